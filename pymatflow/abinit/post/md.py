@@ -5,19 +5,25 @@ import os
 import copy
 import datetime
 import subprocess
+import numpy as np
 import matplotlib.pyplot as plt
 
-from pymatflow.base.atom import Atom
+from pymatflow.base.trajectory import base_trajectory
+from pymatflow.base.cache import post_cache
+from pymatflow.base.xyzio import format_atoms
 
 
 class md_post:
     """
     Note:
     """
-    def __init__(self, output):
+    def __init__(self, output, cache=False):
         """
         output:
             the output file of molecular dynamics run.
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         self.cells:
             a list of cell for every structure in self.trajectory.
             dimension: len(self.trajectory) * 9
@@ -38,9 +44,17 @@ class md_post:
         self.outvars_before = {}
         self.outvars_after = {}
 
+        if cache == True:
+            sidecar = post_cache(self.file, name="md")
+            if sidecar.load():
+                sidecar.restore(self)
+                return
         with open(self.file, 'r') as fout:
             self.lines = fout.readlines()
         self.get_info()
+        if cache == True:
+            sidecar.dump(self, ["cells", "acells", "rprimds", "trajectory", "md_params", "run_info", "outvars_before", "outvars_after"])
+            sidecar.save()
 
     def get_info(self):
         """
@@ -210,7 +224,7 @@ class md_post:
         Note:
         """
         bohr = 0.5291772108
-        self.trajectory = []
+        self.trajectory = base_trajectory()
         self.cells = []
         self.acells = []
         self.rprimds = []
@@ -222,9 +236,9 @@ class md_post:
                 atm = []
                 j = i + 1
                 while self.lines[j].split()[1] != "coordinates":
-                    atm.append(Atom("XXX", float(self.lines[j].split()[0])*bohr, float(self.lines[j].split()[1])*bohr, float(self.lines[j].split()[2])*bohr))
+                    atm.append(self.lines[j].split()[0:3])
                     j = j + 1
-                self.trajectory.append(atm)
+                self.trajectory.append(np.array(atm, dtype=float) * bohr)
             # --------------------------------
             # get the self.acells and self.rprimds
             # if not opt cell, the following two if code will never run to get the cell
@@ -251,20 +265,14 @@ class md_post:
             #
 
         # now using self.atom_type from self.get_pseudo_info()
-        for i in range(len(self.trajectory)):
-            for j in range(len(self.trajectory[i])):
-                name = self.atom_type[self.outvars_before["typat"][j]]
-                self.trajectory[i][j].set_name(name)
+        # species is stored only once for the whole trajectory
+        if len(self.trajectory) > 0:
+            self.trajectory.set_species([self.atom_type[self.outvars_before["typat"][j]] for j in range(self.trajectory.natom)])
         #
 
    
     def print_trajectory(self, xyz="trajectory.xyz"):
-        with open(xyz, 'w') as fout:
-            for i in range(len(self.trajectory)):
-                fout.write("%d\n" % len(self.trajectory[i]))
-                fout.write("i = %d\n" % i)
-                for atom in self.trajectory[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+        self.trajectory.to_xyz(xyz)
 
     def view_trajectory(self, trajfile="trajectory.xyz"):
         #os.system("xcrysden --xyz %s" % trajfile)
@@ -291,8 +299,7 @@ class md_post:
         with open("final-structure.xyz", 'w') as fout:
             fout.write("%d\n" % len(self.trajectory[-1]))
             fout.write("cell: %.9f %.9f %.9f | %.9f %.9f %.9f | %.9f %.9f %.9f\n" % (cell[0], cell[1], cell[2], cell[3], cell[4], cell[5], cell[6], cell[7], cell[8]))
-            for atom in self.trajectory[-1]:
-                fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+            fout.write(format_atoms(self.trajectory[-1]))
 
     def plot_run_info(self):
         """
@@ -7,6 +7,7 @@ import subprocess
 import matplotlib.pyplot as plt
 
 from pymatflow.base.atom import Atom
+from pymatflow.base.xyzio import format_atoms
 
 
 class neb_out:
@@ -228,14 +229,12 @@ class neb_post:
             for i in range(len(self.trajectory_initial)):
                 fout.write("%d\n" % len(self.trajectory_initial[i]))
                 fout.write("i = %d\n" % i)
-                for atom in self.trajectory_initial[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory_initial[i]))
         with open(xyz_final, 'w') as fout:
             for i in range(len(self.trajectory_final)):
                 fout.write("%d\n" % len(self.trajectory_final[i]))
                 fout.write("i = %d\n" % i)
-                for atom in self.trajectory_final[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory_final[i]))
 
     def view_trajectory(self, trajfile_initial="trajectory-initial.xyz", trajfile_final="trajectory-final.xyz"):
         #os.system("xcrysden --xyz %s" % trajfile)
@@ -6,9 +6,13 @@ import copy
 import json
 import datetime
 import subprocess
+import numpy as np
 import matplotlib.pyplot as plt
 
 from pymatflow.base.atom import Atom
+from pymatflow.base.trajectory import base_trajectory
+from pymatflow.base.cache import post_cache
+from pymatflow.base.xyzio import format_atoms
 
 
 class opt:
@@ -41,7 +45,7 @@ class opt:
         self.trajectory = None
 
 
-    def parse(self, file):
+    def parse(self, file, cache=False):
         """
         get the general information of opt run from opt run output file
         which is now stored in self.lines
@@ -56,8 +60,16 @@ class opt:
 
             we don't read the final structure individually, because it is actually the final
             structure in self.trajectory, namely self.trajectory[-1]
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         """
         self.file = os.path.abspath(file)
+        if cache == True:
+            sidecar = post_cache(self.file, name="opt")
+            if sidecar.load():
+                sidecar.restore(self)
+                return self.info
 
         with open(self.file, 'r') as fout:
             self.lines = fout.readlines()
@@ -67,6 +79,9 @@ class opt:
         self._get_pseduo_info() # also get information about the type of atom and its name
         self._get_run_info()
         self._get_trajectory()
+        if cache == True:
+            sidecar.dump(self, ["info"])
+            sidecar.save()
         return self.info
 
     def _get_outvars_before_and_after(self):
@@ -229,7 +244,7 @@ class opt:
         Note:
         """
         bohr = 0.5291772108
-        self.info["trajectory"] = []
+        self.info["trajectory"] = base_trajectory()
         self.info["cells"] = []
         self.info["acells"] = []
         self.info["rprimds"] = []
@@ -241,9 +256,9 @@ class opt:
                 atm = []
                 j = i + 1
                 while self.lines[j].split()[1] != "coordinates":
-                    atm.append(Atom("XXX", float(self.lines[j].split()[0])*bohr, float(self.lines[j].split()[1])*bohr, float(self.lines[j].split()[2])*bohr))
+                    atm.append(self.lines[j].split()[0:3])
                     j = j + 1
-                self.info["trajectory"].append(atm)
+                self.info["trajectory"].append(np.array(atm, dtype=float) * bohr)
             # --------------------------------
             # get the self.info["acells"] and self.info["rprimds"]
             # if not opt cell, the following two if code will never run to get the cell
@@ -270,19 +285,13 @@ class opt:
             #
 
         # now using self.atom_type from self.get_pseudo_info()
-        for i in range(len(self.info["trajectory"])):
-            for j in range(len(self.info["trajectory"][i])):
-                name = self.atom_type[self.info["outvars"]["before"]["typat"][j]]
-                self.info["trajectory"][i][j].set_name(name)
+        # species is stored only once for the whole trajectory
+        if len(self.info["trajectory"]) > 0:
+            self.info["trajectory"].set_species([self.atom_type[self.info["outvars"]["before"]["typat"][j]] for j in range(self.info["trajectory"].natom)])
         #
 
     def print_trajectory(self, directory="./"):
-        with open(os.path.join(directory, "trajectory.xyz"), 'w') as fout:
-            for i in range(len(self.info["trajectory"])):
-                fout.write("%d\n" % len(self.info["trajectory"][i]))
-                fout.write("i = %d\n" % i)
-                for atom in self.info["trajectory"][i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+        self.info["trajectory"].to_xyz(os.path.join(directory, "trajectory.xyz"))
 
     def view_trajectory(self, trajfile="trajectory.xyz"):
         #os.system("xcrysden --xyz %s" % trajfile)
@@ -309,8 +318,7 @@ class opt:
         with open(os.path.join(directory, "final-structure.xyz"), 'w') as fout:
             fout.write("%d\n" % len(self.info["trajectory"][-1]))
             fout.write("cell: %.9f %.9f %.9f | %.9f %.9f %.9f | %.9f %.9f %.9f\n" % (cell[0], cell[1], cell[2], cell[3], cell[4], cell[5], cell[6], cell[7], cell[8]))
-            for atom in self.info["trajectory"][-1]:
-                fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+            fout.write(format_atoms(self.info["trajectory"][-1]))
 
     def plot_info(self, directory="./"):
         """
@@ -1,3 +1,5 @@
 from .element import element
 from .xyz import base_xyz
 from .atom import Atom
+from .atoms import atoms_array
+from .trajectory import base_trajectory
@@ -0,0 +1,514 @@
+"""
+array backed list of atoms, the storage of atoms in base_xyz and crystal
+"""
+import numpy as np
+
+from pymatflow.base.atom import Atom
+
+"""
+Usage:
+    atoms = atoms_array([Atom("H", 0, 0, 0), Atom("O", 0, 0, 1)])
+    atoms.positions # (natom, 3) cartesian coordinates
+    atoms.species # index of the name of each atom in atoms.names
+    atoms.symbols # name of each atom
+    atoms.fix # (natom, 3) bool array
+    atoms[0].x += 0.1 # writes to atoms.positions[0, 0]
+    frac = atoms.get_fractional(cell)
+
+Note:
+    the name, coordinates and fix of all atoms are stored in three arrays,
+    species(index into the table of names), positions and fix, preallocated and
+    grown in chunks like base_trajectory. so vectorized code can work on
+    atoms.positions directly instead of looping over Atom objects.
+
+    atoms_array behaves like the list of Atom used before: indexing returns an
+    atom_view, which is an Atom whose name, x, y, z and fix read from and
+    write to the arrays, and append, extend, insert, del, remove, pop, sort,
+    slicing and iteration work as for a list. so `for atom in structure.atoms`
+    and `structure.atoms[i].x = 0.0` keep working.
+    an atom_view follows its atom when atoms are removed, inserted or
+    reordered(del, pop, insert, sort, ...), like an Atom kept from a list.
+    unlike an Atom, it can not be used after its own atom is removed from the
+    atoms_array: accessing it raises ValueError. use copy.copy(view) or pop()
+    to get an independent Atom.
+
+    building an atoms_array from a list of Atom copies the atoms, so the list
+    and the atoms_array are independent afterwards: assigning a list to
+    crystal.atoms or base_xyz.atoms and then appending to that list does not
+    change the structure. append to structure.atoms instead.
+"""
+
+
+class fix_view:
+    """
+    the fix flags of one atom, a list like view of a row of atoms_array.fix
+    """
+    def __init__(self, atom):
+        self._atom = atom
+
+    @property
+    def _owner(self):
+        return self._atom._owner
+
+    @property
+    def _index(self):
+        return self._atom._index
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [bool(item) for item in self._owner._fix[self._index, j]]
+        return bool(self._owner._fix[self._index, j])
+
+    def __setitem__(self, j, value):
+        self._owner._fix[self._index, j] = value
+
+    def __iter__(self):
+        for j in range(3):
+            yield bool(self._owner._fix[self._index, j])
+
+    def __contains__(self, value):
+        return value in list(self)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class atom_view(Atom):
+    """
+    an Atom stored in a row of atoms_array. it follows its atom when rows
+    are moved(del, insert, sort, ...) and raises ValueError once its atom is
+    removed from the atoms_array
+    """
+    def __init__(self, owner, index):
+        self._owner = owner
+        self._id = owner._ids[index]
+        # row of the atom when owner._version was self._version
+        self._row = index
+        self._version = owner._version
+
+    @property
+    def _index(self):
+        if self._version != self._owner._version:
+            self._row = self._owner._find(self._id)
+            self._version = self._owner._version
+        if self._row is None:
+            raise ValueError("atom_view: the atom has been removed from its atoms_array")
+        return self._row
+
+    @property
+    def name(self):
+        return self._owner.names[self._owner._species[self._index]]
+
+    @name.setter
+    def name(self, name):
+        self._owner._species[self._index] = self._owner._name_index(name)
+
+    @property
+    def x(self):
+        return float(self._owner._positions[self._index, 0])
+
+    @x.setter
+    def x(self, x):
+        self._owner._positions[self._index, 0] = x
+
+    @property
+    def y(self):
+        return float(self._owner._positions[self._index, 1])
+
+    @y.setter
+    def y(self, y):
+        self._owner._positions[self._index, 1] = y
+
+    @property
+    def z(self):
+        return float(self._owner._positions[self._index, 2])
+
+    @z.setter
+    def z(self, z):
+        self._owner._positions[self._index, 2] = z
+
+    @property
+    def fix(self):
+        return fix_view(self)
+
+    @fix.setter
+    def fix(self, fix):
+        self._owner._fix[self._index] = [bool(item) for item in fix]
+
+    def __repr__(self):
+        return "atom_view(%s, %f, %f, %f)" % (self.name, self.x, self.y, self.z)
+
+    def __copy__(self):
+        # a copy is an Atom independent of the atoms_array
+        atom = Atom(self.name, self.x, self.y, self.z)
+        atom.fix = list(self.fix)
+        return atom
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+
+class atoms_array:
+    """
+    array backed list of atoms
+    """
+    def __init__(self, atoms=None, chunk=256):
+        """
+        atoms:
+            list of Atom or another atoms_array to copy from
+        chunk:
+            number of atoms allocated each time the storage is full
+        """
+        self.names = [] # table of names, species refers to it
+        self._names_index = {}
+        self.natom = 0
+        self.chunk = chunk
+        self._species = np.zeros(0, dtype=int)
+        self._positions = np.zeros((0, 3))
+        self._fix = np.zeros((0, 3), dtype=bool)
+        # a unique id of each atom, so that an atom_view can find its atom after
+        # rows are moved. _version is increased every time rows are moved or removed
+        self._ids = np.zeros(0, dtype=int)
+        self._next_id = 0
+        self._version = 0
+        self._rows = None # id -> row, built on demand for the current _version
+        # cell and its inverse last used by get_fractional
+        self._cell = None
+        self._inverse_cell = None
+        if atoms is not None:
+            self.extend(atoms)
+
+    @property
+    def species(self):
+        """
+        (natom,) view of index of the name of each atom in self.names
+        """
+        return self._species[:self.natom]
+
+    @property
+    def positions(self):
+        """
+        (natom, 3) view of cartesian coordinates
+        """
+        return self._positions[:self.natom]
+
+    @positions.setter
+    def positions(self, positions):
+        self._positions[:self.natom] = positions
+
+    @property
+    def fix(self):
+        """
+        (natom, 3) view of the fix flags
+        """
+        return self._fix[:self.natom]
+
+    @property
+    def symbols(self):
+        """
+        array of name of each atom
+        """
+        if len(self.names) == 0:
+            return np.array([], dtype=str)
+        return np.array(self.names)[self.species]
+
+    def extend_arrays(self, names, positions, fix=None):
+        """
+        append atoms given by arrays
+        names:
+            name of each atom
+        positions:
+            (n, 3) array like cartesian coordinates
+        fix:
+            (n, 3) array like fix flags, default to all False
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        n = positions.shape[0]
+        if n == 0:
+            return
+        unique, inverse = np.unique(np.asarray(names, dtype=str), return_inverse=True)
+        table = np.array([self._name_index(name) for name in unique.tolist()], dtype=int)
+        self._reserve(n)
+        self._species[self.natom:self.natom+n] = table[inverse.reshape(-1)]
+        self._positions[self.natom:self.natom+n] = positions
+        self._fix[self.natom:self.natom+n] = False if fix is None else np.asarray(fix, dtype=bool).reshape(-1, 3)
+        self._new_ids(self.natom, n)
+        self.natom += n
+
+    def select(self, index):
+        """
+        index:
+            bool mask or integer index array of the atoms to take
+        :return a new atoms_array of the selected atoms
+        """
+        index = self._mask_or_index(index)
+        out = atoms_array(chunk=self.chunk)
+        out.names = list(self.names)
+        out._names_index = dict(self._names_index)
+        out._species = self.species[index].copy()
+        out._positions = self.positions[index].reshape(-1, 3).copy()
+        out._fix = self.fix[index].reshape(-1, 3).copy()
+        out.natom = out._positions.shape[0]
+        out._ids = np.arange(out.natom)
+        out._next_id = out.natom
+        return out
+
+    def delete(self, index):
+        """
+        remove atoms in linear time
+        index:
+            bool mask or integer index array of the atoms to remove
+        """
+        keep = np.ones(self.natom, dtype=bool)
+        keep[self._mask_or_index(index)] = False
+        n = int(keep.sum())
+        self._species[:n] = self.species[keep]
+        self._positions[:n] = self.positions[keep]
+        self._fix[:n] = self.fix[keep]
+        self._ids[:n] = self._ids[:self.natom][keep]
+        self.natom = n
+        self._moved()
+
+    def get_inverse_cell(self, cell):
+        """
+        :return inverse of cell, cached until a different cell is used
+        """
+        cell = np.array(cell, dtype=float)
+        if self._cell is None or not np.array_equal(self._cell, cell):
+            self._cell = cell
+            self._inverse_cell = np.linalg.inv(cell)
+        return self._inverse_cell
+
+    def get_fractional(self, cell):
+        """
+        :return (natom, 3) fractional coordinates with regard to cell
+        """
+        return self.positions.dot(self.get_inverse_cell(cell))
+
+    def set_fractional(self, frac, cell):
+        """
+        set the cartesian coordinates from (natom, 3) fractional coordinates
+        """
+        self.positions = np.asarray(frac, dtype=float).dot(np.array(cell, dtype=float))
+
+    def copy(self):
+        return self.select(slice(None))
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __len__(self):
+        return self.natom
+
+    def __iter__(self):
+        # natom is checked every step, like iterating over a list being modified
+        i = 0
+        while i < self.natom:
+            yield atom_view(self, i)
+            i += 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [atom_view(self, j) for j in range(*i.indices(self.natom))]
+        if isinstance(i, (list, np.ndarray)):
+            return self.select(i)
+        return atom_view(self, self._check_index(i))
+
+    def __setitem__(self, i, atom):
+        if isinstance(i, slice):
+            atoms = self.to_list()
+            atoms[i] = [Atom(item.name, item.x, item.y, item.z) for item in atom]
+            self._rebuild(atoms)
+            return
+        i = self._check_index(i)
+        fix = list(atom.fix)
+        self._species[i] = self._name_index(atom.name)
+        self._positions[i] = [atom.x, atom.y, atom.z]
+        self._fix[i] = fix
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            self.delete(np.arange(self.natom)[i])
+            return
+        i = self._check_index(i)
+        for array in (self._species, self._positions, self._fix, self._ids):
+            array[i:self.natom-1] = array[i+1:self.natom]
+        self.natom -= 1
+        self._moved()
+
+    def __contains__(self, atom):
+        return isinstance(atom, atom_view) and atom._owner is self and self._find(atom._id) is not None
+
+    def __add__(self, other):
+        out = self.copy()
+        out.extend(other)
+        return out
+
+    def __radd__(self, other):
+        out = atoms_array(other)
+        out.extend(self)
+        return out
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __repr__(self):
+        return "atoms_array(natom=%d)" % self.natom
+
+    def append(self, atom):
+        self._reserve(1)
+        self._new_ids(self.natom, 1)
+        self.natom += 1
+        self[self.natom - 1] = atom
+
+    def extend(self, atoms):
+        """
+        atoms:
+            list of Atom or atoms_array
+        """
+        if isinstance(atoms, atoms_array):
+            self.extend_arrays(atoms.symbols, atoms.positions, atoms.fix)
+            return
+        atoms = list(atoms)
+        self.extend_arrays(
+            [atom.name for atom in atoms],
+            [[atom.x, atom.y, atom.z] for atom in atoms],
+            [list(atom.fix) for atom in atoms],
+            )
+
+    def insert(self, i, atom):
+        i = min(max(i + self.natom if i < 0 else i, 0), self.natom)
+        self.append(atom)
+        if i < self.natom - 1:
+            for array in (self._species, self._positions, self._fix, self._ids):
+                row = array[self.natom-1].copy()
+                array[i+1:self.natom] = array[i:self.natom-1].copy()
+                array[i] = row
+            self._moved()
+
+    def pop(self, i=-1):
+        """
+        :return the removed atom as an Atom
+        """
+        view = self[i]
+        atom = view.__copy__()
+        del self[view._index]
+        return atom
+
+    def remove(self, atom):
+        if atom not in self:
+            raise ValueError("atoms_array.remove(x): x not in atoms_array")
+        del self[atom._index]
+
+    def index(self, atom):
+        if atom not in self:
+            raise ValueError("atoms_array.index(x): x not in atoms_array")
+        return atom._index
+
+    def clear(self):
+        self.natom = 0
+        self._moved()
+
+    def sort(self, key=None, reverse=False):
+        order = sorted(range(self.natom), key=lambda j: key(atom_view(self, j)) if key is not None else j, reverse=reverse)
+        self._reorder(np.array(order, dtype=int))
+
+    def reverse(self):
+        self._reorder(np.arange(self.natom)[::-1])
+
+    def to_list(self):
+        """
+        :return a list of Atom independent of self
+        """
+        atoms = []
+        for name, position, fix in zip(self.symbols.tolist(), self.positions.tolist(), self.fix.tolist()):
+            atom = Atom(name, position[0], position[1], position[2])
+            atom.fix = fix
+            atoms.append(atom)
+        return atoms
+
+    def _check_index(self, i):
+        i = int(i)
+        if i < 0:
+            i += self.natom
+        if i < 0 or i >= self.natom:
+            raise IndexError("atoms_array index out of range")
+        return i
+
+    def _mask_or_index(self, index):
+        if isinstance(index, slice):
+            return index
+        index = np.asarray(index)
+        if index.dtype != bool:
+            index = index.astype(int)
+        return index
+
+    def _name_index(self, name):
+        if name not in self._names_index:
+            self._names_index[name] = len(self.names)
+            self.names.append(name)
+        return self._names_index[name]
+
+    def _reserve(self, n):
+        """
+        make room for n more atoms, growing by at least one chunk and by half of the
+        current size for large structures, so that appending stays amortized O(1)
+        """
+        capacity = self._positions.shape[0]
+        if self.natom + n <= capacity:
+            return
+        capacity = max(self.natom + n, capacity + max(self.chunk, capacity // 2))
+        species = np.zeros(capacity, dtype=int)
+        positions = np.zeros((capacity, 3))
+        fix = np.zeros((capacity, 3), dtype=bool)
+        ids = np.zeros(capacity, dtype=int)
+        species[:self.natom] = self.species
+        positions[:self.natom] = self.positions
+        fix[:self.natom] = self.fix
+        ids[:self.natom] = self._ids[:self.natom]
+        self._species = species
+        self._positions = positions
+        self._fix = fix
+        self._ids = ids
+
+    def _reorder(self, order):
+        self._species[:self.natom] = self.species[order]
+        self._positions[:self.natom] = self.positions[order]
+        self._fix[:self.natom] = self.fix[order]
+        self._ids[:self.natom] = self._ids[:self.natom][order]
+        self._moved()
+
+    def _rebuild(self, atoms):
+        self.natom = 0
+        self._moved()
+        self.extend(atoms)
+
+    def _new_ids(self, start, n):
+        self._ids[start:start+n] = np.arange(self._next_id, self._next_id + n)
+        self._next_id += n
+        self._rows = None
+
+    def _moved(self):
+        """
+        called when rows are moved or removed, atom_view will look up its row again
+        """
+        self._version += 1
+        self._rows = None
+
+    def _find(self, id):
+        """
+        :return the row of the atom with id, None if it is not in self
+        """
+        if self._rows is None:
+            self._rows = dict(zip(self._ids[:self.natom].tolist(), range(self.natom)))
+        return self._rows.get(id)
@@ -0,0 +1,172 @@
+"""
+binary sidecar cache of parsed calculation output
+"""
+import os
+import json
+import hashlib
+import numpy as np
+
+from pymatflow.base.atom import Atom
+from pymatflow.base.xyz import base_xyz
+from pymatflow.base.trajectory import base_trajectory
+
+"""
+Usage:
+    cache = post_cache("OUTCAR", name="outcar")
+    if cache.load():
+        cache.restore(self)
+    else:
+        # parse OUTCAR
+        cache.dump(self, ["run_info", "trajectory"])
+        cache.save()
+
+Note:
+    the parsed attributes are stored beside the output in a sidecar file like
+    .OUTCAR.outcar.cache.json, and numpy arrays(including the positions and
+    forces of base_trajectory) in a compressed .OUTCAR.outcar.cache.npz.
+
+    the cache is keyed by the size, the modification time and the sha1 of the
+    first and last 64KB of the output, so the output is never read as a whole
+    to validate the cache. when any of them changes, the cache is considered
+    outdated and the output will be parsed again.
+"""
+
+# increase it when the layout of the cached attributes of any post class changes
+CACHE_VERSION = 1
+
+class post_cache:
+    """
+    cache of the attributes of a post processing object
+    """
+    def __init__(self, output, name="post"):
+        """
+        :param output: the output file being parsed
+        :param name: used to distinguish different parsers of the same output
+        """
+        self.output = output
+        directory, basename = os.path.split(os.path.abspath(output))
+        self.sidecar = os.path.join(directory, ".%s.%s.cache.json" % (basename, name))
+        self.sidecar_arrays = self.sidecar[:-len(".json")] + ".npz"
+        self.data = {}
+        self.arrays = {}
+
+    def key(self):
+        """
+        :return: the key identifying the current content of the output
+        """
+        stat = os.stat(self.output)
+        sha1 = hashlib.sha1()
+        with open(self.output, 'rb') as fin:
+            sha1.update(fin.read(65536))
+            if stat.st_size > 65536:
+                fin.seek(max(65536, stat.st_size - 65536))
+                sha1.update(fin.read())
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha1": sha1.hexdigest(), "version": CACHE_VERSION}
+
+    def load(self):
+        """
+        :return: True if a valid cache is loaded
+        """
+        self.data = {}
+        self.arrays = {}
+        if not os.path.exists(self.sidecar):
+            return False
+        try:
+            with open(self.sidecar, 'r') as fin:
+                saved = json.load(fin)
+        except ValueError:
+            return False
+        if saved["key"] != self.key():
+            return False
+        if saved["arrays"] == True:
+            if not os.path.exists(self.sidecar_arrays):
+                return False
+            with np.load(self.sidecar_arrays) as npz:
+                self.arrays = {key: npz[key] for key in npz.files}
+        self.data = saved["data"]
+        return True
+
+    def save(self):
+        """
+        save the cache to the sidecar file
+        """
+        saved = {
+            "key": self.key(),
+            "arrays": len(self.arrays) > 0,
+            "data": self.data,
+            }
+        if len(self.arrays) > 0:
+            # np.savez_compressed will append .npz to the file name if it does not end with it
+            tmp = self.sidecar_arrays[:-len(".npz")] + ".tmp.npz"
+            np.savez_compressed(tmp, **self.arrays)
+            os.replace(tmp, self.sidecar_arrays)
+        with open(self.sidecar + ".tmp", 'w') as fout:
+            json.dump(saved, fout)
+        os.replace(self.sidecar + ".tmp", self.sidecar)
+
+    def dump(self, obj, attrs):
+        """
+        :param obj: the post processing object
+        :param attrs: names of the attributes of obj to cache, attributes not
+            set on obj are skipped.
+        """
+        self.data = {}
+        self.arrays = {}
+        for attr in attrs:
+            if hasattr(obj, attr):
+                self.data[attr] = self._pack(getattr(obj, attr), attr)
+
+    def restore(self, obj):
+        """
+        set the cached attributes on obj
+        """
+        for attr in self.data:
+            setattr(obj, attr, self._unpack(self.data[attr]))
+
+    def _pack(self, value, key):
+        """
+        convert value to json serializable data, numpy arrays are moved to
+        self.arrays under key
+        """
+        if isinstance(value, np.ndarray):
+            self.arrays[key] = value
+            return {"__ndarray__": key}
+        elif isinstance(value, base_trajectory):
+            self.arrays[key + "/positions"] = value.positions
+            if value.forces is not None:
+                self.arrays[key + "/forces"] = value.forces
+            return {"__trajectory__": key, "species": value.species}
+        elif isinstance(value, base_xyz):
+            return {"__xyz__": {
+                "names": [atom.name for atom in value.atoms],
+                "coords": [[atom.x, atom.y, atom.z] for atom in value.atoms],
+                "cell": self._pack(value.cell, key + "/cell"),
+                }}
+        elif isinstance(value, dict):
+            return {str(k): self._pack(value[k], "%s/%s" % (key, k)) for k in value}
+        elif isinstance(value, (list, tuple)):
+            return [self._pack(value[i], "%s/%d" % (key, i)) for i in range(len(value))]
+        elif isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def _unpack(self, value):
+        if isinstance(value, dict):
+            if "__ndarray__" in value:
+                return self.arrays[value["__ndarray__"]]
+            elif "__trajectory__" in value:
+                key = value["__trajectory__"]
+                trajectory = base_trajectory(species=value["species"])
+                trajectory.extend(self.arrays[key + "/positions"], self.arrays.get(key + "/forces"))
+                return trajectory
+            elif "__xyz__" in value:
+                xyz = base_xyz()
+                for name, coord in zip(value["__xyz__"]["names"], value["__xyz__"]["coords"]):
+                    xyz.atoms.append(Atom(name, coord[0], coord[1], coord[2]))
+                xyz.natom = len(xyz.atoms)
+                xyz.cell = self._unpack(value["__xyz__"]["cell"])
+                return xyz
+            return {k: self._unpack(value[k]) for k in value}
+        elif isinstance(value, list):
+            return [self._unpack(item) for item in value]
+        return value
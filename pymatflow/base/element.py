@@ -3,6 +3,9 @@
 # https://en.wikipedia.org/wiki/Periodic_table
 # -----------------------------------------------------------
 
+import numpy as np
+
+
 class Element:
     def __init__(self, number=None, mass=None, symbol=None):
         self.number = int(number) if number != None else None
@@ -130,3 +133,43 @@ element = {
         "Ts": Element(117, 294, "Ts"),          # mass number
         "Og": Element(118, 294, "Og"),          # mass number, unconfirmed: 295
         }
+
+
+# index of the elements built once, so that conversion between atomic numbers
+# and symbols is a table lookup instead of a scan of element:
+#     element_symbols[number] -> symbol, "" for number 0
+#     element_masses[number] -> mass
+#     element_numbers[symbol] -> number
+element_numbers = {symbol: element[symbol].number for symbol in element}
+element_symbols = np.full(max(element_numbers.values()) + 1, "", dtype="<U2")
+element_masses = np.zeros(element_symbols.shape[0])
+for symbol in element:
+    element_symbols[element[symbol].number] = symbol
+    element_masses[element[symbol].number] = element[symbol].mass
+
+
+def numbers_to_symbols(numbers):
+    """
+    :param numbers: array like of atomic numbers
+    :return str array of the element symbols
+    """
+    numbers = np.asarray(numbers, dtype=int)
+    if numbers.size > 0 and (numbers.min() < 1 or numbers.max() >= element_symbols.shape[0]):
+        raise KeyError("atomic number out of range: %s" % numbers[(numbers < 1) | (numbers >= element_symbols.shape[0])][0])
+    return element_symbols[numbers]
+
+def symbols_to_numbers(symbols):
+    """
+    :param symbols: array like of element symbols
+    :return int array of the atomic numbers, every distinct symbol is looked up once
+    """
+    unique, inverse = np.unique(np.asarray(symbols, dtype=str), return_inverse=True)
+    table = np.array([element_numbers[symbol] for symbol in unique.tolist()], dtype=int)
+    return table[inverse.reshape(-1)].reshape(np.shape(symbols))
+
+def symbols_to_masses(symbols):
+    """
+    :param symbols: array like of element symbols
+    :return float array of the atomic masses
+    """
+    return element_masses[symbols_to_numbers(symbols)]
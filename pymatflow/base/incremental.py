@@ -0,0 +1,224 @@
+"""
+resumable parsing state for output files that are still growing
+"""
+import os
+import json
+import hashlib
+import numpy as np
+
+"""
+Usage:
+    state = tail_state("OUTCAR", name="md")
+    state.load()
+    lines, offsets = read_appended_lines("OUTCAR", state.offset)
+    # parse lines, keep the small accumulators in state.data(json serializable)
+    # and append what grows with the output to series
+    state.extend("energies", new_energies) # list of json serializable items
+    state.extend("positions", new_positions) # numpy array of shape (n, natom, 3)
+    state.offset = offsets[-1]
+    state.save()
+    # next time
+    state.load()
+    energies = state.series("energies")
+
+Note:
+    the state is stored in a small sidecar file beside the output, like
+    .OUTCAR.md.state.json, so that the next invocation of the post processing
+    only parses the bytes appended since the last one. if the output file is
+    replaced(smaller than the saved offset or its head changed), the state is
+    discarded and parsing starts again from byte 0.
+
+    quantities growing with the output(energies of every step, trajectories)
+    are kept in series, one append only file per series beside the json, like
+    .OUTCAR.md.state.positions.bin(raw rows of a numpy array) or
+    .OUTCAR.md.state.energies.jsonl(one json item per line). save() only
+    appends the items passed to extend() since the last save and the json
+    only records the number of items and bytes of each series, so a save costs
+    O(new data) however long the run is. a file longer than recorded(save was
+    interrupted between the append and the json) is cut back before appending.
+"""
+
+def iter_appended_lines(output, offset=0):
+    """
+    generator over the complete lines appended to output after byte offset,
+    a trailing line without '\n' is still being written and is not yielded.
+    :param output: the output file
+    :param offset: byte offset to start reading
+    yield:
+        (line, end) where end is the byte offset right after the line
+    """
+    with open(output, 'rb') as fin:
+        fin.seek(offset)
+        for raw in fin:
+            if not raw.endswith(b"\n"):
+                break
+            offset += len(raw)
+            yield raw.decode("utf-8", errors="replace"), offset
+
+def read_appended_lines(output, offset=0):
+    """
+    read the complete lines appended to output after byte offset
+    :param output: the output file
+    :param offset: byte offset to start reading
+    :return (lines, offsets):
+        lines: list of complete lines
+        offsets: byte offset at the begining of each line plus the offset
+            after the last line, so len(offsets) == len(lines) + 1
+    """
+    lines = []
+    offsets = [offset]
+    for line, end in iter_appended_lines(output, offset):
+        lines.append(line)
+        offsets.append(end)
+    return lines, offsets
+
+
+class tail_state:
+    """
+    byte offset and partial accumulators of an incremental parsing, which
+    can be saved to and loaded from a sidecar file
+    """
+    def __init__(self, output, name="post"):
+        """
+        :param output: the output file being parsed
+        :param name: used to distinguish different parsers of the same output
+        """
+        self.output = output
+        directory, basename = os.path.split(os.path.abspath(output))
+        self.sidecar = os.path.join(directory, ".%s.%s.state.json" % (basename, name))
+        self.reset()
+
+    def reset(self):
+        self.offset = 0
+        self.data = {}
+        self.meta = {} # series key -> {"kind", "count", "size"(bytes), "dtype", "shape"}
+        self._saved_size = {} # series key -> size of its file at the last save or load
+        self._pending = {} # series key -> list of bytes to append at save
+
+    def _head_hash(self, nbytes):
+        with open(self.output, 'rb') as fin:
+            return hashlib.sha1(fin.read(nbytes)).hexdigest()
+
+    def _series_file(self, key):
+        kind = self.meta[key]["kind"]
+        name = "".join(c if c.isalnum() or c in "-_" else "." for c in key)
+        return self.sidecar[:-len("json")] + name + (".bin" if kind == "array" else ".jsonl")
+
+    def load(self):
+        """
+        load the state from the sidecar file
+        :return: True if a valid state is loaded, else the state is reset and False is returned
+        """
+        self.reset()
+        if not os.path.exists(self.sidecar):
+            return False
+        try:
+            with open(self.sidecar, 'r') as fin:
+                saved = json.load(fin)
+        except ValueError:
+            return False
+        if "series" not in saved:
+            # written by an older version
+            return False
+        # check the output is still the file we parsed before
+        nbytes = min(saved["offset"], 4096)
+        if os.path.getsize(self.output) < saved["offset"] or self._head_hash(nbytes) != saved["head"]:
+            return False
+        self.meta = saved["series"]
+        for key in self.meta:
+            path = self._series_file(key)
+            if not os.path.exists(path) or os.path.getsize(path) < self.meta[key]["size"]:
+                self.reset()
+                return False
+            self._saved_size[key] = self.meta[key]["size"]
+        self.offset = saved["offset"]
+        self.data = saved["data"]
+        return True
+
+    def length(self, key):
+        """
+        :return number of items in series key, including those not saved yet
+        """
+        return self.meta[key]["count"] if key in self.meta else 0
+
+    def extend(self, key, items):
+        """
+        append items to series key, written to its file at the next save()
+        :param items: numpy array(rows of the same shape and dtype every time) or
+            list of json serializable items
+        """
+        if len(items) == 0:
+            return
+        if isinstance(items, np.ndarray):
+            if key not in self.meta:
+                self.meta[key] = {"kind": "array", "count": 0, "size": 0, "dtype": items.dtype.str, "shape": list(items.shape[1:])}
+            raw = np.ascontiguousarray(items, dtype=np.dtype(self.meta[key]["dtype"])).tobytes()
+        else:
+            if key not in self.meta:
+                self.meta[key] = {"kind": "list", "count": 0, "size": 0}
+            raw = "".join(json.dumps(item) + "\n" for item in items).encode()
+        self._pending.setdefault(key, []).append(raw)
+        self.meta[key]["count"] += len(items)
+        self.meta[key]["size"] += len(raw)
+
+    def series(self, key):
+        """
+        :return the saved items of series key, a numpy array or a list
+        """
+        if key not in self.meta:
+            return []
+        meta = self.meta[key]
+        size = self._saved_size.get(key, 0)
+        raw = b""
+        if size > 0:
+            with open(self._series_file(key), 'rb') as fin:
+                raw = fin.read(size)
+        if meta["kind"] == "array":
+            return np.frombuffer(raw, dtype=np.dtype(meta["dtype"])).reshape([-1] + meta["shape"]).copy()
+        return [json.loads(line) for line in raw.decode().splitlines()]
+
+    def extend_dict(self, key, values):
+        """
+        store a dict like run_info: its list values are series key/name to
+        which the new items(beyond the saved length) are appended, the others
+        are stored in data[key]
+        """
+        self.data[key] = {name: value for name, value in values.items() if not isinstance(value, list)}
+        self.data[key + "/lists"] = [name for name, value in values.items() if isinstance(value, list)]
+        for name in self.data[key + "/lists"]:
+            self.extend(key + "/" + name, values[name][self.length(key + "/" + name):])
+
+    def get_dict(self, key):
+        """
+        :return the dict stored by extend_dict
+        """
+        out = dict(self.data[key])
+        for name in self.data[key + "/lists"]:
+            out[name] = self.series(key + "/" + name)
+        return out
+
+    def save(self):
+        """
+        save the state to the sidecar file, appending the new items of series
+        """
+        for key in self._pending:
+            path = self._series_file(key)
+            size = self._saved_size.get(key, 0)
+            with open(path, 'ab') as fout:
+                # drop bytes of an interrupted save, or of a discarded state
+                if fout.tell() != size:
+                    fout.truncate(size)
+                    fout.seek(size)
+                for raw in self._pending[key]:
+                    fout.write(raw)
+            self._saved_size[key] = self.meta[key]["size"]
+        self._pending = {}
+        saved = {
+            "offset": self.offset,
+            "head": self._head_hash(min(self.offset, 4096)),
+            "series": self.meta,
+            "data": self.data,
+            }
+        with open(self.sidecar + ".tmp", 'w') as fout:
+            json.dump(saved, fout)
+        os.replace(self.sidecar + ".tmp", self.sidecar)
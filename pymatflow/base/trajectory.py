@@ -0,0 +1,157 @@
+"""
+base trajectory class, an array backed representation of trajectory
+"""
+import numpy as np
+
+from pymatflow.base.atom import Atom
+
+"""
+Usage:
+    traj = base_trajectory(species=["H", "H", "O"])
+    traj.append(positions, forces) # positions and forces are (natom, 3)
+    traj.positions # (nframe, natom, 3) array
+    traj.to_xyz("trajectory.xyz")
+"""
+
+
+class base_trajectory:
+    """
+    a representation of trajectory
+    Note:
+        positions and forces of all frames are stored in (nframe, natom, 3)
+        float arrays preallocated and grown in chunks of frames, while the
+        species(name of every atom) is stored only once for the whole trajectory.
+        so a trajectory of 50k frames and 500 atoms costs one float array of
+        50000*500*3 instead of 25M Atom objects.
+
+        traj[i] returns frame i as a list of Atom, so the code working on
+        a list of list of Atom like `for atom in traj[-1]` still works.
+    """
+    def __init__(self, species=None, chunk=256):
+        """
+        species:
+            list of name of each atom, like ["H", "H", "O"]
+        chunk:
+            number of frames allocated each time the storage is full
+        """
+        self.species = species
+        self.natom = None if species is None else len(species)
+        self.nframe = 0
+        self.chunk = chunk
+        self._positions = None
+        self._forces = None
+
+    def __len__(self):
+        return self.nframe
+
+    def __getitem__(self, i):
+        """
+        return frame i as a list of Atom
+        """
+        positions = self.positions[i]
+        species = self.species if self.species is not None else ["x"] * self.natom
+        return [Atom(species[j], positions[j, 0], positions[j, 1], positions[j, 2]) for j in range(self.natom)]
+
+    def __iter__(self):
+        for i in range(self.nframe):
+            yield self[i]
+
+    @property
+    def positions(self):
+        """
+        (nframe, natom, 3) view of positions of all frames
+        """
+        if self._positions is None:
+            return np.zeros((0, 0 if self.natom is None else self.natom, 3))
+        return self._positions[:self.nframe]
+
+    @property
+    def forces(self):
+        """
+        (nframe, natom, 3) view of forces of all frames, None if forces is not stored
+        """
+        if self._forces is None:
+            return None
+        return self._forces[:self.nframe]
+
+    def set_species(self, species):
+        """
+        species:
+            list of name of each atom
+        """
+        if self.natom is not None and len(species) != self.natom:
+            print("===============================================\n")
+            print("warning: base_trajectory.set_species\n")
+            print("length of species is not equal to natom\n")
+            return
+        self.species = list(species)
+        self.natom = len(species)
+
+    def append(self, positions, forces=None):
+        """
+        positions:
+            (natom, 3) array like positions of the new frame
+        forces:
+            (natom, 3) array like forces of the new frame, optional
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        if self.natom is None:
+            self.natom = positions.shape[0]
+        if self._positions is None:
+            self._positions = np.empty((self.chunk, self.natom, 3))
+            if forces is not None:
+                self._forces = np.empty((self.chunk, self.natom, 3))
+        elif self.nframe == self._positions.shape[0]:
+            self._grow()
+        self._positions[self.nframe] = positions
+        if forces is not None and self._forces is not None:
+            self._forces[self.nframe] = np.asarray(forces, dtype=float).reshape(-1, 3)
+        self.nframe += 1
+
+    def extend(self, positions, forces=None):
+        """
+        positions:
+            (nframe, natom, 3) array like positions of the new frames
+        forces:
+            (nframe, natom, 3) array like forces of the new frames, optional
+        """
+        positions = np.asarray(positions, dtype=float)
+        for i in range(positions.shape[0]):
+            self.append(positions[i], None if forces is None else forces[i])
+
+    def _grow(self):
+        """
+        enlarge the storage by at least one chunk, and by half of the current
+        size for long trajectories, so that the copy cost stays amortized O(1)
+        """
+        capacity = self._positions.shape[0]
+        capacity = capacity + max(self.chunk, capacity // 2)
+        positions = np.empty((capacity, self.natom, 3))
+        positions[:self.nframe] = self._positions[:self.nframe]
+        self._positions = positions
+        if self._forces is not None:
+            forces = np.empty((capacity, self.natom, 3))
+            forces[:self.nframe] = self._forces[:self.nframe]
+            self._forces = forces
+
+    def _xyz_format(self):
+        """
+        format string of the atom lines of one frame, built once so that every
+        frame is formatted by one string formatting over the flattened positions
+        """
+        species = self.species if self.species is not None else ["x"] * self.natom
+        return "".join(["%s\t%%.9f\t%%.9f\t%%.9f\n" % name.replace("%", "%%") for name in species])
+
+    def to_xyz(self, xyzfile, comments=None):
+        """
+        xyzfile:
+            the output multi frame xyz file
+        comments:
+            list of comment line for each frame, default to "i = %d"
+        """
+        fmt = self._xyz_format()
+        with open(xyzfile, 'w') as fout:
+            for i in range(self.nframe):
+                comment = "i = %d" % i if comments is None else comments[i]
+                fout.write("%d\n%s\n" % (self.natom, comment))
+                fout.write(fmt % tuple(self._positions[i].ravel()))
@@ -0,0 +1,131 @@
+"""
+rendering many variants of an input from one calculation without changing it
+"""
+import os
+import io
+import copy
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+"""
+Usage:
+    from pymatflow.base.variants import variant_renderer
+    # task is a vasp static_run with incar, poscar, kpoints set
+    renderer = variant_renderer(task, [
+        ("%s/INCAR", [("incar", "to_incar")]),
+        ("%s/POSCAR", [("poscar", "to_poscar")]),
+        ("%s/KPOINTS", [("kpoints", "to_kpoints")]),
+        ])
+    variants = [{"incar.ENCUT": encut} for encut in range(300, 800, 50)]
+    names = ["encut-%d" % encut for encut in range(300, 800, 50)]
+    renderer.write("tmp-vasp-encut", variants, names, nproc=4)
+
+Note:
+    an input file is a list of sections, each written by a method of an attribute
+    of the calculation, like ("incar", "to_incar") or ("force_eval", "to_input").
+    a variant is a dict of overlays, the key is the path of attributes from the
+    calculation to a section followed by the key in its params, like
+    "force_eval.dft.mgrid.CUTOFF" or "system.ecutwfc".
+
+    sections not touched by any overlay of a variant are written once from the
+    calculation and the text is reused for all the variants. for a touched section
+    the objects along the path are shallow copied and the params of the last one
+    is a copy with the overlay applied(copy on write), so the calculation itself
+    is never changed and only the touched part is written again. the path is
+    followed on the copies, so a subsection built on first access(the lazy
+    sections of CP2K) which is not built yet on the calculation is built on the
+    copy only, and the calculation is left as it was.
+"""
+
+class variant_renderer:
+    """
+    render inputs of many parameter variants of one calculation
+    """
+    def __init__(self, task, files):
+        """
+        :param task: the calculation, like an instance of vasp static_run
+        :param files: list of (name, sections), name is the file name with %s
+            replaced by the name of the variant, and sections is a list of
+            (attribute, method) writing the sections of the file in order
+        """
+        self.task = task
+        self.files = files
+        self._rendered = {} # (attribute, method) -> text written from task
+
+    def render(self, variant):
+        """
+        :param variant: dict of overlays
+        :return list of (name, text) of each file, name still with %s
+        """
+        touched = {}
+        for path, value in variant.items():
+            parts = path.split(".")
+            touched.setdefault(parts[0], []).append((parts[1:], value))
+        out = []
+        for name, sections in self.files:
+            text = []
+            for attr, method in sections:
+                if attr in touched:
+                    # from a copy, so that a section never accessed is not built on the task
+                    section = getattr(copy.copy(self.task), attr)
+                    for parts, value in touched[attr]:
+                        section = _overlay(section, parts, value)
+                    text.append(_write(section, method))
+                else:
+                    if (attr, method) not in self._rendered:
+                        self._rendered[(attr, method)] = _write(getattr(self.task, attr), method)
+                    text.append(self._rendered[(attr, method)])
+            out.append((name, "".join(text)))
+        return out
+
+    def write(self, directory, variants, names, nproc=1, chunksize=16):
+        """
+        :param directory: the files are written under it
+        :param variants: list of dict of overlays
+        :param names: name of each variant, replacing %s in the file names
+        :param nproc: number of processes writing the variants
+        :return list of paths of the written files
+        """
+        # render the shared sections before the task is sent to the workers
+        self.render({})
+        jobs = [(directory, variant, name) for variant, name in zip(variants, names)]
+        if nproc == 1:
+            results = map(self._write_variant, jobs)
+            return [path for paths in results for path in paths]
+        with ProcessPoolExecutor(max_workers=nproc) as pool:
+            results = pool.map(self._write_variant, jobs, chunksize=chunksize)
+            return [path for paths in results for path in paths]
+
+    def _write_variant(self, job):
+        directory, variant, name = job
+        paths = []
+        for filename, text in self.render(variant):
+            path = os.path.join(directory, filename % name if "%s" in filename else filename)
+            if os.path.dirname(path) != "":
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as fout:
+                fout.write(text)
+            paths.append(path)
+        return paths
+
+
+def _overlay(section, parts, value):
+    """
+    :return a shallow copy of section with params[parts[-1]] of the subsection
+        at parts[:-1] set to value, section itself is not changed
+    """
+    new = copy.copy(section)
+    if len(parts) == 1:
+        new.params = dict(section.params)
+        new.params[parts[0]] = value
+    else:
+        # the subsection is read from the copy, a lazily built one(like those
+        # of CP2K) never accessed before is then built on the copy only
+        setattr(new, parts[0], _overlay(getattr(new, parts[0]), parts[1:], value))
+    return new
+
+def _write(section, method):
+    fout = io.StringIO()
+    getattr(section, method)(fout)
+    return fout.getvalue()
@@ -6,11 +6,21 @@ import sys
 import os
 import shutil
 import copy
-from pymatflow.base.element import element
+from pymatflow.base.element import symbols_to_numbers
 from pymatflow.base.atom import Atom
+from pymatflow.base.atoms import atoms_array
+from pymatflow.base.xyzio import read_frame, write_frame, parse_cell
 
 """
 Usage:
+    a.atoms = [Atom("H", 0, 0, 0)]
+    a.atoms.append(Atom("H", 0, 0, 0.74))
+
+Note:
+    atoms is a pymatflow.base.atoms.atoms_array. a list of Atom assigned to it
+    is copied, so append to a.atoms rather than to the list assigned. atoms
+    got from a.atoms[i] stay bound to the same atom when other atoms are
+    removed or moved, and raise ValueError once that atom itself is removed.
 """
 
 
@@ -29,6 +39,23 @@ class base_xyz:
         self.cell = None
         self.specie_labels = dict()
 
+    @property
+    def atoms(self):
+        """
+        the atoms are stored in a pymatflow.base.atoms.atoms_array, which
+        can be used like a list of Atom
+        """
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        # an atoms_array is shared like a list was before, a list of Atom is
+        # copied into a new atoms_array, later changes to that list are not seen
+        if atoms is None or isinstance(atoms, atoms_array):
+            self._atoms = atoms
+        else:
+            self._atoms = atoms_array(atoms)
+
     def get_xyz(self, xyzfile):
         """
             get information to construct the structure from an xyz file
@@ -37,48 +64,19 @@ class base_xyz:
         self.file = os.path.abspath(xyzfile)
         # now self.file is an absolute path, this is much easier for later usage
         with open(self.file, 'r') as fin:
-            self.natom = int(fin.readline())
-            fin.readline()
-            i = 0
-            while i < self.natom:
-                line = fin.readline()
-                atom = Atom(line.split()[0], float(line.split()[1]), float(line.split()[2]), float(line.split()[3]))
-                # get information about the fix of this atom for opt and md
-                if len(line.split()) == 4:
-                    atom.fix = [False, False, False]
-                elif line.split()[4][0] == '#':
-                    atom.fix = [False, False, False] # the first char after coordinates is # , so cannpt set T or F
-                else:
-                    for j in range(3):
-                        if line.split()[j+4] == 'T':
-                            atom.fix[j] = True
-                        elif line.split()[j+4] == 'F':
-                            atom.fix[j] = False
-                        else:
-                            print("===============================\n")
-                            print("warning: while read xyz file\n")
-                            print("can only set T or F after coords\n")
-                            sys.exit(1)
-                # end get the information about the fix of this atom for opt and md
-                self.atoms.append(atom)
-                i += 1
+            frame = read_frame(fin)
+        self.natom = frame["natom"]
+        # the fix flags(T/F after coords) are kept for opt and md
+        self.atoms = atoms_array()
+        self.atoms.extend_arrays(frame["symbols"], frame["positions"], frame["fix"])
         self.set_species_number()
-        self.cell = self.get_cell(self.file)
+        self.cell = frame["cell"]
 
     def set_species_number(self):
-        names = [self.atoms[x].name for x in range(self.natom)]
-        species = set(names)
-        species = list(species)
-        species_with_order = {}
-        for i in species:
-            species_with_order[i] = element[i].number
-        tmp = sorted(zip(species_with_order.values(), species_with_order.keys()))
-        for i in range(len(tmp)):
-            tmp[i] = list(tmp[i])
-        for i in range(len(tmp)):
-            tmp[i][0] = i + 1
-        tmp = dict(tmp)
-        self.specie_labels = dict(zip(tmp.values(), tmp.keys()))
+        # species labels 1, 2, ... ordered by atomic number
+        names = np.unique(self.atoms.symbols[:self.natom])
+        names = names[np.argsort(symbols_to_numbers(names), kind="stable")]
+        self.specie_labels = {name: i + 1 for i, name in enumerate(names.tolist())}
         self.nspecies = len(self.specie_labels)
 
 
@@ -90,13 +88,7 @@ class base_xyz:
         with open(xyzfile, 'r') as fin:
             fin.readline()
             line = fin.readline()
-        #return [float(line.split()[i]) for i in [1, 2, 3, 5, 6, 7, 9, 10, 11]]
-        cell = []
-        cell.append([float(line.split()[1]), float(line.split()[2]), float(line.split()[3])])
-        cell.append([float(line.split()[5]), float(line.split()[6]), float(line.split()[7])])
-        cell.append([float(line.split()[9]), float(line.split()[10]), float(line.split()[11])])
-
-        return cell
+        return parse_cell(line)
 
     def update(self, xyzfile):
         self.file = xyzfile
@@ -108,16 +100,8 @@ class base_xyz:
 
     def to_xyz(self, fname):
         with open(fname, 'w') as fout:
-            fout.write("%d\n" % len(self.atoms))
-            #fout.write("cell: %f %f %f | %f %f %f | %f %f %f\n" % (self.cell[0], self.cell[1], self.cell[2], self.cell[3], self.cell[4], self.cell[5], self.cell[6], self.cell[7], self.cell[8]))
-            fout.write("cell: %f %f %f | %f %f %f | %f %f %f\n" % (self.cell[0][0], self.cell[0][1], self.cell[0][2], self.cell[1][0], self.cell[1][1], self.cell[1][2], self.cell[2][0], self.cell[2][1], self.cell[2][2]))
-            for atom in self.atoms:
-                fout.write("%s %f %f %f\n" % (atom.name, atom.x, atom.y, atom.z))
+            write_frame(fout, self.atoms.symbols, self.atoms.positions, cell=self.cell, fmt="%f")
 
     def to_xyz_file(self, fname):
         with open(fname, 'w') as fout:
-            fout.write("%d\n" % len(self.atoms))
-            #fout.write("cell: %f %f %f | %f %f %f | %f %f %f\n" % (self.cell[0], self.cell[1], self.cell[2], self.cell[3], self.cell[4], self.cell[5], self.cell[6], self.cell[7], self.cell[8]))
-            fout.write("cell: %f %f %f | %f %f %f | %f %f %f\n" % (self.cell[0][0], self.cell[0][1], self.cell[0][2], self.cell[1][0], self.cell[1][1], self.cell[1][2], self.cell[2][0], self.cell[2][1], self.cell[2][2]))
-            for atom in self.atoms:
-                fout.write("%s %f %f %f\n" % (atom.name, atom.x, atom.y, atom.z))
+            write_frame(fout, self.atoms.symbols, self.atoms.positions, cell=self.cell, fmt="%f")
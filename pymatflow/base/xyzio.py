@@ -0,0 +1,273 @@
+"""
+fast reading and writing of (multi frame) xyz files
+"""
+import sys
+import numpy as np
+
+
+"""
+Usage:
+    from pymatflow.base.xyzio import xyz_trajectory, read_frame, write_frame
+    traj = xyz_trajectory("trajectory.xyz") # only the frame offsets are read
+    len(traj)
+    frame = traj[-1] # dict of natom, comment, cell, symbols, positions, fix
+    with open("last.xyz", "w") as fout:
+        write_frame(fout, frame["symbols"], frame["positions"], cell=frame["cell"], fix=frame["fix"])
+
+Note:
+    the xyz files of pymatflow carry the cell in the comment line like:
+        cell: 4.08376 0.00000 0.00000 | 0.00000 4.00251 0.00000 | -0.05485 0.00000 8.16247
+    (or "cell(i=3): ..." in trajectories), and optionally three T/F flags after the
+    coordinates of an atom telling whether the atom is fixed along x, y, z. both are
+    read into the frame and written back when given.
+
+    the atom lines of a frame are split once each and converted to arrays by numpy
+    in one go, and a frame is written by one formatted string and one write.
+
+    xyz_trajectory scans the file once in large binary chunks and only counts the
+    newlines(by numpy) to find the byte offset where each frame starts, so frame i
+    of a trajectory of several GB is read by one seek instead of parsing all the
+    frames before it.
+"""
+
+def parse_cell(comment):
+    """
+    :param comment: the comment line of a frame
+    :return cell [[a1, a2, a3], [b1, b2, b3], [c1, c2, c3]] if the line is like
+        "cell: a1 a2 a3 | b1 b2 b3 | c1 c2 c3", otherwise None
+    """
+    head, sep, rest = comment.partition(":")
+    if sep == "" or not head.strip().startswith("cell"):
+        return None
+    values = rest.replace("|", " ").split()
+    if len(values) < 9:
+        return None
+    try:
+        return np.array(values[:9], dtype=float).reshape(3, 3).tolist()
+    except ValueError:
+        return None
+
+def format_cell(cell, label="cell", fmt="%f"):
+    """
+    :return the comment line(without newline) carrying the cell
+    """
+    line = " ".join([fmt] * 3)
+    return ("%s: " % label) + (" | ".join([line] * 3) % tuple(np.array(cell, dtype=float).ravel().tolist()))
+
+def parse_block(lines):
+    """
+    :param lines: the atom lines of a frame
+    :return (symbols, positions, fix): (natom,) str array, (natom, 3) float array
+        and (natom, 3) bool array of the fix flags(all False if not given)
+    """
+    rows = [line.split() for line in lines]
+    natom = len(rows)
+    if natom == 0:
+        return np.zeros(0, dtype=str), np.zeros((0, 3)), np.zeros((0, 3), dtype=bool)
+    lengths = set(map(len, rows))
+    if len(lengths) == 1:
+        table = np.array(rows)
+        symbols = table[:, 0]
+        positions = table[:, 1:4].astype(float)
+        if table.shape[1] > 4:
+            flags = table[:, 4:7] if table.shape[1] >= 7 else None
+            # the first char after coordinates is #, so cannot set T or F
+            comment = np.char.startswith(table[:, 4], "#")
+            fix = _parse_flags(flags, comment)
+        else:
+            fix = np.zeros((natom, 3), dtype=bool)
+        return symbols, positions, fix
+    # lines with different number of columns
+    symbols = np.array([row[0] for row in rows])
+    positions = np.array([row[1:4] for row in rows], dtype=float)
+    fix = np.zeros((natom, 3), dtype=bool)
+    for i, row in enumerate(rows):
+        if len(row) > 4 and row[4][0] != "#":
+            fix[i] = _parse_flags(np.array([row[4:7]]), np.array([False]))[0]
+    return symbols, positions, fix
+
+def format_block(symbols, positions, fix=None, fmt="%.9f"):
+    """
+    :param fix: (natom, 3) bool array like, written as T/F after the coordinates if given
+    :return the atom lines of a frame as one string
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    natom = positions.shape[0]
+    line = "%s\t" + "\t".join([fmt] * 3)
+    table = np.empty((natom, 4 if fix is None else 7), dtype=object)
+    table[:, 0] = np.asarray(symbols, dtype=str).tolist()
+    table[:, 1:4] = positions.tolist()
+    if fix is not None:
+        line += "\t%s\t%s\t%s"
+        table[:, 4:7] = np.where(np.asarray(fix, dtype=bool).reshape(-1, 3), "T", "F").tolist()
+    return ((line + "\n") * natom) % tuple(table.ravel().tolist())
+
+def format_atoms(atoms, fmt="%.9f", fix=False):
+    """
+    :param atoms: a list of Atom or an atoms_array
+    :param fix: whether to write the T/F fix flags
+    :return the atom lines as one string
+    """
+    symbols, positions, flags = _atoms_arrays(atoms)
+    return format_block(symbols, positions, fix=flags if fix == True else None, fmt=fmt)
+
+def read_frame(fin):
+    """
+    read the frame at the current position of fin
+    :return dict of natom, comment, cell, symbols, positions, fix, or None at the end of file
+    """
+    line = fin.readline()
+    if line.strip() == "":
+        return None
+    natom = int(line)
+    comment = fin.readline().rstrip("\r\n")
+    lines = [fin.readline() for i in range(natom)]
+    symbols, positions, fix = parse_block(lines)
+    return {"natom": natom, "comment": comment, "cell": parse_cell(comment),
+        "symbols": symbols, "positions": positions, "fix": fix}
+
+def read_frames(xyzfile):
+    """
+    iterate through all frames of xyzfile sequentially
+    """
+    with open(xyzfile, 'r') as fin:
+        while True:
+            frame = read_frame(fin)
+            if frame is None:
+                break
+            yield frame
+
+def write_frame(fout, symbols, positions, cell=None, comment=None, fix=None, fmt="%.9f"):
+    """
+    :param cell: written to the comment line in the format of pymatflow if comment is None
+    :param comment: the comment line
+    :param fix: (natom, 3) bool array like, written as T/F flags if given
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    if comment is None:
+        comment = format_cell(cell) if cell is not None else ""
+    fout.write("%d\n%s\n%s" % (positions.shape[0], comment, format_block(symbols, positions, fix=fix, fmt=fmt)))
+
+def write_xyz(xyzfile, symbols, positions, cells=None, comments=None, fix=None, fmt="%.9f", mode="w"):
+    """
+    :param positions: (natom, 3) array for one frame or (nframe, natom, 3) for a trajectory
+    :param cells: cell of all frames or list of cell of each frame
+    :param comments: list of comment line of each frame
+    :param mode: "w" or "a" to append the frames to xyzfile
+    """
+    positions = np.asarray(positions, dtype=float)
+    if positions.ndim == 2:
+        positions = positions[None, :, :]
+    if cells is not None and np.ndim(cells) == 2:
+        cells = [cells] * positions.shape[0]
+    with open(xyzfile, mode) as fout:
+        for i in range(positions.shape[0]):
+            write_frame(fout, symbols, positions[i],
+                cell=None if cells is None else cells[i],
+                comment=None if comments is None else comments[i],
+                fix=fix, fmt=fmt)
+
+
+class xyz_trajectory:
+    """
+    random access to the frames of a multi frame xyz file
+    usage:
+        traj = xyz_trajectory("trajectory.xyz")
+        traj[1000]["positions"]
+    """
+    def __init__(self, xyzfile, chunk=2**26):
+        """
+        :param chunk: number of bytes read at a time when building the index
+        """
+        self.file = xyzfile
+        self.offsets, self.natoms = build_index(xyzfile, chunk=chunk)
+
+    def __len__(self):
+        return self.offsets.shape[0]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError("frame index out of range")
+        with open(self.file, 'r', newline="") as fin:
+            fin.seek(int(self.offsets[i]))
+            return read_frame(fin)
+
+    def __iter__(self):
+        return read_frames(self.file)
+
+
+def build_index(xyzfile, chunk=2**26):
+    """
+    :return (offsets, natoms): byte offset of the start of each frame and the
+        number of atoms of each frame
+    """
+    offsets = []
+    natoms = []
+    with open(xyzfile, 'rb') as fin, open(xyzfile, 'rb') as fheader:
+        start = 0 # offset of the next frame
+        skip = 0 # number of newlines before the next frame
+        base = 0 # offset of the current chunk
+        pending = True # the header of the frame at start is not read yet
+        while True:
+            data = fin.read(chunk)
+            if not data:
+                break
+            newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 10) + base
+            base += len(data)
+            k = 0
+            while True:
+                if pending == True:
+                    fheader.seek(start)
+                    header = fheader.readline()
+                    if header.strip() == b"":
+                        return np.array(offsets, dtype=np.int64), np.array(natoms, dtype=int)
+                    offsets.append(start)
+                    natoms.append(int(header))
+                    # the header line itself, the comment line and the atom lines
+                    skip = natoms[-1] + 2
+                    pending = False
+                if k + skip <= newlines.shape[0]:
+                    k += skip
+                    start = int(newlines[k - 1]) + 1
+                    pending = True
+                else:
+                    skip -= newlines.shape[0] - k
+                    break
+        if pending == True:
+            fheader.seek(start)
+            header = fheader.readline()
+            if header.strip() != b"":
+                offsets.append(start)
+                natoms.append(int(header))
+    return np.array(offsets, dtype=np.int64), np.array(natoms, dtype=int)
+
+
+def _parse_flags(flags, comment):
+    """
+    :param flags: (n, 3) str array of the T/F columns
+    :param comment: (n,) bool, lines with a comment instead of flags
+    """
+    fix = np.zeros((comment.shape[0], 3), dtype=bool)
+    if flags is None:
+        return fix
+    use = ~comment
+    if not np.all(np.isin(flags[use], ["T", "F"])):
+        print("===============================\n")
+        print("warning: while read xyz file\n")
+        print("can only set T or F after coords\n")
+        sys.exit(1)
+    fix[use] = flags[use] == "T"
+    return fix
+
+def _atoms_arrays(atoms):
+    """
+    :return (symbols, positions, fix) of a list of Atom or an atoms_array
+    """
+    if hasattr(atoms, "extend_arrays"):
+        return atoms.symbols, atoms.positions, atoms.fix
+    return ([atom.name for atom in atoms], [[atom.x, atom.y, atom.z] for atom in atoms],
+        [list(atom.fix) for atom in atoms])
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
-from emuhelper.base.atom import Atom
-from emuhelper.base.xyz import base_xyz
+from pymatflow.base.atom import Atom
+from pymatflow.base.xyz import base_xyz
+from pymatflow.structure.selection import get_mask, sphere
 
 
 class cluster_xyz(base_xyz):
@@ -10,16 +11,16 @@ class cluster_xyz(base_xyz):
 
     """
     def __init__(self, xyz_file):
-        super().__init__(xyz_file)
+        super().__init__()
+        self.get_xyz(xyz_file)
 
     def build_cluster_sphere(self, radius):
         """
         radius: 球形cluster的半径, 单位是Angstrom
         """
         center = self.get_center_xyz()
-        for atom in self.atoms:
-            if (atom.x - center[0])**2 + (atom.y - center[1])**2 + (atom.z - center[2])**2 > radius**2:
-                self.atoms.remove(atom)
+        # atoms outside the sphere are removed at once
+        self.atoms.delete(get_mask(self, region=sphere(center, radius), invert=True))
         self.natom = len(self.atoms)
         
     def get_center_xyz(self):
@@ -84,7 +84,7 @@ def main():
             a.cell, a.atoms = aseio.read_poscar(args.input)
 
         # output structure
-        import pymatflow.third.aseio
+        import pymatflow.third.aseio as aseio
         aseio.write_lammps_data(cell=a.cell, atoms=a.atoms, filepath=args.output)
 
         print("=========================================================\n")
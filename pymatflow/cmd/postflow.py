@@ -99,6 +99,10 @@ def main():
     subparser.add_argument("-d", "--directory", type=str, default="matflow-running",
             help="Directory to do the calculation")
 
+    subparser.add_argument("--cache", type=str, default="F",
+            choices=["T", "F"],
+            help="whether to cache the parsed output in a sidecar file beside it, so that the next postflow on the unchanged output does not parse it again")
+
     # structure file
     structfile = subparser.add_mutually_exclusive_group() # only one of them can be provided
     structfile.add_argument("--xyz", type=str, default=None,
@@ -171,6 +175,10 @@ def main():
             choices=["matplotlib", "gnuplot"],
             help="plot engine, matplotlib or gnuplot")
 
+    subparser.add_argument("--cache", type=str, default="F",
+            choices=["T", "F"],
+            help="whether to cache the parsed output in a sidecar file beside it, so that the next postflow on the unchanged output does not parse it again")
+
     # structure file
     structfile = subparser.add_mutually_exclusive_group() # only one of them can be provided
     structfile.add_argument("--xyz", type=str, default=None,
@@ -240,6 +248,10 @@ def main():
     subparser.add_argument("--fontsize", type=int, default=10,
             help="fontsize for the plot.")
             
+    subparser.add_argument("--cache", type=str, default="F",
+            choices=["T", "F"],
+            help="whether to cache the parsed output in a sidecar file beside it, so that the next postflow on the unchanged output does not parse it again")
+
     # structure file
     structfile = subparser.add_mutually_exclusive_group() # only one of them can be provided
     structfile.add_argument("--xyz", type=str, default=None,
@@ -313,6 +325,10 @@ def main():
             help="manual input kpath read from the file")
 
 
+    subparser.add_argument("--cache", type=str, default="F",
+            choices=["T", "F"],
+            help="whether to cache the parsed output in a sidecar file beside it, so that the next postflow on the unchanged output does not parse it again")
+
     # structure file
     structfile = subparser.add_mutually_exclusive_group() # only one of them can be provided
     structfile.add_argument("--xyz", type=str, default=None,
@@ -358,6 +374,10 @@ def main():
     subparser.add_argument("--kpath-file", type=str,
             help="manual input kpath read from the file")
 
+    subparser.add_argument("--cache", type=str, default="F",
+            choices=["T", "F"],
+            help="whether to cache the parsed output in a sidecar file beside it, so that the next postflow on the unchanged output does not parse it again")
+
     # structure file
     structfile = subparser.add_mutually_exclusive_group() # only one of them can be provided
     structfile.add_argument("--xyz", type=str, default=None,
@@ -416,6 +436,8 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    cache = args.cache == "T"
+
     # dealing wich structure files
     if args.xyz != None:
         xyzfile = args.xyz
@@ -450,7 +472,7 @@ def main():
             # optimization
             from pymatflow.abinit.post.opt import opt
             post = opt()
-            post.parse(os.path.join(args.directory, "optimization.out"))
+            post.parse(os.path.join(args.directory, "optimization.out"), cache=cache)
             post.export(directory=args.directory)
         elif args.runtype == 2:
             # cubic cell
@@ -487,7 +509,7 @@ def main():
             if "scf" in args.static:
                 from pymatflow.cp2k.post.scf import scf_out
                 task = scf_out()
-                task.get_info(os.path.join(args.directory, "static-scf.out"))
+                task.get_info(os.path.join(args.directory, "static-scf.out"), cache=cache)
                 task.export(args.directory)
             if "band" in args.static:
                 from pymatflow.cp2k.post.bands import bands_post
@@ -549,7 +571,7 @@ def main():
         elif args.runtype == 10:
             # aimd
             from pymatflow.cp2k.post.md import md_post
-            task = md_post(output=os.path.join(args.directory, "aimd.out"), run_type='MD')
+            task = md_post(output=os.path.join(args.directory, "aimd.out"), run_type='MD', cache=cache)
             task.export(args.directory)
         else:
             pass
@@ -578,7 +600,7 @@ def main():
             if args.opt_out == None:
                 # use default relax.out
                 args.opt_out = os.path.join(args.directory, "relax.out")
-            task.get_info(args.opt_out)
+            task.get_info(args.opt_out, cache=cache)
             task.export(args.directory)
         elif args.runtype == 2:
             # vc-relax
@@ -588,7 +610,7 @@ def main():
             if args.opt_out == None:
                 # use default vc-relax.out
                 args.opt_out = os.path.join(args.directory, "vc-relax.out")
-            task.get_info(args.opt_out)
+            task.get_info(args.opt_out, cache=cache)
             task.export(args.directory)
         elif args.runtype == 3:
             # cubic cell
@@ -636,7 +658,7 @@ def main():
             # optimization
             from pymatflow.siesta.post.opt import opt_out
             task = opt_out()
-            task.get_info(os.path.join(args.directory, "geometric-optimization.out"))
+            task.get_info(os.path.join(args.directory, "geometric-optimization.out"), cache=cache)
             task.export(directory=args.directory)
         elif args.runtype == 2:
             # cubic cell
@@ -662,8 +684,8 @@ def main():
             if args.static == "band":
                 from pymatflow.vasp.post.bands import post_bands
                 bands = post_bands()
-                bands.get_kpath_and_vasprun(kpath=get_kpath(kpath_manual=args.kpath_manual, kpath_file=args.kpath_file), vasprun=os.path.join(args.directory, "vasprun.xml"))
-                bands.get_efermi(vasprun=os.path.join(args.directory, "vasprun.xml" if args.efermi.lower() == "nscf" else "vasprun.xml.scf"))
+                bands.get_kpath_and_vasprun(kpath=get_kpath(kpath_manual=args.kpath_manual, kpath_file=args.kpath_file), vasprun=os.path.join(args.directory, "vasprun.xml"), cache=cache)
+                bands.get_efermi(vasprun=os.path.join(args.directory, "vasprun.xml" if args.efermi.lower() == "nscf" else "vasprun.xml.scf"), cache=cache)
                 bands.export(directory=args.directory, engine=args.engine, bandrange=args.bandrange, xrange=args.xrange, yrange=args.yrange)
                 if bands.magnetic_status == "soc-ispin-1" or bands.magnetic_status == "soc-ispin-2":
                     # actually soc-ispin-2 never exists
@@ -679,8 +701,8 @@ def main():
             elif args.static == "dos":
                 from pymatflow.vasp.post.pdos import post_pdos
                 pdos = post_pdos()
-                pdos.get_vasprun(os.path.join(args.directory, "vasprun.xml"))
-                pdos.get_efermi(vasprun=os.path.join(args.directory, "vasprun.xml" if args.efermi.lower() == "nscf" else "vasprun.xml.scf"))            
+                pdos.get_vasprun(os.path.join(args.directory, "vasprun.xml"), cache=cache)
+                pdos.get_efermi(vasprun=os.path.join(args.directory, "vasprun.xml" if args.efermi.lower() == "nscf" else "vasprun.xml.scf"), cache=cache)            
                 pdos.export(directory=args.directory, engine=args.engine, plotrange=args.plotrange)
                 
         elif args.runtype == 1:
@@ -688,7 +710,7 @@ def main():
             from pymatflow.vasp.post.opt import opt_out
             os.chdir(args.directory)
             opt = opt_out()
-            opt.get_info(outcar="OUTCAR", poscar="POSCAR")
+            opt.get_info(outcar="OUTCAR", poscar="POSCAR", cache=cache)
             os.chdir("../")
             opt.export(directory=args.directory)
         elif args.runtype == 2:
@@ -722,7 +744,7 @@ def main():
         elif args.runtype == 10:
             # aimd
             from pymatflow.vasp.post.md import md_post
-            task = md_post(output=os.path.join(args.directory, "OUTCAR"))
+            task = md_post(output=os.path.join(args.directory, "OUTCAR"), cache=cache)
             task.export(directory=os.path.join(args.directory, "post-processing"))
             print("=========================================================\n")
             print("             convert XDATCAR to xxx.xyz\n")
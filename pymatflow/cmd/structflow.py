@@ -19,36 +19,11 @@ def read_structure(filepath):
         from pymatflow.structure.crystal import crystal
         a = crystal()
         a.from_xyz_file(filepath)
-    elif filepath.split(".")[-1] == "cif":
+    elif filepath.split(".")[-1] in ["cif", "xsd", "xsf", "cfg", "lammps", "lmp"] or os.path.basename(filepath) in ["POSCAR", "CONTCAR"]:
         from pymatflow.structure.crystal import crystal
         import pymatflow.third.aseio as aseio
         a = crystal()
-        a.cell, a.atoms = aseio.read_cif(filepath)
-    elif filepath.split(".")[-1] == "xsd":
-        from pymatflow.structure.crystal import crystal
-        import pymatflow.third.aseio as aseio
-        a = crystal()
-        a.cell, a.atoms = aseio.read_xsd(filepath)
-    elif filepath.split(".")[-1] == "xsf":
-        from pymatflow.structure.crystal import crystal
-        import pymatflow.third.aseio as aseio
-        a = crystal()
-        a.cell, a.atoms = aseio.read_xsf(filepath)
-    elif filepath.split(".")[-1] == "cfg":
-        from pymatflow.structure.crystal import crystal
-        import pymatflow.third.aseio as aseio 
-        a = crystal()
-        a.cell, a.atoms = aseio.read_cfg(filepath)    
-    elif os.path.basename(filepath) == "POSCAR" or os.path.basename(filepath) == "CONTCAR":
-        from pymatflow.structure.crystal import crystal
-        import pymatflow.third.aseio as aseio
-        a = crystal()
-        a.cell, a.atoms = aseio.read_poscar(filepath)
-    elif filepath.split(".")[-1] == "lammps" or filepath.split(".")[-1] == "lmp":
-        from pymatflow.structure.crystal import crystal
-        import pymatflow.third.aseio as aseio
-        a = crystal()
-        a.cell, a.atoms = aseio.read_lammps_data(filepath)
+        a.cell, a.atoms = aseio.read(filepath)
     else:
         pass
     return a
@@ -66,21 +41,9 @@ def write_structure(structure, filepath, frac=1):
     """
     if filepath.split(".")[-1] == "xyz":
         structure.write_xyz(filepath=filepath)
-    elif filepath.split(".")[-1] == "cif":
+    elif filepath.split(".")[-1] in ["cif", "xsd", "xsf", "cube", "cfg", "lammps", "lmp"]:
         import pymatflow.third.aseio as aseio
-        aseio.write_cif(cell=structure.cell, atoms=structure.atoms, filepath=filepath)
-    elif filepath.split(".")[-1] == "xsd":
-        import pymatflow.third.aseio as aseio
-        aseio.write_xsd(cell=structure.cell, atoms=structure.atoms, filepath=filepath)
-    elif filepath.split(".")[-1] == "xsf":
-        import pymatflow.third.aseio as aseio
-        aseio.write_xsf(cell=structure.cell, atoms=structure.atoms, filepath=filepath)
-    elif filepath.split(".")[-1] == "cube":
-        import pymatflow.third.aseio as aseio
-        aseio.write_cube(cell=structure.cell, atoms=structure.atoms, filepath=filepath)
-    elif filepath.split(".")[-1] == "cfg":
-        import pymatflow.third.aseio as aseio 
-        aseio.write_cfg(cell=structure.cell, atoms=structure.atoms, filepath=filepath)
+        aseio.write(filepath, structure.cell, structure.atoms)
     elif os.path.basename(filepath) == "POSCAR" or os.path.basename(filepath) == "CONTCAR":
         from pymatflow.structure.crystal import crystal
         from pymatflow.vasp.base.poscar import vasp_poscar
@@ -99,9 +62,6 @@ def write_structure(structure, filepath, frac=1):
             else:
                 pass
             poscar.to_poscar(fout=fout, coordtype=coordtype)
-    elif filepath.split(".")[-1] == "lammps" or filepath.split(".")[-1] == "lmp":
-        import pymatflow.third.aseio as aseio
-        aseio.write_lammps_data(cell=structure.cell, atoms=structure.atoms, filepath=filepath)            
     else:
         pass
 
@@ -14,6 +14,7 @@ from pymatflow.cp2k.base.atom_potential import cp2k_atom_potential
 from pymatflow.cp2k.base.atom_powell import cp2k_atom_powell
 from pymatflow.cp2k.base.atom_pp_basis import cp2k_atom_pp_basis
 from pymatflow.cp2k.base.atom_print import cp2k_atom_print
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -25,18 +26,19 @@ class cp2k_atom:
     """
 
     """
+    ae_basis = lazy_section("cp2k_atom_ae_basis", "AE_BASIS")
+    method = lazy_section("cp2k_atom_method", "METHOD")
+    optimization = lazy_section("cp2k_atom_optimization", "OPTIMIZATION")
+    potential = lazy_section("cp2k_atom_potential", "POTENTIAL")
+    powell = lazy_section("cp2k_atom_powell", "POWELL")
+    pp_basis = lazy_section("cp2k_atom_pp_basis", "PP_BASIS")
+    printout = lazy_section("cp2k_atom_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.ae_basis = cp2k_atom_ae_basis()
-        self.method = cp2k_atom_method()
-        self.optimization = cp2k_atom_optimization()
-        self.potential = cp2k_atom_potential()
-        self.powell = cp2k_atom_powell()
-        self.pp_basis = cp2k_atom_pp_basis()
-        self.printout = cp2k_atom_print()
         # basic setting
 
     def to_input(self, fout):
@@ -44,19 +46,19 @@ class cp2k_atom:
         fout.write("&ATOM\n")
         for item in self.params:
             fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.ae_basis.status == True:
+        if section_active(self, "ae_basis"):
             self.ae_basis.to_input(fout)
-        if self.method.status == True:
+        if section_active(self, "method"):
             self.method.to_input(fout)
-        if self.optimization.status == True:
+        if section_active(self, "optimization"):
             self.optimization.to_input(fout)
-        if self.potential.status == True:
+        if section_active(self, "potential"):
             self.potential.to_input(fout)
-        if self.powell.status == True:
+        if section_active(self, "powell"):
             self.powell.to_input(fout)
-        if self.pp_basis.status == True:
+        if section_active(self, "pp_basis"):
             self.pp_basis.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("&END ATOM\n")
         fout.write("\n")
@@ -68,22 +70,4 @@ class cp2k_atom:
             self.method.xc.wf_correlation.status = True
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "AE_BASIS":
-                self.ae_basis.set_params({item: params[item]})
-            elif item.split("-")[0] == "METHOD":
-                self.method.set_params({item: params[item]})
-            elif item.split("-")[0] == "OPTIMIZATION":
-                self.optimization.set_params({item: params[item]})
-            elif item.split("-")[0] == "POTENTIAL":
-                self.potential.set_params({item: params[item]})
-            elif item.split("-")[0] == "POWELL":
-                self.powell.set_params({item: params[item]})
-            elif item.split("-")[0] == "PP_BASIS":
-                self.pp_basis.set_params({item: params[item]})
-            elif item.split("-")[0] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
@@ -7,6 +7,7 @@ import os
 import shutil
 
 from pymatflow.cp2k.base.atom_print import cp2k_atom_print
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 """
 Usage:
@@ -25,38 +26,28 @@ class cp2k_atom_ae_basis_basis:
         fout.write("\t\t&END BASIS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_ae_basis:
+    basis = lazy_section("cp2k_atom_ae_basis_basis", "BASIS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.basis = cp2k_atom_ae_basis_basis()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t&AE_BASIS\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.basis.status == True:
+        if section_active(self, "basis"):
             self.basis.to_input(fout)
         fout.write("\t&END AE_BASIS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "BASIS":
-                self.basis.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
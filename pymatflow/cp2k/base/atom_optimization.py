@@ -7,6 +7,7 @@ import os
 import shutil
 
 from pymatflow.cp2k.base.atom_print import cp2k_atom_print
+from pymatflow.cp2k.base.section import route_params
 
 """
 Usage:
@@ -34,10 +35,6 @@ class cp2k_atom_optimization:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
@@ -7,6 +7,7 @@ import os
 import shutil
 
 from pymatflow.cp2k.base.atom_print import cp2k_atom_print
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 """
 Usage:
@@ -32,11 +33,7 @@ class cp2k_atom_potential_ecp:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_atom_potential_gth_potential:
@@ -58,46 +55,34 @@ class cp2k_atom_potential_gth_potential:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_atom_potential:
     """
 
     """
+    ecp = lazy_section("cp2k_atom_potential_ecp", "ECP")
+    gth_potential = lazy_section("cp2k_atom_potential_gth_potential", "GTH_POTENTIAL")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.ecp = cp2k_atom_potential_ecp()
-        self.gth_potential = cp2k_atom_potential_gth_potential()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t&POTENTIAL\n")
         for item in self.params:
             fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.ecp.status == True:
+        if section_active(self, "ecp"):
             self.ecp.to_input(fout)
-        if self.gth_potential.status == True:
+        if section_active(self, "gth_potential"):
             self.gth_potential.to_input(fout)
         fout.write("\t&END POTENTIAL\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "ECP":
-                self.ecp.set_params({item: params[item]})
-            elif item.split("-")[1] == "GTH_POTENTIAL":
-                self.gth_potential.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -30,43 +31,33 @@ class cp2k_atom_print_admm_admm_basis_basis:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_atom_print_admm_admm_basis:
     """
 
     """
+    basis = lazy_section("cp2k_atom_print_admm_admm_basis_basis", "BASIS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.basis = cp2k_atom_print_admm_admm_basis_basis()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t\t&ADMM_BASIS\n")
         for item in self.params:
             fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.basis.status == True:
+        if section_active(self, "basis"):
             self.basis.to_input(fout)
         fout.write("\t\t\t&END ADMM_BASIS\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "BASIS":
-                self.basis.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_admm_each:
@@ -88,49 +79,37 @@ class cp2k_atom_print_admm_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_admm:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_admm_each", "EACH")
+    admm_basis = lazy_section("cp2k_atom_print_admm_admm_basis", "ADMM_BASIS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_admm_each()
-        self.admm_basis = cp2k_atom_print_admm_admm_basis()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&ADMM\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
-        if self.admm_basis.status == True:
+        if section_active(self, "admm_basis"):
             self.admm_basis.to_input(fout)
         fout.write("\t\t&END ADMM\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            elif item.split("-")[2] == "ADMM_BASIS":
-                self.admm_basis.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_analyze_basis_each:
     """
@@ -151,44 +130,34 @@ class cp2k_atom_print_analyze_basis_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_analyze_basis:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_analyze_basis_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_analyze_basis_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&ANALYZE_BASIS\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END ANALYZE_BASIS\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_basis_set_each:
     """
@@ -209,44 +178,34 @@ class cp2k_atom_print_basis_set_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_basis_set:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_basis_set_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_basis_set_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&BASIS_SET\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END BASIS_SET\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_fit_basis_each:
     """
@@ -267,44 +226,34 @@ class cp2k_atom_print_fit_basis_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_fit_basis:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_fit_basis_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_fit_basis_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&FIT_BASIS\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END FIT_BASIS\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_fit_density_each:
     """
@@ -325,44 +274,34 @@ class cp2k_atom_print_fit_density_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_fit_density:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_fit_density_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_fit_density_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&FIT_DENSITY\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END FIT_DENSITY\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_fit_kgpot_each:
     """
@@ -383,44 +322,34 @@ class cp2k_atom_print_fit_kgpot_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_fit_kgpot:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_fit_kgpot_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_fit_kgpot_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&FIT_KGPOT\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END FIT_KGPOT\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_fit_pseudo_each:
     """
@@ -441,44 +370,34 @@ class cp2k_atom_print_fit_pseudo_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_fit_pseudo:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_fit_pseudo_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_fit_pseudo_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&FIT_PSEUDO\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END FIT_PSEUDO\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_geometrical_response_basis_each:
     """
@@ -499,44 +418,34 @@ class cp2k_atom_print_geometrical_response_basis_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_geometrical_response_basis:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_geometrical_response_basis_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_geometrical_response_basis_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&GEOMETRICAL_RESPONSE_BASIS\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END GEOMETRICAL_RESPONSE_BASIS\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_atom_print_method_info_each:
@@ -558,44 +467,34 @@ class cp2k_atom_print_method_info_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_method_info:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_method_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_method_info_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&METHOD_INFO\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END METHOD_INFO\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_orbitals_each:
     """
@@ -616,44 +515,34 @@ class cp2k_atom_print_orbitals_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_orbitals:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_orbitals_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_orbitals_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&ORBITALS\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END ORBITALS\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_potential_each:
     """
@@ -674,44 +563,34 @@ class cp2k_atom_print_potential_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_potential:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_potential_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_potential_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&POTENTIAL\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END POTENTIAL\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_program_banner_each:
     """
@@ -732,44 +611,34 @@ class cp2k_atom_print_program_banner_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_program_banner:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_program_banner_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_program_banner_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&PROGRAM_BANNER\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PROGRAM_BANNER\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_response_basis_each:
     """
@@ -790,44 +659,34 @@ class cp2k_atom_print_response_basis_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_response_basis:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_response_basis_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_response_basis_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&RESPONSE_BASIS\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END RESPONSE_BASIS\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_atom_print_scf_info_each:
     """
@@ -848,44 +707,34 @@ class cp2k_atom_print_scf_info_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_scf_info:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_scf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_scf_info_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&SCF_INFO\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END SCF_INFO\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_atom_print_separable_gaussian_pseudo_each:
@@ -907,44 +756,34 @@ class cp2k_atom_print_separable_gaussian_pseudo_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_separable_gaussian_pseudo:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_separable_gaussian_pseudo_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_separable_gaussian_pseudo_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&SEPARABLE_GAUSSIAN_PSEUDO\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END SEPARABLE_GAUSSIAN_PSEUDO\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_atom_print_upf_file_each:
@@ -966,44 +805,34 @@ class cp2k_atom_print_upf_file_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_atom_print_upf_file:
     """
 
     """
+    each = lazy_section("cp2k_atom_print_upf_file_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_atom_print_upf_file_each()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&UPF_FILE\n")
         for item in self.params:
             fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END UPF_FILE\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -1011,108 +840,72 @@ class cp2k_atom_print:
     """
 
     """
+    admm = lazy_section("cp2k_atom_print_admm", "ADMM")
+    analyze_basis = lazy_section("cp2k_atom_print_analyze_basis", "ANALYZE_BASIS")
+    basis_set = lazy_section("cp2k_atom_print_basis_set", "BASIS_SET")
+    fit_basis = lazy_section("cp2k_atom_print_fit_basis", "FIT_BASIS")
+    fit_density = lazy_section("cp2k_atom_print_fit_density", "FIT_DENSITY")
+    fit_kgpot = lazy_section("cp2k_atom_print_fit_kgpot", "FIT_KGPOT")
+    fit_pseudo = lazy_section("cp2k_atom_print_fit_pseudo", "FIT_PSEUDO")
+    geometrical_response_basis = lazy_section("cp2k_atom_print_geometrical_response_basis", "GEOMETRICAL_RESPONSE_BASIS")
+    method_info = lazy_section("cp2k_atom_print_method_info", "METHOD_INFO")
+    orbitals = lazy_section("cp2k_atom_print_orbitals", "ORBITALS")
+    potential = lazy_section("cp2k_atom_print_potential", "POTENTIAL")
+    program_banner = lazy_section("cp2k_atom_print_program_banner", "PROGRAM_BANNER")
+    response_basis = lazy_section("cp2k_atom_print_response_basis", "RESPONSE_BASIS")
+    scf_info = lazy_section("cp2k_atom_print_scf_info", "SCF_INFO")
+    separable_gaussian_pseudo = lazy_section("cp2k_atom_print_separable_gaussian_pseudo", "SEPARABLE_GAUSSIAN_PSEUDO")
+    upf_file = lazy_section("cp2k_atom_print_upf_file", "UPF_FILE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.admm = cp2k_atom_print_admm()
-        self.analyze_basis = cp2k_atom_print_analyze_basis()
-        self.basis_set = cp2k_atom_print_basis_set()
-        self.fit_basis = cp2k_atom_print_fit_basis()
-        self.fit_density = cp2k_atom_print_fit_density()
-        self.fit_kgpot = cp2k_atom_print_fit_kgpot()
-        self.fit_pseudo = cp2k_atom_print_fit_pseudo()
-        self.geometrical_response_basis = cp2k_atom_print_geometrical_response_basis()
-        self.method_info = cp2k_atom_print_method_info()
-        self.orbitals = cp2k_atom_print_orbitals()
-        self.potential = cp2k_atom_print_potential()
-        self.program_banner = cp2k_atom_print_program_banner()
-        self.response_basis = cp2k_atom_print_response_basis()
-        self.scf_info = cp2k_atom_print_scf_info()
-        self.separable_gaussian_pseudo = cp2k_atom_print_separable_gaussian_pseudo()
-        self.upf_file = cp2k_atom_print_upf_file()
         # basic setting
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t&PRINT\n")
         for item in self.params:
             fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.admm.status == True:
+        if section_active(self, "admm"):
             self.admm.to_input(fout)
-        if self.analyze_basis.status == True:
+        if section_active(self, "analyze_basis"):
             self.analyze_basis.to_input(fout)
-        if self.basis_set.status == True:
+        if section_active(self, "basis_set"):
             self.basis_set.to_input(fout)
-        if self.fit_basis.status == True:
+        if section_active(self, "fit_basis"):
             self.fit_basis.to_input(fout)
-        if self.fit_density.status == True:
+        if section_active(self, "fit_density"):
             self.fit_density.to_input(fout)
-        if self.fit_kgpot.status == True:
+        if section_active(self, "fit_kgpot"):
             self.fit_kgpot.to_input(fout)
-        if self.fit_pseudo.status == True:
+        if section_active(self, "fit_pseudo"):
             self.fit_pseudo.to_input(fout)
-        if self.geometrical_response_basis.status == True:
+        if section_active(self, "geometrical_response_basis"):
             self.geometrical_response_basis.to_input(fout)
-        if self.method_info.status == True:
+        if section_active(self, "method_info"):
             self.method_info.to_input(fout)
-        if self.orbitals.status == True:
+        if section_active(self, "orbitals"):
             self.orbitals.to_input(fout)
-        if self.potential.status == True:
+        if section_active(self, "potential"):
             self.potential.to_input(fout)
-        if self.program_banner.status == True:
+        if section_active(self, "program_banner"):
             self.program_banner.to_input(fout)
-        if self.response_basis.status == True:
+        if section_active(self, "response_basis"):
             self.response_basis.to_input(fout)
-        if self.scf_info.status == True:
+        if section_active(self, "scf_info"):
             self.scf_info.to_input(fout)
-        if self.separable_gaussian_pseudo.status == True:
+        if section_active(self, "separable_gaussian_pseudo"):
             self.separable_gaussian_pseudo.to_input(fout)
-        if self.upf_file.status == True:
+        if section_active(self, "upf_file"):
             self.upf_file.to_input(fout)
         fout.write("\t&END PRINT\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "ADMM":
-                self.admm.set_params({item: params[item]})
-            elif item.split("-")[1] == "ANALYZE_BASIS":
-                self.analyze_basis.set_params({item: params[item]})
-            elif item.split("-")[1] == "BASIS_SET":
-                self.basis_set.set_params({item: params[item]})
-            elif item.split("-")[1] == "FIT_BASIS":
-                self.fit_basis.set_params({item: params[item]})
-            elif item.split("-")[1] == "FIT_DENSITY":
-                self.fit_density.set_params({item: params[item]})
-            elif item.split("-")[1] == "FIT_KGPOT":
-                self.kgpot.set_params({item: params[item]})
-            elif item.split("-")[1] == "FIT_PSEUDO":
-                self.fit_pseudo.set_params({item: params[item]})
-            elif item.split("-")[1] == "GEOMETRICAL_RESPONSE_BASIS":
-                self.geometrical_response_basis.set_params({item: params[item]})
-            elif item.split("-")[1] == "METHOD_INFO":
-                self.method_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "ORBITALS":
-                self.orbitals.set_params({item: params[item]})
-            elif item.split("-")[1] == "POTENTIAL":
-                self.potential.set_params({item: params[item]})
-            elif item.split("-")[1] == "PROGRAM_BANNER":
-                self.program_banner.set_params({item: params[item]})
-            elif item.split("-")[1] == "RESPONSE_BASIS":
-                self.response_basis.set_params({item: params[item]})
-            elif item.split("-")[1] == "SCF_INFO":
-                self.scf_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "SEPARABLE_GAUSSIAN_PSEUDO":
-                self.separable_gaussian_pseudo.set_params({item: params[item]})
-            elif item.split("-")[1] == "UPF_FILE":
-                self.upf_file.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -39,11 +40,7 @@ class cp2k_bsse_configuration:
         fout.write("\t\t&END CONFIGURATION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_bsse_fragment:
     """
@@ -68,11 +65,7 @@ class cp2k_bsse_fragment:
         fout.write("\t\t&END FRAGMENT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_bsse_fragment_energies:
@@ -98,11 +91,7 @@ class cp2k_bsse_fragment_energies:
         fout.write("\t\t&END FRAGMENT_ENERGIES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_bsse_print_program_run_info_each:
@@ -128,23 +117,20 @@ class cp2k_bsse_print_program_run_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_bsse_print_program_run_info:
     """
 
     """
+    each = lazy_section("cp2k_bsse_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_bsse_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -158,11 +144,7 @@ class cp2k_bsse_print_program_run_info:
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_bsse_print_restart_each:
@@ -188,23 +170,20 @@ class cp2k_bsse_print_restart_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_bsse_print_restart:
     """
 
     """
+    each = lazy_section("cp2k_bsse_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_bsse_print_restart_each()
         # basic setting
 
     def to_input(self, fout):
@@ -218,24 +197,21 @@ class cp2k_bsse_print_restart:
         fout.write("\t\t\t&END RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_bsse_print:
     """
 
     """
+    program_run_info = lazy_section("cp2k_bsse_print_program_run_info", "PROGRAM_RUN_INFO")
+    restart = lazy_section("cp2k_bsse_print_restart", "RESTART")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.program_run_info = cp2k_bsse_print_program_run_info()
-        self.restart = cp2k_bsse_print_restart()
         # basic setting
 
     def to_input(self, fout):
@@ -246,37 +222,30 @@ class cp2k_bsse_print:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_bsse:
     """
 
     """
+    configuration = lazy_section("cp2k_bsse_configuration", "CONFIGURATION")
+    fragment = lazy_section("cp2k_bsse_fragment", "FRAGMENT")
+    fragment_energies = lazy_section("cp2k_bsse_fragment_energies", "FRAGMENT_ENERGIES")
+    printout = lazy_section("cp2k_bsse_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.configuration = cp2k_bsse_configuration()
-        self.fragment = cp2k_bsse_fragment()
-        self.fragment_energies = cp2k_bsse_fragment_energies()
-        self.printout = cp2k_bsse_print()
         # basic setting
 
     def to_input(self, fout):
@@ -287,27 +256,15 @@ class cp2k_bsse:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.configuration.status == True:
+        if section_active(self, "configuration"):
             self.configuration.to_input(fout)
-        if self.fragment.status == True:
+        if section_active(self, "fragment"):
             self.fragment.to_input(fout)
-        if self.fragment_energies.status == True:
+        if section_active(self, "fragment_energies"):
             self.fragment_energies.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t&END BSSE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "CONFIGURATION":
-                self.configuration.set_params({item: params[item]})
-            elif item.split("-")[1] == "FRAGMENT":
-                self.fragment.set_params({item: params[item]})
-            elif item.split("-")[1] == "FRAGMENT_ENERGIES":
-                self.fragment_energies.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
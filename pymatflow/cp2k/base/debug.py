@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -32,22 +33,19 @@ class cp2k_debug_program_run_info_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_debug_program_run_info:
     """
     """
+    each = lazy_section("cp2k_debug_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_debug_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -56,31 +54,26 @@ class cp2k_debug_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t&END PROGRAM_RUN_INFO\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_debug:
     """
     """
+    program_run_info = lazy_section("cp2k_debug_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.program_run_info = cp2k_debug_program_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -89,19 +82,13 @@ class cp2k_debug:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("&END DEBUG\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
 
 
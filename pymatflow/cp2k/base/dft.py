@@ -34,6 +34,7 @@ from pymatflow.cp2k.base.dft_print import cp2k_dft_print
 from pymatflow.cp2k.base.dft_kpoints import cp2k_dft_kpoints
 from pymatflow.cp2k.base.dft_localize import cp2k_dft_localize
 from pymatflow.cp2k.base.dft_efield import cp2k_dft_efield
+from pymatflow.cp2k.base.section import lazy_section, section_active, section_touched, route_params
 
 """
 usage:
@@ -47,6 +48,34 @@ class cp2k_dft:
     """
 
     """
+    almo_scf = lazy_section("cp2k_dft_almo_scf", "ALMO_SCF")
+    auxiliary_density_matrix_method = lazy_section("cp2k_dft_auxiliary_density_matrix_method", "AUXILIARY_DENSITY_MATRIX_METHOD")
+    density_fitting = lazy_section("cp2k_dft_density_fitting", "DENSITY_FITTING")
+    efield = lazy_section("cp2k_dft_efield", "EFIELD")
+    external_density = lazy_section("cp2k_dft_external_density", "EXTERNAL_DENSITY")
+    external_potential = lazy_section("cp2k_dft_external_potential", "EXTERNAL_POTENTIAL")
+    external_vxc = lazy_section("cp2k_dft_external_vxc", "EXTERNAL_VXC")
+    kg_method = lazy_section("cp2k_dft_kg_method", "KG_METHOD")
+    kpoints = lazy_section("cp2k_dft_kpoints", "KPOINTS")
+    localize = lazy_section("cp2k_dft_localize", "LOCALIZE")
+    low_spin_roks = lazy_section("cp2k_dft_low_spin_roks", "LOW_SPIN_ROKS")
+    ls_scf = lazy_section("cp2k_dft_ls_scf", "LS_SCF")
+    mgrid = lazy_section("cp2k_dft_mgrid", "MGRID")
+    periodic_efield = lazy_section("cp2k_dft_periodic_efield", "PERIODIC_EFIELD")
+    poisson = lazy_section("cp2k_dft_poisson", "POISSON")
+    printout = lazy_section("cp2k_dft_print", "PRINT")
+    qs = lazy_section("cp2k_dft_qs", "QS")
+    real_time_propagation = lazy_section("cp2k_dft_real_time_propagation", "REAL_TIME_PROPAGATION")
+    relativistic = lazy_section("cp2k_dft_relativistic", "RELATIVISTIC")
+    sccs = lazy_section("cp2k_dft_sccs", "SCCS")
+    scf = lazy_section("cp2k_dft_scf", "SCF")
+    scrf = lazy_section("cp2k_dft_scrf", "SCRF")
+    sic = lazy_section("cp2k_dft_sic", "SIC")
+    tddfpt = lazy_section("cp2k_dft_tddfpt", "TDDFPT")
+    transport = lazy_section("cp2k_dft_transport", "TRANSPORT")
+    xas = lazy_section("cp2k_dft_xas", "XAS")
+    xc = lazy_section("cp2k_dft_xc", "XC")
+
     def __init__(self):
         """
             BASIS_MOLOPT contains the basis set for all elements
@@ -73,60 +102,6 @@ class cp2k_dft:
                 }
         self.status = False
 
-        self.almo_scf = cp2k_dft_almo_scf()
-
-        self.auxiliary_density_matrix_method = cp2k_dft_auxiliary_density_matrix_method()
-
-        self.density_fitting = cp2k_dft_density_fitting()
-
-        self.efield = cp2k_dft_efield() 
-        
-        self.external_density = cp2k_dft_external_density()
-
-        self.external_potential = cp2k_dft_external_potential()
-
-        self.external_vxc = cp2k_dft_external_vxc()
-
-        self.kg_method = cp2k_dft_kg_method()
-
-        self.kpoints = cp2k_dft_kpoints()
-
-        self.localize = cp2k_dft_localize()
-
-        self.low_spin_roks = cp2k_dft_low_spin_roks()
-
-        self.ls_scf = cp2k_dft_ls_scf()
-        
-        self.mgrid = cp2k_dft_mgrid()
-
-        self.periodic_efield = cp2k_dft_periodic_efield()
-
-        self.poisson = cp2k_dft_poisson()
-        
-        self.printout = cp2k_dft_print()
-
-        self.qs = cp2k_dft_qs()
-        
-        self.real_time_propagation = cp2k_dft_real_time_propagation()
-        
-        self.relativistic = cp2k_dft_relativistic() 
-        
-        self.sccs = cp2k_dft_sccs()
-
-        self.scf = cp2k_dft_scf()
-        
-        self.scrf = cp2k_dft_scrf()
-        
-        self.sic = cp2k_dft_sic() 
-        
-        self.tddfpt = cp2k_dft_tddfpt()
-        
-        self.transport = cp2k_dft_transport()
-        
-        self.xas = cp2k_dft_xas() 
-        
-        self.xc = cp2k_dft_xc()
-
         # basic setting
         self.qs.status = True
         self.poisson.status = True
@@ -145,29 +120,29 @@ class cp2k_dft:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.qs.status == True:
+        if section_active(self, "qs"):
             self.qs.to_input(fout)
-        if self.poisson.status == True:
+        if section_active(self, "poisson"):
             self.poisson.to_input(fout)
-        if self.ls_scf.status == True:
+        if section_active(self, "ls_scf"):
             self.ls_scf.to_input(fout)
-        if self.mgrid.status == True:
+        if section_active(self, "mgrid"):
             self.mgrid.to_input(fout)
-        if self.xc.status == True:
+        if section_active(self, "xc"):
             self.xc.to_input(fout)
-        if self.kpoints.status == True:
+        if section_active(self, "kpoints"):
             self.kpoints.to_input(fout)
         #if self.sccs.status == True:
         #    self.sccs.to_input(fout)
-        if self.sccs.section != None and self.sccs.section.upper() == "TRUE":
+        if section_touched(self, "sccs") and self.sccs.section != None and self.sccs.section.upper() == "TRUE":
             self.sccs.to_input(fout)
-        if self.scf.status == True:
+        if section_active(self, "scf"):
             self.scf.to_input(fout)
-        if self.localize.status == True:
+        if section_active(self, "localize"):
             self.localize.to_input(fout)
-        if self.periodic_efield.status == True:
+        if section_active(self, "periodic_efield"):
             self.periodic_efield.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t&END DFT\n")
 
@@ -182,66 +157,5 @@ class cp2k_dft:
             self.params["LSD"] = ".TRUE."
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                if item.split("-")[-1] == "LS_SCF":
-                    self.ls_scf.section = params[item]
-                elif item.split("-")[-1] == "SCCS":
-                    self.sccs.section = params[item]
-                else:
-                    self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "ALMO_SCF":
-                self.almo_scf.set_params({item: params[item]})
-            elif item.split("-")[1] == "AUXILIARY_DENSITY_MATRIX_METHOD":
-                self.auxiliary_density_matrix_method.set_params({item: params[item]})
-            elif item.split("-")[1] == "DENSITY_FITTING":
-                self.density_fitting.set_params({item: params[item]})
-            elif item.split("-")[1] == "EFIELD":
-                self.efield.set_params({item: params[item]})
-            elif item.split("-")[1] == "EXTERNAL_DENSITY":
-                self.external_density.set_params({item: params[item]})
-            elif item.split("-")[1] == "EXTERNAL_POTENTIAL":
-                self.external_potential.set_params({item: params[item]})
-            elif item.split("-")[1] == "EXTERNAL_VXC":
-                self.external_vxc.set_params({item: params[item]})
-            elif item.split("-")[1] == "KG_METHOD":
-                self.kg_method.set_params({item: params[item]})
-            elif item.split("-")[1] == "KPOINTS":
-                self.kpoints.set_params({item: params[item]})
-            elif item.split("-")[1] == "LOCALIZE":
-                self.localize.set_params({item: params[item]})
-            elif item.split("-")[1] == "LOW_SPIN_ROKS":
-                self.low_spin_roks.set_params({item: params[item]})
-            elif item.split("-")[1] == "LS_SCF":
-                self.ls_scf.set_params({item: params[item]})
-            elif item.split("-")[1] == "MGRID":
-                self.mgrid.set_params({item: params[item]})
-            elif item.split("-")[1] == "PERIODIC_EFIELD":
-                self.periodic_efield.set_params({item: params[item]})
-            elif item.split("-")[1] == "POISSON":
-                self.poisson.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[1] == "QS":
-                self.qs.set_params({item: params[item]})
-            elif item.split("-")[1] == "REAL_TIME_PROPAGATION":
-                self.real_time_propagation.set_params({item: params[item]})
-            elif item.split("-")[1] == "RELATIVISTIC":
-                self.relativistic.set_params({item: params[item]})
-            elif item.split("-")[1] == "SCCS":
-                self.sccs.set_params({item: params[item]})
-            elif item.split("-")[1] == "SCF":
-                self.scf.set_params({item: params[item]})
-            elif item.split("-")[1] == "SCRF":
-                self.scrf.set_params({item: params[item]})
-            elif item.split("-")[1] == "SIC":
-                self.sic.set_params({item: params[item]})
-            elif item.split("-")[1] == "TDDFPT":
-                self.tddfpt.set_params({item: params[item]})
-            elif item.split("-")[1] == "TRANSPORT":
-                self.transport.set_params({item: params[item]})
-            elif item.split("-")[1] == "XAS":
-                self.xas.set_params({item: params[item]})
-            elif item.split("-")[1] == "XC":
-                self.xc.set_params({item: params[item]})
+        route_params(self, params, level=1)
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ==================================
 # CP2K / FORCE_EVAL / DFT / ALMO_SCF
 # ==================================
@@ -24,11 +26,7 @@ class cp2k_dft_almo_scf_almo_optimizer_diis:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_almo_scf_almo_optimizer_pcg:
     def __init__(self):
@@ -49,11 +47,7 @@ class cp2k_dft_almo_scf_almo_optimizer_pcg:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_almo_scf_analysis_print_almo_cta_each:
     def __init__(self):
@@ -74,22 +68,18 @@ class cp2k_dft_almo_scf_analysis_print_almo_cta_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_almo_scf_analysis_print_almo_cta:
+    each = lazy_section("cp2k_dft_almo_scf_analysis_print_almo_cta_each", "EACH")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.each = cp2k_dft_almo_scf_analysis_print_almo_cta_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -100,19 +90,13 @@ class cp2k_dft_almo_scf_analysis_print_almo_cta:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ALMO_CTA\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_almo_scf_analysis_print_almo_eda_ct_each:
     def __init__(self):
@@ -133,21 +117,17 @@ class cp2k_dft_almo_scf_analysis_print_almo_eda_ct_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_almo_scf_analysis_print_almo_eda_ct:
+    each = lazy_section("cp2k_dft_almo_scf_analysis_print_almo_eda_ct_each", "EACH")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.each = cp2k_dft_almo_scf_analysis_print_almo_eda_ct_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -158,31 +138,25 @@ class cp2k_dft_almo_scf_analysis_print_almo_eda_ct:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ALMO_EDA_CT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_almo_scf_analysis_print:
+    almo_cta = lazy_section("cp2k_dft_almo_scf_analysis_print_almo_cta", "ALMO_CTA")
+    almo_eda_ct = lazy_section("cp2k_dft_almo_scf_analysis_print_almo_eda_ct", "ALMO_EDA_CT")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.almo_cta = cp2k_dft_almo_scf_analysis_print_almo_cta()
-        self.almo_eda_ct = cp2k_dft_almo_scf_analysis_print_almo_eda_ct()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -191,33 +165,25 @@ class cp2k_dft_almo_scf_analysis_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.almo_cta.status == True:
+        if section_active(self, "almo_cta"):
             self.almo_cat.to_input(fout)
-        if self.almo_eda_ct.status == True:
+        if section_active(self, "almo_eda_ct"):
             self.almo_eda_ct.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "ALMO_CTA":
-                self.almo_cta.set_params({item: params[item]})
-            elif item.split("-")[4] == "ALMO_EDA_CT":
-                self.almo_eda_ct.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_almo_scf_analysis:
+    printout = lazy_section("cp2k_dft_almo_scf_analysis_print", "PRINT")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.printout = cp2k_dft_almo_scf_analysis_print()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -228,19 +194,13 @@ class cp2k_dft_almo_scf_analysis:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t&END ANALYSIS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_almo_scf_xalmo_optimizer_pcg:
     def __init__(self):
@@ -261,24 +221,20 @@ class cp2k_dft_almo_scf_xalmo_optimizer_pcg:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_almo_scf:
+    almo_optimizer_diis = lazy_section("cp2k_dft_almo_scf_almo_optimizer_diis", "ALMO_OPTIMIZER_DIIS")
+    almo_optimizer_pcg = lazy_section("cp2k_dft_almo_scf_almo_optimizer_pcg", "ALMO_OPTIMIZER_PCG")
+    anlysis = lazy_section("cp2k_dft_almo_scf_analysis", "ANALYSIS")
+    xalmo_optimizer_pcg = lazy_section("cp2k_dft_almo_scf_xalmo_optimizer_pcg", "XALMO_OPTIMIZER_PCG")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.almo_optimizer_diis = cp2k_dft_almo_scf_almo_optimizer_diis()
-        self.almo_optimizer_pcg = cp2k_dft_almo_scf_almo_optimizer_pcg()
-        self.anlysis = cp2k_dft_almo_scf_analysis()
-        self.xalmo_optimizer_pcg = cp2k_dft_almo_scf_xalmo_optimizer_pcg()
-
         # basic setting
 
     def to_input(self, fout):
@@ -289,28 +245,16 @@ class cp2k_dft_almo_scf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.almo_optimizer_diis.status == True:
+        if section_active(self, "almo_optimizer_diis"):
             self.almo_optimizer_diis.to_input(fout)
-        if self.almo_optimizer_pcg.status == True:
+        if section_active(self, "almo_optimizer_pcg"):
             self.almo_optimizer_pcg.to_input(fout)
         if self.analysis.status == True:
             self.analysis.to_input(fout)
-        if self.xalmo_optimizer_pcg.status == True:
+        if section_active(self, "xalmo_optimizer_pcg"):
             self.xalmo_optimizer_pcg.to_input(fout) 
         fout.write("\t\t&END ALMO_SCF\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "ALMO_OPTIMIZER_DIIS":
-                self.almo_optimizer_diis.set_params({item: params[item]})
-            elif item.split("-")[2] == "ALMO_OPTIMIZER_PCG":
-                self.almo_optimizer_pcg.set_params({item: params[item]})
-            elif item.split("-")[2] == "ANLYSIS":
-                self.analysis.set_params({item: params[item]})
-            elif item.split("-")[2] == "XALMO_OPTIMIZER_PCG":
-                self.xalmo_optimizer_pcg.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
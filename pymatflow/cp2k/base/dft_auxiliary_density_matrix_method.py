@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import route_params
+
 
 # ============================================
 # ============================================
@@ -23,8 +25,4 @@ class cp2k_dft_auxiliary_density_matrix_method:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
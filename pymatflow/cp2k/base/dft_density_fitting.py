@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ================================
 # ================================
 class cp2k_dft_density_fitting_program_run_info_each:
@@ -22,21 +24,17 @@ class cp2k_dft_density_fitting_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_density_fitting_program_run_info:
+    each = lazy_section("cp2k_dft_density_fitting_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.each = cp2k_dft_density_fitting_program_run_info_each()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -45,29 +43,23 @@ class cp2k_dft_density_fitting_program_run_info:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_density_fitting:
+    program_run_info = lazy_section("cp2k_dft_density_fitting_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
             
-        self.program_run_info = cp2k_dft_density_fitting_program_run_info()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -78,16 +70,10 @@ class cp2k_dft_density_fitting:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t&END DENSITY_FITTING\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
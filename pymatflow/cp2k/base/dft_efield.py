@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 # ====================
 # ====================
@@ -21,11 +23,7 @@ class cp2k_dft_efield_constant_env:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -44,11 +42,7 @@ class cp2k_dft_efield_custom_env:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_efield_gaussian_env:
     def __init__(self):
@@ -65,11 +59,7 @@ class cp2k_dft_efield_gaussian_env:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_efield_ramp_env:
@@ -87,14 +77,15 @@ class cp2k_dft_efield_ramp_env:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_efield:
+    constant_env = lazy_section("cp2k_dft_efield_constant_env", "CONSTANT_ENV")
+    custom_env = lazy_section("cp2k_dft_efield_custom_env", "CUSTOM_ENV")
+    gaussian_env = lazy_section("cp2k_dft_efield_gaussian_env", "GAUSSIAN_ENV")
+    ramp_env = lazy_section("cp2k_dft_efield_ramp_env", "RAMP_ENV")
+
     def __init__(self):
         self.params = {
                 "ENVELOP": None,
@@ -105,11 +96,6 @@ class cp2k_dft_efield:
                 }
         self.status = False
 
-        self.constant_env = cp2k_dft_efield_constant_env()
-        self.custom_env = cp2k_dft_efield_custom_env()
-        self.gaussian_env = cp2k_dft_efield_gaussian_env()
-        self.ramp_env = cp2k_dft_efield_ramp_env()
-
     def to_input(self, fout):
         fout.write("\t\t&EFIELD\n")
         for item in self.params:
@@ -118,28 +104,16 @@ class cp2k_dft_efield:
                     fout.write("\t\t\t%s %.f %.f %.f\n" % (item, self.params[item][0], self.params[item][1], self.params[item][2]))
                 else:
                     fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.constant_env.status == True:
+        if section_active(self, "constant_env"):
             self.constant_env.to_input(fout)
-        if self.custom_env.status == True:
+        if section_active(self, "custom_env"):
             self.cuttom_env.to_input(fout)
-        if self.gaussian_env.status == True:
+        if section_active(self, "gaussian_env"):
             self.gaussian_env.to_input(fout)
-        if self.ramp_env.status == True:
+        if section_active(self, "ramp_env"):
             self.ramp_env.to_input(fout)
         fout.write("\t\t&END EFIELD\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CONSTANT_ENV":
-                self.constant_env.set_params({item: params[item]})
-            elif item.split("-")[2] == "CUSTOM_ENV":
-                self.custom_env.set_params({item: params[item]})
-            elif item.split("-")[2] == "GAUSSIAN_ENV":
-                self.gaussian_env.set_params({item: params[item]})
-            elif item.split("-")[2] == "RAMP_ENV":
-                self.ramp_env.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import route_params
+
 # ==============================
 # ==============================
 class cp2k_dft_external_density:
@@ -22,8 +24,4 @@ class cp2k_dft_external_density:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ==========================
 # ==========================
 
@@ -21,9 +23,7 @@ class cp2k_dft_kg_method_energy_correction_xc_adiabatic_rescaling:
         fout.write("\t\t\t\t\t&END ADIABATIC_RESCALING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_hf_info_each:
@@ -43,18 +43,16 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_hf_info_each:
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_hf_info:
+    each = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_hf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_energy_correction_xc_hf_hf_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -66,16 +64,12 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_hf_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END HF_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_interaction_potential:
     def __init__(self):
@@ -94,9 +88,7 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_interaction_potential:
         fout.write("\t\t\t\t\t\t&END INTERACTION_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_load_balance_print_each:
     def __init__(self):
@@ -115,22 +107,16 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_load_balance_print_each:
         fout.write("\t\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_load_balance_print:
+    each = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_load_balance_print_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_energy_correction_xc_hf_load_balance_print_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -141,28 +127,23 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_load_balance_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_load_balance:
+    printout = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_load_balance_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_dft_kg_method_energy_correction_xc_hf_load_balance_print()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -171,18 +152,12 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_load_balance:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_memory:
@@ -202,9 +177,7 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_memory:
         fout.write("\t\t\t\t\t\t&END MEMORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_periodic:
     def __init__(self):
@@ -223,9 +196,7 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_periodic:
         fout.write("\t\t\t\t\t\t&END PERIODIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_hf_screening:
     def __init__(self):
@@ -244,24 +215,22 @@ class cp2k_dft_kg_method_energy_correction_xc_hf_screening:
         fout.write("\t\t\t\t\t\t&END SCREENING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_hf:
+    hf_info = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_hf_info", "HF_INFO")
+    interaction_potential = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_interaction_potential", "INTERACTION_POTENTIAL")
+    load_balance = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_load_balance", "LOAD_BALANCE")
+    memory = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_memory", "MEMORY")
+    periodic = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_periodic", "PERIODIC")
+    screening = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf_info = cp2k_dft_kg_method_energy_correction_xc_hf_hf_info()
-        self.interaction_potential = cp2k_dft_kg_method_energy_correction_xc_hf_interaction_potential()
-        self.load_balance = cp2k_dft_kg_method_energy_correction_xc_hf_load_balance()
-        self.memory = cp2k_dft_kg_method_energy_correction_xc_hf_memory()
-        self.periodic = cp2k_dft_kg_method_energy_correction_xc_hf_periodic()
-        self.screening = cp2k_dft_kg_method_energy_correction_xc_hf_screening()
-
         # basic setting
 
     def to_input(self, fout):
@@ -272,38 +241,22 @@ class cp2k_dft_kg_method_energy_correction_xc_hf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf_info.status == True:
+        if section_active(self, "hf_info"):
             self.hf_info.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.load_balance.status == True:
+        if section_active(self, "load_balance"):
             self.load_balance.to_input(fout)
-        if self.memory.status == True:
+        if section_active(self, "memory"):
             self.memory.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input(fout)
         fout.write("\t\t\t\t\t&END HF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "HF_INFO":
-                self.hf_info.set_params({item: parmas[item]})
-            elif item.split("-")[5] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[5] == "LOAD_BALANCE":
-                self.load_balance.set_params({item: params[item]})
-            elif item.split("-")[5] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[5] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[5] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential_print_dftd_each:
     def __init__(self):
@@ -318,18 +271,16 @@ class cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential_print
         fout.write("\t\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential_print_dftd:
+    each = lazy_section("cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential_print_dftd_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential_print_dftd_each()
-
         # basic setting
         self.each.status = True
 
@@ -337,27 +288,21 @@ class cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential_print
         fout.write("\t\t\t\t\t\t\t&PRINT_DFTD\n")
         for item in self.params:
             fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END PRINT_DFTD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential:
+    print_dftd = lazy_section("cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential_print_dftd", "PRINT_DFTD")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.print_dftd = cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential_print_dftd()
-
         # basic setting
         self.params["PARAMETER_FILE_NAME"] = "dftd3.dat"
 
@@ -365,16 +310,12 @@ class cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential:
         fout.write("\t\t\t\t\t&PAIR_POTENTIAL\n")
         for item in self.params:
             fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.print_dftd.status == True:
+        if section_active(self, "print_dftd"):
             self.print_dftd.to_input(fout)
         fout.write("\t\t\t\t\t&END PAIR_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "PRINT_DFTD":
-                self.print_dftd.set_params({item: params[item]})
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_vdw_potential_non_local:
     def __init__(self):
@@ -389,12 +330,13 @@ class cp2k_dft_kg_method_energy_correction_xc_vdw_potential_non_local:
         fout.write("\t\t\t\t\t\t&END NON_LOCAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_vdw_potential:
+    pair_potential = lazy_section("cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential", "PAIR_POTENTIAL")
+    non_local = lazy_section("cp2k_dft_kg_method_energy_correction_xc_vdw_potential_non_local", "NON_LOCAL")
+
     def __init__(self):
         self.params = {
                 "POTENTIAL_TYPE": None,
@@ -402,8 +344,6 @@ class cp2k_dft_kg_method_energy_correction_xc_vdw_potential:
         self.status = False
 
         self.params["POTENTIAL_TYPE"] = "PAIR_POTENTIAL"
-        self.pair_potential = cp2k_dft_kg_method_energy_correction_xc_vdw_potential_pair_potential()
-        self.non_local = cp2k_dft_kg_method_energy_correction_xc_vdw_potential_non_local()
 
     def to_input(self, fout):
         fout.write("\t\t\t\t\t&VDW_POTENTIAL\n")
@@ -416,13 +356,7 @@ class cp2k_dft_kg_method_energy_correction_xc_vdw_potential:
         fout.write("\t\t\t&END VDW_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "PAIR_POTENTIAL":
-                self.pair_potential.set_params({item: params[item]})
-            elif item.split("-")[5] == "NON_LOCAL":
-                self.non_local.set_params({item: params[item]})
+        route_params(self, params, level=5)
 
 
 
@@ -442,11 +376,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_cphf:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_direct_canonical:
@@ -465,11 +395,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_direct_canonical:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_cutoff_calib:
@@ -488,11 +414,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_cutoff_cali
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_eri_mme_info_each:
     def __init__(self):
@@ -510,21 +432,17 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_eri_mme_inf
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_eri_mme_info:
+    each = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_eri_mme_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_eri_mme_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -536,31 +454,25 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_eri_mme_inf
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END ERI_MME_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme:
+    cutoff_calib = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_cutoff_calib", "CUTOFF_CALIB")
+    eri_mme_info = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_eri_mme_info", "ERI_MME_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cutoff_calib = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_cutoff_calib()
-        self.eri_mme_info = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme_eri_mme_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -571,24 +483,16 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cutoff_calib.status == True:
+        if section_active(self, "cutoff_calib"):
             self.cutoff_calib.to_input(fout)
-        if self.eri_mme_info.status == True:
+        if section_active(self, "eri_mme_info"):
             self.eri_mme_info.to_input(fout)
         fout.write("\t\t\t\t\t\t&END ERI_MME\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "CUTOFF_CALIB":
-                self.cutoff_calib.set_params({item: params[item]})
-            elif item.split("-")[6] == "ERI_MME_INFO":
-                self.eri_mme_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_interaction_potential:
     def __init__(self):
@@ -606,11 +510,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_interaction_potenti
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_mp2_info_each:
@@ -632,21 +532,17 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_mp2_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_mp2_info:
+    each = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_mp2_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_mp2_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -658,20 +554,14 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_mp2_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END MP2_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_opt_ri_basis:
     def __init__(self):
@@ -689,11 +579,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_opt_ri_basis:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_laplace:
@@ -712,11 +598,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_laplace:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_mp2:
     def __init__(self):
@@ -734,11 +616,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_mp2:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_hf_info_each:
     def __init__(self):
@@ -756,20 +634,16 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_hf_info_e
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=9)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_hf_info:
+    each = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_hf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_hf_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -781,20 +655,14 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_hf_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&END HF_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_interaction_potential:
     def __init__(self):
@@ -812,11 +680,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_interacti
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance_print_each:
     def __init__(self):
@@ -834,20 +698,16 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_bala
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=10)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance_print:
+    each = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance_print_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance_print_each()
-
         # basic setting 
         self.each.status = True
 
@@ -859,29 +719,23 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_bala
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=9)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance:
+    printout = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -892,20 +746,14 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_bala
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_memory:
     def __init__(self):
@@ -923,11 +771,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_memory:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_periodic:
     def __init__(self):
@@ -945,11 +789,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_periodic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_screening:
     def __init__(self):
@@ -967,25 +807,21 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_screening
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf:
+    hf_info = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_hf_info", "HF_INFO")
+    interaction_potential = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_interaction_potential", "INTERACTION_POTENTIAL")
+    load_balance = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance", "LOAD_BALANCE")
+    memory = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_memory", "MEMORY")
+    periodic = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_periodic", "PERIODIC")
+    screening = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf_info = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_hf_info()
-        self.interaction_potential = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_interaction_potential()
-        self.load_balance = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_load_balance()
-        self.memory = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_memory()
-        self.periodic = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_periodic()
-        self.screening = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf_screening()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -994,40 +830,24 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf_info.status == True:    
+        if section_active(self, "hf_info"):    
             self.hf_info.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.load_balance.status == True:
+        if section_active(self, "load_balance"):
             self.load_balance.to_input(fout)
         if self.memoery.status == True:
             self.memory.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input()
         fout.write("\t\t\t\t\t\t\t&end HF\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "HF_INFO":
-                self.hf_info.set_params({item: params[item]})
-            elif item.split("-")[7] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[7] == "LOAD_BALANCE":
-                self.load_balance.set_params({item: params[item]})
-            elif item.split("-")[7] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[7] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[7] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_im_time:
@@ -1046,11 +866,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_im_time:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_ri_axk:
@@ -1069,11 +885,7 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_ri_axk:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_ri_g0w0:
     def __init__(self):
@@ -1091,23 +903,19 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_ri_g0w0:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa:
+    hf = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf", "HF")
+    im_time = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_im_time", "IM_TIME")
+    ri_axk = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_ri_axk", "RI_AXK")
+    ri_g0w0 = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_ri_g0w0", "RI_G0W0")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_hf()
-        self.im_time = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_im_time()
-        self.ri_axk = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_ri_axk()
-        self.ri_g0w0 = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa_ri_g0w0()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1118,32 +926,20 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf.status == True:
+        if section_active(self, "hf"):
             self.hf.to_input(fout)
-        if self.im_time.status == True:
+        if section_active(self, "im_time"):
             self.im_time.to_input(fout)
-        if self.ri_axk.status == True:
+        if section_active(self, "ri_axk"):
             self.ri_axk.to_input(fout)
-        if self.ri_g0w0.status == True:
+        if section_active(self, "ri_g0w0"):
             self.ri_g0w0.to_input(fout)
         fout.write("\t\t\t\t\t\t&end RI_RPA\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "HF":
-                self.hf.set_params({item: params[item]})
-            elif item.split("-")[6] == "IM_TIME":
-                self.im_time.set_params({item: params[item]})
-            elif item.split("-")[6] == "RI_AXK":
-                self.ri_axk.set_params({item: params[item]})
-            elif item.split("-")[6] == "RI_G0W0":
-                self.ri_g0w0.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_wfc_gpw:
@@ -1162,29 +958,25 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation_wfc_gpw:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_wf_correlation:
+    cphf = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_cphf", "CPHF")
+    direct_canonical = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_direct_canonical", "DIRECT_CANONICAL")
+    eri_mme = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme", "ERI_MME")
+    interaction_potential = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_interaction_potential", "INTERACTION_POTENTIAL")
+    mp2_info = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_mp2_info", "MP2_INFO")
+    opt_ri_basis = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_opt_ri_basis", "OPT_RI_BASIS")
+    ri_laplace = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_laplace", "RI_LAPLACE")
+    ri_mp2 = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_mp2", "RI_MP2")
+    ri_rpa = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa", "RI_RPA")
+    wfc_gpw = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation_wfc_gpw", "WFC_GPW")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cphf = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_cphf()
-        self.direct_canonical = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_direct_canonical()
-        self.eri_mme = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_eri_mme()
-        self.interaction_potential = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_interaction_potential()
-        self.mp2_info = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_mp2_info()
-        self.opt_ri_basis = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_opt_ri_basis()
-        self.ri_laplace = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_laplace()
-        self.ri_mp2 = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_mp2()
-        self.ri_rpa = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_ri_rpa()
-        self.wfc_gpw = cp2k_dft_kg_method_energy_correction_xc_wf_correlation_wfc_gpw()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1193,56 +985,32 @@ class cp2k_dft_kg_method_energy_correction_xc_wf_correlation:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cphf.status == True:
+        if section_active(self, "cphf"):
             self.cphf.to_input(fout)
-        if self.direct_canonical.status == True:
+        if section_active(self, "direct_canonical"):
             self.direct_canonical.to_input(fout)
-        if self.eri_mme.status == True:
+        if section_active(self, "eri_mme"):
             self.eri_mme.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.mp2_info.status == True:
+        if section_active(self, "mp2_info"):
             self.mp2_info.to_input(fout)
-        if self.opt_ri_basis.status == True:
+        if section_active(self, "opt_ri_basis"):
             self.opt_ri_basis.to_input(fout)
-        if self.ri_laplace.status == True:
+        if section_active(self, "ri_laplace"):
             self.ri_laplace.to_iknput(fout)
-        if self.ri_mp2.status == True:
+        if section_active(self, "ri_mp2"):
             self.ri_mp2.to_input(fout)
-        if self.ri_rpa.status == True:
+        if section_active(self, "ri_rpa"):
             self.ri_rpa.to_input(fout)
-        if self.wfc_gpw.status == True:
+        if section_active(self, "wfc_gpw"):
             self.wfc_gpw.to_input(fout)
         fout.write("\t\t\t\t\t&END WF_CORRELATION\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "CPHF":
-                self.cphf.set_params({item: params[item]})
-            elif item.split("-")[5] == "DIRECT_CANONICAL":
-                self.direct_canonical.set_params({item: params[item]})
-            elif item.split("-")[5] == "ERI_MME":
-                self.eri_mme.set_params({item: params[item]})
-            elif item.split("-")[5] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[5] == "MP2_INFO":
-                self.mp2_info.set_params({item: params[item]})
-            elif item.split("-")[5] == "OPT_RI_BASIS":
-                self.opt_ri_basis.set_params({item: params[item]})
-            elif item.split("-")[5] == "RI_LAPLACE":
-                self.ri_laplace.set_params({item: params[item]})
-            elif item.split("-")[5] == "RI_MP2":
-                self.ri_mp2.set_params({item: params[item]})
-            elif item.split("-")[5] == "RI_RPA":
-                self.ri_rpa.set_params({item: params[item]})
-            elif item.split("-")[5] == "WFC_GPW":
-                self.wfc_gpw.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 
@@ -1262,9 +1030,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88_lr:
     def __init__(self):
@@ -1282,9 +1048,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88_lr_adiabatic:
     def __init__(self):
@@ -1302,9 +1066,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88_lr_adiabatic
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke97:
@@ -1323,9 +1085,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke97:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke_roussel:
     def __init__(self):
@@ -1343,9 +1103,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke_roussel:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_beef:
     def __init__(self):
@@ -1363,9 +1121,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_beef:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_cs1:
     def __init__(self):
@@ -1383,9 +1139,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_cs1:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_gv09:
     def __init__(self):
@@ -1403,9 +1157,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_gv09:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_hcth:
     def __init__(self):
@@ -1423,9 +1175,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_hcth:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_ke_gga:
     def __init__(self):
@@ -1443,9 +1193,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_ke_gga:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_ke_libxc:
     def __init__(self):
@@ -1463,9 +1211,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_ke_libxc:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_lda_hole_t_c_lr:
     def __init__(self):
@@ -1483,9 +1229,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_lda_hole_t_c_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_libxc:
     def __init__(self):
@@ -1503,9 +1247,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_libxc:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_lyp:
     def __init__(self):
@@ -1523,9 +1265,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_lyp:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_lyp_adiabatic:
     def __init__(self):
@@ -1543,9 +1283,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_lyp_adiabatic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_optx:
     def __init__(self):
@@ -1563,9 +1301,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_optx:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_p86c:
     def __init__(self):
@@ -1583,9 +1319,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_p86c:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pade:
     def __init__(self):
@@ -1603,9 +1337,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pade:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pbe:
     def __init__(self):
@@ -1623,9 +1355,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pbe:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pbe_hole_t_c_lr:
     def __init__(self):
@@ -1643,9 +1373,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pbe_hole_t_c_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pw92:
     def __init__(self):
@@ -1663,9 +1391,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pw92:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pz81:
     def __init__(self):
@@ -1683,9 +1409,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_pz81:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_tf:
     def __init__(self):
@@ -1703,9 +1427,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_tf:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_tfw:
     def __init__(self):
@@ -1723,9 +1445,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_tfw:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_tpss:
     def __init__(self):
@@ -1743,9 +1463,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_tpss:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_vwn:
     def __init__(self):
@@ -1763,9 +1481,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_vwn:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_xalpha:
     def __init__(self):
@@ -1783,9 +1499,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_xalpha:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_xgga:
     def __init__(self):
@@ -1803,9 +1517,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_xgga:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional_xwpbe:
     def __init__(self):
@@ -1823,11 +1535,38 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional_xwpbe:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_functional:
+    becke88_lr = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88_lr", "BECKE88_LR")
+    becke88_lr_adiabatic = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88_lr_adiabatic", "BECKE88_LR_ADIABATIC")
+    becke97 = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke97", "BECKE97")
+    becke_roussel = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke_roussel", "BECKE_ROUSSEL")
+    beef = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_beef", "BEEF")
+    cs1 = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_cs1", "CS1")
+    gv09 = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_gv09", "GV09")
+    hcth = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_hcth", "HCTH")
+    ke_gga = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_ke_gga", "KE_GGA")
+    ke_libxc = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_ke_libxc", "KE_LIBXC")
+    lda_hole_t_c_lr = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_lda_hole_t_c_lr", "LDA_HOLE_T_C_LR")
+    libxc = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_libxc", "LIBXC")
+    lyp = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_lyp", "LYP")
+    lyp_adiabatic = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_lyp_adiabatic", "LYP_ADIABATIC")
+    optx = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_optx", "OPTX")
+    p86c = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_p86c", "P86C")
+    pade = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_pade", "PADE")
+    pbe = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_pbe", "PBE")
+    pbe_hole_t_c_lr = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_pbe_hole_t_c_lr", "PBE_HOLE_T_C_LR")
+    pw92 = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_pw92", "PW92")
+    pz81 = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_pz81", "PZ81")
+    tf = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_tf", "TF")
+    tfw = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_tfw", "TFW")
+    tpss = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_tpss", "TPSS")
+    vwn = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_vwn", "VWN")
+    xalpha = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_xalpha", "XALPHA")
+    xgga = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_xgga", "XGGA")
+    xwpbe = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional_xwpbe", "XWPBE")
+
     def __init__(self):
         self.section = "PBE"
         self.params = {
@@ -1835,38 +1574,9 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional:
         self.status = False
 
         self.becke88 =  cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88()
-        self.becke88_lr = cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88_lr()
-        self.becke88_lr_adiabatic = cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke88_lr_adiabatic()
-        self.becke97 = cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke97()
-        self.becke_roussel = cp2k_dft_kg_method_energy_correction_xc_xc_functional_becke_roussel()
-        self.beef = cp2k_dft_kg_method_energy_correction_xc_xc_functional_beef()
-        self.cs1 = cp2k_dft_kg_method_energy_correction_xc_xc_functional_cs1()
-        self.gv09 = cp2k_dft_kg_method_energy_correction_xc_xc_functional_gv09()
-        self.hcth = cp2k_dft_kg_method_energy_correction_xc_xc_functional_hcth()
-        self.ke_gga = cp2k_dft_kg_method_energy_correction_xc_xc_functional_ke_gga()
-        self.ke_libxc = cp2k_dft_kg_method_energy_correction_xc_xc_functional_ke_libxc()
-        self.lda_hole_t_c_lr = cp2k_dft_kg_method_energy_correction_xc_xc_functional_lda_hole_t_c_lr()
-        self.libxc = cp2k_dft_kg_method_energy_correction_xc_xc_functional_libxc()
-        self.lyp = cp2k_dft_kg_method_energy_correction_xc_xc_functional_lyp()
-        self.lyp_adiabatic = cp2k_dft_kg_method_energy_correction_xc_xc_functional_lyp_adiabatic()
-        self.optx = cp2k_dft_kg_method_energy_correction_xc_xc_functional_optx()
-        self.p86c = cp2k_dft_kg_method_energy_correction_xc_xc_functional_p86c()
-        self.pade = cp2k_dft_kg_method_energy_correction_xc_xc_functional_pade()
-        self.pbe = cp2k_dft_kg_method_energy_correction_xc_xc_functional_pbe()
-        self.pbe_hole_t_c_lr = cp2k_dft_kg_method_energy_correction_xc_xc_functional_pbe_hole_t_c_lr()
-        self.pw92 = cp2k_dft_kg_method_energy_correction_xc_xc_functional_pw92()
-        self.pz81 = cp2k_dft_kg_method_energy_correction_xc_xc_functional_pz81()
-        self.tf = cp2k_dft_kg_method_energy_correction_xc_xc_functional_tf()
-        self.tfw = cp2k_dft_kg_method_energy_correction_xc_xc_functional_tfw()
-        self.tpss = cp2k_dft_kg_method_energy_correction_xc_xc_functional_tpss()
-        self.vwn = cp2k_dft_kg_method_energy_correction_xc_xc_functional_vwn()
-        self.xalpha = cp2k_dft_kg_method_energy_correction_xc_xc_functional_xalpha()
-        self.xgga = cp2k_dft_kg_method_energy_correction_xc_xc_functional_xgga()
-        self.xwpbe = cp2k_dft_kg_method_energy_correction_xc_xc_functional_xwpbe()
 
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1939,69 +1649,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_functional:
         set_params for xc_functional is different from many other
         set_params, as it deal with the key 'XC_FUNCTIONAL' only
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "BECKE88":
-                self.becke88.set_params({item: params[item]})
-            elif item.split("-")[5] == "BECKE88_LR":
-                self.becke88_lr.set_params({item: params[item]})
-            elif item.split("-")[5] == "BECKE88_LR_ADIABATIC":
-                self.becke88_lr_adiabatic.set_params({item: params[item]})
-            elif item.split("-")[5] == "BECKE97":
-                self.becke97.set_params({item: params[item]})
-            elif item.split("-")[5] == "BECKE_ROUSSEL":
-                self.becke_roussel.set_params({item: params[item]})
-            elif item.split("-")[5] == "BEEF":
-                self.beef.set_params({item: params[item]})
-            elif item.split("-")[5] == "CS1":
-                self.cs1.set_params({item: params[item]})
-            elif item.split("-")[5] == "GV09":
-                self.gv09.set_params({item: params[item]})
-            elif item.split("-")[5] == "HCTH":
-                self.hcth.set_params({item: params[item]})
-            elif item.split("-")[5] == "KE_GGA":
-                self.ke_gga.set_params({item: params[item]})
-            elif item.split("-")[5] == "KE_LIBXC":
-                self.ke_libxc.set_params({item: params[item]})
-            elif item.split("-")[5] == "LDA_HOLE_T_C_LR":
-                self.lda_hole_t_c_lr.set_params({item: params[item]})
-            elif item.split("-")[5] == "LIBXC":
-                self.libxc.set_params({item: params[item]})
-            elif item.split("-")[5] == "LYP":
-                self.lyp.set_params({item: params[item]})
-            elif item.split("-")[5] == "LYP_ADIABATIC":
-                self.lyp_adiabatic.set_params({item: params[item]})
-            elif item.split("-")[5] == "OPTX":
-                self.optx.set_params({item: params[item]})
-            elif item.split("-")[5] == "P86C":
-                self.p86c.set_params({item: params[item]})
-            elif item.split("-")[5] == "PADE":
-                self.pade.set_params({item: params[item]})
-            elif item.split("-")[5] == "PBE":
-                self.pbe.set_params({item: params[item]})
-            elif item.split("-")[5] == "PBE_HOLE_T_C_LR":
-                self.pbe_hole_t_c_lr.set_params({item: params[item]})
-            elif item.split("-")[5] == "PW92":
-                self.pw92.set_params({item: params[item]})
-            elif item.split("-")[5] == "PZ81":
-                self.pz81.set_params({item: params[item]})
-            elif item.split("-")[5] == "TF":
-                self.tf.set_params({item: params[item]})
-            elif item.split("-")[5] == "TFW":
-                self.tfw.set_params({item: params[item]})
-            elif item.split("-")[5] == "TPSS":
-                self.tpss.set_params({item: params[item]})
-            elif item.split("-")[5] == "VWN":
-                self.vwn.set_params({item: params[item]})
-            elif item.split("-")[5] == "XALPHA":
-                self.xalpha.set_params({item: params[item]})
-            elif item.split("-")[5] == "XGGA":
-                self.xgga.set_params({item: params[item]})
-            elif item.split("-")[5] == "XWPBE":
-                self.xwpbe.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_grid:
     def __init__(self):
@@ -2022,9 +1670,7 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_grid:
         fout.write("\t\t\t\t\t&END XC_GRID\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_potential_saop:
@@ -2044,18 +1690,16 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_potential_saop:
         fout.write("\t\t\t\t\t\t&END SAOP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_energy_correction_xc_xc_potential:
+    saop = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_potential_saop", "SAOP")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.saop = cp2k_dft_kg_method_energy_correction_xc_xc_potential_saop()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2066,33 +1710,29 @@ class cp2k_dft_kg_method_energy_correction_xc_xc_potential:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.saop.status == True:
+        if section_active(self, "saop"):
             self.saop.to_input(fout)
         fout.write("\t\t\t\t\t&END XC_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "SAOP":
-                self.saop.set_params({item: params[item]})
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_energy_correction_xc:
+    adiabatic_rescaling = lazy_section("cp2k_dft_kg_method_energy_correction_xc_adiabatic_rescaling", "ADIABATIC_RESCALING")
+    hf = lazy_section("cp2k_dft_kg_method_energy_correction_xc_hf", "HF")
+    vdw_potential = lazy_section("cp2k_dft_kg_method_energy_correction_xc_vdw_potential", "VDW_POTENTIAL")
+    wf_correlation = lazy_section("cp2k_dft_kg_method_energy_correction_xc_wf_correlation", "WF_CORRELATION")
+    xc_functional = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_functional", "XC_FUNCTIONAL")
+    xc_grid = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_grid", "XC_GRID")
+    xc_potential = lazy_section("cp2k_dft_kg_method_energy_correction_xc_xc_potential", "XC_POTENTIAL")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.adiabatic_rescaling = cp2k_dft_kg_method_energy_correction_xc_adiabatic_rescaling()
-        self.hf = cp2k_dft_kg_method_energy_correction_xc_hf()
-        self.vdw_potential = cp2k_dft_kg_method_energy_correction_xc_vdw_potential()
-        self.wf_correlation = cp2k_dft_kg_method_energy_correction_xc_wf_correlation()
-        self.xc_functional = cp2k_dft_kg_method_energy_correction_xc_xc_functional()
-        self.xc_grid = cp2k_dft_kg_method_energy_correction_xc_xc_grid()
-        self.xc_potential = cp2k_dft_kg_method_energy_correction_xc_xc_potential()
-
         # basic setting
         self.xc_functional.status = True
         self.vdw_potential.status = False
@@ -2110,56 +1750,37 @@ class cp2k_dft_kg_method_energy_correction_xc:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.adiabatic_rescaling.status == True:
+        if section_active(self, "adiabatic_rescaling"):
             self.adiabatic_rescaling.to_input(fout)
-        if self.hf.status == True:
+        if section_active(self, "hf"):
             self.hf.to_input(fout)
-        if self.xc_functional.status == True:
+        if section_active(self, "xc_functional"):
             self.xc_functional.to_input(fout)
-        if self.vdw_potential.status == True:
+        if section_active(self, "vdw_potential"):
             self.vdw_potential.to_input(fout)
-        if self.wf_correlation.status == True:
+        if section_active(self, "wf_correlation"):
             self.wf_correlation.to_input(fout)
-        if self.xc_grid.status == True:
+        if section_active(self, "xc_grid"):
             self.xc_grid.to_input(fout)
-        if self.xc_potential.status == True:
+        if section_active(self, "xc_potential"):
             self.xc_potential.to_input(fout)
         fout.write("\t\t\t\t&END XC\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "XC_FUNCTIONAL":
-                self.xc_functional.set_params({item: params[item]})
-            elif item.split("-")[4] == "VDW_POTENTIAL":
-                self.vdw_potential.set_params({item: params[item]})
-            elif item.split("-")[4] == "ADIABATIC_RESCALING":
-                self.adiabatic_rescaling.set_params({item: params[item]})
-            elif item.split("-")[4] == "HF":
-                self.hf.set_params({item: params[item]})
-            elif item.split("-")[4] == "WF_CORRELATION":
-                self.wf_correlation.set_params({item: params[item]})
-            elif item.split("-")[4] == "XC_GRID":
-                self.xc_grid.set_params({item: params[item]})
-            elif item.split("-")[4] == "XC_POTENTIAL":
-                self.xc_potential.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_kg_method_energy_correction:
+    xc = lazy_section("cp2k_dft_kg_method_energy_correction_xc", "XC")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.xc = cp2k_dft_kg_method_energy_correction_xc()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -2168,19 +1789,13 @@ class cp2k_dft_kg_method_energy_correction:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.xc.status == True:
+        if section_active(self, "xc"):
             self.xc.to_input(fout)
         fout.write("\t\t\t&END ENERGY_CORRECTION\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "XC":
-                self.xc.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_kg_method_lrigpw:
     def __init__(self):
@@ -2201,11 +1816,7 @@ class cp2k_dft_kg_method_lrigpw:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_kg_method_print_neighbor_lists_each:
@@ -2227,22 +1838,18 @@ class cp2k_dft_kg_method_print_neighbor_lists_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_print_neighbor_lists:
+    each = lazy_section("cp2k_dft_kg_method_print_neighbor_lists_each", "EACH")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_print_neighbor_lists_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2253,30 +1860,24 @@ class cp2k_dft_kg_method_print_neighbor_lists:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_kg_method_print:
+    neighbor_lists = lazy_section("cp2k_dft_kg_method_print_neighbor_lists", "NEIGHBOR_LISTS")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.neighbor_lists = cp2k_dft_kg_method_print_neighbor_lists()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2287,19 +1888,13 @@ class cp2k_dft_kg_method_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.neighbor_lists.status == True:
+        if section_active(self, "neighbor_lists"):
             self.neighbor_lists.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "NEIGHBOR_LISTS":
-                self.neighbor_lists.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_kg_method_xc_adiabatic_rescaling:
@@ -2319,9 +1914,7 @@ class cp2k_dft_kg_method_xc_adiabatic_rescaling:
         fout.write("\t\t\t\t&END ADIABATIC_RESCALING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_kg_method_xc_hf_hf_info_each:
@@ -2341,18 +1934,16 @@ class cp2k_dft_kg_method_xc_hf_hf_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_xc_hf_hf_info:
+    each = lazy_section("cp2k_dft_kg_method_xc_hf_hf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_xc_hf_hf_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -2364,16 +1955,12 @@ class cp2k_dft_kg_method_xc_hf_hf_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END HF_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_hf_interaction_potential:
     def __init__(self):
@@ -2392,9 +1979,7 @@ class cp2k_dft_kg_method_xc_hf_interaction_potential:
         fout.write("\t\t\t\t\t&END INTERACTION_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_hf_load_balance_print_each:
     def __init__(self):
@@ -2413,22 +1998,16 @@ class cp2k_dft_kg_method_xc_hf_load_balance_print_each:
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_xc_hf_load_balance_print:
+    each = lazy_section("cp2k_dft_kg_method_xc_hf_load_balance_print_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_xc_hf_load_balance_print_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2439,28 +2018,23 @@ class cp2k_dft_kg_method_xc_hf_load_balance_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_xc_hf_load_balance:
+    printout = lazy_section("cp2k_dft_kg_method_xc_hf_load_balance_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_dft_kg_method_xc_hf_load_balance_print()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -2469,18 +2043,12 @@ class cp2k_dft_kg_method_xc_hf_load_balance:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_hf_memory:
@@ -2500,9 +2068,7 @@ class cp2k_dft_kg_method_xc_hf_memory:
         fout.write("\t\t\t\t\t&END MEMORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_hf_periodic:
     def __init__(self):
@@ -2521,9 +2087,7 @@ class cp2k_dft_kg_method_xc_hf_periodic:
         fout.write("\t\t\t\t\t&END PERIODIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_hf_screening:
     def __init__(self):
@@ -2542,24 +2106,22 @@ class cp2k_dft_kg_method_xc_hf_screening:
         fout.write("\t\t\t\t\t&END SCREENING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_hf:
+    hf_info = lazy_section("cp2k_dft_kg_method_xc_hf_hf_info", "HF_INFO")
+    interaction_potential = lazy_section("cp2k_dft_kg_method_xc_hf_interaction_potential", "INTERACTION_POTENTIAL")
+    load_balance = lazy_section("cp2k_dft_kg_method_xc_hf_load_balance", "LOAD_BALANCE")
+    memory = lazy_section("cp2k_dft_kg_method_xc_hf_memory", "MEMORY")
+    periodic = lazy_section("cp2k_dft_kg_method_xc_hf_periodic", "PERIODIC")
+    screening = lazy_section("cp2k_dft_kg_method_xc_hf_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf_info = cp2k_dft_kg_method_xc_hf_hf_info()
-        self.interaction_potential = cp2k_dft_kg_method_xc_hf_interaction_potential()
-        self.load_balance = cp2k_dft_kg_method_xc_hf_load_balance()
-        self.memory = cp2k_dft_kg_method_xc_hf_memory()
-        self.periodic = cp2k_dft_kg_method_xc_hf_periodic()
-        self.screening = cp2k_dft_kg_method_xc_hf_screening()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2570,38 +2132,22 @@ class cp2k_dft_kg_method_xc_hf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf_info.status == True:
+        if section_active(self, "hf_info"):
             self.hf_info.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.load_balance.status == True:
+        if section_active(self, "load_balance"):
             self.load_balance.to_input(fout)
-        if self.memory.status == True:
+        if section_active(self, "memory"):
             self.memory.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input(fout)
         fout.write("\t\t\t\t&END HF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "HF_INFO":
-                self.hf_info.set_params({item: parmas[item]})
-            elif item.split("-")[4] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[4] == "LOAD_BALANCE":
-                self.load_balance.set_params({item: params[item]})
-            elif item.split("-")[4] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[4] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[4] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_kg_method_xc_vdw_potential_pair_potential_print_dftd_each:
     def __init__(self):
@@ -2616,18 +2162,16 @@ class cp2k_dft_kg_method_xc_vdw_potential_pair_potential_print_dftd_each:
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_xc_vdw_potential_pair_potential_print_dftd:
+    each = lazy_section("cp2k_dft_kg_method_xc_vdw_potential_pair_potential_print_dftd_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_xc_vdw_potential_pair_potential_print_dftd_each()
-
         # basic setting
         self.each.status = True
 
@@ -2635,27 +2179,21 @@ class cp2k_dft_kg_method_xc_vdw_potential_pair_potential_print_dftd:
         fout.write("\t\t\t\t\t\t&PRINT_DFTD\n")
         for item in self.params:
             fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END PRINT_DFTD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_xc_vdw_potential_pair_potential:
+    print_dftd = lazy_section("cp2k_dft_kg_method_xc_vdw_potential_pair_potential_print_dftd", "PRINT_DFTD")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.print_dftd = cp2k_dft_kg_method_xc_vdw_potential_pair_potential_print_dftd()
-
         # basic setting
         self.params["PARAMETER_FILE_NAME"] = "dftd3.dat"
 
@@ -2663,16 +2201,12 @@ class cp2k_dft_kg_method_xc_vdw_potential_pair_potential:
         fout.write("\t\t\t\t&PAIR_POTENTIAL\n")
         for item in self.params:
             fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.print_dftd.status == True:
+        if section_active(self, "print_dftd"):
             self.print_dftd.to_input(fout)
         fout.write("\t\t\t\t&END PAIR_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "PRINT_DFTD":
-                self.print_dftd.set_params({item: params[item]})
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_vdw_potential_non_local:
     def __init__(self):
@@ -2687,12 +2221,13 @@ class cp2k_dft_kg_method_xc_vdw_potential_non_local:
         fout.write("\t\t\t\t\t&END NON_LOCAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_vdw_potential:
+    pair_potential = lazy_section("cp2k_dft_kg_method_xc_vdw_potential_pair_potential", "PAIR_POTENTIAL")
+    non_local = lazy_section("cp2k_dft_kg_method_xc_vdw_potential_non_local", "NON_LOCAL")
+
     def __init__(self):
         self.params = {
                 "POTENTIAL_TYPE": None,
@@ -2700,8 +2235,6 @@ class cp2k_dft_kg_method_xc_vdw_potential:
         self.status = False
 
         self.params["POTENTIAL_TYPE"] = "PAIR_POTENTIAL"
-        self.pair_potential = cp2k_dft_kg_method_xc_vdw_potential_pair_potential()
-        self.non_local = cp2k_dft_kg_method_xc_vdw_potential_non_local()
 
     def to_input(self, fout):
         fout.write("\t\t\t\t&VDW_POTENTIAL\n")
@@ -2714,13 +2247,7 @@ class cp2k_dft_kg_method_xc_vdw_potential:
         fout.write("\t\t\t&END VDW_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "PAIR_POTENTIAL":
-                self.pair_potential.set_params({item: params[item]})
-            elif item.split("-")[4] == "NON_LOCAL":
-                self.non_local.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 
@@ -2740,11 +2267,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_cphf:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_direct_canonical:
@@ -2763,11 +2286,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_direct_canonical:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_eri_mme_cutoff_calib:
@@ -2786,11 +2305,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_eri_mme_cutoff_calib:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_xc_wf_correlation_eri_mme_eri_mme_info_each:
     def __init__(self):
@@ -2808,21 +2323,17 @@ class cp2k_dft_kg_method_xc_wf_correlation_eri_mme_eri_mme_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_eri_mme_eri_mme_info:
+    each = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_eri_mme_eri_mme_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_xc_wf_correlation_eri_mme_eri_mme_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -2834,31 +2345,25 @@ class cp2k_dft_kg_method_xc_wf_correlation_eri_mme_eri_mme_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END ERI_MME_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_eri_mme:
+    cutoff_calib = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_eri_mme_cutoff_calib", "CUTOFF_CALIB")
+    eri_mme_info = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_eri_mme_eri_mme_info", "ERI_MME_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cutoff_calib = cp2k_dft_kg_method_xc_wf_correlation_eri_mme_cutoff_calib()
-        self.eri_mme_info = cp2k_dft_kg_method_xc_wf_correlation_eri_mme_eri_mme_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2869,24 +2374,16 @@ class cp2k_dft_kg_method_xc_wf_correlation_eri_mme:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cutoff_calib.status == True:
+        if section_active(self, "cutoff_calib"):
             self.cutoff_calib.to_input(fout)
-        if self.eri_mme_info.status == True:
+        if section_active(self, "eri_mme_info"):
             self.eri_mme_info.to_input(fout)
         fout.write("\t\t\t\t\t&END ERI_MME\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "CUTOFF_CALIB":
-                self.cutoff_calib.set_params({item: params[item]})
-            elif item.split("-")[5] == "ERI_MME_INFO":
-                self.eri_mme_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_wf_correlation_interaction_potential:
     def __init__(self):
@@ -2904,11 +2401,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_interaction_potential:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_mp2_info_each:
@@ -2930,21 +2423,17 @@ class cp2k_dft_kg_method_xc_wf_correlation_mp2_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_mp2_info:
+    each = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_mp2_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_xc_wf_correlation_mp2_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -2956,20 +2445,14 @@ class cp2k_dft_kg_method_xc_wf_correlation_mp2_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END MP2_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_wf_correlation_opt_ri_basis:
     def __init__(self):
@@ -2987,11 +2470,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_opt_ri_basis:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_laplace:
@@ -3010,11 +2489,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_laplace:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_mp2:
     def __init__(self):
@@ -3032,11 +2507,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_mp2:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_hf_info_each:
     def __init__(self):
@@ -3054,20 +2525,16 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_hf_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_hf_info:
+    each = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_hf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_hf_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -3079,20 +2546,14 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_hf_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END HF_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_interaction_potential:
     def __init__(self):
@@ -3110,11 +2571,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_interaction_potential:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance_print_each:
     def __init__(self):
@@ -3132,20 +2589,16 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance_print_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=9)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance_print:
+    each = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance_print_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance_print_each()
-
         # basic setting 
         self.each.status = True
 
@@ -3157,29 +2610,23 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance:
+    printout = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -3190,20 +2637,14 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_memory:
     def __init__(self):
@@ -3221,11 +2662,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_memory:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_periodic:
     def __init__(self):
@@ -3243,11 +2680,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_periodic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_screening:
     def __init__(self):
@@ -3265,25 +2698,21 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_screening:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf:
+    hf_info = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_hf_info", "HF_INFO")
+    interaction_potential = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_interaction_potential", "INTERACTION_POTENTIAL")
+    load_balance = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance", "LOAD_BALANCE")
+    memory = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_memory", "MEMORY")
+    periodic = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_periodic", "PERIODIC")
+    screening = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf_info = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_hf_info()
-        self.interaction_potential = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_interaction_potential()
-        self.load_balance = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_load_balance()
-        self.memory = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_memory()
-        self.periodic = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_periodic()
-        self.screening = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf_screening()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -3292,40 +2721,24 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf_info.status == True:    
+        if section_active(self, "hf_info"):    
             self.hf_info.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.load_balance.status == True:
+        if section_active(self, "load_balance"):
             self.load_balance.to_input(fout)
         if self.memoery.status == True:
             self.memory.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input()
         fout.write("\t\t\t\t\t\t&end HF\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "HF_INFO":
-                self.hf_info.set_params({item: params[item]})
-            elif item.split("-")[6] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[6] == "LOAD_BALANCE":
-                self.load_balance.set_params({item: params[item]})
-            elif item.split("-")[6] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[6] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[6] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_im_time:
@@ -3344,11 +2757,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_im_time:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_ri_axk:
@@ -3367,11 +2776,7 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_ri_axk:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_ri_g0w0:
     def __init__(self):
@@ -3389,23 +2794,19 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_ri_g0w0:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa:
+    hf = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf", "HF")
+    im_time = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_im_time", "IM_TIME")
+    ri_axk = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_ri_axk", "RI_AXK")
+    ri_g0w0 = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_ri_g0w0", "RI_G0W0")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_hf()
-        self.im_time = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_im_time()
-        self.ri_axk = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_ri_axk()
-        self.ri_g0w0 = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa_ri_g0w0()
-
         # basic setting
 
     def to_input(self, fout):
@@ -3416,32 +2817,20 @@ class cp2k_dft_kg_method_xc_wf_correlation_ri_rpa:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf.status == True:
+        if section_active(self, "hf"):
             self.hf.to_input(fout)
-        if self.im_time.status == True:
+        if section_active(self, "im_time"):
             self.im_time.to_input(fout)
-        if self.ri_axk.status == True:
+        if section_active(self, "ri_axk"):
             self.ri_axk.to_input(fout)
-        if self.ri_g0w0.status == True:
+        if section_active(self, "ri_g0w0"):
             self.ri_g0w0.to_input(fout)
         fout.write("\t\t\t\t\t&end RI_RPA\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "HF":
-                self.hf.set_params({item: params[item]})
-            elif item.split("-")[5] == "IM_TIME":
-                self.im_time.set_params({item: params[item]})
-            elif item.split("-")[5] == "RI_AXK":
-                self.ri_axk.set_params({item: params[item]})
-            elif item.split("-")[5] == "RI_G0W0":
-                self.ri_g0w0.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_wf_correlation_wfc_gpw:
@@ -3460,29 +2849,25 @@ class cp2k_dft_kg_method_xc_wf_correlation_wfc_gpw:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_wf_correlation:
+    cphf = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_cphf", "CPHF")
+    direct_canonical = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_direct_canonical", "DIRECT_CANONICAL")
+    eri_mme = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_eri_mme", "ERI_MME")
+    interaction_potential = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_interaction_potential", "INTERACTION_POTENTIAL")
+    mp2_info = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_mp2_info", "MP2_INFO")
+    opt_ri_basis = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_opt_ri_basis", "OPT_RI_BASIS")
+    ri_laplace = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_laplace", "RI_LAPLACE")
+    ri_mp2 = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_mp2", "RI_MP2")
+    ri_rpa = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_ri_rpa", "RI_RPA")
+    wfc_gpw = lazy_section("cp2k_dft_kg_method_xc_wf_correlation_wfc_gpw", "WFC_GPW")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cphf = cp2k_dft_kg_method_xc_wf_correlation_cphf()
-        self.direct_canonical = cp2k_dft_kg_method_xc_wf_correlation_direct_canonical()
-        self.eri_mme = cp2k_dft_kg_method_xc_wf_correlation_eri_mme()
-        self.interaction_potential = cp2k_dft_kg_method_xc_wf_correlation_interaction_potential()
-        self.mp2_info = cp2k_dft_kg_method_xc_wf_correlation_mp2_info()
-        self.opt_ri_basis = cp2k_dft_kg_method_xc_wf_correlation_opt_ri_basis()
-        self.ri_laplace = cp2k_dft_kg_method_xc_wf_correlation_ri_laplace()
-        self.ri_mp2 = cp2k_dft_kg_method_xc_wf_correlation_ri_mp2()
-        self.ri_rpa = cp2k_dft_kg_method_xc_wf_correlation_ri_rpa()
-        self.wfc_gpw = cp2k_dft_kg_method_xc_wf_correlation_wfc_gpw()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -3491,56 +2876,32 @@ class cp2k_dft_kg_method_xc_wf_correlation:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cphf.status == True:
+        if section_active(self, "cphf"):
             self.cphf.to_input(fout)
-        if self.direct_canonical.status == True:
+        if section_active(self, "direct_canonical"):
             self.direct_canonical.to_input(fout)
-        if self.eri_mme.status == True:
+        if section_active(self, "eri_mme"):
             self.eri_mme.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.mp2_info.status == True:
+        if section_active(self, "mp2_info"):
             self.mp2_info.to_input(fout)
-        if self.opt_ri_basis.status == True:
+        if section_active(self, "opt_ri_basis"):
             self.opt_ri_basis.to_input(fout)
-        if self.ri_laplace.status == True:
+        if section_active(self, "ri_laplace"):
             self.ri_laplace.to_iknput(fout)
-        if self.ri_mp2.status == True:
+        if section_active(self, "ri_mp2"):
             self.ri_mp2.to_input(fout)
-        if self.ri_rpa.status == True:
+        if section_active(self, "ri_rpa"):
             self.ri_rpa.to_input(fout)
-        if self.wfc_gpw.status == True:
+        if section_active(self, "wfc_gpw"):
             self.wfc_gpw.to_input(fout)
         fout.write("\t\t\t\t&END WF_CORRELATION\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CPHF":
-                self.cphf.set_params({item: params[item]})
-            elif item.split("-")[4] == "DIRECT_CANONICAL":
-                self.direct_canonical.set_params({item: params[item]})
-            elif item.split("-")[4] == "ERI_MME":
-                self.eri_mme.set_params({item: params[item]})
-            elif item.split("-")[4] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[4] == "MP2_INFO":
-                self.mp2_info.set_params({item: params[item]})
-            elif item.split("-")[4] == "OPT_RI_BASIS":
-                self.opt_ri_basis.set_params({item: params[item]})
-            elif item.split("-")[4] == "RI_LAPLACE":
-                self.ri_laplace.set_params({item: params[item]})
-            elif item.split("-")[4] == "RI_MP2":
-                self.ri_mp2.set_params({item: params[item]})
-            elif item.split("-")[4] == "RI_RPA":
-                self.ri_rpa.set_params({item: params[item]})
-            elif item.split("-")[4] == "WFC_GPW":
-                self.wfc_gpw.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -3560,9 +2921,7 @@ class cp2k_dft_kg_method_xc_xc_functional_becke88:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_becke88_lr:
     def __init__(self):
@@ -3580,9 +2939,7 @@ class cp2k_dft_kg_method_xc_xc_functional_becke88_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_becke88_lr_adiabatic:
     def __init__(self):
@@ -3600,9 +2957,7 @@ class cp2k_dft_kg_method_xc_xc_functional_becke88_lr_adiabatic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_kg_method_xc_xc_functional_becke97:
@@ -3621,9 +2976,7 @@ class cp2k_dft_kg_method_xc_xc_functional_becke97:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_becke_roussel:
     def __init__(self):
@@ -3641,9 +2994,7 @@ class cp2k_dft_kg_method_xc_xc_functional_becke_roussel:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_beef:
     def __init__(self):
@@ -3661,9 +3012,7 @@ class cp2k_dft_kg_method_xc_xc_functional_beef:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_cs1:
     def __init__(self):
@@ -3681,9 +3030,7 @@ class cp2k_dft_kg_method_xc_xc_functional_cs1:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_gv09:
     def __init__(self):
@@ -3701,9 +3048,7 @@ class cp2k_dft_kg_method_xc_xc_functional_gv09:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_hcth:
     def __init__(self):
@@ -3721,9 +3066,7 @@ class cp2k_dft_kg_method_xc_xc_functional_hcth:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_ke_gga:
     def __init__(self):
@@ -3741,9 +3084,7 @@ class cp2k_dft_kg_method_xc_xc_functional_ke_gga:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_ke_libxc:
     def __init__(self):
@@ -3761,9 +3102,7 @@ class cp2k_dft_kg_method_xc_xc_functional_ke_libxc:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_lda_hole_t_c_lr:
     def __init__(self):
@@ -3781,9 +3120,7 @@ class cp2k_dft_kg_method_xc_xc_functional_lda_hole_t_c_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_libxc:
     def __init__(self):
@@ -3801,9 +3138,7 @@ class cp2k_dft_kg_method_xc_xc_functional_libxc:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_lyp:
     def __init__(self):
@@ -3821,9 +3156,7 @@ class cp2k_dft_kg_method_xc_xc_functional_lyp:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_lyp_adiabatic:
     def __init__(self):
@@ -3841,9 +3174,7 @@ class cp2k_dft_kg_method_xc_xc_functional_lyp_adiabatic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_optx:
     def __init__(self):
@@ -3861,9 +3192,7 @@ class cp2k_dft_kg_method_xc_xc_functional_optx:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_p86c:
     def __init__(self):
@@ -3881,9 +3210,7 @@ class cp2k_dft_kg_method_xc_xc_functional_p86c:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_pade:
     def __init__(self):
@@ -3901,9 +3228,7 @@ class cp2k_dft_kg_method_xc_xc_functional_pade:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_pbe:
     def __init__(self):
@@ -3921,9 +3246,7 @@ class cp2k_dft_kg_method_xc_xc_functional_pbe:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_pbe_hole_t_c_lr:
     def __init__(self):
@@ -3941,9 +3264,7 @@ class cp2k_dft_kg_method_xc_xc_functional_pbe_hole_t_c_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_pw92:
     def __init__(self):
@@ -3961,9 +3282,7 @@ class cp2k_dft_kg_method_xc_xc_functional_pw92:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_pz81:
     def __init__(self):
@@ -3981,9 +3300,7 @@ class cp2k_dft_kg_method_xc_xc_functional_pz81:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_tf:
     def __init__(self):
@@ -4001,9 +3318,7 @@ class cp2k_dft_kg_method_xc_xc_functional_tf:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_tfw:
     def __init__(self):
@@ -4021,9 +3336,7 @@ class cp2k_dft_kg_method_xc_xc_functional_tfw:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_tpss:
     def __init__(self):
@@ -4041,9 +3354,7 @@ class cp2k_dft_kg_method_xc_xc_functional_tpss:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_vwn:
     def __init__(self):
@@ -4061,9 +3372,7 @@ class cp2k_dft_kg_method_xc_xc_functional_vwn:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_xalpha:
     def __init__(self):
@@ -4081,9 +3390,7 @@ class cp2k_dft_kg_method_xc_xc_functional_xalpha:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_xgga:
     def __init__(self):
@@ -4101,9 +3408,7 @@ class cp2k_dft_kg_method_xc_xc_functional_xgga:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional_xwpbe:
     def __init__(self):
@@ -4121,11 +3426,38 @@ class cp2k_dft_kg_method_xc_xc_functional_xwpbe:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_functional:
+    becke88_lr = lazy_section("cp2k_dft_kg_method_xc_xc_functional_becke88_lr", "BECKE88_LR")
+    becke88_lr_adiabatic = lazy_section("cp2k_dft_kg_method_xc_xc_functional_becke88_lr_adiabatic", "BECKE88_LR_ADIABATIC")
+    becke97 = lazy_section("cp2k_dft_kg_method_xc_xc_functional_becke97", "BECKE97")
+    becke_roussel = lazy_section("cp2k_dft_kg_method_xc_xc_functional_becke_roussel", "BECKE_ROUSSEL")
+    beef = lazy_section("cp2k_dft_kg_method_xc_xc_functional_beef", "BEEF")
+    cs1 = lazy_section("cp2k_dft_kg_method_xc_xc_functional_cs1", "CS1")
+    gv09 = lazy_section("cp2k_dft_kg_method_xc_xc_functional_gv09", "GV09")
+    hcth = lazy_section("cp2k_dft_kg_method_xc_xc_functional_hcth", "HCTH")
+    ke_gga = lazy_section("cp2k_dft_kg_method_xc_xc_functional_ke_gga", "KE_GGA")
+    ke_libxc = lazy_section("cp2k_dft_kg_method_xc_xc_functional_ke_libxc", "KE_LIBXC")
+    lda_hole_t_c_lr = lazy_section("cp2k_dft_kg_method_xc_xc_functional_lda_hole_t_c_lr", "LDA_HOLE_T_C_LR")
+    libxc = lazy_section("cp2k_dft_kg_method_xc_xc_functional_libxc", "LIBXC")
+    lyp = lazy_section("cp2k_dft_kg_method_xc_xc_functional_lyp", "LYP")
+    lyp_adiabatic = lazy_section("cp2k_dft_kg_method_xc_xc_functional_lyp_adiabatic", "LYP_ADIABATIC")
+    optx = lazy_section("cp2k_dft_kg_method_xc_xc_functional_optx", "OPTX")
+    p86c = lazy_section("cp2k_dft_kg_method_xc_xc_functional_p86c", "P86C")
+    pade = lazy_section("cp2k_dft_kg_method_xc_xc_functional_pade", "PADE")
+    pbe = lazy_section("cp2k_dft_kg_method_xc_xc_functional_pbe", "PBE")
+    pbe_hole_t_c_lr = lazy_section("cp2k_dft_kg_method_xc_xc_functional_pbe_hole_t_c_lr", "PBE_HOLE_T_C_LR")
+    pw92 = lazy_section("cp2k_dft_kg_method_xc_xc_functional_pw92", "PW92")
+    pz81 = lazy_section("cp2k_dft_kg_method_xc_xc_functional_pz81", "PZ81")
+    tf = lazy_section("cp2k_dft_kg_method_xc_xc_functional_tf", "TF")
+    tfw = lazy_section("cp2k_dft_kg_method_xc_xc_functional_tfw", "TFW")
+    tpss = lazy_section("cp2k_dft_kg_method_xc_xc_functional_tpss", "TPSS")
+    vwn = lazy_section("cp2k_dft_kg_method_xc_xc_functional_vwn", "VWN")
+    xalpha = lazy_section("cp2k_dft_kg_method_xc_xc_functional_xalpha", "XALPHA")
+    xgga = lazy_section("cp2k_dft_kg_method_xc_xc_functional_xgga", "XGGA")
+    xwpbe = lazy_section("cp2k_dft_kg_method_xc_xc_functional_xwpbe", "XWPBE")
+
     def __init__(self):
         self.section = "PBE"
         self.params = {
@@ -4133,38 +3465,9 @@ class cp2k_dft_kg_method_xc_xc_functional:
         self.status = False
 
         self.becke88 =  cp2k_dft_kg_method_xc_xc_functional_becke88()
-        self.becke88_lr = cp2k_dft_kg_method_xc_xc_functional_becke88_lr()
-        self.becke88_lr_adiabatic = cp2k_dft_kg_method_xc_xc_functional_becke88_lr_adiabatic()
-        self.becke97 = cp2k_dft_kg_method_xc_xc_functional_becke97()
-        self.becke_roussel = cp2k_dft_kg_method_xc_xc_functional_becke_roussel()
-        self.beef = cp2k_dft_kg_method_xc_xc_functional_beef()
-        self.cs1 = cp2k_dft_kg_method_xc_xc_functional_cs1()
-        self.gv09 = cp2k_dft_kg_method_xc_xc_functional_gv09()
-        self.hcth = cp2k_dft_kg_method_xc_xc_functional_hcth()
-        self.ke_gga = cp2k_dft_kg_method_xc_xc_functional_ke_gga()
-        self.ke_libxc = cp2k_dft_kg_method_xc_xc_functional_ke_libxc()
-        self.lda_hole_t_c_lr = cp2k_dft_kg_method_xc_xc_functional_lda_hole_t_c_lr()
-        self.libxc = cp2k_dft_kg_method_xc_xc_functional_libxc()
-        self.lyp = cp2k_dft_kg_method_xc_xc_functional_lyp()
-        self.lyp_adiabatic = cp2k_dft_kg_method_xc_xc_functional_lyp_adiabatic()
-        self.optx = cp2k_dft_kg_method_xc_xc_functional_optx()
-        self.p86c = cp2k_dft_kg_method_xc_xc_functional_p86c()
-        self.pade = cp2k_dft_kg_method_xc_xc_functional_pade()
-        self.pbe = cp2k_dft_kg_method_xc_xc_functional_pbe()
-        self.pbe_hole_t_c_lr = cp2k_dft_kg_method_xc_xc_functional_pbe_hole_t_c_lr()
-        self.pw92 = cp2k_dft_kg_method_xc_xc_functional_pw92()
-        self.pz81 = cp2k_dft_kg_method_xc_xc_functional_pz81()
-        self.tf = cp2k_dft_kg_method_xc_xc_functional_tf()
-        self.tfw = cp2k_dft_kg_method_xc_xc_functional_tfw()
-        self.tpss = cp2k_dft_kg_method_xc_xc_functional_tpss()
-        self.vwn = cp2k_dft_kg_method_xc_xc_functional_vwn()
-        self.xalpha = cp2k_dft_kg_method_xc_xc_functional_xalpha()
-        self.xgga = cp2k_dft_kg_method_xc_xc_functional_xgga()
-        self.xwpbe = cp2k_dft_kg_method_xc_xc_functional_xwpbe()
 
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -4237,69 +3540,7 @@ class cp2k_dft_kg_method_xc_xc_functional:
         set_params for xc_functional is different from many other
         set_params, as it deal with the key 'XC_FUNCTIONAL' only
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "BECKE88":
-                self.becke88.set_params({item: params[item]})
-            elif item.split("-")[4] == "BECKE88_LR":
-                self.becke88_lr.set_params({item: params[item]})
-            elif item.split("-")[4] == "BECKE88_LR_ADIABATIC":
-                self.becke88_lr_adiabatic.set_params({item: params[item]})
-            elif item.split("-")[4] == "BECKE97":
-                self.becke97.set_params({item: params[item]})
-            elif item.split("-")[4] == "BECKE_ROUSSEL":
-                self.becke_roussel.set_params({item: params[item]})
-            elif item.split("-")[4] == "BEEF":
-                self.beef.set_params({item: params[item]})
-            elif item.split("-")[4] == "CS1":
-                self.cs1.set_params({item: params[item]})
-            elif item.split("-")[4] == "GV09":
-                self.gv09.set_params({item: params[item]})
-            elif item.split("-")[4] == "HCTH":
-                self.hcth.set_params({item: params[item]})
-            elif item.split("-")[4] == "KE_GGA":
-                self.ke_gga.set_params({item: params[item]})
-            elif item.split("-")[4] == "KE_LIBXC":
-                self.ke_libxc.set_params({item: params[item]})
-            elif item.split("-")[4] == "LDA_HOLE_T_C_LR":
-                self.lda_hole_t_c_lr.set_params({item: params[item]})
-            elif item.split("-")[4] == "LIBXC":
-                self.libxc.set_params({item: params[item]})
-            elif item.split("-")[4] == "LYP":
-                self.lyp.set_params({item: params[item]})
-            elif item.split("-")[4] == "LYP_ADIABATIC":
-                self.lyp_adiabatic.set_params({item: params[item]})
-            elif item.split("-")[4] == "OPTX":
-                self.optx.set_params({item: params[item]})
-            elif item.split("-")[4] == "P86C":
-                self.p86c.set_params({item: params[item]})
-            elif item.split("-")[4] == "PADE":
-                self.pade.set_params({item: params[item]})
-            elif item.split("-")[4] == "PBE":
-                self.pbe.set_params({item: params[item]})
-            elif item.split("-")[4] == "PBE_HOLE_T_C_LR":
-                self.pbe_hole_t_c_lr.set_params({item: params[item]})
-            elif item.split("-")[4] == "PW92":
-                self.pw92.set_params({item: params[item]})
-            elif item.split("-")[4] == "PZ81":
-                self.pz81.set_params({item: params[item]})
-            elif item.split("-")[4] == "TF":
-                self.tf.set_params({item: params[item]})
-            elif item.split("-")[4] == "TFW":
-                self.tfw.set_params({item: params[item]})
-            elif item.split("-")[4] == "TPSS":
-                self.tpss.set_params({item: params[item]})
-            elif item.split("-")[4] == "VWN":
-                self.vwn.set_params({item: params[item]})
-            elif item.split("-")[4] == "XALPHA":
-                self.xalpha.set_params({item: params[item]})
-            elif item.split("-")[4] == "XGGA":
-                self.xgga.set_params({item: params[item]})
-            elif item.split("-")[4] == "XWPBE":
-                self.xwpbe.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_kg_method_xc_xc_grid:
     def __init__(self):
@@ -4320,9 +3561,7 @@ class cp2k_dft_kg_method_xc_xc_grid:
         fout.write("\t\t\t\t&END XC_GRID\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_kg_method_xc_xc_potential_saop:
@@ -4342,18 +3581,16 @@ class cp2k_dft_kg_method_xc_xc_potential_saop:
         fout.write("\t\t\t\t\t&END SAOP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_kg_method_xc_xc_potential:
+    saop = lazy_section("cp2k_dft_kg_method_xc_xc_potential_saop", "SAOP")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.saop = cp2k_dft_kg_method_xc_xc_potential_saop()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4364,33 +3601,29 @@ class cp2k_dft_kg_method_xc_xc_potential:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.saop.status == True:
+        if section_active(self, "saop"):
             self.saop.to_input(fout)
         fout.write("\t\t\t\t&END XC_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "SAOP":
-                self.saop.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_kg_method_xc:
+    adiabatic_rescaling = lazy_section("cp2k_dft_kg_method_xc_adiabatic_rescaling", "ADIABATIC_RESCALING")
+    hf = lazy_section("cp2k_dft_kg_method_xc_hf", "HF")
+    vdw_potential = lazy_section("cp2k_dft_kg_method_xc_vdw_potential", "VDW_POTENTIAL")
+    wf_correlation = lazy_section("cp2k_dft_kg_method_xc_wf_correlation", "WF_CORRELATION")
+    xc_functional = lazy_section("cp2k_dft_kg_method_xc_xc_functional", "XC_FUNCTIONAL")
+    xc_grid = lazy_section("cp2k_dft_kg_method_xc_xc_grid", "XC_GRID")
+    xc_potential = lazy_section("cp2k_dft_kg_method_xc_xc_potential", "XC_POTENTIAL")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.adiabatic_rescaling = cp2k_dft_kg_method_xc_adiabatic_rescaling()
-        self.hf = cp2k_dft_kg_method_xc_hf()
-        self.vdw_potential = cp2k_dft_kg_method_xc_vdw_potential()
-        self.wf_correlation = cp2k_dft_kg_method_xc_wf_correlation()
-        self.xc_functional = cp2k_dft_kg_method_xc_xc_functional()
-        self.xc_grid = cp2k_dft_kg_method_xc_xc_grid()
-        self.xc_potential = cp2k_dft_kg_method_xc_xc_potential()
-
         # basic setting
         self.xc_functional.status = True
         self.vdw_potential.status = False
@@ -4408,56 +3641,38 @@ class cp2k_dft_kg_method_xc:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.adiabatic_rescaling.status == True:
+        if section_active(self, "adiabatic_rescaling"):
             self.adiabatic_rescaling.to_input(fout)
-        if self.hf.status == True:
+        if section_active(self, "hf"):
             self.hf.to_input(fout)
-        if self.xc_functional.status == True:
+        if section_active(self, "xc_functional"):
             self.xc_functional.to_input(fout)
-        if self.vdw_potential.status == True:
+        if section_active(self, "vdw_potential"):
             self.vdw_potential.to_input(fout)
-        if self.wf_correlation.status == True:
+        if section_active(self, "wf_correlation"):
             self.wf_correlation.to_input(fout)
-        if self.xc_grid.status == True:
+        if section_active(self, "xc_grid"):
             self.xc_grid.to_input(fout)
-        if self.xc_potential.status == True:
+        if section_active(self, "xc_potential"):
             self.xc_potential.to_input(fout)
         fout.write("\t\t\t&XC\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "XC_FUNCTIONAL":
-                self.xc_functional.set_params({item: params[item]})
-            elif item.split("-")[3] == "VDW_POTENTIAL":
-                self.vdw_potential.set_params({item: params[item]})
-            elif item.split("-")[3] == "ADIABATIC_RESCALING":
-                self.adiabatic_rescaling.set_params({item: params[item]})
-            elif item.split("-")[3] == "HF":
-                self.hf.set_params({item: params[item]})
-            elif item.split("-")[3] == "WF_CORRELATION":
-                self.wf_correlation.set_params({item: params[item]})
-            elif item.split("-")[3] == "XC_GRID":
-                self.xc_grid.set_params({item: params[item]})
-            elif item.split("-")[3] == "XC_POTENTIAL":
-                self.xc_potential.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_kg_method:
+    energy_correction = lazy_section("cp2k_dft_kg_method_energy_correction", "ENERGY_CORRECTION")
+    lrigpw = lazy_section("cp2k_dft_kg_method_lrigpw", "LRIGPW")
+    printout = lazy_section("cp2k_dft_kg_method_print", "PRINT")
+    xc = lazy_section("cp2k_dft_kg_method_xc", "XC")
+
     def __init__(self):
         self.params = {
 
                 }
         self.status = False
 
-        self.energy_correction = cp2k_dft_kg_method_energy_correction()
-        self.lrigpw = cp2k_dft_kg_method_lrigpw()
-        self.printout = cp2k_dft_kg_method_print()
-        self.xc = cp2k_dft_kg_method_xc()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4468,28 +3683,16 @@ class cp2k_dft_kg_method:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.energy_correction.status == True:
+        if section_active(self, "energy_correction"):
             self.energy_correction.to_input(fout)
-        if self.lrigpw.status == True:
+        if section_active(self, "lrigpw"):
             self.lrigpw.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.xc.status == True:
+        if section_active(self, "xc"):
             self.xc.to_input(fout)
         fout.write("\t\t&END KG_METHOD\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "ENERGY_CORRECTION":
-                self.energy_correction.set_params({item: params[item]})
-            elif item.split("-")[2] == "LRIGPW":
-                self.lrigpw.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[2] == "XC":
-                self.xc.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -2,6 +2,7 @@
 # _*_ coding: utf-8 _*_
 
 import sys
+from pymatflow.cp2k.base.section import route_params
 
 
 # =================================
@@ -65,8 +66,4 @@ class cp2k_dft_kpoints:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
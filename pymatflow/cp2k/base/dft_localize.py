@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 # =================================
 # CP2K / FORCE_EVAL /DFT / LOCALIZE
@@ -24,22 +26,18 @@ class cp2k_dft_localize_print_loc_restart_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_loc_restart:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_loc_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_loc_restart_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -48,19 +46,13 @@ class cp2k_dft_localize_print_loc_restart:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END LOC_RESTART\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_localize_print_molecular_dipoles_each:
@@ -81,22 +73,18 @@ class cp2k_dft_localize_print_molecular_dipoles_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_molecular_dipoles:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_molecular_dipoles_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_molecular_dipoles_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -105,19 +93,13 @@ class cp2k_dft_localize_print_molecular_dipoles:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MOLECULAR_DIPOLES\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_localize_print_molecular_states_cubes_each:
@@ -138,22 +120,18 @@ class cp2k_dft_localize_print_molecular_states_cubes_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_localize_print_molecular_states_cubes:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_molecular_states_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_molecular_states_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -162,19 +140,13 @@ class cp2k_dft_localize_print_molecular_states_cubes:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CUBES\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_molecular_states_each:
     """
@@ -194,23 +166,19 @@ class cp2k_dft_localize_print_molecular_states_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_molecular_states:
     """
     """
+    cubes = lazy_section("cp2k_dft_localize_print_molecular_states_cubes", "CUBES")
+    each = lazy_section("cp2k_dft_localize_print_molecular_states_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cubes = cp2k_dft_localize_print_molecular_states_cubes()
-        self.each = cp2k_dft_localize_print_molecular_states_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -219,23 +187,15 @@ class cp2k_dft_localize_print_molecular_states:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cubes.status == True:
+        if section_active(self, "cubes"):
             self.cubes.to_input(fout)
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MOLECULAR_STATES\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CUBES":
-                self.cubes.set_params({item: params[item]})
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_localize_print_program_run_info_each:
     """
@@ -255,22 +215,18 @@ class cp2k_dft_localize_print_program_run_info_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_program_run_info:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -279,19 +235,13 @@ class cp2k_dft_localize_print_program_run_info:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_localize_print_total_dipole_each:
     """
@@ -311,22 +261,18 @@ class cp2k_dft_localize_print_total_dipole_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_total_dipole:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_total_dipole_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_total_dipole_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -335,19 +281,13 @@ class cp2k_dft_localize_print_total_dipole:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END TOTAL_DIPOLE\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_localize_print_wannier_centers_each:
@@ -368,22 +308,18 @@ class cp2k_dft_localize_print_wannier_centers_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_wannier_centers:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_wannier_centers_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_wannier_centers_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -392,19 +328,13 @@ class cp2k_dft_localize_print_wannier_centers:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WANNIER_CENTERS\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_localize_print_wannier_cubes_each:
@@ -425,22 +355,18 @@ class cp2k_dft_localize_print_wannier_cubes_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_wannier_cubes:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_wannier_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_wannier_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -449,19 +375,13 @@ class cp2k_dft_localize_print_wannier_cubes:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WANNIER_CUBES\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_localize_print_wannier_spreads_each:
@@ -482,22 +402,18 @@ class cp2k_dft_localize_print_wannier_spreads_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_wannier_spreads:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_wannier_spreads_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_wannier_spreads_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -506,19 +422,13 @@ class cp2k_dft_localize_print_wannier_spreads:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WANNIER_SPREADS\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_localize_print_wannier_states_cubes_each:
     """
@@ -538,22 +448,18 @@ class cp2k_dft_localize_print_wannier_states_cubes_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_localize_print_wannier_states_cubes:
     """
     """
+    each = lazy_section("cp2k_dft_localize_print_wannier_states_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_localize_print_wannier_states_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -562,19 +468,13 @@ class cp2k_dft_localize_print_wannier_states_cubes:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CUBES\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_wannier_states_each:
     """
@@ -594,23 +494,19 @@ class cp2k_dft_localize_print_wannier_states_each:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_localize_print_wannier_states:
     """
     """
+    cubes = lazy_section("cp2k_dft_localize_print_wannier_states_cubes", "CUBES")
+    each = lazy_section("cp2k_dft_localize_print_wannier_states_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cubes = cp2k_dft_localize_print_wannier_states_cubes()
-        self.each = cp2k_dft_localize_print_wannier_states_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -619,23 +515,15 @@ class cp2k_dft_localize_print_wannier_states:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cubes.status == True:
+        if section_active(self, "cubes"):
             self.cubes.to_input(fout)
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WANNIERS_STATES\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CUBES":
-                self.cubes.set_params({item: params[item]})
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -657,11 +545,7 @@ class cp2k_dft_localize_print:
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_localize:
     """
@@ -671,6 +555,8 @@ class cp2k_dft_localize:
         for the molecules available in the simulated
         trajectory.
     """
+    printout = lazy_section("cp2k_dft_localize_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 "method": None,
@@ -678,8 +564,6 @@ class cp2k_dft_localize:
                 }
         self.status = False
 
-        self.printout = cp2k_dft_localize_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -688,16 +572,10 @@ class cp2k_dft_localize:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t%s %s\n" % (item, str(self.params[item])))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t&END LOCALIZE\n")
     
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # =======================================
 # CP2K / FORCE_EVAL / DFT /  LS_SCF
 # =======================================
@@ -17,26 +19,22 @@ class cp2k_dft_ls_scf_chebyshev_dos_each:
         """
         fout.write("\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t&end EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_chebyshev_dos:
+    each = lazy_section("cp2k_dft_ls_scf_chebyshev_dos_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_chebyshev_dos_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -45,21 +43,15 @@ class cp2k_dft_ls_scf_chebyshev_dos:
         """
         fout.write("\t\t\t\t&DOS\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&end DOS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_ls_scf_chebyshev_print_specific_e_density_cube_each:
     def __init__(self):
@@ -73,26 +65,22 @@ class cp2k_dft_ls_scf_chebyshev_print_specific_e_density_cube_each:
         """
         fout.write("\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t&end EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_chebyshev_print_specific_e_density_cube:
+    each = lazy_section("cp2k_dft_ls_scf_chebyshev_print_specific_e_density_cube_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_chebyshev_print_specific_e_density_cube_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -101,33 +89,26 @@ class cp2k_dft_ls_scf_chebyshev_print_specific_e_density_cube:
         """
         fout.write("\t\t\t\t&PRINT_SPECIFIC_E_DENSITY_CUBE\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&end PRINT_SPECIFIC_E_DENSITY_CUBE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_ls_scf_chebyshev:
+    dos = lazy_section("cp2k_dft_ls_scf_chebyshev_dos", "DOS")
+    print_specific_e_density_cube = lazy_section("cp2k_dft_ls_scf_chebyshev_print_specific_e_density_cube", "PRINT_SPECIFIC_E_DENSITY_CUBE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.dos = cp2k_dft_ls_scf_chebyshev_dos()
-
-        self.print_specific_e_density_cube = cp2k_dft_ls_scf_chebyshev_print_specific_e_density_cube()
-
         # basic setting
 
     def to_input(self, fout):
@@ -136,25 +117,17 @@ class cp2k_dft_ls_scf_chebyshev:
         """
         fout.write("\t\t\t&CHEBYSHEV\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.dos.status == True:
+        if section_active(self, "dos"):
             self.dos.to_input(fout)
-        if self.print_specific_e_density_cube.status == True:
+        if section_active(self, "print_specific_e_density_cube"):
             self.print_specific_e_density_cube.to_input(fout)
         fout.write("\t\t\t&end CHEBYSHEV\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DOS":
-                self.dos.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT_SPECIFIC_E_DENSITY_CUBE":
-                self.print_specific_e_density_cube.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_ls_scf_curvy_steps:
@@ -169,17 +142,13 @@ class cp2k_dft_ls_scf_curvy_steps:
         """
         fout.write("\t\t\t&CURVY_STEPS\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t&end CURVY_STEPS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_ls_scf_pao_line_search_print_run_info_each:
     def __init__(self):
@@ -193,27 +162,23 @@ class cp2k_dft_ls_scf_pao_line_search_print_run_info_each:
         """
         fout.write("\t\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_dft_ls_scf_pao_line_search_print_run_info:
+    each = lazy_section("cp2k_dft_ls_scf_pao_line_search_print_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_line_search_print_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -222,29 +187,24 @@ class cp2k_dft_ls_scf_pao_line_search_print_run_info:
         """
         fout.write("\t\t\t\t\t\t&RUN_INFO\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_line_search_print:
+    run_info = lazy_section("cp2k_dft_ls_scf_pao_line_search_print_run_info", "RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.run_info = cp2k_dft_ls_scf_pao_line_search_print_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -253,30 +213,24 @@ class cp2k_dft_ls_scf_pao_line_search_print:
         """
         fout.write("\t\t\t\t\t&PRINT\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.run_info.status == True:
+        if section_active(self, "run_info"):
             self.run_info.to_input(fout)
         fout.write("\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "RUN_INFO":
-                self.run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_pao_line_search:
+    printout = lazy_section("cp2k_dft_ls_scf_pao_line_search_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_dft_ls_scf_pao_line_search_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -285,21 +239,15 @@ class cp2k_dft_ls_scf_pao_line_search:
         """
         fout.write("\t\t\t\t&LINE_SEARCH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t&END LINE_SEARCH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_ls_scf_pao_machine_learning_training_set:
     def __init__(self):
@@ -313,26 +261,22 @@ class cp2k_dft_ls_scf_pao_machine_learning_training_set:
         """
         fout.write("\t\t\t\t\t&training_set\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t&end training_set\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_pao_machine_learning:
+    training_set = lazy_section("cp2k_dft_ls_scf_pao_machine_learning_training_set", "TRAINING_SET")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.training_set = cp2k_dft_ls_scf_pao_machine_learning_training_set()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -341,21 +285,15 @@ class cp2k_dft_ls_scf_pao_machine_learning:
         """
         fout.write("\t\t\t\t&machine_learning\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.training_set.status == True:
+        if section_active(self, "training_set"):
             self.training_set.to_input(fout)
         fout.write("\t\t\t\t&end machine_learning\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "TRAINING_SET":
-                self.training_set.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_ls_scf_pao_print_atom_info_each:
     def __init__(self):
@@ -369,26 +307,22 @@ class cp2k_dft_ls_scf_pao_print_atom_info_each:
         """
         fout.write("\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_print_atom_info:
+    each = lazy_section("cp2k_dft_ls_scf_pao_print_atom_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_print_atom_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -397,21 +331,15 @@ class cp2k_dft_ls_scf_pao_print_atom_info:
         """
         fout.write("\t\t\t\t\t&ATOM_INFO\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ATOM_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 
@@ -427,26 +355,22 @@ class cp2k_dft_ls_scf_pao_print_fock_eigenvalues_each:
         """
         fout.write("\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_print_fock_eigenvalues:
+    each = lazy_section("cp2k_dft_ls_scf_pao_print_fock_eigenvalues_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_print_fock_eigenvalues_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -455,21 +379,15 @@ class cp2k_dft_ls_scf_pao_print_fock_eigenvalues:
         """
         fout.write("\t\t\t\t\t&FOCK_EIGENVALUES\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END FOCK_EIGENVALUES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_ls_scf_pao_print_fock_gap_each:
@@ -484,26 +402,22 @@ class cp2k_dft_ls_scf_pao_print_fock_gap_each:
         """
         fout.write("\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_print_fock_gap:
+    each = lazy_section("cp2k_dft_ls_scf_pao_print_fock_gap_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_print_fock_gap_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -512,21 +426,15 @@ class cp2k_dft_ls_scf_pao_print_fock_gap:
         """
         fout.write("\t\t\t\t\t&FOCK_GAP\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END FOCK_GAP\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_pao_print_ml_training_data_each:
     def __init__(self):
@@ -540,26 +448,22 @@ class cp2k_dft_ls_scf_pao_print_ml_training_data_each:
         """
         fout.write("\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_print_ml_training_data:
+    each = lazy_section("cp2k_dft_ls_scf_pao_print_ml_training_data_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_print_ml_training_data_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -568,21 +472,15 @@ class cp2k_dft_ls_scf_pao_print_ml_training_data:
         """
         fout.write("\t\t\t\t\t&ML_TRAINING_DATA\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ML_TRAINING_DATA\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_pao_print_ml_variance_each:
     def __init__(self):
@@ -596,26 +494,22 @@ class cp2k_dft_ls_scf_pao_print_ml_variance_each:
         """
         fout.write("\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_print_ml_variance:
+    each = lazy_section("cp2k_dft_ls_scf_pao_print_ml_variance_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_print_ml_variance_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -624,21 +518,15 @@ class cp2k_dft_ls_scf_pao_print_ml_variance:
         """
         fout.write("\t\t\t\t\t&ML_VARIANCE\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ML_VARIANCE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_pao_print_opt_info_each:
     def __init__(self):
@@ -652,26 +540,22 @@ class cp2k_dft_ls_scf_pao_print_opt_info_each:
         """
         fout.write("\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_print_opt_info:
+    each = lazy_section("cp2k_dft_ls_scf_pao_print_opt_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_print_opt_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -680,21 +564,15 @@ class cp2k_dft_ls_scf_pao_print_opt_info:
         """
         fout.write("\t\t\t\t\t&OPT_INFO\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END OPT_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_pao_print_restart_each:
     def __init__(self):
@@ -708,26 +586,22 @@ class cp2k_dft_ls_scf_pao_print_restart_each:
         """
         fout.write("\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_print_restart:
+    each = lazy_section("cp2k_dft_ls_scf_pao_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_print_restart_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -736,21 +610,15 @@ class cp2k_dft_ls_scf_pao_print_restart:
         """
         fout.write("\t\t\t\t\t&RESTART\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END RESTART\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_ls_scf_pao_print_run_info_each:
     def __init__(self):
@@ -764,26 +632,22 @@ class cp2k_dft_ls_scf_pao_print_run_info_each:
         """
         fout.write("\t\t\t\t\t\t&EACH\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_ls_scf_pao_print_run_info:
+    each = lazy_section("cp2k_dft_ls_scf_pao_print_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_ls_scf_pao_print_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -792,37 +656,32 @@ class cp2k_dft_ls_scf_pao_print_run_info:
         """
         fout.write("\t\t\t\t\t&RUN_INFO\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_ls_scf_pao_print:
+    atom_info = lazy_section("cp2k_dft_ls_scf_pao_print_atom_info", "ATOM_INFO")
+    fock_eigenvalues = lazy_section("cp2k_dft_ls_scf_pao_print_fock_eigenvalues", "FOCK_EIGENVALUES")
+    fock_gap = lazy_section("cp2k_dft_ls_scf_pao_print_fock_gap", "FOCK_GAP")
+    ml_training_data = lazy_section("cp2k_dft_ls_scf_pao_print_ml_training_data", "ML_TRAINING_DATA")
+    ml_variance = lazy_section("cp2k_dft_ls_scf_pao_print_ml_variance", "ML_VARIANCE")
+    opt_info = lazy_section("cp2k_dft_ls_scf_pao_print_opt_info", "OPT_INFO")
+    restart = lazy_section("cp2k_dft_ls_scf_pao_print_restart", "RESTART")
+    run_info = lazy_section("cp2k_dft_ls_scf_pao_print_run_info", "RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.atom_info = cp2k_dft_ls_scf_pao_print_atom_info()
-        self.fock_eigenvalues = cp2k_dft_ls_scf_pao_print_fock_eigenvalues()
-        self.fock_gap = cp2k_dft_ls_scf_pao_print_fock_gap()
-        self.ml_training_data = cp2k_dft_ls_scf_pao_print_ml_training_data()
-        self.ml_variance = cp2k_dft_ls_scf_pao_print_ml_variance()
-        self.opt_info = cp2k_dft_ls_scf_pao_print_opt_info()
-        self.restart = cp2k_dft_ls_scf_pao_print_restart()
-        self.run_info = cp2k_dft_ls_scf_pao_print_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -831,61 +690,41 @@ class cp2k_dft_ls_scf_pao_print:
         """
         fout.write("\t\t\t\t&PRINT\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.atom_info.status == True:
+        if section_active(self, "atom_info"):
             self.atom_info.to_input(fout)
-        if self.fock_eigenvalues.status == True:
+        if section_active(self, "fock_eigenvalues"):
             self.fock_eigenvalues.to_input(fout)
-        if self.fock_gap.status == True:
+        if section_active(self, "fock_gap"):
             self.fock_gap.to_input(fout)
-        if self.ml_training_data.status == True:
+        if section_active(self, "ml_training_data"):
             self.ml_training_data.to_input(fout)
-        if self.ml_variance.status == True:
+        if section_active(self, "ml_variance"):
             self.ml_variance.to_input(fout)
-        if self.opt_info.status == True:
+        if section_active(self, "opt_info"):
             self.opt_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
-        if self.run_info.status == True:
+        if section_active(self, "run_info"):
             self.run_info.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "ATOM_INFO":
-                self.atom_info.set_params({item: params[item]})
-            elif item.split("-")[5] == "FOCK_EIGENVALUES":
-                self.fock_eigenvalues.set_params({item: params[item]})
-            elif item.split("-")[5] == "FOCK_GAP":
-                self.fock_gap.set_params({item: params[item]})
-            elif item.split("-")[5] == "ML_TRAINING_DATA":
-                self.ml_training_data.set_params({item: params[item]})
-            elif item.split("-")[5] == "ML_VARIANCE":
-                self.ml_variance.set_params({item: params[item]})
-            elif item.split("-")[5] == "OPT_INFO":
-                self.opt_info.set_params({item: params[item]})
-            elif item.split("-")[5] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            elif item.split("-")[5] == "RUN_INFO":
-                self.run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_ls_scf_pao:
+    line_search = lazy_section("cp2k_dft_ls_scf_pao_line_search", "LINE_SEARCH")
+    machine_learning = lazy_section("cp2k_dft_ls_scf_pao_machine_learning", "MACHINE_LEARNING")
+    printout = lazy_section("cp2k_dft_ls_scf_pao_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.line_search = cp2k_dft_ls_scf_pao_line_search()
-        self.machine_learning = cp2k_dft_ls_scf_pao_machine_learning()
-        self.printout = cp2k_dft_ls_scf_pao_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -894,29 +733,19 @@ class cp2k_dft_ls_scf_pao:
         """
         fout.write("\t\t\t&PAO\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.line_search.status == True:
+        if section_active(self, "line_search"):
             self.line_search.to_input(fout)
-        if self.machine_learning.status == True:
+        if section_active(self, "machine_learning"):
             self.machine_learning.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t&end PAO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "LINE_SEARCH":
-                self.line_search.set_params({item: params[item]})
-            elif item.split("-")[3] == "MACHINE_LEARNING":
-                self.machine_learning.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_ls_scf_pexsi:
     def __init__(self):
@@ -930,17 +759,13 @@ class cp2k_dft_ls_scf_pexsi:
         """
         fout.write("\t\t\t&PEXSI\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t&END PEXSI\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_ls_scf_rho_mixing:
     def __init__(self):
@@ -954,21 +779,23 @@ class cp2k_dft_ls_scf_rho_mixing:
         """
         fout.write("\t\t\t&RHO_MIXING\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         fout.write("\t\t\t&end RHO_MIXING\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
 class cp2k_dft_ls_scf:
+    chebyshev = lazy_section("cp2k_dft_ls_scf_chebyshev", "CHEBYSHEV")
+    curvy_steps = lazy_section("cp2k_dft_ls_scf_curvy_steps", "CURVY_STEPS")
+    pao = lazy_section("cp2k_dft_ls_scf_pao", "PAO")
+    pexsi = lazy_section("cp2k_dft_ls_scf_pexsi", "PEXSI")
+    rho_mixing = lazy_section("cp2k_dft_ls_scf_rho_mixing", "RHO_MIXING")
+
     def __init__(self):
         self.params = {
                 "check_s_inv": None,
@@ -1001,12 +828,6 @@ class cp2k_dft_ls_scf:
                 }
         self.status = False
 
-        self.chebyshev = cp2k_dft_ls_scf_chebyshev()
-        self.curvy_steps = cp2k_dft_ls_scf_curvy_steps()
-        self.pao = cp2k_dft_ls_scf_pao()
-        self.pexsi = cp2k_dft_ls_scf_pexsi()
-        self.rho_mixing = cp2k_dft_ls_scf_rho_mixing()
-
         # basic setting
 
         self.params["eps_filter"] = 1.0e-7
@@ -1019,34 +840,20 @@ class cp2k_dft_ls_scf:
         """
         fout.write("\t\t&ls_scf\n")
         for item in self.params:
-            if self.params[item] is not none:
+            if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.chebyshev.status == True:
+        if section_active(self, "chebyshev"):
             self.chebyshev.to_input(fout)
-        if self.curvy_steps.status == True:
+        if section_active(self, "curvy_steps"):
             self.curvy_steps.to_input(fout)
-        if self.pao.status == True:
+        if section_active(self, "pao"):
             self.pao.to_input(fout)
-        if self.pexsi.status == True:
+        if section_active(self, "pexsi"):
             self.pexsi.to_input(fout)
-        if self.rho_mixing.status == True:
+        if section_active(self, "rho_mixing"):
             self.rho_mixing.to_input(fout)
         fout.write("\t\t&end ls_scf\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CHEBYSHEV":
-                self.chebyshev.set_params({item: params[item]})
-            elif item.split("-")[2] == "CURVY_STEPS":
-                self.curvy_steps.set_params({item: params[item]})
-            elif item.split("-")[2] == "PAO":
-                self.pao.set_params({item: params[item]})
-            elif item.split("-")[2] == "PEXSI":
-                self.pexsi.set_params({item: params[item]})
-            elif item.split("-")[2] == "RHO_MIXING":
-                self.rho_mixing.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
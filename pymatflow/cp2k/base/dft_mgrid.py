@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ===============================
 # CP2K / FORCE_EVAL / DFT / MGRID
 # ===============================
@@ -21,20 +23,16 @@ class cp2k_dft_mgrid_interpolator_conv_info_each:
         fout.write("\t\t\t\t\t&end EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_mgrid_interpolator_conv_info:
+    each = lazy_section("cp2k_dft_mgrid_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_mgrid_interpolator_conv_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -45,27 +43,21 @@ class cp2k_dft_mgrid_interpolator_conv_info:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&end CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_mgrid_interpolator:
+    conv_info = lazy_section("cp2k_dft_mgrid_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.conv_info = cp2k_dft_mgrid_interpolator_conv_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -76,18 +68,12 @@ class cp2k_dft_mgrid_interpolator:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t&end interpolator\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_mgrid_rs_grid:
     def __init__(self):
@@ -106,13 +92,12 @@ class cp2k_dft_mgrid_rs_grid:
         fout.write("\t\t\t&END RS_GRID\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_mgrid:
+    interpolator = lazy_section("cp2k_dft_mgrid_interpolator", "INTERPOLATOR")
+    rs_grid = lazy_section("cp2k_dft_mgrid_rs_grid", "RS_GRID")
+
     def __init__(self):
         self.params = {
                 "CUTOFF": None,
@@ -126,9 +111,6 @@ class cp2k_dft_mgrid:
                 }
         self.status = False
 
-        self.interpolator = cp2k_dft_mgrid_interpolator()
-        self.rs_grid = cp2k_dft_mgrid_rs_grid()
-
         # basic setting
 
     def to_input(self, fout):
@@ -139,20 +121,12 @@ class cp2k_dft_mgrid:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             self.interpolator.to_input(fout)
-        if self.rs_grid.status == True:
+        if section_active(self, "rs_grid"):
             self.rs_grid.to_input(fout)
         fout.write("\t\t&END MGRID\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[2] == "RS_GRID":
-                self.rs_grid.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
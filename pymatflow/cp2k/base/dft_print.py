@@ -2,6 +2,7 @@
 # _*_ coding: utf-8 _*_
 
 import numpy as np
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 # ===============================
 # CP2K / FORCE_EVAL / DFT / PRINT
@@ -22,11 +23,7 @@ class cp2k_dft_print_active_space:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_band_structure:
@@ -73,11 +70,7 @@ class cp2k_dft_print_band_structure:
         self.kpath = kpath
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_efield_cube:
@@ -95,11 +88,7 @@ class cp2k_dft_print_efield_cube:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_elf_cube:
@@ -122,11 +111,7 @@ class cp2k_dft_print_elf_cube:
         fout.write("\t\t\t&END ELF_CUBE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_e_density_cube:
@@ -150,11 +135,7 @@ class cp2k_dft_print_e_density_cube:
         fout.write("\t\t\t&END E_DENSITY_CUBE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_pdos:
@@ -174,11 +155,7 @@ class cp2k_dft_print_pdos:
         fout.write("\t\t\t&END PDOS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_moments:
@@ -197,11 +174,7 @@ class cp2k_dft_print_moments:
         fout.write("\t\t\t&END MOMENTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_electric_field_gradient:
@@ -220,11 +193,7 @@ class cp2k_dft_print_electric_field_gradient:
         fout.write("\t\t\t&END ELECTRIC_FIELD_GRADIENT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_print_external_potential_cube:
     def __init__(self):
@@ -242,11 +211,7 @@ class cp2k_dft_print_external_potential_cube:
         fout.write("\t\t\t&END EXTERNAL_POTENTIAL_CUBE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_print_lowdin:
     def __init__(self):
@@ -263,11 +228,7 @@ class cp2k_dft_print_lowdin:
         fout.write("\t\t\t&END LOWDIN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_mo:
@@ -286,11 +247,7 @@ class cp2k_dft_print_mo:
         fout.write("\t\t\t&END MO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_print_mo_cubes:
     def __init__(self):
@@ -309,11 +266,7 @@ class cp2k_dft_print_mo_cubes:
         fout.write("\t\t\t&END MO_CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_mulliken:
@@ -331,11 +284,7 @@ class cp2k_dft_print_mulliken:
         fout.write("\t\t\t&END MULLIKEN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_stm:
@@ -353,11 +302,7 @@ class cp2k_dft_print_stm:
         fout.write("\t\t\t&END STM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_subcell:
@@ -375,11 +320,7 @@ class cp2k_dft_print_subcell:
         fout.write("\t\t\t&END SUBCELL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -398,11 +339,7 @@ class cp2k_dft_print_tot_density_cube:
         fout.write("\t\t\t&END TOT_DENSITY_CUBE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -421,11 +358,7 @@ class cp2k_dft_print_v_hartree_cube:
         fout.write("\t\t\t&END V_HARTREE_CUBE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_v_xc_cube:
@@ -443,11 +376,7 @@ class cp2k_dft_print_v_xc_cube:
         fout.write("\t\t\t&END V_XC_CUBE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_wannier90:
@@ -464,11 +393,7 @@ class cp2k_dft_print_wannier90:
         fout.write("\t\t\t&END WANNIER90\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_print_wfn_mix:
@@ -485,11 +410,7 @@ class cp2k_dft_print_wfn_mix:
         fout.write("\t\t\t&END WFN_MIX\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -508,11 +429,7 @@ class cp2k_dft_print_xray_diffraction_spectrum:
         fout.write("\t\t\t&END XRAY_DIFFRACTION_SPECTRUM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -524,32 +441,41 @@ class cp2k_dft_print:
             eg. it can help with analysis of charge density cube files.
             it lies in cp2k/tool/cubecruncher
     """
+    active_space = lazy_section("cp2k_dft_print_active_space", "ACTIVE_SPACE")
+    band_structure = lazy_section("cp2k_dft_print_band_structure", "BAND_STRUCTURE")
+    efield_cube = lazy_section("cp2k_dft_print_efield_cube", "EFIELD_CUBE")
+    electric_field_gradient = lazy_section("cp2k_dft_print_electric_field_gradient", "ELECTRIC_FIELD_GRADIENT")
+    elf_cube = lazy_section("cp2k_dft_print_elf_cube", "ELF_CUBE")
+    external_potential_cube = lazy_section("cp2k_dft_print_external_potential_cube", "EXTERNAL_POTENTIAL_CUBE")
+    e_density_cube = lazy_section("cp2k_dft_print_e_density_cube", "E_DENSITY_CUBE")
+    lowdin = lazy_section("cp2k_dft_print_lowdin", "LOWDIN")
+    mo = lazy_section("cp2k_dft_print_mo", "MO")
+    moments = lazy_section("cp2k_dft_print_moments", "MOMENTS")
+    mo_cubes = lazy_section("cp2k_dft_print_mo_cubes", "MO_CUBES")
+    mulliken = lazy_section("cp2k_dft_print_mulliken", "MULLIKEN")
+    pdos = lazy_section("cp2k_dft_print_pdos", "PDOS")
+    stm = lazy_section("cp2k_dft_print_stm", "STM")
+    subcell = lazy_section("cp2k_dft_print_subcell", "SUBCELL")
+    tot_density_cube = lazy_section("cp2k_dft_print_tot_density_cube", "TOT_DENSITY_CUBE")
+    v_hartree_cube = lazy_section("cp2k_dft_print_v_hartree_cube", "V_HARTREE_CUBE")
+    v_xc_cube = lazy_section("cp2k_dft_print_v_xc_cube", "V_XC_CUBE")
+    wannier90 = lazy_section("cp2k_dft_print_wannier90", "WANNIER90")
+    wfn_mix = lazy_section("cp2k_dft_print_wfn_mix", "WFN_MIX")
+    xray_diffraction_spectrum = lazy_section("cp2k_dft_print_xray_diffraction_spectrum", "XRAY_DIFFRACTION_SPECTRUM")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.active_space = cp2k_dft_print_active_space()
-
         self.adjmat_write = False
-        self.band_structure = cp2k_dft_print_band_structure()
         self.basis_molopt_quantities = False
         self.basis_set_file = False
         self.derivatives = False
         self.dft_control_parameters = False
 
-        self.efield_cube = cp2k_dft_print_efield_cube()
-
-        self.electric_field_gradient = cp2k_dft_print_electric_field_gradient()
-
-        self.elf_cube = cp2k_dft_print_elf_cube()
-
         self.energy_windows = False
 
-        self.external_potential_cube = cp2k_dft_print_external_potential_cube()
-
-        self.e_density_cube = cp2k_dft_print_e_density_cube()
-
         self.gapw = False
         self.hirshfeld = False
         self.hyperfine_coupling_tensor = False
@@ -558,47 +484,19 @@ class cp2k_dft_print:
         self.kpoints = False
         self.ks_csr_write = False
 
-        self.lowdin = cp2k_dft_print_lowdin()
-
         self.mao_analysis = False
         self.minbas_analysis = False
 
-        self.mo = cp2k_dft_print_mo()
-
-        self.moments = cp2k_dft_print_moments()
-
-        self.mo_cubes = cp2k_dft_print_mo_cubes()
-
-        self.mulliken = cp2k_dft_print_mulliken()
-
         self.neighbor_lists = False
         self.optimize_lri_basis = False
         self.overlap_condition = False
         
-        self.pdos = cp2k_dft_print_pdos()
-        
         self.plus_u = False
         self.program_banner = False
         self.sccs = False
 
-        self.stm = cp2k_dft_print_stm()
-
-        self.subcell = cp2k_dft_print_subcell()
-
         self.s_csr_write = False
 
-        self.tot_density_cube = cp2k_dft_print_tot_density_cube()
-
-        self.v_hartree_cube = cp2k_dft_print_v_hartree_cube()
-
-        self.v_xc_cube = cp2k_dft_print_v_xc_cube()
-
-        self.wannier90 = cp2k_dft_print_wannier90()
-
-        self.wfn_mix = cp2k_dft_print_wfn_mix()
-
-        self.xray_diffraction_spectrum = cp2k_dft_print_xray_diffraction_spectrum()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -608,118 +506,72 @@ class cp2k_dft_print:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
 
-        if self.active_space.status == True:
+        if section_active(self, "active_space"):
             self.active_space.to_input(fout)
 
-        if self.band_structure.status == True:
+        if section_active(self, "band_structure"):
             self.band_structure.to_input(fout)
         
-        if self.efield_cube.status == True:
+        if section_active(self, "efield_cube"):
             self.efield_cube.to_input(fout)
 
-        if self.electric_field_gradient.status == True:
+        if section_active(self, "electric_field_gradient"):
             self.electric_field_gradient.to_input(fout)
 
-        if self.elf_cube.status == True:
+        if section_active(self, "elf_cube"):
             self.elf_cube.to_input(fout)
 
-        if self.e_density_cube.status == True:
+        if section_active(self, "e_density_cube"):
             self.e_density_cube.to_input(fout)
 
-        if self.external_potential_cube.status == True:
+        if section_active(self, "external_potential_cube"):
             self.external_potential_cube.to_input(fout)
 
-        if self.pdos.status == True:
+        if section_active(self, "pdos"):
             self.pdos.to_input(fout)
 
-        if self.lowdin.status == True:
+        if section_active(self, "lowdin"):
             self.lowdin.to_input(fout)
 
-        if self.mo.status == True:
+        if section_active(self, "mo"):
             self.mo.to_input(fout)
 
-        if self.moments.status == True:
+        if section_active(self, "moments"):
             self.moments.to_input(fout)
 
-        if self.mo_cubes.status == True:
+        if section_active(self, "mo_cubes"):
             self.mo_cubes.to_input(fout)
 
-        if self.mulliken.status == True:
+        if section_active(self, "mulliken"):
             self.mulliken.to_input(fout)
 
-        if self.stm.status == True:
+        if section_active(self, "stm"):
             self.stm.to_input(fout)
 
-        if self.subcell.status == True:
+        if section_active(self, "subcell"):
             self.subcell.to_input(fout)
        
-        if self.tot_density_cube.status == True:
+        if section_active(self, "tot_density_cube"):
             self.tot_density_cube.to_input(fout)
 
-        if self.v_hartree_cube.status == True:
+        if section_active(self, "v_hartree_cube"):
             self.v_hartree_cube.to_input(fout)
 
-        if self.v_xc_cube.status == True:
+        if section_active(self, "v_xc_cube"):
             self.v_xc_cube.to_input(fout)
 
-        if self.wannier90.status == True:
+        if section_active(self, "wannier90"):
             self.wannier90.to_input(fout)
 
-        if self.wfn_mix.status == True:
+        if section_active(self, "wfn_mix"):
             self.wfn_mix.to_input(fout)
 
-        if self.xray_diffraction_spectrum.status == True:
+        if section_active(self, "xray_diffraction_spectrum"):
             self.xray_diffraction_spectrum.to_input(fout)
 
         fout.write("\t\t&END PRINT\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BAND_STRUCTURE":
-                self.band_structure.set_params({item: params[item]})
-            elif item.split("-")[2] == "ACTIVE_SPACE":
-                self.active_space.set_params({item: params[item]})
-            elif item.split("-")[2] == "EFIELD_CUBE":
-                self.efield_cube.set_params({item: params[item]})
-            elif item.split("-")[2] == "ELF_CUBE":
-                self.elf_cube.set_params({item: params[item]})
-            elif item.split("-")[2] == "E_DENSITY_CUBE":
-                self.e_density_cube.set_params({item: params[item]})
-            elif item.split("-")[2] == "LOWDIN":
-                self.lowdin.set_params({item: params[item]})
-            elif item.split("-")[2] == "MO":
-                self.mo.set_params({item: params[item]})           
-            elif item.split("-")[2] == "MO_CUBES":
-                self.mo_cubes.set_params({item: params[item]})           
-            elif item.split("-")[2] == "MOMENTS":
-                self.moments.set_params({item: params[item]})           
-            elif item.split("-")[2] == "MULLIKEN":
-                self.mulliken.set_params({item: params[item]})           
-            elif item.split("-")[2] == "ELECTRIC_FIELD_GRADIENT":
-                self.electric_field_gradient.set_params({item: params[item]})           
-            elif item.split("-")[2] == "EXTERNAL_POTENTIAL_CUBE":
-                self.external_potential_cube.set_params({item: params[item]})           
-            elif item.split("-")[2] == "PDOS":
-                self.pdos.set_params({item: params[item]})           
-            elif item.split("-")[2] == "SUBCELL":
-                self.subcell.set_params({item: params[item]})           
-            elif item.split("-")[2] == "STM":
-                self.stm.set_params({item: params[item]})           
-            elif item.split("-")[2] == "TOT_DENSITY-CUBE":
-                self.tot_density_cube.set_params({item: params[item]})           
-            elif item.split("-")[2] == "V_HARTREE_CUBE":
-                self.v_hartree_cube.set_params({item: params[item]})           
-            elif item.split("-")[2] == "V_XC_CUBE":
-                self.x_xc_cube.set_params({item: params[item]})           
-            elif item.split("-")[2] == "WANNIER90":
-                self.wannier90.set_params({item: params[item]})           
-            elif item.split("-")[2] == "WFN_MIX":
-                self.wfn_mix.set_params({item: params[item]})           
-            elif item.split("-")[2] == "XRAY_DIFFRACTION_SPECTRUM":
-                self.xray_diffraction_spectrum.set_params({item: params[item]})           
-            else:
-                pass
+        route_params(self, params, level=2)
 
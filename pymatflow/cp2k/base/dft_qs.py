@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ============================
 # CP2K / FORCE_EVAL / DFT / QS
 # ============================
@@ -22,11 +24,7 @@ class cp2k_dft_qs_becke_constraint_atom_group:
         fout.write("\t\t\t\t&END ATOM_GROUP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_qs_becke_constraint_dummy_atoms:
     def __init__(self):
@@ -45,11 +43,7 @@ class cp2k_dft_qs_becke_constraint_dummy_atoms:
         fout.write("\t\t\t\t&END DUMMY_ATOMS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_qs_becke_constraint_program_run_info_each:
     def __init__(self):
@@ -68,21 +62,17 @@ class cp2k_dft_qs_becke_constraint_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_qs_becke_constraint_program_run_info:
+    each = lazy_section("cp2k_dft_qs_becke_constraint_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_qs_becke_constraint_program_run_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -94,30 +84,24 @@ class cp2k_dft_qs_becke_constraint_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PRQOGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_becke_constraint:
+    atom_group = lazy_section("cp2k_dft_qs_becke_constraint_atom_group", "ATOM_GROUP")
+    dummy_atoms = lazy_section("cp2k_dft_qs_becke_constraint_dummy_atoms", "DUMMY_ATOMS")
+    program_run_info = lazy_section("cp2k_dft_qs_becke_constraint_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.atom_group = cp2k_dft_qs_becke_constraint_atom_group()
-        self.dummy_atoms = cp2k_dft_qs_becke_constraint_dummy_atoms()
-        self.program_run_info = cp2k_dft_qs_becke_constraint_program_run_info()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -126,26 +110,16 @@ class cp2k_dft_qs_becke_constraint:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.atom_group.status == True:
+        if section_active(self, "atom_group"):
             self.atom_group.to_input(fout)
-        if self.dummy_atoms.status == True:
+        if section_active(self, "dummy_atoms"):
             self.dummy.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END BECKE_CONSTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "ATOM_GROUP":
-                self.atom_group.set_params({item: params[item]})
-            elif item.split("-")[3] == "DUMMY_ATOMS":
-                self.dummy_atoms.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_qs_cdft_hirshfeld_constraint_program_run_info_each:
     def __init__(self):
@@ -164,20 +138,16 @@ class cp2k_dft_qs_cdft_hirshfeld_constraint_program_run_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_qs_cdft_hirshfeld_constraint_program_run_info:
+    each = lazy_section("cp2k_dft_qs_cdft_hirshfeld_constraint_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_qs_cdft_hirshfeld_constraint_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -188,27 +158,21 @@ class cp2k_dft_qs_cdft_hirshfeld_constraint_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.to_input(fout)
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_qs_cdft_hirshfeld_constraint:
+    program_run_info = lazy_section("cp2k_dft_qs_cdft_hirshfeld_constraint_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.program_run_info = cp2k_dft_qs_cdft_hirshfeld_constraint_program_run_info()
-        
         # basic_setting
 
     def to_input(self, fout):
@@ -219,18 +183,12 @@ class cp2k_dft_qs_cdft_hirshfeld_constraint:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t\t&END HIRSHFELD_CONSTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_cdft_outer_scf_cdft_opt:
@@ -250,21 +208,17 @@ class cp2k_dft_qs_cdft_outer_scf_cdft_opt:
         fout.write("\t\t\t\t\t&END CDFT_OPT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_qs_cdft_outer_scf:
+    cdft_opt = lazy_section("cp2k_dft_qs_cdft_outer_scf_cdft_opt", "CDFT_OPT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cdft_opt = cp2k_dft_qs_cdft_outer_scf_cdft_opt()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -275,29 +229,23 @@ class cp2k_dft_qs_cdft_outer_scf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cdft_opt.status == True:
+        if section_active(self, "cdft_opt"):
             self.cdft_opt.to_input(fout)
         fout.write("\t\t\t\t&END OUTER_SCF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CDFT_OPT":
-                self.cdft_opt.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_cdft:
+    hirshfeld_constraint = lazy_section("cp2k_dft_qs_cdft_hirshfeld_constraint", "HIRSHFELD_CONSTRAINT")
+    outer_scf = lazy_section("cp2k_dft_qs_cdft_outer_scf", "OUTER_SCF")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hirshfeld_constraint = cp2k_dft_qs_cdft_hirshfeld_constraint()
-        self.outer_scf = cp2k_dft_qs_cdft_outer_scf()
-
         # basic setting
 
     def to_input(self, fout):
@@ -308,23 +256,15 @@ class cp2k_dft_qs_cdft:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.hirshfeld_constraint.status == True:
+        if section_active(self, "hirshfeld_constraint"):
             self.hirshfeld_constraint.to_input(fout)
-        if self.outer_scf.status == True:
+        if section_active(self, "outer_scf"):
             self.outer_scf.to_input(fout)
 
         fout.write("\t\t\t&END CDFT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "HIRSHFELD_CONSTRAINT":
-                self.hirshfeld_constraint.set_params({item: params[item]})
-            elif item.split("-")[3] == "OUTER_SCF":
-                self.outer_scf.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_qs_ddapc_restraint_program_run_info_each:
     def __init__(self):
@@ -343,13 +283,11 @@ class cp2k_dft_qs_ddapc_restraint_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_qs_ddapc_restraint_program_run_info:
+    each = lazy_section("cp2k_dft_qs_ddapc_restraint_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
@@ -357,8 +295,6 @@ class cp2k_dft_qs_ddapc_restraint_program_run_info:
 
         self.section = "LOW"
 
-        self.each = cp2k_dft_qs_ddapc_restraint_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -374,22 +310,16 @@ class cp2k_dft_qs_ddapc_restraint_program_run_info:
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_qs_ddapc_restraint:
+    program_run_info = lazy_section("cp2k_dft_qs_ddapc_restraint_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.program_run_info = cp2k_dft_qs_ddapc_restraint_program_run_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -400,21 +330,12 @@ class cp2k_dft_qs_ddapc_restraint:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END DDAPC_RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                if item.split("-")[-1] == "PROGRAM_RUN_INFO":
-                    self.program_run_info.section = params[item]
-                else:
-                    self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_qs_dftb_parameter:
@@ -434,21 +355,17 @@ class cp2k_dft_qs_dftb_parameter:
         fout.write("\t\t\t\t&END PARAMETER\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_dftb:
+    parameter = lazy_section("cp2k_dft_qs_dftb_parameter", "PARAMETER")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.parameter = cp2k_dft_qs_dftb_parameter()
-
         # basic setting
         self.parameter.status = True
 
@@ -460,18 +377,12 @@ class cp2k_dft_qs_dftb:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.parameter.status == True:
+        if section_active(self, "parameter"):
             self.parameter.to_input(fout)
         fout.write("\t\t\t&END DFTB\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "PARAMETER":
-                self.parameter.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_qs_distribution:
@@ -491,11 +402,7 @@ class cp2k_dft_qs_distribution:
         fout.write("\t\t\t&END DISTRIBUTION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_qs_lrigpw:
@@ -515,11 +422,7 @@ class cp2k_dft_qs_lrigpw:
         fout.write("\t\t\t&END LRIGPW\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_qs_mulliken_restraint:
     def __init__(self):
@@ -538,11 +441,7 @@ class cp2k_dft_qs_mulliken_restraint:
         fout.write("\t\t\t&END MULLIKEN_RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_qs_optimize_lri_basis_constraint_exponents:
@@ -562,11 +461,7 @@ class cp2k_dft_qs_optimize_lri_basis_constraint_exponents:
         fout.write("\t\t\t\t&END CONSTRAINT_EXPONENTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_optimize_lri_basis:
@@ -586,11 +481,7 @@ class cp2k_dft_qs_optimize_lri_basis:
         fout.write("\t\t\t&END OPTIMIZE_LRI_BASIS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_qs_opt_embed_embed_dens_diff_each:
     def __init__(self):
@@ -609,20 +500,16 @@ class cp2k_dft_qs_opt_embed_embed_dens_diff_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_qs_opt_embed_embed_dens_diff:
+    each = lazy_section("cp2k_dft_qs_opt_embed_embed_dens_diff_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_qs_opt_embed_embed_dens_diff_each()
-
         # basic setting
         self.each.status = True
 
@@ -634,18 +521,12 @@ class cp2k_dft_qs_opt_embed_embed_dens_diff:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END EMBED_DENS_DIFF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.to_input(fout)
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_qs_opt_embed_embed_pot_cube_each:
     def __init__(self):
@@ -664,21 +545,17 @@ class cp2k_dft_qs_opt_embed_embed_pot_cube_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_qs_opt_embed_embed_pot_cube:
+    each = lazy_section("cp2k_dft_qs_opt_embed_embed_pot_cube_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_qs_opt_embed_embed_pot_cube_each()
-
         # basic setting
         self.each.status = True
 
@@ -690,18 +567,12 @@ class cp2k_dft_qs_opt_embed_embed_pot_cube:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END EMBED_POT_CUBE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.to_input(fout)
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_opt_embed_embed_pot_vector_each:
@@ -721,20 +592,16 @@ class cp2k_dft_qs_opt_embed_embed_pot_vector_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_qs_opt_embed_embed_pot_vector:
+    each = lazy_section("cp2k_dft_qs_opt_embed_embed_pot_vector_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_qs_opt_embed_embed_pot_vector_each()
-
         # basic setting
         self.each.status = True
 
@@ -746,30 +613,24 @@ class cp2k_dft_qs_opt_embed_embed_pot_vector:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END EMBED_POT_VECTOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_opt_embed:
+    embed_dens_diff = lazy_section("cp2k_dft_qs_opt_embed_embed_dens_diff", "EMBED_DENS_DIFF")
+    embed_pot_cube = lazy_section("cp2k_dft_qs_opt_embed_embed_pot_cube", "EMBED_POT_CUBE")
+    embed_pot_vector = lazy_section("cp2k_dft_qs_opt_embed_embed_pot_vector", "EMBED_POT_VECTOR")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.embed_dens_diff = cp2k_dft_qs_opt_embed_embed_dens_diff()
-        self.embed_pot_cube = cp2k_dft_qs_opt_embed_embed_pot_cube()
-        self.embed_pot_vector = cp2k_dft_qs_opt_embed_embed_pot_vector()
-
         # basic setting
 
     def to_input(self, fout):
@@ -780,33 +641,16 @@ class cp2k_dft_qs_opt_embed:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.embed_dens_diff.status == True:
+        if section_active(self, "embed_dens_diff"):
             self.embed_dens_diff.to_input(fout)
-        if self.embed_pot_cube.status == True:
+        if section_active(self, "embed_pot_cube"):
             self.embed_pot_cube.to_input(fout)
-        if self.embed_pot_vector.status == True:
+        if section_active(self, "embed_pot_vector"):
             self.embed_pot_vector.to_input(fout)
         fout.write("\t\t\t&END OPT_EMBED\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                if item.split("-")[-1] == "EMBED_DENS_DIFF":
-                    self.embed_dens_diff.section = params[item]
-                elif item.split("-")[-1] == "EMBED_POT_CUBE":
-                    self.embed_pot_cube.section = params[item]
-                elif item.split("-")[-1] == "EMBED_POT_VECTOR":
-                    self.embed_pot_vector.section = params[item]
-                else:
-                    self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EMBED_DENS_DIFF":
-                self.embed_dens_diff.set_params({item: params[item]})
-            elif item.split("-")[3] == "EMBED_POT_CUBE":
-                self.embed_pot_cube.set_params({item: params[item]})
-            elif item.split("-")[3] == "EMBED_POT_VECTOR":
-                self.embed_pot_vector.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_qs_s2_restraint:
@@ -826,11 +670,7 @@ class cp2k_dft_qs_s2_restraint:
         fout.write("\t\t\t&END S2_RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_qs_se_coulomb:
@@ -850,11 +690,7 @@ class cp2k_dft_qs_se_coulomb:
         fout.write("\t\t\t\t&END COULOMB\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_se_exchange:
@@ -874,11 +710,7 @@ class cp2k_dft_qs_se_exchange:
         fout.write("\t\t\t\t&END EXCHANGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_se_ga:
@@ -898,11 +730,7 @@ class cp2k_dft_qs_se_ga:
         fout.write("\t\t\t\t&END GA\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_se_lr_correction:
@@ -922,11 +750,7 @@ class cp2k_dft_qs_se_lr_correction:
         fout.write("\t\t\t\t&END LR_CORRECTION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_qs_se_memory:
     def __init__(self):
@@ -945,11 +769,7 @@ class cp2k_dft_qs_se_memory:
         fout.write("\t\t\t\t&END MEMORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_qs_se_neighbor_lists:
     def __init__(self):
@@ -968,11 +788,7 @@ class cp2k_dft_qs_se_neighbor_lists:
         fout.write("\t\t\t\t&END NEIGHBOR_LISTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_qs_se_print_ewald_info_each:
@@ -992,21 +808,17 @@ class cp2k_dft_qs_se_print_ewald_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_qs_se_print_ewald_info:
+    each = lazy_section("cp2k_dft_qs_se_print_ewald_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_qs_se_print_ewald_info_each()
-
         # basic seting
         self.each.status = True
 
@@ -1018,18 +830,12 @@ class cp2k_dft_qs_se_print_ewald_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END EWALD_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_qs_se_print_neighbor_lists_each:
     def __init__(self):
@@ -1048,21 +854,17 @@ class cp2k_dft_qs_se_print_neighbor_lists_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_qs_se_print_neighbor_lists:
+    each = lazy_section("cp2k_dft_qs_se_print_neighbor_lists_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_qs_se_print_neighbor_lists_each()
-
         # basic seting
         self.each.status = True
 
@@ -1074,18 +876,12 @@ class cp2k_dft_qs_se_print_neighbor_lists:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END NEIGHBOR_LISTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_qs_se_print_subcell_each:
@@ -1105,21 +901,17 @@ class cp2k_dft_qs_se_print_subcell_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_qs_se_print_subcell:
+    each = lazy_section("cp2k_dft_qs_se_print_subcell_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_qs_se_print_subcell_each()
-
         # basic setting
         self.each.status = True
 
@@ -1131,30 +923,24 @@ class cp2k_dft_qs_se_print_subcell:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END SUBCELL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_qs_se_print:
+    ewald_info = lazy_section("cp2k_dft_qs_se_print_ewald_info", "EWALD_INFO")
+    neighbor_lists = lazy_section("cp2k_dft_qs_se_print_neighbor_lists", "NEIGHBOR_LISTS")
+    subcell = lazy_section("cp2k_dft_qs_se_print_subcell", "SUBCELL")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.ewald_info = cp2k_dft_qs_se_print_ewald_info()
-        self.neighbor_lists = cp2k_dft_qs_se_print_neighbor_lists()
-        self.subcell = cp2k_dft_qs_se_print_subcell()
-    
         # basic setting
 
     def to_input(self, fout):
@@ -1165,26 +951,16 @@ class cp2k_dft_qs_se_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.ewald_info.status == True:
+        if section_active(self, "ewald_info"):
             self.ewald_info.to_input(fout)
-        if self.neighbor_lists.status == True:
+        if section_active(self, "neighbor_lists"):
             self.neighbor_lists.to_input(fout)
-        if self.subcell.status == True:
+        if section_active(self, "subcell"):
             self.subcell.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EWALD_INFO":
-                self.ewald_info.set_params({item: params[item]})
-            elif item.split("-")[4] == "NEIGHBOR_LISTS":
-                self.neighbor_lists.set_params({item: params[item]})
-            elif item.split("-")[4] == "SUBCELL":
-                self.subcell.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -1205,29 +981,25 @@ class cp2k_dft_qs_se_screening:
         fout.write("\t\t\t\t&END SCREENING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
 class cp2k_dft_qs_se:
+    coulomb = lazy_section("cp2k_dft_qs_se_coulomb", "COULOMB")
+    exchange = lazy_section("cp2k_dft_qs_se_exchange", "EXCHANGE")
+    ga = lazy_section("cp2k_dft_qs_se_ga", "GA")
+    lr_correction = lazy_section("cp2k_dft_qs_se_lr_correction", "LR_CORRECTION")
+    memory = lazy_section("cp2k_dft_qs_se_memory", "MEMORY")
+    neighbor_lists = lazy_section("cp2k_dft_qs_se_neighbor_lists", "NEIGHBOR_LISTS")
+    printout = lazy_section("cp2k_dft_qs_se_print", "PRINT")
+    screening = lazy_section("cp2k_dft_qs_se_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.coulomb = cp2k_dft_qs_se_coulomb()
-        self.exchange = cp2k_dft_qs_se_exchange()
-        self.ga = cp2k_dft_qs_se_ga()
-        self.lr_correction = cp2k_dft_qs_se_lr_correction()
-        self.memory = cp2k_dft_qs_se_memory()
-        self.neighbor_lists = cp2k_dft_qs_se_neighbor_lists()
-        self.printout = cp2k_dft_qs_se_print()
-        self.screening = cp2k_dft_qs_se_screening()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1236,49 +1008,41 @@ class cp2k_dft_qs_se:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.coulomb.status == True:
+        if section_active(self, "coulomb"):
             self.coulomb.to_input(fout)
-        if self.exchange.status == True:
+        if section_active(self, "exchange"):
             self.exchange.to_input(fout)
-        if self.ga.status == True:
+        if section_active(self, "ga"):
             self.ga.to_input(fout)
-        if self.lr_correction.status == True:
+        if section_active(self, "lr_correction"):
             self.lr_correction.to_input(fout)
-        if self.memory.status == True:
+        if section_active(self, "memory"):
             self.memory.to_input(fout)
-        if self.neighbor_lists.status == True:
+        if section_active(self, "neighbor_lists"):
             self.neighbor_lists.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input(fout)
         fout.write("\t\t\t&END SE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "COULOMB":
-                self.coulomb.set_params({item: params[item]})
-            elif item.split("-")[3] == "EXCHANGE":
-                self.exchange.set_params({item: params[item]})
-            elif item.split("-")[3] == "GA":
-                self.ga.set_params({item: params[item]})
-            elif item.split("-")[3] == "LR_CORRECTION":
-                self.lr_correction.set_params({item: params[item]})
-            elif item.split("-")[3] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[3] == "NEIGHBOR_LISTS":
-                self.neighbor_lists.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[3] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_qs:
+    becke_constraint = lazy_section("cp2k_dft_qs_becke_constraint", "BECKE_CONSTRAINT")
+    cdft = lazy_section("cp2k_dft_qs_cdft", "CDFT")
+    ddapc_restraint = lazy_section("cp2k_dft_qs_ddapc_restraint", "DDAPC_RESTRAINT")
+    dftb = lazy_section("cp2k_dft_qs_dftb", "DFTB")
+    distribution = lazy_section("cp2k_dft_qs_distribution", "DISTRIBUTION")
+    lrigpw = lazy_section("cp2k_dft_qs_lrigpw", "LRIGPW")
+    mulliken_restraint = lazy_section("cp2k_dft_qs_mulliken_restraint", "MULLIKEN_RESTRAINT")
+    optimize_lri_basis = lazy_section("cp2k_dft_qs_optimize_lri_basis", "OPTIMIZE_LRI_BASIS")
+    opt_embed = lazy_section("cp2k_dft_qs_opt_embed", "OPT_EMBED")
+    s2_restraint = lazy_section("cp2k_dft_qs_s2_restraint", "S2_RESTRAINT")
+    se = lazy_section("cp2k_dft_qs_se", "SE")
+
     def __init__(self):
         self.params = {
                 "METHOD": "GPW",
@@ -1287,18 +1051,6 @@ class cp2k_dft_qs:
                 }
         self.status = False
 
-        self.becke_constraint = cp2k_dft_qs_becke_constraint()
-        self.cdft = cp2k_dft_qs_cdft()
-        self.ddapc_restraint = cp2k_dft_qs_ddapc_restraint()
-        self.dftb = cp2k_dft_qs_dftb()
-        self.distribution = cp2k_dft_qs_distribution()
-        self.lrigpw = cp2k_dft_qs_lrigpw()
-        self.mulliken_restraint = cp2k_dft_qs_mulliken_restraint()
-        self.optimize_lri_basis = cp2k_dft_qs_optimize_lri_basis()
-        self.opt_embed = cp2k_dft_qs_opt_embed()
-        self.s2_restraint = cp2k_dft_qs_s2_restraint()
-        self.se = cp2k_dft_qs_se()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1307,58 +1059,32 @@ class cp2k_dft_qs:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.becke_constraint.status == True:
+        if section_active(self, "becke_constraint"):
             self.becke_constraint.to_input(fout)
-        if self.cdft.status == True:
+        if section_active(self, "cdft"):
             self.cdft.to_input(fout)
-        if self.ddapc_restraint.status == True:
+        if section_active(self, "ddapc_restraint"):
             self.ddapc_restraint.to_input(fout)
-        if self.dftb.status == True:
+        if section_active(self, "dftb"):
             self.dftb.to_input(fout)
-        if self.distribution.status == True:
+        if section_active(self, "distribution"):
             self.distribution.to_input(fout)
-        if self.lrigpw.status == True:
+        if section_active(self, "lrigpw"):
             self.lrigpw.to_input(fout)
-        if self.mulliken_restraint.status == True:
+        if section_active(self, "mulliken_restraint"):
             self.mulliken_restraint.to_input(fout)
-        if self.optimize_lri_basis.status == True:
+        if section_active(self, "optimize_lri_basis"):
             self.optimize_lri_basis.to_input(fout)
-        if self.opt_embed.status == True:
+        if section_active(self, "opt_embed"):
             self.opt_embed.to_input(fout)
-        if self.s2_restraint.status == True:
+        if section_active(self, "s2_restraint"):
             self.s2_restraint.to_input(fout)
-        if self.se.status == True:
+        if section_active(self, "se"):
             self.se.to_input(fout)
         fout.write("\t\t&END QS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BECKE_CONSTRAINT":
-                self.becke_constraint.set_params({item: params[item]})
-            elif item.split("-")[2] == "CDFT":
-                self.cdft.set_params({item: params[item]})
-            elif item.split("-")[2] == "DDAPC_RESTRAINT":
-                sel.fddapc_restraint.set_params({item: params[item]})
-            elif item.split("-")[2] == "DFTB":
-                self.dftb.set_params({item: params[item]})
-            elif item.split("-")[2] == "DISTRIBUTION":
-                self.distribution.set_params({item: params[item]})
-            elif item.split("-")[2] == "LRIGPW":
-                self.lrigpw.set_params({item: params[item]})
-            elif item.split("-")[2] == "MULLIKEN_RESTRAINT":
-                self.mulliken_restraint.set_params({item: params[item]})
-            elif item.split("-")[2] == "OPTIMIZE_LRI_BASIS":
-                self.optimize_lri_basis.set_params({item: params[item]})
-            elif item.split("-")[2] == "OPT_EMBED":
-                self.opt_embed.set_params({item: params[item]})
-            elif item.split("-")[2] == "S2_RESTRAINT":
-                self.s2_restraint.set_params({item: params[item]})
-            elif item.split("-")[2] == "SE":
-                self.se.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
                 
 
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ==================================
 # ==================================
 class cp2k_dft_real_time_propagation_print_current_each:
@@ -22,24 +24,19 @@ class cp2k_dft_real_time_propagation_print_current_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_real_time_propagation_print_current:
+    each = lazy_section("cp2k_dft_real_time_propagation_print_current_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_real_time_propagation_print_current_each()
-        
         # basic setting
 
-    
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -48,19 +45,13 @@ class cp2k_dft_real_time_propagation_print_current:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END CURRENT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_real_time_propagation_print_program_run_info_each:
     def __init__(self):
@@ -80,23 +71,18 @@ class cp2k_dft_real_time_propagation_print_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_real_time_propagation_print_program_run_info:
+    each = lazy_section("cp2k_dft_real_time_propagation_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_real_time_propagation_print_program_run_info_each()
-        
         # basic setting
 
-    
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -105,19 +91,13 @@ class cp2k_dft_real_time_propagation_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_real_time_propagation_print_restart_each:
@@ -138,24 +118,19 @@ class cp2k_dft_real_time_propagation_print_restart_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_real_time_propagation_print_restart:
+    each = lazy_section("cp2k_dft_real_time_propagation_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_real_time_propagation_print_restart_each()
-        
         # basic setting
 
-    
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -164,19 +139,13 @@ class cp2k_dft_real_time_propagation_print_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RESTART\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item] 
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_real_time_propagation_print_restart_history_each:
     def __init__(self):
@@ -196,24 +165,19 @@ class cp2k_dft_real_time_propagation_print_restart_history_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_real_time_propagation_print_restart_history:
+    each = lazy_section("cp2k_dft_real_time_propagation_print_restart_history_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_real_time_propagation_print_restart_history_each()
-        
         # basic setting
 
-    
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -222,34 +186,28 @@ class cp2k_dft_real_time_propagation_print_restart_history:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RESTART_HISTORY")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_real_time_propagation_print:
+    current = lazy_section("cp2k_dft_real_time_propagation_print_current", "CURRENT")
+    program_run_info = lazy_section("cp2k_dft_real_time_propagation_print_program_run_info", "PROGRAM_RUN_INFO")
+    restart = lazy_section("cp2k_dft_real_time_propagation_print_restart", "RESTART")
+    restart_history = lazy_section("cp2k_dft_real_time_propagation_print_restart_history", "RESTART_HISTORY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.current = cp2k_dft_real_time_propagation_print_current()
-        self.program_run_info = cp2k_dft_real_time_propagation_print_program_run_info()
-        self.restart = cp2k_dft_real_time_propagation_print_restart()
-        self.restart_history = cp2k_dft_real_time_propagation_print_restart_history()
-
         # basic settign
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -258,34 +216,24 @@ class cp2k_dft_real_time_propagation_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.current.status == True:
+        if section_active(self, "current"):
             self.current.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
-        if self.restart_history.status == True:
+        if section_active(self, "restart_history"):
             self.restart_history.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CURRENT":
-                self.current.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            elif item.split("-")[3] == "RESTART_HISTORY":
-                self.restart_history.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_real_time_propagation:
+    printout = lazy_section("cp2k_dft_real_time_propagation_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 "ACCURACY_REFINEMENT": None,
@@ -299,10 +247,8 @@ class cp2k_dft_real_time_propagation:
                 }
         self.status = False
 
-        self.printout = cp2k_dft_real_time_propagation_print()
-        
         # basic setting
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -311,16 +257,10 @@ class cp2k_dft_real_time_propagation:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t&END REAL_TIME_PROPAGATION\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -4,6 +4,9 @@
 # ==================
 # ==================
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
+
 class cp2k_dft_sccs_andreussi:
     def __init__(self):
         self.params = {}
@@ -21,11 +24,7 @@ class cp2k_dft_sccs_andreussi:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_sccs_fattebert_gygi:
     """
@@ -50,21 +49,19 @@ class cp2k_dft_sccs_fattebert_gygi:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
 class cp2k_dft_sccs:
+    andreussi = lazy_section("cp2k_dft_sccs_andreussi", "ANDREUSSI")
+    fattebert_gygi = lazy_section("cp2k_dft_sccs_fattebert_gygi", "FATTEBERT-GYGI")
+
     def __init__(self):
         self.params = {}
         self.status = False
-
-        self.andreussi = cp2k_dft_sccs_andreussi()
-        self.fattebert_gygi = cp2k_dft_sccs_fattebert_gygi()
+        # section parameter of SCCS, like TRUE, not written if None
+        self.section = None
 
         # basic setting
 
@@ -76,22 +73,14 @@ class cp2k_dft_sccs:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.andreussi.status == True:
+        if section_active(self, "andreussi"):
             self.andreussi.to_input(fout)
-        if self.fattebert_gygi.status == True:
+        if section_active(self, "fattebert_gygi"):
             self.fattebert_gygi.to_input(fout)
         fout.write("\t\t&END SCCS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "ANDREUSSI":
-                self.andreussi.set_params({item: params[item]})
-            elif item.split("-")[2] == "FATTEBERT_GYGI":
-                self.fattebert_gygi.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
@@ -2,6 +2,7 @@
 # _*_ coding: utf-8 _*_
 
 import sys
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 # =============================
 # CP2K / FORCE_EVAL / DFT / SCF
@@ -24,9 +25,7 @@ class cp2k_dft_scf_diagonalization_davidson:
        fout.write("\t\t\t\t&END DAVIDSON\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_diagonalization_diag_sub_scf_mixing:
@@ -46,11 +45,7 @@ class cp2k_dft_scf_diagonalization_diag_sub_scf_mixing:
        fout.write("\t\t\t\t\t&END MIXING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_scf_diagonalization_diag_sub_scf:
     def __init__(self):
@@ -69,11 +64,7 @@ class cp2k_dft_scf_diagonalization_diag_sub_scf:
        fout.write("\t\t\t\t&END DIAG_SUB_SCF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "MIXING":
-                self.mixing.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_diagonalization_filter_matrix:
@@ -93,9 +84,7 @@ class cp2k_dft_scf_diagonalization_filter_matrix:
        fout.write("\t\t\t\t&END FILTER_MATRIX\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_diagonalization_krylov:
@@ -115,9 +104,7 @@ class cp2k_dft_scf_diagonalization_krylov:
        fout.write("\t\t\t\t&END KRYLOV\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_diagonalization_ot:
@@ -137,12 +124,16 @@ class cp2k_dft_scf_diagonalization_ot:
        fout.write("\t\t\t\t&END OT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_diagonalization:
+    davidson = lazy_section("cp2k_dft_scf_diagonalization_davidson", "DAVIDSON")
+    diag_sub_scf = lazy_section("cp2k_dft_scf_diagonalization_diag_sub_scf", "DIAG_SUB_SCF")
+    filter_matrix = lazy_section("cp2k_dft_scf_diagonalization_filter_matrix", "FILTER_MATRIX")
+    krylov = lazy_section("cp2k_dft_scf_diagonalization_krylov", "KRYLOV")
+    ot = lazy_section("cp2k_dft_scf_diagonalization_ot", "OT")
+
     def __init__(self):
         self.params = {
                 "ALGORITHM": "STANDARD",
@@ -156,12 +147,6 @@ class cp2k_dft_scf_diagonalization:
 
         self.section = "TRUE" # TRUE, FALSE, true, false, True, False, actually regardness of uppercase or lowercase
 
-        self.davidson = cp2k_dft_scf_diagonalization_davidson()
-        self.diag_sub_scf = cp2k_dft_scf_diagonalization_diag_sub_scf()
-        self.filter_matrix = cp2k_dft_scf_diagonalization_filter_matrix()
-        self.krylov = cp2k_dft_scf_diagonalization_krylov()
-        self.ot = cp2k_dft_scf_diagonalization_ot()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -170,29 +155,14 @@ class cp2k_dft_scf_diagonalization:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.davidson.status == True:
+        if section_active(self, "davidson"):
             self.davidson.to_input(fout)
-        if self.diag_sub_scf.status == True:
+        if section_active(self, "diag_sub_scf"):
             self.diag_sub_scf.to_input(fout)
         fout.write("\t\t\t&END DIAGONALIZATION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                if item.split("-")[3] == "DIAG_SUB_SCF":
-                    self.diag_sub_scf.section = params[item]
-                else:
-                    self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DAVIDSON":
-                self.davidson.set_params({item: params[item]})
-            elif item.split("-")[3] == "DIAG_SUB_SCF":
-                self.diag_sub_scf.set_params({item: params[item]})
-            elif item.split("-")[3] == "FILTER_MATRIX":
-                self.filter_matrix.set_params({item: params[item]})
-            elif item.split("-")[3] == "KRYLOV":
-                self.krylov.set_params({item: params[item]})
-            elif item.split("-")[3] == "OT":
-                self.ot.set_params({item: params[item]})
+        route_params(self, params, level=3)
 
 
 
@@ -215,9 +185,7 @@ class cp2k_dft_scf_ot:
         fout.write("\t\t\t&END OT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_dft_scf_mixing:
     def __init__(self):
@@ -241,9 +209,7 @@ class cp2k_dft_scf_mixing:
         fout.write("\t\t\t&END MIXING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_dft_scf_mom:
     def __init__(self):
@@ -264,9 +230,7 @@ class cp2k_dft_scf_mom:
         fout.write("\t\t\t&END MOM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_dft_scf_outer_scf_cdft_opt:
     def __init__(self):
@@ -286,13 +250,11 @@ class cp2k_dft_scf_outer_scf_cdft_opt:
         fout.write("\t\t\t\t&END CDFT_OPT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_outer_scf:
+    cdft_opt = lazy_section("cp2k_dft_scf_outer_scf_cdft_opt", "CDFT_OPT")
+
     def __init__(self):
         self.params = {
                 }
@@ -300,8 +262,6 @@ class cp2k_dft_scf_outer_scf:
 
         self.section = 'TRUE' # TRUE, FALSE, true, false, True, False, actually regardness of uppercase or lowercase
 
-        self.cdft_opt = cp2k_dft_scf_outer_scf_cdft_opt()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -310,16 +270,12 @@ class cp2k_dft_scf_outer_scf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cdft_opt.status == True:
+        if section_active(self, "cdft_opt"):
             self.cdft_opt.to_input(fout)
         fout.write("\t\t\t&END OUTER_SCF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CDFT_OPT":
-                self.cdft_opt.set_params({item: params[item]})
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_scf_smear:
@@ -354,9 +310,7 @@ class cp2k_dft_scf_smear:
         fout.write("\t\t\t&END SMEAR\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_dft_scf_print_davidson_each:
     def __init__(self):
@@ -375,24 +329,23 @@ class cp2k_dft_scf_print_davidson_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_davidson:
+    each = lazy_section("cp2k_dft_scf_print_davidson_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_davidson_each()
         # basic setting
         self.each.status = True
         
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -401,16 +354,12 @@ class cp2k_dft_scf_print_davidson:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END DAVIDSON\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_print_detailed_energy_each:
     def __init__(self):
@@ -429,19 +378,18 @@ class cp2k_dft_scf_print_detailed_energy_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_detailed_energy:
+    each = lazy_section("cp2k_dft_scf_print_detailed_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_detailed_energy_each()
         # basic setting
         self.each.status = True
     
@@ -455,16 +403,12 @@ class cp2k_dft_scf_print_detailed_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END DETAILED_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_print_diag_sub_scf_each:
     def __init__(self):
@@ -483,24 +427,23 @@ class cp2k_dft_scf_print_diag_sub_scf_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_diag_sub_scf:
+    each = lazy_section("cp2k_dft_scf_print_diag_sub_scf_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_diag_sub_scf_each()
         # basic setting
         self.each.status = True
         
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -509,16 +452,12 @@ class cp2k_dft_scf_print_diag_sub_scf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END DIAG_SUB_SCF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_print_diis_info_each:
     def __init__(self):
@@ -537,24 +476,23 @@ class cp2k_dft_scf_print_diis_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_diis_info:
+    each = lazy_section("cp2k_dft_scf_print_diis_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_diis_info_each()
         # basic setting
         self.each.status = True
         
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -563,16 +501,12 @@ class cp2k_dft_scf_print_diis_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END DIIS_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_print_filter_matrix_each:
     def __init__(self):
@@ -591,24 +525,23 @@ class cp2k_dft_scf_print_filter_matrix_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_filter_matrix:
+    each = lazy_section("cp2k_dft_scf_print_filter_matrix_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_filter_matrix_each()
         # basic setting
         self.each.status = True
         
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -617,16 +550,12 @@ class cp2k_dft_scf_print_filter_matrix:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END FILTER_MATRIX\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 
@@ -647,24 +576,23 @@ class cp2k_dft_scf_print_iteration_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_iteration_info:
+    each = lazy_section("cp2k_dft_scf_print_iteration_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_iteration_info_each()
         # basic setting
         self.each.status = True
         
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -673,16 +601,12 @@ class cp2k_dft_scf_print_iteration_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END ITERATION_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_print_lanczos_each:
@@ -702,24 +626,23 @@ class cp2k_dft_scf_print_lanczos_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_lanczos:
+    each = lazy_section("cp2k_dft_scf_print_lanczos_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_lanczos_each()
         # basic setting
         self.each.status = True
         
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -728,16 +651,12 @@ class cp2k_dft_scf_print_lanczos:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END LANCZOS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_print_mos_molden_each:
     def __init__(self):
@@ -756,24 +675,23 @@ class cp2k_dft_scf_print_mos_molden_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_mos_molden:
+    each = lazy_section("cp2k_dft_scf_print_mos_molden_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_mos_molden_each()
         # basic setting
         self.each.status = True
         
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -782,16 +700,12 @@ class cp2k_dft_scf_print_mos_molden:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MOS_MOLDEN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_print_mo_magnitude_each:
@@ -811,24 +725,23 @@ class cp2k_dft_scf_print_mo_magnitude_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_mo_magnitude:
+    each = lazy_section("cp2k_dft_scf_print_mo_magnitude_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_mo_magnitude_each()
         # basic setting
         self.each.status = True
         
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -837,16 +750,12 @@ class cp2k_dft_scf_print_mo_magnitude:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MO_MAGNITUDE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_print_mo_orthonormality_each:
     def __init__(self):
@@ -865,25 +774,23 @@ class cp2k_dft_scf_print_mo_orthonormality_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_mo_orthonormality:
+    each = lazy_section("cp2k_dft_scf_print_mo_orthonormality_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_mo_orthonormality_each()
         # basic setting
         self.each.status = True
     
         self.section = "HIGHG" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -892,16 +799,12 @@ class cp2k_dft_scf_print_mo_orthonormality:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MO_ORTHONORMALITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_print_program_run_info_each:
     def __init__(self):
@@ -920,25 +823,23 @@ class cp2k_dft_scf_print_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_program_run_info:
+    each = lazy_section("cp2k_dft_scf_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_program_run_info_each()
         # basic setting
         self.each.status = True
     
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -947,16 +848,12 @@ class cp2k_dft_scf_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_print_restart_each:
@@ -976,25 +873,23 @@ class cp2k_dft_scf_print_restart_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_restart:
+    each = lazy_section("cp2k_dft_scf_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_restart_each()
         # basic setting
         self.each.status = True
     
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1003,16 +898,12 @@ class cp2k_dft_scf_print_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_scf_print_restart_history_each:
     def __init__(self):
@@ -1031,19 +922,18 @@ class cp2k_dft_scf_print_restart_history_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_restart_history:
+    each = lazy_section("cp2k_dft_scf_print_restart_history_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_restart_history_each()
         # basic setting
         self.each.status = True
     
@@ -1057,16 +947,12 @@ class cp2k_dft_scf_print_restart_history:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RESTART_HISTORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_print_total_densities_each:
@@ -1086,24 +972,23 @@ class cp2k_dft_scf_print_total_densities_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 
 class cp2k_dft_scf_print_total_densities:
+    each = lazy_section("cp2k_dft_scf_print_total_densities_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_scf_print_total_densities_each()
         # basic setting
         self.each.status = True
 
         self.section = "HIGH" # DEBUG | HIGH | LOW | MEDIUM | OFF | ON | SILENT
-    
+
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1112,40 +997,36 @@ class cp2k_dft_scf_print_total_densities:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True: 
+        if section_active(self, "each"): 
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END TOTAL_DENSITIES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_scf_print:
+    davidson = lazy_section("cp2k_dft_scf_print_davidson", "DAVIDSON")
+    detailed_energy = lazy_section("cp2k_dft_scf_print_detailed_energy", "DETAILED_ENERGY")
+    diag_sub_scf = lazy_section("cp2k_dft_scf_print_diag_sub_scf", "DIAG_SUB_SCF")
+    diis_info = lazy_section("cp2k_dft_scf_print_diis_info", "DIIS_INFO")
+    filter_matrix = lazy_section("cp2k_dft_scf_print_filter_matrix", "FILTER_MATRIX")
+    iteration_info = lazy_section("cp2k_dft_scf_print_iteration_info", "ITERATION_INFO")
+    lanczos = lazy_section("cp2k_dft_scf_print_lanczos", "LANCZOS")
+    mos_molden = lazy_section("cp2k_dft_scf_print_mos_molden", "MOS_MOLDEN")
+    mo_magnitude = lazy_section("cp2k_dft_scf_print_mo_magnitude", "MO_MAGNITUDE")
+    mo_orthonormality = lazy_section("cp2k_dft_scf_print_mo_orthonormality", "MO_ORTHONORMALITY")
+    program_run_info = lazy_section("cp2k_dft_scf_print_program_run_info", "PROGRAM_RUN_INFO")
+    restart = lazy_section("cp2k_dft_scf_print_restart", "RESTART")
+    restart_history = lazy_section("cp2k_dft_scf_print_restart_history", "RESTART_HISTORY")
+    total_densities = lazy_section("cp2k_dft_scf_print_total_densities", "TOTAL_DENSITIES")
+
     def __init__(self):
         self.params = {
                 "DM_RESTART_WRITE": None,
                 }
         self.status = False
 
-        self.davidson = cp2k_dft_scf_print_davidson()
-        self.detailed_energy = cp2k_dft_scf_print_detailed_energy()
-        self.diag_sub_scf = cp2k_dft_scf_print_diag_sub_scf()
-        self.diis_info = cp2k_dft_scf_print_diis_info()
-        self.filter_matrix = cp2k_dft_scf_print_filter_matrix()
-        self.iteration_info = cp2k_dft_scf_print_iteration_info()
-        self.lanczos = cp2k_dft_scf_print_lanczos()
-        self.mos_molden = cp2k_dft_scf_print_mos_molden()
-        self.mo_magnitude = cp2k_dft_scf_print_mo_magnitude()
-        self.mo_orthonormality = cp2k_dft_scf_print_mo_orthonormality()
-        self.program_run_info = cp2k_dft_scf_print_program_run_info()
-        self.restart = cp2k_dft_scf_print_restart()
-        self.restart_history = cp2k_dft_scf_print_restart_history()
-        self.total_densities = cp2k_dft_scf_print_total_densities()
-
         # basic setting
         self.restart.status = True
         self.restart_history.status = True
@@ -1158,100 +1039,49 @@ class cp2k_dft_scf_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.davidson.status == True:
+        if section_active(self, "davidson"):
             self.davidson.to_input(fout)
-        if self.detailed_energy.status == True:
+        if section_active(self, "detailed_energy"):
             self.detailed_energy.to_input(fout)
-        if self.diag_sub_scf.status == True:
+        if section_active(self, "diag_sub_scf"):
             self.diag_sub_scf.to_input(fout)
-        if self.diis_info.status == True:
+        if section_active(self, "diis_info"):
             self.diis_info.to_input(fout)
-        if self.filter_matrix.status == True:
+        if section_active(self, "filter_matrix"):
             self.filter_matrix.to_input(fout)
         if self.iteration_info.statu == True:
             self.iteration_info.to_input(fout)
-        if self.lanczos.status == True:
+        if section_active(self, "lanczos"):
             self.lanczos.to_input(fout)
-        if self.mos_molden.status == True:
+        if section_active(self, "mos_molden"):
             self.mos_molden.to_input(fout)
-        if self.mo_magnitude.status == True:
+        if section_active(self, "mo_magnitude"):
             self.mo_magnitude.to_input(fout)
         if self.orthonormality.status == True:
             self.orthonormality.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
-        if self.restart_history.status == True:
+        if section_active(self, "restart_history"):
             self.restart_history.to_input(fout)
-        if self.total_densities.status == True:
+        if section_active(self, "total_densities"):
             self.total_densities.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params: 
-            if len(item.split("-")) == 4:
-                if item.split("-")[3] == "DAVIDSON":
-                    self.davidson.section = params[item]
-                elif item.split("-")[3] == "DETAILED_ENERGY":
-                    self.detailed_energy.section = params[item]
-                elif item.split("-")[3] == "DIAG_SUB_SCF":
-                    self.diag_sub_scf.section = params[item]
-                elif item.split("-")[3] == "DIIS_INFO":
-                    self.diis_info.section = params[item]
-                elif item.split("-")[3] == "FILTER_MATRIX":
-                    self.filter_matrix.section = params[item]
-                elif item.split("-")[3] == "ITERATION_INFO":
-                    sel.fiteration_info.section = params[item]
-                elif item.split("-")[3] == "LANCZOS":
-                    self.lanczos.section = params[item]
-                elif item.split("-")[3] == "MOS_MOLDEN":
-                    self.mos_molden.section = params[item]
-                elif item.split("-")[3] == "MO_MAGNITUDE":
-                    self.mo_magnitude.section = params[item]
-                elif item.split("-")[3] == "MO_ORTHONORMALITY":
-                    self.mo_orthonormality.section = params[item]
-                elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                    self.program_run_info.section = params[item]
-                elif item.split("-")[3] == "RESTART":
-                    self.restart.section = params[item]
-                elif item.split("-")[3] == "RESTART_HISTORY":
-                    self.restart_history.section = params[item]
-                elif item.split("-")[3] == "TOTAL_DENSITIES":
-                    self.total_densities.section = params[item]
-                else:
-                    self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DAVIDSON":
-                self.dividson.set_params({item: params[item]})
-            elif item.split("-")[3] == "DETAILED_ENERGY":
-                self.detailed_energy.set_params({item: params[item]})
-            elif item.split("-")[3] == "DIAG_SUB_SCF":
-                self.diag_sub_scf.set_params({item: params[item]})
-            elif item.split("-")[3] == "DIIS_INFO":
-                self.diis_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "FILTER_MATRIX":
-                self.filter_matrix.set_params({item: params[item]})
-            elif item.split("-")[3] == "ITERATION_INFO":
-                self.iteration_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "LANCZOS":
-                self.lanczos.set_params({item: params[item]})
-            elif item.split("-")[3] == "MOS_MOLDEN":
-                self.mos_molden.set_params({item: params[item]})
-            elif item.split("-")[3] == "MO_MAGNITUDE":
-                self.mo_magnitude.set_params({item: params[item]})
-            elif item.split("-")[3] == "MO_ORTHONORMALITY":
-                self.mo_orthonormality.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            elif item.split("-")[3] == "RESTART_HISTORY":
-                self.restart_history.set_params({item: params[item]})
-            elif item.split("-")[3] == "TOTAL_DENSITIES":
-                self.total_densities.set_params({item: params[item]})
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_scf:
+    diagonalization = lazy_section("cp2k_dft_scf_diagonalization", "DIAGONALIZATION")
+    ot = lazy_section("cp2k_dft_scf_ot", "OT")
+    mom = lazy_section("cp2k_dft_scf_mom", "MOM")
+    mixing = lazy_section("cp2k_dft_scf_mixing", "MIXING")
+    smear = lazy_section("cp2k_dft_scf_smear", "SMEAR")
+    printout = lazy_section("cp2k_dft_scf_print", "PRINT")
+    outer_scf = lazy_section("cp2k_dft_scf_outer_scf", "OUTER_SCF")
+
     def __init__(self):
         self.params = {
                 "ADDED_MOS": 20,
@@ -1265,14 +1095,6 @@ class cp2k_dft_scf:
                 }
         self.status = False
 
-        self.diagonalization = cp2k_dft_scf_diagonalization()
-        self.ot = cp2k_dft_scf_ot()
-        self.mom = cp2k_dft_scf_mom()
-        self.mixing = cp2k_dft_scf_mixing()
-        self.smear = cp2k_dft_scf_smear()
-        self.printout = cp2k_dft_scf_print()
-        self.outer_scf = cp2k_dft_scf_outer_scf()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1311,36 +1133,11 @@ class cp2k_dft_scf:
         if self.outer_scf.section != None and self.outer_scf.section.upper() == "TRUE":
             self.outer_scf.to_input(fout)
 
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t&END SCF\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                if item.split("-")[-1] == "SMEAR":
-                    self.smear.section = params[item]
-                elif item.split("-")[-1] == "DIAGONALIZATION":
-                    self.diagonalization.section = params[item]
-                elif item.split("-")[-1] == "OT":
-                    self.ot.section = params[item]
-                elif item.split("-")[-1] == "OUTER_SCF":
-                    self.outer_scf.section = params[item]
-                elif item.split("-")[-1] == "MOM":
-                    self.mom.section = params[item]
-                elif item.split("-")[-1] == "MIXING":
-                    self.mixing.section = params[item]
-                else:
-                    self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DIAGONALIZATION":
-                self.diagonalization.set_params({item: params[item]})
-            elif item.split("-")[2] == "OT":
-                self.ot.set_params({item: params[item]})
-            elif item.split("-")[2] == "MIXING":
-                self.mixing.set_params({item: params[item]})
-            elif item.split("-")[2] == "SMEAR" and len(item.split("-")) > 3:
-                self.smear.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
+        route_params(self, params, level=2)
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ===================
 # ===================
 
@@ -21,19 +23,15 @@ class cp2k_dft_scrf_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_scrf_program_run_info:
+    each = lazy_section("cp2k_dft_scrf_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_dft_scrf_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -44,19 +42,13 @@ class cp2k_dft_scrf_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_scrf_sphere_center:
     def __init__(self):
@@ -75,19 +67,15 @@ class cp2k_dft_scrf_sphere_center:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_scrf_sphere:
+    center = lazy_section("cp2k_dft_scrf_sphere_center", "CENTER")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.center = cp2k_dft_scrf_sphere_center()
-
         # basic setting
 
     def to_input(self, fout):
@@ -98,29 +86,23 @@ class cp2k_dft_scrf_sphere:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.center.status == True:
+        if section_active(self, "center"):
             self.center.to_input(fout)
         fout.write("\t\t\t&END SPHERE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CENTER":
-                self.center.set_params({item: parmas[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_scrf:
+    program_run_info = lazy_section("cp2k_dft_scrf_program_run_info", "PROGRAM_RUN_INFO")
+    sphere = lazy_section("cp2k_dft_scrf_sphere", "SPHERE")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.program_run_info = cp2k_dft_scrf_program_run_info()
-        self.sphere = cp2k_dft_scrf_sphere()
-
         # basic setting
 
     def to_input(self, fout):
@@ -131,21 +113,13 @@ class cp2k_dft_scrf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.sphere.status == True:
+        if section_active(self, "sphere"):
             self.sphere.to_input(fout)
         fout.write("\t\t&END SCRF\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPHERE":
-                self.sphere.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
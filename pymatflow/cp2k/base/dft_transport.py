@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ==============================
 # ==============================
 
@@ -23,11 +25,7 @@ class cp2k_dft_transport_beyn:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_transport_contact:
     def __init__(self):
@@ -47,11 +45,7 @@ class cp2k_dft_transport_contact:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_transport_pexsi:
@@ -72,11 +66,7 @@ class cp2k_dft_transport_pexsi:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_transport_print_current_each:
     def __init__(self):
@@ -96,20 +86,16 @@ class cp2k_dft_transport_print_current_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_transport_print_current:
+    each = lazy_section("cp2k_dft_transport_print_current_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_dft_transport_print_current_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -120,29 +106,23 @@ class cp2k_dft_transport_print_current:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END CURRENT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_transport_print:
+    current = lazy_section("cp2k_dft_transport_print_current", "CURRENT")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.current = cp2k_dft_transport_print_current()
-
         # basic setting
 
     def to_input(self, fout):
@@ -153,34 +133,28 @@ class cp2k_dft_transport_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.current.status == True:
+        if section_active(self, "current"):
             self.current.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CURRENT":
-                self.current.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
 class cp2k_dft_transport:
+    beyn = lazy_section("cp2k_dft_transport_beyn", "BEYN")
+    contact = lazy_section("cp2k_dft_transport_contact", "CONTACT")
+    pexsi = lazy_section("cp2k_dft_transport_pexsi", "PEXSI")
+    printout = lazy_section("cp2k_dft_transport_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 "TRANSPORT_METHOD": None,
                 }       
         self.status = False
 
-        self.beyn = cp2k_dft_transport_beyn()
-        self.contact = cp2k_dft_transport_contact()
-        self.pexsi = cp2k_dft_transport_pexsi()
-        self.printout = cp2k_dft_transport_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -191,28 +165,16 @@ class cp2k_dft_transport:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.beyn.status == True:
+        if section_active(self, "beyn"):
             self.beyn.to_input(fout)
-        if self.contact.status == True:
+        if section_active(self, "contact"):
             self.contact.to_input(fout)
-        if self.pexsi.status == True:
+        if section_active(self, "pexsi"):
             self.pexsi.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t&END TRANSPORT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BEYN":
-                self.beyn.set_params({item: params[item]})
-            elif item.split("-")[2] == "CONTACT":
-                self.contact.set_params({item: params[item]})
-            elif item.split("-")[2] == "PEXSI":
-                self.pexsi.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ==============================
 # ==============================
 
@@ -22,20 +24,16 @@ class cp2k_dft_xas_localize_print_loc_restart_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_localize_print_loc_restart:
+    each = lazy_section("cp2k_dft_xas_localize_print_loc_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_loc_restart_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -46,19 +44,13 @@ class cp2k_dft_xas_localize_print_loc_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END LOC_RESTART\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_localize_print_molecular_dipoles_each:
     def __init__(self):
@@ -78,23 +70,18 @@ class cp2k_dft_xas_localize_print_molecular_dipoles_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_localize_print_molecular_dipoles:
+    each = lazy_section("cp2k_dft_xas_localize_print_molecular_dipoles_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_molecular_dipoles_each()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -103,19 +90,13 @@ class cp2k_dft_xas_localize_print_molecular_dipoles:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END MOLECULAR_DIPOLES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_localize_print_molecular_states_cubes_each:
@@ -136,20 +117,16 @@ class cp2k_dft_xas_localize_print_molecular_states_cubes_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_xas_localize_print_molecular_states_cubes:
+    each = lazy_section("cp2k_dft_xas_localize_print_molecular_states_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_molecular_states_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -160,19 +137,13 @@ class cp2k_dft_xas_localize_print_molecular_states_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END CUBES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_localize_print_molecular_states_each:
@@ -193,21 +164,17 @@ class cp2k_dft_xas_localize_print_molecular_states_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_localize_print_molecular_states:
+    cubes = lazy_section("cp2k_dft_xas_localize_print_molecular_states_cubes", "CUBES")
+    each = lazy_section("cp2k_dft_xas_localize_print_molecular_states_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cubes = cp2k_dft_xas_localize_print_molecular_states_cubes()
-        self.each = cp2k_dft_xas_localize_print_molecular_states_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -218,23 +185,15 @@ class cp2k_dft_xas_localize_print_molecular_states:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cubes.status == True:
+        if section_active(self, "cubes"):
             self.cubes.to_input(fout)
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END MOLECULAR_STATES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "CUBES":
-                self.cubes.set_params({item: params[item]})
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_localize_print_program_run_info_each:
     def __init__(self):
@@ -254,21 +213,17 @@ class cp2k_dft_xas_localize_print_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_localize_print_program_run_info:
+    each = lazy_section("cp2k_dft_xas_localize_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -279,19 +234,13 @@ class cp2k_dft_xas_localize_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_localize_print_total_dipole_each:
     def __init__(self):
@@ -311,21 +260,17 @@ class cp2k_dft_xas_localize_print_total_dipole_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_localize_print_total_dipole:
+    each = lazy_section("cp2k_dft_xas_localize_print_total_dipole_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_total_dipole_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -336,19 +281,13 @@ class cp2k_dft_xas_localize_print_total_dipole:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END TOTAL_DIPOLE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_localize_print_wannier_centers_each:
     def __init__(self):
@@ -368,21 +307,17 @@ class cp2k_dft_xas_localize_print_wannier_centers_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_localize_print_wannier_centers:
+    each = lazy_section("cp2k_dft_xas_localize_print_wannier_centers_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_wannier_centers_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -393,19 +328,13 @@ class cp2k_dft_xas_localize_print_wannier_centers:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END WANNIER_CENTERS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: parmas[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_localize_print_wannier_cubes_each:
@@ -426,21 +355,17 @@ class cp2k_dft_xas_localize_print_wannier_cubes_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_localize_print_wannier_cubes:
+    each = lazy_section("cp2k_dft_xas_localize_print_wannier_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_wannier_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -451,19 +376,13 @@ class cp2k_dft_xas_localize_print_wannier_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END WANNIER_CUBES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_localize_print_wannier_spreads_each:
     def __init__(self):
@@ -483,20 +402,16 @@ class cp2k_dft_xas_localize_print_wannier_spreads_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_localize_print_wannier_spreads:
+    each = lazy_section("cp2k_dft_xas_localize_print_wannier_spreads_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_wannier_spreads_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -507,19 +422,13 @@ class cp2k_dft_xas_localize_print_wannier_spreads:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END WANNIER_SPREADS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_localize_print_wannier_states_cubes_each:
     def __init__(self):
@@ -539,21 +448,17 @@ class cp2k_dft_xas_localize_print_wannier_states_cubes_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_dft_xas_localize_print_wannier_states_cubes:
+    each = lazy_section("cp2k_dft_xas_localize_print_wannier_states_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_localize_print_wannier_states_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -564,19 +469,13 @@ class cp2k_dft_xas_localize_print_wannier_states_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END CUBES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.splti("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_localize_print_wannier_states_each:
     def __init__(self):
@@ -596,21 +495,17 @@ class cp2k_dft_xas_localize_print_wannier_states_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_localize_print_wannier_states:
+    cubes = lazy_section("cp2k_dft_xas_localize_print_wannier_states_cubes", "CUBES")
+    each = lazy_section("cp2k_dft_xas_localize_print_wannier_states_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cubes = cp2k_dft_xas_localize_print_wannier_states_cubes()
-        self.each = cp2k_dft_xas_localize_print_wannier_states_each()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -621,40 +516,32 @@ class cp2k_dft_xas_localize_print_wannier_states:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cubes.status == True:
+        if section_active(self, "cubes"):
             self.cubes.to_input(fout)
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END WANIER_STATES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "CUBES":
-                self.cubes.set_params({item: params[item]})
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_localize_print:
+    loc_restart = lazy_section("cp2k_dft_xas_localize_print_loc_restart", "LOC_RESTART")
+    molecular_dipoles = lazy_section("cp2k_dft_xas_localize_print_molecular_dipoles", "MOLECULAR_DIPOLES")
+    molecular_states = lazy_section("cp2k_dft_xas_localize_print_molecular_states", "MOLECULAR_STATES")
+    program_run_info = lazy_section("cp2k_dft_xas_localize_print_program_run_info", "PROGRAM_RUN_INFO")
+    total_dipole = lazy_section("cp2k_dft_xas_localize_print_total_dipole", "TOTAL_DIPOLE")
+    wannier_centers = lazy_section("cp2k_dft_xas_localize_print_wannier_centers", "WANNIER_CENTERS")
+    wannier_cubes = lazy_section("cp2k_dft_xas_localize_print_wannier_cubes", "WANNIER_CUBES")
+    wannier_spreads = lazy_section("cp2k_dft_xas_localize_print_wannier_spreads", "WANNIER_SPREADS")
+    wannier_states = lazy_section("cp2k_dft_xas_localize_print_wannier_states", "WANNIER_STATES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.loc_restart = cp2k_dft_xas_localize_print_loc_restart()
-        self.molecular_dipoles = cp2k_dft_xas_localize_print_molecular_dipoles()
-        self.molecular_states = cp2k_dft_xas_localize_print_molecular_states()
-        self.program_run_info = cp2k_dft_xas_localize_print_program_run_info()
-        self.total_dipole = cp2k_dft_xas_localize_print_total_dipole()
-        self.wannier_centers = cp2k_dft_xas_localize_print_wannier_centers()
-        self.wannier_cubes = cp2k_dft_xas_localize_print_wannier_cubes()
-        self.wannier_spreads = cp2k_dft_xas_localize_print_wannier_spreads()
-        self.wannier_states = cp2k_dft_xas_localize_print_wannier_states()
-
         # basic setting
 
     def to_input(self, fout):
@@ -665,60 +552,38 @@ class cp2k_dft_xas_localize_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.loc_restart.status == True:
+        if section_active(self, "loc_restart"):
             self.loc_restart.to_input(fout)
-        if self.molecular_dipoles.status == True:
+        if section_active(self, "molecular_dipoles"):
             self.molecular_dipoles.to_input(fout)
-        if self.molecular_states.status == True:
+        if section_active(self, "molecular_states"):
             self.molecular_states.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.total_dipole.status == True:
+        if section_active(self, "total_dipole"):
             self.total_dipole.to_input(fout)
-        if self.wannier_centers.status == True:
+        if section_active(self, "wannier_centers"):
             self.wannier_centers.to_input(fout)
-        if self.wannier_cubes.status == True:
+        if section_active(self, "wannier_cubes"):
             self.wannier_cubes.to_input(fout)
-        if self.wannier_spreads.status == True:
+        if section_active(self, "wannier_spreads"):
             self.wannier_spreads.to_input(fout)
-        if self.wannier_states.status == True:
+        if section_active(self, "wannier_states"):
             self.wannier_states.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "LOC_RESTART":
-                self.loc_restart.set_params({item: params[item]})
-            elif item.split("-")[4] == "MOLECULAR_DIPOLES":
-                self.molecular_dipoles.set_params({item: params[item]})
-            elif item.split("-")[4] == "MOLECULAR_STATES":
-                self.molecular_states.set_params({item: params[item]})
-            elif item.split("-")[4] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[4] == "TOTAL_DIPOLE":
-                self.total_dipole.set_params({item: params[item]})
-            elif item.split("-")[4] == "WANNIER_CENTERS":
-                self.wannier_centers.set_params({item: params[item]})
-            elif item.split("-")[4] == "WANNIER_CUBES":
-                self.wannier_cubes.set_params({item: params[item]})
-            elif item.split("-")[4] == "WANNIER_SPREADS":
-                self.wannier_spreads.set_params({item: params[item]})
-            elif item.split("-")[4] == "WANNIER_STATES":
-                self.wannier_states.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_localize:
+    printout = lazy_section("cp2k_dft_xas_localize_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_dft_xas_localize_print()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -729,19 +594,13 @@ class cp2k_dft_xas_localize:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t&END LOCALIZE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_xas_print_cls_function_cubes_each:
@@ -762,21 +621,17 @@ class cp2k_dft_xas_print_cls_function_cubes_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_print_cls_function_cubes:
+    each = lazy_section("cp2k_dft_xas_print_cls_function_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_cls_function_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -787,19 +642,13 @@ class cp2k_dft_xas_print_cls_function_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END CLS_FUNCTION_CUBES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xas_print_iteration_info_each:
@@ -820,20 +669,16 @@ class cp2k_dft_xas_print_iteration_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_print_iteration_info:
+    each = lazy_section("cp2k_dft_xas_print_iteration_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_iteration_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -844,19 +689,13 @@ class cp2k_dft_xas_print_iteration_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END ITERATION_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xas_print_loc_restart_each:
@@ -877,21 +716,17 @@ class cp2k_dft_xas_print_loc_restart_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_print_loc_restart:
+    each = lazy_section("cp2k_dft_xas_print_loc_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_loc_restart_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -902,19 +737,13 @@ class cp2k_dft_xas_print_loc_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END LOC_RESTART\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_print_pdos_each:
     def __init__(self):
@@ -934,11 +763,7 @@ class cp2k_dft_xas_print_pdos_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_print_pdos_ldos:
     def __init__(self):
@@ -958,11 +783,7 @@ class cp2k_dft_xas_print_pdos_ldos:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_print_pdos_r_ldos:
     def __init__(self):
@@ -982,23 +803,19 @@ class cp2k_dft_xas_print_pdos_r_ldos:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_print_pdos:
+    each = lazy_section("cp2k_dft_xas_print_pdos_each", "EACH")
+    ldos = lazy_section("cp2k_dft_xas_print_pdos_ldos", "LDOS")
+    r_ldos = lazy_section("cp2k_dft_xas_print_pdos_r_ldos", "R_LDOS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_dft_xas_print_pdos_each()
-        self.ldos = cp2k_dft_xas_print_pdos_ldos()
-        self.r_ldos = cp2k_dft_xas_print_pdos_r_ldos()
-
         # basic seting
 
     def to_input(self, fout):
@@ -1009,27 +826,17 @@ class cp2k_dft_xas_print_pdos:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
-        if self.ldos.status == True:
+        if section_active(self, "ldos"):
             self.ldos.to_input(fout)
-        if self.r_ldos.status == True:
+        if section_active(self, "r_ldos"):
             sel.fr_ldos.to_input(fout)  
         fout.write("\t\t\t\t&END PDOS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            elif item.split("-")[4] == "LDOS":
-                self.ldos.set_params({item: params[item]})
-            elif item.split("-")[4] == "R_LDOS":
-                self.r_ldos.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xas_print_program_run_info_each:
@@ -1050,21 +857,17 @@ class cp2k_dft_xas_print_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_print_program_run_info:
+    eacj = lazy_section("cp2k_dft_xas_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.eacj = cp2k_dft_xas_print_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1081,13 +884,7 @@ class cp2k_dft_xas_print_program_run_info:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == True:
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xas_print_restart_each:
@@ -1108,21 +905,17 @@ class cp2k_dft_xas_print_restart_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_print_restart:
+    each = lazy_section("cp2k_dft_xas_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_restart_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1133,19 +926,13 @@ class cp2k_dft_xas_print_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RESTART\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_print_wannier_centers_each:
     def __init__(self):
@@ -1165,21 +952,17 @@ class cp2k_dft_xas_print_wannier_centers_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_print_wannier_centers:
+    each = lazy_section("cp2k_dft_xas_print_wannier_centers_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_wannier_centers_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1190,19 +973,13 @@ class cp2k_dft_xas_print_wannier_centers:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WANNIER_CENTERS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_print_wannier_cubes_each:
     def __init__(self):
@@ -1222,20 +999,16 @@ class cp2k_dft_xas_print_wannier_cubes_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_print_wannier_cubes:
+    each = lazy_section("cp2k_dft_xas_print_wannier_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_wannier_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1246,19 +1019,13 @@ class cp2k_dft_xas_print_wannier_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WANNIER_CUBES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_print_wannier_spreads_each:
     def __init__(self):
@@ -1278,21 +1045,17 @@ class cp2k_dft_xas_print_wannier_spreads_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_print_wannier_spreads:
+    each = lazy_section("cp2k_dft_xas_print_wannier_spreads_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_wannier_spreads_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1303,19 +1066,13 @@ class cp2k_dft_xas_print_wannier_spreads:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WANNIER_SPREADS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xas_print_xas_spectrum_each:
@@ -1336,20 +1093,16 @@ class cp2k_dft_xas_print_xas_spectrum_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_print_xas_spectrum:
+    each = lazy_section("cp2k_dft_xas_print_xas_spectrum_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_xas_spectrum_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1360,19 +1113,13 @@ class cp2k_dft_xas_print_xas_spectrum:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END XAS_SPECTRUM\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xas_print_xes_spectrum_each:
@@ -1393,21 +1140,17 @@ class cp2k_dft_xas_print_xes_spectrum_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_print_xes_spectrum:
+    each = lazy_section("cp2k_dft_xas_print_xes_spectrum_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_print_xes_spectrum_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1418,38 +1161,32 @@ class cp2k_dft_xas_print_xes_spectrum:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END XES_SPECTRUM\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_print:
+    cls_function_cubes = lazy_section("cp2k_dft_xas_print_cls_function_cubes", "CLS_FUNCTION_CUBES")
+    iteration_info = lazy_section("cp2k_dft_xas_print_iteration_info", "ITERATION_INFO")
+    loc_restart = lazy_section("cp2k_dft_xas_print_loc_restart", "LOC_RESTART")
+    pdos = lazy_section("cp2k_dft_xas_print_pdos", "PDOS")
+    program_run_info = lazy_section("cp2k_dft_xas_print_program_run_info", "PROGRAM_RUN_INFO")
+    restart = lazy_section("cp2k_dft_xas_print_restart", "RESTART")
+    wanier_centers = lazy_section("cp2k_dft_xas_print_wannier_centers", "WANNIER_CENTERS")
+    wannier_cubes = lazy_section("cp2k_dft_xas_print_wannier_cubes", "WANNIER_CUBES")
+    wannier_spreads = lazy_section("cp2k_dft_xas_print_wannier_spreads", "WANNIER_SPREADS")
+    xas_spectrum = lazy_section("cp2k_dft_xas_print_xas_spectrum", "XAS_SPECTRUM")
+    xes_spectrum = lazy_section("cp2k_dft_xas_print_xes_spectrum", "XES_SPECTRUM")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cls_function_cubes = cp2k_dft_xas_print_cls_function_cubes()
-        self.iteration_info = cp2k_dft_xas_print_iteration_info()
-        self.loc_restart = cp2k_dft_xas_print_loc_restart()
-        self.pdos = cp2k_dft_xas_print_pdos()
-        self.program_run_info = cp2k_dft_xas_print_program_run_info()
-        self.restart = cp2k_dft_xas_print_restart()
-        self.wanier_centers = cp2k_dft_xas_print_wannier_centers()
-        self.wannier_cubes = cp2k_dft_xas_print_wannier_cubes()
-        self.wannier_spreads = cp2k_dft_xas_print_wannier_spreads()
-        self.xas_spectrum = cp2k_dft_xas_print_xas_spectrum()
-        self.xes_spectrum = cp2k_dft_xas_print_xes_spectrum()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1460,59 +1197,33 @@ class cp2k_dft_xas_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cls_function_cubes.status == True:
+        if section_active(self, "cls_function_cubes"):
             self.cls_function_cubes.to_input(fout)
-        if self.iteration_info.status == True:
+        if section_active(self, "iteration_info"):
             self.iteration_info.to_input(fout)
-        if self.loc_restart.status == True:
+        if section_active(self, "loc_restart"):
             self.loc_restart.to_input(fout)
-        if self.pdos.status == True:
+        if section_active(self, "pdos"):
             self.pdos.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
         if self.wannier_centers.status == True:
             self.wannier_centers.to_input(fout)
-        if self.wannier_cubes.status == True:
+        if section_active(self, "wannier_cubes"):
             self.waniner_cubes.to_input(fout)
-        if self.wannier_spreads.status == True:
+        if section_active(self, "wannier_spreads"):
             self.wannier_spreads.to_input(fout)
-        if self.xas_spectrum.status == True:
+        if section_active(self, "xas_spectrum"):
             self.xas_spectrum.to_input(fout)
-        if self.xes_spectrum.status == True:
+        if section_active(self, "xes_spectrum"):
             self.xes_spectrum.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CLS_FUNCTION_CUBES":
-                self.cls_function_cubes.set_params({item: params[item]})
-            elif item.split("-")[3] == "ITERATION_INFO":
-                self.iteration_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "LOC_RESTART":
-                self.loc_restart.set_params({item: params[item]})
-            elif item.split("-")[3] == "PDOS":
-                self.pdos.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            elif item.split("-")[3] == "WANNIER_CENTERS":
-                self.wannier_centers.set_params({item: params[item]})
-            elif item.split("-")[3] == "WANNIER_CUBES":
-                self.wannier_cubes.set_params({item: params[item]})
-            elif item.split("-")[3] == "WANNIER_SPREADS":
-                self.wannier_spreads.set_params({item: params[item]})
-            elif item.split("-")[3] == "XAS_SPECTRUM":
-                self.xas_spectrum.set_params({item: params[item]})
-            elif item.split("-")[3] == "XES_SPECTRUM":
-                self.xes_spectrum.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_xas_scf_diagonalization_davidson:
@@ -1533,11 +1244,7 @@ class cp2k_dft_xas_scf_diagonalization_davidson:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_diagonalization_diag_sub_scf_mixing:
     def __init__(self):
@@ -1557,21 +1264,17 @@ class cp2k_dft_xas_scf_diagonalization_diag_sub_scf_mixing:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_diagonalization_diag_sub_scf:
+    mixing = lazy_section("cp2k_dft_xas_scf_diagonalization_diag_sub_scf_mixing", "MIXING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.mixing = cp2k_dft_xas_scf_diagonalization_diag_sub_scf_mixing()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1582,19 +1285,13 @@ class cp2k_dft_xas_scf_diagonalization_diag_sub_scf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.mixing.status == True:
+        if section_active(self, "mixing"):
             self.mixing.to_input(fout)
         fout.write("\t\t\t\t\t&END DIAG_SUB_SCF\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "MIXING":
-                self.mixing.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_diagonalization_filter_matrix:
     def __init__(self):
@@ -1614,11 +1311,7 @@ class cp2k_dft_xas_scf_diagonalization_filter_matrix:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_diagonalization_krylov:
     def __init__(self):
@@ -1638,11 +1331,7 @@ class cp2k_dft_xas_scf_diagonalization_krylov:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_diagonalization_ot:
     def __init__(self):
@@ -1662,24 +1351,20 @@ class cp2k_dft_xas_scf_diagonalization_ot:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_diagonalization:
+    davidson = lazy_section("cp2k_dft_xas_scf_diagonalization_davidson", "DAVIDSON")
+    diag_sub_scf = lazy_section("cp2k_dft_xas_scf_diagonalization_diag_sub_scf", "DIAG_SUB_SCF")
+    filter_matrix = lazy_section("cp2k_dft_xas_scf_diagonalization_filter_matrix", "FILTER_MATRIX")
+    krylov = lazy_section("cp2k_dft_xas_scf_diagonalization_krylov", "KRYLOV")
+    ot = lazy_section("cp2k_dft_xas_scf_diagonalization_ot", "OT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.davidson = cp2k_dft_xas_scf_diagonalization_davidson()
-        self.diag_sub_scf = cp2k_dft_xas_scf_diagonalization_diag_sub_scf()
-        self.filter_matrix = cp2k_dft_xas_scf_diagonalization_filter_matrix()
-        self.krylov = cp2k_dft_xas_scf_diagonalization_krylov()
-        self.ot = cp2k_dft_xas_scf_diagonalization_ot()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1690,35 +1375,21 @@ class cp2k_dft_xas_scf_diagonalization:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.davidson.status == True:
+        if section_active(self, "davidson"):
             self.davidson.to_input(fout)
-        if self.diag_sub_scf.status == True:
+        if section_active(self, "diag_sub_scf"):
             self.diag_sub_scf.to_input(fout)
-        if self.filter_matrix.status == True:
+        if section_active(self, "filter_matrix"):
             self.filter_matrix.to_input(fout)
-        if self.krylov.status == True:
+        if section_active(self, "krylov"):
             self.krylov.to_input(fout)
-        if self.ot.status == True:
+        if section_active(self, "ot"):
             self.ot.to_input(fout)
         fout.write("\t\t\t\t&END DIAGONALIZATION\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "DAVIDSON":
-                self.davidson.set_params({item: params[item]})
-            elif item.split("-")[4] == "DAIG_SUB_SCF":
-                self.diag_sub_scf.set_params({item: params[item]})
-            elif item.split("-")[4] == "FILTER_MATRIX":
-                self.filter_matrix.set_params({item: params[item]})
-            elif item.split("-")[4] == "KRYLOV":
-                self.krylov.set_params({item: params[item]})
-            elif item.split("-")[4] == "OT":
-                self.ot.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_scf_mixing:
     def __init__(self):
@@ -1738,11 +1409,7 @@ class cp2k_dft_xas_scf_mixing:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_scf_mom:
     def __init__(self):
@@ -1762,11 +1429,7 @@ class cp2k_dft_xas_scf_mom:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_scf_ot:
     def __init__(self):
@@ -1786,11 +1449,7 @@ class cp2k_dft_xas_scf_ot:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xas_scf_outer_scf_cdft_opt:
@@ -1811,21 +1470,17 @@ class cp2k_dft_xas_scf_outer_scf_cdft_opt:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_scf_outer_scf:
+    cdft_opt = lazy_section("cp2k_dft_xas_scf_outer_scf_cdft_opt", "CDFT_OPT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cdft_opt = cp2k_dft_xas_scf_outer_scf_cdft_opt()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -1836,19 +1491,13 @@ class cp2k_dft_xas_scf_outer_scf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cdft_opt.status == True:
+        if section_active(self, "cdft_opt"):
             self.cdft_opt.to_input(fout)
         fout.write("\t\t\t\t&END OUTER_SCF\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CDFT_OPT":
-                self.cdft_opt.set_params({item: prams[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xas_scf_print_davidson_each:
@@ -1869,20 +1518,16 @@ class cp2k_dft_xas_scf_print_davidson_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_scf_print_davidson:
+    each = lazy_section("cp2k_dft_xas_scf_print_davidson_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_dft_xas_scf_print_davidson_each()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -1893,19 +1538,13 @@ class cp2k_dft_xas_scf_print_davidson:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END DAVIDSON\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_detailed_energy_each:
     def __init__(self):
@@ -1925,20 +1564,16 @@ class cp2k_dft_xas_scf_print_detailed_energy_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_scf_print_detailed_energy:
+    each = lazy_section("cp2k_dft_xas_scf_print_detailed_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_detailed_energy_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1949,19 +1584,13 @@ class cp2k_dft_xas_scf_print_detailed_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END DETAILED_ENERGY\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_diag_sub_scf_each:
     def __init__(self):
@@ -1981,21 +1610,17 @@ class cp2k_dft_xas_scf_print_diag_sub_scf_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_diag_sub_scf:
+    each = lazy_section("cp2k_dft_xas_scf_print_diag_sub_scf_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_diag_sub_scf_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2006,19 +1631,13 @@ class cp2k_dft_xas_scf_print_diag_sub_scf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END DIAG_SUB_SCF\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_scf_print_diis_info_each:
@@ -2039,11 +1658,7 @@ class cp2k_dft_xas_scf_print_diis_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_diis_info:
@@ -2070,13 +1685,7 @@ class cp2k_dft_xas_scf_print_diis_info:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_filter_matrix_each:
     def __init__(self):
@@ -2096,21 +1705,17 @@ class cp2k_dft_xas_scf_print_filter_matrix_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_filter_matrix:
+    each = lazy_section("cp2k_dft_xas_scf_print_filter_matrix_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_filter_matrix_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2121,19 +1726,13 @@ class cp2k_dft_xas_scf_print_filter_matrix:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END FILTER_MATRIX\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_iteration_info_each:
     def __init__(self):
@@ -2153,21 +1752,17 @@ class cp2k_dft_xas_scf_print_iteration_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_iteration_info:
+    each = lazy_section("cp2k_dft_xas_scf_print_iteration_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_iteration_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2178,19 +1773,13 @@ class cp2k_dft_xas_scf_print_iteration_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ITERATION_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_scf_print_lanczos_each:
@@ -2211,21 +1800,17 @@ class cp2k_dft_xas_scf_print_lanczos_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_lanczos:
+    each = lazy_section("cp2k_dft_xas_scf_print_lanczos_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_lanczos_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2236,19 +1821,13 @@ class cp2k_dft_xas_scf_print_lanczos:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END LANCZOS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_mos_molden_each:
     def __init__(self):
@@ -2268,21 +1847,17 @@ class cp2k_dft_xas_scf_print_mos_molden_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_mos_molden:
+    each = lazy_section("cp2k_dft_xas_scf_print_mos_molden_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_mos_molden_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2293,19 +1868,13 @@ class cp2k_dft_xas_scf_print_mos_molden:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END MOS_MOLDEN\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_mo_magnitude_each:
     def __init__(self):
@@ -2325,21 +1894,17 @@ class cp2k_dft_xas_scf_print_mo_magnitude_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_mo_magnitude:
+    each = lazy_section("cp2k_dft_xas_scf_print_mo_magnitude_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_mo_magnitude_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2350,19 +1915,13 @@ class cp2k_dft_xas_scf_print_mo_magnitude:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END MO_MAGNITUDE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xas_scf_print_mo_orthonormality_each:
@@ -2383,21 +1942,17 @@ class cp2k_dft_xas_scf_print_mo_orthonormality_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_mo_orthonormality:
+    each = lazy_section("cp2k_dft_xas_scf_print_mo_orthonormality_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_mo_orthonormality_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2408,19 +1963,13 @@ class cp2k_dft_xas_scf_print_mo_orthonormality:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ORTHONORMALITY\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_program_run_info_each:
     def __init__(self):
@@ -2442,21 +1991,16 @@ class cp2k_dft_xas_scf_print_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xas_scf_print_program_run_info:
+    each = lazy_section("cp2k_dft_xas_scf_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-
-        self.each = cp2k_dft_xas_scf_print_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2467,19 +2011,13 @@ class cp2k_dft_xas_scf_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_restart_each:
     def __init__(self):
@@ -2499,21 +2037,17 @@ class cp2k_dft_xas_scf_print_restart_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_restart:
+    each = lazy_section("cp2k_dft_xas_scf_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_restart_each()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -2522,19 +2056,13 @@ class cp2k_dft_xas_scf_print_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END RESTART\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_restart_history_each:
     def __init__(self):
@@ -2554,21 +2082,17 @@ class cp2k_dft_xas_scf_print_restart_history_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_restart_history:
+    each = lazy_section("cp2k_dft_xas_scf_print_restart_history_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_restart_history_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2579,19 +2103,13 @@ class cp2k_dft_xas_scf_print_restart_history:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END RESTART_HISTORY\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print_total_densities_each:
     def __init__(self):
@@ -2611,21 +2129,17 @@ class cp2k_dft_xas_scf_print_total_densities_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xas_scf_print_total_densities:
+    each = lazy_section("cp2k_dft_xas_scf_print_total_densities_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xas_scf_print_total_densities_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2636,41 +2150,35 @@ class cp2k_dft_xas_scf_print_total_densities:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END TOTAL_DENSITIES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({ietm: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xas_scf_print:
+    davidson = lazy_section("cp2k_dft_xas_scf_print_davidson", "DAVIDSON")
+    detailed_energy = lazy_section("cp2k_dft_xas_scf_print_detailed_energy", "DETAILED_ENERGY")
+    diag_sub_scf = lazy_section("cp2k_dft_xas_scf_print_diag_sub_scf", "DIAG_SUB_SCF")
+    diis_info = lazy_section("cp2k_dft_xas_scf_print_diis_info", "DIIS_INFO")
+    filter_matrix = lazy_section("cp2k_dft_xas_scf_print_filter_matrix", "FILTER_MATRIX")
+    iteration_info = lazy_section("cp2k_dft_xas_scf_print_iteration_info", "ITERATION_INFO")
+    lanczos = lazy_section("cp2k_dft_xas_scf_print_lanczos", "LANCZOS")
+    mos_molden = lazy_section("cp2k_dft_xas_scf_print_mos_molden", "MOS_MOLDEN")
+    mo_magnitude = lazy_section("cp2k_dft_xas_scf_print_mo_magnitude", "MO_MAGNITUDE")
+    mo_orthonormality = lazy_section("cp2k_dft_xas_scf_print_mo_orthonormality", "MO_ORTHONORMALITY")
+    program_run_info = lazy_section("cp2k_dft_xas_scf_print_program_run_info", "PROGRAM_RUN_INFO")
+    restart = lazy_section("cp2k_dft_xas_scf_print_restart", "RESTART")
+    restart_history = lazy_section("cp2k_dft_xas_scf_print_restart_history", "RESTART_HISTORY")
+    total_densities = lazy_section("cp2k_dft_xas_scf_print_total_densities", "TOTAL_DENSITIES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.davidson = cp2k_dft_xas_scf_print_davidson()
-        self.detailed_energy = cp2k_dft_xas_scf_print_detailed_energy()
-        self.diag_sub_scf = cp2k_dft_xas_scf_print_diag_sub_scf()
-        self.diis_info = cp2k_dft_xas_scf_print_diis_info()
-        self.filter_matrix = cp2k_dft_xas_scf_print_filter_matrix()
-        self.iteration_info = cp2k_dft_xas_scf_print_iteration_info()
-        self.lanczos = cp2k_dft_xas_scf_print_lanczos()
-        self.mos_molden = cp2k_dft_xas_scf_print_mos_molden()
-        self.mo_magnitude = cp2k_dft_xas_scf_print_mo_magnitude()
-        self.mo_orthonormality = cp2k_dft_xas_scf_print_mo_orthonormality()
-        self.program_run_info = cp2k_dft_xas_scf_print_program_run_info()
-        self.restart = cp2k_dft_xas_scf_print_restart()
-        self.restart_history = cp2k_dft_xas_scf_print_restart_history()
-        self.total_densities = cp2k_dft_xas_scf_print_total_densities()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2681,71 +2189,39 @@ class cp2k_dft_xas_scf_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.davidson.status == True:
+        if section_active(self, "davidson"):
             self.davidson.to_input(fout)
-        if self.detailed_energy.status == True:
+        if section_active(self, "detailed_energy"):
             self.detailed_energy.to_input(fout)
-        if self.diag_sub_scf.status == True:
+        if section_active(self, "diag_sub_scf"):
             self.diag_sub_scf.to_input(fout)
-        if self.diis_info.status == True:
+        if section_active(self, "diis_info"):
             self.diis_info.to_input(fout)
-        if self.filter_matrix.status == True:
+        if section_active(self, "filter_matrix"):
             self.filter_matrix.to_input(fout)
-        if self.iteration_info.status == True:
+        if section_active(self, "iteration_info"):
             self.iteration_info.to_input(fout)
-        if self.lanczos.status == True:
+        if section_active(self, "lanczos"):
             self.lanczos.to_input(fout)
-        if self.mos_molden.status == True:
+        if section_active(self, "mos_molden"):
             self.mos_molden.to_input(fout)
-        if self.mo_magnitude.status == True:
+        if section_active(self, "mo_magnitude"):
             self.mo_magnitude.to_input(fout)
-        if self.mo_orthonormality.status == True:
+        if section_active(self, "mo_orthonormality"):
             self.mo_orthonormality.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
-        if self.restart_history.status == True:
+        if section_active(self, "restart_history"):
             self.restart_history.to_input(fout)
-        if self.total_densities.status == True:
+        if section_active(self, "total_densities"):
             self.total_densities.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "DAVIDSON":
-                self.davidson.set_params({item: params[item]})
-            elif item.split("-")[4] == "DETAILED_ENERGY":
-                self.detailed_energy.set_params({item: params[item]})
-            elif item.split("-")[4] == "DIAG_SUB_SCF":
-                self.diag_sub_scf.set_params({item: params[item]})
-            elif item.split("-")[4] == "DIIS_INFO":
-                self.diis_info.set_params({item: params[item]})
-            elif item.split("-")[4] == "FILTER_MATRIX":
-                self.filter_matrix.set_params({item: params[item]})
-            elif item.split("-")[4] == "ITERATION_INFO":
-                self.iteration_info.set_params({item: params[item]})
-            elif item.split("-")[4] == "LANCZOS":
-                self.lanczos.set_params({item: params[item]})
-            elif item.split("-")[4] == "MOS_MOLDEN":
-                self.mos_molden.set_params({item: params[item]})
-            elif item.split("-")[4] == "MO_MAGNITUDE":
-                self.mo_magnitude.set_params({item: params[item]})
-            elif item.split("-")[4] == "MO_ORTHONORMALITY":
-                self.mo_orthonormality.set_params({item: params[item]})
-            elif item.split("-")[4] == "PROGRAM_RUN_INFO":
-                self.proram_run_info.set_params({item: params[item]})
-            elif item.split("-")[4] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            elif item.split("-")[4] == "RESTART_HISTORY":
-                self.restart_history.set_params({item: params[item]})
-            elif item.split("-")[4] == "TOTAL_DENSITIES":
-                self.total_densities.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_scf_smear:
     def __init__(self):
@@ -2765,26 +2241,22 @@ class cp2k_dft_xas_scf_smear:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xas_scf:
+    diagonalization = lazy_section("cp2k_dft_xas_scf_diagonalization", "DIAGONALIZATION")
+    mixing = lazy_section("cp2k_dft_xas_scf_mixing", "MIXING")
+    mom = lazy_section("cp2k_dft_xas_scf_mom", "MOM")
+    ot = lazy_section("cp2k_dft_xas_scf_ot", "OT")
+    outer_scf = lazy_section("cp2k_dft_xas_scf_outer_scf", "OUTER_SCF")
+    printout = lazy_section("cp2k_dft_xas_scf_print", "PRINT")
+    smear = lazy_section("cp2k_dft_xas_scf_smear", "SMEAR")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.diagonalization = cp2k_dft_xas_scf_diagonalization()
-        self.mixing = cp2k_dft_xas_scf_mixing()
-        self.mom = cp2k_dft_xas_scf_mom()
-        self.ot = cp2k_dft_xas_scf_ot()
-        self.outer_scf = cp2k_dft_xas_scf_outer_scf()
-        self.printout = cp2k_dft_xas_scf_print()
-        self.smear = cp2k_dft_xas_scf_smear()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2795,46 +2267,32 @@ class cp2k_dft_xas_scf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.diagonalization.status == True:
+        if section_active(self, "diagonalization"):
             self.diagonalization.to_input(fout)
-        if self.mixing.status == True:
+        if section_active(self, "mixing"):
             self.mixing.to_input(fout)
-        if self.mom.status == True:
+        if section_active(self, "mom"):
             self.mom.to_input(fout)
-        if self.ot.status == True:
+        if section_active(self, "ot"):
             self.ot.to_input(fout)
-        if self.outer_scf.status == True:
+        if section_active(self, "outer_scf"):
             self.outer_scf.to_input(fout)
         if self.printout.statu == True:
             self.printout.to_input(fout)
-        if self.smear.status == True:
+        if section_active(self, "smear"):
             self.smear.to_input(fout)
         fout.write("\t\t\t&END SCF\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DIAGONALIZATION":
-                self.diagonalization.set_params({item: params[item]})
-            elif item.split("-")[3] == "MIXING":
-                self.mixing.set_params({item: params[item]})
-            elif item.split("-")[3] == "MOM":
-                self.mom.set_params({item: params[item]})
-            elif item.split("-")[3] == "OT":
-                self.ot.set_params({item: params[item]})
-            elif item.split("-")[3] == "OUTER_SCF":
-                self.outer_scf.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[3] == "SMEAR":
-                self.smear.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_xas:
+    localize = lazy_section("cp2k_dft_xas_localize", "LOCALIZE")
+    printout = lazy_section("cp2k_dft_xas_print", "PRINT")
+    scf = lazy_section("cp2k_dft_xas_scf", "SCF")
+
     def __init__(self):
         self.params = {
                 "ADDED_MOS": None,
@@ -2842,10 +2300,6 @@ class cp2k_dft_xas:
                 }
         self.status = False
 
-        self.localize = cp2k_dft_xas_localize()
-        self.printout = cp2k_dft_xas_print()
-        self.scf = cp2k_dft_xas_scf()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2856,24 +2310,14 @@ class cp2k_dft_xas:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.localize.status == True:
+        if section_active(self, "localize"):
             self.localize.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.scf.status == True:
+        if section_active(self, "scf"):
             self.scf.to_input(fout)
         fout.write("\t\t&END XAS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "LOCALIZE":
-                self.localize.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[2] == "SCF":
-                self.scf.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # =============================
 # CP2K / FORCE_EVAL / DFT / XC
 # =============================
@@ -22,9 +24,7 @@ class cp2k_dft_xc_adiabatic_rescaling:
         fout.write("\t\t\t&END ADIABATIC_RESCALING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_xc_hf_hf_info_each:
@@ -44,18 +44,16 @@ class cp2k_dft_xc_hf_hf_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 class cp2k_dft_xc_hf_hf_info:
+    each = lazy_section("cp2k_dft_xc_hf_hf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xc_hf_hf_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -67,16 +65,12 @@ class cp2k_dft_xc_hf_hf_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END HF_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_hf_interaction_potential:
     def __init__(self):
@@ -95,9 +89,7 @@ class cp2k_dft_xc_hf_interaction_potential:
         fout.write("\t\t\t\t&END INTERACTION_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_hf_load_balance_print_each:
     def __init__(self):
@@ -116,22 +108,16 @@ class cp2k_dft_xc_hf_load_balance_print_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xc_hf_load_balance_print:
+    each = lazy_section("cp2k_dft_xc_hf_load_balance_print_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xc_hf_load_balance_print_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -142,28 +128,23 @@ class cp2k_dft_xc_hf_load_balance_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=5)
 
 class cp2k_dft_xc_hf_load_balance:
+    printout = lazy_section("cp2k_dft_xc_hf_load_balance_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_dft_xc_hf_load_balance_print()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -172,18 +153,12 @@ class cp2k_dft_xc_hf_load_balance:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_hf_memory:
@@ -203,9 +178,7 @@ class cp2k_dft_xc_hf_memory:
         fout.write("\t\t\t\t&END MEMORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_hf_periodic:
     def __init__(self):
@@ -224,9 +197,7 @@ class cp2k_dft_xc_hf_periodic:
         fout.write("\t\t\t\t&END PERIODIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_hf_screening:
     def __init__(self):
@@ -245,24 +216,22 @@ class cp2k_dft_xc_hf_screening:
         fout.write("\t\t\t\t&END SCREENING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_hf:
+    hf_info = lazy_section("cp2k_dft_xc_hf_hf_info", "HF_INFO")
+    interaction_potential = lazy_section("cp2k_dft_xc_hf_interaction_potential", "INTERACTION_POTENTIAL")
+    load_balance = lazy_section("cp2k_dft_xc_hf_load_balance", "LOAD_BALANCE")
+    memory = lazy_section("cp2k_dft_xc_hf_memory", "MEMORY")
+    periodic = lazy_section("cp2k_dft_xc_hf_periodic", "PERIODIC")
+    screening = lazy_section("cp2k_dft_xc_hf_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf_info = cp2k_dft_xc_hf_hf_info()
-        self.interaction_potential = cp2k_dft_xc_hf_interaction_potential()
-        self.load_balance = cp2k_dft_xc_hf_load_balance()
-        self.memory = cp2k_dft_xc_hf_memory()
-        self.periodic = cp2k_dft_xc_hf_periodic()
-        self.screening = cp2k_dft_xc_hf_screening()
-
         # basic setting
 
     def to_input(self, fout):
@@ -273,38 +242,22 @@ class cp2k_dft_xc_hf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf_info.status == True:
+        if section_active(self, "hf_info"):
             self.hf_info.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.load_balance.status == True:
+        if section_active(self, "load_balance"):
             self.load_balance.to_input(fout)
-        if self.memory.status == True:
+        if section_active(self, "memory"):
             self.memory.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input(fout)
         fout.write("\t\t\t&END HF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "HF_INFO":
-                self.hf_info.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[3] == "LOAD_BALANCE":
-                self.load_balance.set_params({item: params[item]})
-            elif item.split("-")[3] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[3] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[3] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_xc_vdw_potential_pair_potential_print_dftd_each:
     def __init__(self):
@@ -319,18 +272,16 @@ class cp2k_dft_xc_vdw_potential_pair_potential_print_dftd_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=6)
 
 class cp2k_dft_xc_vdw_potential_pair_potential_print_dftd:
+    each = lazy_section("cp2k_dft_xc_vdw_potential_pair_potential_print_dftd_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xc_vdw_potential_pair_potential_print_dftd_each()
-
         # basic setting
         self.each.status = True
 
@@ -339,27 +290,21 @@ class cp2k_dft_xc_vdw_potential_pair_potential_print_dftd:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PRINT_DFTD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xc_vdw_potential_pair_potential:
+    print_dftd = lazy_section("cp2k_dft_xc_vdw_potential_pair_potential_print_dftd", "PRINT_DFTD")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.print_dftd = cp2k_dft_xc_vdw_potential_pair_potential_print_dftd()
-
         # basic setting
         self.params["PARAMETER_FILE_NAME"] = "dftd3.dat"
 
@@ -368,16 +313,12 @@ class cp2k_dft_xc_vdw_potential_pair_potential:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.print_dftd.status == True:
+        if section_active(self, "print_dftd"):
             self.print_dftd.to_input(fout)
         fout.write("\t\t\t\t&END PAIR_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "PRINT_DFTD":
-                self.print_dftd.set_params({item: params[item]})
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_vdw_potential_non_local:
     def __init__(self):
@@ -392,20 +333,19 @@ class cp2k_dft_xc_vdw_potential_non_local:
         fout.write("\t\t\t\t&END NON_LOCAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_vdw_potential:
+    pair_potential = lazy_section("cp2k_dft_xc_vdw_potential_pair_potential", "PAIR_POTENTIAL")
+    non_local = lazy_section("cp2k_dft_xc_vdw_potential_non_local", "NON_LOCAL")
+
     def __init__(self):
         self.params = {
                 "POTENTIAL_TYPE": None,
                 }
         self.status = False
 
-        self.pair_potential = cp2k_dft_xc_vdw_potential_pair_potential()
-        self.non_local = cp2k_dft_xc_vdw_potential_non_local()
         # basic setting
         self.pair_potential.status = True
         self.params["POTENTIAL_TYPE"] = "PAIR_POTENTIAL"
@@ -421,13 +361,7 @@ class cp2k_dft_xc_vdw_potential:
         fout.write("\t\t\t&END VDW_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "PAIR_POTENTIAL":
-                self.pair_potential.set_params({item: params[item]})
-            elif item.split("-")[3] == "NON_LOCAL":
-                self.non_local.set_params({item: params[item]})
+        route_params(self, params, level=3)
 
 
 
@@ -447,11 +381,7 @@ class cp2k_dft_xc_wf_correlation_cphf:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_wf_correlation_direct_canonical:
@@ -470,11 +400,7 @@ class cp2k_dft_xc_wf_correlation_direct_canonical:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_wf_correlation_eri_mme_cutoff_calib:
@@ -493,11 +419,7 @@ class cp2k_dft_xc_wf_correlation_eri_mme_cutoff_calib:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xc_wf_correlation_eri_mme_eri_mme_info_each:
     def __init__(self):
@@ -515,21 +437,17 @@ class cp2k_dft_xc_wf_correlation_eri_mme_eri_mme_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_dft_xc_wf_correlation_eri_mme_eri_mme_info:
+    each = lazy_section("cp2k_dft_xc_wf_correlation_eri_mme_eri_mme_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xc_wf_correlation_eri_mme_eri_mme_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -541,31 +459,25 @@ class cp2k_dft_xc_wf_correlation_eri_mme_eri_mme_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ERI_MME_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xc_wf_correlation_eri_mme:
+    cutoff_calib = lazy_section("cp2k_dft_xc_wf_correlation_eri_mme_cutoff_calib", "CUTOFF_CALIB")
+    eri_mme_info = lazy_section("cp2k_dft_xc_wf_correlation_eri_mme_eri_mme_info", "ERI_MME_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cutoff_calib = cp2k_dft_xc_wf_correlation_eri_mme_cutoff_calib()
-        self.eri_mme_info = cp2k_dft_xc_wf_correlation_eri_mme_eri_mme_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -576,24 +488,16 @@ class cp2k_dft_xc_wf_correlation_eri_mme:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cutoff_calib.status == True:
+        if section_active(self, "cutoff_calib"):
             self.cutoff_calib.to_input(fout)
-        if self.eri_mme_info.status == True:
+        if section_active(self, "eri_mme_info"):
             self.eri_mme_info.to_input(fout)
         fout.write("\t\t\t\t&END ERI_MME\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CUTOFF_CALIB":
-                self.cutoff_calib.set_params({item: params[item]})
-            elif item.split("-")[4] == "ERI_MME_INFO":
-                self.eri_mme_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_wf_correlation_interaction_potential:
     def __init__(self):
@@ -611,11 +515,7 @@ class cp2k_dft_xc_wf_correlation_interaction_potential:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_wf_correlation_mp2_info_each:
@@ -637,21 +537,17 @@ class cp2k_dft_xc_wf_correlation_mp2_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xc_wf_correlation_mp2_info:
+    each = lazy_section("cp2k_dft_xc_wf_correlation_mp2_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xc_wf_correlation_mp2_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -663,20 +559,14 @@ class cp2k_dft_xc_wf_correlation_mp2_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MP2_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_wf_correlation_opt_ri_basis:
     def __init__(self):
@@ -694,11 +584,7 @@ class cp2k_dft_xc_wf_correlation_opt_ri_basis:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_wf_correlation_ri_laplace:
@@ -717,11 +603,7 @@ class cp2k_dft_xc_wf_correlation_ri_laplace:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_wf_correlation_ri_mp2:
     def __init__(self):
@@ -739,11 +621,7 @@ class cp2k_dft_xc_wf_correlation_ri_mp2:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_hf_info_each:
     def __init__(self):
@@ -761,20 +639,16 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_hf_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_hf_info:
+    each = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_hf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xc_wf_correlation_ri_rpa_hf_hf_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -786,20 +660,14 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_hf_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END HF_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_interaction_potential:
     def __init__(self):
@@ -817,11 +685,7 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_interaction_potential:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance_print_each:
     def __init__(self):
@@ -839,20 +703,16 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance_print_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance_print:
+    each = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance_print_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance_print_each()
-
         # basic setting 
         self.each.status = True
 
@@ -864,29 +724,23 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance:
+    printout = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -897,20 +751,14 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_memory:
     def __init__(self):
@@ -928,11 +776,7 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_memory:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_periodic:
     def __init__(self):
@@ -950,11 +794,7 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_periodic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf_screening:
     def __init__(self):
@@ -972,25 +812,21 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf_screening:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_hf:
+    hf_info = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_hf_info", "HF_INFO")
+    interaction_potential = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_interaction_potential", "INTERACTION_POTENTIAL")
+    load_balance = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance", "LOAD_BALANCE")
+    memory = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_memory", "MEMORY")
+    periodic = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_periodic", "PERIODIC")
+    screening = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf_info = cp2k_dft_xc_wf_correlation_ri_rpa_hf_hf_info()
-        self.interaction_potential = cp2k_dft_xc_wf_correlation_ri_rpa_hf_interaction_potential()
-        self.load_balance = cp2k_dft_xc_wf_correlation_ri_rpa_hf_load_balance()
-        self.memory = cp2k_dft_xc_wf_correlation_ri_rpa_hf_memory()
-        self.periodic = cp2k_dft_xc_wf_correlation_ri_rpa_hf_periodic()
-        self.screening = cp2k_dft_xc_wf_correlation_ri_rpa_hf_screening()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -999,40 +835,24 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_hf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf_info.status == True:    
+        if section_active(self, "hf_info"):    
             self.hf_info.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.load_balance.status == True:
+        if section_active(self, "load_balance"):
             self.load_balance.to_input(fout)
         if self.memoery.status == True:
             self.memory.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input()
         fout.write("\t\t\t\t\t&end HF\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "HF_INFO":
-                self.hf_info.set_params({item: params[item]})
-            elif item.split("-")[5] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[5] == "LOAD_BALANCE":
-                self.load_balance.set_params({item: params[item]})
-            elif item.split("-")[5] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[5] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[5] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_im_time:
@@ -1051,11 +871,7 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_im_time:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_ri_axk:
@@ -1074,11 +890,7 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_ri_axk:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa_ri_g0w0:
     def __init__(self):
@@ -1096,23 +908,19 @@ class cp2k_dft_xc_wf_correlation_ri_rpa_ri_g0w0:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_dft_xc_wf_correlation_ri_rpa:
+    hf = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_hf", "HF")
+    im_time = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_im_time", "IM_TIME")
+    ri_axk = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_ri_axk", "RI_AXK")
+    ri_g0w0 = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa_ri_g0w0", "RI_G0W0")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf = cp2k_dft_xc_wf_correlation_ri_rpa_hf()
-        self.im_time = cp2k_dft_xc_wf_correlation_ri_rpa_im_time()
-        self.ri_axk = cp2k_dft_xc_wf_correlation_ri_rpa_ri_axk()
-        self.ri_g0w0 = cp2k_dft_xc_wf_correlation_ri_rpa_ri_g0w0()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1123,32 +931,20 @@ class cp2k_dft_xc_wf_correlation_ri_rpa:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf.status == True:
+        if section_active(self, "hf"):
             self.hf.to_input(fout)
-        if self.im_time.status == True:
+        if section_active(self, "im_time"):
             self.im_time.to_input(fout)
-        if self.ri_axk.status == True:
+        if section_active(self, "ri_axk"):
             self.ri_axk.to_input(fout)
-        if self.ri_g0w0.status == True:
+        if section_active(self, "ri_g0w0"):
             self.ri_g0w0.to_input(fout)
         fout.write("\t\t\t\t&end RI_RPA\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "HF":
-                self.hf.set_params({item: params[item]})
-            elif item.split("-")[4] == "IM_TIME":
-                self.im_time.set_params({item: params[item]})
-            elif item.split("-")[4] == "RI_AXK":
-                self.ri_axk.set_params({item: params[item]})
-            elif item.split("-")[4] == "RI_G0W0":
-                self.ri_g0w0.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_wf_correlation_wfc_gpw:
@@ -1167,29 +963,25 @@ class cp2k_dft_xc_wf_correlation_wfc_gpw:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_wf_correlation:
+    cphf = lazy_section("cp2k_dft_xc_wf_correlation_cphf", "CPHF")
+    direct_canonical = lazy_section("cp2k_dft_xc_wf_correlation_direct_canonical", "DIRECT_CANONICAL")
+    eri_mme = lazy_section("cp2k_dft_xc_wf_correlation_eri_mme", "ERI_MME")
+    interaction_potential = lazy_section("cp2k_dft_xc_wf_correlation_interaction_potential", "INTERACTION_POTENTIAL")
+    mp2_info = lazy_section("cp2k_dft_xc_wf_correlation_mp2_info", "MP2_INFO")
+    opt_ri_basis = lazy_section("cp2k_dft_xc_wf_correlation_opt_ri_basis", "OPT_RI_BASIS")
+    ri_laplace = lazy_section("cp2k_dft_xc_wf_correlation_ri_laplace", "RI_LAPLACE")
+    ri_mp2 = lazy_section("cp2k_dft_xc_wf_correlation_ri_mp2", "RI_MP2")
+    ri_rpa = lazy_section("cp2k_dft_xc_wf_correlation_ri_rpa", "RI_RPA")
+    wfc_gpw = lazy_section("cp2k_dft_xc_wf_correlation_wfc_gpw", "WFC_GPW")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cphf = cp2k_dft_xc_wf_correlation_cphf()
-        self.direct_canonical = cp2k_dft_xc_wf_correlation_direct_canonical()
-        self.eri_mme = cp2k_dft_xc_wf_correlation_eri_mme()
-        self.interaction_potential = cp2k_dft_xc_wf_correlation_interaction_potential()
-        self.mp2_info = cp2k_dft_xc_wf_correlation_mp2_info()
-        self.opt_ri_basis = cp2k_dft_xc_wf_correlation_opt_ri_basis()
-        self.ri_laplace = cp2k_dft_xc_wf_correlation_ri_laplace()
-        self.ri_mp2 = cp2k_dft_xc_wf_correlation_ri_mp2()
-        self.ri_rpa = cp2k_dft_xc_wf_correlation_ri_rpa()
-        self.wfc_gpw = cp2k_dft_xc_wf_correlation_wfc_gpw()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1198,56 +990,32 @@ class cp2k_dft_xc_wf_correlation:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cphf.status == True:
+        if section_active(self, "cphf"):
             self.cphf.to_input(fout)
-        if self.direct_canonical.status == True:
+        if section_active(self, "direct_canonical"):
             self.direct_canonical.to_input(fout)
-        if self.eri_mme.status == True:
+        if section_active(self, "eri_mme"):
             self.eri_mme.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.mp2_info.status == True:
+        if section_active(self, "mp2_info"):
             self.mp2_info.to_input(fout)
-        if self.opt_ri_basis.status == True:
+        if section_active(self, "opt_ri_basis"):
             self.opt_ri_basis.to_input(fout)
-        if self.ri_laplace.status == True:
+        if section_active(self, "ri_laplace"):
             self.ri_laplace.to_iknput(fout)
-        if self.ri_mp2.status == True:
+        if section_active(self, "ri_mp2"):
             self.ri_mp2.to_input(fout)
-        if self.ri_rpa.status == True:
+        if section_active(self, "ri_rpa"):
             self.ri_rpa.to_input(fout)
-        if self.wfc_gpw.status == True:
+        if section_active(self, "wfc_gpw"):
             self.wfc_gpw.to_input(fout)
         fout.write("\t\t\t&END WF_CORRELATION\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CPHF":
-                self.cphf.set_params({item: params[item]})
-            elif item.split("-")[3] == "DIRECT_CANONICAL":
-                self.direct_canonical.set_params({item: params[item]})
-            elif item.split("-")[3] == "ERI_MME":
-                self.eri_mme.set_params({item: params[item]})
-            elif item.split("-")[3] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[3] == "MP2_INFO":
-                self.mp2_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "OPT_RI_BASIS":
-                self.opt_ri_basis.set_params({item: params[item]})
-            elif item.split("-")[3] == "RI_LAPLACE":
-                self.ri_laplace.set_params({item: params[item]})
-            elif item.split("-")[3] == "RI_MP2":
-                self.ri_mp2.set_params({item: params[item]})
-            elif item.split("-")[3] == "RI_RPA":
-                self.ri_rpa.set_params({item: params[item]})
-            elif item.split("-")[3] == "WFC_GPW":
-                self.wfc_gpw.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -1267,9 +1035,7 @@ class cp2k_dft_xc_xc_functional_becke88:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_becke88_lr:
     def __init__(self):
@@ -1287,9 +1053,7 @@ class cp2k_dft_xc_xc_functional_becke88_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_becke88_lr_adiabatic:
     def __init__(self):
@@ -1307,9 +1071,7 @@ class cp2k_dft_xc_xc_functional_becke88_lr_adiabatic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_dft_xc_xc_functional_becke97:
@@ -1328,9 +1090,7 @@ class cp2k_dft_xc_xc_functional_becke97:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_becke_roussel:
     def __init__(self):
@@ -1348,9 +1108,7 @@ class cp2k_dft_xc_xc_functional_becke_roussel:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_beef:
     def __init__(self):
@@ -1368,9 +1126,7 @@ class cp2k_dft_xc_xc_functional_beef:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_cs1:
     def __init__(self):
@@ -1388,9 +1144,7 @@ class cp2k_dft_xc_xc_functional_cs1:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_gv09:
     def __init__(self):
@@ -1408,9 +1162,7 @@ class cp2k_dft_xc_xc_functional_gv09:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_hcth:
     def __init__(self):
@@ -1428,9 +1180,7 @@ class cp2k_dft_xc_xc_functional_hcth:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_ke_gga:
     def __init__(self):
@@ -1448,9 +1198,7 @@ class cp2k_dft_xc_xc_functional_ke_gga:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_ke_libxc:
     def __init__(self):
@@ -1468,9 +1216,7 @@ class cp2k_dft_xc_xc_functional_ke_libxc:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_lda_hole_t_c_lr:
     def __init__(self):
@@ -1488,9 +1234,7 @@ class cp2k_dft_xc_xc_functional_lda_hole_t_c_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_libxc:
     def __init__(self):
@@ -1508,9 +1252,7 @@ class cp2k_dft_xc_xc_functional_libxc:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_lyp:
     def __init__(self):
@@ -1528,9 +1270,7 @@ class cp2k_dft_xc_xc_functional_lyp:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_lyp_adiabatic:
     def __init__(self):
@@ -1548,9 +1288,7 @@ class cp2k_dft_xc_xc_functional_lyp_adiabatic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_optx:
     def __init__(self):
@@ -1568,9 +1306,7 @@ class cp2k_dft_xc_xc_functional_optx:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_p86c:
     def __init__(self):
@@ -1588,9 +1324,7 @@ class cp2k_dft_xc_xc_functional_p86c:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_pade:
     def __init__(self):
@@ -1608,9 +1342,7 @@ class cp2k_dft_xc_xc_functional_pade:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_pbe:
     def __init__(self):
@@ -1628,9 +1360,7 @@ class cp2k_dft_xc_xc_functional_pbe:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_pbe_hole_t_c_lr:
     def __init__(self):
@@ -1648,9 +1378,7 @@ class cp2k_dft_xc_xc_functional_pbe_hole_t_c_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_pw92:
     def __init__(self):
@@ -1668,9 +1396,7 @@ class cp2k_dft_xc_xc_functional_pw92:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_pz81:
     def __init__(self):
@@ -1688,9 +1414,7 @@ class cp2k_dft_xc_xc_functional_pz81:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_tf:
     def __init__(self):
@@ -1708,9 +1432,7 @@ class cp2k_dft_xc_xc_functional_tf:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_tfw:
     def __init__(self):
@@ -1728,9 +1450,7 @@ class cp2k_dft_xc_xc_functional_tfw:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_tpss:
     def __init__(self):
@@ -1748,9 +1468,7 @@ class cp2k_dft_xc_xc_functional_tpss:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_vwn:
     def __init__(self):
@@ -1768,9 +1486,7 @@ class cp2k_dft_xc_xc_functional_vwn:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_xalpha:
     def __init__(self):
@@ -1788,9 +1504,7 @@ class cp2k_dft_xc_xc_functional_xalpha:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_xgga:
     def __init__(self):
@@ -1808,9 +1522,7 @@ class cp2k_dft_xc_xc_functional_xgga:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional_xwpbe:
     def __init__(self):
@@ -1828,11 +1540,38 @@ class cp2k_dft_xc_xc_functional_xwpbe:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_functional:
+    becke88_lr = lazy_section("cp2k_dft_xc_xc_functional_becke88_lr", "BECKE88_LR")
+    becke88_lr_adiabatic = lazy_section("cp2k_dft_xc_xc_functional_becke88_lr_adiabatic", "BECKE88_LR_ADIABATIC")
+    becke97 = lazy_section("cp2k_dft_xc_xc_functional_becke97", "BECKE97")
+    becke_roussel = lazy_section("cp2k_dft_xc_xc_functional_becke_roussel", "BECKE_ROUSSEL")
+    beef = lazy_section("cp2k_dft_xc_xc_functional_beef", "BEEF")
+    cs1 = lazy_section("cp2k_dft_xc_xc_functional_cs1", "CS1")
+    gv09 = lazy_section("cp2k_dft_xc_xc_functional_gv09", "GV09")
+    hcth = lazy_section("cp2k_dft_xc_xc_functional_hcth", "HCTH")
+    ke_gga = lazy_section("cp2k_dft_xc_xc_functional_ke_gga", "KE_GGA")
+    ke_libxc = lazy_section("cp2k_dft_xc_xc_functional_ke_libxc", "KE_LIBXC")
+    lda_hole_t_c_lr = lazy_section("cp2k_dft_xc_xc_functional_lda_hole_t_c_lr", "LDA_HOLE_T_C_LR")
+    libxc = lazy_section("cp2k_dft_xc_xc_functional_libxc", "LIBXC")
+    lyp = lazy_section("cp2k_dft_xc_xc_functional_lyp", "LYP")
+    lyp_adiabatic = lazy_section("cp2k_dft_xc_xc_functional_lyp_adiabatic", "LYP_ADIABATIC")
+    optx = lazy_section("cp2k_dft_xc_xc_functional_optx", "OPTX")
+    p86c = lazy_section("cp2k_dft_xc_xc_functional_p86c", "P86C")
+    pade = lazy_section("cp2k_dft_xc_xc_functional_pade", "PADE")
+    pbe = lazy_section("cp2k_dft_xc_xc_functional_pbe", "PBE")
+    pbe_hole_t_c_lr = lazy_section("cp2k_dft_xc_xc_functional_pbe_hole_t_c_lr", "PBE_HOLE_T_C_LR")
+    pw92 = lazy_section("cp2k_dft_xc_xc_functional_pw92", "PW92")
+    pz81 = lazy_section("cp2k_dft_xc_xc_functional_pz81", "PZ81")
+    tf = lazy_section("cp2k_dft_xc_xc_functional_tf", "TF")
+    tfw = lazy_section("cp2k_dft_xc_xc_functional_tfw", "TFW")
+    tpss = lazy_section("cp2k_dft_xc_xc_functional_tpss", "TPSS")
+    vwn = lazy_section("cp2k_dft_xc_xc_functional_vwn", "VWN")
+    xalpha = lazy_section("cp2k_dft_xc_xc_functional_xalpha", "XALPHA")
+    xgga = lazy_section("cp2k_dft_xc_xc_functional_xgga", "XGGA")
+    xwpbe = lazy_section("cp2k_dft_xc_xc_functional_xwpbe", "XWPBE")
+
     def __init__(self):
         self.section = "PBE"
         self.params = {
@@ -1840,38 +1579,9 @@ class cp2k_dft_xc_xc_functional:
         self.status = False
 
         self.becke88 =  cp2k_dft_xc_xc_functional_becke88()
-        self.becke88_lr = cp2k_dft_xc_xc_functional_becke88_lr()
-        self.becke88_lr_adiabatic = cp2k_dft_xc_xc_functional_becke88_lr_adiabatic()
-        self.becke97 = cp2k_dft_xc_xc_functional_becke97()
-        self.becke_roussel = cp2k_dft_xc_xc_functional_becke_roussel()
-        self.beef = cp2k_dft_xc_xc_functional_beef()
-        self.cs1 = cp2k_dft_xc_xc_functional_cs1()
-        self.gv09 = cp2k_dft_xc_xc_functional_gv09()
-        self.hcth = cp2k_dft_xc_xc_functional_hcth()
-        self.ke_gga = cp2k_dft_xc_xc_functional_ke_gga()
-        self.ke_libxc = cp2k_dft_xc_xc_functional_ke_libxc()
-        self.lda_hole_t_c_lr = cp2k_dft_xc_xc_functional_lda_hole_t_c_lr()
-        self.libxc = cp2k_dft_xc_xc_functional_libxc()
-        self.lyp = cp2k_dft_xc_xc_functional_lyp()
-        self.lyp_adiabatic = cp2k_dft_xc_xc_functional_lyp_adiabatic()
-        self.optx = cp2k_dft_xc_xc_functional_optx()
-        self.p86c = cp2k_dft_xc_xc_functional_p86c()
-        self.pade = cp2k_dft_xc_xc_functional_pade()
-        self.pbe = cp2k_dft_xc_xc_functional_pbe()
-        self.pbe_hole_t_c_lr = cp2k_dft_xc_xc_functional_pbe_hole_t_c_lr()
-        self.pw92 = cp2k_dft_xc_xc_functional_pw92()
-        self.pz81 = cp2k_dft_xc_xc_functional_pz81()
-        self.tf = cp2k_dft_xc_xc_functional_tf()
-        self.tfw = cp2k_dft_xc_xc_functional_tfw()
-        self.tpss = cp2k_dft_xc_xc_functional_tpss()
-        self.vwn = cp2k_dft_xc_xc_functional_vwn()
-        self.xalpha = cp2k_dft_xc_xc_functional_xalpha()
-        self.xgga = cp2k_dft_xc_xc_functional_xgga()
-        self.xwpbe = cp2k_dft_xc_xc_functional_xwpbe()
 
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1944,69 +1654,7 @@ class cp2k_dft_xc_xc_functional:
         set_params for xc_functional is different from many other
         set_params, as it deal with the key 'XC_FUNCTIONAL' only
         """
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "BECKE88":
-                self.becke88.set_params({item: params[item]})
-            elif item.split("-")[3] == "BECKE88_LR":
-                self.becke88_lr.set_params({item: params[item]})
-            elif item.split("-")[3] == "BECKE88_LR_ADIABATIC":
-                self.becke88_lr_adiabatic.set_params({item: params[item]})
-            elif item.split("-")[3] == "BECKE97":
-                self.becke97.set_params({item: params[item]})
-            elif item.split("-")[3] == "BECKE_ROUSSEL":
-                self.becke_roussel.set_params({item: params[item]})
-            elif item.split("-")[3] == "BEEF":
-                self.beef.set_params({item: params[item]})
-            elif item.split("-")[3] == "CS1":
-                self.cs1.set_params({item: params[item]})
-            elif item.split("-")[3] == "GV09":
-                self.gv09.set_params({item: params[item]})
-            elif item.split("-")[3] == "HCTH":
-                self.hcth.set_params({item: params[item]})
-            elif item.split("-")[3] == "KE_GGA":
-                self.ke_gga.set_params({item: params[item]})
-            elif item.split("-")[3] == "KE_LIBXC":
-                self.ke_libxc.set_params({item: params[item]})
-            elif item.split("-")[3] == "LDA_HOLE_T_C_LR":
-                self.lda_hole_t_c_lr.set_params({item: params[item]})
-            elif item.split("-")[3] == "LIBXC":
-                self.libxc.set_params({item: params[item]})
-            elif item.split("-")[3] == "LYP":
-                self.lyp.set_params({item: params[item]})
-            elif item.split("-")[3] == "LYP_ADIABATIC":
-                self.lyp_adiabatic.set_params({item: params[item]})
-            elif item.split("-")[3] == "OPTX":
-                self.optx.set_params({item: params[item]})
-            elif item.split("-")[3] == "P86C":
-                self.p86c.set_params({item: params[item]})
-            elif item.split("-")[3] == "PADE":
-                self.pade.set_params({item: params[item]})
-            elif item.split("-")[3] == "PBE":
-                self.pbe.set_params({item: params[item]})
-            elif item.split("-")[3] == "PBE_HOLE_T_C_LR":
-                self.pbe_hole_t_c_lr.set_params({item: params[item]})
-            elif item.split("-")[3] == "PW92":
-                self.pw92.set_params({item: params[item]})
-            elif item.split("-")[3] == "PZ81":
-                self.pz81.set_params({item: params[item]})
-            elif item.split("-")[3] == "TF":
-                self.tf.set_params({item: params[item]})
-            elif item.split("-")[3] == "TFW":
-                self.tfw.set_params({item: params[item]})
-            elif item.split("-")[3] == "TPSS":
-                self.tpss.set_params({item: params[item]})
-            elif item.split("-")[3] == "VWN":
-                self.vwn.set_params({item: params[item]})
-            elif item.split("-")[3] == "XALPHA":
-                self.xalpha.set_params({item: params[item]})
-            elif item.split("-")[3] == "XGGA":
-                self.xgga.set_params({item: params[item]})
-            elif item.split("-")[3] == "XWPBE":
-                self.xwpbe.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_dft_xc_xc_grid:
     def __init__(self):
@@ -2027,9 +1675,7 @@ class cp2k_dft_xc_xc_grid:
         fout.write("\t\t\t&END XC_GRID\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_xc_xc_potential_saop:
@@ -2049,18 +1695,16 @@ class cp2k_dft_xc_xc_potential_saop:
         fout.write("\t\t\t\t&END SAOP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 class cp2k_dft_xc_xc_potential:
+    saop = lazy_section("cp2k_dft_xc_xc_potential_saop", "SAOP")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.saop = cp2k_dft_xc_xc_potential_saop()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2071,19 +1715,23 @@ class cp2k_dft_xc_xc_potential:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.saop.status == True:
+        if section_active(self, "saop"):
             self.saop.to_input(fout)
         fout.write("\t\t\t&END XC_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "SAOP":
-                self.saop.set_params({item: params[item]})
+        route_params(self, params, level=3)
 
 
 class cp2k_dft_xc:
+    adiabatic_rescaling = lazy_section("cp2k_dft_xc_adiabatic_rescaling", "ADIABATIC_RESCALING")
+    hf = lazy_section("cp2k_dft_xc_hf", "HF")
+    vdw_potential = lazy_section("cp2k_dft_xc_vdw_potential", "VDW_POTENTIAL")
+    wf_correlation = lazy_section("cp2k_dft_xc_wf_correlation", "WF_CORRELATION")
+    xc_functional = lazy_section("cp2k_dft_xc_xc_functional", "XC_FUNCTIONAL")
+    xc_grid = lazy_section("cp2k_dft_xc_xc_grid", "XC_GRID")
+    xc_potential = lazy_section("cp2k_dft_xc_xc_potential", "XC_POTENTIAL")
+
     def __init__(self):
         self.params = {
                 "DENSITY_CUTOFF": None,
@@ -2094,14 +1742,6 @@ class cp2k_dft_xc:
                 }
         self.status = False
 
-        self.adiabatic_rescaling = cp2k_dft_xc_adiabatic_rescaling()
-        self.hf = cp2k_dft_xc_hf()
-        self.vdw_potential = cp2k_dft_xc_vdw_potential()
-        self.wf_correlation = cp2k_dft_xc_wf_correlation()
-        self.xc_functional = cp2k_dft_xc_xc_functional()
-        self.xc_grid = cp2k_dft_xc_xc_grid()
-        self.xc_potential = cp2k_dft_xc_xc_potential()
-
         # basic setting
         self.xc_functional.status = True
         self.vdw_potential.status = False
@@ -2119,45 +1759,22 @@ class cp2k_dft_xc:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s" % (item, str(self.params[item])))
-        if self.adiabatic_rescaling.status == True:
+        if section_active(self, "adiabatic_rescaling"):
             self.adiabatic_rescaling.to_input(fout)
-        if self.hf.status == True:
+        if section_active(self, "hf"):
             self.hf.to_input(fout)
-        if self.xc_functional.status == True:
+        if section_active(self, "xc_functional"):
             self.xc_functional.to_input(fout)
-        if self.vdw_potential.status == True:
+        if section_active(self, "vdw_potential"):
             self.vdw_potential.to_input(fout)
-        if self.wf_correlation.status == True:
+        if section_active(self, "wf_correlation"):
             self.wf_correlation.to_input(fout)
-        if self.xc_grid.status == True:
+        if section_active(self, "xc_grid"):
             self.xc_grid.to_input(fout)
-        if self.xc_potential.status == True:
+        if section_active(self, "xc_potential"):
             self.xc_potential.to_input(fout)
         fout.write("\t\t&END XC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                if item.split("-")[-1] == "XC_FUNCTIONAL":
-                    self.xc_functional.section = params[item]
-                elif item.split("-")[-1] == "VDW_POTENTIAL":
-                    self.vdw_potential.section = params[item]
-                else:
-                    self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "XC_FUNCTIONAL" and len(item.split("-")) > 3:
-                self.xc_functional.set_params({item: params[item]})
-            elif item.split("-")[2] == "VDW_POTENTIAL":
-                self.vdw_potential.set_params({item: params[item]})
-            elif item.split("-")[2] == "ADIABATIC_RESCALING":
-                self.adiabatic_rescaling.set_params({item: params[item]})
-            elif item.split("-")[2] == "HF":
-                self.hf.set_params({item: params[item]})
-            elif item.split("-")[2] == "WF_CORRELATION":
-                self.wf_correlation.set_params({item: params[item]})
-            elif item.split("-")[2] == "XC_GRID":
-                self.xc_grid.set_params({item: params[item]})
-            elif item.split("-")[2] == "XC_POTENTIAL":
-                self.xc_potential.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
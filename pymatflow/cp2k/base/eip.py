@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 # ============================================
@@ -33,22 +34,19 @@ class cp2k_eip_print_coord_avg_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_eip_print_coord_avg:
     """
 
     """
+    each = lazy_section("cp2k_eip_print_coord_avg_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_eip_print_coord_avg_each()
         # basic setting
 
     def to_input(self, fout):
@@ -59,18 +57,12 @@ class cp2k_eip_print_coord_avg:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END COORD_AVG\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_eip_print_coord_var_each:
@@ -95,23 +87,20 @@ class cp2k_eip_print_coord_var_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_eip_print_coord_var:
     """
 
     """
+    each = lazy_section("cp2k_eip_print_coord_var_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_eip_print_coord_var_each()
         # basic setting
 
     def to_input(self, fout):
@@ -122,18 +111,12 @@ class cp2k_eip_print_coord_var:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END COORD_VAR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_eip_print_count_each:
     """
@@ -157,23 +140,20 @@ class cp2k_eip_print_count_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_eip_print_count:
     """
 
     """
+    each = lazy_section("cp2k_eip_print_count_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_eip_print_count_each()
         # basic setting
 
     def to_input(self, fout):
@@ -184,18 +164,12 @@ class cp2k_eip_print_count:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END COUNT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_eip_print_energies_each:
     """
@@ -219,23 +193,20 @@ class cp2k_eip_print_energies_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_eip_print_energies:
     """
 
     """
+    each = lazy_section("cp2k_eip_print_energies_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_eip_print_energies_each()
         # basic setting
 
     def to_input(self, fout):
@@ -246,18 +217,12 @@ class cp2k_eip_print_energies:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END ENERGIES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_eip_print_energies_var_each:
     """
@@ -281,23 +246,20 @@ class cp2k_eip_print_energies_var_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_eip_print_energies_var:
     """
 
     """
+    each = lazy_section("cp2k_eip_print_energies_var_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_eip_print_energies_var_each()
         # basic setting
 
     def to_input(self, fout):
@@ -308,18 +270,12 @@ class cp2k_eip_print_energies_var:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END ENERGIES_VAR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_eip_print_forces_each:
@@ -344,11 +300,7 @@ class cp2k_eip_print_forces_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -356,12 +308,13 @@ class cp2k_eip_print_forces:
     """
 
     """
+    each = lazy_section("cp2k_eip_print_forces_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_eip_print_forces_each()
         # basic setting
 
     def to_input(self, fout):
@@ -372,35 +325,30 @@ class cp2k_eip_print_forces:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END FORCES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_eip_print:
     """
 
     """
+    coord_avg = lazy_section("cp2k_eip_print_coord_avg", "COORD_AVG")
+    coord_var = lazy_section("cp2k_eip_print_coord_var", "COORD_VAR")
+    count = lazy_section("cp2k_eip_print_count", "COUNT")
+    energies = lazy_section("cp2k_eip_print_energies", "ENERGIES")
+    energies_var = lazy_section("cp2k_eip_print_energies_var", "ENERGIES_VAR")
+    forces = lazy_section("cp2k_eip_print_forces", "FORCES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.coord_avg = cp2k_eip_print_coord_avg()
-        self.coord_var = cp2k_eip_print_coord_var()
-        self.count = cp2k_eip_print_count()
-        self.energies = cp2k_eip_print_energies()
-        self.energies_var = cp2k_eip_print_energies_var()
-        self.forces = cp2k_eip_print_forces()
         # basic setting
 
     def to_input(self, fout):
@@ -411,51 +359,35 @@ class cp2k_eip_print:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.coord_avg.status == True:
+        if section_active(self, "coord_avg"):
             self.coord_avg.to_input(fout)
-        if self.coord_var.status == True:
+        if section_active(self, "coord_var"):
             self.coord_var.to_input(fout)
-        if self.count.status == True:
+        if section_active(self, "count"):
             self.count.to_input(fout)
-        if self.energies.status == True:
+        if section_active(self, "energies"):
             self.energies.to_input(fout)
-        if self.energies_var.status == True:
+        if section_active(self, "energies_var"):
             self.energies_var.to_input(fout)
-        if self.forces.status == True:
+        if section_active(self, "forces"):
             self.forces.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "COORD_AVG":
-                self.coord_avg.set_params({item: params[item]})
-            elif item.split("-")[2] == "COORD_VAR":
-                self.coord_var.set_params({item: params[item]})
-            elif item.split("-")[2] == "COUNT":
-                self.count.set_params({item: params[item]})
-            elif item.split("-")[2] == "ENERGIES":
-                self.energies.set_params({item: params[item]})
-            elif item.split("-")[2] == "ENERGIES_VAR":
-                self.energies_var.set_params({item: params[item]})
-            elif item.split("-")[2] == "FORCES":
-                self.forces.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_eip:
     """
 
     """
+    printout = lazy_section("cp2k_eip_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_eip_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -466,15 +398,9 @@ class cp2k_eip:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t&END EIP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -35,26 +36,22 @@ class cp2k_embed_mapping_force_eval_fragment:
         fout.write("\t\t\t\t&END FRAGMENT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_embed_mapping_force_eval:
     """
 
     """
+    fragment = lazy_section("cp2k_embed_mapping_force_eval_fragment", "FRAGMENT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.fragment = cp2k_embed_mapping_force_eval_fragment()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -63,18 +60,12 @@ class cp2k_embed_mapping_force_eval:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.fragment.status == True:
+        if section_active(self, "fragment"):
             self.fragment.to_input(fout)
         fout.write("\t\t\t&END FORCE_EVAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "FRAGMENT":
-                self.fragment.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_embed_mapping_force_eval_embed_fragment:
     """
@@ -97,22 +88,19 @@ class cp2k_embed_mapping_force_eval_embed_fragment:
         fout.write("\t\t\t\t&END FRAGMENT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_embed_mapping_force_eval_embed:
     """
 
     """
+    fragment = lazy_section("cp2k_embed_mapping_force_eval_embed_fragment", "FRAGMENT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.fragment = cp2k_embed_mapping_force_eval_embed_fragment()
         # basic setting
 
     def to_input(self, fout):
@@ -123,31 +111,26 @@ class cp2k_embed_mapping_force_eval_embed:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.fragment.status == True:
+        if section_active(self, "fragment"):
             self.fragment.to_input(fout)
         fout.write("\t\t\t&END FORCE_EVAL_EMBED\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "FRAGMENT":
-                self.fragment.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_embed_mapping:
     """
 
     """
+    force_eval = lazy_section("cp2k_embed_mapping_force_eval", "FORCE_EVAL")
+    force_eval_embed = lazy_section("cp2k_embed_mapping_force_eval_embed", "FORCE_EVAL_EMBED")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.force_eval = cp2k_embed_mapping_force_eval()
-        self.force_eval_embed = cp2k_embed_mapping_force_eval_embed()
         # basic setting
 
     def to_input(self, fout):
@@ -158,22 +141,14 @@ class cp2k_embed_mapping:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.force_eval.status == True:
+        if section_active(self, "force_eval"):
             self.force_eval.to_input(fout)
-        if self.force_eval_embed.status == True:
+        if section_active(self, "force_eval_embed"):
             self.force_eval_embed.to_input(fout)
         fout.write("\t\t&END MAPPING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "FORCE_EVAL":
-                self.force_eval.set_params({item: params[item]})
-            elif item.split("-")[2] == "FORCE_EVAL_EMBED":
-                self.force_eval_embed.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_embed_print_program_run_info_each:
     """
@@ -196,26 +171,22 @@ class cp2k_embed_print_program_run_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_embed_print_program_run_info:
     """
 
     """
+    each = lazy_section("cp2k_embed_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_embed_print_program_run_info_each()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -224,33 +195,27 @@ class cp2k_embed_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_embed_print:
     """
 
     """
+    program_run_info = lazy_section("cp2k_embed_print_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.program_run_info = cp2k_embed_print_program_run_info()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -259,18 +224,12 @@ class cp2k_embed_print:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -278,13 +237,14 @@ class cp2k_embed:
     """
 
     """
+    mapping = lazy_section("cp2k_embed_mapping", "MAPPING")
+    printout = lazy_section("cp2k_embed_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.mapping = cp2k_embed_mapping()
-        self.printout = cp2k_embed_print()
         # basic setting
 
     def to_input(self, fout):
@@ -295,19 +255,11 @@ class cp2k_embed:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.mapping.status == True:
+        if section_active(self, "mapping"):
             self.mappint.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t&END DFT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "MAPPING":
-                self.mappint.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
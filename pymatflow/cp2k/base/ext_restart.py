@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import route_params
 
 
 
@@ -31,6 +32,4 @@ class cp2k_ext_restart:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params)
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import route_params
 
 
 """
@@ -38,8 +39,4 @@ class cp2k_external_potential:
         fout.write("\t&END EXTERNAL_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -32,11 +33,7 @@ class cp2k_farming_job:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 class cp2k_farming_program_run_info_each:
     """
@@ -58,22 +55,19 @@ class cp2k_farming_program_run_info_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_farming_program_run_info:
     """
     """
+    each = lazy_section("cp2k_farming_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_farming_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -82,20 +76,14 @@ class cp2k_farming_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t&END PROGRAM_RUN_INFO\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 class cp2k_farming_restart_each:
     """
@@ -117,22 +105,19 @@ class cp2k_farming_restart_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_farming_restart:
     """
     """
+    each = lazy_section("cp2k_farming_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_farming_restart_each()
         # basic setting
 
     def to_input(self, fout):
@@ -141,33 +126,28 @@ class cp2k_farming_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t&END RESTART\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_farming:
     """
     """
+    job = lazy_section("cp2k_farming_job", "JOB")
+    program_run_info = lazy_section("cp2k_farming_program_run_info", "PROGRAM_RUN_INFO")
+    restart = lazy_section("cp2k_farming_restart", "RESTART")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.job = cp2k_farming_job()
-        self.program_run_info = cp2k_farming_program_run_info()
-        self.restart = cp2k_farming_restart()
         # basic setting
 
     def to_input(self, fout):
@@ -175,27 +155,17 @@ class cp2k_farming:
         fout.write("&FARMING\n")
         for item in self.params:
             fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.job.status == True:
+        if section_active(self, "job"):
             self.job.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
         fout.write("&END FARMING\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "JOB":
-                self.job.set_params({item: params[item]})
-            elif item.split("-")[0] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[0] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
 
 
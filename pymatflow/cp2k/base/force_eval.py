@@ -19,6 +19,7 @@ from pymatflow.cp2k.base.pw_dft import cp2k_pw_dft
 from pymatflow.cp2k.base.qmmm import cp2k_qmmm
 from pymatflow.cp2k.base.rescale_forces import cp2k_rescale_forces
 from pymatflow.cp2k.base.subsys import cp2k_subsys
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -42,6 +43,10 @@ class cp2k_force_eval:
         rather than 'is kind of a', so here combination is used to organize
         the these classes.
     """
+    subsys = lazy_section("cp2k_subsys", "SUBSYS")
+    dft = lazy_section("cp2k_dft", "DFT")
+    properties = lazy_section("cp2k_properties", "PROPERTIES")
+
     def __init__(self):
         self.params = {
                 "METHOD": "QS",
@@ -50,11 +55,6 @@ class cp2k_force_eval:
                 }
         self.status = False
 
-        self.subsys = cp2k_subsys()
-        self.dft = cp2k_dft()
-        self.properties = cp2k_properties()
-
-
     def to_input(self, fout):
         # check before write input file
         #self.check_spin()
@@ -63,11 +63,11 @@ class cp2k_force_eval:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.subsys.status == True:
+        if section_active(self, "subsys"):
             self.subsys.to_input(fout)
-        if self.dft.status == True:
+        if section_active(self, "dft"):
             self.dft.to_input(fout)
-        if self.properties.status == True:
+        if section_active(self, "properties"):
             self.properties.to_input(fout)
         fout.write("&END FORCE_EVAL\n") 
         fout.write("\n")
@@ -89,14 +89,4 @@ class cp2k_force_eval:
             parameters for sub section(like dft), are handled over 
             to sub section controllers.
         """
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "SUBSYS":
-                self.subsys.set_params({item: params[item]})
-            elif item.split("-")[0] == "DFT":
-                self.dft.set_params({item: params[item]})
-            elif item.split("-")[0] == "PROPERTIES":
-                self.properties.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import route_params
 
 """
 Usage:
@@ -34,11 +35,7 @@ class cp2k_glob:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params)
 
     def basic_setting(self, run_type="ENERGY_FORCE"):
         """
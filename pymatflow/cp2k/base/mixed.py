@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -39,11 +40,7 @@ class cp2k_mixed_coupling:
         fout.write("\t\t&end coupling\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_mixed_generic:
     """
@@ -68,11 +65,7 @@ class cp2k_mixed_generic:
         fout.write("\t\t&end GENERIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_mixed_linear:
@@ -98,11 +91,7 @@ class cp2k_mixed_linear:
         fout.write("\t\t&end LINEAR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_mixed_mapping_force_eval_fragment:
     """
@@ -127,23 +116,20 @@ class cp2k_mixed_mapping_force_eval_fragment:
         fout.write("\t\t\t\t&end FRAGMENT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mixed_mapping_force_eval:
     """
 
     """
+    fragment = lazy_section("cp2k_mixed_mapping_force_eval_fragment", "FRAGMENT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.fragment = cp2k_mixed_mapping_force_eval_fragment()
         # basic setting
 
     def to_input(self, fout):
@@ -154,18 +140,12 @@ class cp2k_mixed_mapping_force_eval:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.fragment.status == True:
+        if section_active(self, "fragment"):
             self.fragment.to_input(fout)
         fout.write("\t\t\t&END FORCE_EVAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "FRAGMENT":
-                self.fragment.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mixed_mapping_force_eval_mixed_fragment:
@@ -191,23 +171,20 @@ class cp2k_mixed_mapping_force_eval_mixed_fragment:
         fout.write("\t\t\t\t&end FRAGMENT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mixed_mapping_force_eval_mixed:
     """
 
     """
+    fragment = lazy_section("cp2k_mixed_mapping_force_eval_mixed_fragment", "FRAGMENT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.fragment = cp2k_mixed_mapping_force_eval_mixed_fragment()
         # basic setting
 
     def to_input(self, fout):
@@ -218,18 +195,12 @@ class cp2k_mixed_mapping_force_eval_mixed:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.fragment.status == True:
+        if section_active(self, "fragment"):
             self.fragment.to_input(fout)
         fout.write("\t\t\t&end FORCE_EVAL_MIXED\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "FRAGMENT":
-                self.fragment.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -237,13 +208,14 @@ class cp2k_mixed_mapping:
     """
 
     """
+    force_eval = lazy_section("cp2k_mixed_mapping_force_eval", "FORCE_EVAL")
+    force_eval_mixed = lazy_section("cp2k_mixed_mapping_force_eval_mixed", "FORCE_EVAL_MIXED")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.force_eval = cp2k_mixed_mapping_force_eval()
-        self.force_eval_mixed = cp2k_mixed_mapping_force_eval_mixed()
         # basic setting
 
     def to_input(self, fout):
@@ -254,22 +226,14 @@ class cp2k_mixed_mapping:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.force_eval.status == True:
+        if section_active(self, "force_eval"):
             self.force_eval.to_input(fout)
-        if self.force_eval_mixed.status == True:
+        if section_active(self, "force_eval_mixed"):
             self.force_eval_mixed.to_input(fout)
         fout.write("\t\t&end MAPPING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "FORCE_EVAL":
-                self.force_eval.set_params({item: params[item]})
-            elif item.split("-")[2] == "FORCE_EVAL_MIXED":
-                self.force_eval_mixed.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -296,11 +260,7 @@ class cp2k_mixed_mixed_cdft_block_diagonalize:
         fout.write("\t\t\t&END BLOCK_DIAGONALIZE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mixed_mixed_cdft_print_program_run_info_each:
     """
@@ -325,22 +285,19 @@ class cp2k_mixed_mixed_cdft_print_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_mixed_mixed_cdft_print_program_run_info:
     """
 
     """
+    each = lazy_section("cp2k_mixed_mixed_cdft_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_mixed_mixed_cdft_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -351,30 +308,25 @@ class cp2k_mixed_mixed_cdft_print_program_run_info:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mixed_mixed_cdft_print:
     """
 
     """
+    program_run_info = lazy_section("cp2k_mixed_mixed_cdft_print_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.program_run_info = cp2k_mixed_mixed_cdft_print_program_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -385,31 +337,26 @@ class cp2k_mixed_mixed_cdft_print:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mixed_mixed_cdft:
     """
 
     """
+    block_diagonalize = lazy_section("cp2k_mixed_mixed_cdft_block_diagonalize", "BLOCK_DIAGONALIZE")
+    printout = lazy_section("cp2k_mixed_mixed_cdft_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.block_diagonalize = cp2k_mixed_mixed_cdft_block_diagonalize()
-        self.printout = cp2k_mixed_mixed_cdft_print()
         # basic setting
 
     def to_input(self, fout):
@@ -420,22 +367,14 @@ class cp2k_mixed_mixed_cdft:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.block_diagonalize.status == True:
+        if section_active(self, "block_diagonalize"):
             self.block_diagonalize.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t&end MIXED_CDFT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BLOCK_DIAGONALIZE":
-                self.block_diagonalize.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRITN":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_mixed_print_dipole_each:
@@ -461,11 +400,7 @@ class cp2k_mixed_print_dipole_each:
         fout.write("\t\t\t\t&end EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -473,12 +408,13 @@ class cp2k_mixed_print_dipole:
     """
 
     """
+    each = lazy_section("cp2k_mixed_print_dipole_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_mixed_print_dipole_each()
         # basic setting
 
     def to_input(self, fout):
@@ -489,18 +425,12 @@ class cp2k_mixed_print_dipole:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&end PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mixed_print_program_run_info_each:
@@ -526,11 +456,7 @@ class cp2k_mixed_print_program_run_info_each:
         fout.write("\t\t\t\t&end EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -538,12 +464,13 @@ class cp2k_mixed_print_program_run_info:
     """
 
     """
+    each = lazy_section("cp2k_mixed_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_mixed_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -554,18 +481,12 @@ class cp2k_mixed_print_program_run_info:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -573,13 +494,14 @@ class cp2k_mixed_print:
     """
 
     """
+    dipole = lazy_section("cp2k_mixed_print_dipole", "DIPOLE")
+    program_run_Info = lazy_section("cp2k_mixed_print_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.dipole = cp2k_mixed_print_dipole()
-        self.program_run_Info = cp2k_mixed_print_program_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -590,22 +512,14 @@ class cp2k_mixed_print:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.dipole.status == True:
+        if section_active(self, "dipole"):
             self.dipole.to_input(fout)
         if self.program_run_info.status == True:
             self.program_run_info.to_input(fout)
         fout.write("\t\t&end PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DIPOLE":
-                self.dipole.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_mixed_restraint:
@@ -631,29 +545,26 @@ class cp2k_mixed_restraint:
         fout.write("\t\t&end RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_mixed:
     """
 
     """
+    coupling = lazy_section("cp2k_mixed_coupling", "COUPLING")
+    generic = lazy_section("cp2k_mixed_generic", "GENERIC")
+    linear = lazy_section("cp2k_mixed_linear", "LINEAR")
+    mapping = lazy_section("cp2k_mixed_mapping", "MAPPING")
+    printout = lazy_section("cp2k_mixed_print", "PRINT")
+    restraint = lazy_section("cp2k_mixed_restraint", "RESTRAINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.coupling = cp2k_mixed_coupling()
-        self.generic = cp2k_mixed_generic()
-        self.linear = cp2k_mixed_linear()
-        self.mapping = cp2k_mixed_mapping()
         self.mixed_cdft  = cp2k_mixed_cdft()
-        self.printout = cp2k_mixed_print()
-        self.restraint = cp2k_mixed_restraint()
         # basic setting
 
     def to_input(self, fout):
@@ -664,39 +575,21 @@ class cp2k_mixed:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.coupling.status == True:
+        if section_active(self, "coupling"):
             self.coupling.to_input(fout)
-        if self.generic.status == True:
+        if section_active(self, "generic"):
             self.generic.to_input(fout)
-        if self.linear.status == True:
+        if section_active(self, "linear"):
             self.linear.to_input(fout)
-        if self.mapping.status == True:
+        if section_active(self, "mapping"):
             self.mapping.to_input(fout)
         if self.mixed_cdft.status == True:
             self.mixed_cdft.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.restraint.status == True:
+        if section_active(self, "restraint"):
             self.restraint.to_input(fout)
         fout.write("\t&END MIXED\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "COUPLING":
-                self.coupling.set_params({item: params[item]})
-            elif item.split("-")[1] == "GENERIC":
-                self.generic.set_params({item: params[item]})
-            elif item.split("-")[1] == "LINEAR":
-                self.linear.set_params({item: params[item]})
-            elif item.split("-")[1] == "MAPPING":
-                self.mapping.set_params({item: params[item]})
-            elif item.split("-")[1] == "MIXED_CDFT":
-                self.mixed_cdft.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[1] == "RESTRAITN":
-                self.restraint.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
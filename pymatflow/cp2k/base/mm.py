@@ -12,6 +12,7 @@ from pymatflow.cp2k.base.mm_neighbor_lists import cp2k_mm_neighbor_lists
 from pymatflow.cp2k.base.mm_periodic_efield import cp2k_mm_periodic_efield
 from pymatflow.cp2k.base.mm_poisson import cp2k_mm_poisson
 from pymatflow.cp2k.base.mm_print import cp2k_mm_print
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 """
 usage:
@@ -25,6 +26,12 @@ class cp2k_mm:
     """
 
     """
+    forcefield = lazy_section("cp2k_mm_forcefield", "FORCEFIELD")
+    neighbor_lists = lazy_section("cp2k_mm_neighbor_lists", "NEIGHBOR_LISTS")
+    periodic_efield = lazy_section("cp2k_mm_periodic_efield", "PERIODIC_EFIELD")
+    poisson = lazy_section("cp2k_mm_poisson", "POISSON")
+    printout = lazy_section("cp2k_mm_print", "PRINT")
+
     def __init__(self):
         """
         """
@@ -32,12 +39,6 @@ class cp2k_mm:
                 }
         self.status = False
 
-        self.forcefield = cp2k_mm_force_field()
-        self.neighbor_lists = cp2k_mm_neighbor_lists()
-        self.periodic_efield = cp2k_mm_periodic_efield()
-        self.poisson = cp2k_mm_poisson()
-        self.printout = cp2k_mm_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -48,31 +49,17 @@ class cp2k_mm:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.forcefield.status == True:
+        if section_active(self, "forcefield"):
             self.forcefield.to_input(fout)
-        if self.neighbor_lists.status == True:
+        if section_active(self, "neighbor_lists"):
             self.neighbor_lists.to_input(fout)
-        if self.periodic_efield.status == True:
+        if section_active(self, "periodic_efield"):
             self.periodic_efield.to_input(fout)
-        if self.poisson.status == True:
+        if section_active(self, "poisson"):
             self.poisson.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t&END DFT\n")
     
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "FORCEFIELD":
-                self.forcefield.set_params({item: params[item]})
-            elif item.split("-")[1] == "NEIGHBOR_LISTS":
-                self.neighbor_lists.set_params({item: params[item]})
-            elif item.split("-")[1] == "PERIODIC_EFIELD":
-                self.periodic_efield.set_params({item: params[item]})
-            elif item.split("-")[1] == "POISSON":
-                self.poisson.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ===================
 # ===================
 
@@ -22,21 +24,17 @@ class cp2k_mm_forcefield_bend_ub:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_forcefield_bend:
+    ub = lazy_section("cp2k_mm_forcefield_bend_ub", "UB")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.ub = cp2k_mm_forcefield_bend_ub()
-
         # basic setting
 
     def to_input(self, fout):
@@ -47,19 +45,13 @@ class cp2k_mm_forcefield_bend:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.ub.status == True:
+        if section_active(self, "ub"):
             self.ub.to_input(fout)
         fout.write("\t\t\t&END BEND\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "UB":
-                self.ub.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mm_forcefield_bond:
@@ -80,11 +72,7 @@ class cp2k_mm_forcefield_bond:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_forcefield_charge:
     def __init__(self):
@@ -104,11 +92,7 @@ class cp2k_mm_forcefield_charge:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_forcefield_charges:
     def __init__(self):
@@ -128,11 +112,7 @@ class cp2k_mm_forcefield_charges:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mm_forcefield_dipole_damping:
@@ -153,21 +133,17 @@ class cp2k_mm_forcefield_dipole_damping:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_forcefield_dipole:
+    damping = lazy_section("cp2k_mm_forcefield_dipole_damping", "DAMPING")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.damping = cp2k_mm_forcefield_dipole_damping()
-
         # basic setting
 
     def to_input(self, fout):
@@ -178,19 +154,13 @@ class cp2k_mm_forcefield_dipole:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.damping.status == True:
+        if section_active(self, "damping"):
             self.damping.to_input(fout)
         fout.write("\t\t\t&END DIPOLE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DAMPING":
-                self.damping.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_forcefield_improper:
     def __init__(self):
@@ -210,11 +180,7 @@ class cp2k_mm_forcefield_improper:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mm_forcefield_nonbonded_bmhft:
@@ -235,11 +201,7 @@ class cp2k_mm_forcefield_nonbonded_bmhft:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_forcefield_nonbonded_bmhftd:
@@ -260,11 +222,7 @@ class cp2k_mm_forcefield_nonbonded_bmhftd:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_forcefield_nonbonded_buck4ranges:
@@ -285,11 +243,7 @@ class cp2k_mm_forcefield_nonbonded_buck4ranges:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_forcefield_nonbonded_buckmorse:
@@ -310,11 +264,7 @@ class cp2k_mm_forcefield_nonbonded_buckmorse:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded_eam:
     def __init__(self):
@@ -334,11 +284,7 @@ class cp2k_mm_forcefield_nonbonded_eam:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded_genpot:
     def __init__(self):
@@ -358,11 +304,7 @@ class cp2k_mm_forcefield_nonbonded_genpot:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded_goodwin:
     def __init__(self):
@@ -382,11 +324,7 @@ class cp2k_mm_forcefield_nonbonded_goodwin:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded_ipbv:
     def __init__(self):
@@ -406,11 +344,7 @@ class cp2k_mm_forcefield_nonbonded_ipbv:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_forcefield_nonbonded_lennard_jones:
@@ -431,11 +365,7 @@ class cp2k_mm_forcefield_nonbonded_lennard_jones:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded_quip:
     def __init__(self):
@@ -455,11 +385,7 @@ class cp2k_mm_forcefield_nonbonded_quip:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded_siepmann:
     def __init__(self):
@@ -479,11 +405,7 @@ class cp2k_mm_forcefield_nonbonded_siepmann:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded_tersoff:
     def __init__(self):
@@ -503,11 +425,7 @@ class cp2k_mm_forcefield_nonbonded_tersoff:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded_williams:
     def __init__(self):
@@ -527,34 +445,29 @@ class cp2k_mm_forcefield_nonbonded_williams:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded:
+    bmhft = lazy_section("cp2k_mm_forcefield_nonbonded_bmhft", "BMHFT")
+    bmhftd = lazy_section("cp2k_mm_forcefield_nonbonded_bmhftd", "BMHFTD")
+    buck4ranges = lazy_section("cp2k_mm_forcefield_nonbonded_buck4ranges", "BUCK4RANGES")
+    buckmorse = lazy_section("cp2k_mm_forcefield_nonbonded_buckmorse", "BUCKMORSE")
+    eam = lazy_section("cp2k_mm_forcefield_nonbonded_eam", "EAM")
+    genpot = lazy_section("cp2k_mm_forcefield_nonbonded_genpot", "GENPOT")
+    goodwin = lazy_section("cp2k_mm_forcefield_nonbonded_goodwin", "GOODWIN")
+    ipbv = lazy_section("cp2k_mm_forcefield_nonbonded_ipbv", "IPBV")
+    lennard_jones = lazy_section("cp2k_mm_forcefield_nonbonded_lennard_jones", "LENNARD-JONES")
+    quip = lazy_section("cp2k_mm_forcefield_nonbonded_quip", "QUIP")
+    siepmann = lazy_section("cp2k_mm_forcefield_nonbonded_siepmann", "SIEPMANN")
+    tersoff = lazy_section("cp2k_mm_forcefield_nonbonded_tersoff", "TERSOFF")
+    williams = lazy_section("cp2k_mm_forcefield_nonbonded_williams", "WILLIAMS")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.bmhft = cp2k_mm_forcefield_nonbonded_bmhft()
-        self.bmhftd = cp2k_mm_forcefield_nonbonded_bmhftd()
-        self.buck4ranges = cp2k_mm_forcefield_nonbonded_buck4ranges()
-        self.buckmorse = cp2k_mm_forcefield_nonbonded_buckmorse()
-        self.eam = cp2k_mm_forcefield_nonbonded_eam()
-        self.genpot = cp2k_mm_forcefield_nonbonded_genpot()
-        self.goodwin = cp2k_mm_forcefield_nonbonded_goodwin()
-        self.ipbv = cp2k_mm_forcefield_nonbonded_ipbv()
-        self.lennard_jones = cp2k_mm_forcefield_nonbonded_lennard_jones()
-        self.quip = cp2k_mm_forcefield_nonbonded_quip()
-        self.siepmann = cp2k_mm_forcefield_nonbonded_siepmann()
-        self.tersoff = cp2k_mm_forcefield_nonbonded_tersoff()
-        self.williams = cp2k_mm_forcefield_nonbonded_williams()
-
         # basic setting
-        
 
     def to_input(self, fout):
         """
@@ -564,67 +477,37 @@ class cp2k_mm_forcefield_nonbonded:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.bmhft.status == True:
+        if section_active(self, "bmhft"):
             self.bmhft.to_input(fout)
-        if self.bmhftd.status == True:
+        if section_active(self, "bmhftd"):
             self.bmhftd.to_input(fout)
-        if self.buck4ranges.status == True:
+        if section_active(self, "buck4ranges"):
             self.buck4ranges.to_input(fout)
-        if self.buckmorse.status == True:
+        if section_active(self, "buckmorse"):
             self.buckmorse.to_input(fout)
-        if self.eam.status == True:
+        if section_active(self, "eam"):
             self.eam.to_input(fout)
-        if self.genpot.status == True:
+        if section_active(self, "genpot"):
             self.genpot.to_input(fout)
-        if self.goodwin.status == True:
+        if section_active(self, "goodwin"):
             self.goodwin.to_input(fout)
-        if self.ipbv.status == True:
+        if section_active(self, "ipbv"):
             self.ipbv.to_input(fout)
-        if self.lennard_jones.status == True:
+        if section_active(self, "lennard_jones"):
             self.lennard_jones.to_input(fout)
-        if self.quip.status == True:
+        if section_active(self, "quip"):
             self.quip.to_input(fout)
-        if self.siepmann.status == True:
+        if section_active(self, "siepmann"):
             self.siepmann.to_input(fout)
-        if self.tersoff.status == True:
+        if section_active(self, "tersoff"):
             self.tersoff.to_input(fout)
-        if self.williams.status == True:
+        if section_active(self, "williams"):
             self.williams.to_input(fout)
         fout.write("\t\t\tEND NONBONDED\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "BMHFT":
-                self.bmhft.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "BMHFTD":
-                self.bmhftd.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "BUCK4RANGES":
-                self.buck4ranges.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "BUCKMORSE":
-                self.buckmorse.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "EAM":
-                self.eam.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "GENPOT":
-                self.genpot.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "GOODWIN":
-                self.goodwin.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "IPBV":
-                self.ipbv.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "LENNARD_JONES":
-                self.lennard_jones.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "QUIP":
-                self.quip.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "SIEPMANN":
-                self.siepmann.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "TERSOFF":
-                self.tersoff.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "WILLIAMS":
-                self.williams.set_params({item: parmas[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -646,11 +529,7 @@ class cp2k_mm_forcefield_nonbonded14_genpot:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_forcefield_nonbonded14_goodwin:
     def __init__(self):
@@ -670,11 +549,7 @@ class cp2k_mm_forcefield_nonbonded14_goodwin:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_forcefield_nonbonded14_lennard_jones:
@@ -695,11 +570,7 @@ class cp2k_mm_forcefield_nonbonded14_lennard_jones:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_forcefield_nonbonded14_williams:
@@ -720,28 +591,23 @@ class cp2k_mm_forcefield_nonbonded14_williams:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
 class cp2k_mm_forcefield_nonbonded14:
+    genpot = lazy_section("cp2k_mm_forcefield_nonbonded14_genpot", "GENPOT")
+    goodwin = lazy_section("cp2k_mm_forcefield_nonbonded14_goodwin", "GOODWIN")
+    lennard_jones = lazy_section("cp2k_mm_forcefield_nonbonded14_lennard_jones", "LENNARD-JONES")
+    williams = lazy_section("cp2k_mm_forcefield_nonbonded14_williams", "WILLIAMS")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.genpot = cp2k_mm_forcefield_nonbonded14_genpot()
-        self.goodwin = cp2k_mm_forcefield_nonbonded14_goodwin()
-        self.lennard_jones = cp2k_mm_forcefield_nonbonded14_lennard_jones()
-        self.williams = cp2k_mm_forcefield_nonbonded14_williams()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -750,31 +616,19 @@ class cp2k_mm_forcefield_nonbonded14:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.genpot.status == True:
+        if section_active(self, "genpot"):
             self.genpot.to_input(fout)
-        if self.goodwin.status == True:
+        if section_active(self, "goodwin"):
             self.goodwin.to_input(fout)
-        if self.lennard_jones.status == True:
+        if section_active(self, "lennard_jones"):
             self.lennard_jones.to_input(fout)
-        if self.williams.status == True:
+        if section_active(self, "williams"):
             self.williams.to_input(fout)
         fout.write("\t\t\t&END NONBONDED14\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "GENPOT":
-                self.genpot.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "GOODWIN":
-                self.goodwin.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "LENNARD_JONES":
-                self.lennard_jones.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "WILLIAMS":
-                self.williams.set_params({item: parmas[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
                 
 
@@ -799,11 +653,7 @@ class cp2k_mm_forcefield_opbend:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_forcefield_quadrupole:
     def __init__(self):
@@ -823,11 +673,7 @@ class cp2k_mm_forcefield_quadrupole:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_forcefield_shell:
     def __init__(self):
@@ -847,11 +693,7 @@ class cp2k_mm_forcefield_shell:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_forcefield_spline:
     def __init__(self):
@@ -871,11 +713,7 @@ class cp2k_mm_forcefield_spline:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_forcefield_torsion:
     def __init__(self):
@@ -895,32 +733,28 @@ class cp2k_mm_forcefield_torsion:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_forcefield:
+    bend = lazy_section("cp2k_mm_forcefield_bend", "BEND")
+    bond = lazy_section("cp2k_mm_forcefield_bond", "BOND")
+    charge = lazy_section("cp2k_mm_forcefield_charge", "CHARGE")
+    charges = lazy_section("cp2k_mm_forcefield_charges", "CHARGES")
+    dipole = lazy_section("cp2k_mm_forcefield_dipole", "DIPOLE")
+    improper = lazy_section("cp2k_mm_forcefield_improper", "IMPROPER")
+    nonbonded = lazy_section("cp2k_mm_forcefield_nonbonded", "NONBONDED")
+    nonbonded14 = lazy_section("cp2k_mm_forcefield_nonbonded14", "NONBONDED14")
+    opbend = lazy_section("cp2k_mm_forcefield_opbend", "OPBEND")
+    quadrupole = lazy_section("cp2k_mm_forcefield_quadrupole", "QUADRUPOLE")
+    shell = lazy_section("cp2k_mm_forcefield_shell", "SHELL")
+    spline = lazy_section("cp2k_mm_forcefield_spline", "SPLINE")
+    torsion = lazy_section("cp2k_mm_forcefield_torsion", "TORSION")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.bend = cp2k_mm_forcefield_bend()
-        self.bond = cp2k_mm_forcefield_bond()
-        self.charge = cp2k_mm_forcefield_charge()
-        self.charges = cp2k_mm_forcefield_charges()
-        self.dipole = cp2k_mm_forcefield_dipole()
-        self.improper = cp2k_mm_forcefield_improper()
-        self.nonbonded = cp2k_mm_forcefield_nonbonded()
-        self.nonbonded14 = cp2k_mm_forcefield_nonbonded14()
-        self.opbend = cp2k_mm_forcefield_opbend()
-        self.quadrupole = cp2k_mm_forcefield_quadrupole()
-        self.shell = cp2k_mm_forcefield_shell()
-        self.spline = cp2k_mm_forcefield_spline()
-        self.torsion = cp2k_mm_forcefield_torsion()
-
         # basic setting
 
     def to_input(self, fout):
@@ -931,62 +765,32 @@ class cp2k_mm_forcefield:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.bend.status == True:
+        if section_active(self, "bend"):
             self.bend.to_input(fout)
-        if self.bond.status == True:
+        if section_active(self, "bond"):
             self.bond.to_input(fout)
-        if self.charge.status == True:
+        if section_active(self, "charge"):
             self.charge.to_input(fout)
-        if self.charges.status == True:
+        if section_active(self, "charges"):
             self.charges.to_input(fout)
-        if self.dipole.status == True:
+        if section_active(self, "dipole"):
             self.dipole.to_input(fout)
-        if self.improper.status == True:
+        if section_active(self, "improper"):
             self.improper.to_input(fout)
-        if self.nonbonded.status == True:
+        if section_active(self, "nonbonded"):
             self.nonbonded.to_input(fout)
-        if self.nonbonded14.status == True:
+        if section_active(self, "nonbonded14"):
             self.nonbonded14.to_input(fout)
-        if self.opbend.status == True:
+        if section_active(self, "opbend"):
             self.opbend.to_input(fout)
-        if self.quadrupole.status == True:
+        if section_active(self, "quadrupole"):
             self.quadrupole.to_input(fout)
-        if self.shell.status == True:
+        if section_active(self, "shell"):
             self.shell.to_input(fout)
-        if self.torsion.status == True:
+        if section_active(self, "torsion"):
             self.torsion.to_input(fout)
         fout.write("\t\t&END FORCEFIELD\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BEND":
-                self.bend.set_params({item: params[item]})
-            elif item.split("-")[2] == "BOND":
-                self.bond.set_params({item: params[item]})
-            elif item.split("-")[2] == "CHARGE":
-                self.charge.set_params({item: params[item]})
-            elif item.split("-")[2] == "CHARGES":
-                self.charges.set_params({item: params[item]})
-            elif item.split("-")[2] == "DIPOLE":
-                self.dipole.set_params({item: params[item]})
-            elif item.split("-")[2] == "IMPROPER":
-                self.improper.set_params({item: params[item]})
-            elif item.split("-")[2] == "NONBONDED":
-                self.nonbonded.set_params({item: params[item]})
-            elif item.split("-")[2] == "NONBONDED14":
-                self.nonbonded14.et_params({item: params[item]})
-            elif item.split("-")[2] == "OPBEND":
-                self.opbend.set_params({item: params[item]})
-            elif item.split("-")[2] == "QUADRUPOLE":
-                self.quadrupole.set_params({item: params[item]})
-            elif item.split("-")[2] == "SHELL":
-                self.shell.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPLINE":
-                self.spline.set_params({item: params[item]})
-            elif item.split("-")[2] == "TORSION":
-                self.torsion.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
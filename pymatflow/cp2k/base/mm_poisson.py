@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ===================
 # ===================
 class cp2k_mm_poisson_ewald_multipoles:
@@ -21,11 +23,7 @@ class cp2k_mm_poisson_ewald_multipoles:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_poisson_ewald_print_program_run_info_each:
     def __init__(self):
@@ -45,20 +43,16 @@ class cp2k_mm_poisson_ewald_print_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_mm_poisson_ewald_print_program_run_info:
+    each = lazy_section("cp2k_mm_poisson_ewald_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
         
-        self.each = cp2k_mm_piosson_ewald_print_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -69,28 +63,22 @@ class cp2k_mm_poisson_ewald_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_mm_poisson_ewald_print:
+    program_run_info = lazy_section("cp2k_mm_poisson_ewald_print_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.program_run_info = cp2k_mm_poisson_ewald_print_program_run_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -101,19 +89,13 @@ class cp2k_mm_poisson_ewald_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_poisson_ewald_rs_grid:
     def __init__(self):
@@ -133,22 +115,18 @@ class cp2k_mm_poisson_ewald_rs_grid:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_poisson_ewald:
+    multipoles = lazy_section("cp2k_mm_poisson_ewald", "MULTIPOLES")
+    printout = lazy_section("cp2k_mm_poisson_ewald_print", "PRINT")
+    rs_grid = lazy_section("cp2k_mm_poisson_ewald_rs_grid", "RS_GRID")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.multipoles = cp2k_mm_poisson_ewald()
-        self.printout = cp2k_mm_poisson_print()
-        self.rs_grid = cp2k_mm_poisson_rs_grid()
-
         # basic setting
 
     def to_input(self, fout):
@@ -159,27 +137,17 @@ class cp2k_mm_poisson_ewald:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.multipoles.status == True:
+        if section_active(self, "multipoles"):
             self.multipoles.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.rs_grid.status == True:
+        if section_active(self, "rs_grid"):
             self.rs_grid.to_input(fout)
         fout.write("\t\t\t&END EWALD\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "MULTIPOLES":
-                self.multipoles.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[3] == "RS_GRID":
-                self.rs_grid.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mm_poisson_implicit_dielectric_dielec_aa_cuboidal:
@@ -200,11 +168,7 @@ class cp2k_mm_poisson_implicit_dielectric_dielec_aa_cuboidal:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_mm_poisson_implicit_dielectric_dielec_xaa_annular:
     def __init__(self):
@@ -224,22 +188,18 @@ class cp2k_mm_poisson_implicit_dielectric_dielec_xaa_annular:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_mm_poisson_implicit_dielectric:
+    dielec_aa_cuboidal = lazy_section("cp2k_mm_poisson_implicit_dielectric_dielec_aa_cuboidal", "DIELEC_AA_CUBOIDAL")
+    dielec_xaa_annular = lazy_section("cp2k_mm_poisson_implicit_dielectric_dielec_xaa_annular", "DIELEC_XAA_ANNULAR")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.dielec_aa_cuboidal = cp2k_mm_poisson_implicit_dielectric_dielec_aa__cuboidal()
-        self.dielec_xaa_annular = cp2k_mm_poisson_implicit_dielectric_dielec_xaa_annular()
-
         # basic setting
 
     def to_input(self, fout):
@@ -250,23 +210,15 @@ class cp2k_mm_poisson_implicit_dielectric:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.dielec_aa_cuboidal.status == True:
+        if section_active(self, "dielec_aa_cuboidal"):
             self.dielec_aa_cuboidal.to_input(fout)
-        if self.dielec_xaa_annular.status == True:
+        if section_active(self, "dielec_xaa_annular"):
             self.dielec_xaa_annular.to_input(fout)
         fout.write("\t\t\t\t&END DIELECTRIC\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "DIELEC_AA_CUBOIDAL":
-                self.dielec_aa_cuboidal.set_params({item: params[item]})
-            elif item.split("-")[4] == "DIELEC_XAA_ANNULAR":
-                self.dielec_xaa_annular.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_poisson_implicit_dielectric_bc_aa_cuboidal:
@@ -287,11 +239,7 @@ class cp2k_mm_poisson_implicit_dielectric_bc_aa_cuboidal:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_mm_poisson_implicit_dielectric_bc_aa_cylindrical:
     def __init__(self):
@@ -311,11 +259,7 @@ class cp2k_mm_poisson_implicit_dielectric_bc_aa_cylindrical:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_mm_poisson_implicit_dielectric_bc_aa_planar:
     def __init__(self):
@@ -335,11 +279,7 @@ class cp2k_mm_poisson_implicit_dielectric_bc_aa_planar:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_mm_poisson_implicit_dielectric_bc_planar:
     def __init__(self):
@@ -359,23 +299,20 @@ class cp2k_mm_poisson_implicit_dielectric_bc_planar:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_mm_poisson_implicit_dielectric_bc:
+    aa_cuboidal = lazy_section("cp2k_mm_poisson_implicit_dielectric_bc_aa_cuboidal", "AA_CUBOIDAL")
+    aa_cylindrical = lazy_section("cp2k_mm_poisson_implicit_dielectric_bc_aa_cylindrical", "AA_CYLINDRICAL")
+    aa_planar = lazy_section("cp2k_mm_poisson_implicit_dielectric_bc_aa_planar", "AA_PLANAR")
+    planar = lazy_section("cp2k_mm_poisson_implicit_dielectric_bc_planar", "PLANAR")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.aa_cuboidal = cp2k_mm_poisson_implicit_dielectric_bc_aa_cuboidal()
-        self.aa_cylindrical = cp2k_mm_poisson_implicit_dielectric_bc_aa_cylindrical()
-        self.aa_planar = cp2k_mm_poisson_implicit_dielectric_bc_aa_planar()
-        self.planar = cp2k_mm_poisson_implicit_dielectric_bc_planar()
         # basic setting
 
     def to_input(self, fout):
@@ -386,45 +323,32 @@ class cp2k_mm_poisson_implicit_dielectric_bc:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.aa_cuboidal.status == True:
+        if section_active(self, "aa_cuboidal"):
             self.aa_cuboidal.to_input(fout)
-        if self.aa_cylindrical.status == True:
+        if section_active(self, "aa_cylindrical"):
             self.aa_cylindrical.to_input(fout)
-        if self.aa_planar.status == True:
+        if section_active(self, "aa_planar"):
             self.aa_planar.to_input(fout)
-        if self.planar.status == True:
+        if section_active(self, "planar"):
             self.planar.to_input(fout)
         fout.write("\t\t\t\t&END DIELECTRIC_BC\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "AA_CUBOIDAL":
-                self.aa_cuboidal.set_params({item: params[item]})
-            elif item.split("-")[4] == "AA_CYLINDRICAL":
-                self.aa_cylindrical.set_params({item: params[item]})
-            elif item.split("-")[4] == "AA_PLANAR":
-                self.aa_planar.set_params({item: params[item]})
-            elif item.split("-")[4] == "PLANAR":
-                self.planar.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_poisson_implicit:
+    dielectric = lazy_section("cp2k_mm_poisson_implicit_dielectric", "DIELECTRIC")
+    dielectric_bc = lazy_section("cp2k_mm_poisson_implicit_dielectric_bc", "DIELECTRIC_BC")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.dielectric = cp2k_mm_poisson_implicit_dielectric()
-        self.dielectric_bc = cp2k_mm_poisson_implicit_dielectric_bc()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -433,23 +357,15 @@ class cp2k_mm_poisson_implicit:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.dielectric.status == True:
+        if section_active(self, "dielectric"):
             self.dielectric.to_input(fout)
-        if self.dielectric_bc.status == True:
+        if section_active(self, "dielectric_bc"):
             self.dielectric_bc.to_input(fout)
         fout.write("\t\t\t&END IMPLICIT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DIELECTRIC":
-                self.dielectric.set_params({item: params[item]})
-            elif item.split("-")[3] == "DIELECTRIC_BC":
-                self.dielectric_bc.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mm_poisson_mt:
@@ -470,11 +386,7 @@ class cp2k_mm_poisson_mt:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_poisson_multipole_check_spline_each:
     def __init__(self):
@@ -494,11 +406,7 @@ class cp2k_mm_poisson_multipole_check_spline_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_mm_poisson_multipole_check_spline:
     def __init__(self):
@@ -524,13 +432,7 @@ class cp2k_mm_poisson_multipole_check_spline:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_poisson_multipole_interpolator_conv_info_each:
     def __init__(self):
@@ -550,20 +452,16 @@ class cp2k_mm_poisson_multipole_interpolator_conv_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_mm_poisson_multipole_interpolator_conv_info:
+    each = lazy_section("cp2k_mm_poisson_multipole_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_poisson_multipole_interpolator_conv_info_each()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -578,22 +476,16 @@ class cp2k_mm_poisson_multipole_interpolator_conv_info:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_mm_poisson_multipole_interpolator:
+    conv_info = lazy_section("cp2k_mm_poisson_multipole_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.conv_info = cp2k_mm_poisson_multipole_interpolator_conv_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -604,19 +496,13 @@ class cp2k_mm_poisson_multipole_interpolator:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_poisson_multipole_program_run_info_each:
     def __init__(self):
@@ -636,20 +522,17 @@ class cp2k_mm_poisson_multipole_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_mm_poisson_multipole_program_run_info:
+    each = lazy_section("cp2k_mm_poisson_multipole_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_poisson_multipole_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -660,31 +543,25 @@ class cp2k_mm_poisson_multipole_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_poisson_multipole:
+    check_spline = lazy_section("cp2k_mm_poisson_multipole_check_spline", "CHECK_SPLINE")
+    interpolator = lazy_section("cp2k_mm_poisson_multipole_interpolator", "INTERPOLATOR")
+    program_run_info = lazy_section("cp2k_mm_poisson_multipole_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.check_spline = cp2k_mm_poisson_multipole_check_spline()
-        self.interpolator = cp2k_mm_poisson_multipole_interpolator()
-        self.program_run_info = cp2k_mm_poisson_multipole_program_run_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -695,27 +572,17 @@ class cp2k_mm_poisson_multipole:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.check_spline.status == True:
+        if section_active(self, "check_spline"):
             self.check_spline.to_input(fout)
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             self.interpolator.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END MULTIPOLE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CHECK_SPLINE":
-                self.check_spline.set_params({item: params[item]})
-            elif item.split("-")[3] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -737,25 +604,21 @@ class cp2k_mm_poisson_wavelet:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mm_poisson:
+    ewald = lazy_section("cp2k_mm_poisson_ewald", "EWALD")
+    implicit = lazy_section("cp2k_mm_poisson_implicit", "IMPLICIT")
+    mt = lazy_section("cp2k_mm_poisson_mt", "MT")
+    multipole = lazy_section("cp2k_mm_poisson_multipole", "MULTIPOLE")
+    wavelet = lazy_section("cp2k_mm_poisson_wavelet", "WAVELET")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.ewald = cp2k_mm_poisson_ewald()
-        self.implicit = cp2k_mm_poisson_implicit()
-        self.mt = cp2k_mm_poisson_mt()
-        self.multipole = cp2k_mm_poisson_multipole()
-        self.wavelet = cp2k_mm_poisson_wavelet()
-
         # basic setting
 
     def to_input(self, fout):
@@ -766,32 +629,18 @@ class cp2k_mm_poisson:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.ewald.status == True:
+        if section_active(self, "ewald"):
             self.ewald.to_input(fout)
-        if self.implicit.status == True:
+        if section_active(self, "implicit"):
             self.ewald.to_input(fout)
-        if self.mt.status == True:
+        if section_active(self, "mt"):
             self.mt.to_input(fout)
-        if self.multipole.status == True:
+        if section_active(self, "multipole"):
             self.multipole.to_input(fout)
-        if self.wavelet.status == True:
+        if section_active(self, "wavelet"):
             self.wavelet.to_input(fout)
         fout.write("\t\t&END POISSON\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EWALD":
-                self.ewald.set_params({item: params[item]})
-            elif item.split("-")[2] == "IMPLICIT":
-                self.implicit.set_params({item: parmas[item]})
-            elif item.split("-")[2] == "MT":
-                self.mt.set_params({item: parmas[item]})
-            elif item.split("-")[2] == "MULTIPOLE":
-                self.multipole.set_params({item: parmas[item]})
-            elif item.split("-")[2] == "WAVELET":
-                self.wavelet.set_params({item: parmas[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ===================
 # ===================
 
@@ -22,19 +24,16 @@ class cp2k_mm_print_derivatives_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_derivatives:
+    each = lazy_section("cp2k_mm_print_derivatives_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_derivatives_each()
         # basic setting
 
     def to_input(self, fout):
@@ -45,19 +44,13 @@ class cp2k_mm_print_derivatives:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END DERIVATIVES\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_dipole_each:
     def __init__(self):
@@ -77,19 +70,16 @@ class cp2k_mm_print_dipole_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_dipole:
+    each = lazy_section("cp2k_mm_print_dipole_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_dipole_each()
         # basic setting
 
     def to_input(self, fout):
@@ -100,19 +90,13 @@ class cp2k_mm_print_dipole:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END DIPOLE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_ewald_info_each:
     def __init__(self):
@@ -132,19 +116,16 @@ class cp2k_mm_print_ewald_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_ewald_info:
+    each = lazy_section("cp2k_mm_print_ewald_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_ewald_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -155,19 +136,13 @@ class cp2k_mm_print_ewald_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item]))) 
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END EWALD_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_ff_info_each:
     def __init__(self):
@@ -187,19 +162,16 @@ class cp2k_mm_print_ff_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_ff_info:
+    each = lazy_section("cp2k_mm_print_ff_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_ff_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -210,19 +182,13 @@ class cp2k_mm_print_ff_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END FF_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_ff_parameter_file_each:
     def __init__(self):
@@ -242,20 +208,17 @@ class cp2k_mm_print_ff_parameter_file_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_mm_print_ff_parameter_file:
+    each = lazy_section("cp2k_mm_print_ff_parameter_file_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_ff_parameter_file_each()
         # basic setting
 
     def to_input(self, fout):
@@ -266,19 +229,13 @@ class cp2k_mm_print_ff_parameter_file:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END FF_PARAMETER_FILE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_iter_info_each:
     def __init__(self):
@@ -298,19 +255,16 @@ class cp2k_mm_print_iter_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_inter_info:
+    each = lazy_section("cp2k_mm_print_iter_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_iter_inro_each()
         # basic setting
 
     def to_input(self, fout):
@@ -321,19 +275,13 @@ class cp2k_mm_print_inter_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END ITER_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_neighbor_lists_each:
     def __init__(self):
@@ -353,19 +301,16 @@ class cp2k_mm_print_neighbor_lists_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_neighbor_lists:
+    each = lazy_section("cp2k_mm_print_neighbor_lists_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_neighbor_lists_each()
         # basic setting
 
     def to_input(self, fout):
@@ -376,19 +321,13 @@ class cp2k_mm_print_neighbor_lists:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END NEIGHBOR_LISTS\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_program_banner_each:
     def __init__(self):
@@ -408,19 +347,16 @@ class cp2k_mm_print_program_banner_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_program_banner:
+    each = lazy_section("cp2k_mm_print_program_banner_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_program_banner_each()
         # basic setting
 
     def to_input(self, fout):
@@ -431,19 +367,13 @@ class cp2k_mm_print_program_banner:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PROGRAM_BANNER\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_program_run_info_each:
     def __init__(self):
@@ -463,20 +393,16 @@ class cp2k_mm_print_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_program_run_info:
+    each = lazy_section("cp2k_mm_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
         
-        self.each = cp2k_mm_print_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -487,19 +413,13 @@ class cp2k_mm_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_mm_print_subcell_each:
     def __init__(self):
@@ -519,19 +439,16 @@ class cp2k_mm_print_subcell_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_mm_print_subcell:
+    each = lazy_section("cp2k_mm_print_subcell_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_mm_print_subcell_each()
         # basic setting
 
     def to_input(self, fout):
@@ -542,36 +459,31 @@ class cp2k_mm_print_subcell:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END SUBCELL\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_mm_print:
+    derivatives = lazy_section("cp2k_mm_print_derivatives", "DERIVATIVES")
+    dipole = lazy_section("cp2k_mm_print_dipole", "DIPOLE")
+    ewald_info = lazy_section("cp2k_mm_print_ewald_info", "EWALD_INFO")
+    ff_info = lazy_section("cp2k_mm_print_ff_info", "FF_INFO")
+    ff_parameter_file = lazy_section("cp2k_mm_print_ff_parameter_file", "FF_PARAMETER_FILE")
+    iter_info = lazy_section("cp2k_mm_print_inter_info", "ITER_INFO")
+    neighbor_lists = lazy_section("cp2k_mm_print_neighbor_lists", "NEIGHBOR_LISTS")
+    program_banner = lazy_section("cp2k_mm_print_program_banner", "PROGRAM_BANNER")
+    program_run_info = lazy_section("cp2k_mm_print_program_run_info", "PROGRAM_RUN_INFO")
+    subcell = lazy_section("cp2k_mm_print_subcell", "SUBCELL")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
-        self.derivatives = cp2k_mm_print_derivatives()
-        self.dipole = cp2k_mm_print_dipole()
-        self.ewald_info = cp2k_mm_print_ewald_info()
-        self.ff_info = cp2k_mm_print_ff_info()
-        self.ff_parameter_file = cp2k_mm_print_ff_parameter_file()
-        self.iter_info = cp2k_mm_print_iter_info()
-        self.neighbor_lists = cp2k_mm_print_neighbor_lists()
-        self.program_banner = cp2k_mm_print_program_banner()
-        self.program_run_info = cp2k_mm_print_program_run_info()
-        self.subcell = cp2k_mm_print_subcell()
 
         # basic setting
 
@@ -583,52 +495,28 @@ class cp2k_mm_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.derivatives.status == True:
+        if section_active(self, "derivatives"):
             self.derivatives.to_input(fout)
-        if self.dipole.status == True:
+        if section_active(self, "dipole"):
             self.dipole.to_input(fout)
-        if self.ewald_info.status == True:
+        if section_active(self, "ewald_info"):
             self.ewald_info.to_input(fout)
-        if self.ff_info.status == True:
+        if section_active(self, "ff_info"):
             self.ff_info.to_input(fout)
-        if self.ff_parameter_file.status == True:
+        if section_active(self, "ff_parameter_file"):
             self.ff_paramter_file.to_input(fout)
-        if self.iter_info.status == True:
+        if section_active(self, "iter_info"):
             self.iter_info.to_input(fout)
-        if self.neighbor_lists.status == True:
+        if section_active(self, "neighbor_lists"):
             self.neighbor_lists.to_input(fout)
-        if self.program_banner.status == True:
+        if section_active(self, "program_banner"):
             self.program_banner.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.subcell.status == True:
+        if section_active(self, "subcell"):
             self.subcell.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DERIVATIVES":
-                self.derivatives.set_params({item: params[item]})
-            elif item.split("-")[2] == "DIPOLE":
-                self.dipole.set_params({item: params[item]})
-            elif item.split("-")[2] == "EWALD_INFO":
-                self.ewald_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "FF_INFO":
-                self.ff_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "FF_PARAMTER_FILE":
-                self.ff_paramter_file.set_params({item: params[item]})
-            elif item.split("-")[2] == "ITER_INFO":
-                self.iter_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "NEIGHBOR_LISTS":
-                self.neighbor_lists.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROGRAM_BANNER":
-                self.program_banner.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "SUBCELL":
-                self.subcell.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
@@ -19,6 +19,7 @@ from pymatflow.cp2k.base.motion_pint import cp2k_motion_pint
 from pymatflow.cp2k.base.motion_shell_opt import cp2k_motion_shell_opt
 from pymatflow.cp2k.base.motion_tmc import cp2k_motion_tmc
 from pymatflow.cp2k.base.motion_flexible_partitioning import cp2k_motion_flexible_partitioning
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -28,38 +29,26 @@ Usage:
 class cp2k_motion:
     """
     """
+    band = lazy_section("cp2k_motion_band", "BAND")
+    cell_opt = lazy_section("cp2k_motion_cell_opt", "CELL_OPT")
+    constraint = lazy_section("cp2k_motion_constraint", "CONSTRAINT")
+    driver = lazy_section("cp2k_motion_driver", "DRIVER")
+    flexible_partitioning = lazy_section("cp2k_motion_flexible_partitioning", "FLEXIBLE_PARTITIONING")
+    free_energy = lazy_section("cp2k_motion_free_energy", "FREE_ENERGY")
+    geo_opt = lazy_section("cp2k_motion_geo_opt", "GEO_OPT")
+    mc = lazy_section("cp2k_motion_mc", "MC")
+    md = lazy_section("cp2k_motion_md", "MD")
+    pint = lazy_section("cp2k_motion_pint", "PINT")
+    printout = lazy_section("cp2k_motion_print", "PRINT")
+    shell_opt = lazy_section("cp2k_motion_shell_opt", "SHELL_OPT")
+    tmc = lazy_section("cp2k_motion_tmc", "TMC")
+
     def __init__(self, project_name="ab-initio", run_type="NONE"):
         self.params = {
                 }
 
         self.status = False
 
-        self.band = cp2k_motion_band()
-
-        self.cell_opt = cp2k_motion_cell_opt()
-        
-        self.constraint = cp2k_motion_constraint() 
-        
-        self.driver = cp2k_motion_driver()
-
-        self.flexible_partitioning = cp2k_motion_flexible_partitioning()
-
-        self.free_energy = cp2k_motion_free_energy()
-
-        self.geo_opt = cp2k_motion_geo_opt()
-       
-        self.mc = cp2k_motion_mc()
-
-        self.md = cp2k_motion_md()
-        
-        self.pint = cp2k_motion_pint()
-        
-        self.printout = cp2k_motion_print() 
-                
-        self.shell_opt = cp2k_motion_shell_opt()
-        
-        self.tmc = cp2k_motion_tmc() 
-
         # basic setting
         self.printout.status = True
 
@@ -67,23 +56,23 @@ class cp2k_motion:
         fout.write("&MOTION\n")
         for item in self.params:
             fout.write("\t%s %s\n" % (item, self.params[item]))
-        if  self.geo_opt.status == True:
+        if  section_active(self, "geo_opt"):
             self.geo_opt.to_input(fout)
-        if  self.cell_opt.status == True:
+        if  section_active(self, "cell_opt"):
             self.cell_opt.to_input(fout)
-        if  self.mc.status == True:
+        if  section_active(self, "mc"):
             self.mc.to_input(fout)
-        if self.md.status == True:
+        if section_active(self, "md"):
             self.md.to_input(fout)
-        if self.pint.status == True:
+        if section_active(self, "pint"):
             self.pint.to_input(fout)
-        if self.shell_opt.status == True:
+        if section_active(self, "shell_opt"):
             self.shell_opt.to_input(fout)
-        if self.band.status == True:
+        if section_active(self, "band"):
             self.band.to_input(fout)
-        if self.free_energy.status == True:
+        if section_active(self, "free_energy"):
             self.free_energy.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("&END MOTION\n")
         fout.write("\n")
@@ -112,37 +101,7 @@ class cp2k_motion:
         """
             Note: parameters for sub section(like md), are handled over to sub section controllers.
         """
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "MD":
-                self.md.set_params({item: params[item]})
-            elif item.split("-")[0] == "BAND":
-                self.band.set_params({item: params[item]})
-            elif item.split("-")[0] == "CELL_OPT":
-                self.cell_opt.set_params({item: params[item]})
-            elif item.split("-")[0] == "GEO_OPT":
-                self.geo_opt.set_params({item: params[item]})
-            elif item.split("-")[0] == "MC":
-                self.mc.set_params({item: params[item]})
-            elif item.split("-")[0] == "TMC":
-                self.tmc.set_params({item: params[item]})
-            elif item.split("-")[0] == "SHELL_OPT":
-                self.shell_opt.set_params({item: params[item]})
-            elif item.split("-")[0] == "CONSTRAINT":
-                self.constraint.set_params({item: params[item]})
-            elif item.split("-")[0] == "DRIVER":
-                self.driver.set_params({item: params[item]})
-            elif item.split("-")[0] == "PINT":
-                self.pint.set_params({item: params[item]})
-            elif item.split("-")[0] == "FLEXIBLE_PARTITIONING":
-                self.flexible_partitioning.set_params({item: params[item]})
-            elif item.split("-")[0] == "FREE_ENERGY":
-                self.free_energy.set_params({item: params[item]})
-            elif item.split("-")[0] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
         # need to do some checking
         self.check_cell_opt()
 
@@ -2,6 +2,7 @@
 # _*_ coding: utf-8 _*_
 
 from pymatflow.base.xyz import base_xyz
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 # ====================
 # CP2K / MOTION / BAND
@@ -25,19 +26,16 @@ class cp2k_motion_band_banner_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_band_banner:
+    each = lazy_section("cp2k_motion_band_banner_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_band_banner_each()
         # basic setting
 
     def to_input(self, fout):
@@ -48,18 +46,12 @@ class cp2k_motion_band_banner:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END BANNER\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_band_ci_neb:
     def __init__(self):
@@ -79,11 +71,7 @@ class cp2k_motion_band_ci_neb:
         fout.write("\t\t&END CI_NEB\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_band_convergence_control:
     def __init__(self):
@@ -103,11 +91,7 @@ class cp2k_motion_band_convergence_control:
         fout.write("\t\t&END CONVERGENCE_CONTROL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_band_convergence_info_each:
     def __init__(self):
@@ -127,20 +111,17 @@ class cp2k_motion_band_convergence_info_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_band_convergence_info:
+    each = lazy_section("cp2k_motion_band_convergence_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_band_convergence_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -151,18 +132,12 @@ class cp2k_motion_band_convergence_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END CONVERGENCE_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_band_energy_each:
@@ -183,20 +158,17 @@ class cp2k_motion_band_energy_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_band_energy:
+    each = lazy_section("cp2k_motion_band_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_band_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -207,18 +179,12 @@ class cp2k_motion_band_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_band_optimize_band_diis_diis_info_each:
     def __init__(self):
@@ -238,19 +204,16 @@ class cp2k_motion_band_optimize_band_diis_diis_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_band_optimize_band_diis_diis_info:
+    each = lazy_section("cp2k_motion_band_optimize_band_diis_diis_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_band_optimize_band_diis_diis_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -264,19 +227,16 @@ class cp2k_motion_band_optimize_band_diis_diis_info:
         fout.write("\t\t\t\t&END DIIS_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_band_optimize_band_diis:
+    diis_info = lazy_section("cp2k_motion_band_optimize_band_diis_diis_info", "DIIS_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.diis_info = cp2k_motion_band_optimize_band_diis_diis_info()
         # basic setting
 
     def to_input(self, fout):
@@ -287,18 +247,12 @@ class cp2k_motion_band_optimize_band_diis:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.diis_info.status == True:
+        if section_active(self, "diis_info"):
             self.diis_info.to_input(fout)
         fout.write("\t\t\t&END DIIS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DIIS_INFO":
-                self.diis_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_band_optimize_band_md_temp_control:
@@ -319,11 +273,7 @@ class cp2k_motion_band_optimize_band_md_temp_control:
         fout.write("\t\t\t\t&END TEMP_CONTROL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_band_optimize_band_md_vel_control:
     def __init__(self):
@@ -343,21 +293,18 @@ class cp2k_motion_band_optimize_band_md_vel_control:
         fout.write("\t\t\t\t&END VEL_CONTROL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_band_optimize_band_md:
+    temp_control = lazy_section("cp2k_motion_band_optimize_band_md_temp_control", "TEMP_CONTROL")
+    vel_control = lazy_section("cp2k_motion_band_optimize_band_md_vel_control", "VEL_CONTROL")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.temp_control = cp2k_motion_band_optimize_band_md_temp_control()
-        self.vel_control = cp2k_motion_band_optimize_band_md_vel_control()
         # basic setting
 
     def to_input(self, fout):
@@ -368,32 +315,25 @@ class cp2k_motion_band_optimize_band_md:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.temp_control.status == True:
+        if section_active(self, "temp_control"):
             self.temp_contro.to_input(fout)
-        if self.vel_control.status == True:
+        if section_active(self, "vel_control"):
             self.vel_control.to_input(fout)
         fout.write("\t\t\t&END MD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "TEMP_CONTROL":
-                self.temp_control.set_params({item: params[item]})
-            elif item.split("-")[3] == "VEL_CONTROL":
-                self.vel_control.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_band_optimize_band:
+    diis = lazy_section("cp2k_motion_band_optimize_band_diis", "DIIS")
+    md = lazy_section("cp2k_motion_band_optimize_band_md", "MD")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.diis = cp2k_motion_band_optimize_band_diis()
-        self.md = cp2k_motion_band_optimize_band_md()
         # basic setting
 
     def to_input(self, fout):
@@ -404,22 +344,14 @@ class cp2k_motion_band_optimize_band:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.diis.status == True:
+        if section_active(self, "diis"):
             self.diis.to_input(fout)
-        if self.md.status == True:
+        if section_active(self, "md"):
             self.md.to_input(fout)
         fout.write("\t\t&END OPTIMIZE_BAND\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DIIS":
-                self.diis.set_params({item: params[item]})
-            elif item.split("-")[2] == "MD":
-                self.md.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_band_program_run_info_each:
@@ -440,20 +372,17 @@ class cp2k_motion_band_program_run_info_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_band_program_run_info:
+    each = lazy_section("cp2k_motion_band_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_band_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -464,18 +393,12 @@ class cp2k_motion_band_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_band_replica_coord:
@@ -496,11 +419,7 @@ class cp2k_motion_band_replica_coord:
         fout.write("\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_band_replica_velocity:
     def __init__(self):
@@ -520,20 +439,17 @@ class cp2k_motion_band_replica_velocity:
         fout.write("\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_band_replica:
+    coord = lazy_section("cp2k_motion_band_replica_coord", "COORD")
+    velocity = lazy_section("cp2k_motion_band_replica_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.coord = cp2k_motion_band_replica_coord()
-        self.velocity = cp2k_motion_band_replica_velocity()
         # basic setting
 
     def to_input(self, fout):
@@ -544,22 +460,14 @@ class cp2k_motion_band_replica:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t&END REPLICA\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "COORD":
-                self.coord.set_params({item: params[item]})
-            elif item.split("-")[2] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_band_replica_info_each:
     def __init__(self):
@@ -579,20 +487,17 @@ class cp2k_motion_band_replica_info_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_band_replica_info:
+    each = lazy_section("cp2k_motion_band_replica_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_band_replica_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -603,18 +508,12 @@ class cp2k_motion_band_replica_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END REPLICA_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_band_string_method:
     def __init__(self):
@@ -634,14 +533,21 @@ class cp2k_motion_band_string_method:
         fout.write("\t\t&END STRING_METHOD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_band:
+    banner = lazy_section("cp2k_motion_band_banner", "BANNER")
+    ci_neb = lazy_section("cp2k_motion_band_ci_neb", "CI_NEB")
+    convergence_control = lazy_section("cp2k_motion_band_convergence_control", "CONVERGENCE_CONTROL")
+    convergence_info = lazy_section("cp2k_motion_band_convergence_info", "CONVERGENCE_INFO")
+    energy = lazy_section("cp2k_motion_band_energy", "ENERGY")
+    optimize_band = lazy_section("cp2k_motion_band_optimize_band", "OPTIMIZE_BAND")
+    program_run_info = lazy_section("cp2k_motion_band_program_run_info", "PROGRAM_RUN_INFO")
+    replica = lazy_section("cp2k_motion_band_replica", "REPLICA")
+    replica_info = lazy_section("cp2k_motion_band_replica_info", "REPLICA_INFO")
+    string_method = lazy_section("cp2k_motion_band_string_method", "STRING_METHOD")
+
     def __init__(self):
         self.params = {
                 "ALIGN_FRAMES": None,
@@ -656,17 +562,6 @@ class cp2k_motion_band:
                 }
         self.status = False
 
-        self.banner = cp2k_motion_band_banner()
-        self.ci_neb = cp2k_motion_band_ci_neb()
-        self.convergence_control = cp2k_motion_band_convergence_control()
-        self.convergence_info = cp2k_motion_band_convergence_info()
-        self.energy = cp2k_motion_band_energy()
-        self.optimize_band = cp2k_motion_band_optimize_band()
-        self.program_run_info = cp2k_motion_band_program_run_info()
-        self.replica = cp2k_motion_band_replica()
-        self.replica_info = cp2k_motion_band_replica_info()
-        self.string_method = cp2k_motion_band_string_method()
-
         self.images = []
 
         self.params["BAND_TYPE"] = "CI-NEB"
@@ -683,27 +578,27 @@ class cp2k_motion_band:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.banner.status == True:
+        if section_active(self, "banner"):
             self.banner.to_input(fout)
-        if self.ci_neb.status == True:
+        if section_active(self, "ci_neb"):
             self.ci_neb.to_input(fout)
-        if self.convergence_control.status == True:
+        if section_active(self, "convergence_control"):
             self.convergence_control.to_input(fout)
-        if self.convergence_info.status == True:
+        if section_active(self, "convergence_info"):
             self.convergence_info.to_input(fout)
-        if self.energy.status == True:
+        if section_active(self, "energy"):
             self.energy.to_input(fout)
-        if self.optimize_band.status == True:
+        if section_active(self, "optimize_band"):
             self.optimize_band.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         for image in self.images:
             fout.write("\t\t&REPLICA\n")
             fout.write("\t\t\tCOORD_FILE_NAME %s\n" % image.file)
             fout.write("\t\t&END REPLICA\n")
-        if self.replica_info.status == True:
+        if section_active(self, "replica_info"):
             self.replica_info.to_input(fout)
-        if self.string_method.status == True:
+        if section_active(self, "string_method"):
             self.string_method.to_input(fout)
         fout.write("\t&END BAND\n")
 
@@ -714,28 +609,4 @@ class cp2k_motion_band:
             self.images.append(xyz)
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "BANNER":
-                self.banner.set_params({item: params[item]})
-            elif item.split("-")[1] == "CI_NEB":
-                self.ci_neb.set_params({item: params[item]})
-            elif item.split("-")[1] == "CONVERGENCE_CONTROL":
-                self.convergence_control.set_params({item: params[item]})
-            elif item.split("-")[1] == "CONVERGENCE_INFO":
-                self.convergence_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "ENERGY":
-                self.energy.set_params({item: params[item]})
-            elif item.split("-")[1] == "OPTIMIZE_BAND":
-                self.optimize_band.set_params({item: params[item]})
-            elif item.split("-")[1] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "REPLICA":
-                self.replica.set_params({item: params[item]})
-            elif item.split("-")[1] == "REPLICA_INFO":
-                self.replica_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "STRING_METHOD":
-                self.string_method.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 # ========================
 # CP2K / MOTION / CELL_OPT
 # ========================
@@ -22,20 +24,17 @@ class cp2k_motion_cell_opt_bfgs_restart_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_cell_opt_bfgs_restart:
+    each = lazy_section("cp2k_motion_cell_opt_bfgs_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_cell_opt_bfgs_restart_each()
         # basic setting
 
     def to_input(self, fout):
@@ -46,29 +45,23 @@ class cp2k_motion_cell_opt_bfgs_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_cell_opt_bfgs:
+    restart = lazy_section("cp2k_motion_cell_opt_bfgs_restart", "RESTART")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restart = cp2k_motion_cell_opt_bfgs_restart()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -77,18 +70,12 @@ class cp2k_motion_cell_opt_bfgs:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
         fout.write("\t\t&END BFGS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_cell_opt_cg_line_search_2pnt:
     def __init__(self):
@@ -107,11 +94,7 @@ class cp2k_motion_cell_opt_cg_line_search_2pnt:
         fout.write("\t\t\t\t&END 2PNT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_cell_opt_cg_line_search_gold:
@@ -131,21 +114,18 @@ class cp2k_motion_cell_opt_cg_line_search_gold:
         fout.write("\t\t\t\t&END GOLD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_cell_opt_cg_line_search:
+    _2pnt = lazy_section("cp2k_motion_cell_opt_cg_line_search_2pnt", "2PNT")
+    gold = lazy_section("cp2k_motion_cell_opt_cg_line_search_gold", "GOLD")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self._2pnt = cp2k_motion_cell_opt_cg_line_search_2pnt()
-        self.gold = cp2k_motion_cell_opt_cg_line_search_gold()
         # basic setting
 
     def to_input(self, fout):
@@ -156,34 +136,26 @@ class cp2k_motion_cell_opt_cg_line_search:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self._2pnt.status == True:
+        if section_active(self, "_2pnt"):
             self._2pnt.to_input(fout)
-        if self.gold.status == True:
+        if section_active(self, "gold"):
             self.gold.to_input(fout)
         fout.write("\t\t\t&END LINE_SEARCH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "2PNT":
-                slef._2pnt.set_params({item: params[item]})
-            elif item.split("-")[3] == "GOLD":
-                self.gold.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_cell_opt_cg:
+    line_serach = lazy_section("cp2k_motion_cell_opt_cg_line_search", "LINE_SEARCH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.line_serach = cp2k_motion_cell_opt_cg_line_search()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -197,13 +169,7 @@ class cp2k_motion_cell_opt_cg:
         fout.write("\t\t&END CG\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "LINE_SEARCH":
-                self.line_search.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_cell_opt_lbfgs:
@@ -223,11 +189,7 @@ class cp2k_motion_cell_opt_lbfgs:
         fout.write("\t\t&END LBFGS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_cell_opt_print_cell_each:
     def __init__(self):
@@ -246,20 +208,17 @@ class cp2k_motion_cell_opt_print_cell_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_cell_opt_print_cell:
+    each = lazy_section("cp2k_motion_cell_opt_print_cell_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_motion_cell_opt_print_cell_each()
         # basic setting
         self.params["FILENAME"] = "cell-every-ion-step"
 
@@ -274,11 +233,7 @@ class cp2k_motion_cell_opt_print_cell:
         fout.write("\t\t\t&END CELL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_cell_opt_print_program_run_info_each:
@@ -298,20 +253,17 @@ class cp2k_motion_cell_opt_print_program_run_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_cell_opt_print_program_run_info:
+    each = lazy_section("cp2k_motion_cell_opt_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_motion_cell_opt_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -325,24 +277,20 @@ class cp2k_motion_cell_opt_print_program_run_info:
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_cell_opt_print:
+    cell = lazy_section("cp2k_motion_cell_opt_print_cell", "CELL")
+    program_run_info = lazy_section("cp2k_motion_cell_opt_print_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.cell = cp2k_motion_cell_opt_print_cell()
-        self.program_run_info = cp2k_motion_cell_opt_print_program_run_info()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -351,26 +299,23 @@ class cp2k_motion_cell_opt_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cell.status == True:
+        if section_active(self, "cell"):
             self.cell.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CELL":
-                self.cell.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
 class cp2k_motion_cell_opt:
+    bfgs = lazy_section("cp2k_motion_cell_opt_bfgs", "BFGS")
+    cg = lazy_section("cp2k_motion_cell_opt_cg", "CG")
+    lbfgs = lazy_section("cp2k_motion_cell_opt_lbfgs", "LBFGS")
+    printout = lazy_section("cp2k_motion_cell_opt_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 "CONSTRAINT": None,
@@ -389,10 +334,6 @@ class cp2k_motion_cell_opt:
                 }
         self.status = False
 
-        self.bfgs = cp2k_motion_cell_opt_bfgs()
-        self.cg = cp2k_motion_cell_opt_cg()
-        self.lbfgs = cp2k_motion_cell_opt_lbfgs()
-        self.printout = cp2k_motion_cell_opt_print()
         # basic setting
         self.printout.status = True
         self.params["CONSTRAINT"] = "NONE"
@@ -407,7 +348,6 @@ class cp2k_motion_cell_opt:
         self.params["RMS_FORCE"] = 3.0e-4
         self.params["TYPE"] = "DIRECT_CELL_OPT"
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -416,30 +356,18 @@ class cp2k_motion_cell_opt:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.bfgs.status == True:
+        if section_active(self, "bfgs"):
             self.bfgs.to_input(fout)
-        if self.cg.status == True:
+        if section_active(self, "cg"):
             self.cg.to_input(fout)
-        if self.lbfgs.status == True:
+        if section_active(self, "lbfgs"):
             self.lbfgs.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t&END CELL_OPT\n")
     
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "BFGS":
-                self.bfgs.set_params({item: params[item]})
-            elif item.split("-")[1] == "CG":
-                self.cg.set_params({item: params[item]})
-            elif item.split("-")[1] == "LBFGS":
-                self.lbfgs.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
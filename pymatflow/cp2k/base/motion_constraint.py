@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 
 class cp2k_motion_constraint_collective_restraint:
@@ -20,18 +22,17 @@ class cp2k_motion_constraint_collective_restraint:
         fout.write("\t\t\t&END RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_constraint_collective:
+    restraint = lazy_section("cp2k_motion_constraint_collective_restraint", "RESTRAINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restraint = cp2k_motion_constraint_collective_restraint()
         # basic setting
 
     def to_input(self, fout):
@@ -42,18 +43,12 @@ class cp2k_motion_constraint_collective:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.restraint.status == True:
+        if section_active(self, "restraint"):
             self.restraint.to_input(fout)
         fout.write("\t\t&END COLLECTIVE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RESTRAINT":
-                self.restraint.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_constraint_colvar_restart:
@@ -73,9 +68,7 @@ class cp2k_motion_constraint_colvar_restart:
         fout.write("\t\t&END COLVAR_RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_constraint_constraint_info_each:
@@ -95,18 +88,17 @@ class cp2k_motion_constraint_constraint_info_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_constraint_constraint_info:
+    each = lazy_section("cp2k_motion_constraint_constraint_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_constraint_constraint_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -117,18 +109,12 @@ class cp2k_motion_constraint_constraint_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END CONSTRAINT_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_constraint_fixed_atoms_restraint:
     def __init__(self):
@@ -147,17 +133,16 @@ class cp2k_motion_constraint_fixed_atoms_restraint:
         fout.write("\t\t\t&END RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_constraint_fixed_atoms:
+    restraint = lazy_section("cp2k_motion_constraint_fixed_atoms_restraint", "RESTRAINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restraint = cp2k_motion_constraint_fixed_atoms_restraint()
         # basic setting
 
     def to_input(self, fout):
@@ -168,18 +153,12 @@ class cp2k_motion_constraint_fixed_atoms:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.restraint.status == True:
+        if section_active(self, "restraint"):
             self.restraint.to_input(fout)
         fout.write("\t\t&END FIXED_ATOMS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RESTRAINT":
-                self.restraint.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_constraint_fix_atom_restart:
     def __init__(self):
@@ -198,9 +177,7 @@ class cp2k_motion_constraint_fix_atom_restart:
         fout.write("\t\t&END FIX_ATOM_RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=2)
 
 class cp2k_motion_constraint_g3x3_restraint:
     def __init__(self):
@@ -219,18 +196,17 @@ class cp2k_motion_constraint_g3x3_restraint:
         fout.write("\t\t\t&END RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_constraint_g3x3:
+    restraint = lazy_section("cp2k_motion_constraint_g3x3_restraint", "RESTRAINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restraint = cp2k_motion_constraint_g3x3_restraint()
         # basic setting
 
     def to_input(self, fout):
@@ -241,18 +217,12 @@ class cp2k_motion_constraint_g3x3:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.restraint.status == True:
+        if section_active(self, "restraint"):
             self.restraint.to_input(fout)
         fout.write("\t\t&END G3X3\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RESTRAINT":
-                self.restraint.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_constraint_g4x6_restraint:
     def __init__(self):
@@ -271,18 +241,17 @@ class cp2k_motion_constraint_g4x6_restraint:
         fout.write("\t\t\t&END RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_constraint_g4x6:
+    restraint = lazy_section("cp2k_motion_constraint_g4x6_restraint", "RESTRAINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restraint = cp2k_motion_constraint_g4x6_restraint()
         # basic setting
 
     def to_input(self, fout):
@@ -293,18 +262,12 @@ class cp2k_motion_constraint_g4x6:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.restraint.status == True:
+        if section_active(self, "restraint"):
             self.restraint.to_input(fout)
         fout.write("\t\t&END G4X6\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RESTRAINT":
-                self.restraint.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_constraint_hbonds_restraint:
     def __init__(self):
@@ -323,18 +286,17 @@ class cp2k_motion_constraint_hbonds_restraint:
         fout.write("\t\t\t&END RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_constraint_hbonds:
+    restraint = lazy_section("cp2k_motion_constraint_hbonds_restraint", "RESTRAINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restraint = cp2k_motion_constraint_hbonds_restraint()
         # basic setting
 
     def to_input(self, fout):
@@ -345,18 +307,12 @@ class cp2k_motion_constraint_hbonds:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.restraint.status == True:
+        if section_active(self, "restraint"):
             self.restraint.to_input(fout)
         fout.write("\t\t&END HBONDS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RESTRAINT":
-                self.restraint.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_constraint_lagrange_multipliers_each:
     def __init__(self):
@@ -375,18 +331,17 @@ class cp2k_motion_constraint_lagrange_multipliers_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_constraint_lagrange_multipliers:
+    each = lazy_section("cp2k_motion_constraint_lagrange_multipliers_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_constraint_lagrange_multipliers_each()
         # basic setting
 
     def to_input(self, fout):
@@ -397,18 +352,12 @@ class cp2k_motion_constraint_lagrange_multipliers:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END LAGRANGE_MULTIPLIERS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_constraint_virtual_site_restraint:
@@ -428,17 +377,16 @@ class cp2k_motion_constraint_virtual_site_restraint:
         fout.write("\t\t\t&END RESTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_constraint_virtual_site:
+    restraint = lazy_section("cp2k_motion_constraint_virtual_site_restraint", "RESTRAINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restraint = cp2k_motion_constraint_virtual_site_restraint()
         # basic setting
 
     def to_input(self, fout):
@@ -449,22 +397,27 @@ class cp2k_motion_constraint_virtual_site:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.restraint.status == True:
+        if section_active(self, "restraint"):
             self.restraint.to_input(fout)
         fout.write("\t\t&END VIRTUAL_SITE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RESTRAINT":
-                self.restraint.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
 class cp2k_motion_constraint:
+    collective = lazy_section("cp2k_motion_constraint_collective", "COLLECTIVE")
+    colvar_restart = lazy_section("cp2k_motion_constraint_colvar_restart", "COLVAR_RESTART")
+    constraint_info = lazy_section("cp2k_motion_constraint_constraint_info", "CONSTRAINT_INFO")
+    fixed_atoms = lazy_section("cp2k_motion_constraint_fixed_atoms", "FIXED_ATOMS")
+    fix_atom_restart = lazy_section("cp2k_motion_constraint_fix_atom_restart", "FIX_ATOM_RESTART")
+    g3x3 = lazy_section("cp2k_motion_constraint_g3x3", "G3X3")
+    g4x6 = lazy_section("cp2k_motion_constraint_g4x6", "G4X6")
+    hbonds = lazy_section("cp2k_motion_constraint_hbonds", "HBONDS")
+    lagrange_multipliers = lazy_section("cp2k_motion_constraint_lagrange_multipliers", "LAGRANGE_MULTIPLIERS")
+    virtual_site = lazy_section("cp2k_motion_constraint_virtual_site", "VIRTUAL_SITE")
+
     def __init__(self):
         self.params = {
                 "CONSTRAINT_INIT": None,
@@ -473,17 +426,6 @@ class cp2k_motion_constraint:
                 }
         self.status = False
 
-        self.collective = cp2k_motion_constraint_collective()
-        self.colvar_restart = cp2k_motion_constraint_colvar_restart()
-        self.constraint_info = cp2k_motion_constraint_constraint_info()
-        self.fixed_atoms = cp2k_motion_constraint_fixed_atoms()
-        self.fix_atom_restart = cp2k_motion_constraint_fix_atom_restart()
-        self.g3x3 = cp2k_motion_constraint_g3x3()
-        self.g4x6 = cp2k_motion_constraint_g4x6()
-        self.hbonds = cp2k_motion_constraint_hbonds()
-        self.lagrange_multipliers = cp2k_motion_constraint_lagrange_multipliers()
-        self.virtual_site = cp2k_motion_constraint_virtual_site()
-            
         # basic setting
 
     def to_input(self, fout):
@@ -494,52 +436,28 @@ class cp2k_motion_constraint:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.collective.status == True:
+        if section_active(self, "collective"):
             self.collective.to_input(fout)
-        if self.colvar_restart.status == True:
+        if section_active(self, "colvar_restart"):
             self.colvar_restart.to_input(fout)
-        if self.constraint_info.status == True:
+        if section_active(self, "constraint_info"):
             self.constraitn_info.to_input(fout)
-        if self.fixed_atoms.status == True:
+        if section_active(self, "fixed_atoms"):
             self.fixed_atoms.to_input(fout)
-        if self.fix_atom_restart.status == True:
+        if section_active(self, "fix_atom_restart"):
             self.fix_atom_restart.to_input(fout)
-        if self.g3x3.status == True:
+        if section_active(self, "g3x3"):
             self.g3x3.to_input(fout)
-        if self.g4x6.status == True:
+        if section_active(self, "g4x6"):
             self.g4x6.to_input(fout)
-        if self.hbonds.status == True:
+        if section_active(self, "hbonds"):
             self.hbonds.to_input(fout)
-        if self.lagrange_multipliers.status == True:
+        if section_active(self, "lagrange_multipliers"):
             self.lagrange_multipliers.to_input(fout)
-        if self.virtual_site.status == True:
+        if section_active(self, "virtual_site"):
             self.virtual_site.to_input(fout)
         fout.write("\t&END CONSTRAINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "COLLECTIVE":
-                self.collective.set_params({item: params[item]})
-            elif item.split("-")[1] == "COLVAR_RESTART":
-                self.colvar_restart.set_params({item: params[item]})
-            elif item.split("-")[1] == "CONSTRAINT_INFO":
-                self.constraint_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "FIXED_ATOMS":
-                self.fixed_atoms.set_params({item: params[item]})
-            elif item.split("-")[1] == "FIX_ATOM_RESTART":
-                self.fix_atom_restart.set_params({item: params[item]})
-            elif item.split("-")[1] == "G3X3":
-                self.g3x3.set_params({item: params[item]})
-            elif item.split("-")[1] == "G4X6":
-                self.g4x6.set_params({item: params[item]})
-            elif item.split("-")[1] == "HBONDS":
-                self.hbonds.set_params({item: params[item]})
-            elif item.split("-")[1] == "LAGRANGE_MULTIPLIERS":
-                self.lagrange_multipliers.set_params({item: params[item]})
-            elif item.split("-")[1] == "VIRTUAL_SITE":
-                self.virtual_site.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
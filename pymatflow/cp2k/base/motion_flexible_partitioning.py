@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 class cp2k_motion_flexible_partitioning_control_each:
     def __init__(self):
         self.params = {
@@ -20,20 +22,17 @@ class cp2k_motion_flexible_partitioning_control_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_flexible_partitioning_control:
+    each = lazy_section("cp2k_motion_flexible_partitioning_control_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_motion_flexible_partitioning_control_each()
         # basic setting
 
     def to_input(self, fout):
@@ -44,19 +43,13 @@ class cp2k_motion_flexible_partitioning_control:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t&END CONTROL\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_flexible_partitioning_weights_each:
     def __init__(self):
@@ -77,20 +70,17 @@ class cp2k_motion_flexible_partitioning_weights_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_flexible_partitioning_weights:
+    each = lazy_section("cp2k_motion_flexible_partitioning_weights_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_motion_flexible_partitioning_weights_each()
         # basic setting
 
     def to_input(self, fout):
@@ -101,28 +91,23 @@ class cp2k_motion_flexible_partitioning_weights:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END WEIGHTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_flexible_partitioning:
+    control = lazy_section("cp2k_motion_flexible_partitioning_control", "CONTROL")
+    weights = lazy_section("cp2k_motion_flexible_partitioning_weights", "WEIGHTS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.control = cp2k_motion_flexible_partitioning_control()
-        self.weights = cp2k_motion_flexible_partitioning_weights()
         # basic setting
 
     def to_input(self, fout):
@@ -133,19 +118,11 @@ class cp2k_motion_flexible_partitioning:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.control.status == True:
+        if section_active(self, "control"):
             self.control.to_input(fout)
-        if self.weights.status == True:
+        if section_active(self, "weights"):
             self.weights.to_input(fout)
         fout.write("\t&END FLEXIBLE_PARTITIONING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "CONTROL":
-                self.control.set_params({item: params[item]})
-            elif item.split("-")[1] == "WEIGHTS":
-                self.weights.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 class cp2k_motion_free_energy_alchemical_change:
     def __init__(self):
@@ -18,11 +20,7 @@ class cp2k_motion_free_energy_alchemical_change:
         fout.write("\t\t&END ALCHEMICAL_CHANGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_free_energy_free_energy_info_each:
@@ -41,19 +39,16 @@ class cp2k_motion_free_energy_free_energy_info_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_free_energy_free_energy_info:
+    each = lazy_section("cp2k_motion_free_energy_free_energy_info_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_free_energy_free_energy_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -64,18 +59,12 @@ class cp2k_motion_free_energy_free_energy_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END FREE_ENERGY_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_free_energy_metadyn_ext_lagrange_fs:
@@ -94,11 +83,7 @@ class cp2k_motion_free_energy_metadyn_ext_lagrange_fs:
         fout.write("\t\t\t&END EXT_LAGRANGE_FS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_free_energy_metadyn_ext_lagrange_ss:
@@ -117,11 +102,7 @@ class cp2k_motion_free_energy_metadyn_ext_lagrange_ss:
         fout.write("\t\t\t&END EXT_LAGRANGE_SS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -141,11 +122,7 @@ class cp2k_motion_free_energy_metadyn_ext_lagrange_ss0:
         fout.write("\t\t\t&END EXT_LAGRANGE_SS0\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_free_energy_metadyn_ext_lagrange_vvp:
     def __init__(self):
@@ -163,11 +140,7 @@ class cp2k_motion_free_energy_metadyn_ext_lagrange_vvp:
         fout.write("\t\t\t&END EXT_LAGRANGE_VVP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_free_energy_metadyn_metavar_wall_gaussian:
     def __init__(self):
@@ -185,11 +158,7 @@ class cp2k_motion_free_energy_metadyn_metavar_wall_gaussian:
         fout.write("\t\t\t\t\t&END GAUSSIAN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_free_energy_metadyn_metavar_wall_quadratic:
     def __init__(self):
@@ -207,11 +176,7 @@ class cp2k_motion_free_energy_metadyn_metavar_wall_quadratic:
         fout.write("\t\t\t\t\t&END QUADRATIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_free_energy_metadyn_metavar_wall_quartic:
@@ -230,11 +195,7 @@ class cp2k_motion_free_energy_metadyn_metavar_wall_quartic:
         fout.write("\t\t\t\t\t&END QUARTIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_free_energy_metadyn_metavar_wall_reflective:
     def __init__(self):
@@ -252,21 +213,18 @@ class cp2k_motion_free_energy_metadyn_metavar_wall_reflective:
         fout.write("\t\t\t\t\t&END REFLECTIVE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_free_energy_metadyn_metavar_wall:
+    gaussian = lazy_section("cp2k_motion_free_energy_metadyn_metavar_wall_gaussian", "GAUSSIAN")
+    quadratic = lazy_section("cp2k_motion_free_energy_metadyn_metavar_wall_quadratic", "QUADRATIC")
+    quartic = lazy_section("cp2k_motion_free_energy_metadyn_metavar_wall_quartic", "QUARTIC")
+    reflective = lazy_section("cp2k_motion_free_energy_metadyn_metavar_wall_reflective", "REFLECTIVE")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.gaussian = cp2k_motion_free_energy_metadyn_metavar_wall_gaussian()
-        self.quadratic = cp2k_motion_free_energy_metadyn_metavar_wall_quadratic()
-        self.quartic = cp2k_motion_free_energy_metadyn_metavar_wall_quartic()
-        self.reflective = cp2k_motion_free_energy_metadyn_metavar_wall_reflective()
         # basic setting
 
     def to_input(self, fout):
@@ -277,38 +235,27 @@ class cp2k_motion_free_energy_metadyn_metavar_wall:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.gaussian.status == True:
+        if section_active(self, "gaussian"):
             self.gaussian.to_input(fout) 
-        if self.quadratic.status == True:
+        if section_active(self, "quadratic"):
             self.quadratic.to_input(fout)
-        if self.quartic.status == True:
+        if section_active(self, "quartic"):
             self.quartic.to_input(fout)
-        if self.reflective.status == True:
+        if section_active(self, "reflective"):
             self.reflective.to_input(fout)
         fout.write("\t\t\t\t&END WALL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "GAUSSIAN":
-                self.gaussian.set_params({item: params[item]})
-            elif item.split("-")[4] == "QUADRATIC":
-                self.quadratic.set_params({item: params[item]})
-            elif item.split("-")[4] == "QUARTIC":
-                self.quartic.set_params({item: params[item]})
-            elif item.split("-")[4] == "REFLECTIVE":
-                self.reflective.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_free_energy_metadyn_metavar:
+    wall = lazy_section("cp2k_motion_free_energy_metadyn_metavar_wall", "WALL")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.wall = cp2k_motion_free_energy_metadyn_metavar_wall()
         # basic setting
 
     def to_input(self, fout):
@@ -319,18 +266,12 @@ class cp2k_motion_free_energy_metadyn_metavar:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.wall.status == True:
+        if section_active(self, "wall"):
             self.wall.to_input(fout)
         fout.write("\t\t\t&END METAVAR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "WALL":
-                self.wall.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_free_energy_metadyn_multiple_walkers_walkers_file_name:
@@ -349,19 +290,16 @@ class cp2k_motion_free_energy_metadyn_multiple_walkers_walkers_file_name:
         fout.write("\t\t\t\t&END WALKERS_FILE_NAME\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_free_energy_metadyn_multiple_walkers:
+    walkers_file_name = lazy_section("cp2k_motion_free_energy_metadyn_multiple_walkers_walkers_file_name", "WALKERS_FILE_NAME")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.walkers_file_name = cp2k_motion_free_energy_metadyn_multiple_walkers_walkers_file_name()
         # basic setting
 
     def to_input(self, fout):
@@ -372,18 +310,12 @@ class cp2k_motion_free_energy_metadyn_multiple_walkers:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.walkers_file_name.status == True:
+        if section_active(self, "walkers_file_name"):
             self.walkers_file_name.to_input(fout)
         fout.write("\t\t\t&END MULTIPLE_WALKERS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "WALKERS_FILE_NAME":
-                self.walkers.file_name.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_free_energy_metadyn_print_colvar_each:
@@ -402,19 +334,16 @@ class cp2k_motion_free_energy_metadyn_print_colvar_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_free_energy_metadyn_print_colvar:
+    each = lazy_section("cp2k_motion_free_energy_metadyn_print_colvar_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_free_energy_metadyn_print_colvar_each()
         # basic setting
 
     def to_input(self, fout):
@@ -425,18 +354,12 @@ class cp2k_motion_free_energy_metadyn_print_colvar:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END COLVAR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_free_energy_metadyn_print_hills_each:
     def __init__(self):
@@ -454,19 +377,16 @@ class cp2k_motion_free_energy_metadyn_print_hills_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_free_energy_metadyn_print_hills:
+    each = lazy_section("cp2k_motion_free_energy_metadyn_print_hills_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_free_energy_metadyn_print_hills_each()
         # basic setting
 
     def to_input(self, fout):
@@ -477,18 +397,12 @@ class cp2k_motion_free_energy_metadyn_print_hills:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END HILLS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_free_energy_metadyn_print_program_run_info_each:
     def __init__(self):
@@ -506,19 +420,16 @@ class cp2k_motion_free_energy_metadyn_print_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_free_energy_metadyn_print_program_run_info:
+    each = lazy_section("cp2k_motion_free_energy_metadyn_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_free_energy_metadyn_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -529,18 +440,12 @@ class cp2k_motion_free_energy_metadyn_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_free_energy_metadyn_print_temperature_colvar_each:
     def __init__(self):
@@ -558,19 +463,16 @@ class cp2k_motion_free_energy_metadyn_print_temperature_colvar_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_free_energy_metadyn_print_temperature_colvar:
+    each = lazy_section("cp2k_motion_free_energy_metadyn_print_temperature_colvar_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_free_energy_metadyn_print_temperature_colvar_each()
         # basic setting
 
     def to_input(self, fout):
@@ -581,28 +483,23 @@ class cp2k_motion_free_energy_metadyn_print_temperature_colvar:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END TEMPERATURE_COLVAR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_free_energy_metadyn_print:
+    colvar = lazy_section("cp2k_motion_free_energy_metadyn_print_colvar", "COLVAR")
+    hills = lazy_section("cp2k_motion_free_energy_metadyn_print_hills", "HILLS")
+    program_run_info = lazy_section("cp2k_motion_free_energy_metadyn_print_program_run_info", "PROGRAM_RUN_INFO")
+    temperature_colvar = lazy_section("cp2k_motion_free_energy_metadyn_print_temperature_colvar", "TEMPERATURE_COLVAR")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.colvar = cp2k_motion_free_energy_metadyn_print_colvar()
-        self.hills = cp2k_motion_free_energy_metadyn_print_hills()
-        self.program_run_info = cp2k_motion_free_energy_metadyn_print_program_run_info()
-        self.temperature_colvar = cp2k_motion_free_energy_metadyn_print_temperature_colvar()
         # basic setting
 
     def to_input(self, fout):
@@ -613,30 +510,18 @@ class cp2k_motion_free_energy_metadyn_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.colvar.status == True:
+        if section_active(self, "colvar"):
             self.colvar.to_input(fout)
-        if self.hills.status == True:
+        if section_active(self, "hills"):
             self.hills.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.temperature_colvar.status == True:
+        if section_active(self, "temperature_colvar"):
             self.temperature_colvar.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "COLVAR":
-                self.colvar.set_params({item: params[item]})
-            elif item.split("-")[3] == "HILLS":
-                self.hills.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "TEMPERATURE_COLVAR":
-                self.temperature_colvar.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_free_energy_metadyn_spawned_hills_height:
     def __init__(self):
@@ -654,11 +539,7 @@ class cp2k_motion_free_energy_metadyn_spawned_hills_height:
         fout.write("\t\t\t&END SPAWNED_HILLS_HEIGHT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_free_energy_metadyn_spawned_hills_invdt:
     def __init__(self):
@@ -676,11 +557,7 @@ class cp2k_motion_free_energy_metadyn_spawned_hills_invdt:
         fout.write("\t\t\t&END SPAWNED_HILLS_INVDT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_free_energy_metadyn_spawned_hills_pos:
     def __init__(self):
@@ -698,11 +575,7 @@ class cp2k_motion_free_energy_metadyn_spawned_hills_pos:
         fout.write("\t\t\t&END SPAWNED_HILLS_POS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_free_energy_metadyn_spawned_hills_scale:
     def __init__(self):
@@ -720,30 +593,26 @@ class cp2k_motion_free_energy_metadyn_spawned_hills_scale:
         fout.write("\t\t\t&END SPAWNED_HILLS_SCALE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_free_energy_metadyn:
+    ext_lagrange_fs = lazy_section("cp2k_motion_free_energy_metadyn_ext_lagrange_fs", "EXT_LAGRANGE_FS")
+    ext_lagrange_ss = lazy_section("cp2k_motion_free_energy_metadyn_ext_lagrange_ss", "EXT_LAGRANGE_SS")
+    ext_lagrange_ss0 = lazy_section("cp2k_motion_free_energy_metadyn_ext_lagrange_ss0", "EXT_LAGRANGE_SS0")
+    ext_lagrange_vvp = lazy_section("cp2k_motion_free_energy_metadyn_ext_lagrange_vvp", "EXT_LAGRANGE_VVP")
+    metavar = lazy_section("cp2k_motion_free_energy_metadyn_metavar", "METAVAR")
+    multiple_walkers = lazy_section("cp2k_motion_free_energy_metadyn_multiple_walkers", "MULTIPLE_WALKERS")
+    printout = lazy_section("cp2k_motion_free_energy_metadyn_print", "PRINT")
+    spawned_hills_height = lazy_section("cp2k_motion_free_energy_metadyn_spawned_hills_height", "SPAWNED_HILLS_HEIGHT")
+    spawned_hills_invdt = lazy_section("cp2k_motion_free_energy_metadyn_spawned_hills_invdt", "SPAWNED_HILLS_INVDT")
+    spawned_hills_pos = lazy_section("cp2k_motion_free_energy_metadyn_spawned_hills_pos", "SPAWNED_HILLS_POS")
+    spawned_hills_scale = lazy_section("cp2k_motion_free_energy_metadyn_spawned_hills_scale", "SPAWNED_HILLS_SCALE")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-
-        self.ext_lagrange_fs = cp2k_motion_free_energy_metadyn_ext_lagrange_fs()
-        self.ext_lagrange_ss = cp2k_motion_free_energy_metadyn_ext_lagrange_ss()
-        self.ext_lagrange_ss0 = cp2k_motion_free_energy_metadyn_ext_lagrange_ss0()
-        self.ext_lagrange_vvp = cp2k_motion_free_energy_metadyn_ext_lagrange_vvp()
-        self.metavar = cp2k_motion_free_energy_metadyn_metavar()
-        self.multiple_walkers = cp2k_motion_free_energy_metadyn_multiple_walkers()
-        self.printout = cp2k_motion_free_energy_metadyn_print()
-        self.spawned_hills_height = cp2k_motion_free_energy_metadyn_spawned_hills_height()
-        self.spawned_hills_invdt = cp2k_motion_free_energy_metadyn_spawned_hills_invdt()
-        self.spawned_hills_pos = cp2k_motion_free_energy_metadyn_spawned_hills_pos()
-        self.spawned_hills_scale = cp2k_motion_free_energy_metadyn_spawned_hills_scale()
         # basic setting
 
     def to_input(self, fout):
@@ -754,58 +623,32 @@ class cp2k_motion_free_energy_metadyn:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.ext_lagrange_fs.status == True:
+        if section_active(self, "ext_lagrange_fs"):
             self.ext_lagrange_fs.to_input(fout)
-        if self.ext_lagrange_ss.status == True:
+        if section_active(self, "ext_lagrange_ss"):
             self.ext_lagrange_ss.to_input(fout)
-        if self.ext_lagrange_ss0.status == True:
+        if section_active(self, "ext_lagrange_ss0"):
             self.ext_lagrange_ss0.to_input(fout)
-        if self.ext_lagrange_vvp.status == True:
+        if section_active(self, "ext_lagrange_vvp"):
             self.ext_lagrange_vvp.to_input(fout)
-        if self.metavar.status == True:
+        if section_active(self, "metavar"):
             self.metavar.to_input(fout)
-        if self.multiple_walkers.status == True:
+        if section_active(self, "multiple_walkers"):
             self.multiple_walkers.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.spawned_hills_height.status == True:
+        if section_active(self, "spawned_hills_height"):
             self.spawned_hills_height.to_input(fout)
-        if self.spawned_hills_invdt.status == True:
+        if section_active(self, "spawned_hills_invdt"):
             self.spawned_hills_invdt.to_input(fout)
-        if self.spawned_hills_pos.status == True:
+        if section_active(self, "spawned_hills_pos"):
             self.spanwed_hills_pos.to_input(fout)
-        if self.spawned_hills_scale.status == True:
+        if section_active(self, "spawned_hills_scale"):
             self.spawned_hills_scale.to_input(fout)
         fout.write("\t\t&END METADYN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EXT_LAGRANGE_FS":
-                self.ext_lagrange_fs.set_params({item: params[item]})
-            elif item.split("-")[2] == "EXT_LAGRANGE_SS":
-                self.ext_lagrange_ss.set_params({item: params[item]})
-            elif item.split("-")[2] == "EXT_LAGRANGE_SS0":
-                self.ext_lagrange_ss0.set_params({item: params[item]})
-            elif item.split("-")[2] == "EXT_LAGRANGE_VVP":
-                self.ext_lagrange_vvp.set_params({item: params[item]})
-            elif item.split("-")[2] == "METAVAR":
-                self.metavar.set_params({item: params[item]})
-            elif item.split("-")[2] == "MULTIPLE_WALKERS":
-                self.multiple_walkers.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPAWNED_HILLS_HEIGHT":
-                self.spawned_hills_height.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPAWNED_HILLS_INVDT":
-                self.spawned_hills_invdt.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPAWNED_HILLS_POS":
-                self.spawned_hills_pos.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPANWED_HILLS_SCALE":
-                self.spawned_hills_scale.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_free_energy_umbrella_integration_convergence_control:
@@ -824,11 +667,7 @@ class cp2k_motion_free_energy_umbrella_integration_convergence_control:
         fout.write("\t\t\t&END CONVERGENCE_CONTROL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_free_energy_umbrella_integration_uvar:
     def __init__(self):
@@ -846,20 +685,17 @@ class cp2k_motion_free_energy_umbrella_integration_uvar:
         fout.write("\t\t\t&END UVAR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_free_energy_umbrella_integration:
+    convergence_control = lazy_section("cp2k_motion_free_energy_umbrella_integration_convergence_control", "CONVERGENCE_CONTROL")
+    uvar = lazy_section("cp2k_motion_free_energy_umbrella_integration_uvar", "UVAR")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.convergence_control = cp2k_motion_free_energy_umbrella_integration_convergence_control()
-        self.uvar = cp2k_motion_free_energy_umbrella_integration_uvar()
         # basic setting
 
     def to_input(self, fout):
@@ -870,33 +706,26 @@ class cp2k_motion_free_energy_umbrella_integration:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.convergence_control.status == True:
+        if section_active(self, "convergence_control"):
             self.convergence_control.to_input(fout)
-        if self.uvar.status == True:
+        if section_active(self, "uvar"):
             self.uvar.to_input(fout)
         fout.write("\t\t&END UMBRELLA_INTERGRATION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CONVERGENCE_CONTROL":
-                self.convergence_control.set_params({item: params[item]})
-            elif item.split("-")[2] == "UVAR":
-                self.uvar.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_free_energy:
+    alchemical_change = lazy_section("cp2k_motion_free_energy_alchemical_change", "ALCHEMICAL_CHANGE")
+    free_energy_info = lazy_section("cp2k_motion_free_energy_free_energy_info", "FREE_ENERGY_INFO")
+    metadyn = lazy_section("cp2k_motion_free_energy_metadyn", "METADYN")
+    umbrella_integration = lazy_section("cp2k_motion_free_energy_umbrella_integration", "UMBRELLA_INTEGRATION")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.alchemical_change = cp2k_motion_free_energy_alchemical_change()
-        self.free_energy_info = cp2k_motion_free_energy_free_energy_info()
-        self.metadyn = cp2k_motion_free_energy_metadyn()
-        self.umbrella_integration = cp2k_motion_free_energy_umbrella_integration()
         # basic setting
 
     def to_input(self, fout):
@@ -907,28 +736,16 @@ class cp2k_motion_free_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.alchemical_change.status == True:
+        if section_active(self, "alchemical_change"):
             self.alchmical_change.to_input(fout)
-        if self.free_energy_info.status == True:
+        if section_active(self, "free_energy_info"):
             self.free_energy_Info.to_input(fout)
-        if self.metadyn.status == True:
+        if section_active(self, "metadyn"):
             self.metadyn.to_input(fout)
-        if self.umbrella_integration.status == True:
+        if section_active(self, "umbrella_integration"):
             self.umbrella_integration.to_input(fout)
         fout.write("\t&END FREE_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "ALCHEMICAL_CHANGE":
-                self.alchemical_change.set_params({item: params[item]})
-            elif item.split("-")[1] == "FREE_ENERGY_INFO":
-                slef.free_energy_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "METADYN":
-                self.metadyn.set_params({item: params[item]})
-            elif item.split("-")[1] == "UMBRELLA_INTERGRATION":
-                self.umbrella_integration.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
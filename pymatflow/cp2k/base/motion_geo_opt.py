@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 class cp2k_motion_geo_opt_bfgs_restart_each:
     def __init__(self):
@@ -19,20 +21,17 @@ class cp2k_motion_geo_opt_bfgs_restart_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_geo_opt_bfgs_restart:
+    each = lazy_section("cp2k_motion_geo_opt_bfgs_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_geo_opt_bfgs_restart_each()
         # basic setting
 
     def to_input(self, fout):
@@ -43,29 +42,23 @@ class cp2k_motion_geo_opt_bfgs_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_geo_opt_bfgs:
+    restart = lazy_section("cp2k_motion_geo_opt_bfgs_restart", "RESTART")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restart = cp2k_motion_geo_opt_bfgs_restart()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -74,18 +67,12 @@ class cp2k_motion_geo_opt_bfgs:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
         fout.write("\t\t&END BFGS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_geo_opt_cg_line_search_2pnt:
     def __init__(self):
@@ -104,11 +91,7 @@ class cp2k_motion_geo_opt_cg_line_search_2pnt:
         fout.write("\t\t\t\t&END 2PNT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_geo_opt_cg_line_search_gold:
@@ -128,21 +111,18 @@ class cp2k_motion_geo_opt_cg_line_search_gold:
         fout.write("\t\t\t\t&END GOLD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_geo_opt_cg_line_search:
+    _2pnt = lazy_section("cp2k_motion_geo_opt_cg_line_search_2pnt", "2PNT")
+    gold = lazy_section("cp2k_motion_geo_opt_cg_line_search_gold", "GOLD")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self._2pnt = cp2k_motion_geo_opt_cg_line_search_2pnt()
-        self.gold = cp2k_motion_geo_opt_cg_line_search_gold()
         # basic setting
 
     def to_input(self, fout):
@@ -153,34 +133,26 @@ class cp2k_motion_geo_opt_cg_line_search:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self._2pnt.status == True:
+        if section_active(self, "_2pnt"):
             self._2pnt.to_input(fout)
-        if self.gold.status == True:
+        if section_active(self, "gold"):
             self.gold.to_input(fout)
         fout.write("\t\t\t&END LINE_SEARCH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "2PNT":
-                slef._2pnt.set_params({item: params[item]})
-            elif item.split("-")[3] == "GOLD":
-                self.gold.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_geo_opt_cg:
+    line_serach = lazy_section("cp2k_motion_geo_opt_cg_line_search", "LINE_SEARCH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.line_serach = cp2k_motion_geo_opt_cg_line_search()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -194,13 +166,7 @@ class cp2k_motion_geo_opt_cg:
         fout.write("\t\t&END CG\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "LINE_SEARCH":
-                self.line_search.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_geo_opt_lbfgs:
@@ -220,11 +186,7 @@ class cp2k_motion_geo_opt_lbfgs:
         fout.write("\t\t&END LBFGS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_geo_opt_print_program_run_info_each:
@@ -244,20 +206,17 @@ class cp2k_motion_geo_opt_print_program_run_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_geo_opt_print_program_run_info:
+    each = lazy_section("cp2k_motion_geo_opt_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_motion_geo_opt_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -268,30 +227,24 @@ class cp2k_motion_geo_opt_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_geo_opt_print:
+    program_run_info = lazy_section("cp2k_motion_geo_opt_print_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
     
-        self.program_run_info = cp2k_motion_geo_opt_print_program_run_info()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -300,18 +253,12 @@ class cp2k_motion_geo_opt_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_dimer_vector:
@@ -334,11 +281,7 @@ class cp2k_motion_geo_opt_transition_state_dimer_dimer_vector:
         fout.write("\t\t\t\t&END DIMER_VECTOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -364,20 +307,17 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs_restart_each:
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs_restart:
+    each = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs_restart_each()
         # basic setting
 
     def to_input(self, fout):
@@ -388,29 +328,23 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs:
+    restart = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs_restart", "RESTART")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.restart = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs_restart()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -419,18 +353,12 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_bfgs:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
         fout.write("\t\t\t\t\t&END BFGS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search_2pnt:
     def __init__(self):
@@ -449,11 +377,7 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search_2pnt:
         fout.write("\t\t\t\t\t\t\t&END 2PNT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search_gold:
@@ -473,21 +397,18 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search_gold:
         fout.write("\t\t\t\t\t\t\t&END GOLD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search:
+    _2pnt = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search_2pnt", "2PNT")
+    gold = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search_gold", "GOLD")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self._2pnt = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search_2pnt()
-        self.gold = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search_gold()
         # basic setting
 
     def to_input(self, fout):
@@ -498,34 +419,26 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self._2pnt.status == True:
+        if section_active(self, "_2pnt"):
             self._2pnt.to_input(fout)
-        if self.gold.status == True:
+        if section_active(self, "gold"):
             self.gold.to_input(fout)
         fout.write("\t\t\t\t\t\t&END LINE_SEARCH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "2PNT":
-                slef._2pnt.set_params({item: params[item]})
-            elif item.split("-")[6] == "GOLD":
-                self.gold.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg:
+    line_serach = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search", "LINE_SEARCH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.line_serach = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg_line_search()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -539,13 +452,7 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_cg:
         fout.write("\t\t\t\t\t&END CG\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "LINE_SEARCH":
-                self.line_search.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_lbfgs:
@@ -565,11 +472,7 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_lbfgs:
         fout.write("\t\t\t\t\t&END LBFGS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_program_run_info_each:
@@ -589,20 +492,17 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_program_run_info_
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_program_run_info:
+    each = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -616,11 +516,7 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_program_run_info:
         fout.write("\t\t\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_rotational_info_each:
@@ -640,20 +536,17 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_rotational_info_e
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_rotational_info:
+    each = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_rotational_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_rotational_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -664,31 +557,25 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_rotational_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&ENDROTATIONAL_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print:
+    program_run_info = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_program_run_info", "PROGRAM_RUN_INFO")
+    rotational_info = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_rotational_info", "ROTATIONAL_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
     
-        self.program_run_info = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_program_run_info()
-        self.rotational_info = cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print_rotational_info()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -697,38 +584,30 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.rotational_info.status == True:
+        if section_active(self, "rotational_info"):
             self.rotational_info.to_input(fout)
         fout.write("\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[5] == "ROTATIONAL_INFO":
-                self.rotational_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 
 class cp2k_motion_geo_opt_transition_state_dimer_rot_opt:
+    bfgs = lazy_section("cp2k_motion_geo_opt_bfgs", "BFGS")
+    cg = lazy_section("cp2k_motion_geo_opt_cg", "CG")
+    lbfgs = lazy_section("cp2k_motion_geo_opt_lbfgs", "LBFGS")
+    printout = lazy_section("cp2k_motion_geo_opt_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
     
-        self.bfgs = cp2k_motion_geo_opt_bfgs()
-        self.cg = cp2k_motion_geo_opt_cg()
-        self.lbfgs = cp2k_motion_geo_opt_lbfgs()
-        self.printout = cp2k_motion_geo_opt_print()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -737,42 +616,30 @@ class cp2k_motion_geo_opt_transition_state_dimer_rot_opt:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.bfgs.status == True:
+        if section_active(self, "bfgs"):
             self.bfgs.to_input(fout)
-        if self.cg.status == True:
+        if section_active(self, "cg"):
             self.cg.to_input(fout)
-        if self.lbfgs.status == True:
+        if section_active(self, "lbfgs"):
             self.lbfgs.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t&END ROT_OPT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "BFGS":
-                self.bfgs.set_params({item: params[item]})
-            elif item.split("-")[4] == "CG":
-                self.cg.set_params({item: params[item]})
-            elif item.split("-")[4] == "LBFGS":
-                self.lbfgs.set_params({item: params[item]})
-            elif item.split("-")[4] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_geo_opt_transition_state_dimer:
+    dimer_vector = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_dimer_vector", "DIMER_VECTOR")
+    rot_opt = lazy_section("cp2k_motion_geo_opt_transition_state_dimer_rot_opt", "ROT_OPT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
     
-        self.dimer_vector = cp2k_motion_geo_opt_transition_state_dimer_dimer_vector()
-        self.rot_opt = cp2k_motion_geo_opt_transition_state_dimer_rot_opt()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -781,33 +648,25 @@ class cp2k_motion_geo_opt_transition_state_dimer:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.dimer_vector.status == True:
+        if section_active(self, "dimer_vector"):
             self.dimer_vector.to_input(fout)
-        if self.rot_opt.status == True:
+        if section_active(self, "rot_opt"):
             self.rot_opt.to_input(fout)
         fout.write("\t\t\t&END DIMER\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DIMER_VECTOR":
-                self.dimer_vector.set_params({item: params[item]})
-            elif item.split("-")[3] == "ROT_OPT":
-                self.rot_opt.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_geo_opt_transition_state:
+    dimer = lazy_section("cp2k_motion_geo_opt_transition_state_dimer", "DIMER")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
     
-        self.dimer = cp2k_motion_geo_opt_transition_state_dimer()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -816,21 +675,21 @@ class cp2k_motion_geo_opt_transition_state:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.dimer.status == True:
+        if section_active(self, "dimer"):
             self.dimer.to_input(fout)
         fout.write("\t\t&END TRANSITION_STATE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DIMER":
-                self.dimer.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_geo_opt:
+    bfgs = lazy_section("cp2k_motion_geo_opt_bfgs", "BFGS")
+    cg = lazy_section("cp2k_motion_geo_opt_cg", "CG")
+    lbfgs = lazy_section("cp2k_motion_geo_opt_lbfgs", "LBFGS")
+    printout = lazy_section("cp2k_motion_geo_opt_print", "PRINT")
+    transition_state = lazy_section("cp2k_motion_geo_opt_transition_state", "TRANSITION_STATE")
+
     def __init__(self):
         self.params = {
                 "MAX_DR": None,
@@ -844,11 +703,6 @@ class cp2k_motion_geo_opt:
                 }
         self.status = False
         
-        self.bfgs = cp2k_motion_geo_opt_bfgs()
-        self.cg = cp2k_motion_geo_opt_cg()
-        self.lbfgs = cp2k_motion_geo_opt_lbfgs()
-        self.printout = cp2k_motion_geo_opt_print()
-        self.transition_state = cp2k_motion_geo_opt_transition_state()
         # basic setting
         self.params["MAX_DR"] = 3.0e-3
         self.params["MAX_FORCE"] = 4.5e-4
@@ -858,7 +712,6 @@ class cp2k_motion_geo_opt:
         self.params["RMS_FORCE"] = 3.0e-4
         self.params["TYPE"] = "MINIMIZATION"
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -867,32 +720,18 @@ class cp2k_motion_geo_opt:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.bfgs.status == True:
+        if section_active(self, "bfgs"):
             self.bfgs.to_input(fout)
-        if self.cg.status == True:
+        if section_active(self, "cg"):
             self.cg.to_input(fout)
-        if self.lbfgs.status == True:
+        if section_active(self, "lbfgs"):
             self.lbfgs.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.transition_state.status == True:
+        if section_active(self, "transition_state"):
             self.transition_state.to_input(fout)
         fout.write("\t&END GEO_OPT\n")
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "BFGS":
-                self.bfgs.set_params({item: params[item]})
-            elif item.split("-")[1] == "CG":
-                self.cg.set_params({item: params[item]})
-            elif item.split("-")[1] == "LBFGS":
-                self.lbfgs.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[1] == "TRANSITION_STATE":
-                self.transition_state.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
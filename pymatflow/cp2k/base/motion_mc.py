@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 
 class cp2k_motion_mc_avbmc:
@@ -19,11 +21,7 @@ class cp2k_motion_mc_avbmc:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_mc_max_displacements_box_probabilities:
@@ -42,11 +40,7 @@ class cp2k_motion_mc_max_displacements_box_probabilities:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_mc_max_displacements_mol_probabilities:
@@ -65,18 +59,15 @@ class cp2k_motion_mc_max_displacements_mol_probabilities:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_mc_max_displacements:
+    box_probabilities = lazy_section("cp2k_motion_mc_max_displacements_box_probabilities", "BOX_PROBABILITIES")
+    mol_Probabilities = lazy_section("cp2k_motion_mc_max_displacements_mol_probabilities", "MOL_PROBABILITIES")
+
     def __init__(self):
         self.status = False
 
-        self.box_probabilities = cp2k_motion_mc_max_displacements_box_probabilities()
-        self.mol_Probabilities = cp2k_motion_mc_max_displacements_mol_probabilities()
         # basic setting
 
     def to_input(self, fout):
@@ -87,7 +78,7 @@ class cp2k_motion_mc_max_displacements:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.box_probabilities.status == True:
+        if section_active(self, "box_probabilities"):
             self.box_probabilities.to_input(fout)
         if self.mol_probabilities.status == True:
             self.mol_probabilities.to_input(fout)
@@ -95,15 +86,7 @@ class cp2k_motion_mc_max_displacements:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BOX_PROBABILITIES":
-                self.box_probabilities.set_params({item: params[item]})
-            elif item.split("-")[2] == "MOL_PROBABILITIES":
-                self.mol_probabilities.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -123,11 +106,7 @@ class cp2k_motion_mc_move_probabilities_box_probabilities:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_mc_move_probabilities_mol_probabilities:
@@ -146,18 +125,15 @@ class cp2k_motion_mc_move_probabilities_mol_probabilities:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_mc_move_probabilities:
+    box_probabilities = lazy_section("cp2k_motion_mc_move_probabilities_box_probabilities", "BOX_PROBABILITIES")
+    mol_Probabilities = lazy_section("cp2k_motion_mc_move_probabilities_mol_probabilities", "MOL_PROBABILITIES")
+
     def __init__(self):
         self.status = False
 
-        self.box_probabilities = cp2k_motion_mc_move_probabilities_box_probabilities()
-        self.mol_Probabilities = cp2k_motion_mc_move_probabilities_mol_probabilities()
         # basic setting
 
     def to_input(self, fout):
@@ -168,7 +144,7 @@ class cp2k_motion_mc_move_probabilities:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.box_probabilities.status == True:
+        if section_active(self, "box_probabilities"):
             self.box_probabilities.to_input(fout)
         if self.mol_probabilities.status == True:
             self.mol_probabilities.to_input(fout)
@@ -176,15 +152,7 @@ class cp2k_motion_mc_move_probabilities:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BOX_PROBABILITIES":
-                self.box_probabilities.set_params({item: params[item]})
-            elif item.split("-")[2] == "MOL_PROBABILITIES":
-                self.mol_probabilities.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -204,21 +172,18 @@ class cp2k_motion_mc_move_updates:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_mc:
+    avmbc = lazy_section("cp2k_motion_mc_avbmc", "AVBMC")
+    max_displacements = lazy_section("cp2k_motion_mc_max_displacements", "MAX_DISPLACEMENTS")
+    move_probabilities = lazy_section("cp2k_motion_mc_move_probabilities", "MOVE_PROBABILITIES")
+    move_updates = lazy_section("cp2k_motion_mc_move_updates", "MOVE_UPDATES")
+
     def __init__(self):
         self.status = False
 
-        self.avmbc = cp2k_motion_mc_avbmc()
-        self.max_displacements = cp2k_motion_mc_max_displacements()
-        self.move_probabilities = cp2k_motion_mc_move_probabilities()
-        self.move_updates = cp2k_motion_mc_move_updates()
         # basic setting
 
     def to_input(self, fout):
@@ -231,27 +196,15 @@ class cp2k_motion_mc:
                 fout.write("\t\t%s %s\n" % (item, str(self.params[item])))
         if self.avbmc.status == True:
             self.avbmc.to_input(fout)
-        if self.max_displacements.status == True:
+        if section_active(self, "max_displacements"):
             self.max_displacements.to_input(fout)
-        if self.move_probabilities.status == True:
+        if section_active(self, "move_probabilities"):
             self.move_probabilities.to_input(fout)
-        if self.move_updates.status == True:
+        if section_active(self, "move_updates"):
             self.move_update.to_input(fout)
         fout.write("\t&END MC\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "AVBMC":
-                self.avbmc.set_params({item: params[item]})
-            elif item.split("-")[1] == "MAX_DISPLACEMENTS":
-                self.max_displacements.set_params({item: params[item]})
-            elif item.split("-")[1] == "MOVE_PROBABILITIES":
-                self.move_probabilities.set_params({item: params[item]})
-            elif item.split("-")[1] == "MOVE_UPDATE":
-                self.move_updates.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_define_region:
     def __init__(self):
@@ -16,9 +18,7 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_define_region:
         fout.write("\t\t\t\t&END_DEFINE_REGION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_coord:
@@ -37,11 +37,7 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_coord:
         fout.write("\t\t\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_force:
@@ -60,11 +56,7 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_force:
         fout.write("\t\t\t\t\t&END FORCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_mass:
     def __init__(self):
@@ -82,11 +74,7 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_mass:
         fout.write("\t\t\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_velocity:
     def __init__(self):
@@ -104,13 +92,14 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_velocity:
         fout.write("\t\t\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose:
+    coord = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_coord", "COORD")
+    force = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_force", "FORCE")
+    mass = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_mass", "MASS")
+    velocity = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 "LENGTH": None,
@@ -120,10 +109,6 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose:
                 }
         self.status = False
 
-        self.coord = cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_coord()
-        self.force = cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_force()
-        self.mass = cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_mass()
-        self.velocity = cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose_velocity()
         # basic setting
         self.params["LENGTH"] = 3
         self.params["MTS"] = 2
@@ -135,40 +120,29 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.force.status == True:
+        if section_active(self, "force"):
             self.force.to_input(fout)
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t\t\t&END NOSE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            elif item.split("-")[4] == "MASS":
-                self.mass.set_params({item: params[item]})
-            elif item.split("-")[4] == "FORCE":
-                self.force.set_params({item: params[item]})
-            elif item.split("-")[4] == "COORD":
-                self.coord.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_fast:
+    define_region = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast_define_region", "DEFINE_REGION")
+    nose = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose", "NOSE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.define_region = cp2k_motion_md_adiabatic_dynamics_thermostat_fast_define_region()
-        self.nose = cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose()
         # basic setting
 
     def to_input(self, fout):
@@ -176,22 +150,14 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_fast:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.define_region.status == True:
+        if section_active(self, "define_region"):
             self.defin_region.to_input(fout)
-        if self.nose.status == True:
+        if section_active(self, "nose"):
             self.nose.to_input(fout)
         fout.write("\t\t\t&END THERMOSTAT_FAST\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DEFINE_REGION":
-                self.define_region.set_params({item: params[item]})
-            elif item.split("-")[3] == "NOSE":
-                self.nose.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_define_region:
     def __init__(self):
@@ -207,9 +173,7 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_define_region:
         fout.write("\t\t\t\t&end define_region\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_coord:
@@ -228,11 +192,7 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_coord:
         fout.write("\t\t\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_force:
@@ -251,11 +211,7 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_force:
         fout.write("\t\t\t\t\t&END FORCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_mass:
     def __init__(self):
@@ -273,11 +229,7 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_mass:
         fout.write("\t\t\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_velocity:
     def __init__(self):
@@ -295,13 +247,14 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_velocity:
         fout.write("\t\t\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose:
+    coord = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_coord", "COORD")
+    force = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_force", "FORCE")
+    mass = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_mass", "MASS")
+    velocity = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 "LENGTH": None,
@@ -311,10 +264,6 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose:
                 }
         self.status = False
 
-        self.coord = cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_coord()
-        self.force = cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_force()
-        self.mass = cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_mass()
-        self.velocity = cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose_velocity()
         # basic setting
         self.params["LENGTH"] = 3
         self.params["MTS"] = 2
@@ -326,40 +275,29 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_slow_nose:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.force.status == True:
+        if section_active(self, "force"):
             self.force.to_input(fout)
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t\t\t&END NOSE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            elif item.split("-")[4] == "MASS":
-                self.mass.set_params({item: params[item]})
-            elif item.split("-")[4] == "FORCE":
-                self.force.set_params({item: params[item]})
-            elif item.split("-")[4] == "COORD":
-                self.coord.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_adiabatic_dynamics_thermostat_slow:
+    define_region = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast_define_region", "DEFINE_REGION")
+    nose = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose", "NOSE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.define_region = cp2k_motion_md_adiabatic_dynamics_thermostat_fast_define_region()
-        self.nose = cp2k_motion_md_adiabatic_dynamics_thermostat_fast_nose()
         # basic setting
 
     def to_input(self, fout):
@@ -367,32 +305,25 @@ class cp2k_motion_md_adiabatic_dynamics_thermostat_slow:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.define_region.status == True:
+        if section_active(self, "define_region"):
             self.defin_region.to_input(fout)
-        if self.nose.status == True:
+        if section_active(self, "nose"):
             self.nose.to_input(fout)
         fout.write("\t\t\t&END THERMOSTAT_SLOW\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DEFINE_REGION":
-                self.define_region.set_params({item: params[item]})
-            elif item.split("-")[3] == "NOSE":
-                self.nose.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_adiabatic_dynamics:
+    thermostat_fast = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_fast", "THERMOSTAT_FAST")
+    thermostat_slow = lazy_section("cp2k_motion_md_adiabatic_dynamics_thermostat_slow", "THERMOSTAT_SLOW")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.thermostat_fast = cp2k_motion_md_adiabatic_dynamics_thermostat_fast()
-        self.thermostat_slow = cp2k_motion_md_adiabatic_dynamics_thermostat_slow()
         # basic setting
 
     def to_input(self, fout):
@@ -400,22 +331,14 @@ class cp2k_motion_md_adiabatic_dynamics:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.thermostat_fast.status == True:
+        if section_active(self, "thermostat_fast"):
             self.thermostat_fast.to_input(fout)
-        if self.thermostat_slow.status == True:
+        if section_active(self, "thermostat_slow"):
             self.thermostat_slow.to_input(fout)
         fout.write("\t\t&END ADIABATIC_DYNAMICS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "THERMOSTAT_FAST":
-                self.thermostat_fast.set_params({item: params[item]})
-            elif item.split("-")[2] == "THERMOSTAT_SLOW":
-                self.thermostat_slow.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_md_averages_print_averages_each:
@@ -432,20 +355,17 @@ class cp2k_motion_md_averages_print_averages_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_averages_print_averages:
+    each = lazy_section("cp2k_motion_md_averages_print_averages_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_averages_print_averages_each()
         # basic setting
 
     def to_input(self, fout):
@@ -453,18 +373,12 @@ class cp2k_motion_md_averages_print_averages:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PRINT_AVERAGES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_md_averages_restart_averages:
     def __init__(self):
@@ -480,21 +394,18 @@ class cp2k_motion_md_averages_restart_averages:
         fout.write("\t\t\t&END RESTART_AVERAGES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_averages:
+    print_averages = lazy_section("cp2k_motion_md_averages_print_averages", "PRINT_AVERAGES")
+    restart_averages = lazy_section("cp2k_motion_md_averages_restart_averages", "RESTART_AVERAGES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.print_averages = cp2k_motion_md_averages_print_averages()
-        self.restart_averages = cp2k_motion_md_averages_restart_averages()
         # basic setting
 
     def to_input(self, fout):
@@ -502,22 +413,14 @@ class cp2k_motion_md_averages:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.print_averages.status == True:
+        if section_active(self, "print_averages"):
             self.print_averages.to_input(fout)
-        if self.restart_averages.status == True:
+        if section_active(self, "restart_averages"):
             self.restart_averages.to_input(fout)
         fout.write("\t\t&END AVERAGES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PRINT_AVERAGES":
-                self.print_averages.set_params({item: params[item]})
-            elif item.split("-")[2] == "RESTART_AVERAGES":
-                self.restart_averages.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -536,9 +439,7 @@ class cp2k_motion_md_barostat_mass:
         fout.write("\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_md_barostat_print_energy_each:
     def __init__(self):
@@ -554,18 +455,17 @@ class cp2k_motion_md_barostat_print_energy_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_barostat_print_energy:
+    each = lazy_section("cp2k_motion_md_barostat_print_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_barostat_print_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -576,18 +476,17 @@ class cp2k_motion_md_barostat_print_energy:
         fout.write("\t\t\t\t&END ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_barostat_print:
+    energy = lazy_section("cp2k_motion_md_barostat_print_energy", "ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.energy = cp2k_motion_md_barostat_print_energy()
         # basic setting
 
     def to_input(self, fout):
@@ -595,18 +494,12 @@ class cp2k_motion_md_barostat_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.energy.status == True:
+        if section_active(self, "energy"):
             self.energy.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "ENERGY":
-                self.energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_barostat_thermostat_ad_langevin_chi:
@@ -625,11 +518,7 @@ class cp2k_motion_md_barostat_thermostat_ad_langevin_chi:
         fout.write("\t\t\t\t\t&END CHI\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_ad_langevin_mass:
     def __init__(self):
@@ -647,21 +536,18 @@ class cp2k_motion_md_barostat_thermostat_ad_langevin_mass:
         fout.write("\t\t\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_barostat_thermostat_ad_langevin:
+    chi = lazy_section("cp2k_motion_md_barostat_thermostat_ad_langevin_chi", "CHI")
+    mass = lazy_section("cp2k_motion_md_barostat_thermostat_ad_langevin_mass", "MASS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.chi = cp2k_motion_md_barostat_thermostat_ad_langevin_chi()
-        self.mass = cp2k_motion_md_barostat_thermostat_ad_langevin_mass()
         # basic setting
 
     def to_input(self, fout):
@@ -669,22 +555,14 @@ class cp2k_motion_md_barostat_thermostat_ad_langevin:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.chi.status == True:
+        if section_active(self, "chi"):
             self.chi.to_input(fout)
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
         fout.write("\t\t\t\t&END AD_LANGEVIN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CHI":
-                self.chi.set_params({item: params[item]})
-            elif item.split("-")[4] == "MASS":
-                self.mass.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_barostat_thermostat_csvr_rng_init:
@@ -703,11 +581,7 @@ class cp2k_motion_md_barostat_thermostat_csvr_rng_init:
         fout.write("\t\t\t\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_csvr_thermostat_energy:
     def __init__(self):
@@ -725,21 +599,18 @@ class cp2k_motion_md_barostat_thermostat_csvr_thermostat_energy:
         fout.write("\t\t\t\t\t&END THERMOSTAT_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_barostat_thermostat_csvr:
+    rng_init = lazy_section("cp2k_motion_md_barostat_thermostat_csvr_rng_init", "RNG_INIT")
+    thermostat_energy = lazy_section("cp2k_motion_md_barostat_thermostat_csvr_thermostat_energy", "THERMOSTAT_ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.rng_init = cp2k_motion_md_barostat_thermostat_csvr_rng_init()
-        self.thermostat_energy = cp2k_motion_md_barostat_thermostat_csvr_thermostat_energy()
         # basic setting
 
     def to_input(self, fout):
@@ -747,22 +618,14 @@ class cp2k_motion_md_barostat_thermostat_csvr:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
-        if self.thermostat_energy.status == True:
+        if section_active(self, "thermostat_energy"):
             self.thermostat_energy.to_input(fout)
         fout.write("\t\t\t\t&END CSVR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            elif item.split("-")[4] == "THERMOSTAT_ENERGY":
-                self.thermostat_energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -782,11 +645,7 @@ class cp2k_motion_md_barostat_thermostat_gle_rng_init:
         fout.write("\t\t\t\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_gle_s:
     def __init__(self):
@@ -804,11 +663,7 @@ class cp2k_motion_md_barostat_thermostat_gle_s:
         fout.write("\t\t\t\t\t&END S\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_gle_thermostat_energy:
     def __init__(self):
@@ -826,48 +681,35 @@ class cp2k_motion_md_barostat_thermostat_gle_thermostat_energy:
         fout.write("\t\t\t\t\t&END THERMOSTAT_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_gle:
+    rng_init = lazy_section("cp2k_motion_md_barostat_thermostat_gle_rng_init", "RNG_INIT")
+    s = lazy_section("cp2k_motion_md_barostat_thermostat_gle_s", "S")
+    thermostat_energy = lazy_section("cp2k_motion_md_barostat_thermostat_gle_thermostat_energy", "THERMOSTAT_ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.rng_init = cp2k_motion_md_barostat_thermostat_gle_rng_init()
-        self.s = cp2k_motion_md_barostat_thermostat_gle_s()
-        self.thermostat_energy = cp2k_motion_md_barostat_thermostat_gle_thermostat_energy()
         # basic setting
-    
+
     def to_input(self, fout):
         fout.write("\t\t\t\t&GLE\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
-        if self.s.status == True:
+        if section_active(self, "s"):
             self.s.to_input(fout)
-        if self.thermostat_energy.status == True:
+        if section_active(self, "thermostat_energy"):
             self.thermostat_energy.to_input(fout)
         fout.write("\t\t\t\t&END GLE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            elif item.split("-")[4] == "S":
-                self.s.set_params({item: params[item]})
-            elif item.split("-")[4] == "THERMOSTAT_ENERGY":
-                self.thermostat_energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -887,11 +729,7 @@ class cp2k_motion_md_barostat_thermostat_nose_coord:
         fout.write("\t\t\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_barostat_thermostat_nose_force:
@@ -910,11 +748,7 @@ class cp2k_motion_md_barostat_thermostat_nose_force:
         fout.write("\t\t\t\t\t&END FORCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_nose_mass:
     def __init__(self):
@@ -932,11 +766,7 @@ class cp2k_motion_md_barostat_thermostat_nose_mass:
         fout.write("\t\t\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_nose_velocity:
     def __init__(self):
@@ -954,13 +784,14 @@ class cp2k_motion_md_barostat_thermostat_nose_velocity:
         fout.write("\t\t\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_nose:
+    coord = lazy_section("cp2k_motion_md_barostat_thermostat_nose_coord", "COORD")
+    force = lazy_section("cp2k_motion_md_barostat_thermostat_nose_force", "FORCE")
+    mass = lazy_section("cp2k_motion_md_barostat_thermostat_nose_mass", "MASS")
+    velocity = lazy_section("cp2k_motion_md_barostat_thermostat_nose_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 "LENGTH": None,
@@ -970,10 +801,6 @@ class cp2k_motion_md_barostat_thermostat_nose:
                 }
         self.status = False
 
-        self.coord = cp2k_motion_md_barostat_thermostat_nose_coord()
-        self.force = cp2k_motion_md_barostat_thermostat_nose_force()
-        self.mass = cp2k_motion_md_barostat_thermostat_nose_mass()
-        self.velocity = cp2k_motion_md_barostat_thermostat_nose_velocity()
         # basic setting
         self.params["LENGTH"] = 3
         self.params["MTS"] = 2
@@ -985,30 +812,18 @@ class cp2k_motion_md_barostat_thermostat_nose:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.force.status == True:
+        if section_active(self, "force"):
             self.force.to_input(fout)
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t\t\t&END NOSE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            elif item.split("-")[4] == "MASS":
-                self.mass.set_params({item: params[item]})
-            elif item.split("-")[4] == "FORCE":
-                self.force.set_params({item: params[item]})
-            elif item.split("-")[4] == "COORD":
-                self.coord.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_barostat_thermostat_print_energy_each:
@@ -1027,20 +842,17 @@ class cp2k_motion_md_barostat_thermostat_print_energy_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_md_barostat_thermostat_print_energy:
+    each = lazy_section("cp2k_motion_md_barostat_thermostat_print_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_barostat_thermostat_print_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1048,18 +860,12 @@ class cp2k_motion_md_barostat_thermostat_print_energy:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_barostat_thermostat_print_temperature_each:
     def __init__(self):
@@ -1077,20 +883,17 @@ class cp2k_motion_md_barostat_thermostat_print_temperature_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_md_barostat_thermostat_print_temperature:
+    each = lazy_section("cp2k_motion_md_barostat_thermostat_print_temperature_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_barostat_thermostat_print_temperature_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1098,18 +901,12 @@ class cp2k_motion_md_barostat_thermostat_print_temperature:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END TEMPERATURE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_barostat_thermostat_print_thermostat_info_each:
@@ -1128,20 +925,17 @@ class cp2k_motion_md_barostat_thermostat_print_thermostat_info_each:
         fout.write("\t\t\t\t\t\t&end EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_md_barostat_thermostat_print_thermostat_info:
+    each = lazy_section("cp2k_motion_md_barostat_thermostat_print_thermostat_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_barostat_thermostat_print_thermostat_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1149,29 +943,24 @@ class cp2k_motion_md_barostat_thermostat_print_thermostat_info:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END THERMOSTAT_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_barostat_thermostat_print:
+    energy = lazy_section("cp2k_motion_md_barostat_thermostat_print_energy", "ENERGY")
+    temperature = lazy_section("cp2k_motion_md_barostat_thermostat_print_temperature", "TEMPERATURE")
+    thermostat_info = lazy_section("cp2k_motion_md_barostat_thermostat_print_thermostat_info", "THERMOSTAT_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.energy = cp2k_motion_md_barostat_thermostat_print_energy()
-        self.temperature = cp2k_motion_md_barostat_thermostat_print_temperature()
-        self.thermostat_info = cp2k_motion_md_barostat_thermostat_print_thermostat_info()
         # basic setting
 
     def to_input(self, fout):
@@ -1179,29 +968,25 @@ class cp2k_motion_md_barostat_thermostat_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.energy.status == True:
+        if section_active(self, "energy"):
             self.energy.to_input(fout)
-        if self.temperature.status == True:
+        if section_active(self, "temperature"):
             self.temperature.to_input(fout)
-        if self.thermostat_info.status == True:
+        if section_active(self, "thermostat_info"):
             self.thermostat_info.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "ENERGY":
-                self.energy.set_params({item: params[item]})
-            elif item.split("-")[4] == "TEMPERATURE":
-                self.temperature.set_params({item: params[item]})
-            elif item.split("-")[4] == "THERMOSTAT_INFO":
-                self.thermostat_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_barostat_thermostat:
+    ad_langevin = lazy_section("cp2k_motion_md_barostat_thermostat_ad_langevin", "AD_LANGEVIN")
+    csvr = lazy_section("cp2k_motion_md_barostat_thermostat_csvr", "CSVR")
+    gle = lazy_section("cp2k_motion_md_barostat_thermostat_gle", "GLE")
+    nose = lazy_section("cp2k_motion_md_barostat_thermostat_nose", "NOSE")
+    printout = lazy_section("cp2k_motion_md_barostat_thermostat_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 "REGION": None,
@@ -1209,11 +994,6 @@ class cp2k_motion_md_barostat_thermostat:
                 }
         self.status = False
 
-        self.ad_langevin = cp2k_motion_md_barostat_thermostat_ad_langevin()
-        self.csvr = cp2k_motion_md_barostat_thermostat_csvr()
-        self.gle = cp2k_motion_md_barostat_thermostat_gle()
-        self.nose = cp2k_motion_md_barostat_thermostat_nose()
-        self.printout = cp2k_motion_md_barostat_thermostat_print()
         # basic setting
         self.params["TYPE"] = "NOSE"
 
@@ -1222,37 +1002,23 @@ class cp2k_motion_md_barostat_thermostat:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.ad_langevin.status == True:
+        if section_active(self, "ad_langevin"):
             self.add_langevin.to_input(fout)
-        if self.csvr.status == True:
+        if section_active(self, "csvr"):
             self.csvr.to_input(fout)
-        if self.gle.status == True:
+        if section_active(self, "gle"):
             self.gle.to_input(fout)
-        if self.nose.status == True:
+        if section_active(self, "nose"):
             self.nose.to_input(fout)
         if self.params["TYPE"].upper() == "NOSE":
             self.nose.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
 
         fout.write("\t\t\t&END THERMOSTAT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "ADD_LANGEVIN":
-                self.add_langevin.set_params({item: params[item]})
-            elif item.split("-")[3] == "CSVR":
-                self.csvr.set_params({item: params[item]})
-            elif item.split("-")[3] == "GLE":
-                self.gle.set_params({item: params[item]})
-            elif item.split("-")[3] == "NOSE":
-                self.nose.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -1270,21 +1036,20 @@ class cp2k_motion_md_barostat_velocity:
         fout.write("\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_barostat:
+    mass = lazy_section("cp2k_motion_md_barostat_mass", "MASS")
+    printout = lazy_section("cp2k_motion_md_barostat_print", "PRINT")
+    thermostat = lazy_section("cp2k_motion_md_barostat_thermostat", "THERMOSTAT")
+    velocity = lazy_section("cp2k_motion_md_barostat_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.mass = cp2k_motion_md_barostat_mass()
-        self.printout = cp2k_motion_md_barostat_print()
-        self.thermostat = cp2k_motion_md_barostat_thermostat()
-        self.velocity = cp2k_motion_md_barostat_velocity()
         # basic setting
 
     def to_input(self, fout):
@@ -1292,30 +1057,18 @@ class cp2k_motion_md_barostat:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.thermostat.status == True:
+        if section_active(self, "thermostat"):
             self.thermostat.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t&END BAROSTAT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "MASS":
-                self.mass.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[2] == "THERMOSTAT":
-                self.thermostat.set_params({item: params[item]})
-            elif item.split("-")[2] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_md_cascade_atom_list:
@@ -1332,18 +1085,17 @@ class cp2k_motion_md_cascade_atom_list:
         fout.write("\t\t\t&END ATOM_LIST\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_cascade:
+    atom_list = lazy_section("cp2k_motion_md_cascade_atom_list", "ATOM_LIST")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.atom_list = cp2k_motion_md_cascade_atom_list()
         # basic setting
 
     def to_input(self, fout):
@@ -1351,18 +1103,12 @@ class cp2k_motion_md_cascade:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.atom_list.status == True:
+        if section_active(self, "atom_list"):
             self.atom_list.to_input(fout)
         fout.write("\t\t&END CASCADE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "ATOM_LIST":
-                self.atom_list.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -1380,9 +1126,7 @@ class cp2k_motion_md_initial_vibration:
         fout.write("\t\t&END INITIAL_VIBRATION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_md_langevin:
@@ -1399,9 +1143,7 @@ class cp2k_motion_md_langevin:
         fout.write("\t\t&END LANGEVIN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_md_msst:
@@ -1418,9 +1160,7 @@ class cp2k_motion_md_msst:
         fout.write("\t\t&END MSST\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_md_print_center_of_mass_each:
@@ -1437,18 +1177,17 @@ class cp2k_motion_md_print_center_of_mass_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_print_center_of_mass:
+    each = lazy_section("cp2k_motion_md_print_center_of_mass_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_print_center_of_mass_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1459,13 +1198,7 @@ class cp2k_motion_md_print_center_of_mass:
         fout.write("\t\t\t&END CENTER_OF_MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_md_print_coefficients_each:
     def __init__(self):
@@ -1481,18 +1214,17 @@ class cp2k_motion_md_print_coefficients_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_print_coefficients:
+    each = lazy_section("cp2k_motion_md_print_coefficients_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_print_coefficients_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1500,18 +1232,12 @@ class cp2k_motion_md_print_coefficients:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END COEFFICIENTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -1529,18 +1255,17 @@ class cp2k_motion_md_print_energy_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_print_energy:
+    each = lazy_section("cp2k_motion_md_print_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_print_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1548,18 +1273,12 @@ class cp2k_motion_md_print_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_print_program_run_info_each:
@@ -1576,18 +1295,17 @@ class cp2k_motion_md_print_program_run_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_print_program_run_info:
+    each = lazy_section("cp2k_motion_md_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1595,18 +1313,12 @@ class cp2k_motion_md_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_md_print_rotational_info_each:
     def __init__(self):
@@ -1622,18 +1334,17 @@ class cp2k_motion_md_print_rotational_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_print_rotational_info:
+    each = lazy_section("cp2k_motion_md_print_rotational_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_print_rotational_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1641,18 +1352,12 @@ class cp2k_motion_md_print_rotational_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END ROTATIONAL_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_print_shell_energy_each:
@@ -1669,18 +1374,17 @@ class cp2k_motion_md_print_shell_energy_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_print_shell_energy:
+    each = lazy_section("cp2k_motion_md_print_shell_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_print_shell_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1688,18 +1392,12 @@ class cp2k_motion_md_print_shell_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END SHELL_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -1717,18 +1415,17 @@ class cp2k_motion_md_print_temp_kind_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_print_temp_kind:
+    each = lazy_section("cp2k_motion_md_print_temp_kind_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_print_temp_kind_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1736,18 +1433,12 @@ class cp2k_motion_md_print_temp_kind:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END TEMP_KIND\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_print_temp_shell_kind_each:
@@ -1764,18 +1455,17 @@ class cp2k_motion_md_print_temp_shell_kind_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_print_temp_shell_kind:
+    each = lazy_section("cp2k_motion_md_print_temp_shell_kind_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_print_temp_shell_kind_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1783,34 +1473,29 @@ class cp2k_motion_md_print_temp_shell_kind:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END TEMP_SHELL_KIND\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_print:
+    center_of_mass = lazy_section("cp2k_motion_md_print_center_of_mass", "CENTER_OF_MASS")
+    coefficients = lazy_section("cp2k_motion_md_print_coefficients", "COEFFICIENTS")
+    energy = lazy_section("cp2k_motion_md_print_energy", "ENERGY")
+    program_run_info = lazy_section("cp2k_motion_md_print_program_run_info", "PROGRAM_RUN_INFO")
+    rotational_info = lazy_section("cp2k_motion_md_print_rotational_info", "ROTATIONAL_INFO")
+    shell_energy = lazy_section("cp2k_motion_md_print_shell_energy", "SHELL_ENERGY")
+    temp_kind = lazy_section("cp2k_motion_md_print_temp_kind", "TEMP_KIND")
+    temp_shell_kind = lazy_section("cp2k_motion_md_print_temp_shell_kind", "TEMP_SHELL_KIND")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.center_of_mass = cp2k_motion_md_print_center_of_mass()
-        self.coefficients = cp2k_motion_md_print_coefficients()
-        self.energy = cp2k_motion_md_print_energy()
-        self.program_run_info = cp2k_motion_md_print_program_run_info()
-        self.rotational_info = cp2k_motion_md_print_rotational_info()
-        self.shell_energy = cp2k_motion_md_print_shell_energy()
-        self.temp_kind = cp2k_motion_md_print_temp_kind()
-        self.temp_shell_kind = cp2k_motion_md_print_temp_shell_kind()
         # basic setting
 
     def to_input(self, fout):
@@ -1818,46 +1503,26 @@ class cp2k_motion_md_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.center_of_mass.status == True:
+        if section_active(self, "center_of_mass"):
             self.center_of_mass.to_input(fout)
-        if self.coefficients.status == True:
+        if section_active(self, "coefficients"):
             self.coefficients.to_input(fout)
-        if self.energy.status == True:
+        if section_active(self, "energy"):
             self.energy.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.rotational_info.status == True:
+        if section_active(self, "rotational_info"):
             self.rotational_info.to_input(fout)
-        if self.shell_energy.status == True:
+        if section_active(self, "shell_energy"):
             self.shell_energy.to_input(fout)
-        if self.temp_kind.status == True:
+        if section_active(self, "temp_kind"):
             self.temp_kind.to_input(fout)
-        if self.temp_shell_kind.status == True:
+        if section_active(self, "temp_shell_kind"):
             self.temp_shell_kind.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CENTER_OF_MASS":
-                self.center_of_mass.set_params({item: params[item]})
-            elif item.split("-")[2] == "COEFFICIENTS":
-                self.coefficients.set_params({item: params[item]})
-            elif item.split("-")[2] == "ENERGY":
-                self.energy.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "ROTATIONAL_INFO":
-                self.rotational_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "SHELL_ENENRGY":
-                self.shell_energy.set_params({item: params[item]})
-            elif item.split("-")[2] == "TEMP_KIND":
-                self.temp_kind.set_params({item: params[item]})
-            elif item.split("-")[2] == "TEMP_SHELL_KIND":
-                self.temp_shell_kind.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_md_reftraj_msd_define_region:
     def __init__(self):
@@ -1873,20 +1538,17 @@ class cp2k_motion_md_reftraj_msd_define_region:
         fout.write("\t\t\t\t&END DEFINE_REGION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_reftraj_msd:
+    define_region = lazy_section("cp2k_motion_md_reftraj_msd_define_region", "DEFINE_REGION")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.define_region = cp2k_motion_md_reftraj_msd_define_region()
         # basic setting
 
     def to_input(self, fout):
@@ -1894,18 +1556,12 @@ class cp2k_motion_md_reftraj_msd:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.define_region.status == True:
+        if section_active(self, "define_region"):
             self.define_region.to_input(fout)
         fout.write("\t\t\t&END MSD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DEFINE_REGION":
-                self.define_region.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_md_reftraj_print_displaced_atom_each:
     def __init__(self):
@@ -1921,19 +1577,16 @@ class cp2k_motion_md_reftraj_print_displaced_atom_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_reftraj_print_displaced_atom:
+    each = lazy_section("cp2k_motion_md_reftraj_print_displaced_atom_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_reftraj_print_displaced_atom_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1941,18 +1594,12 @@ class cp2k_motion_md_reftraj_print_displaced_atom:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END DISPLACED_ATOM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_reftraj_print_msd_kind_each:
@@ -1969,19 +1616,16 @@ class cp2k_motion_md_reftraj_print_msd_kind_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_reftraj_print_msd_kind:
+    each = lazy_section("cp2k_motion_md_reftraj_print_msd_kind_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_reftraj_print_msd_kind_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1989,18 +1633,12 @@ class cp2k_motion_md_reftraj_print_msd_kind:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MSD_KIND\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_reftraj_print_msd_molecule_each:
@@ -2017,19 +1655,16 @@ class cp2k_motion_md_reftraj_print_msd_molecule_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_reftraj_print_msd_molecule:
+    each = lazy_section("cp2k_motion_md_reftraj_print_msd_molecule_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_reftraj_print_msd_molecule_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2037,28 +1672,23 @@ class cp2k_motion_md_reftraj_print_msd_molecule:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MSD_MOLECULE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_reftraj_print:
+    displaced_atom = lazy_section("cp2k_motion_md_reftraj_print_displaced_atom", "DISPLACED_ATOM")
+    msd_kind = lazy_section("cp2k_motion_md_reftraj_print_msd_kind", "MSD_KIND")
+    msd_molecule = lazy_section("cp2k_motion_md_reftraj_print_msd_molecule", "MSD_MOLECULE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.displaced_atom = cp2k_motion_md_reftraj_print_displaced_atom()
-        self.msd_kind = cp2k_motion_md_reftraj_print_msd_kind()
-        self.msd_molecule = cp2k_motion_md_reftraj_print_msd_molecule()
         # basic setting
 
     def to_input(self, fout):
@@ -2066,36 +1696,27 @@ class cp2k_motion_md_reftraj_print:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.displaced_atom.status == True:
+        if section_active(self, "displaced_atom"):
             self.displaced_atom.to_input(fout)
-        if self.msd_kind.status == True:
+        if section_active(self, "msd_kind"):
             self.msd_kind.to_input(fou)
-        if self.msd_molecule.status == True:
+        if section_active(self, "msd_molecule"):
             self.mds_molecul.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DISPLACED_ATOM":
-                self.displaced_atom.set_params({item: params[item]})
-            elif item.split("_")[3] == "MSD_KIND":
-                self.msd_kind.set_params({item: params[item]})
-            elif item.split("-")[3] == "MSD_MOLECULE":
-                self.msd_molecule.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_reftraj:
+    msd = lazy_section("cp2k_motion_md_reftraj_msd", "MSD")
+    printout = lazy_section("cp2k_motion_md_reftraj_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.msd = cp2k_motion_md_reftraj_msd()
-        self.printout = cp2k_motion_md_reftraj_print()
         # basic setting
 
     def to_input(self, fout):
@@ -2103,22 +1724,14 @@ class cp2k_motion_md_reftraj:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.msd.status == True:
+        if section_active(self, "msd"):
             self.msd.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t&end reftraj\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "MSD":
-                self.msd.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_param({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_md_respa:
@@ -2135,9 +1748,7 @@ class cp2k_motion_md_respa:
         fout.write("\t\t&END RESPA\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=2)
 
 
 
@@ -2160,11 +1771,7 @@ class cp2k_motion_md_shell_thermostat_ad_langevin_chi:
         fout.write("\t\t\t\t\t&END CHI\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_ad_langevin_mass:
     def __init__(self):
@@ -2182,21 +1789,18 @@ class cp2k_motion_md_shell_thermostat_ad_langevin_mass:
         fout.write("\t\t\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_shell_thermostat_ad_langevin:
+    chi = lazy_section("cp2k_motion_md_shell_thermostat_ad_langevin_chi", "CHI")
+    mass = lazy_section("cp2k_motion_md_shell_thermostat_ad_langevin_mass", "MASS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.chi = cp2k_motion_md_shell_thermostat_ad_langevin_chi()
-        self.mass = cp2k_motion_md_shell_thermostat_ad_langevin_mass()
         # basic setting
 
     def to_input(self, fout):
@@ -2204,22 +1808,14 @@ class cp2k_motion_md_shell_thermostat_ad_langevin:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.chi.status == True:
+        if section_active(self, "chi"):
             self.chi.to_input(fout)
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
         fout.write("\t\t\t\t&END AD_LANGEVIN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CHI":
-                self.chi.set_params({item: params[item]})
-            elif item.split("-")[4] == "MASS":
-                self.mass.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_shell_thermostat_csvr_rng_init:
@@ -2238,11 +1834,7 @@ class cp2k_motion_md_shell_thermostat_csvr_rng_init:
         fout.write("\t\t\t\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_csvr_thermostat_energy:
     def __init__(self):
@@ -2260,21 +1852,18 @@ class cp2k_motion_md_shell_thermostat_csvr_thermostat_energy:
         fout.write("\t\t\t\t\t&END THERMOSTAT_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_shell_thermostat_csvr:
+    rng_init = lazy_section("cp2k_motion_md_shell_thermostat_csvr_rng_init", "RNG_INIT")
+    thermostat_energy = lazy_section("cp2k_motion_md_shell_thermostat_csvr_thermostat_energy", "THERMOSTAT_ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.rng_init = cp2k_motion_md_shell_thermostat_csvr_rng_init()
-        self.thermostat_energy = cp2k_motion_md_shell_thermostat_csvr_thermostat_energy()
         # basic setting
 
     def to_input(self, fout):
@@ -2282,22 +1871,14 @@ class cp2k_motion_md_shell_thermostat_csvr:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
-        if self.thermostat_energy.status == True:
+        if section_active(self, "thermostat_energy"):
             self.thermostat_energy.to_input(fout)
         fout.write("\t\t\t\t&END CSVR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            elif item.split("-")[4] == "THERMOSTAT_ENERGY":
-                self.thermostat_energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_shell_thermostat_define_region:
@@ -2316,11 +1897,7 @@ class cp2k_motion_md_shell_thermostat_define_region:
         fout.write("\t\t\t\t&END DEFINE_REGION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_shell_thermostat_gle_rng_init:
@@ -2339,11 +1916,7 @@ class cp2k_motion_md_shell_thermostat_gle_rng_init:
         fout.write("\t\t\t\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_gle_s:
     def __init__(self):
@@ -2361,11 +1934,7 @@ class cp2k_motion_md_shell_thermostat_gle_s:
         fout.write("\t\t\t\t\t&END S\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_gle_thermostat_energy:
     def __init__(self):
@@ -2383,48 +1952,35 @@ class cp2k_motion_md_shell_thermostat_gle_thermostat_energy:
         fout.write("\t\t\t\t\t&END THERMOSTAT_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_gle:
+    rng_init = lazy_section("cp2k_motion_md_shell_thermostat_gle_rng_init", "RNG_INIT")
+    s = lazy_section("cp2k_motion_md_shell_thermostat_gle_s", "S")
+    thermostat_energy = lazy_section("cp2k_motion_md_shell_thermostat_gle_thermostat_energy", "THERMOSTAT_ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.rng_init = cp2k_motion_md_shell_thermostat_gle_rng_init()
-        self.s = cp2k_motion_md_shell_thermostat_gle_s()
-        self.thermostat_energy = cp2k_motion_md_shell_thermostat_gle_thermostat_energy()
         # basic setting
-    
+
     def to_input(self, fout):
         fout.write("\t\t\t\t&GLE\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
-        if self.s.status == True:
+        if section_active(self, "s"):
             self.s.to_input(fout)
-        if self.thermostat_energy.status == True:
+        if section_active(self, "thermostat_energy"):
             self.thermostat_energy.to_input(fout)
         fout.write("\t\t\t\t&END GLE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            elif item.split("-")[4] == "S":
-                self.s.set_params({item: params[item]})
-            elif item.split("-")[4] == "THERMOSTAT_ENERGY":
-                self.thermostat_energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -2444,11 +2000,7 @@ class cp2k_motion_md_shell_thermostat_nose_coord:
         fout.write("\t\t\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_shell_thermostat_nose_force:
@@ -2467,11 +2019,7 @@ class cp2k_motion_md_shell_thermostat_nose_force:
         fout.write("\t\t\t\t\t&END FORCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_nose_mass:
     def __init__(self):
@@ -2489,11 +2037,7 @@ class cp2k_motion_md_shell_thermostat_nose_mass:
         fout.write("\t\t\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_nose_velocity:
     def __init__(self):
@@ -2511,13 +2055,14 @@ class cp2k_motion_md_shell_thermostat_nose_velocity:
         fout.write("\t\t\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_nose:
+    coord = lazy_section("cp2k_motion_md_shell_thermostat_nose_coord", "COORD")
+    force = lazy_section("cp2k_motion_md_shell_thermostat_nose_force", "FORCE")
+    mass = lazy_section("cp2k_motion_md_shell_thermostat_nose_mass", "MASS")
+    velocity = lazy_section("cp2k_motion_md_shell_thermostat_nose_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 "LENGTH": None,
@@ -2527,10 +2072,6 @@ class cp2k_motion_md_shell_thermostat_nose:
                 }
         self.status = False
 
-        self.coord = cp2k_motion_md_shell_thermostat_nose_coord()
-        self.force = cp2k_motion_md_shell_thermostat_nose_force()
-        self.mass = cp2k_motion_md_shell_thermostat_nose_mass()
-        self.velocity = cp2k_motion_md_shell_thermostat_nose_velocity()
         # basic setting
         self.params["LENGTH"] = 3
         self.params["MTS"] = 2
@@ -2542,30 +2083,18 @@ class cp2k_motion_md_shell_thermostat_nose:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.force.status == True:
+        if section_active(self, "force"):
             self.force.to_input(fout)
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t\t\t&END NOSE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            elif item.split("-")[4] == "MASS":
-                self.mass.set_params({item: params[item]})
-            elif item.split("-")[4] == "FORCE":
-                self.force.set_params({item: params[item]})
-            elif item.split("-")[4] == "COORD":
-                self.coord.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_shell_thermostat_print_energy_each:
@@ -2584,20 +2113,17 @@ class cp2k_motion_md_shell_thermostat_print_energy_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_md_shell_thermostat_print_energy:
+    each = lazy_section("cp2k_motion_md_shell_thermostat_print_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_shell_thermostat_print_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2605,18 +2131,12 @@ class cp2k_motion_md_shell_thermostat_print_energy:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_shell_thermostat_print_temperature_each:
     def __init__(self):
@@ -2634,20 +2154,17 @@ class cp2k_motion_md_shell_thermostat_print_temperature_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_md_shell_thermostat_print_temperature:
+    each = lazy_section("cp2k_motion_md_shell_thermostat_print_temperature_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_shell_thermostat_print_temperature_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2655,18 +2172,12 @@ class cp2k_motion_md_shell_thermostat_print_temperature:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END TEMPERATURE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_shell_thermostat_print_thermostat_info_each:
@@ -2685,20 +2196,17 @@ class cp2k_motion_md_shell_thermostat_print_thermostat_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_motion_md_shell_thermostat_print_thermostat_info:
+    each = lazy_section("cp2k_motion_md_shell_thermostat_print_thermostat_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_shell_thermostat_print_thermostat_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2706,29 +2214,24 @@ class cp2k_motion_md_shell_thermostat_print_thermostat_info:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END THERMOSTAT_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_shell_thermostat_print:
+    energy = lazy_section("cp2k_motion_md_shell_thermostat_print_energy", "ENERGY")
+    temperature = lazy_section("cp2k_motion_md_shell_thermostat_print_temperature", "TEMPERATURE")
+    thermostat_info = lazy_section("cp2k_motion_md_shell_thermostat_print_thermostat_info", "THERMOSTAT_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.energy = cp2k_motion_md_shell_thermostat_print_energy()
-        self.temperature = cp2k_motion_md_shell_thermostat_print_temperature()
-        self.thermostat_info = cp2k_motion_md_shell_thermostat_print_thermostat_info()
         # basic setting
 
     def to_input(self, fout):
@@ -2736,29 +2239,26 @@ class cp2k_motion_md_shell_thermostat_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.energy.status == True:
+        if section_active(self, "energy"):
             self.energy.to_input(fout)
-        if self.temperature.status == True:
+        if section_active(self, "temperature"):
             self.temperature.to_input(fout)
-        if self.thermostat_info.status == True:
+        if section_active(self, "thermostat_info"):
             self.thermostat_info.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "ENERGY":
-                self.energy.set_params({item: params[item]})
-            elif item.split("-")[4] == "TEMPERATURE":
-                self.temperature.set_params({item: params[item]})
-            elif item.split("-")[4] == "THERMOSTAT_INFO":
-                self.thermostat_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_shell_thermostat:
+    ad_langevin = lazy_section("cp2k_motion_md_shell_thermostat_ad_langevin", "AD_LANGEVIN")
+    csvr = lazy_section("cp2k_motion_md_shell_thermostat_csvr", "CSVR")
+    define_region = lazy_section("cp2k_motion_md_shell_thermostat_define_region", "DEFINE_REGION")
+    gle = lazy_section("cp2k_motion_md_shell_thermostat_gle", "GLE")
+    nose = lazy_section("cp2k_motion_md_shell_thermostat_nose", "NOSE")
+    printout = lazy_section("cp2k_motion_md_shell_thermostat_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 "REGION": None,
@@ -2766,12 +2266,6 @@ class cp2k_motion_md_shell_thermostat:
                 }
         self.status = False
 
-        self.ad_langevin = cp2k_motion_md_shell_thermostat_ad_langevin()
-        self.csvr = cp2k_motion_md_shell_thermostat_csvr()
-        self.define_region = cp2k_motion_md_shell_thermostat_define_region()
-        self.gle = cp2k_motion_md_shell_thermostat_gle()
-        self.nose = cp2k_motion_md_shell_thermostat_nose()
-        self.printout = cp2k_motion_md_shell_thermostat_print()
         # basic setting
         self.params["TYPE"] = "NOSE"
 
@@ -2780,50 +2274,35 @@ class cp2k_motion_md_shell_thermostat:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.ad_langevin.status == True:
+        if section_active(self, "ad_langevin"):
             self.add_langevin.to_input(fout)
-        if self.csvr.status == True:
+        if section_active(self, "csvr"):
             self.csvr.to_input(fout)
-        if self.define_region.status == True:
+        if section_active(self, "define_region"):
             self.define_region.to_input(fout)
-        if self.gle.status == True:
+        if section_active(self, "gle"):
             self.gle.to_input(fout)
-        if self.nose.status == True:
+        if section_active(self, "nose"):
             self.nose.to_input(fout)
         if self.params["TYPE"].upper() == "NOSE":
             self.nose.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
 
         fout.write("\t\t&END THERMOSTAT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "ADD_LANGEVIN":
-                self.add_langevin.set_params({item: params[item]})
-            elif item.split("-")[3] == "CSVR":
-                self.csvr.set_params({item: params[item]})
-            elif item.split("-")[3] == "DEFINE_REGION":
-                self.define_region.set_params({item: params[item]})
-            elif item.split("-")[3] == "GLE":
-                self.gle.set_params({item: params[item]})
-            elif item.split("-")[3] == "NOSE":
-                self.nose.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_shell:
+    thermostat = lazy_section("cp2k_motion_md_shell_thermostat", "THERMOSTAT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.thermostat = cp2k_motion_md_shell_thermostat()
         # basic setting
 
     def to_input(self, fout):
@@ -2831,16 +2310,12 @@ class cp2k_motion_md_shell:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.thermostat.status == True:
+        if section_active(self, "thermostat"):
             self.thermostat.to_input(fout)
         fout.write("\t\t&END SHELL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "THERMOSTAT":
-                self.thermostat.set_params({item: params[item]})
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_md_thermal_region_define_region:
@@ -2857,11 +2332,7 @@ class cp2k_motion_md_thermal_region_define_region:
         fout.write("\t\t\t&END DEFINE_REGION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_md_thermal_region_print_langevin_regions_each:
     def __init__(self):
@@ -2877,19 +2348,16 @@ class cp2k_motion_md_thermal_region_print_langevin_regions_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_thermal_region_print_langevin_regions:
+    each = lazy_section("cp2k_motion_md_thermal_region_print_langevin_regions_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_thermal_region_print_langevin_regions_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2897,18 +2365,12 @@ class cp2k_motion_md_thermal_region_print_langevin_regions:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END LANGEVIN_REGIONS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermal_region_print_temperature_each:
     def __init__(self):
@@ -2924,19 +2386,16 @@ class cp2k_motion_md_thermal_region_print_temperature_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_motion_md_thermal_region_print_temperature:
+    each = lazy_section("cp2k_motion_md_thermal_region_print_temperature_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_md_thermal_region_print_temperature_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2944,28 +2403,23 @@ class cp2k_motion_md_thermal_region_print_temperature:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END TEMPERATURE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_thermal_region_print:
+    langevin_regions = lazy_section("cp2k_motion_md_thermal_region_print_langevin_regions", "LANGEVIN_REGIONS")
+    temperature = lazy_section("cp2k_motion_md_thermal_region_print_temperature", "TEMPERATURE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.langevin_regions = cp2k_motion_md_thermal_region_print_langevin_regions()
-        self.temperature = cp2k_motion_md_thermal_region_print_temperature()
         # basic setting
 
     def to_input(self, fout):
@@ -2973,32 +2427,25 @@ class cp2k_motion_md_thermal_region_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.langevin_regions.status == True:
+        if section_active(self, "langevin_regions"):
             self.langevin_region.to_input(fout)
-        if self.temperature.status == True:
+        if section_active(self, "temperature"):
             self.temperature.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "LANGEVIN_REGIONS":
-                self.langevin_regions.set_params({item: params[item]})
-            elif item.split("-")[3] == "TEMPERATURE":
-                self.temperature.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_thermal_region:
+    define_region = lazy_section("cp2k_motion_md_thermal_region_define_region", "DEFINE_REGION")
+    printout = lazy_section("cp2k_motion_md_thermal_region_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.define_region = cp2k_motion_md_thermal_region_define_region()
-        self.printout = cp2k_motion_md_thermal_region_print()
         # basic setting
 
     def to_input(self, fout):
@@ -3006,22 +2453,14 @@ class cp2k_motion_md_thermal_region:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.define_region.status == True:
+        if section_active(self, "define_region"):
             self.define_region.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t&END THERMAL_REGION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DEFINE_REGION":
-                self.define_region.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRITN":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_md_thermostat_ad_langevin_chi:
     def __init__(self):
@@ -3039,11 +2478,7 @@ class cp2k_motion_md_thermostat_ad_langevin_chi:
         fout.write("\t\t\t\t&END CHI\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_ad_langevin_mass:
     def __init__(self):
@@ -3061,21 +2496,18 @@ class cp2k_motion_md_thermostat_ad_langevin_mass:
         fout.write("\t\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_thermostat_ad_langevin:
+    chi = lazy_section("cp2k_motion_md_thermostat_ad_langevin_chi", "CHI")
+    mass = lazy_section("cp2k_motion_md_thermostat_ad_langevin_mass", "MASS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.chi = cp2k_motion_md_thermostat_ad_langevin_chi()
-        self.mass = cp2k_motion_md_thermostat_ad_langevin_mass()
         # basic setting
 
     def to_input(self, fout):
@@ -3083,22 +2515,14 @@ class cp2k_motion_md_thermostat_ad_langevin:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.chi.status == True:
+        if section_active(self, "chi"):
             self.chi.to_input(fout)
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
         fout.write("\t\t\t&END AD_LANGEVIN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CHI":
-                self.chi.set_params({item: params[item]})
-            elif item.split("-")[3] == "MASS":
-                self.mass.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_thermostat_csvr_rng_init:
@@ -3117,11 +2541,7 @@ class cp2k_motion_md_thermostat_csvr_rng_init:
         fout.write("\t\t\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_csvr_thermostat_energy:
     def __init__(self):
@@ -3139,21 +2559,18 @@ class cp2k_motion_md_thermostat_csvr_thermostat_energy:
         fout.write("\t\t\t\t&END THERMOSTAT_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_thermostat_csvr:
+    rng_init = lazy_section("cp2k_motion_md_thermostat_csvr_rng_init", "RNG_INIT")
+    thermostat_energy = lazy_section("cp2k_motion_md_thermostat_csvr_thermostat_energy", "THERMOSTAT_ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.rng_init = cp2k_motion_md_thermostat_csvr_rng_init()
-        self.thermostat_energy = cp2k_motion_md_thermostat_csvr_thermostat_energy()
         # basic setting
 
     def to_input(self, fout):
@@ -3161,22 +2578,14 @@ class cp2k_motion_md_thermostat_csvr:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
-        if self.thermostat_energy.status == True:
+        if section_active(self, "thermostat_energy"):
             self.thermostat_energy.to_input(fout)
         fout.write("\t\t\t&END CSVR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            elif item.split("-")[3] == "THERMOSTAT_ENERGY":
-                self.thermostat_energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_thermostat_define_region:
@@ -3195,11 +2604,7 @@ class cp2k_motion_md_thermostat_define_region:
         fout.write("\t\t\t&END DEFINE_REGION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_thermostat_gle_rng_init:
@@ -3218,11 +2623,7 @@ class cp2k_motion_md_thermostat_gle_rng_init:
         fout.write("\t\t\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_gle_s:
     def __init__(self):
@@ -3240,11 +2641,7 @@ class cp2k_motion_md_thermostat_gle_s:
         fout.write("\t\t\t\t&END S\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_gle_thermostat_energy:
     def __init__(self):
@@ -3262,48 +2659,35 @@ class cp2k_motion_md_thermostat_gle_thermostat_energy:
         fout.write("\t\t\t\t&END THERMOSTAT_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_gle:
+    rng_init = lazy_section("cp2k_motion_md_thermostat_gle_rng_init", "RNG_INIT")
+    s = lazy_section("cp2k_motion_md_thermostat_gle_s", "S")
+    thermostat_energy = lazy_section("cp2k_motion_md_thermostat_gle_thermostat_energy", "THERMOSTAT_ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.rng_init = cp2k_motion_md_thermostat_gle_rng_init()
-        self.s = cp2k_motion_md_thermostat_gle_s()
-        self.thermostat_energy = cp2k_motion_md_thermostat_gle_thermostat_energy()
         # basic setting
-    
+
     def to_input(self, fout):
         fout.write("\t\t\t&GLE\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
-        if self.s.status == True:
+        if section_active(self, "s"):
             self.s.to_input(fout)
-        if self.thermostat_energy.status == True:
+        if section_active(self, "thermostat_energy"):
             self.thermostat_energy.to_input(fout)
         fout.write("\t\t\t&END GLE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            elif item.split("-")[3] == "S":
-                self.s.set_params({item: params[item]})
-            elif item.split("-")[3] == "THERMOSTAT_ENERGY":
-                self.thermostat_energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -3323,11 +2707,7 @@ class cp2k_motion_md_thermostat_nose_coord:
         fout.write("\t\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_thermostat_nose_force:
@@ -3346,11 +2726,7 @@ class cp2k_motion_md_thermostat_nose_force:
         fout.write("\t\t\t\t&END FORCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_nose_mass:
     def __init__(self):
@@ -3368,11 +2744,7 @@ class cp2k_motion_md_thermostat_nose_mass:
         fout.write("\t\t\t\t&END MASS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_nose_velocity:
     def __init__(self):
@@ -3390,13 +2762,14 @@ class cp2k_motion_md_thermostat_nose_velocity:
         fout.write("\t\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_nose:
+    coord = lazy_section("cp2k_motion_md_thermostat_nose_coord", "COORD")
+    force = lazy_section("cp2k_motion_md_thermostat_nose_force", "FORCE")
+    mass = lazy_section("cp2k_motion_md_thermostat_nose_mass", "MASS")
+    velocity = lazy_section("cp2k_motion_md_thermostat_nose_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 "LENGTH": None,
@@ -3406,10 +2779,6 @@ class cp2k_motion_md_thermostat_nose:
                 }
         self.status = False
 
-        self.coord = cp2k_motion_md_thermostat_nose_coord()
-        self.force = cp2k_motion_md_thermostat_nose_force()
-        self.mass = cp2k_motion_md_thermostat_nose_mass()
-        self.velocity = cp2k_motion_md_thermostat_nose_velocity()
         # basic setting
         self.params["LENGTH"] = 3
         self.params["MTS"] = 2
@@ -3421,30 +2790,18 @@ class cp2k_motion_md_thermostat_nose:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.force.status == True:
+        if section_active(self, "force"):
             self.force.to_input(fout)
-        if self.mass.status == True:
+        if section_active(self, "mass"):
             self.mass.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t\t&END NOSE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            elif item.split("-")[3] == "MASS":
-                self.mass.set_params({item: params[item]})
-            elif item.split("-")[3] == "FORCE":
-                self.force.set_params({item: params[item]})
-            elif item.split("-")[3] == "COORD":
-                self.coord.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_thermostat_print_energy_each:
@@ -3463,20 +2820,17 @@ class cp2k_motion_md_thermostat_print_energy_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_thermostat_print_energy:
+    each = lazy_section("cp2k_motion_md_thermostat_print_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_thermostat_print_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3484,18 +2838,12 @@ class cp2k_motion_md_thermostat_print_energy:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_md_thermostat_print_temperature_each:
     def __init__(self):
@@ -3513,20 +2861,17 @@ class cp2k_motion_md_thermostat_print_temperature_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_thermostat_print_temperature:
+    each = lazy_section("cp2k_motion_md_thermostat_print_temperature_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_thermostat_print_temperature_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3534,18 +2879,12 @@ class cp2k_motion_md_thermostat_print_temperature:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END TEMPERATURE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_thermostat_print_thermostat_info_each:
@@ -3564,20 +2903,17 @@ class cp2k_motion_md_thermostat_print_thermostat_info_each:
         fout.write("\t\t\t\t\t&end EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_md_thermostat_print_thermostat_info:
+    each = lazy_section("cp2k_motion_md_thermostat_print_thermostat_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.each = cp2k_motion_md_thermostat_print_thermostat_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3585,29 +2921,24 @@ class cp2k_motion_md_thermostat_print_thermostat_info:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END THERMOSTAT_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_md_thermostat_print:
+    energy = lazy_section("cp2k_motion_md_thermostat_print_energy", "ENERGY")
+    temperature = lazy_section("cp2k_motion_md_thermostat_print_temperature", "TEMPERATURE")
+    thermostat_info = lazy_section("cp2k_motion_md_thermostat_print_thermostat_info", "THERMOSTAT_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.energy = cp2k_motion_md_thermostat_print_energy()
-        self.temperature = cp2k_motion_md_thermostat_print_temperature()
-        self.thermostat_info = cp2k_motion_md_thermostat_print_thermostat_info()
         # basic setting
 
     def to_input(self, fout):
@@ -3615,29 +2946,26 @@ class cp2k_motion_md_thermostat_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.energy.status == True:
+        if section_active(self, "energy"):
             self.energy.to_input(fout)
-        if self.temperature.status == True:
+        if section_active(self, "temperature"):
             self.temperature.to_input(fout)
-        if self.thermostat_info.status == True:
+        if section_active(self, "thermostat_info"):
             self.thermostat_info.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "ENERGY":
-                self.energy.set_params({item: params[item]})
-            elif item.split("-")[3] == "TEMPERATURE":
-                self.temperature.set_params({item: params[item]})
-            elif item.split("-")[3] == "THERMOSTAT_INFO":
-                self.thermostat_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_md_thermostat:
+    ad_langevin = lazy_section("cp2k_motion_md_thermostat_ad_langevin", "AD_LANGEVIN")
+    csvr = lazy_section("cp2k_motion_md_thermostat_csvr", "CSVR")
+    define_region = lazy_section("cp2k_motion_md_thermostat_define_region", "DEFINE_REGION")
+    gle = lazy_section("cp2k_motion_md_thermostat_gle", "GLE")
+    nose = lazy_section("cp2k_motion_md_thermostat_nose", "NOSE")
+    printout = lazy_section("cp2k_motion_md_thermostat_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 "REGION": None,
@@ -3645,12 +2973,6 @@ class cp2k_motion_md_thermostat:
                 }
         self.status = False
 
-        self.ad_langevin = cp2k_motion_md_thermostat_ad_langevin()
-        self.csvr = cp2k_motion_md_thermostat_csvr()
-        self.define_region = cp2k_motion_md_thermostat_define_region()
-        self.gle = cp2k_motion_md_thermostat_gle()
-        self.nose = cp2k_motion_md_thermostat_nose()
-        self.printout = cp2k_motion_md_thermostat_print()
         # basic setting
         self.params["TYPE"] = "NOSE"
 
@@ -3659,41 +2981,25 @@ class cp2k_motion_md_thermostat:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.ad_langevin.status == True:
+        if section_active(self, "ad_langevin"):
             self.add_langevin.to_input(fout)
-        if self.csvr.status == True:
+        if section_active(self, "csvr"):
             self.csvr.to_input(fout)
-        if self.define_region.status == True:
+        if section_active(self, "define_region"):
             self.define_region.to_input(fout)
-        if self.gle.status == True:
+        if section_active(self, "gle"):
             self.gle.to_input(fout)
-        if self.nose.status == True:
+        if section_active(self, "nose"):
             self.nose.to_input(fout)
         if self.params["TYPE"].upper() == "NOSE":
             self.nose.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
 
         fout.write("\t\t&END THERMOSTAT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "ADD_LANGEVIN":
-                self.add_langevin.set_params({item: params[item]})
-            elif item.split("-")[2] == "CSVR":
-                self.csvr.set_params({item: params[item]})
-            elif item.split("-")[2] == "DEFINE_REGION":
-                self.define_region.set_params({item: params[item]})
-            elif item.split("-")[2] == "GLE":
-                self.gle.set_params({item: params[item]})
-            elif item.split("-")[2] == "NOSE":
-                self.nose.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -3711,13 +3017,26 @@ class cp2k_motion_md_velocity_softening:
         fout.write("\t\t&END VELOCITY_SOFTENING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=2)
 
 
 
 class cp2k_motion_md:
+    adiabatic_dynamics = lazy_section("cp2k_motion_md_adiabatic_dynamics", "ADIABATIC_DYNAMICS")
+    averages = lazy_section("cp2k_motion_md_averages", "AVERAGES")
+    barostat = lazy_section("cp2k_motion_md_barostat", "BAROSTAT")
+    cascade = lazy_section("cp2k_motion_md_cascade", "CASCADE")
+    initial_vibration = lazy_section("cp2k_motion_md_initial_vibration", "INITIAL_VIBRATION")
+    langevin = lazy_section("cp2k_motion_md_langevin", "LANGEVIN")
+    msst = lazy_section("cp2k_motion_md_msst", "MSST")
+    printout = lazy_section("cp2k_motion_md_print", "PRINT")
+    reftraj = lazy_section("cp2k_motion_md_reftraj", "REFTRAJ")
+    respa = lazy_section("cp2k_motion_md_respa", "RESPA")
+    shell = lazy_section("cp2k_motion_md_shell", "SHELL")
+    thermal_region = lazy_section("cp2k_motion_md_thermal_region", "THERMAL_REGION")
+    thermostat = lazy_section("cp2k_motion_md_thermostat", "THERMOSTAT")
+    velocity_softening = lazy_section("cp2k_motion_md_velocity_softening", "VELOCITY_SOFTENING")
+
     def __init__(self):
         self.params = {
                 "ANGVEL_TOL": None,
@@ -3742,20 +3061,6 @@ class cp2k_motion_md:
                 }
         self.status = False
         
-        self.adiabatic_dynamics = cp2k_motion_md_adiabatic_dynamics()
-        self.averages = cp2k_motion_md_averages()
-        self.barostat = cp2k_motion_md_barostat()
-        self.cascade = cp2k_motion_md_cascade()
-        self.initial_vibration = cp2k_motion_md_initial_vibration()
-        self.langevin = cp2k_motion_md_langevin()
-        self.msst = cp2k_motion_md_msst()
-        self.printout = cp2k_motion_md_print()
-        self.reftraj = cp2k_motion_md_reftraj()
-        self.respa = cp2k_motion_md_respa()
-        self.shell = cp2k_motion_md_shell()
-        self.thermal_region = cp2k_motion_md_thermal_region()
-        self.thermostat = cp2k_motion_md_thermostat()
-        self.velocity_softening = cp2k_motion_md_velocity_softening()
         # basic default setting
         self.params["TIMESTEP"] = 0.5
         self.params["STEPS"] = 1000
@@ -3772,67 +3077,35 @@ class cp2k_motion_md:
             self.thermostat.to_input(fout)
         if self.params["ENSEMBLE"] == "REFTRAJ":
             self.reftraj.to_input(fout)
-        if self.adiabatic_dynamics.status == True:
+        if section_active(self, "adiabatic_dynamics"):
             self.adiabatic_dynamics.to_input(fout)
-        if self.averages.status == True:
+        if section_active(self, "averages"):
             self.averages.to_input(fout)
-        if self.barostat.status == True:
+        if section_active(self, "barostat"):
             self.barostat.to_input(fout)
-        if self.cascade.status == True:
+        if section_active(self, "cascade"):
             self.cascade.to_input(fout)
-        if self.initial_vibration.status == True:
+        if section_active(self, "initial_vibration"):
             self.initial_vibration.to_input(fout)
-        if self.langevin.status == True:
+        if section_active(self, "langevin"):
             self.langevin.to_input(fout)
-        if self.msst.status == True:
+        if section_active(self, "msst"):
             self.msst.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.reftraj.status == True:
+        if section_active(self, "reftraj"):
             self.reftraj.to_input(fout)
-        if self.respa.status == True:
+        if section_active(self, "respa"):
             self.respa.to_input(fout)
-        if self.shell.status == True:
+        if section_active(self, "shell"):
             self.shell.to_input(fout)
-        if self.thermal_region.status == True:
+        if section_active(self, "thermal_region"):
             self.thermal_region.to_input(fout)
-        if self.thermostat.status == True:
+        if section_active(self, "thermostat"):
             self.thermostat.to_input(fout)
-        if self.velocity_softening.status == True:
+        if section_active(self, "velocity_softening"):
             self.velocity_softening.to_input(fout)
         fout.write("\t&END MD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "ADIABATIC_DYNAMICS":
-                self.adiabatic_dynamics.set_params({item: params[item]})
-            elif item.split("-")[1] == "AVERAGES":
-                self.averages.set_params({item: params[item]})
-            elif item.split("-")[1] == "BAROSTAT":
-                self.barostat.set_params({item: params[item]})
-            elif item.split("-")[1] == "CASCADE":
-                self.cascade.set_params({item: params[item]})
-            elif item.split("-")[1] == "INITIAL_VIBRATION":
-                self.initial_vibration.set_params({item: params[item]})
-            elif item.split("-")[1] == "LANGEVIN":
-                self.langevin.set_params({item: params[item]})
-            elif item.split("-")[1] == "MSST":
-                self.msst.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[1] == "REFTRAJ":
-                self.reftraj.set_params({item: params[item]})
-            elif item.split("-")[1] == "RESPA":
-                self.respa.set_params({item: params[item]})
-            elif item.split("-")[1] == "SHELL":
-                self.shell.set_params({item: params[item]})
-            elif item.split("-")[1] == "THERMAL_REGION":
-                self.thermal_region.set_params({item: params[item]})
-            elif item.split("-")[1] == "THERMOSTAT":
-                self.thermostat.set_params({item: params[item]})
-            elif item.split("-")[1] == "VELOCITY_SOFTENING":
-                self.velocity_softening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
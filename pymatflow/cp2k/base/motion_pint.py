@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 class cp2k_motion_pint_beads_coord:
     def __init__(self):
@@ -19,11 +21,7 @@ class cp2k_motion_pint_beads_coord:
         fout.write("\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_beads_velocity:
     def __init__(self):
@@ -42,23 +40,18 @@ class cp2k_motion_pint_beads_velocity:
         fout.write("\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_beads:
+    coord = lazy_section("cp2k_motion_pint_beads_coord", "COORD")
+    velocity = lazy_section("cp2k_motion_pint_beads_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.coord = cp2k_motion_pint_beads_coord()
-        self.velocity = cp2k_motion_pint_beads_velocity()
-
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -67,22 +60,14 @@ class cp2k_motion_pint_beads:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t&END BEADS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "COORD":
-                self.coord.set_params({item: params[item]})
-            elif item.split("-")[2] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_pint_gle_rng_init:
     def __init__(self):
@@ -101,11 +86,7 @@ class cp2k_motion_pint_gle_rng_init:
         fout.write("\t\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_gle_s:
@@ -125,11 +106,7 @@ class cp2k_motion_pint_gle_s:
         fout.write("\t\t\t&END S\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_gle_thermostat_energy:
     def __init__(self):
@@ -148,22 +125,19 @@ class cp2k_motion_pint_gle_thermostat_energy:
         fout.write("\t\t\t&END THERMOSTAT_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_gle:
+    rng_init = lazy_section("cp2k_motion_pint_gle_rng_init", "RNG_INIT")
+    s = lazy_section("cp2k_motion_pint_gle_s", "S")
+    thermostat_energy = lazy_section("cp2k_motion_pint_gle_thermostat_energy", "THERMOSTAT_ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.rng_init = cp2k_motion_pint_gle_rng_init()
-        self.s = cp2k_motion_pint_gle_s()
-        self.thermostat_energy = cp2k_motion_pint_gle_thermostat_energy()
         # basic setting
 
     def to_input(self, fout):
@@ -174,26 +148,16 @@ class cp2k_motion_pint_gle:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
-        if self.s.status == True:
+        if section_active(self, "s"):
             self.s.to_input(fout)
-        if self.thermostat_energy.status == True:
+        if section_active(self, "thermostat_energy"):
             self.thermostat_energy.to_input(fout)
         fout.write("\t\t&END GLE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            elif item.split("-")[2] == "S":
-                self.s.set_params({item: params[item]})
-            elif item.split("-")[2] == "THERMOSTAT_ENERGY":
-                self.thermostat_energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_pint_helium_averages:
@@ -213,11 +177,7 @@ class cp2k_motion_pint_helium_averages:
         fout.write("\t\t\t&END AVERAGES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_helium_ceperley_m_sampling:
@@ -237,20 +197,17 @@ class cp2k_motion_pint_helium_ceperley_m_sampling:
         fout.write("\t\t\t\t&END M-SAMPLING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_ceperley:
+    m_sampling = lazy_section("cp2k_motion_pint_helium_ceperley_m_sampling", "M-SAMPLING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.m_sampling = cp2k_motion_pint_helium_ceperley_m_sampling()
         # basic setting
 
     def to_input(self, fout):
@@ -261,18 +218,12 @@ class cp2k_motion_pint_helium_ceperley:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.m_sampling.status == True:
+        if section_active(self, "m_sampling"):
             self.m_sampling.to_input(fout)
         fout.write("\t\t\t&END CEPERLEY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "M_SAMPLING":
-                self.m_sampling.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_helium_coord:
@@ -292,11 +243,7 @@ class cp2k_motion_pint_helium_coord:
         fout.write("\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_helium_force:
@@ -316,11 +263,7 @@ class cp2k_motion_pint_helium_force:
         fout.write("\t\t\t&END FORCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_helium_perm:
@@ -340,11 +283,7 @@ class cp2k_motion_pint_helium_perm:
         fout.write("\t\t\t&END PERM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -365,20 +304,17 @@ class cp2k_motion_pint_helium_print_accepts_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_accepts:
+    each = lazy_section("cp2k_motion_pint_helium_print_accepts_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_accepts_each()
         # basic setting
 
     def to_input(self, fout):
@@ -389,18 +325,12 @@ class cp2k_motion_pint_helium_print_accepts:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END ACCEPTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_helium_print_action_each:
     def __init__(self):
@@ -419,20 +349,17 @@ class cp2k_motion_pint_helium_print_action_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_action:
+    each = lazy_section("cp2k_motion_pint_helium_print_action_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_action_each()
         # basic setting
 
     def to_input(self, fout):
@@ -443,18 +370,12 @@ class cp2k_motion_pint_helium_print_action:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END ACTION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_coordinates_each:
@@ -474,20 +395,17 @@ class cp2k_motion_pint_helium_print_coordinates_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_coordinates:
+    each = lazy_section("cp2k_motion_pint_helium_print_coordinates_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_coordinates_each()
         # basic setting
 
     def to_input(self, fout):
@@ -498,18 +416,12 @@ class cp2k_motion_pint_helium_print_coordinates:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END COORDINATES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_energy_each:
@@ -529,20 +441,17 @@ class cp2k_motion_pint_helium_print_energy_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_energy:
+    each = lazy_section("cp2k_motion_pint_helium_print_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -553,18 +462,12 @@ class cp2k_motion_pint_helium_print_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_helium_print_forces_each:
     def __init__(self):
@@ -583,20 +486,17 @@ class cp2k_motion_pint_helium_print_forces_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_forces:
+    each = lazy_section("cp2k_motion_pint_helium_print_forces_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_forces_each()
         # basic setting
 
     def to_input(self, fout):
@@ -607,18 +507,12 @@ class cp2k_motion_pint_helium_print_forces:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END FORCES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_helium_print_forces_inst_each:
     def __init__(self):
@@ -637,20 +531,17 @@ class cp2k_motion_pint_helium_print_forces_inst_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_forces_inst:
+    each = lazy_section("cp2k_motion_pint_helium_print_forces_inst_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_forces_inst_each()
         # basic setting
 
     def to_input(self, fout):
@@ -661,18 +552,12 @@ class cp2k_motion_pint_helium_print_forces_inst:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END FORCES_INST\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_helium_print_moment_of_inertia_each:
     def __init__(self):
@@ -691,20 +576,17 @@ class cp2k_motion_pint_helium_print_moment_of_inertia_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_moment_of_inertia:
+    each = lazy_section("cp2k_motion_pint_helium_print_moment_of_inertia_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_moment_of_inertia_each()
         # basic setting
 
     def to_input(self, fout):
@@ -715,18 +597,12 @@ class cp2k_motion_pint_helium_print_moment_of_inertia:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MOMENT_OF_INERTIA\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_helium_print_moment_of_inertia_avg_each:
     def __init__(self):
@@ -745,20 +621,17 @@ class cp2k_motion_pint_helium_print_moment_of_inertia_avg_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_moment_of_inertia_avg:
+    each = lazy_section("cp2k_motion_pint_helium_print_moment_of_inertia_avg_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_moment_of_inertia_avg_each()
         # basic setting
 
     def to_input(self, fout):
@@ -769,18 +642,12 @@ class cp2k_motion_pint_helium_print_moment_of_inertia_avg:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END MOMENT_OF_INERTIA_AVG\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_perm_each:
@@ -800,20 +667,17 @@ class cp2k_motion_pint_helium_print_perm_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_perm:
+    each = lazy_section("cp2k_motion_pint_helium_print_perm_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_perm_each()
         # basic setting
 
     def to_input(self, fout):
@@ -824,18 +688,12 @@ class cp2k_motion_pint_helium_print_perm:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PERM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_plength_each:
@@ -855,20 +713,17 @@ class cp2k_motion_pint_helium_print_plength_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_plength:
+    each = lazy_section("cp2k_motion_pint_helium_print_plength_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_plength_each()
         # basic setting
 
     def to_input(self, fout):
@@ -879,18 +734,12 @@ class cp2k_motion_pint_helium_print_plength:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PLENGTH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_projected_area_each:
@@ -910,20 +759,17 @@ class cp2k_motion_pint_helium_print_projected_area_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_projected_area:
+    each = lazy_section("cp2k_motion_pint_helium_print_projected_area_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_projected_area_each()
         # basic setting
 
     def to_input(self, fout):
@@ -934,18 +780,12 @@ class cp2k_motion_pint_helium_print_projected_area:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROJECTED_AREA\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_projected_area_2_avg_each:
@@ -965,20 +805,17 @@ class cp2k_motion_pint_helium_print_projected_area_2_avg_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_projected_area_2_avg:
+    each = lazy_section("cp2k_motion_pint_helium_print_projected_area_2_avg_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_projected_area_2_avg_each()
         # basic setting
 
     def to_input(self, fout):
@@ -989,18 +826,12 @@ class cp2k_motion_pint_helium_print_projected_area_2_avg:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROJECTED_AREA_2_AVG\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_rdf_each:
@@ -1020,20 +851,17 @@ class cp2k_motion_pint_helium_print_rdf_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_rdf:
+    each = lazy_section("cp2k_motion_pint_helium_print_rdf_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_rdf_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1044,18 +872,12 @@ class cp2k_motion_pint_helium_print_rdf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RDF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_rho_each:
@@ -1075,20 +897,17 @@ class cp2k_motion_pint_helium_print_rho_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_rho:
+    each = lazy_section("cp2k_motion_pint_helium_print_rho_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_rho_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1099,18 +918,12 @@ class cp2k_motion_pint_helium_print_rho:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RHO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_helium_print_winding_number_each:
     def __init__(self):
@@ -1129,20 +942,17 @@ class cp2k_motion_pint_helium_print_winding_number_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_winding_number:
+    each = lazy_section("cp2k_motion_pint_helium_print_winding_number_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_winding_number_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1153,18 +963,12 @@ class cp2k_motion_pint_helium_print_winding_number:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WINDING_NUMBER\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_motion_pint_helium_print_winding_number_2_avg_each:
@@ -1184,20 +988,17 @@ class cp2k_motion_pint_helium_print_winding_number_2_avg_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_motion_pint_helium_print_winding_number_2_avg:
+    each = lazy_section("cp2k_motion_pint_helium_print_winding_number_2_avg_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_helium_print_winding_number_2_avg_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1208,43 +1009,38 @@ class cp2k_motion_pint_helium_print_winding_number_2_avg:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END WINDING_NUMBER_2_AVG\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
 class cp2k_motion_pint_helium_print:
+    accepts = lazy_section("cp2k_motion_pint_helium_print_accepts", "ACCEPTS")
+    action = lazy_section("cp2k_motion_pint_helium_print_action", "ACTION")
+    coordinates = lazy_section("cp2k_motion_pint_helium_print_coordinates", "COORDINATES")
+    energy = lazy_section("cp2k_motion_pint_helium_print_energy", "ENERGY")
+    forces = lazy_section("cp2k_motion_pint_helium_print_forces", "FORCES")
+    forces_inst = lazy_section("cp2k_motion_pint_helium_print_forces_inst", "FORCES_INST")
+    moment_of_inertia = lazy_section("cp2k_motion_pint_helium_print_moment_of_inertia", "MOMENT_OF_INERTIA")
+    moment_of_inertia_avg = lazy_section("cp2k_motion_pint_helium_print_moment_of_inertia_avg", "MOMENT_OF_INERTIA_AVG")
+    perm = lazy_section("cp2k_motion_pint_helium_print_perm", "PERM")
+    plength = lazy_section("cp2k_motion_pint_helium_print_plength", "PLENGTH")
+    projected_area = lazy_section("cp2k_motion_pint_helium_print_projected_area", "PROJECTED_AREA")
+    projected_area_2_avg = lazy_section("cp2k_motion_pint_helium_print_projected_area_2_avg", "PROJECTED_AREA_2_AVG")
+    rdf = lazy_section("cp2k_motion_pint_helium_print_rdf", "RDF")
+    rho = lazy_section("cp2k_motion_pint_helium_print_rho", "RHO")
+    winding_number = lazy_section("cp2k_motion_pint_helium_print_winding_number", "WINDING_NUMBER")
+    winding_number_2_avg = lazy_section("cp2k_motion_pint_helium_print_winding_number_2_avg", "WINDING_NUMBER_2_AVG")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.accepts = cp2k_motion_pint_helium_print_accepts()
-        self.action = cp2k_motion_pint_helium_print_action()
-        self.coordinates = cp2k_motion_pint_helium_print_coordinates()
-        self.energy = cp2k_motion_pint_helium_print_energy()
-        self.forces = cp2k_motion_pint_helium_print_forces()
-        self.forces_inst = cp2k_motion_pint_helium_print_forces_inst()
-        self.moment_of_inertia = cp2k_motion_pint_helium_print_moment_of_inertia()
-        self.moment_of_inertia_avg = cp2k_motion_pint_helium_print_moment_of_inertia_avg()
-        self.perm = cp2k_motion_pint_helium_print_perm()
-        self.plength = cp2k_motion_pint_helium_print_plength()
-        self.projected_area = cp2k_motion_pint_helium_print_projected_area()
-        self.projected_area_2_avg = cp2k_motion_pint_helium_print_projected_area_2_avg()
-        self.rdf = cp2k_motion_pint_helium_print_rdf()
-        self.rho = cp2k_motion_pint_helium_print_rho()
-        self.winding_number = cp2k_motion_pint_helium_print_winding_number()
-        self.winding_number_2_avg = cp2k_motion_pint_helium_print_winding_number_2_avg()
         # basic setting
 
     def to_input(self, fout):
@@ -1255,78 +1051,42 @@ class cp2k_motion_pint_helium_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.accepts.status == True:
+        if section_active(self, "accepts"):
             self.accepts.to_input(fout)
-        if self.action.status == True:
+        if section_active(self, "action"):
             self.action.to_input(fout)
-        if self.coordinates.status == True: 
+        if section_active(self, "coordinates"): 
             self.coordinates.to_input(fout)
-        if self.energy.status == True: 
+        if section_active(self, "energy"): 
             self.energy.to_input(fout)
-        if self.forces.status == True:
+        if section_active(self, "forces"):
             self.forces.to_input(fout)
-        if self.forces_inst.status == True: 
+        if section_active(self, "forces_inst"): 
             self.forces_inst.to_input(fout)
-        if self.moment_of_inertia.status == True: 
+        if section_active(self, "moment_of_inertia"): 
             self.moment_of_inertia.to_input(fout)
-        if self.moment_of_inertia_avg.status == True: 
+        if section_active(self, "moment_of_inertia_avg"): 
             self.moment_of_inertia_avg.to_input(fout)
-        if self.perm.status == True: 
+        if section_active(self, "perm"): 
             self.perm.to_input(fout)
-        if self.plength.status == True: 
+        if section_active(self, "plength"): 
             self.plength.to_input(fout)
-        if self.projected_area.status == True: 
+        if section_active(self, "projected_area"): 
             self.projected_area.to_input(fout)
-        if self.projected_area_2_avg.status == True: 
+        if section_active(self, "projected_area_2_avg"): 
             self.projected_area_2_avg.to_input(fout)
-        if self.rdf.status == True:
+        if section_active(self, "rdf"):
             self.rdf.to_input(fout)
-        if self.rho.status == True:
+        if section_active(self, "rho"):
             self.rho.to_input(fout)
-        if self.winding_number.status == True: 
+        if section_active(self, "winding_number"): 
             self.winding_number.to_input(fout)
-        if self.winding_number_2_avg.status == True: 
+        if section_active(self, "winding_number_2_avg"): 
             self.winding_number_2_avg.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "ACCEPTS":
-                self.accepts.set_params({item: params[item]})
-            elif item.split("-")[3] == "ACTION":
-                self.action.to_input(fout)
-            elif item.split("-")[3] == "COORDINATES":
-                self.coordinates.to_input(fout)
-            elif item.split("-")[3] == "ENERGY":
-                self.energy.to_input(fout)
-            elif item.split("-")[3] == "FORCES":
-                self.forces.to_input(fout)
-            elif item.split("-")[3] == "FORCES_INST":
-                self.forces_inst.to_input(fout)
-            elif item.split("-")[3] == "MOMENT_OF_INERTIA":
-                self.moment_of_inertia.to_input(fout)
-            elif item.split("-")[3] == "MOMENT_OF_INERTIA_AVG":
-                self.moment_of_inertia_avg.to_input(fout)
-            elif item.split("-")[3] == "PERM":
-                self.perm.to_input(fout)
-            elif item.split("-")[3] == "PLENGTH":
-                self.plength.to_input(fout)
-            elif item.split("-")[3] == "PROJECTED_AREA":
-                self.projected_area.to_input(fout)
-            elif item.split("-")[3] == "PROJECTED_AREA_2_AVG":
-                self.projected_area_2_avg.to_input(fout)
-            elif item.split("-")[3] == "RDF":
-                self.rdf.to_input(fout)
-            elif item.split("-")[3] == "RHO":
-                self.rho.to_input(fout)
-            elif item.split("-")[3] == "WINDING_NUMBER":
-                self.winding_number.to_input(fout)
-            elif item.split("-")[3] == "WINDING_NUMBER_2_AVG":
-                self.winding_number_2_avg.to_input(fout)
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_helium_rdf:
@@ -1346,11 +1106,7 @@ class cp2k_motion_pint_helium_rdf:
         fout.write("\t\t\t&END RDF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_helium_rho:
     def __init__(self):
@@ -1369,11 +1125,7 @@ class cp2k_motion_pint_helium_rho:
         fout.write("\t\t\t&END RHO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_helium_rng_state:
@@ -1393,11 +1145,7 @@ class cp2k_motion_pint_helium_rng_state:
         fout.write("\t\t\t&END RNG_STATE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_helium_worm:
@@ -1417,29 +1165,26 @@ class cp2k_motion_pint_helium_worm:
         fout.write("\t\t\t&END WORM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_helium:
+    avearges = lazy_section("cp2k_motion_pint_helium_averages", "AVERAGES")
+    ceperley = lazy_section("cp2k_motion_pint_helium_ceperley", "CEPERLEY")
+    coord = lazy_section("cp2k_motion_pint_helium_coord", "COORD")
+    force = lazy_section("cp2k_motion_pint_helium_force", "FORCE")
+    perm = lazy_section("cp2k_motion_pint_helium_perm", "PERM")
+    printout = lazy_section("cp2k_motion_pint_helium_print", "PRINT")
+    rdf = lazy_section("cp2k_motion_pint_helium_rdf", "RDF")
+    rho = lazy_section("cp2k_motion_pint_helium_rho", "RHO")
+    rng_state = lazy_section("cp2k_motion_pint_helium_rng_state", "RNG_STATE")
+    worm = lazy_section("cp2k_motion_pint_helium_worm", "WORM")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.avearges = cp2k_motion_pint_helium_averages()
-        self.ceperley = cp2k_motion_pint_helium_ceperley()
-        self.coord = cp2k_motion_pint_helium_coord()
-        self.force = cp2k_motion_pint_helium_force()
-        self.perm = cp2k_motion_pint_helium_perm()
-        self.printout = cp2k_motion_pint_helium_print()
-        self.rdf = cp2k_motion_pint_helium_rdf()
-        self.rho = cp2k_motion_pint_helium_rho()
-        self.rng_state = cp2k_motion_pint_helium_rng_state()
-        self.worm = cp2k_motion_pint_helium_worm()
         # basic setting
 
     def to_input(self, fout):
@@ -1452,52 +1197,28 @@ class cp2k_motion_pint_helium:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
         if self.averages.status == True:
             self.averages.to_input(fout)
-        if self.ceperley.status == True:
+        if section_active(self, "ceperley"):
             self.ceperley.to_input(fout)
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.force.status == True:
+        if section_active(self, "force"):
             self.force.to_input(fout)
-        if self.perm.status == True:
+        if section_active(self, "perm"):
             self.perm.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.rdf.status == True:
+        if section_active(self, "rdf"):
             self.rdf.to_input(fout)
-        if self.rho.status == True:
+        if section_active(self, "rho"):
             self.rho.to_input(fout)
-        if self.rng_state.status == True:
+        if section_active(self, "rng_state"):
             self.rng_state.to_input(fout)
-        if self.worm.status == True:
+        if section_active(self, "worm"):
             self.worm.to_input(fout)
         fout.write("\t\t&END HELIUM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "AVERAGES":
-                self.averages.set_params({item: params[item]})
-            elif item.split("-")[2] == "CEPERLEY":
-                self.ceperley.set_params({item: params[item]})
-            elif item.split("-")[2] == "COORD":
-                self.coord.set_params({item: params[item]})
-            elif item.split("-")[2] == "FORCE":
-                self.force.set_params({item: params[item]})
-            elif item.split("-")[2] == "PERM":
-                self.perm.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[2] == "RDF":
-                self.rdf.set_params({item: params[item]})
-            elif item.split("-")[2] == "RHO":
-                self.rho.set_params({item: params[item]})
-            elif item.split("-")[2] == "RNG_STATE":
-                self.rng_state.set_params({item: params[item]})
-            elif item.split("-")[2] == "WORM":
-                self.worm.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_pint_init:
@@ -1517,11 +1238,7 @@ class cp2k_motion_pint_init:
         fout.write("\t\t&END INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_pint_normalmode:
     def __init__(self):
@@ -1540,11 +1257,7 @@ class cp2k_motion_pint_normalmode:
         fout.write("\t\t&END NORMALMODE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_pint_nose_coord:
     def __init__(self):
@@ -1563,11 +1276,7 @@ class cp2k_motion_pint_nose_coord:
         fout.write("\t\t\t&END COORD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_nose_velocity:
     def __init__(self):
@@ -1586,21 +1295,18 @@ class cp2k_motion_pint_nose_velocity:
         fout.write("\t\t\t&END VELOCITY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_nose:
+    coord = lazy_section("cp2k_motion_pint_nose_coord", "COORD")
+    velocity = lazy_section("cp2k_motion_pint_nose_velocity", "VELOCITY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.coord = cp2k_motion_pint_nose_coord()
-        self.velocity = cp2k_motion_pint_nose_velocity()
         # basic setting
 
     def to_input(self, fout):
@@ -1611,22 +1317,14 @@ class cp2k_motion_pint_nose:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout)
-        if self.velocity.status == True:
+        if section_active(self, "velocity"):
             self.velocity.to_input(fout)
         fout.write("\t\t&END NOSE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "COORD":
-                self.coord.set_params({item: params[item]})
-            elif item.split("-")[2] == "VELOCITY":
-                self.velocity.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_pint_piglet_extra_dof:
     def __init__(self):
@@ -1645,11 +1343,7 @@ class cp2k_motion_pint_piglet_extra_dof:
         fout.write("\t\t&END EXTRA_DOF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_piglet_rng_init:
     def __init__(self):
@@ -1668,21 +1362,18 @@ class cp2k_motion_pint_piglet_rng_init:
         fout.write("\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_piglet:
+    extra_dof = lazy_section("cp2k_motion_pint_piglet_extra_dof", "EXTRA_DOF")
+    rng_init = lazy_section("cp2k_motion_pint_piglet_rng_init", "RNG_INIT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.extra_dof = cp2k_motion_pint_piglet_extra_dof()
-        self.rng_init = cp2k_motion_pint_piglet_rng_init()
         # basic setting
 
     def to_input(self, fout):
@@ -1693,22 +1384,14 @@ class cp2k_motion_pint_piglet:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.extra_dof.status == True:
+        if section_active(self, "extra_dof"):
             self.extra_dfo.to_input(fout)
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
         fout.write("\t\t&END PIGLET\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EXTRA_DOF":
-                self.extra_dof.set_params({item: params[item]})
-            elif item.split("-")[2] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_pint_pile_rng_init:
     def __init__(self):
@@ -1727,20 +1410,17 @@ class cp2k_motion_pint_pile_rng_init:
         fout.write("\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_pint_pile:
+    rng_init = lazy_section("cp2k_motion_pint_pile_rng_init", "RNG_INIT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.rng_init = cp2k_motion_pint_pile_rng_init()
         # basic setting
 
     def to_input(self, fout):
@@ -1751,18 +1431,12 @@ class cp2k_motion_pint_pile:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
         fout.write("\t\t&END PILE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_pint_print_action_each:
@@ -1782,19 +1456,16 @@ class cp2k_motion_pint_print_action_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_print_action:
+    each = lazy_section("cp2k_motion_pint_print_action_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_print_action_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1805,18 +1476,12 @@ class cp2k_motion_pint_print_action:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END ACTION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_print_centroid_gyr_each:
     def __init__(self):
@@ -1835,19 +1500,16 @@ class cp2k_motion_pint_print_centroid_gyr_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_print_centroid_gyr:
+    each = lazy_section("cp2k_motion_pint_print_centroid_gyr_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_print_centroid_gyr_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1858,18 +1520,12 @@ class cp2k_motion_pint_print_centroid_gyr:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END CENTROID_GYR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_print_centroid_pos_each:
     def __init__(self):
@@ -1888,19 +1544,16 @@ class cp2k_motion_pint_print_centroid_pos_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_print_centroid_pos:
+    each = lazy_section("cp2k_motion_pint_print_centroid_pos_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_print_centroid_pos_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1911,18 +1564,12 @@ class cp2k_motion_pint_print_centroid_pos:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END CENTROID_POS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_print_centroid_vel_each:
     def __init__(self):
@@ -1941,19 +1588,16 @@ class cp2k_motion_pint_print_centroid_vel_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_print_centroid_vel:
+    each = lazy_section("cp2k_motion_pint_print_centroid_vel_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_print_centroid_vel_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1964,18 +1608,12 @@ class cp2k_motion_pint_print_centroid_vel:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END CENTROID_VEL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_print_com_each:
     def __init__(self):
@@ -1994,19 +1632,16 @@ class cp2k_motion_pint_print_com_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_print_com:
+    each = lazy_section("cp2k_motion_pint_print_com_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_print_com_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2017,18 +1652,12 @@ class cp2k_motion_pint_print_com:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END COM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_print_energy_each:
     def __init__(self):
@@ -2047,19 +1676,16 @@ class cp2k_motion_pint_print_energy_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_motion_pint_print_energy:
+    each = lazy_section("cp2k_motion_pint_print_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_motion_pint_print_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2070,31 +1696,26 @@ class cp2k_motion_pint_print_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_print:
+    action = lazy_section("cp2k_motion_pint_print_action", "ACTION")
+    centroid_gyr = lazy_section("cp2k_motion_pint_print_centroid_gyr", "CENTROID_GYR")
+    centroid_pos = lazy_section("cp2k_motion_pint_print_centroid_pos", "CENTROID_POS")
+    centroid_vel = lazy_section("cp2k_motion_pint_print_centroid_vel", "CENTROID_VEL")
+    com = lazy_section("cp2k_motion_pint_print_com", "COM")
+    energy = lazy_section("cp2k_motion_pint_print_energy", "ENERGY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.action = cp2k_motion_pint_print_action()
-        self.centroid_gyr = cp2k_motion_pint_print_centroid_gyr()
-        self.centroid_pos = cp2k_motion_pint_print_centroid_pos()
-        self.centroid_vel = cp2k_motion_pint_print_centroid_vel()
-        self.com = cp2k_motion_pint_print_com()
-        self.energy = cp2k_motion_pint_print_energy()
         # basic setting
 
     def to_input(self, fout):
@@ -2105,38 +1726,22 @@ class cp2k_motion_pint_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.action.status == True:
+        if section_active(self, "action"):
             slef.action.to_input(fout)
-        if self.centroid_gyr.status == True:
+        if section_active(self, "centroid_gyr"):
             self.centroid_gyr.to_input(fout)
         if slef.centroid_pos.status == True:
             self.centroid_pos.to_input(fout)
-        if self.centroid_vel.status == True:
+        if section_active(self, "centroid_vel"):
             self.centroid_vel.to_input(fout)
-        if self.com.status == True:
+        if section_active(self, "com"):
             self.com.to_input(fout)
-        if self.energy.status == True:
+        if section_active(self, "energy"):
             self.energy.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "ACTION":
-                self.action.set_params({item: params[item]})
-            elif item.split("-")[2] == "CENTROID_GYR":
-                self.centroid_gyr.set_params({item: params[item]})
-            elif item.split("-")[2] == "CENTROID_POS":
-                self.centroid_pos.set_params({item: params[item]})
-            elif item.split("-")[2] == "CENTROID_VEL":
-                self.centroid_vel.set_params({item: params[item]})
-            elif item.split("-")[2] == "COM":
-                self.com.set_params({item: params[item]})
-            elif item.split("-")[2] == "ENERGY":
-                self.energy.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_pint_qtb_rng_init:
     def __init__(self):
@@ -2155,19 +1760,16 @@ class cp2k_motion_pint_qtb_rng_init:
         fout.write("\t\t\t&END RNG_INIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_motion_pint_qtb:
+    rng_init = lazy_section("cp2k_motion_pint_qtb_rng_init", "RNG_INIT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.rng_init = cp2k_motion_pint_qtb_rng_init()
         # basic setting
 
     def to_input(self, fout):
@@ -2178,18 +1780,12 @@ class cp2k_motion_pint_qtb:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.rng_init.status == True:
+        if section_active(self, "rng_init"):
             self.rng_init.to_input(fout)
         fout.write("\t\t&END QTB\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "RNG_INIT":
-                self.rng_init.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_pint_staging:
@@ -2209,15 +1805,23 @@ class cp2k_motion_pint_staging:
         fout.write("\t\t&END STAGING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
 class cp2k_motion_pint:
+    beads = lazy_section("cp2k_motion_pint_beads", "BEADS")
+    gle = lazy_section("cp2k_motion_pint_gle", "GLE")
+    helium = lazy_section("cp2k_motion_pint_helium", "HELIUM")
+    init = lazy_section("cp2k_motion_pint_init", "INIT")
+    normalmode = lazy_section("cp2k_motion_pint_normalmode", "NORMALMODE")
+    nose = lazy_section("cp2k_motion_pint_nose", "NOSE")
+    piglet = lazy_section("cp2k_motion_pint_piglet", "PIGLET")
+    pile = lazy_section("cp2k_motion_pint_pile", "PILE")
+    printout = lazy_section("cp2k_motion_pint_print", "PRINT")
+    qtb = lazy_section("cp2k_motion_pint_qtb", "QTB")
+    staging = lazy_section("cp2k_motion_pint_staging", "STAGING")
+
     def __init__(self):
         self.params = {
                 "DT": None,
@@ -2236,17 +1840,6 @@ class cp2k_motion_pint:
                 }
         self.status = False
 
-        self.beads = cp2k_motion_pint_beads()
-        self.gle = cp2k_motion_pint_gle()
-        self.helium = cp2k_motion_pint_helium()
-        self.init = cp2k_motion_pint_init()
-        self.normalmode = cp2k_motion_pint_normalmode()
-        self.nose = cp2k_motion_pint_nose()
-        self.piglet = cp2k_motion_pint_piglet()
-        self.pile = cp2k_motion_pint_pile()
-        self.printout = cp2k_motion_pint_print()
-        self.qtb = cp2k_motion_pint_qtb()
-        self.staging = cp2k_motion_pint_staging()
         # basic setting
 
     def to_input(self, fout):
@@ -2257,56 +1850,30 @@ class cp2k_motion_pint:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.beads.status == True:
+        if section_active(self, "beads"):
             self.beads.to_input(fout)
-        if self.gle.status == True:
+        if section_active(self, "gle"):
             self.gle.to_input(fout)
-        if self.helium.status == True:
+        if section_active(self, "helium"):
             self.helium.to_input(fout)
-        if self.init.status == True:
+        if section_active(self, "init"):
             self.init.to_input(fout)
-        if self.normalmode.status == True:
+        if section_active(self, "normalmode"):
             self.normalmode.to_input(fout)
-        if self.nose.status == True:
+        if section_active(self, "nose"):
             self.nose.to_input(fout)
-        if self.piglet.status == True:
+        if section_active(self, "piglet"):
             self.piglet.to_input(fout)
-        if self.pile.status == True:
+        if section_active(self, "pile"):
             self.pile.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.qtb.status == True:
+        if section_active(self, "qtb"):
             self.qtb.to_input(fout)
-        if self.staging.status == True:
+        if section_active(self, "staging"):
             self.staging.to_input(fout)
         fout.write("\t&END PINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-") == "BEADS":
-                self.beads.set_params({item: params[item]})
-            elif item.split("-") == "GLE":
-                self.gle.set_params({item: params[item]})
-            elif item.split("-") == "HELIUM":
-                self.helium.set_params({item: params[item]})
-            elif item.split("-") == "INIT":
-                self.init.set_params({item: params[item]})
-            elif item.split("-") == "NORMALMODE":
-                self.normalmode.set_params({item: params[item]})
-            elif item.split("-") == "NOSE":
-                self.nose.set_params({item: params[item]})
-            elif item.split("-") == "PIGLET":
-                self.piglet.set_params({item: params[item]})
-            elif item.split("-") == "PILE":
-                self.pile.set_params({item: params[item]})
-            elif item.split("-") == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-") == "QTB":
-                self.qtb.set_params({item: params[item]})
-            elif item.split("-") == "STAGING":
-                self.staging.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 class cp2k_motion_print_cell_each:
     def __init__(self):
         self.params = {}
@@ -14,18 +16,15 @@ class cp2k_motion_print_cell_each:
         fout.write("\t\t\t&end EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_print_cell:
+    each = lazy_section("cp2k_motion_print_cell_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
-        self.each = cp2k_motion_print_cell_each()
         
         # basic setting
         self.each.status = True
@@ -35,18 +34,12 @@ class cp2k_motion_print_cell:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&end CELL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_core_forces_each:
     def __init__(self):
@@ -61,18 +54,15 @@ class cp2k_motion_print_core_forces_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_print_core_forces:
+    each = lazy_section("cp2k_motion_print_core_forces_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
-        self.each = cp2k_motion_print_core_forces_each()
         
         # basic setting
         self.each.status = True
@@ -82,18 +72,12 @@ class cp2k_motion_print_core_forces:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&end CORE_FORCES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_core_trajectory_each:
     def __init__(self):
@@ -108,18 +92,15 @@ class cp2k_motion_print_core_trajectory_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_print_core_trajectory:
+    each = lazy_section("cp2k_motion_print_core_trajectory_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
-        self.each = cp2k_motion_print_core_trajectory_each()
         
         # basic setting
         self.each.status = True
@@ -129,18 +110,12 @@ class cp2k_motion_print_core_trajectory:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END CORE_TRAJECTORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_print_core_velocities_each:
@@ -156,18 +131,15 @@ class cp2k_motion_print_core_velocities_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_print_core_velocities:
+    each = lazy_section("cp2k_motion_print_core_velocities_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
-        self.each = cp2k_motion_print_core_velocities_each()
         
         # basic setting
         self.each.status = True
@@ -177,18 +149,12 @@ class cp2k_motion_print_core_velocities:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END CORE_VELOCITIES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_forces_each:
     def __init__(self):
@@ -203,18 +169,15 @@ class cp2k_motion_print_forces_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_print_forces:
+    each = lazy_section("cp2k_motion_print_forces_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
-        self.each = cp2k_motion_print_forces_each()
         
         # basic setting
         self.each.status = True
@@ -224,18 +187,12 @@ class cp2k_motion_print_forces:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END FORCES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_force_mixing_labels_each:
     def __init__(self):
@@ -250,18 +207,15 @@ class cp2k_motion_print_force_mixing_labels_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_print_force_mixing_labels:
+    each = lazy_section("cp2k_motion_print_force_mixing_labels_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
-        self.each = cp2k_motion_print_force_mixing_labels_each()
         
         # basic setting
         self.each.status = True
@@ -271,18 +225,12 @@ class cp2k_motion_print_force_mixing_labels:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END FORCE_MIXING_LABELS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_mixed_energies_each:
     def __init__(self):
@@ -297,18 +245,15 @@ class cp2k_motion_print_mixed_energies_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_print_mixed_energies:
+    each = lazy_section("cp2k_motion_print_mixed_energies_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
-        self.each = cp2k_motion_print_mixed_energies_each()
         
         # basic setting
         self.each.status = True
@@ -318,18 +263,12 @@ class cp2k_motion_print_mixed_energies:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END MIXED_ENERGIES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -346,18 +285,15 @@ class cp2k_motion_print_restart_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_print_restart:
+    each = lazy_section("cp2k_motion_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
-        self.each = cp2k_motion_print_restart_each()
         
         # basic setting
         self.each.status = True
@@ -367,18 +303,12 @@ class cp2k_motion_print_restart:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&end restart\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_restart_history_each:
     def __init__(self):
@@ -393,16 +323,15 @@ class cp2k_motion_print_restart_history_each:
         fout.write("\t\t\t&end EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_restart_history:
+    each = lazy_section("cp2k_motion_print_restart_history_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_restart_history_each()
         # basic setting
         self.each.status = True
 
@@ -411,16 +340,12 @@ class cp2k_motion_print_restart_history:
         for item in self.params:
             if self.params[item] is not none:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&end restart_history\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=2)
 
 
 
@@ -437,16 +362,15 @@ class cp2k_motion_print_shell_forces_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_shell_forces:
+    each = lazy_section("cp2k_motion_print_shell_forces_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_shell_forces_each()
         # basic setting
         self.each.status = True
 
@@ -455,18 +379,12 @@ class cp2k_motion_print_shell_forces:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END SHELL_FORCES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -484,16 +402,15 @@ class cp2k_motion_print_shell_trajectory_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_shell_trajectory:
+    each = lazy_section("cp2k_motion_print_shell_trajectory_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_shell_trajectory_each()
         # basic setting
         self.each.status = True
 
@@ -502,18 +419,12 @@ class cp2k_motion_print_shell_trajectory:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END SHELL_TRAJECTORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_shell_velocities_each:
     def __init__(self):
@@ -528,16 +439,15 @@ class cp2k_motion_print_shell_velocities_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_shell_velocities:
+    each = lazy_section("cp2k_motion_print_shell_velocities_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_shell_velocities_each()
         # basic setting
         self.each.status = True
 
@@ -546,18 +456,12 @@ class cp2k_motion_print_shell_velocities:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END SHELL_VELOCITIES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_stress_each:
     def __init__(self):
@@ -572,16 +476,15 @@ class cp2k_motion_print_stress_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_stress:
+    each = lazy_section("cp2k_motion_print_stress_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_stress_each()
         # basic setting
         self.each.status = True
 
@@ -590,18 +493,12 @@ class cp2k_motion_print_stress:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END STRESS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_print_structure_data_each:
     def __init__(self):
@@ -616,16 +513,15 @@ class cp2k_motion_print_structure_data_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_structure_data:
+    each = lazy_section("cp2k_motion_print_structure_data_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_structure_data_each()
         # basic setting
         self.each.status = True
 
@@ -634,18 +530,12 @@ class cp2k_motion_print_structure_data:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END STRUCTURE_DATA\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_print_trajectory_each:
@@ -661,16 +551,15 @@ class cp2k_motion_print_trajectory_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_trajectory:
+    each = lazy_section("cp2k_motion_print_trajectory_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_trajectory_each()
         # basic setting
         self.each.status = True
 
@@ -679,18 +568,12 @@ class cp2k_motion_print_trajectory:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END TRAJECTORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -708,16 +591,15 @@ class cp2k_motion_print_translation_vector_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_translation_vector:
+    each = lazy_section("cp2k_motion_print_translation_vector_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_translation_vector_each()
         # basic setting
         self.each.status = True
 
@@ -726,18 +608,12 @@ class cp2k_motion_print_translation_vector:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END TRANSLATION_VECTOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_print_velocities_each:
@@ -753,16 +629,15 @@ class cp2k_motion_print_velocities_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=3)
 
 class cp2k_motion_print_velocities:
+    each = lazy_section("cp2k_motion_print_velocities_each", "EACH")
+
     def __init__(self):
         self.params = {}
         self.status = False
 
-        self.each = cp2k_motion_print_velocities_each()
         # basic setting
         self.each.status = True
 
@@ -771,120 +646,77 @@ class cp2k_motion_print_velocities:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END VELOCITIES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
 class cp2k_motion_print:
+    cell = lazy_section("cp2k_motion_print_cell", "CELL")
+    core_forces = lazy_section("cp2k_motion_print_core_forces", "CORE_FORCES")
+    core_trajectory = lazy_section("cp2k_motion_print_core_trajectory", "CORE_TRAJECTORY")
+    core_velocities = lazy_section("cp2k_motion_print_core_velocities", "CORE_VELOCITIES")
+    forces = lazy_section("cp2k_motion_print_forces", "FORCES")
+    force_mixing_labels = lazy_section("cp2k_motion_print_force_mixing_labels", "FORCE_MIXING_LABELS")
+    mixed_energies = lazy_section("cp2k_motion_print_mixed_energies", "MIXED_ENERGIES")
+    restart = lazy_section("cp2k_motion_print_restart", "RESTART")
+    restart_history = lazy_section("cp2k_motion_print_restart_history", "RESTART_HISTORY")
+    shell_forces = lazy_section("cp2k_motion_print_shell_forces", "SHELL_FORCES")
+    shell_trajectory = lazy_section("cp2k_motion_print_shell_trajectory", "SHELL_TRAJECTORY")
+    shell_velocities = lazy_section("cp2k_motion_print_shell_velocities", "SHELL_VELOCITIES")
+    stress = lazy_section("cp2k_motion_print_stress", "STRESS")
+    structure_data = lazy_section("cp2k_motion_print_structure_data", "STRUCTURE_DATA")
+    trajectory = lazy_section("cp2k_motion_print_trajectory", "TRAJECTORY")
+    translation_vector = lazy_section("cp2k_motion_print_translation_vector", "TRANSLATION_VECTOR")
+    velocities = lazy_section("cp2k_motion_print_velocities", "VELOCITIES")
+
     def __init__(self):
         self.status = False
-        self.cell = cp2k_motion_print_cell()
-        self.core_forces = cp2k_motion_print_core_forces()
-        self.core_trajectory = cp2k_motion_print_core_trajectory()
-        self.core_velocities = cp2k_motion_print_core_velocities()
-        self.forces = cp2k_motion_print_forces()
-        self.force_mixing_labels = cp2k_motion_print_force_mixing_labels()
-        self.mixed_energies = cp2k_motion_print_mixed_energies()
-        self.restart = cp2k_motion_print_restart()
-        self.restart_history = cp2k_motion_print_restart_history()
-        self.shell_forces = cp2k_motion_print_shell_forces()
-        self.shell_trajectory = cp2k_motion_print_shell_trajectory()
-        self.shell_velocities = cp2k_motion_print_shell_velocities()
-        self.stress = cp2k_motion_print_stress()
-        self.structure_data = cp2k_motion_print_structure_data()
-        self.trajectory = cp2k_motion_print_trajectory()
-        self.translation_vector = cp2k_motion_print_translation_vector()
-        self.velocities = cp2k_motion_print_velocities()
         # basic setting
-    
+
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t&PRINT\n")
         
-        if self.cell.status == True:
+        if section_active(self, "cell"):
             self.cell.to_input(fout)
-        if self.core_forces.status == True:
+        if section_active(self, "core_forces"):
             self.core_forces.to_input(fout)
-        if self.core_trajectory.status == True:
+        if section_active(self, "core_trajectory"):
             self.core_trajectory.to_input(fout)
-        if self.core_velocities.status == True:
+        if section_active(self, "core_velocities"):
             self.core_velocities.to_input(fout)
-        if self.forces.status == True:
+        if section_active(self, "forces"):
             self.forces.to_input(fout)
-        if self.force_mixing_labels.status == True:
+        if section_active(self, "force_mixing_labels"):
             self.force_mixing_labels.to_input(fout)
-        if self.mixed_energies.status == True:
+        if section_active(self, "mixed_energies"):
             self.mixed_energies.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             slef.restart.to_input(fout)
-        if self.restart_history.status == True:
+        if section_active(self, "restart_history"):
             self.restart_history.to_input(fout)
-        if self.shell_forces.status == True:
+        if section_active(self, "shell_forces"):
             self.shell_forces.to_input(fout)
-        if self.shell_trajectory.status == True:
+        if section_active(self, "shell_trajectory"):
             self.shell_trajectory.to_input(fout)
-        if self.shell_velocities.status == True:
+        if section_active(self, "shell_velocities"):
             self.shell_velocities.to_input(fout)
-        if self.stress.status == True:
+        if section_active(self, "stress"):
             self.stress.to_input(fout)
-        if self.structure_data.status == True:
+        if section_active(self, "structure_data"):
             self.structure_data.to_input(fout)
-        if self.trajectory.status == True:
+        if section_active(self, "trajectory"):
             self.trajectory.to_input(fout)
-        if self.translation_vector.status == True:
+        if section_active(self, "translation_vector"):
             self.translation_vector.to_input(fout)
-        if self.velocities.status == True:
+        if section_active(self, "velocities"):
             self.velocities.to_input(fout)
         fout.write("\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "CELL":
-                self.cell.set_params({item: params[item]})
-            elif item.split("-")[1] == "CORE_FORCES":
-                self.core_forces.set_params({item: params[item]})
-            elif item.split("-")[1] == "CORE_TRAJECTORY":
-                self.core_trajectory.set_params({item: params[item]})
-            elif item.split("-")[1] == "CORE_VELOCITIES":
-                self.core_velocities.set_params({item: params[item]})
-            elif item.split("-")[1] == "FORCES":
-                self.forces.set_params({item: params[item]})
-            elif item.split("-")[1] == "FORCE_MIXING_LABELS":
-                self.force_mixing_labels.set_params({item: params[item]})
-            elif item.split("-")[1] == "MIXED_ENERGIES":
-                self.mixed_energies.set_params({item: params[item]})
-            elif item.split("-")[1] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            elif item.split("-")[1] == "RESTART_HISTORY":
-                slef.restart_history.set_params({item: params[item]})
-            elif item.split("-")[1] == "SHELL_FORCES":
-                self.shell_forces.set_params({item: params[item]})
-            elif item.split("-")[1] == "SHELL_TRAJECTORY":
-                self.shell_trajectory.set_params({item: params[item]})
-            elif item.split("-")[1] == "SHELL_VELOCITIES":
-                slef.shell_velocities.set_params({item: params[item]})
-            elif item.split("-")[1] == "STRESS":
-                self.stress.set_params({item: params[item]})
-            elif item.split("-")[1] == "STRUCTURE_DATA":
-                self.structure_data.set_params({item: params[item]})
-            elif item.split("-")[1] == "TRAJECTORY":
-                self.trajectory.set_params({item: params[item]})
-            elif item.split("-")[1] == "TRANSLATION_VECTOR":
-                self.translation_vector.set_params({item: params[item]})
-            elif item.split("-")[1] == "VELOCITIES":
-                self.velocities.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
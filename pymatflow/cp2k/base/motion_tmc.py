@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 
 class cp2k_motion_tmc_move_type:
@@ -23,11 +25,7 @@ class cp2k_motion_tmc_move_type:
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_tmc_nmc_moves_move_type:
     def __init__(self):
@@ -49,24 +47,20 @@ class cp2k_motion_tmc_nmc_moves_move_type:
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_tmc_nmc_moves:
+    mvoe_type = lazy_section("cp2k_motion_tmc_nmc_moves_move_type", "MOVE_TYPE")
+
     def __init__(self):
         self.params = {
                 }
 
         self.status = False
 
-        self.mvoe_type = cp2k_motion_tmc_nmc_moves_move_type()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -75,19 +69,13 @@ class cp2k_motion_tmc_nmc_moves:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.mvoe_type.status == True:
+        if section_active(self, "mvoe_type"):
             self.move_type.to_input(fout)
         fout.write("\t\t&END NMC_MOVES\n")
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "MOVE_TYPE":
-                self.move_type.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_tmc_tmc_analysis_charge:
     def __init__(self):
@@ -109,24 +97,20 @@ class cp2k_motion_tmc_tmc_analysis_charge:
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_tmc_tmc_analysis:
+    charge = lazy_section("cp2k_motion_tmc_tmc_analysis_charge", "CHARGE")
+
     def __init__(self):
         self.params = {
                 }
 
         self.status = False
 
-        self.charge = cp2k_motion_tmc_tmc_analysis_charge()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -135,19 +119,13 @@ class cp2k_motion_tmc_tmc_analysis:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.charge.status == True:
+        if section_active(self, "charge"):
             self.charge.to_input(fout)
         fout.write("\t\t&END TMC_ANALYSIS\n")
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CHARGE":
-                self.charge.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_motion_tmc_tmc_analysis_files_charge:
     def __init__(self):
@@ -169,24 +147,20 @@ class cp2k_motion_tmc_tmc_analysis_files_charge:
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_motion_tmc_tmc_analysis_files:
+    charge = lazy_section("cp2k_motion_tmc_tmc_analysis_files_charge", "CHARGE")
+
     def __init__(self):
         self.params = {
                 }
 
         self.status = False
 
-        self.charge = cp2k_motion_tmc_tmc_analysis_files_charge()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -195,35 +169,29 @@ class cp2k_motion_tmc_tmc_analysis_files:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.charge.status == True:
+        if section_active(self, "charge"):
             self.charge.to_input(fout)
         fout.write("\t\t&END TMC_ANALYSIS_FILES\n")
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CHARGE":
-                self.charge.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_motion_tmc:
+    move_type = lazy_section("cp2k_motion_tmc_move_type", "MOVE_TYPE")
+    nmc_moves = lazy_section("cp2k_motion_tmc_nmc_moves", "NMC_MOVES")
+    tmc_analysis = lazy_section("cp2k_motion_tmc_tmc_analysis", "TMC_ANALYSIS")
+    tmc_analysis_files = lazy_section("cp2k_motion_tmc_tmc_analysis_files", "TMC_ANALYSIS_FILES")
+
     def __init__(self):
         self.params = {
                 }
 
         self.status = False
 
-        self.move_type = cp2k_motion_tmc_move_type()
-        self.nmc_moves = cp2k_motion_tmc_nmc_moves()
-        self.tmc_analysis = cp2k_motion_tmc_tmc_analysis()
-        self.tmc_analysis_files = cp2k_motion_tmc_tmc_analysis_files()
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -232,28 +200,16 @@ class cp2k_motion_tmc:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.move_type.status == True:
+        if section_active(self, "move_type"):
             self.move_type.to_input(fout)
-        if self.nmc_moves.status == True:
+        if section_active(self, "nmc_moves"):
             self.nmc_moves.to_input(fout)
-        if self.tmc_analysis.status == True:
+        if section_active(self, "tmc_analysis"):
             self.tmc_analysis.to_input(fout)
-        if self.tmc_analysis_files.status == True:
+        if section_active(self, "tmc_analysis_files"):
             self.tmc_analysis_files.to_input(fout)
         fout.write("\t&END TMC\n")
     
          
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "MOVE_TYPE":
-                self.move_type.set_params({item: params[item]})
-            elif item.split("-")[1] == "NMC_MOVES":
-                self.nmc_moves.set_params({item: params[item]})
-            elif item.split("-")[1] == "TMC_ANALYSIS":
-                self.tmc_analysis.set_params({item: params[item]})
-            elif item.split("-")[1] == "TMC_ANALYSIS_FILES":
-                self.tmc_analysis_files.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
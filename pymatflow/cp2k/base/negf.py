@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 """
 Usage:
@@ -29,11 +30,7 @@ class cp2k_negf_contact_bulk_region:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_negf_contact_print_dos_each:
     """
@@ -54,23 +51,20 @@ class cp2k_negf_contact_print_dos_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_negf_contact_print_dos:
     """
 
     """
+    each = lazy_section("cp2k_negf_contact_print_dos_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_negf_contact_print_dos_each()
         # basic setting
     def to_input(self, fout):
         # fout: a file stream for writing
@@ -84,25 +78,20 @@ class cp2k_negf_contact_print_dos:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_negf_contact_print:
     """
 
     """
+    dos = lazy_section("cp2k_negf_contact_print_dos", "DOS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.dos = cp2k_negf_contact_print_dos()
         # basic setting
 
     def to_input(self, fout):
@@ -111,19 +100,13 @@ class cp2k_negf_contact_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.dos.status == True:
+        if section_active(self, "dos"):
             self.dos.to_input(fout)
         fout.write("\t\t&END PRINT\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DOS":
-                self.dos.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_negf_contact_screening_region:
     """
@@ -144,24 +127,21 @@ class cp2k_negf_contact_screening_region:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_negf_contact:
     """
 
     """
+    bulk_region = lazy_section("cp2k_negf_contact_bulk_region", "BULK_REGION")
+    printout = lazy_section("cp2k_negf_contact_print", "PRINT")
+    screening_region = lazy_section("cp2k_negf_contact_screening_region", "SCREENING_REGION")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.bulk_region = cp2k_negf_contact_bulk_region()
-        self.printout = cp2k_negf_contact_print()
-        self.screening_region = cp2k_negf_contact_screening_region()
         # basic setting
 
     def to_input(self, fout):
@@ -170,27 +150,17 @@ class cp2k_negf_contact:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.bulk_region.status == True:
+        if section_active(self, "bulk_region"):
             self.bulk_region.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.screening_region.status == True:
+        if section_active(self, "screening_region"):
             self.screening_region.to_input(fout)
         fout.write("\t&END CONTACT\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "BULK_REGION":
-                self.bulk_region.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[1] == "SCREENING_REGION":
-                self.screening_region.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_negf_mixing:
@@ -212,11 +182,7 @@ class cp2k_negf_mixing:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_negf_print_dos_each:
@@ -238,22 +204,19 @@ class cp2k_negf_print_dos_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_negf_print_dos:
     """
 
     """
+    each = lazy_section("cp2k_negf_print_dos_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_negf_print_dos_each()
         # basic setting
 
     def to_input(self, fout):
@@ -262,19 +225,13 @@ class cp2k_negf_print_dos:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END DOS\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_negf_print_transmission_each:
     """
@@ -295,22 +252,19 @@ class cp2k_negf_print_transmission_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_negf_print_transmission:
     """
 
     """
+    each = lazy_section("cp2k_negf_print_transmission_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_negf_print_transmission_each()
         # basic setting
 
     def to_input(self, fout):
@@ -319,32 +273,27 @@ class cp2k_negf_print_transmission:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END TRANSMISSION\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_negf_print:
     """
 
     """
+    dos = lazy_section("cp2k_negf_print_dos", "DOS")
+    transmission = lazy_section("cp2k_negf_print_transmission", "TRANSMISSION")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.dos = cp2k_negf_print_dos()
-        self.transmission = cp2k_negf_print_transmission()
         # basic setting
 
     def to_input(self, fout):
@@ -353,23 +302,15 @@ class cp2k_negf_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.dos.status == True:
+        if section_active(self, "dos"):
             self.dos.to_input(fout)
-        if self.transmission.status == True:
+        if section_active(self, "transmission"):
             self.transmission.to_input(fout)
         fout.write("\t&END PRINT\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "DOS":
-                self.dos.set_params({item: params[item]})
-            elif item.split("-")[1] == "TRANSMISSION":
-                self.transmission.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_negf_scattering_region:
@@ -391,26 +332,23 @@ class cp2k_negf_scattering_region:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_negf:
     """
 
     """
+    contact = lazy_section("cp2k_negf_contact", "CONTACT")
+    mixing = lazy_section("cp2k_negf_mixing", "MIXING")
+    printout = lazy_section("cp2k_negf_print", "PRINT")
+    scattering_region = lazy_section("cp2k_negf_scattering_region", "SCATTERING_REGION")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.contact = cp2k_negf_contact()
-        self.mixing = cp2k_negf_mixing()
-        self.printout = cp2k_negf_print()
-        self.scattering_region = cp2k_negf_scattering_region()
         # basic setting
 
     def to_input(self, fout):
@@ -419,30 +357,18 @@ class cp2k_negf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.contact.status == True:
+        if section_active(self, "contact"):
             self.contact.to_input(fout)
-        if self.mixing.status == True:
+        if section_active(self, "mixing"):
             self.mixing.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.scattering_region.status == True:
+        if section_active(self, "scattering_region"):
             self.scattering_region.to_input(fout)
         fout.write("&END NEGF\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "CONTACT":
-                self.contact.set_params({item: params[item]})
-            elif item.split("-")[0] == "MIXING":
-                self.mixing.set_params({item: params[item]})
-            elif ietm.split("-")[0] == "PRITN":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[0] == "SCATTERING_REGION":
-                self.scattering_region.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
 
 
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -33,11 +34,7 @@ class cp2k_optimize_basis_fit_kind_constrain_exponents:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_optimize_basis_fit_kind_derived_basis_sets:
     """
@@ -60,23 +57,20 @@ class cp2k_optimize_basis_fit_kind_derived_basis_sets:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_optimize_basis_fit_kind:
     """
     """
+    constrain_exponents = lazy_section("cp2k_optimize_basis_fit_kind_constrain_exponents", "CONSTRAIN_EXPONENTS")
+    derived_basis_sets = lazy_section("cp2k_optimize_basis_fit_kind_derived_basis_sets", "DERIVED_BASIS_SETS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.constrain_exponents = cp2k_optimize_basis_fit_kind_constrain_exponents()
-        self.derived_basis_sets = cp2k_optimize_basis_fit_kind_derived_basis_sets()
         # basic setting
 
     def to_input(self, fout):
@@ -85,24 +79,16 @@ class cp2k_optimize_basis_fit_kind:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.constrain_exponents.status == True:
+        if section_active(self, "constrain_exponents"):
             self.constrain_exponents.to_input(fout)
-        if self.derived_basis_sets.status == True:
+        if section_active(self, "derived_basis_sets"):
             self.derived_basis_sets.to_input(fout)
         fout.write("\t&END FIT_KIND\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "CONSTRAIN_EXPONENTS":
-                self.constrain_exponents.set_params({item: params[item]})
-            elif item.split("-")[1] == "DERIVED_BASIS_SETS":
-                self.derived_basis_sets.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_optimize_basis_optimization:
@@ -126,11 +112,7 @@ class cp2k_optimize_basis_optimization:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_optimize_basis_training_files:
@@ -154,24 +136,21 @@ class cp2k_optimize_basis_training_files:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_optimize_basis:
     """
     """
+    fit_kind = lazy_section("cp2k_optimize_basis_fit_kind", "FIT_KIND")
+    optimization = lazy_section("cp2k_optimize_basis_optimization", "OPTIMIZATION")
+    traning_files = lazy_section("cp2k_optimize_basis_training_files", "TRAINING_FILES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
             
-        self.fit_kind = cp2k_optimize_basis_fit_kind()
-        self.optimization = cp2k_optimize_basis_optimization()
-        self.traning_files = cp2k_optimize_basis_training_files()
         # basic setting
 
     def to_input(self, fout):
@@ -180,9 +159,9 @@ class cp2k_optimize_basis:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.fit_kind.status == True:
+        if section_active(self, "fit_kind"):
             self.fit_kind.to_input(fout)
-        if self.optimization.status == True:
+        if section_active(self, "optimization"):
             self.optimization.to_input(fout)
         if self.training_files.status == True:
             self.training_files.to_input(fout)
@@ -191,16 +170,6 @@ class cp2k_optimize_basis:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "FIT_KIND":
-                self.fit_kind.set_params({item: params[item]})
-            elif item.split("-")[0] == "OPTIMIZATION":
-                self.optimization.set_params({item: params[item]})
-            elif item.split("-")[0] == "TRAINING_FILES":
-                self.training_files.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
 
 
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -32,22 +33,19 @@ class cp2k_optimize_input_force_matching_compare_energies_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_optimize_input_force_matching_compare_energies:
     """
     """
+    each = lazy_section("cp2k_optimize_input_force_matching_compare_energies_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_optimize_input_force_matching_compare_energies_each()
         # basic setting
 
     def to_input(self, fout):
@@ -56,20 +54,14 @@ class cp2k_optimize_input_force_matching_compare_energies:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END COMPARE_ENERGIES\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_optimize_input_force_matching_compare_forces_each:
@@ -93,22 +85,19 @@ class cp2k_optimize_input_force_matching_compare_forces_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_optimize_input_force_matching_compare_forces:
     """
     """
+    each = lazy_section("cp2k_optimize_input_force_matching_compare_forces_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_optimize_input_force_matching_compare_forces_each()
         # basic setting
 
     def to_input(self, fout):
@@ -117,32 +106,27 @@ class cp2k_optimize_input_force_matching_compare_forces:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END COMPARE_FORCES\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_optimize_input_force_matching:
     """
     """
+    compare_energies = lazy_section("cp2k_optimize_input_force_matching_compare_energies", "COMPARE_ENERGIES")
+    compare_forces = lazy_section("cp2k_optimize_input_force_matching_compare_forces", "COMPARE_FORCES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.compare_energies = cp2k_optimize_input_force_matching_compare_energies()
-        self.compare_forces = cp2k_optimize_input_force_matching_compare_forces()
         # basic setting
 
     def to_input(self, fout):
@@ -153,22 +137,14 @@ class cp2k_optimize_input_force_matching:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
         if self.compare_eenrgies.status == True:
             self.compare_energies.to_input(fout)
-        if self.compare_forces.status == True:
+        if section_active(self, "compare_forces"):
             self.compare_forces.to_input(fout)
         fout.write("\t&END FORCE_MATCHING\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "COMPARE_ENERGIES":
-                self.compare_energies.set_params({item: params[item]})
-            elif item.split("-")[1] == "COMPARE_FORCES":
-                self.compare_forces.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_optimize_input_history_each:
@@ -192,22 +168,19 @@ class cp2k_optimize_input_history_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_optimize_input_history:
     """
     """
+    each = lazy_section("cp2k_optimize_input_history_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_optimize_input_history_each()
         # basic setting
 
     def to_input(self, fout):
@@ -216,20 +189,14 @@ class cp2k_optimize_input_history:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t&END HISTORY\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 class cp2k_optimize_input_restart_each:
     """
@@ -252,22 +219,19 @@ class cp2k_optimize_input_restart_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_optimize_input_restart:
     """
     """
+    each = lazy_section("cp2k_optimize_input_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_optimize_input_restart_each()
         # basic setting
 
     def to_input(self, fout):
@@ -276,20 +240,14 @@ class cp2k_optimize_input_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t&END RESTART\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_optimize_input_variable:
@@ -313,25 +271,22 @@ class cp2k_optimize_input_variable:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_optimize_input:
     """
     """
+    force_matching = lazy_section("cp2k_optimize_input_force_matching", "FORCE_MATCHING")
+    history = lazy_section("cp2k_optimize_input_history", "HISTORY")
+    restart = lazy_section("cp2k_optimize_input_restart", "RESTART")
+    variable = lazy_section("cp2k_optimize_input_variable", "VARIABLE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.force_matching = cp2k_optimize_input_force_matching()
-        self.history = cp2k_optimize_input_history()
-        self.restart = cp2k_optimize_input_restart()
-        self.variable = cp2k_optimize_input_variable()
         # basic setting
 
     def to_input(self, fout):
@@ -340,31 +295,19 @@ class cp2k_optimize_input:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.force_matching.status == True:
+        if section_active(self, "force_matching"):
             self.force_matching.to_input(fout)
-        if self.history.status == True:
+        if section_active(self, "history"):
             self.history.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
-        if self.variable.status == True:
+        if section_active(self, "variable"):
             self.restart.to_input(fout)
         fout.write("&END OPTIMIZE_INPUT\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "FORCE_MATCHING":
-                self.force_matching.set_params({item: params[item]})
-            elif item.split("-")[0] == "HISTORY":
-                self.history.set_params({item: params[item]})
-            elif item.split("-")[0] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            elif item.split("-")[0] == "VARIABLE":
-                self.variable.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
 
 
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -38,22 +39,19 @@ class cp2k_print_distribution_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_print_distribution:
     """
 
     """
+    each = lazy_section("cp2k_print_distribution_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_print_distribution_each()
         # basic setting
 
     def to_input(self, fout):
@@ -69,13 +67,7 @@ class cp2k_print_distribution:
         fout.write("\t\t&end distribution\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -102,22 +94,19 @@ class cp2k_print_distribution1d_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_print_distribution1d:
     """
 
     """
+    each = lazy_section("cp2k_print_distribution1d_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_print_distribution1d_each()
         # basic setting
 
     def to_input(self, fout):
@@ -133,13 +122,7 @@ class cp2k_print_distribution1d:
         fout.write("\t\t&end distribution1d\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_print_distribution2d_each:
@@ -165,22 +148,19 @@ class cp2k_print_distribution2d_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_print_distribution2d:
     """
 
     """
+    each = lazy_section("cp2k_print_distribution2d_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_print_distribution2d_each()
         # basic setting
 
     def to_input(self, fout):
@@ -196,13 +176,7 @@ class cp2k_print_distribution2d:
         fout.write("\t\t&end distribution2d\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_print_forces_each:
     """
@@ -227,22 +201,19 @@ class cp2k_print_forces_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_print_forces:
     """
 
     """
+    each = lazy_section("cp2k_print_forces_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_print_forces_each()
         # basic setting
 
     def to_input(self, fout):
@@ -258,13 +229,7 @@ class cp2k_print_forces:
         fout.write("\t\t&end forces\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_print_grid_information_each:
     """
@@ -289,22 +254,19 @@ class cp2k_print_grid_information_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_print_grid_information:
     """
 
     """
+    each = lazy_section("cp2k_print_grid_information_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_print_grid_information_each()
         # basic setting
 
     def to_input(self, fout):
@@ -320,13 +282,7 @@ class cp2k_print_grid_information:
         fout.write("\t\t&end grid_information\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_print_program_run_info_each:
     """
@@ -351,22 +307,19 @@ class cp2k_print_program_run_info_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_print_program_run_info:
     """
 
     """
+    each = lazy_section("cp2k_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -382,13 +335,7 @@ class cp2k_print_program_run_info:
         fout.write("\t\t&end program_run_info\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_print_stress_tensor_each:
     """
@@ -413,22 +360,19 @@ class cp2k_print_stress_tensor_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_print_stress_tensor:
     """
 
     """
+    each = lazy_section("cp2k_print_stress_tensor_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_print_stress_tensor_each()
         # basic setting
 
     def to_input(self, fout):
@@ -444,13 +388,7 @@ class cp2k_print_stress_tensor:
         fout.write("\t\t&end stress_tensor\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_print_total_numbers_each:
     """
@@ -475,22 +413,19 @@ class cp2k_print_total_numbers_each:
         fout.write("\t\t\t&end each\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_print_total_numbers:
     """
 
     """
+    each = lazy_section("cp2k_print_total_numbers_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_print_total_numbers_each()
         # basic setting
 
     def to_input(self, fout):
@@ -506,13 +441,7 @@ class cp2k_print_total_numbers:
         fout.write("\t\t&end total_numbers\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "each":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 
@@ -520,19 +449,20 @@ class cp2k_print:
     """
 
     """
+    distribution = lazy_section("cp2k_print_distribution", "DISTRIBUTION")
+    distribution1d = lazy_section("cp2k_print_distribution1d", "DISTRIBUTION1D")
+    distribution2d = lazy_section("cp2k_print_distribution2d", "DISTRIBUTION2D")
+    forces = lazy_section("cp2k_print_forces", "FORCES")
+    grid_information = lazy_section("cp2k_print_grid_information", "GRID_INFORMATION")
+    program_run_info = lazy_section("cp2k_print_program_run_info", "PROGRAM_RUN_INFO")
+    stress_tensor = lazy_section("cp2k_print_stress_tensor", "STRESS_TENSOR")
+    total_numbers = lazy_section("cp2k_print_total_numbers", "TOTAL_NUMBERS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.distribution = cp2k_print_distribution()
-        self.distribution1d = cp2k_print_distribution1d()
-        self.distribution2d = cp2k_print_distribution2d()
-        self.forces = cp2k_print_forces()
-        self.grid_information = cp2k_print_grid_information()
-        self.program_run_info = cp2k_print_program_run_info()
-        self.stress_tensor = cp2k_print_stress_tensor()
-        self.total_numbers = cp2k_print_total_numbers()
         # basic setting
 
     def to_input(self, fout):
@@ -543,43 +473,23 @@ class cp2k_print:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.distribution.status == True:
+        if section_active(self, "distribution"):
             self.distribution.to_input(fout)
-        if self.distribution1d.status == True:
+        if section_active(self, "distribution1d"):
             self.distribution1d.to_input(fout)
-        if self.distribution2d.status == True:
+        if section_active(self, "distribution2d"):
             self.distribution2d.to_input(fout)
-        if self.forces.status == True:
+        if section_active(self, "forces"):
             self.forces.to_input(fout)
-        if self.grid_information.status == True:
+        if section_active(self, "grid_information"):
             self.grid_information.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.stress_tensor.status == True:
+        if section_active(self, "stress_tensor"):
             self.stress_tensor.to_input(fout)
-        if self.total_numbers.status == True:
+        if section_active(self, "total_numbers"):
             self.total_numbers.to_input(fout)
         fout.write("\t&END PRINTn")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "DISTRIBUTION":
-                self.distribution.set_params({item: params[item]})
-            elif item.split("-")[1] == "DISTRIBUTION1D":
-                self.distribution1d.set_params({item: params[item]})
-            elif item.split("-")[1] == "DISTRIBUTION2D":
-                self.distribution2d.set_params({item: params[item]})
-            elif item.split("-")[1] == "FORCES":
-                self.forces.set_params({item: params[item]})
-            elif item.split("-")[1] == "GRID_INFORMATION":
-                self.grid_information.set_params({item: params[item]})
-            elif item.split("-")[1] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "STRESS_TENSOR":
-                self.stress_tensor.set_params({item: params[item]})
-            elif item.split("-")[1] == "TOTAL_NUMBERS":
-                self.total_numbers.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
+
 
 class cp2k_properties_atomic:
     def __init__(self):
@@ -17,11 +19,7 @@ class cp2k_properties_atomic:
         fout.write("\t\t&END ATOMIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_properties_et_coupling_becke_constraint_a_atom_group:
@@ -39,11 +37,7 @@ class cp2k_properties_et_coupling_becke_constraint_a_atom_group:
         fout.write("\t\t\t\t&END ATOM_GROUP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_et_coupling_becke_constraint_a_dummy_atoms:
     def __init__(self):
@@ -60,11 +54,7 @@ class cp2k_properties_et_coupling_becke_constraint_a_dummy_atoms:
         fout.write("\t\t\t\t&END DUMMY_ATOMS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_et_coupling_becke_constraint_a_program_run_info_each:
     def __init__(self):
@@ -81,20 +71,17 @@ class cp2k_properties_et_coupling_becke_constraint_a_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_et_coupling_becke_constraint_a_program_run_info:
+    each = lazy_section("cp2k_properties_et_coupling_becke_constraint_a_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_et_coupling_becke_constraint_a_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -102,29 +89,24 @@ class cp2k_properties_et_coupling_becke_constraint_a_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_et_coupling_becke_constraint_a:
+    atom_group = lazy_section("cp2k_properties_et_coupling_becke_constraint_a_atom_group", "ATOM_GROUP")
+    dummy_atoms = lazy_section("cp2k_properties_et_coupling_becke_constraint_a_dummy_atoms", "DUMMY_ATOMS")
+    program_run_info = lazy_section("cp2k_properties_et_coupling_becke_constraint_a_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.atom_group = cp2k_properties_et_coupling_becke_constraint_a_atom_group()
-        self.dummy_atoms = cp2k_properties_et_coupling_becke_constraint_a_dummy_atoms()
-        self.program_run_info = cp2k_properties_et_coupling_becke_constraint_a_program_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -132,26 +114,16 @@ class cp2k_properties_et_coupling_becke_constraint_a:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.atom_group.status == True:
+        if section_active(self, "atom_group"):
             self.atom_group.to_input(fout)
-        if self.dummy_atoms.status == True:
+        if section_active(self, "dummy_atoms"):
             self.dummy_atoms.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END BECKE_CONSTRAINT_A\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "ATOM_GROUP":
-                self.atom_group.set_params({item: params[item]})
-            elif item.split("-")[3] == "DUMMY_ATOMS":
-                self.dummy_atoms.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_et_coupling_becke_constraint_b_atom_group:
     def __init__(self):
@@ -168,11 +140,7 @@ class cp2k_properties_et_coupling_becke_constraint_b_atom_group:
         fout.write("\t\t\t\t&END ATOM_GROUP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_et_coupling_becke_constraint_b_dummy_atoms:
     def __init__(self):
@@ -189,11 +157,7 @@ class cp2k_properties_et_coupling_becke_constraint_b_dummy_atoms:
         fout.write("\t\t\t\t&END DUMMY_ATOMS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_et_coupling_becke_constraint_b_program_run_info_each:
     def __init__(self):
@@ -210,20 +174,17 @@ class cp2k_properties_et_coupling_becke_constraint_b_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_et_coupling_becke_constraint_b_program_run_info:
+    each = lazy_section("cp2k_properties_et_coupling_becke_constraint_b_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_et_coupling_becke_constraint_b_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -231,29 +192,24 @@ class cp2k_properties_et_coupling_becke_constraint_b_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_et_coupling_becke_constraint_b:
+    atom_group = lazy_section("cp2k_properties_et_coupling_becke_constraint_b_atom_group", "ATOM_GROUP")
+    dummy_atoms = lazy_section("cp2k_properties_et_coupling_becke_constraint_b_dummy_atoms", "DUMMY_ATOMS")
+    program_run_info = lazy_section("cp2k_properties_et_coupling_becke_constraint_b_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.atom_group = cp2k_properties_et_coupling_becke_constraint_b_atom_group()
-        self.dummy_atoms = cp2k_properties_et_coupling_becke_constraint_b_dummy_atoms()
-        self.program_run_info = cp2k_properties_et_coupling_becke_constraint_b_program_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -261,26 +217,16 @@ class cp2k_properties_et_coupling_becke_constraint_b:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.atom_group.status == True:
+        if section_active(self, "atom_group"):
             self.atom_group.to_input(fout)
-        if self.dummy_atoms.status == True:
+        if section_active(self, "dummy_atoms"):
             self.dummy_atoms.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END BECKE_CONSTRAINT_B\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "ATOM_GROUP":
-                self.atom_group.set_params({item: params[item]})
-            elif item.split("-")[3] == "DUMMY_ATOMS":
-                self.dummy_atoms.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_et_coupling_ddapc_restraint_a_program_run_info_each:
     def __init__(self):
@@ -297,69 +243,53 @@ class cp2k_properties_et_coupling_ddapc_restraint_a_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_et_coupling_ddapc_restraint_a_program_run_info:
+    each = lazy_section("cp2k_properties_et_coupling_ddapc_restraint_a_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_et_coupling_ddapc_restraint_a_program_run_info_each()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t&PROGRAM_RUN_INFO\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_et_coupling_ddapc_restraint_a:
+    program_run_info = lazy_section("cp2k_properties_et_coupling_ddapc_restraint_a_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.program_run_info = cp2k_properties_et_coupling_ddapc_restraint_a_program_run_info()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t&DDAPC_RESTRAINT_A\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END DDAPC_RESTRAINT_A\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_properties_et_coupling_ddapc_restraint_b_program_run_info_each:
@@ -377,69 +307,53 @@ class cp2k_properties_et_coupling_ddapc_restraint_b_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_et_coupling_ddapc_restraint_b_program_run_info:
+    each = lazy_section("cp2k_properties_et_coupling_ddapc_restraint_b_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_et_coupling_ddapc_restraint_b_program_run_info_each()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t&PROGRAM_RUN_INFO\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_et_coupling_ddapc_restraint_b:
+    program_run_info = lazy_section("cp2k_properties_et_coupling_ddapc_restraint_b_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.program_run_info = cp2k_properties_et_coupling_ddapc_restraint_b_program_run_info()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t&DDAPC_RESTRAINT_A\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END DDAPC_RESTRAINT_A\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_et_coupling_program_run_info_each:
     def __init__(self):
@@ -456,40 +370,30 @@ class cp2k_properties_et_coupling_program_run_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_et_coupling_program_run_info:
+    each = lazy_section("cp2k_properties_et_coupling_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_et_coupling_program_run_info_each()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t&PROGRAM_RUN_INFO\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_et_coupling_projection_block_print_mo_cubes_each:
     def __init__(self):
@@ -506,95 +410,73 @@ class cp2k_properties_et_coupling_projection_block_print_mo_cubes_each:
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_properties_et_coupling_projection_block_print_mo_cubes:
+    each = lazy_section("cp2k_properties_et_coupling_projection_block_print_mo_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_et_coupling_projection_block_print_mo_cubes_each()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t\t&PRINT\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_et_coupling_projection_block_print:
+    mo_cubes = lazy_section("cp2k_properties_et_coupling_projection_block_print_mo_cubes", "MO_CUBES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.mo_cubes = cp2k_properties_et_coupling_projection_block_print_mo_cubes()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t\t&PRINT\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.mo_cubes.status == True:
+        if section_active(self, "mo_cubes"):
             self.mo_cubes.to_input(fout)
         fout.write("\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "MO_CUBES":
-                slef.mo_cubes.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_et_coupling_projection_block:
+    printout = lazy_section("cp2k_properties_et_coupling_projection_block_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_properties_et_coupling_projection_block_print()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t&BLOCK\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t&END BLOCK\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_et_coupling_projection_program_run_info_each:
     def __init__(self):
@@ -611,127 +493,93 @@ class cp2k_properties_et_coupling_projection_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_et_coupling_projection_program_run_info:
+    each = lazy_section("cp2k_properties_et_coupling_projection_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_et_coupling_projection_program_run_info_each()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t&PROGRAM_RUN_INFO\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_et_coupling_projection:
+    block = lazy_section("cp2k_properties_et_coupling_projection_block", "BLOCK")
+    program_run_info = lazy_section("cp2k_properties_et_coupling_projection_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.block = cp2k_properties_et_coupling_projection_block()
-        self.program_run_info = cp2k_properties_et_coupling_projection_program_run_info()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t&PROJECTION\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.block.status == True:
+        if section_active(self, "block"):
             self.block.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END PROJECTION\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "BLOCK":
-                self.block.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_properties_et_coupling:
+    becke_constraint_a = lazy_section("cp2k_properties_et_coupling_becke_constraint_a", "BECKE_CONSTRAINT_A")
+    becke_constraint_b = lazy_section("cp2k_properties_et_coupling_becke_constraint_b", "BECKE_CONSTRAINT_B")
+    ddapc_restraint_a = lazy_section("cp2k_properties_et_coupling_ddapc_restraint_a", "DDAPC_RESTRAINT_A")
+    ddapc_restraint_b = lazy_section("cp2k_properties_et_coupling_ddapc_restraint_b", "DDAPC_RESTRAINT_B")
+    program_run_info = lazy_section("cp2k_properties_et_coupling_program_run_info", "PROGRAM_RUN_INFO")
+    projection = lazy_section("cp2k_properties_et_coupling_projection", "PROJECTION")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.becke_constraint_a = cp2k_properties_et_coupling_becke_constraint_a()
-        self.becke_constraint_b = cp2k_properties_et_coupling_becke_constraint_b()
-        self.ddapc_restraint_a = cp2k_properties_et_coupling_ddapc_restraint_a()
-        self.ddapc_restraint_b = cp2k_properties_et_coupling_ddapc_restraint_b()
-        self.program_run_info = cp2k_properties_et_coupling_program_run_info()
-        self.projection = cp2k_properties_et_coupling_projection()
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t&ET_COUPLING\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.becke_constraint_a.status == True:
+        if section_active(self, "becke_constraint_a"):
             slef.becke_constraint_a.to_input(fout)
-        if self.becke_constraint_b.status == True:
+        if section_active(self, "becke_constraint_b"):
             self.becke_constraint_b.to_input(fout)
-        if self.ddapc_restraint_a.status == True:
+        if section_active(self, "ddapc_restraint_a"):
             self.ddapc_restraint_a.to_input(fout)
-        if self.ddapc_restraint_b.status == True:
+        if section_active(self, "ddapc_restraint_b"):
             self.ddapc_restraint_b.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.projection.status == True:
+        if section_active(self, "projection"):
             self.projection.to_input(fout)
         fout.write("\t\t&END ET_COUPLING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BECKE_CONSTRAINT_A":
-                self.becke_constraint_a.set_params({item: params[item]})
-            elif item.split("-")[2] == "BECKE_CONSTRAINT_B":
-                self.becke_constraint_b.set_params({item: params[item]})
-            elif item.split("-")[2] == "DDAPC_RESTRAINT_A":
-                self.ddapc_restraint_a.set_params({item: params[item]})
-            elif item.split("-")[2] == "DDAPC_RESTRAINT_B":
-                self.ddapc_restraint_b.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROJECTION":
-                self.projection.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_properties_fit_charge_each:
     def __init__(self):
@@ -748,38 +596,28 @@ class cp2k_properties_fit_charge_each:
         fout.write("\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_properties_fit_charge:
+    each = lazy_section("cp2k_properties_fit_charge_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_fit_charge_each()
-
     def to_input(self, fout):
         fout.write("\t\t&FIT_CHARGE\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END FIT_CHARGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_properties_resp_constraint:
@@ -796,11 +634,7 @@ class cp2k_properties_resp_constraint:
         fout.write("\t\t\t&END CONSTRAINT\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_resp_print_coord_fit_points_each:
     def __init__(self):
@@ -819,41 +653,30 @@ class cp2k_properties_resp_print_coord_fit_points_each:
         fout.write("\t\t\t\t\t&END EACH\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_resp_print_coord_fit_points:
+    each = lazy_section("cp2k_properties_resp_print_coord_fit_points_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_resp_print_coord_fit_points_each()
-        
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t&COORD_FIT_POINTS\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END COORD_FIT_POINTS\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "COORD_FIT_POINTS":
-                self.coord_fit_points.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_resp_print_program_run_info_each:
     def __init__(self):
@@ -872,41 +695,30 @@ class cp2k_properties_resp_print_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_resp_print_program_run_info:
+    each = lazy_section("cp2k_properties_resp_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_resp_print_program_run_info_each()
-        
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t&PROGRAM_RUN_INFO\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_resp_print_resp_charges_to_file_each:
     def __init__(self):
@@ -925,40 +737,29 @@ class cp2k_properties_resp_print_resp_charges_to_file_each:
         fout.write("\t\t\t\t\t&END EACH\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_resp_print_resp_charges_to_file:
+    each = lazy_section("cp2k_properties_resp_print_resp_charges_to_file_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_resp_print_resp_charges_to_file_each()
-        
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t&RESP_CHARGES_TO_FILE\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RESP_CHARGES_TO_FILE\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_resp_print_v_resp_cube_each:
     def __init__(self):
@@ -977,87 +778,63 @@ class cp2k_properties_resp_print_v_resp_cube_each:
         fout.write("\t\t\t\t\t&END EACH\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_resp_print_v_resp_cube:
+    each = lazy_section("cp2k_properties_resp_print_v_resp_cube_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_resp_print_v_resp_cube_each()
-        
         # basic setting
 
-
     def to_input(self, fout):
         fout.write("\t\t\t\t&V_RESP_CUBE\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END V_RESP_CUBE\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_resp_print:
+    coord_fit_points = lazy_section("cp2k_properties_resp_print_coord_fit_points", "COORD_FIT_POINTS")
+    program_run_info = lazy_section("cp2k_properties_resp_print_program_run_info", "PROGRAM_RUN_INFO")
+    resp_charges_to_file = lazy_section("cp2k_properties_resp_print_resp_charges_to_file", "RESP_CHARGES_TO_FILE")
+    v_resp_cube = lazy_section("cp2k_properties_resp_print_v_resp_cube", "V_RESP_CUBE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.coord_fit_points = cp2k_properties_resp_print_coord_fit_points()
-        self.program_run_info = cp2k_properties_resp_print_program_run_info()
-        self.resp_charges_to_file = cp2k_properties_resp_print_resp_charges_to_file()
-        self.v_resp_cube = cp2k_properties_resp_print_v_resp_cube()
-
         # basic setting
         self.v_resp_cube.status = True
 
-
     def to_input(self, fout):
         fout.write("\t\t\t&PRINT\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.coord_fit_points.status == True:
+        if section_active(self, "coord_fit_points"):
             self.coord_fit_points.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.resp_charges_to_file.status == True:
+        if section_active(self, "resp_charges_to_file"):
             self.resp_charges_to_file.to_input(fout)
-        if self.v_resp_cube.status == True:
+        if section_active(self, "v_resp_cube"):
             self.v_resp_cube.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "COORD_FIT_POINTS":
-                self.coord_fit_points.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "RESP_CHARGES_TO_FIEL":
-                self.resp_charges_to_file.set_params({item: params[item]})
-            elif item.split("-")[3] == "V_RESP_CUBE":
-                self.v_resp_cube.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_resp_restraint:
     def __init__(self):
@@ -1073,11 +850,7 @@ class cp2k_properties_resp_restraint:
         fout.write("\t\t\t&END RESTRAINT\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_properties_resp_slab_sampling:
@@ -1108,11 +881,7 @@ class cp2k_properties_resp_slab_sampling:
         fout.write("\t\t\t&END SLAB_SAMPLING\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_resp_sphere_sampling:
     def __init__(self):
@@ -1128,14 +897,16 @@ class cp2k_properties_resp_sphere_sampling:
         fout.write("\t\t\t&END SPHERE_SAMPLING\n")
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_properties_resp:
+    constraint = lazy_section("cp2k_properties_resp_constraint", "CONSTRAINT")
+    printout = lazy_section("cp2k_properties_resp_print", "PRINT")
+    restraint = lazy_section("cp2k_properties_resp_restraint", "RESTRAINT")
+    slab_sampling = lazy_section("cp2k_properties_resp_slab_sampling", "SLAB_SAMPLING")
+    sphere_sampling = lazy_section("cp2k_properties_resp_sphere_sampling", "SPHERE_SAMPLING")
+
     def __init__(self):
         self.params = {
                 "INTEGER_TOTAL_CHARGE": None,
@@ -1147,12 +918,6 @@ class cp2k_properties_resp:
                 }
         self.status = False
 
-        self.constraint = cp2k_properties_resp_constraint()
-        self.printout = cp2k_properties_resp_print()
-        self.restraint = cp2k_properties_resp_restraint()
-        self.slab_sampling = cp2k_properties_resp_slab_sampling()
-        self.sphere_sampling = cp2k_properties_resp_sphere_sampling()
-
         # basic setting
         self.printout.status = True
         self.slab_sampling.status = True
@@ -1162,35 +927,21 @@ class cp2k_properties_resp:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.constraint.status == True:
+        if section_active(self, "constraint"):
             self.constraint.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.restraint.status == True:
+        if section_active(self, "restraint"):
             self.restraint.to_input(fout)
-        if self.slab_sampling.status == True:
+        if section_active(self, "slab_sampling"):
             self.slab_sampling.to_input(fout)
-        if self.sphere_sampling.status == True:
+        if section_active(self, "sphere_sampling"):
             self.sphere_samplint.to_input(fout)
         fout.write("\t\t&END RESP\n")
 
         
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CONSTRAINT":
-                self.constraint.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[2] == "RESTRAINT":
-                self.restraint.set_params({item: params[item]})
-            elif item.split("-")[2] == "SLAB_SAMPLING":
-                self.slab_sampling.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPHERE_SAMPLING":
-                self.sphere_sampling.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_properties_linres_current_interpolator_conv_info_each:
     def __init__(self):
@@ -1208,21 +959,17 @@ class cp2k_properties_linres_current_interpolator_conv_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_current_interpolator_conv_info:
+    each = lazy_section("cp2k_properties_linres_current_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_current_interpolator_conv_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1230,28 +977,22 @@ class cp2k_properties_linres_current_interpolator_conv_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_current_interpolator:
+    conv_info = lazy_section("cp2k_properties_linres_current_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.conv_info = cp2k_properties_linres_current_interpolator_conv_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1259,18 +1000,12 @@ class cp2k_properties_linres_current_interpolator:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_linres_current_print_current_cubes_each:
     def __init__(self):
@@ -1288,21 +1023,17 @@ class cp2k_properties_linres_current_print_current_cubes_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_current_print_current_cubes:
+    each = lazy_section("cp2k_properties_linres_current_print_current_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_current_print_current_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1310,18 +1041,12 @@ class cp2k_properties_linres_current_print_current_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CURRENT_CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_current_print_response_function_cubes_each:
     def __init__(self):
@@ -1339,20 +1064,16 @@ class cp2k_properties_linres_current_print_response_function_cubes_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_linres_current_print_response_function_cubes:
+    each = lazy_section("cp2k_properties_linres_current_print_response_function_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_current_print_response_function_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1360,29 +1081,23 @@ class cp2k_properties_linres_current_print_response_function_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END RESPONSE_FUNCTION_CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_current_print:
+    current_cubes = lazy_section("cp2k_properties_linres_current_print_current_cubes", "CURRENT_CUBES")
+    response_function_cubes = lazy_section("cp2k_properties_linres_current_print_response_function_cubes", "RESPONSE_FUNCTION_CUBES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.current_cubes = cp2k_properties_linres_current_print_current_cubes()
-        self.response_function_cubes = cp2k_properties_linres_current_print_response_function_cubes()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1390,32 +1105,24 @@ class cp2k_properties_linres_current_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.current_cubes.status == True:
+        if section_active(self, "current_cubes"):
             self.current_cubes.to_input(fout)
-        if self.response_function_cubes.status == True:
+        if section_active(self, "response_function_cubes"):
             self.response_function_cubes.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CURRENT_CUBES":
-                self.current_cubes.set_params({item: params[item]})
-            elif item.split("-")[4] == "RESPONSE_FUNCTION_CUBES":
-                self.response_function_cubes.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_linres_current:
+    interpolator = lazy_section("cp2k_properties_linres_current_interpolator", "INTERPOLATOR")
+    printout = lazy_section("cp2k_properties_linres_current_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.interpolator = cp2k_properties_linres_current_interpolator()
-        self.printout = cp2k_properties_linres_current_print()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -1423,22 +1130,14 @@ class cp2k_properties_linres_current:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             self.interpolator.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t&END CURRENT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_linres_epr_interpolator_conv_info_each:
     def __init__(self):
@@ -1456,21 +1155,17 @@ class cp2k_properties_linres_epr_interpolator_conv_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_epr_interpolator_conv_info:
+    each = lazy_section("cp2k_properties_linres_epr_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_interpolator_conv_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1478,28 +1173,22 @@ class cp2k_properties_linres_epr_interpolator_conv_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_epr_interpolator:
+    conv_info = lazy_section("cp2k_properties_linres_epr_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.conv_info = cp2k_properties_linres_epr_interpolator_conv_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1507,18 +1196,12 @@ class cp2k_properties_linres_epr_interpolator:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_adiabatic_rescaling:
     def __init__(self):
@@ -1537,9 +1220,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_adiabatic_rescaling:
         fout.write("\t\t\t\t\t\t\t&END ADIABATIC_RESCALING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=7)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_hf_info_each:
@@ -1559,18 +1240,16 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_hf_info_each:
         fout.write("\t\t\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=9)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_hf_info:
+    each = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_hf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_g_tensor_xc_hf_hf_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -1582,16 +1261,12 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_hf_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&END HF_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_interaction_potential:
     def __init__(self):
@@ -1610,9 +1285,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_interaction_potential:
         fout.write("\t\t\t\t\t\t\t\t&END INTERACTION_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance_print_each:
     def __init__(self):
@@ -1631,22 +1304,16 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance_print_each:
         fout.write("\t\t\t\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[10] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=10)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance_print:
+    each = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance_print_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance_print_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1657,28 +1324,23 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[9] == "EACH":
-                self.each.set_params({item: params[item]})
+        route_params(self, params, level=9)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance:
+    printout = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance_print()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -1687,18 +1349,12 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_memory:
@@ -1718,9 +1374,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_memory:
         fout.write("\t\t\t\t\t\t\t\t&END MEMORY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_periodic:
     def __init__(self):
@@ -1739,9 +1393,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_periodic:
         fout.write("\t\t\t\t\t\t\t\t&END PERIODIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf_screening:
     def __init__(self):
@@ -1760,24 +1412,22 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf_screening:
         fout.write("\t\t\t\t\t\t\t\t&END SCREENING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_hf:
+    hf_info = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_hf_info", "HF_INFO")
+    interaction_potential = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_interaction_potential", "INTERACTION_POTENTIAL")
+    load_balance = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance", "LOAD_BALANCE")
+    memory = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_memory", "MEMORY")
+    periodic = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_periodic", "PERIODIC")
+    screening = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf_info = cp2k_properties_linres_epr_print_g_tensor_xc_hf_hf_info()
-        self.interaction_potential = cp2k_properties_linres_epr_print_g_tensor_xc_hf_interaction_potential()
-        self.load_balance = cp2k_properties_linres_epr_print_g_tensor_xc_hf_load_balance()
-        self.memory = cp2k_properties_linres_epr_print_g_tensor_xc_hf_memory()
-        self.periodic = cp2k_properties_linres_epr_print_g_tensor_xc_hf_periodic()
-        self.screening = cp2k_properties_linres_epr_print_g_tensor_xc_hf_screening()
-
         # basic setting
 
     def to_input(self, fout):
@@ -1788,38 +1438,22 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_hf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf_info.status == True:
+        if section_active(self, "hf_info"):
             self.hf_info.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.load_balance.status == True:
+        if section_active(self, "load_balance"):
             self.load_balance.to_input(fout)
-        if self.memory.status == True:
+        if section_active(self, "memory"):
             self.memory.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END HF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "HF_INFO":
-                self.hf_info.set_params({item: parmas[item]})
-            elif item.split("-")[7] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[7] == "LOAD_BALANCE":
-                self.load_balance.set_params({item: params[item]})
-            elif item.split("-")[7] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[7] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[7] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential_print_dftd_each:
     def __init__(self):
@@ -1834,18 +1468,16 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential_
         fout.write("\t\t\t\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=10)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential_print_dftd:
+    each = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential_print_dftd_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential_print_dftd_each()
-
         # basic setting
         self.each.status = True
 
@@ -1853,27 +1485,21 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential_
         fout.write("\t\t\t\t\t\t\t\t\t&PRINT_DFTD\n")
         for item in self.params:
             fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t\t&END PRINT_DFTD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[9] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=9)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential:
+    print_dftd = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential_print_dftd", "PRINT_DFTD")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.print_dftd = cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential_print_dftd()
-
         # basic setting
         self.params["PARAMETER_FILE_NAME"] = "dftd3.dat"
 
@@ -1881,16 +1507,12 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential:
         fout.write("\t\t\t\t\t\t\t\t&PAIR_POTENTIAL\n")
         for item in self.params:
             fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.print_dftd.status == True:
+        if section_active(self, "print_dftd"):
             self.print_dftd.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&END PAIR_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "PRINT_DFTD":
-                self.print_dftd.set_params({item: params[item]})
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_non_local:
     def __init__(self):
@@ -1905,12 +1527,13 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_non_local:
         fout.write("\t\t\t\t\t\t\t\t&END NON_LOCAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential:
+    pair_potential = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential", "PAIR_POTENTIAL")
+    non_local = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_non_local", "NON_LOCAL")
+
     def __init__(self):
         self.params = {
                 "POTENTIAL_TYPE": None,
@@ -1918,8 +1541,6 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential:
         self.status = False
 
         self.params["POTENTIAL_TYPE"] = "PAIR_POTENTIAL"
-        self.pair_potential = cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_pair_potential()
-        self.non_local = cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential_non_local()
 
     def to_input(self, fout):
         fout.write("\t\t\t\t\t\t\t&VDW_POTENTIAL\n")
@@ -1932,13 +1553,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential:
         fout.write("\t\t\t\t\t\t\t&END VDW_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "PAIR_POTENTIAL":
-                self.pair_potential.set_params({item: params[item]})
-            elif item.split("-")[7] == "NON_LOCAL":
-                self.non_local.set_params({item: params[item]})
+        route_params(self, params, level=7)
 
 
 
@@ -1958,11 +1573,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_cphf:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_direct_canonical:
@@ -1981,11 +1592,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_direct_canonic
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_cutoff_calib:
@@ -2004,11 +1611,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_cutoff
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=9)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_eri_mme_info_each:
     def __init__(self):
@@ -2026,21 +1629,17 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_eri_mm
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=10)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_eri_mme_info:
+    each = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_eri_mme_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_eri_mme_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -2052,31 +1651,25 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_eri_mm
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t\t&END ERI_MME_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[9] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=9)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme:
+    cutoff_calib = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_cutoff_calib", "CUTOFF_CALIB")
+    eri_mme_info = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_eri_mme_info", "ERI_MME_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cutoff_calib = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_cutoff_calib()
-        self.eri_mme_info = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme_eri_mme_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2087,24 +1680,16 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cutoff_calib.status == True:
+        if section_active(self, "cutoff_calib"):
             self.cutoff_calib.to_input(fout)
-        if self.eri_mme_info.status == True:
+        if section_active(self, "eri_mme_info"):
             self.eri_mme_info.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&END ERI_MME\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "CUTOFF_CALIB":
-                self.cutoff_calib.set_params({item: params[item]})
-            elif item.split("-")[8] == "ERI_MME_INFO":
-                self.eri_mme_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_interaction_potential:
     def __init__(self):
@@ -2122,11 +1707,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_interaction_po
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_mp2_info_each:
@@ -2148,21 +1729,17 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_mp2_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=9)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_mp2_info:
+    each = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_mp2_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_mp2_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -2174,20 +1751,14 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_mp2_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&END MP2_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_opt_ri_basis:
     def __init__(self):
@@ -2205,11 +1776,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_opt_ri_basis:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_laplace:
@@ -2228,11 +1795,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_laplace:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_mp2:
     def __init__(self):
@@ -2250,11 +1813,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_mp2:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_hf_info_each:
     def __init__(self):
@@ -2272,20 +1831,16 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_hf_i
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 12:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=11)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_hf_info:
+    each = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_hf_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_hf_info_each()
-
         # basic setting
         self.each.status = True
 
@@ -2297,20 +1852,14 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_hf_i
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t\t\t&END HF_INFO\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[10] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=10)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_interaction_potential:
     def __init__(self):
@@ -2328,11 +1877,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_inte
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=10)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance_print_each:
     def __init__(self):
@@ -2350,20 +1895,16 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 13:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=12)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance_print:
+    each = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance_print_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance_print_each()
-
         # basic setting 
         self.each.status = True
 
@@ -2375,29 +1916,23 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[10] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=11)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance:
+    printout = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2408,20 +1943,14 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t\t\t&END LOAD_BALANCE\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[10] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=10)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_memory:
     def __init__(self):
@@ -2439,11 +1968,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_memo
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=10)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_periodic:
     def __init__(self):
@@ -2461,11 +1986,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_peri
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=10)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_screening:
     def __init__(self):
@@ -2483,25 +2004,21 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_scre
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 11:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=10)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf:
+    hf_info = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_hf_info", "HF_INFO")
+    interaction_potential = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_interaction_potential", "INTERACTION_POTENTIAL")
+    load_balance = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance", "LOAD_BALANCE")
+    memory = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_memory", "MEMORY")
+    periodic = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_periodic", "PERIODIC")
+    screening = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_screening", "SCREENING")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf_info = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_hf_info()
-        self.interaction_potential = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_interaction_potential()
-        self.load_balance = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_load_balance()
-        self.memory = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_memory()
-        self.periodic = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_periodic()
-        self.screening = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf_screening()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -2510,40 +2027,24 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf_info.status == True:    
+        if section_active(self, "hf_info"):    
             self.hf_info.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.load_balance.status == True:
+        if section_active(self, "load_balance"):
             self.load_balance.to_input(fout)
         if self.memoery.status == True:
             self.memory.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.screening.status == True:
+        if section_active(self, "screening"):
             self.screening.to_input()
         fout.write("\t\t\t\t\t\t\t\t\t&end HF\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[9] == "HF_INFO":
-                self.hf_info.set_params({item: params[item]})
-            elif item.split("-")[9] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[9] == "LOAD_BALANCE":
-                self.load_balance.set_params({item: params[item]})
-            elif item.split("-")[9] == "MEMORY":
-                self.memory.set_params({item: params[item]})
-            elif item.split("-")[9] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[9] == "SCREENING":
-                self.screening.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=9)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_im_time:
@@ -2562,11 +2063,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_im_time
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=9)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_ri_axk:
@@ -2585,11 +2082,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_ri_axk:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=9)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_ri_g0w0:
     def __init__(self):
@@ -2607,23 +2100,19 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_ri_g0w0
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 10:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=9)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa:
+    hf = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf", "HF")
+    im_time = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_im_time", "IM_TIME")
+    ri_axk = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_ri_axk", "RI_AXK")
+    ri_g0w0 = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_ri_g0w0", "RI_G0W0")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.hf = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_hf()
-        self.im_time = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_im_time()
-        self.ri_axk = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_ri_axk()
-        self.ri_g0w0 = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa_ri_g0w0()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2634,32 +2123,20 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.hf.status == True:
+        if section_active(self, "hf"):
             self.hf.to_input(fout)
-        if self.im_time.status == True:
+        if section_active(self, "im_time"):
             self.im_time.to_input(fout)
-        if self.ri_axk.status == True:
+        if section_active(self, "ri_axk"):
             self.ri_axk.to_input(fout)
-        if self.ri_g0w0.status == True:
+        if section_active(self, "ri_g0w0"):
             self.ri_g0w0.to_input(fout)
         fout.write("\t\t\t\t\t\t\t\t&end RI_RPA\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[8] == "HF":
-                self.hf.set_params({item: params[item]})
-            elif item.split("-")[8] == "IM_TIME":
-                self.im_time.set_params({item: params[item]})
-            elif item.split("-")[8] == "RI_AXK":
-                self.ri_axk.set_params({item: params[item]})
-            elif item.split("-")[8] == "RI_G0W0":
-                self.ri_g0w0.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_wfc_gpw:
@@ -2678,29 +2155,25 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_wfc_gpw:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation:
+    cphf = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_cphf", "CPHF")
+    direct_canonical = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_direct_canonical", "DIRECT_CANONICAL")
+    eri_mme = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme", "ERI_MME")
+    interaction_potential = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_interaction_potential", "INTERACTION_POTENTIAL")
+    mp2_info = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_mp2_info", "MP2_INFO")
+    opt_ri_basis = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_opt_ri_basis", "OPT_RI_BASIS")
+    ri_laplace = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_laplace", "RI_LAPLACE")
+    ri_mp2 = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_mp2", "RI_MP2")
+    ri_rpa = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa", "RI_RPA")
+    wfc_gpw = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_wfc_gpw", "WFC_GPW")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cphf = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_cphf()
-        self.direct_canonical = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_direct_canonical()
-        self.eri_mme = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_eri_mme()
-        self.interaction_potential = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_interaction_potential()
-        self.mp2_info = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_mp2_info()
-        self.opt_ri_basis = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_opt_ri_basis()
-        self.ri_laplace = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_laplace()
-        self.ri_mp2 = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_mp2()
-        self.ri_rpa = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_ri_rpa()
-        self.wfc_gpw = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation_wfc_gpw()
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -2709,56 +2182,32 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cphf.status == True:
+        if section_active(self, "cphf"):
             self.cphf.to_input(fout)
-        if self.direct_canonical.status == True:
+        if section_active(self, "direct_canonical"):
             self.direct_canonical.to_input(fout)
-        if self.eri_mme.status == True:
+        if section_active(self, "eri_mme"):
             self.eri_mme.to_input(fout)
-        if self.interaction_potential.status == True:
+        if section_active(self, "interaction_potential"):
             self.interaction_potential.to_input(fout)
-        if self.mp2_info.status == True:
+        if section_active(self, "mp2_info"):
             self.mp2_info.to_input(fout)
-        if self.opt_ri_basis.status == True:
+        if section_active(self, "opt_ri_basis"):
             self.opt_ri_basis.to_input(fout)
-        if self.ri_laplace.status == True:
+        if section_active(self, "ri_laplace"):
             self.ri_laplace.to_iknput(fout)
-        if self.ri_mp2.status == True:
+        if section_active(self, "ri_mp2"):
             self.ri_mp2.to_input(fout)
-        if self.ri_rpa.status == True:
+        if section_active(self, "ri_rpa"):
             self.ri_rpa.to_input(fout)
-        if self.wfc_gpw.status == True:
+        if section_active(self, "wfc_gpw"):
             self.wfc_gpw.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END WF_CORRELATION\n")
 
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "CPHF":
-                self.cphf.set_params({item: params[item]})
-            elif item.split("-")[7] == "DIRECT_CANONICAL":
-                self.direct_canonical.set_params({item: params[item]})
-            elif item.split("-")[7] == "ERI_MME":
-                self.eri_mme.set_params({item: params[item]})
-            elif item.split("-")[7] == "INTERACTION_POTENTIAL":
-                self.interaction_potential.set_params({item: params[item]})
-            elif item.split("-")[7] == "MP2_INFO":
-                self.mp2_info.set_params({item: params[item]})
-            elif item.split("-")[7] == "OPT_RI_BASIS":
-                self.opt_ri_basis.set_params({item: params[item]})
-            elif item.split("-")[7] == "RI_LAPLACE":
-                self.ri_laplace.set_params({item: params[item]})
-            elif item.split("-")[7] == "RI_MP2":
-                self.ri_mp2.set_params({item: params[item]})
-            elif item.split("-")[7] == "RI_RPA":
-                self.ri_rpa.set_params({item: params[item]})
-            elif item.split("-")[7] == "WFC_GPW":
-                self.wfc_gpw.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 
@@ -2778,9 +2227,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88_lr:
     def __init__(self):
@@ -2798,9 +2245,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88_lr:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88_lr_adiabatic:
     def __init__(self):
@@ -2818,9 +2263,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88_lr_adia
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke97:
@@ -2839,9 +2282,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke97:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke_roussel:
     def __init__(self):
@@ -2859,9 +2300,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke_roussel:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_beef:
     def __init__(self):
@@ -2879,9 +2318,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_beef:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_cs1:
     def __init__(self):
@@ -2899,9 +2336,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_cs1:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_gv09:
     def __init__(self):
@@ -2919,9 +2354,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_gv09:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_hcth:
     def __init__(self):
@@ -2939,9 +2372,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_hcth:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_ke_gga:
     def __init__(self):
@@ -2959,9 +2390,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_ke_gga:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_ke_libxc:
     def __init__(self):
@@ -2979,9 +2408,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_ke_libxc:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lda_hole_t_c_lr:
     def __init__(self):
@@ -2999,9 +2426,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lda_hole_t_c_lr
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_libxc:
     def __init__(self):
@@ -3019,9 +2444,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_libxc:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lyp:
     def __init__(self):
@@ -3039,9 +2462,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lyp:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lyp_adiabatic:
     def __init__(self):
@@ -3059,9 +2480,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lyp_adiabatic:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_optx:
     def __init__(self):
@@ -3079,9 +2498,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_optx:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_p86c:
     def __init__(self):
@@ -3099,9 +2516,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_p86c:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pade:
     def __init__(self):
@@ -3119,9 +2534,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pade:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pbe:
     def __init__(self):
@@ -3139,9 +2552,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pbe:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pbe_hole_t_c_lr:
     def __init__(self):
@@ -3159,9 +2570,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pbe_hole_t_c_lr
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pw92:
     def __init__(self):
@@ -3179,9 +2588,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pw92:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pz81:
     def __init__(self):
@@ -3199,9 +2606,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pz81:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tf:
     def __init__(self):
@@ -3219,9 +2624,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tf:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tfw:
     def __init__(self):
@@ -3239,9 +2642,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tfw:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tpss:
     def __init__(self):
@@ -3259,9 +2660,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tpss:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_vwn:
     def __init__(self):
@@ -3279,9 +2678,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_vwn:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xalpha:
     def __init__(self):
@@ -3299,9 +2696,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xalpha:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xgga:
     def __init__(self):
@@ -3319,9 +2714,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xgga:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xwpbe:
     def __init__(self):
@@ -3339,11 +2732,38 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xwpbe:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional:
+    becke88_lr = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88_lr", "BECKE88_LR")
+    becke88_lr_adiabatic = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88_lr_adiabatic", "BECKE88_LR_ADIABATIC")
+    becke97 = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke97", "BECKE97")
+    becke_roussel = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke_roussel", "BECKE_ROUSSEL")
+    beef = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_beef", "BEEF")
+    cs1 = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_cs1", "CS1")
+    gv09 = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_gv09", "GV09")
+    hcth = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_hcth", "HCTH")
+    ke_gga = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_ke_gga", "KE_GGA")
+    ke_libxc = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_ke_libxc", "KE_LIBXC")
+    lda_hole_t_c_lr = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lda_hole_t_c_lr", "LDA_HOLE_T_C_LR")
+    libxc = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_libxc", "LIBXC")
+    lyp = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lyp", "LYP")
+    lyp_adiabatic = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lyp_adiabatic", "LYP_ADIABATIC")
+    optx = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_optx", "OPTX")
+    p86c = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_p86c", "P86C")
+    pade = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pade", "PADE")
+    pbe = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pbe", "PBE")
+    pbe_hole_t_c_lr = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pbe_hole_t_c_lr", "PBE_HOLE_T_C_LR")
+    pw92 = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pw92", "PW92")
+    pz81 = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pz81", "PZ81")
+    tf = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tf", "TF")
+    tfw = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tfw", "TFW")
+    tpss = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tpss", "TPSS")
+    vwn = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_vwn", "VWN")
+    xalpha = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xalpha", "XALPHA")
+    xgga = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xgga", "XGGA")
+    xwpbe = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xwpbe", "XWPBE")
+
     def __init__(self):
         self.section = "PBE"
         self.params = {
@@ -3351,38 +2771,9 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional:
         self.status = False
 
         self.becke88 =  cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88()
-        self.becke88_lr = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88_lr()
-        self.becke88_lr_adiabatic = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke88_lr_adiabatic()
-        self.becke97 = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke97()
-        self.becke_roussel = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_becke_roussel()
-        self.beef = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_beef()
-        self.cs1 = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_cs1()
-        self.gv09 = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_gv09()
-        self.hcth = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_hcth()
-        self.ke_gga = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_ke_gga()
-        self.ke_libxc = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_ke_libxc()
-        self.lda_hole_t_c_lr = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lda_hole_t_c_lr()
-        self.libxc = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_libxc()
-        self.lyp = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lyp()
-        self.lyp_adiabatic = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_lyp_adiabatic()
-        self.optx = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_optx()
-        self.p86c = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_p86c()
-        self.pade = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pade()
-        self.pbe = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pbe()
-        self.pbe_hole_t_c_lr = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pbe_hole_t_c_lr()
-        self.pw92 = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pw92()
-        self.pz81 = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_pz81()
-        self.tf = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tf()
-        self.tfw = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tfw()
-        self.tpss = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_tpss()
-        self.vwn = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_vwn()
-        self.xalpha = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xalpha()
-        self.xgga = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xgga()
-        self.xwpbe = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional_xwpbe()
 
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -3455,69 +2846,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional:
         set_params for xc_functional is different from many other
         set_params, as it deal with the key 'XC_FUNCTIONAL' only
         """
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "BECKE88":
-                self.becke88.set_params({item: params[item]})
-            elif item.split("-")[7] == "BECKE88_LR":
-                self.becke88_lr.set_params({item: params[item]})
-            elif item.split("-")[7] == "BECKE88_LR_ADIABATIC":
-                self.becke88_lr_adiabatic.set_params({item: params[item]})
-            elif item.split("-")[7] == "BECKE97":
-                self.becke97.set_params({item: params[item]})
-            elif item.split("-")[7] == "BECKE_ROUSSEL":
-                self.becke_roussel.set_params({item: params[item]})
-            elif item.split("-")[7] == "BEEF":
-                self.beef.set_params({item: params[item]})
-            elif item.split("-")[7] == "CS1":
-                self.cs1.set_params({item: params[item]})
-            elif item.split("-")[7] == "GV09":
-                self.gv09.set_params({item: params[item]})
-            elif item.split("-")[7] == "HCTH":
-                self.hcth.set_params({item: params[item]})
-            elif item.split("-")[7] == "KE_GGA":
-                self.ke_gga.set_params({item: params[item]})
-            elif item.split("-")[7] == "KE_LIBXC":
-                self.ke_libxc.set_params({item: params[item]})
-            elif item.split("-")[7] == "LDA_HOLE_T_C_LR":
-                self.lda_hole_t_c_lr.set_params({item: params[item]})
-            elif item.split("-")[7] == "LIBXC":
-                self.libxc.set_params({item: params[item]})
-            elif item.split("-")[7] == "LYP":
-                self.lyp.set_params({item: params[item]})
-            elif item.split("-")[7] == "LYP_ADIABATIC":
-                self.lyp_adiabatic.set_params({item: params[item]})
-            elif item.split("-")[7] == "OPTX":
-                self.optx.set_params({item: params[item]})
-            elif item.split("-")[7] == "P86C":
-                self.p86c.set_params({item: params[item]})
-            elif item.split("-")[7] == "PADE":
-                self.pade.set_params({item: params[item]})
-            elif item.split("-")[7] == "PBE":
-                self.pbe.set_params({item: params[item]})
-            elif item.split("-")[7] == "PBE_HOLE_T_C_LR":
-                self.pbe_hole_t_c_lr.set_params({item: params[item]})
-            elif item.split("-")[7] == "PW92":
-                self.pw92.set_params({item: params[item]})
-            elif item.split("-")[7] == "PZ81":
-                self.pz81.set_params({item: params[item]})
-            elif item.split("-")[7] == "TF":
-                self.tf.set_params({item: params[item]})
-            elif item.split("-")[7] == "TFW":
-                self.tfw.set_params({item: params[item]})
-            elif item.split("-")[7] == "TPSS":
-                self.tpss.set_params({item: params[item]})
-            elif item.split("-")[7] == "VWN":
-                self.vwn.set_params({item: params[item]})
-            elif item.split("-")[7] == "XALPHA":
-                self.xalpha.set_params({item: params[item]})
-            elif item.split("-")[7] == "XGGA":
-                self.xgga.set_params({item: params[item]})
-            elif item.split("-")[7] == "XWPBE":
-                self.xwpbe.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_grid:
     def __init__(self):
@@ -3538,9 +2867,7 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_grid:
         fout.write("\t\t\t\t\t\t\t&END XC_GRID\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=7)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_potential_saop:
@@ -3560,18 +2887,16 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_potential_saop:
         fout.write("\t\t\t\t\t\t\t\t&END SAOP\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 9:
-                self.params[item.split("-")[-1]] = params[item]
+        route_params(self, params, level=8)
 
 class cp2k_properties_linres_epr_print_g_tensor_xc_xc_potential:
+    saop = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_potential_saop", "SAOP")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.saop = cp2k_properties_linres_epr_print_g_tensor_xc_xc_potential_saop()
-
         # basic setting
 
     def to_input(self, fout):
@@ -3582,19 +2907,23 @@ class cp2k_properties_linres_epr_print_g_tensor_xc_xc_potential:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.saop.status == True:
+        if section_active(self, "saop"):
             self.saop.to_input(fout)
         fout.write("\t\t\t\t\t\t\t&END XC_POTENTIAL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[7] == "SAOP":
-                self.saop.set_params({item: params[item]})
+        route_params(self, params, level=7)
 
 
 class cp2k_properties_linres_epr_print_g_tensor_xc:
+    adiabatic_rescaling = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_adiabatic_rescaling", "ADIABATIC_RESCALING")
+    hf = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_hf", "HF")
+    vdw_potential = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential", "VDW_POTENTIAL")
+    wf_correlation = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation", "WF_CORRELATION")
+    xc_functional = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional", "XC_FUNCTIONAL")
+    xc_grid = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_grid", "XC_GRID")
+    xc_potential = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc_xc_potential", "XC_POTENTIAL")
+
     def __init__(self):
         self.params = {
                 "DENSITY_CUTOFF": None,
@@ -3605,14 +2934,6 @@ class cp2k_properties_linres_epr_print_g_tensor_xc:
                 }
         self.status = False
 
-        self.adiabatic_rescaling = cp2k_properties_linres_epr_print_g_tensor_xc_adiabatic_rescaling()
-        self.hf = cp2k_properties_linres_epr_print_g_tensor_xc_hf()
-        self.vdw_potential = cp2k_properties_linres_epr_print_g_tensor_xc_vdw_potential()
-        self.wf_correlation = cp2k_properties_linres_epr_print_g_tensor_xc_wf_correlation()
-        self.xc_functional = cp2k_properties_linres_epr_print_g_tensor_xc_xc_functional()
-        self.xc_grid = cp2k_properties_linres_epr_print_g_tensor_xc_xc_grid()
-        self.xc_potential = cp2k_properties_linres_epr_print_g_tensor_xc_xc_potential()
-
         # basic setting
         self.xc_functional.status = True
         self.vdw_potential.status = False
@@ -3630,47 +2951,24 @@ class cp2k_properties_linres_epr_print_g_tensor_xc:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s" % (item, str(self.params[item])))
-        if self.adiabatic_rescaling.status == True:
+        if section_active(self, "adiabatic_rescaling"):
             self.adiabatic_rescaling.to_input(fout)
-        if self.hf.status == True:
+        if section_active(self, "hf"):
             self.hf.to_input(fout)
-        if self.xc_functional.status == True:
+        if section_active(self, "xc_functional"):
             self.xc_functional.to_input(fout)
-        if self.vdw_potential.status == True:
+        if section_active(self, "vdw_potential"):
             self.vdw_potential.to_input(fout)
-        if self.wf_correlation.status == True:
+        if section_active(self, "wf_correlation"):
             self.wf_correlation.to_input(fout)
-        if self.xc_grid.status == True:
+        if section_active(self, "xc_grid"):
             self.xc_grid.to_input(fout)
-        if self.xc_potential.status == True:
+        if section_active(self, "xc_potential"):
             self.xc_potential.to_input(fout)
         fout.write("\t\t\t\t\t\t&END XC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                if item.split("-")[-1] == "XC_FUNCTIONAL":
-                    self.xc_functional.section = params[item]
-                elif item.split("-")[-1] == "VDW_POTENTIAL":
-                    self.vdw_potential.section = params[item]
-                else:
-                    self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "XC_FUNCTIONAL" and len(item.split("-")) > 3:
-                self.xc_functional.set_params({item: params[item]})
-            elif item.split("-")[6] == "VDW_POTENTIAL":
-                self.vdw_potential.set_params({item: params[item]})
-            elif item.split("-")[6] == "ADIABATIC_RESCALING":
-                self.adiabatic_rescaling.set_params({item: params[item]})
-            elif item.split("-")[6] == "HF":
-                self.hf.set_params({item: params[item]})
-            elif item.split("-")[6] == "WF_CORRELATION":
-                self.wf_correlation.set_params({item: params[item]})
-            elif item.split("-")[6] == "XC_GRID":
-                self.xc_grid.set_params({item: params[item]})
-            elif item.split("-")[6] == "XC_POTENTIAL":
-                self.xc_potential.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 
@@ -3690,22 +2988,18 @@ class cp2k_properties_linres_epr_print_g_tensor_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_epr_print_g_tensor:
+    each = lazy_section("cp2k_properties_linres_epr_print_g_tensor_each", "EACH")
+    xc = lazy_section("cp2k_properties_linres_epr_print_g_tensor_xc", "XC")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_g_tensor_each()
-        self.xc = cp2k_properties_linres_epr_print_g_tensor_xc()
-
         # basic setting
 
     def to_input(self, fout):
@@ -3713,22 +3007,14 @@ class cp2k_properties_linres_epr_print_g_tensor:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
-        if self.xc.status == True:
+        if section_active(self, "xc"):
             self.xc.to_input(fout)
         fout.write("\t\t\t\t\t&END G_TENSOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            elif item.split("-")[5] == "XC":
-                self.xc.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 
@@ -3748,21 +3034,17 @@ class cp2k_properties_linres_epr_print_nablavks_cubes_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_epr_print_nablavks_cubes:
+    each = lazy_section("cp2k_properties_linres_epr_print_nablavks_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_nablavks_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -3770,18 +3052,12 @@ class cp2k_properties_linres_epr_print_nablavks_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END NABLAVKS_CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_epr_print_response_function_cubes_each:
     def __init__(self):
@@ -3799,20 +3075,16 @@ class cp2k_properties_linres_epr_print_response_function_cubes_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_linres_epr_print_response_function_cubes:
+    each = lazy_section("cp2k_properties_linres_epr_print_response_function_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_epr_print_response_function_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -3820,30 +3092,24 @@ class cp2k_properties_linres_epr_print_response_function_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END RESPONSE_FUNCTION_CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_epr_print:
+    g_tensor = lazy_section("cp2k_properties_linres_epr_print_g_tensor", "G_TENSOR")
+    nablavks_cubes = lazy_section("cp2k_properties_linres_epr_print_nablavks_cubes", "NABLAVKS_CUBES")
+    response_function_cubes = lazy_section("cp2k_properties_linres_epr_print_response_function_cubes", "RESPONSE_FUNCTION_CUBES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.g_tensor = cp2k_properties_linres_epr_print_g_tensor()
-        self.nablavks_cubes = cp2k_properties_linres_epr_print_nablavks_cubes()
-        self.response_function_cubes = cp2k_properties_linres_epr_print_response_function_cubes()
-
         # basic setting
 
     def to_input(self, fout):
@@ -3851,37 +3117,28 @@ class cp2k_properties_linres_epr_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.g_tensor.status == True:
+        if section_active(self, "g_tensor"):
             self.g_tensor.to_input(fout)
-        if self.nablavks_cubes.status == True:
+        if section_active(self, "nablavks_cubes"):
             self.nablavks_cubes.to_input(fout)
-        if self.response_function_cubes.status == True:
+        if section_active(self, "response_function_cubes"):
             self.response_function_cubes.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "G_TENSOR":
-                self.g_tensor.set_params({item: params[item]})
-            elif item.split("-")[4] == "NABLAVKS_CUBES":
-                self.nablavks_cubes.set_params({item: params[item]})
-            elif item.split("-")[4] == "RESPONSE_FUNCTION_CUBES":
-                self.response_function_cubes.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
 class cp2k_properties_linres_epr:
+    printout = lazy_section("cp2k_properties_linres_epr_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
         self.interpolator  = cp2k_properties_linres_epr_interpolator()
-        self.printout = cp2k_properties_linres_epr_print()
 
         # basic setting
 
@@ -3892,20 +3149,12 @@ class cp2k_properties_linres_epr:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
         if self.interpolator.status == True:
             self.interpolator.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t&END EPR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_linres_localize_print_loc_restart:
     def __init__(self):
@@ -3923,11 +3172,7 @@ class cp2k_properties_linres_localize_print_loc_restart:
         fout.write("\t\t\t\t\t&END LOC_RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_localize_print_loc_restart_each:
@@ -3946,21 +3191,17 @@ class cp2k_properties_linres_localize_print_loc_restart_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_loc_restart:
+    each = lazy_section("cp2k_properties_linres_localize_print_loc_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_loc_restart_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -3968,18 +3209,12 @@ class cp2k_properties_linres_localize_print_loc_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END LOC_RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_localize_print_molecular_dipoles_each:
@@ -3998,21 +3233,17 @@ class cp2k_properties_linres_localize_print_molecular_dipoles_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_molecular_dipoles:
+    each = lazy_section("cp2k_properties_linres_localize_print_molecular_dipoles_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_molecular_dipoles_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4020,18 +3251,12 @@ class cp2k_properties_linres_localize_print_molecular_dipoles:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END MOLECULAR_DIPOLES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_localize_print_molecular_states_cubes_each:
@@ -4050,21 +3275,17 @@ class cp2k_properties_linres_localize_print_molecular_states_cubes_each:
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_properties_linres_localize_print_molecular_states_cubes:
+    each = lazy_section("cp2k_properties_linres_localize_print_molecular_states_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_molecular_states_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4072,18 +3293,12 @@ class cp2k_properties_linres_localize_print_molecular_states_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_molecular_states_each:
@@ -4102,22 +3317,18 @@ class cp2k_properties_linres_localize_print_molecular_states_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_molecular_states:
+    each = lazy_section("cp2k_properties_linres_localize_print_molecular_states_each", "EACH")
+    cubes = lazy_section("cp2k_properties_linres_localize_print_molecular_states_cubes", "CUBES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_molecular_states_each()
-        self.cubes = cp2k_properties_linres_localize_print_molecular_states_cubes()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4125,22 +3336,14 @@ class cp2k_properties_linres_localize_print_molecular_states:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
-        if self.cubes.status == True:
+        if section_active(self, "cubes"):
             self.cubes.to_input(fout)
         fout.write("\t\t\t\t\t&END MOLECULAR_STATES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            elif item.split("-")[5] == "CUBES":
-                self.cubes.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_localize_print_program_run_info_each:
@@ -4159,21 +3362,17 @@ class cp2k_properties_linres_localize_print_program_run_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_program_run_info:
+    each = lazy_section("cp2k_properties_linres_localize_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4181,18 +3380,12 @@ class cp2k_properties_linres_localize_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_localize_print_total_dipole_each:
     def __init__(self):
@@ -4210,21 +3403,17 @@ class cp2k_properties_linres_localize_print_total_dipole_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_total_dipole:
+    each = lazy_section("cp2k_properties_linres_localize_print_total_dipole_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_total_dipole_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4232,18 +3421,12 @@ class cp2k_properties_linres_localize_print_total_dipole:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END TOTAL_DIPOLE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_localize_print_wannier_centers_each:
     def __init__(self):
@@ -4261,21 +3444,17 @@ class cp2k_properties_linres_localize_print_wannier_centers_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_wannier_centers:
+    each = lazy_section("cp2k_properties_linres_localize_print_wannier_centers_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_wannier_centers_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4283,18 +3462,12 @@ class cp2k_properties_linres_localize_print_wannier_centers:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END WANNIER_CENTERS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_localize_print_wannier_cubes_each:
     def __init__(self):
@@ -4312,21 +3485,17 @@ class cp2k_properties_linres_localize_print_wannier_cubes_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_wannier_cubes:
+    each = lazy_section("cp2k_properties_linres_localize_print_wannier_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_wannier_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4334,18 +3503,12 @@ class cp2k_properties_linres_localize_print_wannier_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END WANNIER_CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_localize_print_wannier_spreads_each:
     def __init__(self):
@@ -4363,21 +3526,17 @@ class cp2k_properties_linres_localize_print_wannier_spreads_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_wannier_spreads:
+    each = lazy_section("cp2k_properties_linres_localize_print_wannier_spreads_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_wannier_spreads_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4385,18 +3544,12 @@ class cp2k_properties_linres_localize_print_wannier_spreads:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END WANNIER_SPREADS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_localize_print_wannier_states_cubes_each:
     def __init__(self):
@@ -4414,21 +3567,17 @@ class cp2k_properties_linres_localize_print_wannier_states_cubes_each:
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 
 class cp2k_properties_linres_localize_print_wannier_states_cubes:
+    each = lazy_section("cp2k_properties_linres_localize_print_wannier_states_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_wannier_states_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4436,18 +3585,12 @@ class cp2k_properties_linres_localize_print_wannier_states_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_localize_print_wannier_states_each:
@@ -4466,21 +3609,17 @@ class cp2k_properties_linres_localize_print_wannier_states_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_linres_localize_print_wannier_states:
+    each = lazy_section("cp2k_properties_linres_localize_print_wannier_states_each", "EACH")
+    cubes = lazy_section("cp2k_properties_linres_localize_print_wannier_states_cubes", "CUBES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_localize_print_wannier_states_each()
-        self.cubes = cp2k_properties_linres_localize_print_wannier_states_cubes()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4488,39 +3627,31 @@ class cp2k_properties_linres_localize_print_wannier_states:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.cubes.status == True:
+        if section_active(self, "cubes"):
             self.cubes.to_input(fout)
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END WANNIER_STATES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "CUBES":
-                self.cubes.set_params({item: params[item]})
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_localize_print:
+    loc_restart = lazy_section("cp2k_properties_linres_localize_print_loc_restart", "LOC_RESTART")
+    molecular_states = lazy_section("cp2k_properties_linres_localize_print_molecular_states", "MOLECULAR_STATES")
+    program_run_info = lazy_section("cp2k_properties_linres_localize_print_program_run_info", "PROGRAM_RUN_INFO")
+    total_dipole = lazy_section("cp2k_properties_linres_localize_print_total_dipole", "TOTAL_DIPOLE")
+    wannier_centers = lazy_section("cp2k_properties_linres_localize_print_wannier_centers", "WANNIER_CENTERS")
+    wannier_cubes = lazy_section("cp2k_properties_linres_localize_print_wannier_cubes", "WANNIER_CUBES")
+    wannier_spreads = lazy_section("cp2k_properties_linres_localize_print_wannier_spreads", "WANNIER_SPREADS")
+    wannier_states = lazy_section("cp2k_properties_linres_localize_print_wannier_states", "WANNIER_STATES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.loc_restart = cp2k_properties_linres_localize_print_loc_restart()
-        self.molecular_states = cp2k_properties_linres_localize_print_molecular_states()
-        self.program_run_info = cp2k_properties_linres_localize_print_program_run_info()
-        self.total_dipole = cp2k_properties_linres_localize_print_total_dipole()
-        self.wannier_centers = cp2k_properties_linres_localize_print_wannier_centers()
-        self.wannier_cubes = cp2k_properties_linres_localize_print_wannier_cubes()
-        self.wannier_spreads = cp2k_properties_linres_localize_print_wannier_spreads()
-        self.wannier_states = cp2k_properties_linres_localize_print_wannier_states()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4528,60 +3659,38 @@ class cp2k_properties_linres_localize_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.loc_restart.status == True:
+        if section_active(self, "loc_restart"):
             self.loc_restart.to_input(fout)
         if self.molecular_dipoles.status == True:
             self.molecular_dipoles.to_input(fout)
-        if self.molecular_states.status == True:
+        if section_active(self, "molecular_states"):
             self.molecular_states.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.total_dipole.status == True:
+        if section_active(self, "total_dipole"):
             self.total_dipole.to_input(fout)
-        if self.wannier_centers.status == True:
+        if section_active(self, "wannier_centers"):
             self.wannier_centers.to_input(fout)
-        if self.wannier_cubes.status == True:
+        if section_active(self, "wannier_cubes"):
             self.wannier_cubes.to_input(fout)
-        if self.wannier_spreads.status == True:
+        if section_active(self, "wannier_spreads"):
             self.wannier_spreads.to_input(fout)
-        if self.wannier_states.status == True:
+        if section_active(self, "wannier_states"):
             self.wannier_states.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "LOC_RESTART":
-                self.loc_restart.set_params({item: params[item]})
-            elif item.split("-")[4] == "MOLECULAR_DIPOLES":
-                self.molecular_dipoles.set_params({item: params[item]})
-            elif item.split("-")[4] == "MOLECULAR_STATES":
-                self.molecular_states.set_params({item: params[item]})
-            elif item.split("-")[4] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[4] == "TOTAL_DIPOLE":
-                self.total_dipole.set_params({item: params[item]})
-            elif item.split("-")[4] == "WANNIER_CENTERS":
-                self.wannier_centers.set_params({item: params[item]})
-            elif item.split("-")[4] == "WANNIER_CUEBS":
-                self.wannier_cubes.set_params({item: params[item]})
-            elif item.split("-")[4] == "WANNIER_SPREADS":
-                self.wannier_spreads.set_params({item: params[item]})
-            elif item.split("-")[4] == "WANNIER_STATES":
-                self.wannier_states.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_linres_localize:
+    printout = lazy_section("cp2k_properties_linres_localize_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.printout = cp2k_properties_linres_localize_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4589,18 +3698,12 @@ class cp2k_properties_linres_localize:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t&END LOCALIZE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_properties_linres_nmr_interpolator_conv_info_each:
@@ -4619,21 +3722,17 @@ class cp2k_properties_linres_nmr_interpolator_conv_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_nmr_interpolator_conv_info:
+    each = lazy_section("cp2k_properties_linres_nmr_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_nmr_interpolator_conv_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4641,28 +3740,22 @@ class cp2k_properties_linres_nmr_interpolator_conv_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_nmr_interpolator:
+    conv_info = lazy_section("cp2k_properties_linres_nmr_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.conv_info = cp2k_properties_linres_nmr_interpolator_conv_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4670,18 +3763,12 @@ class cp2k_properties_linres_nmr_interpolator:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_linres_nmr_print_chi_tensor_each:
     def __init__(self):
@@ -4699,20 +3786,16 @@ class cp2k_properties_linres_nmr_print_chi_tensor_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_linres_nmr_print_chi_tensor:
+    each = lazy_section("cp2k_properties_linres_nmr_print_chi_tensor_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_nmr_print_chi_tensor_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4720,18 +3803,12 @@ class cp2k_properties_linres_nmr_print_chi_tensor:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CHI_TENSOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_nmr_print_response_function_cubes_each:
@@ -4750,20 +3827,16 @@ class cp2k_properties_linres_nmr_print_response_function_cubes_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_linres_nmr_print_response_function_cubes:
+    each = lazy_section("cp2k_properties_linres_nmr_print_response_function_cubes_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_nmr_print_response_function_cubes_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4771,18 +3844,12 @@ class cp2k_properties_linres_nmr_print_response_function_cubes:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END RESPONSE_FUNCTION_CUBES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_nmr_print_shielding_tensor_each:
     def __init__(self):
@@ -4800,20 +3867,16 @@ class cp2k_properties_linres_nmr_print_shielding_tensor_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_linres_nmr_print_shielding_tensor:
+    each = lazy_section("cp2k_properties_linres_nmr_print_shielding_tensor_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_nmr_print_shielding_tensor_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4821,30 +3884,24 @@ class cp2k_properties_linres_nmr_print_shielding_tensor:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END SHIELDING_TENSOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_nmr_print:
+    chi_tensor = lazy_section("cp2k_properties_linres_nmr_print_response_function_cubes", "CHI_TENSOR")
+    response_function_cubes = lazy_section("cp2k_properties_linres_nmr_print_response_function_cubes", "RESPONSE_FUNCTION_CUBES")
+    shielding_tensor = lazy_section("cp2k_properties_linres_nmr_print_shielding_tensor", "SHIELDING_TENSOR")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.chi_tensor = cp2k_properties_linres_nmr_print_response_function_cubes()
-        self.response_function_cubes = cp2k_properties_linres_nmr_print_response_function_cubes()
-        self.shielding_tensor = cp2k_properties_linres_nmr_print_shielding_tensor()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4852,26 +3909,16 @@ class cp2k_properties_linres_nmr_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.chi_tensor.status == True:
+        if section_active(self, "chi_tensor"):
             self.chi_tensor.to_input(fout)
-        if self.response_function_cubes.status == True:
+        if section_active(self, "response_function_cubes"):
             self.response_function_cubes.to_input(fout)
         if self.shielding_ternsor.status == True:
             self.shielding_tensor.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CHI_TENSOR":
-                self.chi_tensor.set_params({item: params[item]})
-            elif item.split("-")[4] == "RESPONSE_FUNCTION_CUBES":
-                self.response_function_cubes.set_params({item: params[item]})
-            elif item.split("-")[4] == "SHIELDING_TENSOR":
-                self.shielding_tensor.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_linres_nmr:
@@ -4897,15 +3944,7 @@ class cp2k_properties_linres_nmr:
         fout.write("\t\t\t&END NMR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_properties_linres_polar_interpolator_conv_info_each:
@@ -4924,21 +3963,17 @@ class cp2k_properties_linres_polar_interpolator_conv_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_polar_interpolator_conv_info:
+    each = lazy_section("cp2k_properties_linres_polar_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_polar_interpolator_conv_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4946,28 +3981,22 @@ class cp2k_properties_linres_polar_interpolator_conv_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_polar_interpolator:
+    conv_info = lazy_section("cp2k_properties_linres_polar_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.conv_info = cp2k_properties_linres_polar_interpolator_conv_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -4975,18 +4004,12 @@ class cp2k_properties_linres_polar_interpolator:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_linres_polar_print_polar_matrix_each:
     def __init__(self):
@@ -5004,20 +4027,16 @@ class cp2k_properties_linres_polar_print_polar_matrix_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_linres_polar_print_polar_matrix:
+    each = lazy_section("cp2k_properties_linres_polar_print_polar_matrix_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_polar_print_polar_matrix_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5025,26 +4044,21 @@ class cp2k_properties_linres_polar_print_polar_matrix:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END POLAR_MATRIX\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_polar_print:
+    polar_matrix = lazy_section("cp2k_properties_linres_polar_print_polar_matrix", "POLAR_MATRIX")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.polar_matrix = cp2k_properties_linres_polar_print_polar_matrix()
         # basic setting
 
     def to_input(self, fout):
@@ -5052,28 +4066,22 @@ class cp2k_properties_linres_polar_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.polar_matrix.status == True:
+        if section_active(self, "polar_matrix"):
             self.polar_matrix.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "POLAR_MATRIX":
-                self.polar_matrix.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_linres_polar:
+    interpolator = lazy_section("cp2k_properties_linres_polar_interpolator", "INTERPOLATOR")
+    printout = lazy_section("cp2k_properties_linres_polar_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.interpolator = cp2k_properties_linres_polar_interpolator()
-        self.printout = cp2k_properties_linres_polar_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5081,22 +4089,14 @@ class cp2k_properties_linres_polar:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             self.interpolator.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t&END POLAR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_properties_linres_print_program_run_info_each:
@@ -5117,20 +4117,16 @@ class cp2k_properties_linres_print_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_print_program_run_info:
+    each = lazy_section("cp2k_properties_linres_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_print_program_run_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5138,18 +4134,12 @@ class cp2k_properties_linres_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_linres_print_restart_each:
     def __init__(self):
@@ -5169,20 +4159,16 @@ class cp2k_properties_linres_print_restart_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_print_restart:
+    each = lazy_section("cp2k_properties_linres_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_print_restart_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5190,29 +4176,23 @@ class cp2k_properties_linres_print_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_linres_print:
+    program_run_info = lazy_section("cp2k_properties_linres_print_program_run_info", "PROGRAM_RUN_INFO")
+    restart = lazy_section("cp2k_properties_linres_print_restart", "RESTART")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.program_run_info = cp2k_properties_linres_print_program_run_info()
-        self.restart = cp2k_properties_linres_print_restart()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5220,22 +4200,14 @@ class cp2k_properties_linres_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 class cp2k_properties_linres_spinspin_interpolator_conv_info_each:
     def __init__(self):
         self.params = {
@@ -5252,21 +4224,17 @@ class cp2k_properties_linres_spinspin_interpolator_conv_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_properties_linres_spinspin_interpolator_conv_info:
+    each = lazy_section("cp2k_properties_linres_spinspin_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_spinspin_interpolator_conv_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5274,28 +4242,22 @@ class cp2k_properties_linres_spinspin_interpolator_conv_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_linres_spinspin_interpolator:
+    conv_info = lazy_section("cp2k_properties_linres_spinspin_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.conv_info = cp2k_properties_linres_spinspin_interpolator_conv_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5303,18 +4265,12 @@ class cp2k_properties_linres_spinspin_interpolator:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_linres_spinspin_print_k_matrix_each:
     def __init__(self):
@@ -5332,20 +4288,16 @@ class cp2k_properties_linres_spinspin_print_k_matrix_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_properties_linres_spinspin_print_k_matrix:
+    each = lazy_section("cp2k_properties_linres_spinspin_print_k_matrix_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_linres_spinspin_print_k_matrix_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5353,26 +4305,21 @@ class cp2k_properties_linres_spinspin_print_k_matrix:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END POLAR_MATRIX\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_linres_spinspin_print:
+    polar_matrix = lazy_section("cp2k_properties_linres_spinspin_print_k_matrix", "POLAR_MATRIX")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.polar_matrix = cp2k_properties_linres_spinspin_print_k_matrix()
         # basic setting
 
     def to_input(self, fout):
@@ -5380,28 +4327,23 @@ class cp2k_properties_linres_spinspin_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.polar_matrix.status == True:
+        if section_active(self, "polar_matrix"):
             self.polar_matrix.to_input(fout)
         fout.write("\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "K_MATRIX":
-                self.polar_matrix.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_linres_spinspin:
+    interpolator = lazy_section("cp2k_properties_linres_spinspin_interpolator", "INTERPOLATOR")
+    printout = lazy_section("cp2k_properties_linres_spinspin_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.interpolator = cp2k_properties_linres_spinspin_interpolator()
-        self.printout = cp2k_properties_linres_spinspin_print()
         # basic setting
 
     def to_input(self, fout):
@@ -5409,24 +4351,24 @@ class cp2k_properties_linres_spinspin:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             self.interpolator.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t\t&END SPINSPIN\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[3] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_linres:
+    current = lazy_section("cp2k_properties_linres_current", "CURRENT")
+    epr = lazy_section("cp2k_properties_linres_epr", "EPR")
+    loclalize = lazy_section("cp2k_properties_linres_localize", "LOCALIZE")
+    nmr = lazy_section("cp2k_properties_linres_nmr", "NMR")
+    polar = lazy_section("cp2k_properties_linres_polar", "POLAR")
+    printout = lazy_section("cp2k_properties_linres_print", "PRINT")
+    spinspin = lazy_section("cp2k_properties_linres_spinspin", "SPINSPIN")
+
     def __init__(self):
         self.params = {
                 "ENERGY_GAP": None,
@@ -5436,14 +4378,6 @@ class cp2k_properties_linres:
                 }
         self.status = False
 
-        self.current = cp2k_properties_linres_current()
-        self.epr = cp2k_properties_linres_epr()
-        self.loclalize = cp2k_properties_linres_localize()
-        self.nmr = cp2k_properties_linres_nmr()
-        self.polar = cp2k_properties_linres_polar()
-        self.printout = cp2k_properties_linres_print()
-        self.spinspin = cp2k_properties_linres_spinspin()
-
         # basic setting
         self.polar.status = True
         self.current.status = True
@@ -5453,42 +4387,24 @@ class cp2k_properties_linres:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.current.status == True:
+        if section_active(self, "current"):
             self.current.to_input(fout)
-        if self.epr.status == True:
+        if section_active(self, "epr"):
             self.epr.to_input(fout)
         if self.localize.status == True:
             self.localize.to_input(fout)
-        if self.nmr.status == True:
+        if section_active(self, "nmr"):
             self.nmr.to_input(fout)
-        if self.polar.status == True:
+        if section_active(self, "polar"):
             self.polar.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.spinspin.status == True:
+        if section_active(self, "spinspin"):
             self.spinspin.to_input(fout)
         fout.write("\t\t&END LINRES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CURRENT":
-                self.current.set_params({item: params[item]})
-            elif item.split("-")[2] == "EPR":
-                self.epr.set_params({item: params[item]})
-            elif item.split("-")[2] == "LOCALIZE":
-                self.localize.set_params({item: params[item]})
-            elif item.split("-")[2] == "NMR":
-                self.nmr.set_params({item: params[item]})
-            elif item.split("-")[2] == "POLAR":
-                self.polar.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPINSPIN":
-                self.spinspin.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_properties_tddfpt_dipole_moments:
     def __init__(self):
@@ -5506,11 +4422,7 @@ class cp2k_properties_tddfpt_dipole_moments:
         fout.write("\t\t\t&END DIPOLE_MOMENTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_tddfpt_mgrid:
     def __init__(self):
@@ -5528,11 +4440,7 @@ class cp2k_properties_tddfpt_mgrid:
         fout.write("\t\t\t&END MGRID\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_tddfpt_print_detailed_energy_each:
     def __init__(self):
@@ -5550,20 +4458,17 @@ class cp2k_properties_tddfpt_print_detailed_energy_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_tddfpt_print_detailed_energy:
+    each = lazy_section("cp2k_properties_tddfpt_print_detailed_energy_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_tddfpt_print_detailed_energy_each()
         # basic setting
 
     def to_input(self, fout):
@@ -5571,18 +4476,12 @@ class cp2k_properties_tddfpt_print_detailed_energy:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END DETAILED_ENERGY\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_tddfpt_print_guess_vectors_each:
     def __init__(self):
@@ -5600,20 +4499,16 @@ class cp2k_properties_tddfpt_print_guess_vectors_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_properties_tddfpt_print_guess_vectors:
+    each = lazy_section("cp2k_properties_tddfpt_print_guess_vectors_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_tddfpt_print_guess_vectors_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5621,18 +4516,12 @@ class cp2k_properties_tddfpt_print_guess_vectors:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END GUESS_VECTORS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_properties_tddfpt_print_iteration_info_each:
     def __init__(self):
@@ -5650,21 +4539,17 @@ class cp2k_properties_tddfpt_print_iteration_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_tddfpt_print_iteration_info:
+    each = lazy_section("cp2k_properties_tddfpt_print_iteration_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_tddfpt_print_iteration_info_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5672,18 +4557,12 @@ class cp2k_properties_tddfpt_print_iteration_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END ITERATION_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_tddfpt_print_restart_each:
@@ -5702,21 +4581,17 @@ class cp2k_properties_tddfpt_print_restart_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_properties_tddfpt_print_restart:
+    each = lazy_section("cp2k_properties_tddfpt_print_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_properties_tddfpt_print_restart_each()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5724,30 +4599,25 @@ class cp2k_properties_tddfpt_print_restart:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_properties_tddfpt_print:
+    detailed_energy = lazy_section("cp2k_properties_tddfpt_print_detailed_energy", "DETAILED_ENERGY")
+    guess_vectors = lazy_section("cp2k_properties_tddfpt_print_guess_vectors", "GUESS_VECTORS")
+    iteration_info = lazy_section("cp2k_properties_tddfpt_print_iteration_info", "ITERATION_INFO")
+    restart = lazy_section("cp2k_properties_tddfpt_print_restart", "RESTART")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.detailed_energy = cp2k_properties_tddfpt_print_detailed_energy()
-        self.guess_vectors = cp2k_properties_tddfpt_print_guess_vectors()
-        self.iteration_info = cp2k_properties_tddfpt_print_iteration_info()
-        self.restart = cp2k_properties_tddfpt_print_restart()
         # basic setting
 
     def to_input(self, fout):
@@ -5755,41 +4625,29 @@ class cp2k_properties_tddfpt_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.detailed_energy.status == True:
+        if section_active(self, "detailed_energy"):
             self.detailed_energy.to_input(fout)
-        if self.guess_vectors.status == True:
+        if section_active(self, "guess_vectors"):
             self.guess_vectors.to_input(fout)
-        if self.iteration_info.status == True:
+        if section_active(self, "iteration_info"):
             self.iteration_info.to_input(fout)
-        if self.restart.status == True:
+        if section_active(self, "restart"):
             self.restart.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "DETAILED_ENERGY":
-                self.detailed_energy.set_params({item: params[item]})
-            elif item.split("-")[3] == "GUESS_VECTORS":
-                self.guess_vectors.set_params({item: params[item]})
-            elif item.split("-")[3] == "ITERATION_INFO":
-                self.iteration_info.set_params({item: params[item]})
-            elif item.split("-")[3] == "RESTART":
-                self.restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_properties_tddfpt:
+    dipole_moments = lazy_section("cp2k_properties_tddfpt_dipole_moments", "DIPOLE_MOMENTS")
+    mgrid = lazy_section("cp2k_properties_tddfpt_mgrid", "MGRID")
+    printout = lazy_section("cp2k_properties_tddfpt_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.dipole_moments = cp2k_properties_tddfpt_dipole_moments()
-        self.mgrid = cp2k_properties_tddfpt_mgrid()
-        self.printout = cp2k_properties_tddfpt_print()
-
         # basic setting
 
     def to_input(self, fout):
@@ -5797,72 +4655,46 @@ class cp2k_properties_tddfpt:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.dipole_moments.status == True:
+        if section_active(self, "dipole_moments"):
             self.dipole_moments.to_input(fout)
-        if self.mgrid.status == True:
+        if section_active(self, "mgrid"):
             self.mgrid.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t\t&END TDDFPT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DIPOLE_MOMENTS":
-                self.dipole_moments.set_params({item: params[item]})
-            elif item.split("-")[2] == "MGRID":
-                self.mgrid.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_properties:
+    atomic = lazy_section("cp2k_properties_atomic", "ATOMIC")
+    et_coupling = lazy_section("cp2k_properties_et_coupling", "ET_COUPLING")
+    fit_charge = lazy_section("cp2k_properties_fit_charge", "FIT_CHARGE")
+    resp = lazy_section("cp2k_properties_resp", "RESP")
+    linres = lazy_section("cp2k_properties_linres", "LINRES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.atomic = cp2k_properties_atomic()
-        self.et_coupling = cp2k_properties_et_coupling()
-        self.fit_charge = cp2k_properties_fit_charge()
-        self.resp = cp2k_properties_resp()
-        self.linres = cp2k_properties_linres()
-
     def to_input(self, fout):
         fout.write("\t&PROPERTIES\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.atomic.status == True:
+        if section_active(self, "atomic"):
             self.atomic.to_input(fout)
-        if self.et_coupling.status == True:
+        if section_active(self, "et_coupling"):
             self.et_coupling.to_input(fout)
-        if self.fit_charge.status == True:
+        if section_active(self, "fit_charge"):
             self.fit_charge.to_input(fout)
-        if self.resp.status == True:
+        if section_active(self, "resp"):
             self.resp.to_input(fout)
-        if self.linres.status == True:
+        if section_active(self, "linres"):
             self.linres.to_input(fout)
         fout.write("\t&END PROPERTIES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "ATOMIC":
-                self.atomic.set_params({item: params[item]})
-            elif item.split("-")[1] == "ET_COUPLING":
-                self.et_coupling.set_params({item: params[item]})
-            elif item.split("-")[1] == "FIT_CHARGE":
-                self.fit_charge.set_params({item: params[item]})
-            elif item.split("-")[1] == "RESP":
-                self.resp.set_params({item: params[item]})
-            elif item.split("-")[1] == "LINRES":
-                self.linres.set_params({item: params[item]})
-            elif item.split("-")[1] == "TDDFPT":
-                self.tddfpt.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -11,6 +11,7 @@ from pymatflow.cp2k.base.pw_dft_control import cp2k_pw_dft_control
 from pymatflow.cp2k.base.pw_dft_iterative_solver import cp2k_pw_dft_iterative_solver
 from pymatflow.cp2k.base.pw_dft_mixer import cp2k_pw_dft_mixer
 from pymatflow.cp2k.base.pw_dft_parameters import cp2k_pw_dft_parameters
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 """
 usage:
@@ -23,6 +24,11 @@ usage:
 class cp2k_pw_dft:
     """
     """
+    control = lazy_section("cp2k_pw_dft_control", "CONTROL")
+    iterative_solver = lazy_section("cp2k_pw_dft_iterative_solver", "ITERATIVE_SOLVER")
+    mixer = lazy_section("cp2k_pw_dft_mixer", "MIXER")
+    parameters = lazy_section("cp2k_pw_dft_parameters", "PARAMETERS")
+
     def __init__(self):
         """
         """
@@ -30,11 +36,6 @@ class cp2k_pw_dft:
                 }
         self.status = False
 
-        self.control = cp2k_pw_dft_control()
-        self.iterative_solver = cp2k_pw_dft_iterative_solver()
-        self.mixer = cp2k_pw_dft_mixer()
-        self.parameters = cp2k_pw_dft_parameters()
-
         # basic setting
         self.control.status = True
         self.iterative_solver.status = True
@@ -49,28 +50,16 @@ class cp2k_pw_dft:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.control.status == True:
+        if section_active(self, "control"):
             self.control.to_input(fout)
-        if self.iterative_solver.status == True:
+        if section_active(self, "iterative_solver"):
             self.iterative_solver.to_input(fout)
-        if self.mixer.status == True:
+        if section_active(self, "mixer"):
             self.mixer.to_input(fout)
-        if self.parameters.status == True:
+        if section_active(self, "parameters"):
             self.parameters.to_input(fout)
         fout.write("\t&END PW_DFT\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "CONTROL":
-                self.control.set_params({item: params[item]})
-            elif item.split("-")[1] == "ITERATIVE_SOLVER":
-                self.iterative_solver.set_params({item: params[item]})
-            elif item.split("-")[1] == "MIXER":
-                self.mixer.set_params({item: params[item]})
-            elif item.split("-")[1] == "PARAMETERS":
-                self.parameters.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -38,23 +39,20 @@ class cp2k_qmmm_cell_cell_ref:
         fout.write("\t\t\t&END CELL_REF\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_cell:
     """
 
     """
+    cell_ref = lazy_section("cp2k_qmmm_cell_cell_ref", "CELL_REF")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cell_ref = cp2k_qmmm_cell_cell_ref()
         # basic setting
 
     def to_input(self, fout):
@@ -65,18 +63,12 @@ class cp2k_qmmm_cell:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cell_ref.status == True:
+        if section_active(self, "cell_ref"):
             self.cell_ref.to_input(fout)
         fout.write("\t\t&END CELL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CELL_REF":
-                self.cell_ref.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_qmmm_forcefield_nonbonded_genpot:
     def __init__(self):
@@ -96,11 +88,7 @@ class cp2k_qmmm_forcefield_nonbonded_genpot:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_forcefield_nonbonded_goodwin:
     def __init__(self):
@@ -120,11 +108,7 @@ class cp2k_qmmm_forcefield_nonbonded_goodwin:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_forcefield_nonbonded_lennard_jones:
@@ -145,11 +129,7 @@ class cp2k_qmmm_forcefield_nonbonded_lennard_jones:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_forcefield_nonbonded_williams:
@@ -170,28 +150,23 @@ class cp2k_qmmm_forcefield_nonbonded_williams:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
 class cp2k_qmmm_forcefield_nonbonded:
+    genpot = lazy_section("cp2k_qmmm_forcefield_nonbonded_genpot", "GENPOT")
+    goodwin = lazy_section("cp2k_qmmm_forcefield_nonbonded_goodwin", "GOODWIN")
+    lennard_jones = lazy_section("cp2k_qmmm_forcefield_nonbonded_lennard_jones", "LENNARD-JONES")
+    williams = lazy_section("cp2k_qmmm_forcefield_nonbonded_williams", "WILLIAMS")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.genpot = cp2k_qmmm_forcefield_nonbonded_genpot()
-        self.goodwin = cp2k_qmmm_forcefield_nonbonded_goodwin()
-        self.lennard_jones = cp2k_qmmm_forcefield_nonbonded_lennard_jones()
-        self.williams = cp2k_qmmm_forcefield_nonbonded_williams()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -200,31 +175,19 @@ class cp2k_qmmm_forcefield_nonbonded:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.genpot.status == True:
+        if section_active(self, "genpot"):
             self.genpot.to_input(fout)
-        if self.goodwin.status == True:
+        if section_active(self, "goodwin"):
             self.goodwin.to_input(fout)
-        if self.lennard_jones.status == True:
+        if section_active(self, "lennard_jones"):
             self.lennard_jones.to_input(fout)
-        if self.williams.status == True:
+        if section_active(self, "williams"):
             self.williams.to_input(fout)
         fout.write("\t\t\t&END NONBONDED\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "GENPOT":
-                self.genpot.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "GOODWIN":
-                self.goodwin.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "LENNARD_JONES":
-                self.lennard_jones.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "WILLIAMS":
-                self.williams.set_params({item: parmas[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -247,11 +210,7 @@ class cp2k_qmmm_forcefield_nonbonded14_genpot:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_forcefield_nonbonded14_goodwin:
     def __init__(self):
@@ -271,11 +230,7 @@ class cp2k_qmmm_forcefield_nonbonded14_goodwin:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_forcefield_nonbonded14_lennard_jones:
@@ -296,11 +251,7 @@ class cp2k_qmmm_forcefield_nonbonded14_lennard_jones:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_forcefield_nonbonded14_williams:
@@ -321,28 +272,23 @@ class cp2k_qmmm_forcefield_nonbonded14_williams:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
 class cp2k_qmmm_forcefield_nonbonded14:
+    genpot = lazy_section("cp2k_qmmm_forcefield_nonbonded14_genpot", "GENPOT")
+    goodwin = lazy_section("cp2k_qmmm_forcefield_nonbonded14_goodwin", "GOODWIN")
+    lennard_jones = lazy_section("cp2k_qmmm_forcefield_nonbonded14_lennard_jones", "LENNARD-JONES")
+    williams = lazy_section("cp2k_qmmm_forcefield_nonbonded14_williams", "WILLIAMS")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.genpot = cp2k_qmmm_forcefield_nonbonded14_genpot()
-        self.goodwin = cp2k_qmmm_forcefield_nonbonded14_goodwin()
-        self.lennard_jones = cp2k_qmmm_forcefield_nonbonded14_lennard_jones()
-        self.williams = cp2k_qmmm_forcefield_nonbonded14_williams()
-
         # basic setting
 
-
     def to_input(self, fout):
         """
         fout: a file stream for writing
@@ -351,31 +297,19 @@ class cp2k_qmmm_forcefield_nonbonded14:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.genpot.status == True:
+        if section_active(self, "genpot"):
             self.genpot.to_input(fout)
-        if self.goodwin.status == True:
+        if section_active(self, "goodwin"):
             self.goodwin.to_input(fout)
-        if self.lennard_jones.status == True:
+        if section_active(self, "lennard_jones"):
             self.lennard_jones.to_input(fout)
-        if self.williams.status == True:
+        if section_active(self, "williams"):
             self.williams.to_input(fout)
         fout.write("\t\t\t&END NONBONDED14\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "GENPOT":
-                self.genpot.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "GOODWIN":
-                self.goodwin.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "LENNARD_JONES":
-                self.lennard_jones.set_params({item: parmas[item]})
-            elif item.split("-")[3] == "WILLIAMS":
-                self.williams.set_params({item: parmas[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -383,13 +317,14 @@ class cp2k_qmmm_forcefield:
     """
 
     """
+    nonbonded = lazy_section("cp2k_qmmm_forcefield_nonbonded", "NONBONDED")
+    nonbonded14 = lazy_section("cp2k_qmmm_forcefield_nonbonded14", "NONBONDED14")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.nonbonded = cp2k_qmmm_forcefiled_nonbonded()
-        self.nonbonded14 = cp2k_qmmm_forcefield_nonbonded14()
         # basic setting
 
     def to_input(self, fout):
@@ -400,22 +335,14 @@ class cp2k_qmmm_forcefield:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.nonbonded.status == True:
+        if section_active(self, "nonbonded"):
             self.nonbonded.to_input(fout)
-        if self.nonbonded14.status == True:
+        if section_active(self, "nonbonded14"):
             self.nonbonded14.to_input(fout)
         fout.write("\t\t&END FORCEFIELD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "NONBONDED":
-                self.nonbonded.set_params({item: params[item]})
-            elif item.split("-")[2] == "NONBONDED14":
-                self.nonbonded14.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_qmmm_force_mixing_buffer_links_link_add_mm_charge:
     """
@@ -440,11 +367,7 @@ class cp2k_qmmm_force_mixing_buffer_links_link_add_mm_charge:
         fout.write("\t\t\t\t\t&END ADD_MM_CHARGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_qmmm_force_mixing_buffer_links_link_move_mm_charge:
     """
@@ -469,24 +392,21 @@ class cp2k_qmmm_force_mixing_buffer_links_link_move_mm_charge:
         fout.write("\t\t\t\t\t&END MOVE_MM_CHARGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_force_mixing_buffer_links_link:
     """
 
     """
+    add_mm_charge = lazy_section("cp2k_qmmm_force_mixing_buffer_links_link_add_mm_charge", "ADD_MM_CHARGE")
+    move_mm_charge = lazy_section("cp2k_qmmm_force_mixing_buffer_links_link_move_mm_charge", "MOVE_MM_CHARGE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.add_mm_charge = cp2k_qmmm_force_mixing_buffer_links_link_add_mm_charge()
-        self.move_mm_charge = cp2k_qmmm_force_mixing_buffer_links_link_move_mm_charge()
         # basic setting
 
     def to_input(self, fout):
@@ -497,33 +417,26 @@ class cp2k_qmmm_force_mixing_buffer_links_link:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.add_mm_charge.status == True:
+        if section_active(self, "add_mm_charge"):
             self.add_mm_charge.to_input(fout)
-        if self.move_mm_charge.status == True:
+        if section_active(self, "move_mm_charge"):
             self.move_mm_charge.to_input(fout)
         fout.write("\t\t\t\t&END LINK\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "ADD_MM_CHARGE":
-                self.add_mm_charge.set_params({item: params[item]})
-            elif item.split("-")[4] == "MOVE_MM_CHARGE":
-                self.move_mm_charge.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_force_mixing_buffer_links:
     """
 
     """
+    link = lazy_section("cp2k_qmmm_force_mixing_buffer_links_link", "LINK")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.link = cp2k_qmmm_force_mixing_buffer_links_link()
         # basic setting
 
     def to_input(self, fout):
@@ -534,16 +447,12 @@ class cp2k_qmmm_force_mixing_buffer_links:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.link.status == True:
+        if section_active(self, "link"):
             self.link.to_input(fout)
         fout.write("\t\t\t&END BUFFER_LINKS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_force_mixing_buffer_non_adaptive_link_add_mm_charge:
@@ -569,11 +478,7 @@ class cp2k_qmmm_force_mixing_buffer_non_adaptive_link_add_mm_charge:
         fout.write("\t\t\t\t\t&END ADD_MM_CHARGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_qmmm_force_mixing_buffer_non_adaptive_link_move_mm_charge:
     """
@@ -598,24 +503,21 @@ class cp2k_qmmm_force_mixing_buffer_non_adaptive_link_move_mm_charge:
         fout.write("\t\t\t\t\t&END MOVE_MM_CHARGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_force_mixing_buffer_non_adaptive_link:
     """
 
     """
+    add_mm_charge = lazy_section("cp2k_qmmm_force_mixing_buffer_non_adaptive_link_add_mm_charge", "ADD_MM_CHARGE")
+    move_mm_charge = lazy_section("cp2k_qmmm_force_mixing_buffer_non_adaptive_link_move_mm_charge", "MOVE_MM_CHARGE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.add_mm_charge = cp2k_qmmm_force_mixing_buffer_non_adaptive_link_add_mm_charge()
-        self.move_mm_charge = cp2k_qmmm_force_mixing_buffer_non_adaptive_link_move_mm_charge()
         # basic setting
 
     def to_input(self, fout):
@@ -626,22 +528,14 @@ class cp2k_qmmm_force_mixing_buffer_non_adaptive_link:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.add_mm_charge.status == True:
+        if section_active(self, "add_mm_charge"):
             self.add_mm_charge.to_input(fout)
-        if self.move_mm_charge.status == True:
+        if section_active(self, "move_mm_charge"):
             self.move_mm_charge.to_input(fout)
         fout.write("\t\t\t\t&END LINK\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "ADD_MM_CHARGE":
-                self.add_mm_charge.set_params({item: params[item]})
-            elif item.split("-")[4] == "MOVE_MM_CHARGE":
-                self.move_mm_charge.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_force_mixing_buffer_non_adaptive_qm_kind:
     """
@@ -665,24 +559,21 @@ class cp2k_qmmm_force_mixing_buffer_non_adaptive_qm_kind:
         fout.write("\t\t\t\t&END QM_KIND\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_force_mixing_buffer_non_adaptive:
     """
 
     """
+    link = lazy_section("cp2k_qmmm_force_mixing_buffer_non_adaptive_link", "LINK")
+    qm_kind = lazy_section("cp2k_qmmm_force_mixing_buffer_non_adaptive_qm_kind", "QM_KIND")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.link = cp2k_qmmm_force_mixing_buffer_non_adaptive_link()
-        self.qm_kind = cp2k_qmmm_force_mixing_buffer_non_adaptive_qm_kind()
         # basic setting
 
     def to_input(self, fout):
@@ -693,22 +584,14 @@ class cp2k_qmmm_force_mixing_buffer_non_adaptive:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.link.status == True:
+        if section_active(self, "link"):
             self.link.to_input(fout)
-        if self.qm_kind.status == True:
+        if section_active(self, "qm_kind"):
             self.qm_kind.to_input(fout)
         fout.write("\t\t\t&END BUFFER_NON_ADAPTIVE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "LINK":
-                self.link.set_params({item: params[item]})
-            elif item.split("-")[3] == "QM_KIND":
-                self.qm_kind.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_force_mixing_print_neighbor_lists_each:
     """
@@ -733,23 +616,20 @@ class cp2k_qmmm_force_mixing_print_neighbor_lists_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_force_mixing_print_neighbor_lists:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_force_mixing_print_neighbor_lists_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_force_mixing_print_neighbor_lists_each()
         # basic setting
 
     def to_input(self, fout):
@@ -760,18 +640,12 @@ class cp2k_qmmm_force_mixing_print_neighbor_lists:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END NEIGHBOR_LISTS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_force_mixing_print_subcell_each:
     """
@@ -796,23 +670,20 @@ class cp2k_qmmm_force_mixing_print_subcell_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_force_mixing_print_subcell:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_force_mixing_print_subcell_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_force_mixing_print_subcell_each()
         # basic setting
 
     def to_input(self, fout):
@@ -823,31 +694,26 @@ class cp2k_qmmm_force_mixing_print_subcell:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t&END SUBCELL\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_force_mixing_print:
     """
 
     """
+    neighbor_lists = lazy_section("cp2k_qmmm_force_mixing_print_neighbor_lists", "NEIGHBOR_LISTS")
+    subcell = lazy_section("cp2k_qmmm_force_mixing_print_subcell", "SUBCELL")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.neighbor_lists = cp2k_qmmm_force_mixing_print_neighbor_lists()
-        self.subcell = cp2k_qmmm_forcer_mixing_print_subcell()
         # basic setting
 
     def to_input(self, fout):
@@ -858,22 +724,14 @@ class cp2k_qmmm_force_mixing_print:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.neighbor_lists.status == True:
+        if section_active(self, "neighbor_lists"):
             self.neighbor_lists.to_input(fout)
-        if self.subcell.status == True:
+        if section_active(self, "subcell"):
             self.subcell.to_input(fout)
         fout.write("\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "NEIGHBOR_LISTS":
-                self.neighbor_lists.set_params({item: params[item]})
-            elif item.split("-")[3] == "SUBCELL":
-                self.subcell.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_force_mixing_qm_non_adaptive_qm_kind:
     """
@@ -898,23 +756,20 @@ class cp2k_qmmm_force_mixing_qm_non_adaptive_qm_kind:
         fout.write("\t\t\t\t&END QM_KIND\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_force_mixing_qm_non_adaptive:
     """
 
     """
+    qm_kind = lazy_section("cp2k_qmmm_force_mixing_qm_non_adaptive_qm_kind", "QM_KIND")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.qm_kind = cp2k_qmmm_force_mixing_qm_non_adaptive_qm_kind()
         # basic setting
 
     def to_input(self, fout):
@@ -925,18 +780,12 @@ class cp2k_qmmm_force_mixing_qm_non_adaptive:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.qm_kind.status == True:
+        if section_active(self, "qm_kind"):
             self.qm_kind.to_input(fout)
         fout.write("\t\t\t&END QM_NON_ADAPTIVE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "QM_KIND":
-                self.qm_kind.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_force_mixing_restart_info:
@@ -962,11 +811,7 @@ class cp2k_qmmm_force_mixing_restart_info:
         fout.write("\t\t\t&END RESTART_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 
@@ -974,16 +819,17 @@ class cp2k_qmmm_force_mixing:
     """
 
     """
+    buffer_links = lazy_section("cp2k_qmmm_force_mixing_buffer_links", "BUFFER_LINKS")
+    buffer_non_adaptive = lazy_section("cp2k_qmmm_force_mixing_buffer_non_adaptive", "BUFFER_NON_ADAPTIVE")
+    printout = lazy_section("cp2k_qmmm_force_mixing_print", "PRINT")
+    qm_non_adaptive = lazy_section("cp2k_qmmm_force_mixing_qm_non_adaptive", "QM_NON_ADAPTIVE")
+    restart_info = lazy_section("cp2k_qmmm_force_mixing_restart_info", "RESTART_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.buffer_links = cp2k_qmmm_force_mixing_buffer_links()
-        self.buffer_non_adaptive = cp2k_qmmm_force_mixing_buffer_non_adaptive()
-        self.printout = cp2k_qmmm_force_mixing_print()
-        self.qm_non_adaptive = cp2k_qmmm_force_mixing_qm_non_adaptive()
-        self.restart_info = cp2k_qmmm_force_mixing_restart_info()
         # basic setting
 
     def to_input(self, fout):
@@ -994,34 +840,20 @@ class cp2k_qmmm_force_mixing:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.buffer_links.status == True:
+        if section_active(self, "buffer_links"):
             self.buffer_links.to_input(fout)
-        if self.buffer_non_adaptive.status == True:
+        if section_active(self, "buffer_non_adaptive"):
             self.buffer_non_adaptive.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.qm_non_adaptive.status == True:
+        if section_active(self, "qm_non_adaptive"):
             self.qm_non_adaptive.to_input(fout)
-        if self.restart_info.status == True:
+        if section_active(self, "restart_info"):
             self.restart_info.to_input(fout)
         fout.write("\t\t&END FORCE_MIXING\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "BUFFER_LINKS":
-                self.buffer_links.set_params({item: params[item]})
-            elif item.split("-")[2] == "BUFFER_NON_ADAPTIVE":
-                self.buffer_non_adaptive.set_params({item: params[item]})
-            elif item.split("-")[2] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[2] == "QM_NON_ADAPTIVE":
-                self.qm_non_adaptive.set_params({item: params[item]})
-            elif item.split("-")[2] == "RESTART_INFO":
-                self.restart_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_qmmm_image_charge_eri_mme_cutoff_calib:
@@ -1047,11 +879,7 @@ class cp2k_qmmm_image_charge_eri_mme_cutoff_calib:
         fout.write("\t\t\t&END CUTOFF_CALIB\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_image_charge_eri_mme_eri_mme_info_each:
     """
@@ -1076,23 +904,20 @@ class cp2k_qmmm_image_charge_eri_mme_eri_mme_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_image_charge_eri_mme_eri_mme_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_image_charge_eri_mme_eri_mme_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_image_charge_eri_mme_eri_mme_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1103,30 +928,25 @@ class cp2k_qmmm_image_charge_eri_mme_eri_mme_info:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END CUTOFF_CALIB\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_image_charge_eri_mme:
     """
 
     """
+    cutoff_calib = lazy_section("cp2k_qmmm_image_charge_eri_mme_cutoff_calib", "CUTOFF_CALIB")
+    eri_mme_info = lazy_section("cp2k_qmmm_image_charge_eri_mme_eri_mme_info", "ERI_MME_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cutoff_calib = cp2k_qmmm_image_charge_eri_mme_cutoff_calib()
-        self.eri_mme_info = cp2k_qmmm_image_charge_eri_mme_eri_mme_info()
         # basic setting
 
     def to_input(self, fout):
@@ -1137,34 +957,27 @@ class cp2k_qmmm_image_charge_eri_mme:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cutoff_calib.status == True:
+        if section_active(self, "cutoff_calib"):
             self.cutoff_calib.to_input(fout)
-        if self.eri_mme_info.status == True:
+        if section_active(self, "eri_mme_info"):
             self.eri_mme_info.to_input(fout)
         fout.write("\t\t\t&END ERI_MME\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CUTOFF_CALIB":
-                self.cutoff_calib.set_params({item: params[item]})
-            elif item.split("-")[3] == "ERI_MME_INFO":
-                self.eri_mme_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_image_charge:
     """
 
     """
+    eri_mme = lazy_section("cp2k_qmmm_image_charge_eri_mme", "ERI_MME")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.eri_mme = cp2k_qmmm_image_charge_eri_mme()
         # basic setting
 
     def to_input(self, fout):
@@ -1175,18 +988,12 @@ class cp2k_qmmm_image_charge:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.eri_mme.status == True:
+        if section_active(self, "eri_mme"):
             self.eri_mme.to_input(fout)
         fout.write("\t\t&END IMAGE_CHARGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "ERI_MME":
-                self.eri_mme.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_qmmm_interpolator_conv_info_each:
     """
@@ -1211,11 +1018,7 @@ class cp2k_qmmm_interpolator_conv_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -1223,12 +1026,13 @@ class cp2k_qmmm_interpolator_conv_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_interpolator_conv_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1239,18 +1043,12 @@ class cp2k_qmmm_interpolator_conv_info:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_interpolator_spl_coeffs_each:
@@ -1275,11 +1073,7 @@ class cp2k_qmmm_interpolator_spl_coeffs_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -1287,12 +1081,13 @@ class cp2k_qmmm_interpolator_spl_coeffs:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_interpolator_spl_coeffs_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_interpolator_spl_coeffs_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1303,31 +1098,26 @@ class cp2k_qmmm_interpolator_spl_coeffs:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END SPL_COEFFS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_interpolator:
     """
 
     """
+    conv_info = lazy_section("cp2k_qmmm_interpolator_conv_info", "CONV_INFO")
+    spl_coeffs = lazy_section("cp2k_qmmm_interpolator_spl_coeffs", "SPL_COEFFS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.conv_info = cp2k_qmmm_interpolator_conv_info()
-        self.spl_coeffs = cp2k_qmmm_interpolator_spl_coeffs()
         # basic setting
 
     def to_input(self, fout):
@@ -1338,22 +1128,14 @@ class cp2k_qmmm_interpolator:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
-        if self.spl_coeffs.status == True:
+        if section_active(self, "spl_coeffs"):
             self.spl_coeffs.to_input(fout)
         fout.write("\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "SPL_COEFFS":
-                self.spl_coeffs.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_qmmm_link_add_mm_charge:
     """
@@ -1378,11 +1160,7 @@ class cp2k_qmmm_link_add_mm_charge:
         fout.write("\t\t\t&END ADD_MM_CHARGE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_link_move_mm_charge:
     """
@@ -1407,23 +1185,20 @@ class cp2k_qmmm_link_move_mm_charge:
         fout.write("\t\t\t&END MOVE_MM_CHARGES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_link:
     """
 
     """
+    add_mm_charge = lazy_section("cp2k_qmmm_link_add_mm_charge", "ADD_MM_CHARGE")
+    move_mm_charge = lazy_section("cp2k_qmmm_link_move_mm_charge", "MOVE_MM_CHARGE")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.add_mm_charge = cp2k_qmmm_link_add_mm_charge()
-        self.move_mm_charge = cp2k_qmmm_link_move_mm_charge()
         # basic setting
 
     def to_input(self, fout):
@@ -1434,22 +1209,14 @@ class cp2k_qmmm_link:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.add_mm_charge.status == True:
+        if section_active(self, "add_mm_charge"):
             self.add_mm_charge.to_input(fout)
         if self.mvoe_mm_charge.status == True:
             self.move_mm_charge.to_input(fout)
         fout.write("\t\t&END LINK\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "ADD_MM_CHARGE":
-                self.add_mm_charge.set_params({item: params[item]})
-            elif item.split("-")[2] == "MVOE_MM_CHARGE":
-                self.move_mm_charge.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_qmmm_mm_kind:
@@ -1475,11 +1242,7 @@ class cp2k_qmmm_mm_kind:
         fout.write("\t\t&END MM_KIND\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_qmmm_periodic_check_spline_each:
     """
@@ -1504,23 +1267,20 @@ class cp2k_qmmm_periodic_check_spline_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_periodic_check_spline:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_periodic_check_spline_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_periodic_check_spline_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1531,18 +1291,12 @@ class cp2k_qmmm_periodic_check_spline:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END CHECK_SPLINE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_periodic_interpolator_conv_info_each:
     """
@@ -1567,22 +1321,19 @@ class cp2k_qmmm_periodic_interpolator_conv_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_qmmm_periodic_interpolator_conv_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_periodic_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_periodic_interpolator_conv_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1596,24 +1347,19 @@ class cp2k_qmmm_periodic_interpolator_conv_info:
         fout.write("\t\t\t\t&END CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_periodic_interpolator:
     """
 
     """
+    conv_info = lazy_section("cp2k_qmmm_periodic_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.conv_info = cp2k_qmmm_periodic_interpolator_conv_info()
         # basic setting
 
     def to_input(self, fout):
@@ -1624,18 +1370,12 @@ class cp2k_qmmm_periodic_interpolator:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_periodic_multipole_check_spline_each:
@@ -1661,23 +1401,20 @@ class cp2k_qmmm_periodic_multipole_check_spline_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_periodic_multipole_check_spline:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_periodic_multipole_check_spline_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_periodic_multipole_check_spline_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1691,11 +1428,7 @@ class cp2k_qmmm_periodic_multipole_check_spline:
         fout.write("\t\t\t\t&END CHECK_SPLINES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -1725,23 +1458,20 @@ class cp2k_qmmm_periodic_multipole_interpolator_conv_info_each:
         fout.write("\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_qmmm_periodic_multipole_interpolator_conv_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_periodic_multipole_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_periodic_multipole_interpolator_conv_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1755,11 +1485,7 @@ class cp2k_qmmm_periodic_multipole_interpolator_conv_info:
         fout.write("\t\t\t\t\t&END CONV_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 
@@ -1767,12 +1493,13 @@ class cp2k_qmmm_periodic_multipole_interpolator:
     """
 
     """
+    conv_info = lazy_section("cp2k_qmmm_periodic_multipole_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.conv_info = cp2k_qmmm_periodic_multipole_interpolator_conv_info()
         # basic setting
 
     def to_input(self, fout):
@@ -1783,18 +1510,12 @@ class cp2k_qmmm_periodic_multipole_interpolator:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.covn_info.to_input(fout)
         fout.write("\t\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CONV_INFO":
-                self.covn_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -1821,23 +1542,20 @@ class cp2k_qmmm_periodic_multipole_program_run_info_each:
         fout.write("\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_periodic_multipole_program_run_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_periodic_multipole_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_qmmm_periodic_multipole_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1851,25 +1569,22 @@ class cp2k_qmmm_periodic_multipole_program_run_info:
         fout.write("\t\t\t\t&end program_run_info\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_qmmm_periodic_multipole:
     """
 
     """
+    check_spline = lazy_section("cp2k_qmmm_periodic_multipole_check_spline", "CHECK_SPLINE")
+    interpolator = lazy_section("cp2k_qmmm_periodic_multipole_interpolator", "INTERPOLATOR")
+    program_run_info = lazy_section("cp2k_qmmm_periodic_multipole_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.check_spline = cp2k_qmmm_periodic_multipole_check_splien()
-        self.interpolator = cp2k_qmmm_periodic_multipole_interpolator()
-        self.program_run_info = cp2k_qmmm_periodic_multipole_program_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -1880,26 +1595,16 @@ class cp2k_qmmm_periodic_multipole:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.check_spline.status == True:
+        if section_active(self, "check_spline"):
             self.check_spline.to_input(fout)
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             self.interpolator.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t&END MULTIPOLE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "CHECK_SPLINE":
-                self.check_spline.set_params({item: params[item]})
-            elif item.split("-")[3] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[3] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_periodic_poisson_ewald_multipoles:
@@ -1925,11 +1630,7 @@ class cp2k_qmmm_periodic_poisson_ewald_multipoles:
         fout.write("\t\t\t\t\t&END MULTIPOLES\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_qmmm_periodic_poisson_ewald_print_program_run_info_each:
     """
@@ -1954,22 +1655,19 @@ class cp2k_qmmm_periodic_poisson_ewald_print_program_run_info_each:
         fout.write("\t\t\t\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_qmmm_periodic_poisson_ewald_print_program_run_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_periodic_poisson_ewald_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.each = cp2k_qmmm_periodic_poisson_ewald_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -1980,29 +1678,24 @@ class cp2k_qmmm_periodic_poisson_ewald_print_program_run_info:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_qmmm_periodic_poisson_ewald_print:
     """
 
     """
+    program_run_info = lazy_section("cp2k_qmmm_periodic_poisson_ewald_print_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.program_run_info = cp2k_qmmm_periodic_poisson_ewald_print_program_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -2013,18 +1706,12 @@ class cp2k_qmmm_periodic_poisson_ewald_print:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_periodic_poisson_ewald_rs_grid:
@@ -2050,11 +1737,7 @@ class cp2k_qmmm_periodic_poisson_ewald_rs_grid:
         fout.write("\t\t\t\t\t&END RS_GRID\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 
@@ -2062,14 +1745,15 @@ class cp2k_qmmm_periodic_poisson_ewald:
     """
 
     """
+    multipoles = lazy_section("cp2k_qmmm_periodic_poisson_ewald_multipoles", "MULTIPOLES")
+    printout = lazy_section("cp2k_qmmm_periodic_poisson_ewald_print", "PRINT")
+    rs_grid = lazy_section("cp2k_qmmm_periodic_poisson_ewald_rs_grid", "RS_GRID")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.multipoles = cp2k_qmmm_periodic_poisson_ewald_multipoles()
-        self.printout = cp2k_qmmm_periodic_poisson_ewald_print()
-        self.rs_grid = cp2k_qmmm_periodic_poisson_ewald_rs_grid()
         # basic setting
 
     def to_input(self, fout):
@@ -2080,26 +1764,16 @@ class cp2k_qmmm_periodic_poisson_ewald:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.multipoles.status == True:
+        if section_active(self, "multipoles"):
             self.multipole.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.rs_grid.status == True:
+        if section_active(self, "rs_grid"):
             self.rs_grid.to_input(fout)
         fout.write("\t\t\t\t&END_EALD\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "MULTIPOLES":
-                self.multipoles.set_params({item: params[item]})
-            elif item.split("-")[4] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            elif item.split("-")[4] == "RS_GRID":
-                self.rs_grid.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -2121,11 +1795,7 @@ class cp2k_qmmm_periodic_poisson_implicit_dielectric_dielec_aa_cuboidal:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_qmmm_periodic_poisson_implicit_dielectric_dielec_xaa_annular:
     def __init__(self):
@@ -2145,22 +1815,18 @@ class cp2k_qmmm_periodic_poisson_implicit_dielectric_dielec_xaa_annular:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_qmmm_periodic_poisson_implicit_dielectric:
+    dielec_aa_cuboidal = lazy_section("cp2k_qmmm_periodic_poisson_implicit_dielectric_dielec_aa_cuboidal", "DIELEC_AA_CUBOIDAL")
+    dielec_xaa_annular = lazy_section("cp2k_qmmm_periodic_poisson_implicit_dielectric_dielec_xaa_annular", "DIELEC_XAA_ANNULAR")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.dielec_aa_cuboidal = cp2k_qmmm_periodic_poisson_implicit_dielectric_dielec_aa__cuboidal()
-        self.dielec_xaa_annular = cp2k_qmmm_periodic_poisson_implicit_dielectric_dielec_xaa_annular()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2171,23 +1837,15 @@ class cp2k_qmmm_periodic_poisson_implicit_dielectric:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.dielec_aa_cuboidal.status == True:
+        if section_active(self, "dielec_aa_cuboidal"):
             self.dielec_aa_cuboidal.to_input(fout)
-        if self.dielec_xaa_annular.status == True:
+        if section_active(self, "dielec_xaa_annular"):
             self.dielec_xaa_annular.to_input(fout)
         fout.write("\t\t\t\t\t&END DIELECTRIC\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "DIELEC_AA_CUBOIDAL":
-                self.dielec_aa_cuboidal.set_params({item: params[item]})
-            elif item.split("-")[5] == "DIELEC_XAA_ANNULAR":
-                self.dielec_xaa_annular.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_cuboidal:
@@ -2208,11 +1866,7 @@ class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_cuboidal:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_cylindrical:
     def __init__(self):
@@ -2232,11 +1886,7 @@ class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_cylindrical:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_planar:
     def __init__(self):
@@ -2256,11 +1906,7 @@ class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_planar:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_planar:
     def __init__(self):
@@ -2280,23 +1926,20 @@ class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_planar:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc:
+    aa_cuboidal = lazy_section("cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_cuboidal", "AA_CUBOIDAL")
+    aa_cylindrical = lazy_section("cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_cylindrical", "AA_CYLINDRICAL")
+    aa_planar = lazy_section("cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_planar", "AA_PLANAR")
+    planar = lazy_section("cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_planar", "PLANAR")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.aa_cuboidal = cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_cuboidal()
-        self.aa_cylindrical = cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_cylindrical()
-        self.aa_planar = cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_aa_planar()
-        self.planar = cp2k_qmmm_periodic_poisson_implicit_dielectric_bc_planar()
         # basic setting
 
     def to_input(self, fout):
@@ -2307,31 +1950,19 @@ class cp2k_qmmm_periodic_poisson_implicit_dielectric_bc:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.aa_cuboidal.status == True:
+        if section_active(self, "aa_cuboidal"):
             self.aa_cuboidal.to_input(fout)
-        if self.aa_cylindrical.status == True:
+        if section_active(self, "aa_cylindrical"):
             self.aa_cylindrical.to_input(fout)
-        if self.aa_planar.status == True:
+        if section_active(self, "aa_planar"):
             self.aa_planar.to_input(fout)
-        if self.planar.status == True:
+        if section_active(self, "planar"):
             self.planar.to_input(fout)
         fout.write("\t\t\t\t\t&END DIELECTRIC_BC\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "AA_CUBOIDAL":
-                self.aa_cuboidal.set_params({item: params[item]})
-            elif item.split("-")[5] == "AA_CYLINDRICAL":
-                self.aa_cylindrical.set_params({item: params[item]})
-            elif item.split("-")[5] == "AA_PLANAR":
-                self.aa_planar.set_params({item: params[item]})
-            elif item.split("-")[5] == "PLANAR":
-                self.planar.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 
@@ -2339,12 +1970,13 @@ class cp2k_qmmm_periodic_poisson_implicit:
     """
 
     """
+    dielectric = lazy_section("cp2k_qmmm_periodic_poisson_implicit_dielectric", "DIELECTRIC")
+
     def __init__(self):
         self.params = {
                 }
         self.status = false
 
-        self.dielectric = cp2k_qmmm_periodic_poisson_implicit_dielectric()
         self.dielectric_bc == cp2k_qmmm_periodic_poisson_implicit_dielectric_bc()
         # basic setting
 
@@ -2356,22 +1988,14 @@ class cp2k_qmmm_periodic_poisson_implicit:
         for item in self.params:
             if self.params[item] is not none:                    
                 fout.write("\t\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.dielectric.status == True:
+        if section_active(self, "dielectric"):
             self.dielectric.to_input(fout)
         if self.dielectric_bc.status == True:
             self.dielectric_bc.to_input(fout)
         fout.write("\t\t\t\t&END IMPLICIT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "DIELECTRIC":
-                self.dielectric.set_params({item: params[item]})
-            elif item.split("-")[4] == "DIELECTRIC_BC":
-                self.dielectric_bc.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_periodic_poisson_mt:
     """
@@ -2396,11 +2020,7 @@ class cp2k_qmmm_periodic_poisson_mt:
         fout.write("\t\t\t\t&END MT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -2431,11 +2051,7 @@ class cp2k_qmmm_periodic_poisson_multipole_check_spline_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_qmmm_periodic_poisson_multipole_check_spline:
     def __init__(self):
@@ -2461,13 +2077,7 @@ class cp2k_qmmm_periodic_poisson_multipole_check_spline:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_qmmm_periodic_poisson_multipole_interpolator_conv_info_each:
     def __init__(self):
@@ -2487,20 +2097,16 @@ class cp2k_qmmm_periodic_poisson_multipole_interpolator_conv_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 8:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=7)
 
 class cp2k_qmmm_periodic_poisson_multipole_interpolator_conv_info:
+    each = lazy_section("cp2k_qmmm_periodic_poisson_multipole_interpolator_conv_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_qmmm_periodic_poisson_multipole_interpolator_conv_info_each()
-        
         # basic setting
 
     def to_input(self, fout):
@@ -2515,22 +2121,16 @@ class cp2k_qmmm_periodic_poisson_multipole_interpolator_conv_info:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[6] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=6)
 
 class cp2k_qmmm_periodic_poisson_multipole_interpolator:
+    conv_info = lazy_section("cp2k_qmmm_periodic_poisson_multipole_interpolator_conv_info", "CONV_INFO")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.conv_info = cp2k_qmmm_periodic_poisson_multipole_interpolator_conv_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2541,19 +2141,13 @@ class cp2k_qmmm_periodic_poisson_multipole_interpolator:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.conv_info.status == True:
+        if section_active(self, "conv_info"):
             self.conv_info.to_input(fout)
         fout.write("\t\t\t\t\t&END INTERPOLATOR\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "CONV_INFO":
-                self.conv_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 class cp2k_qmmm_periodic_poisson_multipole_program_run_info_each:
     def __init__(self):
@@ -2573,20 +2167,17 @@ class cp2k_qmmm_periodic_poisson_multipole_program_run_info_each:
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 7:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=6)
 
 
 class cp2k_qmmm_periodic_poisson_multipole_program_run_info:
+    each = lazy_section("cp2k_qmmm_periodic_poisson_multipole_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.each = cp2k_qmmm_periodic_poisson_multipole_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2597,31 +2188,25 @@ class cp2k_qmmm_periodic_poisson_multipole_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t\t\t&END PROGRAM_RUN_INFO\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 6:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[5] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=5)
 
 
 class cp2k_qmmm_periodic_poisson_multipole:
+    check_spline = lazy_section("cp2k_qmmm_periodic_poisson_multipole_check_spline", "CHECK_SPLINE")
+    interpolator = lazy_section("cp2k_qmmm_periodic_poisson_multipole_interpolator", "INTERPOLATOR")
+    program_run_info = lazy_section("cp2k_qmmm_periodic_poisson_multipole_program_run_info", "PROGRAM_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }       
         self.status = False
 
-        self.check_spline = cp2k_qmmm_periodic_poisson_multipole_check_spline()
-        self.interpolator = cp2k_qmmm_periodic_poisson_multipole_interpolator()
-        self.program_run_info = cp2k_qmmm_periodic_poisson_multipole_program_run_info()
-
         # basic setting
 
     def to_input(self, fout):
@@ -2632,27 +2217,17 @@ class cp2k_qmmm_periodic_poisson_multipole:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t\t%s %s\n" % (item, str(self.params[item])))
-        if self.check_spline.status == True:
+        if section_active(self, "check_spline"):
             self.check_spline.to_input(fout)
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             self.interpolator.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
         fout.write("\t\t\t\t&END MULTIPOLE\n")
 
     def set_params(self, params):
         #
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[4] == "CHECK_SPLINE":
-                self.check_spline.set_params({item: params[item]})
-            elif item.split("-")[4] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[4] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 
@@ -2679,26 +2254,23 @@ class cp2k_qmmm_periodic_poisson_wavelet:
         fout.write("\t\t\t\t&END WAVELET\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_periodic_poisson:
     """
 
     """
+    ewald = lazy_section("cp2k_qmmm_periodic_poisson_ewald", "EWALD")
+    implicit = lazy_section("cp2k_qmmm_periodic_poisson_implicit", "IMPLICIT")
+    mt = lazy_section("cp2k_qmmm_periodic_poisson_mt", "MT")
+    multipole = lazy_section("cp2k_qmmm_periodic_poisson_multipole", "MULTIPOLE")
+    wavelet = lazy_section("cp2k_qmmm_periodic_poisson_wavelet", "WAVELET")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.ewald = cp2k_qmmm_periodic_poisson_ewald()
-        self.implicit = cp2k_qmmm_periodic_poisson_implicit()
-        self.mt = cp2k_qmmm_periodic_poisson_mt()
-        self.multipole = cp2k_qmmm_periodic_poisson_multipole()
-        self.wavelet = cp2k_qmmm_periodic_poisson_wavelet()
         # basic setting
 
     def to_input(self, fout):
@@ -2709,49 +2281,36 @@ class cp2k_qmmm_periodic_poisson:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.ewald.status == True:
+        if section_active(self, "ewald"):
             self.ewald.to_input(fout)
-        if self.implicit.status == True:
+        if section_active(self, "implicit"):
             self.implicit.to_input(fout)
-        if self.mt.status == True:
+        if section_active(self, "mt"):
             self.mt.to_input(fout)
-        if self.multipole.status == True:
+        if section_active(self, "multipole"):
             self.multipole.to_input(fout)
-        if self.wavelet.status == True:
+        if section_active(self, "wavelet"):
             self.wavelet.to_input(fout)
         fout.write("\t\t\t&END POISSON\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EWALD":
-                self.ewald.set_params({item: params[item]})
-            elif item.split("-")[3] == "IMPLICIT":
-                self.implicit.set_params({item: params[item]})
-            elif item.split("-")[3] == "MT":
-                self.mt.set_params({item: params[item]})
-            elif item.split("-")[3] == "MULTIPOLE":
-                slef.multipole.set_params({item: params[item]})
-            elif item.split("-")[3] == "WAVELET":
-                self.wavelet.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_periodic:
     """
 
     """
+    check_spline = lazy_section("cp2k_qmmm_periodic_check_spline", "CHECK_SPLINE")
+    interpolator = lazy_section("cp2k_qmmm_periodic_interpolator", "INTERPOLATOR")
+    multipole = lazy_section("cp2k_qmmm_periodic_multipole", "MULTIPOLE")
+    poisson = lazy_section("cp2k_qmmm_periodic_poisson", "POISSON")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.check_spline = cp2k_qmmm_periodic_check_spline()
-        self.interpolator = cp2k_qmmm_periodic_interpolator()
-        self.multipole = cp2k_qmmm_periodic_multipole()
-        self.poisson = cp2k_qmmm_periodic_poisson()
         # basic setting
 
     def to_input(self, fout):
@@ -2762,30 +2321,18 @@ class cp2k_qmmm_periodic:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.check_spline.status == True:
+        if section_active(self, "check_spline"):
             self.check_spline.to_input(fout)
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             selfinterpolator.to_input(fout)
-        if self.multipole.status == True:
+        if section_active(self, "multipole"):
             self.multipole.to_input(fout)
-        if self.poisson.status == True:
+        if section_active(self, "poisson"):
             self.poisson.to_input(fout)
         fout.write("\t\t&END PERIODIC\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CHECK_SPLINE":
-                self.check_spline.set_params({item: params[item]})
-            elif item.split("-")[2] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[2] == "MULTIPOLE":
-                self.multipole.set_params({item: params[item]})
-            elif item.split("-")[2] == "POISSON":
-                self.poisson.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_qmmm_print_derivatives_each:
     """
@@ -2810,22 +2357,19 @@ class cp2k_qmmm_print_derivatives_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_derivatives:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_derivatives_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_derivatives_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2836,18 +2380,12 @@ class cp2k_qmmm_print_derivatives:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_qmmm_print_dipole_each:
@@ -2873,22 +2411,19 @@ class cp2k_qmmm_print_dipole_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_dipole:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_dipole_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_dipole_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2899,18 +2434,12 @@ class cp2k_qmmm_print_dipole:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_print_grid_information_each:
@@ -2936,22 +2465,19 @@ class cp2k_qmmm_print_grid_information_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_grid_information:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_grid_information_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_grid_information_each()
         # basic setting
 
     def to_input(self, fout):
@@ -2962,18 +2488,12 @@ class cp2k_qmmm_print_grid_information:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_image_charge_info_each:
     """
@@ -2998,22 +2518,19 @@ class cp2k_qmmm_print_image_charge_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_image_charge_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_image_charge_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_image_charge_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3024,18 +2541,12 @@ class cp2k_qmmm_print_image_charge_info:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_image_charge_restart_each:
     """
@@ -3060,22 +2571,19 @@ class cp2k_qmmm_print_image_charge_restart_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_image_charge_restart:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_image_charge_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_image_charge_restart_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3086,18 +2594,12 @@ class cp2k_qmmm_print_image_charge_restart:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_mm_potential_each:
     """
@@ -3122,22 +2624,19 @@ class cp2k_qmmm_print_mm_potential_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_mm_potential:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_mm_potential_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_mm_potential_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3148,18 +2647,12 @@ class cp2k_qmmm_print_mm_potential:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_periodic_info_each:
     """
@@ -3184,22 +2677,19 @@ class cp2k_qmmm_print_periodic_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_periodic_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_periodic_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_periodic_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3210,18 +2700,12 @@ class cp2k_qmmm_print_periodic_info:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_pgf_each:
     """
@@ -3246,22 +2730,19 @@ class cp2k_qmmm_print_pgf_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_pgf:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_pgf_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_pgf_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3272,18 +2753,12 @@ class cp2k_qmmm_print_pgf:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_potential_each:
     """
@@ -3308,22 +2783,19 @@ class cp2k_qmmm_print_potential_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_potential:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_potential_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_potential_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3334,18 +2806,12 @@ class cp2k_qmmm_print_potential:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_program_banner_each:
     """
@@ -3370,22 +2836,19 @@ class cp2k_qmmm_print_program_banner_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_program_banner:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_program_banner_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_program_banner_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3396,18 +2859,12 @@ class cp2k_qmmm_print_program_banner:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_program_run_info_each:
     """
@@ -3432,22 +2889,19 @@ class cp2k_qmmm_print_program_run_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_program_run_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3458,18 +2912,12 @@ class cp2k_qmmm_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_qmmm_charges_each:
     """
@@ -3494,22 +2942,19 @@ class cp2k_qmmm_print_qmmm_charges_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_qmmm_charges:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_qmmm_charges_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_qmmm_charges_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3520,18 +2965,12 @@ class cp2k_qmmm_print_qmmm_charges:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_qmmm_link_info_each:
     """
@@ -3556,22 +2995,19 @@ class cp2k_qmmm_print_qmmm_link_info_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_qmmm_link_info:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_qmmm_link_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_qmmm_link_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3582,18 +3018,12 @@ class cp2k_qmmm_print_qmmm_link_info:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_qmmm_matrix_each:
     """
@@ -3618,22 +3048,19 @@ class cp2k_qmmm_print_qmmm_matrix_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_qmmm_matrix:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_qmmm_matrix_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_qmmm_matrix_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3644,18 +3071,12 @@ class cp2k_qmmm_print_qmmm_matrix:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_qmmm_print_qs_derivatives_each:
     """
@@ -3680,22 +3101,19 @@ class cp2k_qmmm_print_qs_derivatives_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_qmmm_print_qs_derivatives:
     """
 
     """
+    each = lazy_section("cp2k_qmmm_print_qs_derivatives_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_qmmm_print_qs_derivatives_each()
         # basic setting
 
     def to_input(self, fout):
@@ -3706,44 +3124,39 @@ class cp2k_qmmm_print_qs_derivatives:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_qmmm_print:
     """
 
     """
+    derivatives = lazy_section("cp2k_qmmm_print_derivatives", "DERIVATIVES")
+    dipole = lazy_section("cp2k_qmmm_print_dipole", "DIPOLE")
+    grid_information = lazy_section("cp2k_qmmm_print_grid_information", "GRID_INFORMATION")
+    image_charge_info = lazy_section("cp2k_qmmm_print_image_charge_info", "IMAGE_CHARGE_INFO")
+    image_charge_restart = lazy_section("cp2k_qmmm_print_image_charge_restart", "IMAGE_CHARGE_RESTART")
+    mm_potential = lazy_section("cp2k_qmmm_print_mm_potential", "MM_POTENTIAL")
+    periodic_info = lazy_section("cp2k_qmmm_print_periodic_info", "PERIODIC_INFO")
+    pgf = lazy_section("cp2k_qmmm_print_pgf", "PGF")
+    potential = lazy_section("cp2k_qmmm_print_potential", "POTENTIAL")
+    program_banner = lazy_section("cp2k_qmmm_print_program_banner", "PROGRAM_BANNER")
+    program_run_info = lazy_section("cp2k_qmmm_print_program_run_info", "PROGRAM_RUN_INFO")
+    qmmm_charges = lazy_section("cp2k_qmmm_print_qmmm_charges", "QMMM_CHARGES")
+    qmmm_link_info = lazy_section("cp2k_qmmm_print_qmmm_link_info", "QMMM_LINK_INFO")
+    qmmm_matrix = lazy_section("cp2k_qmmm_print_qmmm_matrix", "QMMM_MATRIX")
+    qs_derivatives = lazy_section("cp2k_qmmm_print_qs_derivatives", "QS_DERIVATIVES")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.derivatives = cp2k_qmmm_print_derivatives()
-        self.dipole = cp2k_qmmm_print_dipole()
-        self.grid_information = cp2k_qmmm_print_grid_information()
-        self.image_charge_info = cp2k_qmmm_print_image_charge_info()
-        self.image_charge_restart = cp2k_qmmm_print_image_charge_restart()
-        self.mm_potential = cp2k_qmmm_print_mm_potential()
-        self.periodic_info = cp2k_qmmm_print_periodic_info()
-        self.pgf = cp2k_qmmm_print_pgf()
-        self.potential = cp2k_qmmm_print_potential()
-        self.program_banner = cp2k_qmmm_print_program_banner()
-        self.program_run_info = cp2k_qmmm_print_program_run_info()
-        self.qmmm_charges = cp2k_qmmm_print_qmmm_charges()
-        self.qmmm_link_info = cp2k_qmmm_print_qmmm_link_info()
-        self.qmmm_matrix = cp2k_qmmm_print_qmmm_matrix()
-        self.qs_derivatives = cp2k_qmmm_print_qs_derivatives()
         # basic setting
 
     def to_input(self, fout):
@@ -3754,74 +3167,40 @@ class cp2k_qmmm_print:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.derivatives.status == True:
+        if section_active(self, "derivatives"):
             self.drivatives.to_input(fout)
-        if self.dipole.status == True:
+        if section_active(self, "dipole"):
             self.dipole.to_input(fout)
-        if self.grid_information.status == True:
+        if section_active(self, "grid_information"):
             self.grid_information.to_input(fout)
-        if self.image_charge_info.status == True:
+        if section_active(self, "image_charge_info"):
             self.image_charge_info.to_input(fout)
-        if self.image_charge_restart.status == True:
+        if section_active(self, "image_charge_restart"):
             self.image_charge_restart.to_input(fout)
-        if self.mm_potential.status == True:
+        if section_active(self, "mm_potential"):
             self.mm_potential.to_input(fout)
-        if self.periodic_info.status == True:
+        if section_active(self, "periodic_info"):
             self.periodic_info.to_input(fout)
-        if self.pgf.status == True:
+        if section_active(self, "pgf"):
             self.pgg.to_input(fout)
-        if self.potential.status == True:
+        if section_active(self, "potential"):
             self.potential.to_input(fout)
-        if self.program_banner.status == True:
+        if section_active(self, "program_banner"):
             self.program_banner.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.qmmm_charges.status == True:
+        if section_active(self, "qmmm_charges"):
             self.qmmm_charges.to_input(fout)
-        if self.qmmm_link_info.status == True:
+        if section_active(self, "qmmm_link_info"):
             self.qmmm_link_info.to_input(fout)
-        if self.qmmm_matrix.status == True:
+        if section_active(self, "qmmm_matrix"):
             self.qmmm_matrix.to_input(fout)
-        if self.qs_derivatives.status == True:
+        if section_active(self, "qs_derivatives"):
             self.qs_derivatives.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "DERIVATIVES":
-                self.drivatives.set_params({item: params[item]})
-            elif item.split("-")[2] == "DIPOLE":
-                self.dipole.set_params({item: params[item]})
-            elif item.split("-")[2] == "GRID_INFORMATION":
-                self.grid_information.set_params({item: params[item]})
-            elif item.split("-")[2] == "IMAGE_CHARGE_INFO":
-                self.image_charge_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "IMAGE_CHARGE_RESTART":
-                self.image_charge_restart.set_params({item: params[item]})
-            elif item.split("-")[2] == "MM_POTENTIAL":
-                self.mm_potential.set_params({item: params[item]})
-            elif item.split("-")[2] == "PERIODIC_INFO":
-                self.periodic_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "PGF":
-                self.pgf.set_params({item: params[item]})
-            elif item.split("-")[2] == "POTENTIAL":
-                self.potential.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROGRAM_BANNER":
-                self.program_banner.set_params({item: params[item]})
-            elif item.split("-")[2] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "QMMM_CHARGES":
-                self.qmmm_charges.set_params({item: params[item]})
-            elif item.split("-")[2] == "QMMM_LINK_INFO":
-                self.qmmm_link_info.set_params({item: params[item]})
-            elif item.split("-")[2] == "QMMM_MATRIX":
-                self.qmmm_matrix.set_params({item: params[item]})
-            elif item.split("-")[2] == "QS_DERIVATIVES":
-                self.qs_derivatives.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_qmmm_qm_kind:
     """
@@ -3846,11 +3225,7 @@ class cp2k_qmmm_qm_kind:
         fout.write("\t\t&END QM_KIND\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_qmmm_walls:
     """
@@ -3875,33 +3250,30 @@ class cp2k_qmmm_walls:
         fout.write("\t\t&END WALLS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_qmmm:
     """
 
     """
+    cell = lazy_section("cp2k_qmmm_cell", "CELL")
+    forcefield = lazy_section("cp2k_qmmm_forcefield", "FORCEFIELD")
+    force_mixing = lazy_section("cp2k_qmmm_force_mixing", "FORCE_MIXING")
+    image_charge = lazy_section("cp2k_qmmm_image_charge", "IMAGE_CHARGE")
+    interpolator = lazy_section("cp2k_qmmm_interpolator", "INTERPOLATOR")
+    link = lazy_section("cp2k_qmmm_link", "LINK")
+    mm_kind = lazy_section("cp2k_qmmm_mm_kind", "MM_KIND")
+    periodic = lazy_section("cp2k_qmmm_periodic", "PERIODIC")
+    printout = lazy_section("cp2k_qmmm_print", "PRINT")
+    qm_kind = lazy_section("cp2k_qmmm_qm_kind", "QM_KIND")
+    walls = lazy_section("cp2k_qmmm_walls", "WALLS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cell = cp2k_qmmm_cell()
-        self.forcefield = cp2k_qmmm_forcefield()
-        self.force_mixing = cp2k_qmmm_force_mixing()
-        self.image_charge = cp2k_qmmm_image_charge()
-        self.interpolator = cp2k_qmmm_interpolator()
-        self.link = cp2k_qmmm_link()
-        self.mm_kind = cp2k_qmmm_mm_kind()
-        self.periodic = cp2k_qmmm_periodic()
-        self.printout = cp2k_qmmm_print()
-        self.qm_kind = cp2k_qmmm_qm_kind()
-        self.walls = cp2k_qmmm_walls()
         # basic setting
 
     def to_input(self, fout):
@@ -3912,53 +3284,29 @@ class cp2k_qmmm:
         for item in self.params:
             if self.params[item] is not None:                    
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.cell.status == True:
+        if section_active(self, "cell"):
             self.cell.to_input(fout)
-        if self.forcefield.status == True:
+        if section_active(self, "forcefield"):
             self.forcefield.to_input(fout)
-        if self.force_mixing.status == True:
+        if section_active(self, "force_mixing"):
             self.force_mixing.to_input(fout)
-        if self.image_charge.status == True:
+        if section_active(self, "image_charge"):
             self.image_charge.to_input(fout)
-        if self.interpolator.status == True:
+        if section_active(self, "interpolator"):
             self.interpolator.to_input(fout)
-        if self.link.status == True:
+        if section_active(self, "link"):
             self.link.to_input(fout)
-        if self.mm_kind.status == True:
+        if section_active(self, "mm_kind"):
             self.mm_kind.to_input(fout)
-        if self.periodic.status == True:
+        if section_active(self, "periodic"):
             self.periodic.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
-        if self.qm_kind.status == True:
+        if section_active(self, "qm_kind"):
             self.qm_kind.to_input(fout)
-        if self.walls.status == True:
+        if section_active(self, "walls"):
             self.walls.to_input(fout)
         fout.write("\t&END QMMM\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "CELL":
-                self.cell.set_params({item: params[item]})
-            elif item.split("-")[1] == "FORCEFIELD":
-                self.forcefield.set_params({item: params[item]})
-            elif item.split("-")[1] == "FORCE_MIXING":
-                self.force_mixing.set_params({item: params[item]})
-            elif item.split("-")[1] == "IMAGE_CHARGE":
-                self.image_charge.set_params({item: params[item]})
-            elif item.split("-")[1] == "INTERPOLATOR":
-                self.interpolator.set_params({item: params[item]})
-            elif item.split("-")[1] == "LINK":
-                self.link.set_params({item: params[item]})
-            elif item.split("-")[1] == "MM_KIND":
-                self.mm_kind.set_params({item: params[item]})
-            elif item.split("-")[1] == "PERIODIC":
-                self.periodic.set_params({item: params[item]})
-            elif item.split("-")[1] == "QM_KIND":
-                self.qm_kind.set_params({item: params[item]})
-            elif item.split("-")[1] == "WALLS":
-                self.walls.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
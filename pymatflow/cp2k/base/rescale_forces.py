@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import route_params
 
 
 """
@@ -41,10 +42,4 @@ class cp2k_rescale_forces:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "ALMO_SCF":
-                self.almo_scf.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
@@ -0,0 +1,193 @@
+"""
+lazy construction of the subsections of CP2K input
+"""
+import sys
+
+
+"""
+Usage:
+    class cp2k_dft:
+        scf = lazy_section("cp2k_dft_scf", "SCF")
+
+        def to_input(self, fout):
+            if section_active(self, "scf"):
+                self.scf.to_input(fout)
+
+Note:
+    a CP2K section has dozens of subsections which again have their own, so
+    building all of them when a section is created makes thousands of objects
+    for one input. a lazy_section is built when it is first accessed(by
+    self.scf.status = True, set_params, etc.) and then stored in the instance,
+    so later accesses are plain attribute lookups.
+
+    section_active(self, "scf") checks the status of a subsection without
+    building it: a subsection never accessed has the status its class sets in
+    __init__, which is found once per class. section_touched(self, "scf") tells
+    whether it is built at all.
+
+    set_params of every section is route_params: a key like "DFT-MGRID-CUTOFF"
+    is split once and walked down the subsections by section_index, the map
+    from the CP2K name of each subsection(declared in its lazy_section, and
+    the upper case attribute name) to its attribute which is built once per
+    class from the lazy_section declarations, so no chain of comparisons is run for
+    each key and level. the last name is the keyword set in params, or the
+    value of the section keyword(section.section, like "DFT-SCF-OT": "TRUE")
+    when it names a subsection having one, a subsection without one(like
+    "DFT-LS_SCF": "TRUE") is switched on or off by its status, and is never
+    written as a keyword of its parent. keys naming no subsection, or a
+    subsection without section keyword with a value other than true or false,
+    are reported instead of being dropped silently.
+"""
+
+class lazy_section:
+    """
+    descriptor creating the subsection on first access
+    """
+    def __init__(self, name, cp2k_name=None):
+        """
+        :param name: name of the class of the subsection, looked up in the module
+            of the owner class when first needed, so it can be defined later in
+            the module
+        :param cp2k_name: name of the section in CP2K input, like "PRINT" for
+            the attribute printout, used to route the keys of set_params
+        """
+        self.name = name
+        self.cp2k_name = cp2k_name
+        self.cls = None
+        self.default_status = None
+
+    def __set_name__(self, owner, attr):
+        self.attr = attr
+        self.module = owner.__module__
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        section = self.get_class()()
+        # the instance attribute takes precedence over the descriptor from now on
+        obj.__dict__[self.attr] = section
+        return section
+
+    def get_class(self):
+        if self.cls is None:
+            self.cls = getattr(sys.modules[self.module], self.name)
+        return self.cls
+
+    def get_default_status(self):
+        if self.default_status is None:
+            self.default_status = self.get_class()().status
+        return self.default_status
+
+
+def section_touched(obj, attr):
+    """
+    :return whether the subsection attr of obj is already built
+    """
+    return attr in obj.__dict__
+
+def section_active(obj, attr):
+    """
+    :return whether the subsection attr of obj is to be written, without building it
+        if it is never accessed
+    """
+    if attr in obj.__dict__:
+        return obj.__dict__[attr].status == True
+    for owner in type(obj).__mro__:
+        descriptor = owner.__dict__.get(attr)
+        if isinstance(descriptor, lazy_section):
+            return descriptor.get_default_status() == True
+    return getattr(obj, attr).status == True
+
+
+# class -> {CP2K name of the subsection: attribute}
+_indices = {}
+# class -> whether its instance has a section keyword(self.section)
+_has_keyword = {}
+
+def section_index(cls):
+    """
+    :return dict mapping the CP2K names(upper case) of the subsections of
+        class cls to their attributes, like {"MGRID": "mgrid", "PRINT": "printout"}
+    """
+    if cls in _indices:
+        return _indices[cls]
+    index = {}
+    for owner in reversed(type.mro(cls)):
+        for attr, descriptor in owner.__dict__.items():
+            if not isinstance(descriptor, lazy_section):
+                continue
+            index[attr.upper()] = attr
+            if descriptor.cp2k_name is not None:
+                index[descriptor.cp2k_name.upper()] = attr
+    _indices[cls] = index
+    return index
+
+def route_params(section, params, level=0):
+    """
+    set parameters of section and its subsections
+    :param section: the section the keys are relative to
+    :param params: dict like {"DFT-MGRID-CUTOFF": 400}
+    :param level: number of the leading names in the keys naming section itself
+        and its parents, like 1 for "DFT-MGRID-CUTOFF" given to cp2k_dft
+    :return list of the keys naming no subsection, which are not set
+    """
+    unknown = []
+    for item in params:
+        names = item.split("-")
+        if len(names) <= level:
+            unknown.append(item)
+            continue
+        target = section
+        for name in names[level:-1]:
+            attr = section_index(type(target)).get(name.upper())
+            if attr is None:
+                target = None
+                break
+            target = getattr(target, attr)
+        if target is None:
+            unknown.append(item)
+            continue
+        attr = section_index(type(target)).get(names[-1].upper())
+        if attr is not None:
+            if _keyword_of(target, attr) == True:
+                getattr(target, attr).section = params[item]
+            elif _switch(params[item]) is not None:
+                # a subsection without section keyword, like "DFT-LS_SCF": "TRUE", is switched on or off
+                getattr(target, attr).status = _switch(params[item])
+            else:
+                unknown.append(item)
+        elif hasattr(target, "params"):
+            target.params[names[-1]] = params[item]
+        else:
+            unknown.append(item)
+    if len(unknown) > 0:
+        print("=============================================================================\n")
+        print("                              WARNING \n")
+        print("------------------------------------------------------------------------------\n")
+        print("the following parameters match no section of %s and are ignored:\n" % type(section).__name__)
+        for item in unknown:
+            print("%s\n" % item)
+    return unknown
+
+def _switch(value):
+    """
+    :return True or False for the values like TRUE, .FALSE., T, or None for the others
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        if value.strip(".").upper() in ["TRUE", "T", "YES", "ON"]:
+            return True
+        if value.strip(".").upper() in ["FALSE", "F", "NO", "OFF"]:
+            return False
+    return None
+
+def _keyword_of(obj, attr):
+    """
+    :return whether the subsection attr of obj has a section keyword
+    """
+    descriptor = getattr(type(obj), attr, None)
+    cls = descriptor.get_class() if isinstance(descriptor, lazy_section) else type(getattr(obj, attr))
+    if cls not in _has_keyword:
+        _has_keyword[cls] = hasattr(cls(), "section")
+    return _has_keyword[cls]
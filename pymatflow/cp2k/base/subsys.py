@@ -7,6 +7,7 @@ import shutil
 import pymatflow.base as base
 
 from pymatflow.base.xyz import base_xyz
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 """
 Usage:
@@ -40,11 +41,7 @@ class cp2k_subsys_cell:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_subsys_colvar:
@@ -142,6 +139,20 @@ class cp2k_subsys:
     """
 
     """
+    cell = lazy_section("cp2k_subsys_cell", "CELL")
+    colvar = lazy_section("cp2k_subsys_colvar", "COLVAR")
+    coord = lazy_section("cp2k_subsys_coord", "COORD")
+    core_coord = lazy_section("cp2k_subsys_core_coord", "CORE_COORD")
+    core_velocity = lazy_section("cp2k_subsys_core_velocity", "CORE_VELOCITY")
+    kind = lazy_section("cp2k_subsys_kind", "KIND")
+    multipoles = lazy_section("cp2k_subsys_multipoles", "MULTIPOLES")
+    printout = lazy_section("cp2k_subsys_print", "PRINT")
+    rng_init = lazy_section("cp2k_subsys_rng_init", "RNG_INIT")
+    shell_coord = lazy_section("cp2k_subsys_shell_coord", "SHELL_COORD")
+    shell_velocity = lazy_section("cp2k_subsys_shell_velocity", "SHELL_VELOCITY")
+    topology = lazy_section("cp2k_subsys_topology", "TOPOLOGY")
+    velocity = lazy_section("cp2k_subsys_velocity", "VELOCITY")
+
     def __init__(self):
         #super().__init__()
         self.xyz = base_xyz()
@@ -150,32 +161,6 @@ class cp2k_subsys:
                 }
         self.status = False
 
-        self.cell = cp2k_subsys_cell()
-
-        self.colvar = cp2k_subsys_colvar()
-
-        self.coord = cp2k_subsys_coord()
-
-        self.core_coord = cp2k_subsys_core_coord()
-
-        self.core_velocity = cp2k_subsys_core_velocity()
-
-        self.kind = cp2k_subsys_kind()
-
-        self.multipoles = cp2k_subsys_multipoles()
-
-        self.printout = cp2k_subsys_print()
-
-        self.rng_init = cp2k_subsys_rng_init()
-
-        self.shell_coord = cp2k_subsys_shell_coord()
-
-        self.shell_velocity = cp2k_subsys_shell_velocity()
-
-        self.topology = cp2k_subsys_topology()
-
-        self.velocity = cp2k_subsys_velocity()
-
         # basic_setting
         self.kind.status = True
         self.cell.status = True
@@ -186,13 +171,13 @@ class cp2k_subsys:
         fout: a file stream for writing
         """
         fout.write("\t&SUBSYS\n")
-        if self.kind.status == True:
+        if section_active(self, "kind"):
             self.kind.to_input(fout, self.xyz)
-        if self.cell.status == True:
+        if section_active(self, "cell"):
             self.cell.to_input(fout, self.xyz)
-        if self.coord.status == True:
+        if section_active(self, "coord"):
             self.coord.to_input(fout, self.xyz)
-        if self.topology.status == True:
+        if section_active(self, "topology"):
             self.topology.to_input(fout, self.xyz)
         fout.write("\t&END SUBSYS\n")
 
@@ -200,10 +185,4 @@ class cp2k_subsys:
         """
             Note: parameters for sub section(like md), are handled over to sub section controllers.
         """
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "CELL":
-                self.cell.set_params({item: params[item]})
-            else:
-                pass
\ No newline at end of file
+        route_params(self, params, level=1)
\ No newline at end of file
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -32,11 +33,7 @@ class cp2k_swarm_global_opt_history:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_swarm_global_opt_minima_crawling_minima_trajectory_each:
@@ -60,22 +57,19 @@ class cp2k_swarm_global_opt_minima_crawling_minima_trajectory_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_swarm_global_opt_minima_crawling_minima_trajectory:
     """
     """
+    each = lazy_section("cp2k_swarm_global_opt_minima_crawling_minima_trajectory_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_swarm_global_opt_minima_crawling_minima_trajectory_each()
         # basic setting
 
     def to_input(self, fout):
@@ -84,31 +78,26 @@ class cp2k_swarm_global_opt_minima_crawling_minima_trajectory:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END MINIMA_TRAJECTORY\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_swarm_global_opt_minima_crawling:
     """
     """
+    minima_trajectory = lazy_section("cp2k_swarm_global_opt_minima_crawling_minima_trajectory", "MINIMA_TRAJECTORY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.minima_trajectory = cp2k_swarm_global_opt_minima_crawling_minima_trajectory()
         # basic setting
 
     def to_input(self, fout):
@@ -117,20 +106,14 @@ class cp2k_swarm_global_opt_minima_crawling:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.minima_trajectory.status == True:
+        if section_active(self, "minima_trajectory"):
             self.minima_trajectory.to_input(fout)
         fout.write("\t\t&END MINIMA_CRAWLING\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "MINIMA_TRAJECTORY":
-                slef.minima_trajectory.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_swarm_global_opt_minima_hopping:
@@ -154,11 +137,7 @@ class cp2k_swarm_global_opt_minima_hopping:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_swarm_global_opt_progress_trajectory_each:
@@ -182,22 +161,19 @@ class cp2k_swarm_global_opt_progress_trajectory_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_swarm_global_opt_progress_trajectory:
     """
     """
+    each = lazy_section("cp2k_swarm_global_opt_progress_trajectory_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_swarm_global_opt_progress_trajectory_each()
         # basic setting
 
     def to_input(self, fout):
@@ -206,34 +182,29 @@ class cp2k_swarm_global_opt_progress_trajectory:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PROGRESS_TRAJECTORY\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_swarm_global_opt:
     """
     """
+    history = lazy_section("cp2k_swarm_global_opt_history", "HISTORY")
+    minima_crawling = lazy_section("cp2k_swarm_global_opt_minima_crawling", "MINIMA_CRAWLING")
+    minima_hopping = lazy_section("cp2k_swarm_global_opt_minima_hopping", "MINIMA_HOPPING")
+    progress_trajectory = lazy_section("cp2k_swarm_global_opt_progress_trajectory", "PROGRESS_TRAJECTORY")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.history = cp2k_swarm_global_opt_history()
-        self.minima_crawling = cp2k_swarm_global_opt_minima_crawling()
-        self.minima_hopping = cp2k_swarm_global_opt_minima_hopping()
-        self.progress_trajectory = cp2k_swarm_global_opt_progress_trajectory()
         # basic setting
 
     def to_input(self, fout):
@@ -242,32 +213,20 @@ class cp2k_swarm_global_opt:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.history.status == True:
+        if section_active(self, "history"):
             self.history.to_input(fout)
-        if self.minima_crawling.status == True:
+        if section_active(self, "minima_crawling"):
             self.minima_crawling.to_input(fout)
-        if self.minima_hopping.status == True:
+        if section_active(self, "minima_hopping"):
             self.minima_hopping.to_input(fout)
-        if self.progress_trajectory.status == True:
+        if section_active(self, "progress_trajectory"):
             self.progress_trajectory.to_input(fout)
         fout.write("\t&END GLOBAL_OPT\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "HISTORY":
-                self.history.set_params({item: params[item]})
-            elif item.split("-")[1] == "MINIMA_CRAWLING":
-                self.minima_crawling.set_params({item: params[item]})
-            elif item.split("-")[1] == "MINIMA_HOPPING":
-                self.minima_hopping.set_params({item: params[item]})
-            elif item.split("-")[1] == "PROGRESS_TRAJECTORY":
-                self.progress_trajectory.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_swarm_print_communication_log_each:
@@ -291,22 +250,19 @@ class cp2k_swarm_print_communication_log_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_swarm_print_communication_log:
     """
     """
+    each = lazy_section("cp2k_swarm_print_communication_log_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_swarm_print_communication_log_each()
         # basic setting
 
     def to_input(self, fout):
@@ -315,20 +271,14 @@ class cp2k_swarm_print_communication_log:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END COMMUNICATION_LOG\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_swarm_print_master_run_info_each:
@@ -352,22 +302,19 @@ class cp2k_swarm_print_master_run_info_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_swarm_print_master_run_info:
     """
     """
+    each = lazy_section("cp2k_swarm_print_master_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_swarm_print_master_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -376,20 +323,14 @@ class cp2k_swarm_print_master_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END MASTER_RUN_INFO\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_swarm_print_worker_run_info_each:
@@ -413,22 +354,19 @@ class cp2k_swarm_print_worker_run_info_each:
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_swarm_print_worker_run_info:
     """
     """
+    each = lazy_section("cp2k_swarm_print_worker_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_swarm_print_worker_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -437,33 +375,28 @@ class cp2k_swarm_print_worker_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END WORKER_RUN_INFO\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_swarm_print:
     """
     """
+    communication_log = lazy_section("cp2k_swarm_print_communication_log", "COMMUNICATION_LOG")
+    master_run_info = lazy_section("cp2k_swarm_print_master_run_info", "MASTER_RUN_INFO")
+    worker_run_info = lazy_section("cp2k_swarm_print_worker_run_info", "WORKER_RUN_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.communication_log = cp2k_swarm_print_communication_log()
-        self.master_run_info = cp2k_swarm_print_master_run_info()
-        self.worker_run_info = cp2k_swarm_print_worker_run_info()
         # basic setting
 
     def to_input(self, fout):
@@ -472,41 +405,32 @@ class cp2k_swarm_print:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.communication_log.status == True:
+        if section_active(self, "communication_log"):
             self.communication_log.to_input(fout)
-        if self.master_run_info.status == True:
+        if section_active(self, "master_run_info"):
             self.master_run_info.to_input(fout)
-        if self.worker_run_info.status == True:
+        if section_active(self, "worker_run_info"):
             self.worker_run_info.to_input(fout)
         fout.write("\t&END PRINT\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "COMMUNICATION_LOG":
-                slef.communication_log.set_params({item: params[item]})
-            elif item.split("-")[1] == "MASTER_RUN_INFO":
-                self.master_run_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "WORKER_RUN_INFO":
-                self.worker_run_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 
 class cp2k_swarm:
     """
     """
+    global_opt = lazy_section("cp2k_swarm_global_opt", "GLOBAL_OPT")
+    printout = lazy_section("cp2k_swarm_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.global_opt = cp2k_swarm_global_opt()
-        self.printout = cp2k_swarm_print()
         # basic setting
 
     def to_input(self, fout):
@@ -515,23 +439,15 @@ class cp2k_swarm:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.global_opt.status == True:
+        if section_active(self, "global_opt"):
             self.global_opt.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("&END SWARM\n")
         fout.write("\n")
 
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "GLBOAL_OPT":
-                self.global_opt.set_params({item: params[item]})
-            elif item.split("-")[0] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
 
 
@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 
 """
@@ -33,11 +34,7 @@ class cp2k_test_cp_dbcsr:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_test_cp_fm_gemm:
@@ -60,11 +57,7 @@ class cp2k_test_cp_fm_gemm:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 class cp2k_test_eigensolver:
     """
@@ -86,11 +79,7 @@ class cp2k_test_eigensolver:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 class cp2k_test_eri_mme_test_eri_mme_cutoff_calib:
     """
@@ -112,11 +101,7 @@ class cp2k_test_eri_mme_test_eri_mme_cutoff_calib:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 class cp2k_test_eri_mme_test_eri_mme_eri_mme_info_each:
     """
@@ -138,22 +123,19 @@ class cp2k_test_eri_mme_test_eri_mme_eri_mme_info_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 
 class cp2k_test_eri_mme_test_eri_mme_eri_mme_info:
     """
     """
+    each = lazy_section("cp2k_test_eri_mme_test_eri_mme_eri_mme_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_test_eri_mme_test_eri_mme_eri_mme_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -162,31 +144,26 @@ class cp2k_test_eri_mme_test_eri_mme_eri_mme_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END ERI_MME_INFO\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_test_eri_mme_test_eri_mme:
     """
     """
+    cutoff_calib = lazy_section("cp2k_test_eri_mme_test_eri_mme_cutoff_calib", "CUTOFF_CALIB")
+    eri_mme_info = lazy_section("cp2k_test_eri_mme_test_eri_mme_eri_mme_info", "ERI_MME_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cutoff_calib = cp2k_test_eri_mme_test_eri_mme_cutoff_calib()
-        self.eri_mme_info = cp2k_test_eri_mme_test_eri_mme_eri_mme_info()
         # basic setting
 
     def to_input(self, fout):
@@ -195,34 +172,27 @@ class cp2k_test_eri_mme_test_eri_mme:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.cutoff_calib.status == True:
+        if section_active(self, "cutoff_calib"):
             self.cutoff_calib.to_input(fout)
-        if self.eri_mme_info.status == True:
+        if section_active(self, "eri_mme_info"):
             self.eri_mme_info.to_input(fout)
         fout.write("\t\t&END ERI_MME\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "CUTOFF_CALIB":
-                self.cutoff_calib.set_params({item: params[item]})
-            elif item.split("-")[2] == "ERI_MME_INFO":
-                self.eri_mme_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_test_eri_mme_test:
     """
     """
+    eri_mme = lazy_section("cp2k_test_eri_mme_test_eri_mme", "ERI_MME")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.eri_mme = cp2k_test_eri_mme_test_eri_mme()
         # basic setting
 
     def to_input(self, fout):
@@ -231,19 +201,13 @@ class cp2k_test_eri_mme_test:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.eri_mme.status == True:
+        if section_active(self, "eri_mme"):
             self.eri_mme.to_input(fout)
         fout.write("\t&END ERI_MME_TESTT\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "ERI_MME":
-                self.eri_mme.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_test_grid_information_each:
@@ -266,22 +230,19 @@ class cp2k_test_grid_information_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_test_grid_information:
     """
     """
+    each = lazy_section("cp2k_test_grid_information_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
         
-        self.each = cp2k_test_grid_information_each()
         # basic setting
 
     def to_input(self, fout):
@@ -290,19 +251,13 @@ class cp2k_test_grid_information:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t&END GRID_INFORMATION\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_test_program_run_info_each:
@@ -325,22 +280,19 @@ class cp2k_test_program_run_info_each:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_test_program_run_info:
     """
     """
+    each = lazy_section("cp2k_test_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_test_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -349,19 +301,13 @@ class cp2k_test_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fotu)
         fout.write("\t&END PROGRAM_RUN_INFO\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 class cp2k_test_pw_transfer:
     """
@@ -383,11 +329,7 @@ class cp2k_test_pw_transfer:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_test_rs_pw_transfer_rs_grid:
@@ -410,22 +352,19 @@ class cp2k_test_rs_pw_transfer_rs_grid:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_test_rs_pw_transfer:
     """
     """
+    rs_grid = lazy_section("cp2k_test_rs_pw_transfer_rs_grid", "RS_GRID")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.rs_grid = cp2k_test_rs_pw_transfer_rs_grid()
         # basic setting
 
     def to_input(self, fout):
@@ -434,19 +373,13 @@ class cp2k_test_rs_pw_transfer:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.rs_grid.status == True:
+        if section_active(self, "rs_grid"):
             self.rs_grid.to_input(fout)
         fout.write("\t&END RS_PW_TRANSFER\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "RS_GRID":
-                self.rs_grid.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_test_shg_integrals_test_basis:
@@ -469,22 +402,19 @@ class cp2k_test_shg_integrals_test_basis:
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_test_shg_integrals_test:
     """
     """
+    basis = lazy_section("cp2k_test_shg_integrals_test_basis", "BASIS")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.basis = cp2k_test_shg_integrals_test_basis()
         # basic setting
 
     def to_input(self, fout):
@@ -493,39 +423,34 @@ class cp2k_test_shg_integrals_test:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.basis.status == True:
+        if section_active(self, "basis"):
             self.basis.to_input(fout)
         fout.write("\t&END SHG_INTEGRALS_TEST\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "BASIS":
-                self.basis.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 
 class cp2k_test:
     """
     """
+    cp_dbcsr = lazy_section("cp2k_test_cp_dbcsr", "CP_DBCSR")
+    cp_fm_gemm = lazy_section("cp2k_test_cp_fm_gemm", "CP_FM_GEMM")
+    eigensolver = lazy_section("cp2k_test_eigensolver", "EIGENSOLVER")
+    eri_mme_test = lazy_section("cp2k_test_eri_mme_test", "ERI_MME_TEST")
+    grid_information = lazy_section("cp2k_test_grid_information", "GRID_INFORMATION")
+    program_run_info = lazy_section("cp2k_test_program_run_info", "PROGRAM_RUN_INFO")
+    pw_transfer = lazy_section("cp2k_test_pw_transfer", "PW_TRANSFER")
+    rs_pw_transfer = lazy_section("cp2k_test_rs_pw_transfer", "RS_PW_TRANSFER")
+    shg_integrals_test = lazy_section("cp2k_test_shg_integrals_test", "SHG_INTEGRALS_TEST")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.cp_dbcsr = cp2k_test_cp_dbcsr()
-        self.cp_fm_gemm = cp2k_test_cp_fm_gemm()
-        self.eigensolver = cp2k_test_eigensolver()
-        self.eri_mme_test = cp2k_test_eri_mme_test()
-        self.grid_information = cp2k_test_grid_information()
-        self.program_run_info = cp2k_test_program_run_info()
-        self.pw_transfer = cp2k_test_pw_transfer()
-        self.rs_pw_transfer = cp2k_test_rs_pw_transfer()
-        self.shg_integrals_test = cp2k_test_shg_integrals_test()
         # basic setting
 
     def to_input(self, fout):
@@ -534,50 +459,28 @@ class cp2k_test:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.cp_dbcsr.status == True:
+        if section_active(self, "cp_dbcsr"):
             slef.cp_dbcsr.to_input(fout)
-        if self.cp_fm_gemm.status == True:
+        if section_active(self, "cp_fm_gemm"):
             self.cp_fm_gemm.to_input(fout)
-        if self.eigensolver.status == True:
+        if section_active(self, "eigensolver"):
             self.eigensolver.to_input(fout)
-        if self.eri_mme_test.status == True:
+        if section_active(self, "eri_mme_test"):
             self.eri_mme_test.to_input(fout)
-        if self.grid_information.status == True:
+        if section_active(self, "grid_information"):
             self.grid_information.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.pw_transfer.status == True:
+        if section_active(self, "pw_transfer"):
             self.pw_transfer.to_input(fout)
-        if self.rs_pw_transfer.status == True:
+        if section_active(self, "rs_pw_transfer"):
             self.rs_pw_transfer.to_input(fout)
-        if self.shg_integrals_test.status == True:
+        if section_active(self, "shg_integrals_test"):
             self.shg_integrals_test.to_input(fout)
         fout.write("&END TEST\n")
         fout.write("\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "CP_DBCSR":
-                self.cp_dbcsr.set_params({item: params[item]})
-            elif item.split("-")[0] == "CP_FM_GEMM":
-                self.cp_fm_gemm.set_params({item: params[item]})
-            elif item.split("-")[0] == "EIGENSOVLER":
-                self.eigensolver.set_params({item: params[item]})
-            elif item.split("-")[0] == "ERI_MME_TEST":
-                self.eri_mme_test.set_params({item: parmas[item]})
-            elif item.split("-")[0] == "GRID_INFORMATION":
-                self.grid_information.set_params({item: parmas[item]})
-            elif item.split("-")[0] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[0] == "PW_TRANSFER":
-                self.pw_transfer.set_params({item: params[item]})
-            elif item.split("-")[0] == "RS_PW_TRANSFER":
-                self.rs_pw_transfer.set_params({item: parmas[item]})
-            elif item.split("-")[0] == "SHG_INTEGRALS_TEST":
-                self.shg_integrals_test.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
 
 
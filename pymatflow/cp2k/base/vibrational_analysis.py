@@ -5,6 +5,7 @@ import numpy as np
 import sys
 import os
 import shutil
+from pymatflow.cp2k.base.section import lazy_section, section_active, route_params
 
 """
 Usage:
@@ -27,11 +28,7 @@ class cp2k_vibrational_analysis_mode_selective_involved_atoms:
         fout.write("\t\t&END INVOLVED_ATOMS\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_vibrational_analysis_mode_selective_print_ms_restart_each:
@@ -51,82 +48,67 @@ class cp2k_vibrational_analysis_mode_selective_print_ms_restart_each:
         fout.write("\t\t\t\t&END EACH\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 5:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=4)
 
 class cp2k_vibrational_analysis_mode_selective_print_ms_restart:
     """
     """
+    each = lazy_section("cp2k_vibrational_analysis_mode_selective_print_ms_restart_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_vibrational_analysis_mode_selective_print_ms_restart_each()
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t\t&MS_RESTART\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t\t&END MS_RESTART\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[3] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_vibrational_analysis_mode_selective_print:
     """
     """
+    ms_restart = lazy_section("cp2k_vibrational_analysis_mode_selective_print_ms_restart", "MS_RESTART")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.ms_restart = cp2k_vibrational_analysis_mode_selective_print_ms_restart()
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t\t&PRINT\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.ms_restart.status == True:
+        if section_active(self, "ms_restart"):
             self.ms_restart.to_input(fout)
         fout.write("\t\t&END PRINT\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "MS_RESTART":
-                self.ms_restart.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_vibrational_analysis_mode_selective:
     """
     """
+    involved_atoms = lazy_section("cp2k_vibrational_analysis_mode_selective_involved_atoms", "INVOLVED_ATOMS")
+    printout = lazy_section("cp2k_vibrational_analysis_mode_selective_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.involved_atoms = cp2k_vibrational_analysis_mode_selective_involved_atoms()
-        self.printout = cp2k_vibrational_analysis_mode_selective_print()
         # basic setting
 
     def to_input(self, fout):
@@ -135,22 +117,14 @@ class cp2k_vibrational_analysis_mode_selective:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.involved_atoms.status == True:
+        if section_active(self, "involved_atoms"):
             self.involved_atoms.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("\t&END MODE_SELECTIVE\n")
 
     def set_params(self, params):
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "INVOLVED_ATOMS":
-                self.involved_atoms.set_params({item: params[item]})
-            elif item.split("-")[1] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 
 class cp2k_vibrational_analysis_print_banner_each:
@@ -173,22 +147,19 @@ class cp2k_vibrational_analysis_print_banner_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_vibrational_analysis_print_banner:
     """
     """
+    each = lazy_section("cp2k_vibrational_analysis_print_banner_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_vibrational_analysis_print_banner_each()
         # basic setting
 
     def to_input(self, fout):
@@ -197,7 +168,7 @@ class cp2k_vibrational_analysis_print_banner:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END BANNER\n")
         fout.write("\n")
@@ -205,13 +176,7 @@ class cp2k_vibrational_analysis_print_banner:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_vibrational_analysis_print_cartesian_eigs_each:
@@ -234,22 +199,19 @@ class cp2k_vibrational_analysis_print_cartesian_eigs_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_vibrational_analysis_print_cartesian_eigs:
     """
     """
+    each = lazy_section("cp2k_vibrational_analysis_print_cartesian_eigs_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_vibrational_analysis_print_cartesian_eigs_each()
         # basic setting
 
     def to_input(self, fout):
@@ -258,7 +220,7 @@ class cp2k_vibrational_analysis_print_cartesian_eigs:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END CARTESIAN_EIGS\n")
         fout.write("\n")
@@ -266,13 +228,7 @@ class cp2k_vibrational_analysis_print_cartesian_eigs:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_vibrational_analysis_print_hessian_each:
@@ -295,22 +251,19 @@ class cp2k_vibrational_analysis_print_hessian_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_vibrational_analysis_print_hessian:
     """
     """
+    each = lazy_section("cp2k_vibrational_analysis_print_hessian_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_vibrational_analysis_print_hessian_each()
         # basic setting
 
     def to_input(self, fout):
@@ -319,7 +272,7 @@ class cp2k_vibrational_analysis_print_hessian:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END HESSIAN\n")
         fout.write("\n")
@@ -327,13 +280,7 @@ class cp2k_vibrational_analysis_print_hessian:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_vibrational_analysis_print_molden_vib_each:
     """
@@ -355,22 +302,19 @@ class cp2k_vibrational_analysis_print_molden_vib_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_vibrational_analysis_print_molden_vib:
     """
     """
+    each = lazy_section("cp2k_vibrational_analysis_print_molden_vib_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_vibrational_analysis_print_molden_vib_each()
         # basic setting
 
     def to_input(self, fout):
@@ -379,7 +323,7 @@ class cp2k_vibrational_analysis_print_molden_vib:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END MOLDEN_VIB\n")
         fout.write("\n")
@@ -387,13 +331,7 @@ class cp2k_vibrational_analysis_print_molden_vib:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_vibrational_analysis_print_program_run_info_each:
     """
@@ -415,22 +353,19 @@ class cp2k_vibrational_analysis_print_program_run_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_vibrational_analysis_print_program_run_info:
     """
     """
+    each = lazy_section("cp2k_vibrational_analysis_print_program_run_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_vibrational_analysis_print_program_run_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -439,7 +374,7 @@ class cp2k_vibrational_analysis_print_program_run_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END PROGRAM_RUN_INFO\n")
         fout.write("\n")
@@ -447,13 +382,7 @@ class cp2k_vibrational_analysis_print_program_run_info:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 class cp2k_vibrational_analysis_print_rotational_info_each:
     """
@@ -475,22 +404,19 @@ class cp2k_vibrational_analysis_print_rotational_info_each:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 4:
-                self.params[item.split("-")[-1]] = params[item]
-            else:
-                pass
+        route_params(self, params, level=3)
 
 
 class cp2k_vibrational_analysis_print_rotational_info:
     """
     """
+    each = lazy_section("cp2k_vibrational_analysis_print_rotational_info_each", "EACH")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.each = cp2k_vibrational_analysis_print_rotational_info_each()
         # basic setting
 
     def to_input(self, fout):
@@ -499,7 +425,7 @@ class cp2k_vibrational_analysis_print_rotational_info:
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t\t%s %s\n" % (item, self.params[item]))
-        if self.each.status == True:
+        if section_active(self, "each"):
             self.each.to_input(fout)
         fout.write("\t\t&END ROTATIONAL_INFO\n")
         fout.write("\n")
@@ -507,47 +433,41 @@ class cp2k_vibrational_analysis_print_rotational_info:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 3:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[2] == "EACH":
-                self.each.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=2)
 
 
 class cp2k_vibrational_analysis_print:
     """
     """
+    banner = lazy_section("cp2k_vibrational_analysis_print_banner", "BANNER")
+    cartesian_eigs = lazy_section("cp2k_vibrational_analysis_print_cartesian_eigs", "CARTESIAN_EIGS")
+    hessian = lazy_section("cp2k_vibrational_analysis_print_hessian", "HESSIAN")
+    molden_vib = lazy_section("cp2k_vibrational_analysis_print_molden_vib", "MOLDEN_VIB")
+    program_run_info = lazy_section("cp2k_vibrational_analysis_print_program_run_info", "PROGRAM_RUN_INFO")
+    rotational_info = lazy_section("cp2k_vibrational_analysis_print_rotational_info", "ROTATIONAL_INFO")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.banner = cp2k_vibrational_analysis_print_banner()
-        self.cartesian_eigs = cp2k_vibrational_analysis_print_cartesian_eigs()
-        self.hessian = cp2k_vibrational_analysis_print_hessian()
-        self.molden_vib = cp2k_vibrational_analysis_print_molden_vib()
-        self.program_run_info = cp2k_vibrational_analysis_print_program_run_info()
-        self.rotational_info = cp2k_vibrational_analysis_print_rotational_info()
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("\t&PRINT\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t\t%s %s\n" % (item, self.params[item]))
-        if self.banner.status == True:
+        if section_active(self, "banner"):
             self.banner.to_input(fout)
-        if self.cartesian_eigs.status == True:
+        if section_active(self, "cartesian_eigs"):
             self.cartesian_eigs.to_input(fout)
-        if self.hessian.status == True:
+        if section_active(self, "hessian"):
             self.hessian.to_input(fout)
-        if self.molden_vib.status == True:
+        if section_active(self, "molden_vib"):
             self.molden_vib.to_input(fout)
-        if self.program_run_info.status == True:
+        if section_active(self, "program_run_info"):
             self.program_run_info.to_input(fout)
-        if self.rotational_info.status == True:
+        if section_active(self, "rotational_info"):
             self.rotational_info.to_input(fout)
         fout.write("\t&END PRINT\n")
         fout.write("\n")
@@ -555,23 +475,7 @@ class cp2k_vibrational_analysis_print:
     def set_params(self, params):
         """
         """
-        for item in params:
-            if len(item.split("-")) == 2:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[1] == "BANNER":
-                self.banner.set_params({item: params[item]})
-            elif item.split("-")[1] == "CARTESIAN_EIGS":
-                self.cartesian_eigs.set_params({item: params[item]})
-            elif item.split("-")[1] == "HESSIAN":
-                self.hessian.set_params({item: params[item]})
-            elif item.split("-")[1] == "MOLDEN_VIB":
-                self.molden_vib.set_params({item: params[item]})
-            elif item.split("-")[1] == "PROGRAM_RUN_INFO":
-                self.program_run_info.set_params({item: params[item]})
-            elif item.split("-")[1] == "ROTATIONAL_INFO":
-                self.rotational_info.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params, level=1)
 
 class cp2k_vibrational_analysis:
     """
@@ -591,13 +495,14 @@ class cp2k_vibrational_analysis:
         we have to use OT in SCF, and if we use PERIODIC=F, we have to set 
         PERIODIC=NONE in CELL.
     """
+    mode_selective = lazy_section("cp2k_vibrational_analysis_mode_selective", "MODE_SELECTIVE")
+    printout = lazy_section("cp2k_vibrational_analysis_print", "PRINT")
+
     def __init__(self):
         self.params = {
                 }
         self.status = False
 
-        self.mode_selective = cp2k_vibrational_analysis_mode_selective()
-        self.printout = cp2k_vibrational_analysis_print()
         # basic setting
         self.params["INTENSITIES"] = True
         self.params["DX"] = 1.0e-2 # default value in Bohr
@@ -605,16 +510,15 @@ class cp2k_vibrational_analysis:
         self.params["TC_TEMPERATURE"] = 2.7315e2 # K
         self.params["THERMOCHEMISTRY"] = False # Calculation of the thermochemical data. Valid for molecules in the gas phase.
 
-
     def to_input(self, fout):
         # fout: a file stream for writing
         fout.write("&VIBRATIONAL_ANALYSIS\n")
         for item in self.params:
             if self.params[item] is not None:
                 fout.write("\t%s %s\n" % (item, self.params[item]))
-        if self.mode_selective.status == True:
+        if section_active(self, "mode_selective"):
             self.mode_selective.to_input(fout)
-        if self.printout.status == True:
+        if section_active(self, "printout"):
             self.printout.to_input(fout)
         fout.write("&END VIBRATIONAL_ANALYSIS\n")
         fout.write("\n")
@@ -625,12 +529,4 @@ class cp2k_vibrational_analysis:
         parameters for sub section(like), are handled over 
         to sub section controllers.
         """
-        for item in params:
-            if len(item.split("-")) == 1:
-                self.params[item.split("-")[-1]] = params[item]
-            elif item.split("-")[0] == "MODE_SELECTIVE":
-                self.mode_selection.set_params({item: params[item]})
-            elif item.split("-")[0] == "PRINT":
-                self.printout.set_params({item: params[item]})
-            else:
-                pass
+        route_params(self, params)
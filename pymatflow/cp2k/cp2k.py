@@ -21,6 +21,7 @@ from pymatflow.cp2k.base.optimize_input import cp2k_optimize_input
 from pymatflow.cp2k.base.swarm import cp2k_swarm
 from pymatflow.cp2k.base.test import cp2k_test
 from pymatflow.cp2k.base.vibrational_analysis import cp2k_vibrational_analysis
+from pymatflow.cp2k.base.section import lazy_section, section_active, section_touched, route_params
 
 
 """
@@ -41,24 +42,31 @@ class cp2k:
         class like cp2k will providing more convinence for managing codes.
         And most importantly the code will run not very computationally
         consuming. So I consist on this.
+    Note:
+        the sections and all their subsections are lazy_section, which is built
+        only when it is first accessed(set_params, setting status, etc.), and
+        to_input skips the sections never accessed without building them. so a
+        static_run only holds GLOBAL and the part of FORCE_EVAL in use, see
+        utils/benchmark-cp2k-input.py.
     """
+    atom = lazy_section("cp2k_atom", "ATOM")
+    debug = lazy_section("cp2k_debug", "DEBUG")
+    ext_restart = lazy_section("cp2k_ext_restart", "EXT_RESTART")
+    farming = lazy_section("cp2k_farming", "FARMING")
+    force_eval = lazy_section("cp2k_force_eval", "FORCE_EVAL")
+    glob = lazy_section("cp2k_glob", "GLOBAL")
+    motion = lazy_section("cp2k_motion", "MOTION")
+    multipole_force_evals = lazy_section("cp2k_multiple_force_evals", "MULTIPLE_FORCE_EVALS")
+    negf = lazy_section("cp2k_negf", "NEGF")
+    optimize_basis = lazy_section("cp2k_optimize_basis", "OPTIMIZE_BASIS")
+    optimize_input = lazy_section("cp2k_optimize_input", "OPTIMIZE_INPUT")
+    swarm = lazy_section("cp2k_swarm", "SWARM")
+    test = lazy_section("cp2k_test", "TEST")
+    vibrational_analysis = lazy_section("cp2k_vibrational_analysis", "VIBRATIONAL_ANALYSIS")
+
     def __init__(self):
         """
         """
-        self.atom = cp2k_atom()
-        self.debug = cp2k_debug()
-        self.ext_restart = cp2k_ext_restart()
-        self.farming = cp2k_farming()
-        self.force_eval = cp2k_force_eval()
-        self.glob = cp2k_glob()
-        self.motion = cp2k_motion()
-        self.multipole_force_evals = cp2k_multiple_force_evals()
-        self.negf = cp2k_negf()
-        self.optimize_basis = cp2k_optimize_basis()
-        self.optimize_input = cp2k_optimize_input()
-        self.swarm = cp2k_swarm()
-        self.test = cp2k_test()
-        self.vibrational_analysis = cp2k_vibrational_analysis()
 
         self._initialize()
 
@@ -85,36 +93,15 @@ class cp2k:
             input section of cp2k, like "FORCE_EVAL", "ATOM", "MOTION".
 
             currently only FORCE_EVAL, MOTION, ATOM, VIBRATIONAL_ANALYSIS are reliable.
+
+            the items are routed to the sections by route_params, and those naming
+            no section are reported.
+        :return list of the items naming no section
         """
-        for item in params:
-            if item.split("-")[0].upper() == "ATOM":
-                self.atom.set_params({item.replace("ATOM-", ""): params[item]})
-            elif item.split("-")[0].upper() == "DEBUG":
-                self.debug.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "EXT_RESTART":
-                self.ext_restart.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "FARMING":
-                self.farming.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "FORCE_EVAL":
-                self.force_eval.set_params({item.replace("FORCE_EVAL-", ""): params[item]})
-            elif item.split("-")[0].upper() == "GLOBAL":
-                self.glob.set_params({item.replace("GLOBAL-", ""): params[item]})
-            elif item.split("-")[0].upper() == "MOTION":
-                self.motion.set_params({item.replace("MOTION-", ""): params[item]})
-            elif item.split("-")[0].upper() == "MULTIPOLE_FORCE_EVALS":
-                self.multipole_force_evals.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "NEGF":
-                self.negf.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "OPTIMIZE_BASIS":
-                self.optimize_basis.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "OPTIMIZE_INPUT":
-                self.optimize_input.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "SWARM":
-                self.swarm.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "TEST":
-                self.test.set_params({item: params[item]})
-            elif item.split("-")[0].upper() == "VIBRATIONAL_ANALYSIS":
-                self.vibrational_analysis.set_params({item.replace("VIBRATIONAL_ANALYSIS-", ""): params[item]})
+        unknown = route_params(self, params)
+        if section_touched(self, "motion"):
+            self.motion.check_cell_opt()
+        return unknown
 
     def set_pot_basis(self, kind_basis={}, kind_pot={}, basis_set_file="BASIS_MOLOPT", potential_file="GTH_POTENTIALS"):
         """
@@ -6,19 +6,62 @@ import datetime
 import subprocess
 import matplotlib.pyplot as plt
 
+from pymatflow.base.incremental import tail_state, read_appended_lines
+from pymatflow.base.cache import post_cache
+
 class md_post:
     """
     """
-    def __init__(self, output, run_type="MD"):
+    def __init__(self, output, run_type="MD", incremental=False, cache=False):
+        """
+        output:
+            the output file of md run.
+        incremental:
+            if True, the parsing state is saved to a sidecar file beside the
+            output, and the next md_post on the same output only parses the
+            newly appended part. useful to monitor a running md.
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
+            cache is not used in incremental mode.
+        """
         self.file = output
         self.run_type = run_type
         self.program_ended = None # whether calculation is finished
         self.md_params = {}
         self.run_info = {}
-
-        with open(self.file, 'r') as fout:
-            self.lines = fout.readlines()
-        self.get_info()
+        self.last_lines = [] # lines before self.lines, only used in incremental mode
+
+        if incremental == False:
+            if cache == True:
+                sidecar = post_cache(self.file, name="md")
+                if sidecar.load():
+                    sidecar.restore(self)
+                    return
+            with open(self.file, 'r') as fout:
+                self.lines = fout.readlines()
+            self.get_info()
+            if cache == True:
+                sidecar.dump(self, ["program_ended", "md_params", "run_info"])
+                sidecar.save()
+        else:
+            state = tail_state(self.file, name="md")
+            state.load()
+            self.lines, offsets = read_appended_lines(self.file, state.offset)
+            if len(state.data) > 0:
+                self.md_params = state.data["md_params"]
+                self.run_info = state.get_dict("run_info")
+            # the last several lines are needed to check whether the program ended
+            self.last_lines = state.data.get("last_lines", [])
+            self.get_info()
+            state.offset = offsets[-1]
+            state.data = {
+                "md_params": self.md_params,
+                "last_lines": (self.last_lines + self.lines)[-9:],
+                }
+            # only the steps parsed this time are appended to the series
+            state.extend_dict("run_info", self.run_info)
+            state.save()
 
     def get_info(self, output="md.out"):
         """
@@ -32,7 +75,7 @@ class md_post:
         # has stopped only from the last line. and the solution is to check
         # the last several lines
         self.program_ended = False
-        for line in self.lines[-9:]:
+        for line in (self.last_lines + self.lines)[-9:]:
             if len(line.split()) == 0:
                 continue
             if line.split()[0] == "****" and line.split()[1] == "****" and line.split()[2] == "******" and line.split()[3] == "**" and line.split()[4] == "PROGRAM":
@@ -48,10 +91,10 @@ class md_post:
     def get_md_params_and_run_info(self):
         """
         """
-        self.run_info["scf-steps-converged"] = []
-        self.run_info["total-energies"] = []
-        self.run_info["fermi-energies"] = []
-        self.run_info["temperatures"] = []
+        self.run_info.setdefault("scf-steps-converged", [])
+        self.run_info.setdefault("total-energies", [])
+        self.run_info.setdefault("fermi-energies", [])
+        self.run_info.setdefault("temperatures", [])
 
         for line in self.lines:
             # if it is an empty line continue to next line
@@ -8,6 +8,7 @@ import matplotlib.pyplot as plt
 
 from pymatflow.base.atom import Atom
 from pymatflow.base.xyz import base_xyz
+from pymatflow.base.cache import post_cache
 
 class scf_out:
     """
@@ -20,17 +21,28 @@ class scf_out:
         self.scf_params = {}
         self.run_info = {}
 
-    def get_info(self, file):
+    def get_info(self, file, cache=False):
         """
         get the general information of scf run from scf run output file
         which is now stored in self.lines
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         """
         self.clean()
 
         self.file = file
+        if cache == True:
+            sidecar = post_cache(self.file, name="scf")
+            if sidecar.load():
+                sidecar.restore(self)
+                return
         with open(self.file, 'r') as fout:
             self.lines = fout.readlines()
         self.get_scf_params_and_run_info()
+        if cache == True:
+            sidecar.dump(self, ["scf_params", "run_info"])
+            sidecar.save()
 
     def clean(self):
         self.file = None
@@ -8,6 +8,7 @@ import numpy as np
 
 from pymatflow.remote.server import server_handle
 from pymatflow.cp2k.cp2k import cp2k
+from pymatflow.base.variants import variant_renderer
 
 """
 """
@@ -70,7 +71,7 @@ class static_run(cp2k):
 
         server_handle(auto=auto, directory=directory, jobfilebase="static-scf", server=self.run_params["server"])
 
-    def converge_cutoff(self, emin, emax, step, directory="tmp-cp2k-cutoff", runopt="gen", auto=0):
+    def converge_cutoff(self, emin, emax, step, directory="tmp-cp2k-cutoff", runopt="gen", auto=0, nproc=1):
         """
         Note:
             this function is used to do the converge test for CUTOFF.
@@ -89,6 +90,8 @@ class static_run(cp2k):
             for the test of cutoff, rel_cutoff is set to an fixed value
         :param directory:
             where the converge test happens
+        :param nproc:
+            number of processes writing the inputs
         """
         if runopt == "gen" or runopt == "genrun":
             if os.path.exists(directory):
@@ -97,15 +100,14 @@ class static_run(cp2k):
             shutil.copyfile(self.force_eval.subsys.xyz.file, os.path.join(directory, os.path.basename(self.force_eval.subsys.xyz.file)))
 
             n_test = int((emax - emin) / step)
-            for i in range(n_test + 1):
-                cutoff = int(emin + i * step)
-                inpname = "cutoff-%d.inp" % cutoff
-                self.force_eval.dft.mgrid.params["CUTOFF"] = cutoff
-                #self.force_eval.dft.mgrid.params["REL_CUTOFF"] = rel_cutoff
-
-                with open(os.path.join(directory, inpname), 'w') as fout:
-                    self.glob.to_input(fout)
-                    self.force_eval.to_input(fout)
+            cutoffs = [int(emin + i * step) for i in range(n_test + 1)]
+            # GLOBAL is written once, self.force_eval is not changed
+            renderer = variant_renderer(self, [
+                ("cutoff-%s.inp", [("glob", "to_input"), ("force_eval", "to_input")]),
+                ])
+            variants = [{"force_eval.dft.mgrid.CUTOFF": cutoff} for cutoff in cutoffs]
+            #variants = [{"force_eval.dft.mgrid.CUTOFF": cutoff, "force_eval.dft.mgrid.REL_CUTOFF": rel_cutoff} for cutoff in cutoffs]
+            renderer.write(directory, variants, [str(cutoff) for cutoff in cutoffs], nproc=nproc)
 
             # gen yhbatch running script
             with open(os.path.join(directory, "converge-cutoff.slurm"), 'w') as fout:
@@ -149,7 +151,7 @@ class static_run(cp2k):
             os.chdir("../")
         server_handle(auto=auto, directory=directory, jobfilebase="converge-cutoff", server=self.run_params["server"])
 
-    def converge_rel_cutoff(self, emin, emax, step, directory="tmp-cp2k-rel-cutoff", runopt="gen", auto=0):
+    def converge_rel_cutoff(self, emin, emax, step, directory="tmp-cp2k-rel-cutoff", runopt="gen", auto=0, nproc=1):
         """
         Note:
             this function is used to do the converge test of REL_CUTOFF.
@@ -163,6 +165,8 @@ class static_run(cp2k):
             for the test of rel_cutoff, cutoff is set to an fixed value
         :param directory:
             where the converge test happens
+        :param nproc:
+            number of processes writing the inputs
         """
         if runopt == "gen" or runopt == "genrun":
             if os.path.exists(directory):
@@ -171,15 +175,12 @@ class static_run(cp2k):
             shutil.copyfile(self.force_eval.subsys.xyz.file, os.path.join(directory, os.path.basename(self.force_eval.subsys.xyz.file)))
 
             n_test = int((emax - emin) / step)
-            for i in range(n_test + 1):
-                rel_cutoff = int(emin + i * step)
-                inpname = "rel-cutoff-%d.inp" % rel_cutoff
-                #self.force_eval.dft.mgrid.params["CUTOFF"] = cutoff
-                self.force_eval.dft.mgrid.params["REL_CUTOFF"] = rel_cutoff
-
-                with open(os.path.join(directory, inpname), 'w') as fout:
-                    self.glob.to_input(fout)
-                    self.force_eval.to_input(fout)
+            rel_cutoffs = [int(emin + i * step) for i in range(n_test + 1)]
+            renderer = variant_renderer(self, [
+                ("rel-cutoff-%s.inp", [("glob", "to_input"), ("force_eval", "to_input")]),
+                ])
+            variants = [{"force_eval.dft.mgrid.REL_CUTOFF": rel_cutoff} for rel_cutoff in rel_cutoffs]
+            renderer.write(directory, variants, [str(rel_cutoff) for rel_cutoff in rel_cutoffs], nproc=nproc)
 
             # gen yhbatch running script
             with open(os.path.join(directory, "converge-rel-cutoff.slurm"), 'w') as fout:
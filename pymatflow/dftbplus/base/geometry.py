@@ -1,6 +1,7 @@
 """
     
 """
+import io
 import numpy as np
 import os
 import sys
@@ -12,27 +13,38 @@ class geometry:
     def __init__(self):
         self.xyz = base_xyz()
 
-    def to_string(self):
-        strout = ""
-        strout += "Geometry = {\n"
-        strout += "  TypeNames = { "
+    def to_hsd(self, fout):
+        """
+        :param fout: a file stream for writing
+        """
+        fout.write("Geometry = {\n")
+        fout.write("  TypeNames = { ")
         for element in self.xyz.specie_labels:
-            strout += "\"%s\" " % element
-        strout += "  }\n"
-        strout += "  TypesAndCoordinates [Angstrom] = {\n"
+            fout.write("\"%s\" " % element)
+        fout.write("  }\n")
+        fout.write("  TypesAndCoordinates [Angstrom] = {\n")
         element_order = {}
         i = 1
         for element in self.xyz.specie_labels:
             element_order[element] = i
             i += 1
-        for atom in self.xyz.atoms:
-            strout += "    %d %f %f %f\n" % (element_order[atom.name], atom.x, atom.y, atom.z)
-        strout += "  }\n"
-        strout += "  Periodic = Yes\n"
-        strout += "  LatticeVectors [Angstrom] = {\n"
+        atoms = self.xyz.atoms
+        natom = len(atoms)
+        if natom > 0:
+            # all the lines formatted at once
+            table = np.empty((natom, 4), dtype=object)
+            table[:, 0] = [element_order[name] for name in atoms.symbols.tolist()]
+            table[:, 1:4] = np.asarray(atoms.positions, dtype=float).tolist()
+            fout.write(("    %d %f %f %f\n" * natom) % tuple(table.ravel().tolist()))
+        fout.write("  }\n")
+        fout.write("  Periodic = Yes\n")
+        fout.write("  LatticeVectors [Angstrom] = {\n")
         for i in range(3):
-            strout += "    %f %f %f\n" % (self.xyz.cell[i][0], self.xyz.cell[i][1], self.xyz.cell[i][2])
-        strout += "  }\n"
-        strout += "}\n"
-    
-        return strout
+            fout.write("    %f %f %f\n" % (self.xyz.cell[i][0], self.xyz.cell[i][1], self.xyz.cell[i][2]))
+        fout.write("  }\n")
+        fout.write("}\n")
+
+    def to_string(self):
+        fout = io.StringIO()
+        self.to_hsd(fout)
+        return fout.getvalue()
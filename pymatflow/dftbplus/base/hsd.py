@@ -1,5 +1,35 @@
 """
+hsd blocks of DFTB+ input, writing and parsing
+"""
+import io
+import re
+
+
+"""
+Usage:
+    with open("dftb_in.hsd", "w") as fout:
+        hamiltonian.to_hsd(fout) # hamiltonian is an hsd_block
+    # parse an input and write it back
+    with open("dftb_in.hsd", "r") as fin:
+        blocks = parse_hsd(fin.read())
+    blocks["Hamiltonian"].method["Mixer"].scalar["MixingParameter"] = 0.1
+    with open("dftb_in.hsd", "w") as fout:
+        write_hsd(fout, blocks)
+    # differences of two inputs, list of (path, value1, value2)
+    diff_hsd(parse_hsd(text1), parse_hsd(text2))
 
+Note:
+    to_hsd writes each line to the stream as it goes, so the time is linear in
+    the size of the input and the text is never held as a whole, to_string only
+    collects the output of to_hsd.
+
+    parse_hsd reads the text by one regex scan into tokens, then builds the
+    blocks with a stack: Name = Method { opens a method block, Name = { or
+    Name { a property block, Name = v sets a scalar and Name = v1 v2 .. a list
+    of scalar, and a line of bare values(like coordinates) is a row of the
+    block. a unit like [Angstrom] is kept in the name of the block. values are
+    kept as the strings in the text, so what is parsed is written back as it
+    is, except the order: scalars, lists, rows, methods, properties.
 """
 
 class hsd_block:
@@ -15,41 +45,147 @@ class hsd_block:
 
         self.scalar = {}
         self.list_of_scalar = {}
+        self.rows = [] # lines of bare values, like the coordinates
         self.method = {}
         self.list_of_property = {}
 
-    def to_string(self):
-        
+    def to_hsd(self, fout):
+        """
+        :param fout: a file stream for writing
+        """
         if self.status == False:
-            return ""
+            return
 
-        out = ""
         indent = " " * self.level
-        
-        if self.block_type == "method":
-            out += indent + "%s = %s {\n" % (self.name, self.val if self.val != None else "")
+
+        if self.block_type == "method" and self.val != None:
+            fout.write(indent + "%s = %s {\n" % (self.name, self.val))
         else:
-            out += indent + "%s = {\n" %(self.name)
+            fout.write(indent + "%s = {\n" %(self.name))
 
         for item in self.scalar:
-            out += indent + "%s = %s\n" % (item, self.scalar[item])
+            fout.write(indent + "%s = %s\n" % (item, self.scalar[item]))
         for item in self.list_of_scalar:
+            values = "".join(" %s" % val for val in self.list_of_scalar[item])
             if item == "":
-                out += indent
-                for val in self.list_of_scalar[item]:
-                    out += " %s" % val
-                out += "\n"
+                fout.write(indent + values + "\n")
             else:
-                out += indent + "%s ="
-                for val in self.list_of_scalar[item]:
-                    out += " %s" % val
-                out += "\n"
+                fout.write(indent + "%s =" % item + values + "\n")
+        if len(self.rows) > 0:
+            fout.write("".join(indent + " ".join("%s" % val for val in row) + "\n" for row in self.rows))
         for item in self.method:
-            out += self.method[item].to_string()
+            self.method[item].to_hsd(fout)
         for item in self.list_of_property:
-            out += self.list_of_property[item].to_string()
-        
-        out += indent + "}\n"
+            self.list_of_property[item].to_hsd(fout)
+
+        fout.write(indent + "}\n")
+
+    def to_string(self):
+        fout = io.StringIO()
+        self.to_hsd(fout)
+        return fout.getvalue()
+
+
+_token = re.compile(r'"[^"]*"|\'[^\']*\'|\[[^\]]*\]|[{}=;]|\n|#[^\n]*|[^\s{}=;#"\'\[]+')
+
+def parse_hsd(text):
+    """
+    :param text: content of a hsd file
+    :return dict of the top level hsd_block of the input by their names
+    """
+    root = hsd_block(name="", block_type="property", level=-1)
+    stack = [root]
+    statement = []
+    order = [] # names of the top level blocks as they appear
+    for token in _token.findall(text):
+        if token[0] == "#":
+            continue
+        if token == "{":
+            stack.append(_open_block(stack[-1], statement))
+            if len(stack) == 2:
+                order.append(stack[-1].name)
+            statement = []
+        elif token == "}":
+            _set_statement(stack[-1], statement)
+            statement = []
+            if len(stack) > 1:
+                stack.pop()
+        elif token == "\n" or token == ";":
+            # a statement ending with = continues on the next line
+            if len(statement) > 0 and statement[-1] != "=":
+                _set_statement(stack[-1], statement)
+                statement = []
+        else:
+            statement.append(token)
+    _set_statement(stack[-1], statement)
+    return {name: root.method[name] if name in root.method else root.list_of_property[name] for name in order}
+
+def write_hsd(fout, blocks):
+    """
+    :param blocks: dict of top level hsd_block, like the one returned by parse_hsd
+    """
+    for name in blocks:
+        blocks[name].to_hsd(fout)
 
-        return out
-        
+def flatten(blocks, prefix=""):
+    """
+    :return dict of path of every value to the value, like
+        "Hamiltonian/Mixer/MixingParameter": "0.1", the method of a block is
+        at the path of the block, and the rows at path/#0, path/#1, ...
+    """
+    out = {}
+    for name in blocks:
+        block = blocks[name]
+        path = prefix + name
+        if block.block_type == "method" and block.val != None:
+            out[path] = "%s" % block.val
+        for item in block.scalar:
+            out[path + "/" + item] = "%s" % block.scalar[item]
+        for item in block.list_of_scalar:
+            out[path + "/" + item] = " ".join("%s" % val for val in block.list_of_scalar[item])
+        for i, row in enumerate(block.rows):
+            out[path + "/#%d" % i] = " ".join("%s" % val for val in row)
+        out.update(flatten(block.method, prefix=path + "/"))
+        out.update(flatten(block.list_of_property, prefix=path + "/"))
+    return out
+
+def diff_hsd(blocks1, blocks2):
+    """
+    :return list of (path, value1, value2) of the values differing between the
+        two inputs, value is None where the path is missing
+    """
+    flat1 = flatten(blocks1)
+    flat2 = flatten(blocks2)
+    return [(path, flat1.get(path), flat2.get(path)) for path in sorted(set(flat1) | set(flat2)) if flat1.get(path) != flat2.get(path)]
+
+
+def _open_block(parent, statement):
+    """
+    open the block of statement(Name [unit] = Method or Name [unit] =) in parent
+    """
+    if "=" in statement:
+        i = statement.index("=")
+        name, values = " ".join(statement[:i]), statement[i+1:]
+    else:
+        name, values = " ".join(statement), []
+    if len(values) > 0:
+        block = hsd_block(name=name, block_type="method", val=" ".join(values), level=parent.level + 1)
+        parent.method[name] = block
+    else:
+        block = hsd_block(name=name, block_type="property", level=parent.level + 1)
+        parent.list_of_property[name] = block
+    block.status = True
+    return block
+
+def _set_statement(block, statement):
+    if len(statement) == 0:
+        return
+    if "=" in statement:
+        i = statement.index("=")
+        name, values = " ".join(statement[:i]), statement[i+1:]
+        if len(values) == 1:
+            block.scalar[name] = values[0]
+        else:
+            block.list_of_scalar[name] = values
+    else:
+        block.rows.append(statement)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # _*_ coding: utf-8 _*_
 
+import io
 import os
 import sys
 import shutil
@@ -28,12 +29,18 @@ class dftbplus:
 
         self._initialize()
 
+    def to_hsd(self, fout):
+        """
+        :param fout: a file stream for writing
+        """
+        self.geometry.to_hsd(fout)
+        self.hamiltonian.to_hsd(fout)
+        self.driver.to_hsd(fout)
+
     def to_string(self):
-        out = ""
-        out += self.geometry.to_string()
-        out += self.hamiltonian.to_string()
-        out += self.driver.to_string()
-        return out
+        fout = io.StringIO()
+        self.to_hsd(fout)
+        return fout.getvalue()
 
     def _initialize(self):
         """ initialize the current object, do some default setting
@@ -76,7 +83,7 @@ class dftbplus:
             fout.write("#SBATCH -o %s\n" % self.run_params["stdout"])
             fout.write("#SBATCH -e %s\n" % self.run_params["stderr"])
             fout.write("cat > dftb_in.hsd<<EOF\n")
-            fout.write(self.to_string())
+            self.to_hsd(fout)
             fout.write("EOF\n")
             fout.write("yhrun %s\n" % cmd)
 
@@ -88,7 +95,7 @@ class dftbplus:
         with open(os.path.join(directory, scriptname), 'w') as fout:
             fout.write("#!/bin/bash\n")
             fout.write("cat > dftb_in.hsd<<EOF\n")
-            fout.write(self.to_string())
+            self.to_hsd(fout)
             fout.write("EOF\n")
             fout.write("yhrun -N 1 -n 24 %s\n" % (cmd))
 
@@ -105,7 +112,7 @@ class dftbplus:
             fout.write("\n")
             fout.write("cd $PBS_O_WORKDIR\n")
             fout.write("cat > dftb_in.hsd<<EOF\n")
-            fout.write(self.to_string())
+            self.to_hsd(fout)
             fout.write("EOF\n")
             fout.write("NP=`cat $PBS_NODEFILE | wc -l`\n")
             fout.write("mpirun -np $NP -machinefile $PBS_NODEFILE %s \n" % (cmd))            
@@ -118,7 +125,7 @@ class dftbplus:
             fout.write("#!/bin/bash\n")
             fout.write("\n")
             fout.write("cat > dftb_in.hsd<<EOF\n")
-            fout.write(self.to_string())
+            self.to_hsd(fout)
             fout.write("EOF\n")
             fout.write("%s %s\n" % (mpi, cmd))
 
@@ -145,7 +152,7 @@ class dftbplus:
             fout.write("ndoelist=$(cat $CURDIR/nodelist | uniq | awk \'{print $1}\' | tr \'\\n\' \',\')\n")
 
             fout.write("cat > dftb_in.hsd<<EOF\n")
-            fout.write(self.to_string())
+            self.to_hsd(fout)
             fout.write("EOF\n")
             fout.write("mpirun -np $NP -machinefile $CURDIR/nodelist %s\n" % cmd)
 
@@ -164,7 +171,7 @@ class dftbplus:
             fout.write("cd $LS_SUBCWD\n")
 
             fout.write("cat > dftb_in.hsd<<EOF\n")
-            fout.write(self.to_string())
+            self.to_hsd(fout)
             fout.write("EOF\n")
             fout.write("mpirun -machinefile $LSB_DJOB_HOSTFILE -np $NP %s\n" % cmd)
 
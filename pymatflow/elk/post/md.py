@@ -8,6 +8,7 @@ import subprocess
 import matplotlib.pyplot as plt
 
 from pymatflow.vasp.base.xyz import Atom
+from pymatflow.base.xyzio import format_atoms
 
 
 class md_post:
@@ -131,8 +132,7 @@ class md_post:
             for i in range(len(self.trajectory)):
                 fout.write("%d\n" % len(self.trajectory[i]))
                 fout.write("i = %d\n" % i)
-                for atom in self.trajectory[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory[i]))
 
     def view_trajectory(self, trajfile="trajectory.xyz"):
         #os.system("xcrysden --xyz %s" % trajfile)
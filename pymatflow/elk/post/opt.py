@@ -5,6 +5,7 @@ import subprocess
 import matplotlib.pyplot as plt
 
 from pymatflow.vasp.base.xyz import Atom
+from pymatflow.base.xyzio import format_atoms
 
 class opt_out:
     """
@@ -174,8 +175,7 @@ class opt_out:
             with open("final-structure(not-relaxed).xyz", 'w') as fout:
                 fout.write("%d\n" % len(self.trajectory[0]))
                 fout.write("Warning: structure failed to be relaxed or vc-relaxed, this is the final structure(unrelaxed)\n")
-                for atom in self.trajectory[-1]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory[-1]))
             return
         # printout relaxed structure
         with open(xyz, 'w') as fout:
@@ -185,8 +185,7 @@ class opt_out:
                 self.cells[-1][1][0], self.cells[-1][1][1], self.cells[-1][1][2],
                 self.cells[-1][2][0], self.cells[-1][2][1], self.cells[-1][2][2]
                 ))
-            for atom in self.trajectory[-1]:
-                fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+            fout.write(format_atoms(self.trajectory[-1]))
 
     def print_trajectory(self, xyz="trajectory.xyz"):
         with open(xyz, 'w') as fout:
@@ -199,8 +198,7 @@ class opt_out:
                     self.cells[i][1][0], self.cells[i][1][1], self.cells[i][1][2],
                     self.cells[i][2][0], self.cells[i][2][1], self.cells[i][2][2]
                     ))
-                for atom in self.trajectory[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory[i]))
 
     def export(self, directory="tmp-vasp-optimization"):
         os.chdir(directory)
@@ -419,23 +417,20 @@ class opt_post:
             with open("final-structure(not-relaxed).xyz", 'w') as fout:
                 fout.write("%d\n" % len(self.trajectory[0]))
                 fout.write("Warning: structure failed to be relaxed or vc-relaxed, this is the final structure(unrelaxed)\n")
-                for atom in self.trajectory[-1]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory[-1]))
             return
         # printout relaxed structure
         with open(xyz, 'w') as fout:
             fout.write("%d\n" % len(self.trajectory[-1]))
             fout.write("cell:\n")
-            for atom in self.trajectory[-1]:
-                fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+            fout.write(format_atoms(self.trajectory[-1]))
 
     def print_trajectory(self, xyz="trajectory.xyz"):
         with open(xyz, 'w') as fout:
             for i in range(len(self.trajectory)):
                 fout.write("%d\n" % len(self.trajectory[i]))
                 fout.write("i = %d\n" % i)
-                for atom in self.trajectory[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory[i]))
 
     def view_trajectory(self, trajfile="trajectory.xyz"):
         #os.system("xcrysden --xyz %s" % trajfile)
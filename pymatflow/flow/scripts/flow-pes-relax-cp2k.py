@@ -129,6 +129,13 @@ if __name__ == "__main__":
             default=0.0,
             help="z shift for the moving atoms, will shift the z of specified moving atoms by value of zshift")
 
+    parser.add_argument("--symmetry", type=str, default="false",
+            choices=["true", "false", "True", "False"],
+            help="whether only calculate the grid points not equivalent by the in-plane symmetry of the fixed atoms")
+
+    parser.add_argument("--symprec", type=float, default=0.1,
+            help="tolerance of positions in the symmetry search, in unit of Angstrom")
+
     # -----------------------------------------------------------------
     #                      for server handling
     # -----------------------------------------------------------------
@@ -145,6 +152,12 @@ if __name__ == "__main__":
     parser.add_argument("--ppn", type=int, default=32,
             help="ppn of the server")
 
+    parser.add_argument("--nworker", type=int, default=1,
+            help="number of grid points running at the same time with runopt run or genrun")
+
+    parser.add_argument("--nrank", type=int, default=0,
+            help="number of mpi ranks of each grid point(mpirun -np nrank), 0 means using --mpi")
+
 
 
 
@@ -181,5 +194,5 @@ if __name__ == "__main__":
     task.get_xyz(args.file)
     task.set_params(params=params)
     task.set_run(mpi=args.mpi, server=args.server, jobname=args.jobname, nodes=args.nodes, ppn=args.ppn)
-    task.set_pes( move_atom=args.move_atom, xrange=args.xrange, yrange=args.yrange, zshift=args.zshift)
-    task.run(directory=args.directory, runopt=args.runopt, auto=args.auto)
+    task.set_pes( move_atom=args.move_atom, xrange=args.xrange, yrange=args.yrange, zshift=args.zshift, symmetry=args.symmetry.lower() == "true", symprec=args.symprec)
+    task.run(directory=args.directory, runopt=args.runopt, auto=args.auto, nworker=args.nworker, nrank=args.nrank)
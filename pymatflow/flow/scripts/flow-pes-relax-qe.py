@@ -117,6 +117,13 @@ if __name__ == "__main__":
     parser.add_argument("--zshift", type=float,
             default=0.0,
             help="z shift for the moving atoms, will shift the z of specified moving atoms by value of zshift")
+
+    parser.add_argument("--symmetry", type=str, default="false",
+            choices=["true", "false", "True", "False"],
+            help="whether only calculate the grid points not equivalent by the in-plane symmetry of the fixed atoms")
+
+    parser.add_argument("--symprec", type=float, default=0.1,
+            help="tolerance of positions in the symmetry search, in unit of Angstrom")
     
     parser.add_argument("--fix-z", type=int, default=1,
             choices=[0, 1, 2],
@@ -142,6 +149,12 @@ if __name__ == "__main__":
     parser.add_argument("--ppn", type=int, default=32,
             help="ppn of the server")
 
+    parser.add_argument("--nworker", type=int, default=1,
+            help="number of grid points running at the same time with runopt run or genrun")
+
+    parser.add_argument("--nrank", type=int, default=0,
+            help="number of mpi ranks of each grid point(mpirun -np nrank), 0 means using --mpi")
+
     parser.add_argument("--queue", type=str, default=None,
             help="queue to submit the job")
 
@@ -167,8 +180,8 @@ if __name__ == "__main__":
     task.set_kpoints(kpoints_option=args.kpoints_option, kpoints_mp=args.kpoints_mp)
     task.set_params(control=control, system=system, electrons=electrons, ions=ions)
     task.set_run(mpi=args.mpi, server=args.server, jobname=args.jobname, nodes=args.nodes, ppn=args.ppn, queue=args.queue)
-    task.set_pes(move_atom=args.move_atom, xrange=args.xrange, yrange=args.yrange, zshift=args.zshift, fix_z=args.fix_z)
-    task.run(directory=args.directory, runopt=args.runopt, auto=args.auto)
+    task.set_pes(move_atom=args.move_atom, xrange=args.xrange, yrange=args.yrange, zshift=args.zshift, fix_z=args.fix_z, symmetry=args.symmetry.lower() == "true", symprec=args.symprec)
+    task.run(directory=args.directory, runopt=args.runopt, auto=args.auto, nworker=args.nworker, nrank=args.nrank)
 
 
 """
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# _*_ coding: utf-8 _*_
+
+import argparse
+
+from pymatflow.flow.surface_pes import pes_executor, get_pes
+
+
+"""
+usage:
+    pes-run.py -d tmp-vasp-pes-opt -c vasp --nworker 4 --nrank 8
+    # only collect the energies into post-processing/pes.data
+    pes-run.py -d tmp-vasp-pes-opt -c vasp --harvest --nproc 8
+"""
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("-d", "--directory", type=str, required=True,
+            help="directory of the PES calculation, containing the _x_y_ directories")
+
+    parser.add_argument("-c", "--code", type=str, required=True,
+            choices=["cp2k", "qe", "vasp"],
+            help="the program of the calculation")
+
+    parser.add_argument("--nworker", type=int, default=1,
+            help="number of grid points running at the same time")
+
+    parser.add_argument("--nrank", type=int, default=0,
+            help="number of mpi ranks of each grid point, 0 means using --mpi")
+
+    parser.add_argument("--mpi", type=str, default="",
+            help="MPI command used when --nrank is 0: like 'mpirun -np 4'")
+
+    parser.add_argument("--launcher", type=str, default="mpirun -np %d",
+            help="MPI command with the number of ranks as %%d, used when --nrank > 0")
+
+    parser.add_argument("--harvest", action="store_true",
+            help="only collect the energies into post-processing/pes.data, run nothing")
+
+    parser.add_argument("--nproc", type=int, default=1,
+            help="number of processes reading the outputs with --harvest")
+
+    # ==========================================================
+    args = parser.parse_args()
+
+    if args.harvest == True:
+        energies = get_pes(args.directory, code=args.code, nproc=args.nproc)
+    else:
+        energies = pes_executor(args.directory, code=args.code, nworker=args.nworker, nrank=args.nrank, mpi=args.mpi, launcher=args.launcher).run()
+    print("%d of %d grid points with energy\n" % (len([e for e in energies.values() if e is not None]), len(energies)))
@@ -10,7 +10,11 @@ the surface with image processing technique.
 import numpy as np
 import sys
 import os
+import re
 import shutil
+import itertools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from pymatflow.remote.server import server_handle
 
 import pymatflow.cp2k as cp2k
@@ -18,6 +22,43 @@ import pymatflow.qe as qe
 import pymatflow.vasp as vasp
 
 """
+Usage:
+    task = cp2k_run()
+    ...
+    # generate the grid and run 4 grid points at the same time with 8 mpi ranks each
+    task.run(directory="tmp-cp2k-pes-opt", runopt="genrun", nworker=4, nrank=8)
+    # or run(again) an already generated sweep, points finished before are skipped
+    pes_executor("tmp-cp2k-pes-opt", code="cp2k", nworker=4, nrank=8).run()
+    # only collect the energies into post-processing/pes.data
+    get_pes("tmp-vasp-pes-opt", code="vasp", nproc=8)
+    # calculate only the grid points not equivalent by symmetry
+    task.set_pes(move_atom=[-1], xrange=[0, 2.46, 0.205], yrange=[0, 4.26, 0.355], symmetry=True, symprec=0.1)
+
+Note:
+    every grid point is a directory _x_y_ in the directory of the sweep, the
+    executor runs nworker of them at the same time, each as one subprocess
+    (mpi launcher with nrank ranks + the program) in its own directory. a point
+    whose output already has the line printed by the program at a normal end is
+    not run again, so an interrupted sweep can be continued by running it again.
+
+    the energy of a point is read from its output as soon as the point finishes
+    and appended to post-processing/pes.data, when all points are done the file
+    is written again in the order of the grid(y outer, x inner) for plotting.
+    the outputs are read backwards by blocks from the end, where the final
+    energy is, so large OUTCAR of long relaxations are not read as a whole.
+
+    with set_pes(symmetry=True), the in-plane symmetry operations of the fixed
+    atoms(all but move_atom) are searched within symprec: rotations and mirrors
+    of the 2D lattice of a and b(which are taken to be in the xy plane) that
+    together with a translation map every fixed atom onto one of the same
+    element at the same z, and that map the moving atoms(as a group around
+    their center) onto themselves. grid points whose positions of the moving
+    atoms are mapped onto each other are equivalent, only the first of each
+    group(in the order of the grid) gets a directory, and pes-symmetry.data
+    records for every grid point the one calculated for it. the executor and
+    get_pes give pes.data of the full grid from it. images falling outside of
+    the grid are not used, so the grid should cover(at least) a unit cell, with
+    steps commensurate with the lattice, to profit from all the operations.
 """
 
 class cp2k_run(cp2k.opt_run):
@@ -33,7 +74,7 @@ class cp2k_run(cp2k.opt_run):
         self.pes_params = {}
         self.set_pes() # set default value
 
-    def set_pes(self, move_atom=[-1], xrange=[0, 1.5, 0.1], yrange=[0, 1.5, 0.5], zshift=0.0, fix_z=1, fix_y=2, fix_x=2):
+    def set_pes(self, move_atom=[-1], xrange=[0, 1.5, 0.1], yrange=[0, 1.5, 0.5], zshift=0.0, fix_z=1, fix_y=2, fix_x=2, symmetry=False, symprec=0.1):
         """
         :parma move_atom: the atoms that will move in the calculation, list start from 0.
         :param xrange: x range for moving the specified moving atoms.
@@ -42,6 +83,8 @@ class cp2k_run(cp2k.opt_run):
         :param: fix_z: 0 -> do not fix any z of the atoms, 1 -> only fix z of the buttom atoms, 2: fix z of both the buttom and the moving atoms. 
         :param: fix_y: 0 -> do not fix any y of the atoms, 1 -> only fix y of the buttom atoms, 2: fix y of both the buttom and the moving atoms. 
         :param: fix_x: 0 -> do not fix any x of the atoms, 1 -> only fix x of the buttom atoms, 2: fix x of both the buttom and the moving atoms. 
+        :param: symmetry: whether only the grid points not equivalent by the in-plane symmetry of the fixed atoms are calculated
+        :param: symprec: tolerance of positions in the symmetry search, in unit of Angstrom
         """
         self.pes_params["move_atom"] = move_atom
         self.pes_params["xrange"] = xrange
@@ -50,8 +93,10 @@ class cp2k_run(cp2k.opt_run):
         self.pes_params["fix_z"] = fix_z
         self.pes_params["fix_y"] = fix_y
         self.pes_params["fix_x"] = fix_x
+        self.pes_params["symmetry"] = symmetry
+        self.pes_params["symprec"] = symprec
 
-    def run(self, directory="tmp-cp2k-pes-opt", runopt="gen", auto=0):
+    def run(self, directory="tmp-cp2k-pes-opt", runopt="gen", auto=0, nworker=1, nrank=0):
         if runopt == "gen" or runopt == "genrun":
             if os.path.exists(directory):
                 shutil.rmtree(directory)
@@ -72,8 +117,16 @@ class cp2k_run(cp2k.opt_run):
             os.chdir(directory)
             # generate the input files and the initial trajectory
             os.system("mkdir -p post-processing")
+            irreducible = None
+            if self.pes_params["symmetry"] == True:
+                mapping = reduce_pes_grid(self.force_eval.subsys.xyz, self.pes_params)
+                write_pes_symmetry("pes-symmetry.data", mapping)
+                irreducible = set(mapping.values())
             for deltay in np.arange(yrange[0], yrange[1], yrange[2]):
                 for deltax in np.arange(xrange[0], xrange[1], xrange[2]):
+                    if irreducible is not None and grid_name(deltax, deltay) not in irreducible:
+                        # equivalent to another grid point by symmetry
+                        continue
                     os.mkdir("_%.3f_%.3f_" % (deltax if np.abs(deltax) >= 0.001 else 0.0, deltay if np.abs(deltay) >= 0.001 else 0.0))
 
                     for i in self.pes_params["move_atom"]:
@@ -157,6 +210,7 @@ class cp2k_run(cp2k.opt_run):
                 fout.write("    deltay=0.000\n")
                 fout.write("  fi\n")                
                 fout.write("  # run the calculation\n")
+                fout.write("  [ -d _${deltax}_${deltay}_ ] || continue # equivalent to another point by symmetry\n")
                 fout.write("  cd _${deltax}_${deltay}_\n")
                 fout.write("  mpirun -np $NP -machinefile $PBS_NODEFILE %s -in %s > %s\n" % ("$PMF_CP2K", "geo-opt.inp", "geo-opt.out"))
                 fout.write("  cd ../\n")
@@ -243,6 +297,7 @@ class cp2k_run(cp2k.opt_run):
                 fout.write("    deltay=0.000\n")
                 fout.write("  fi\n")                
                 fout.write("  # run the calculation\n")
+                fout.write("  [ -d _${deltax}_${deltay}_ ] || continue # equivalent to another point by symmetry\n")
                 fout.write("  cd _${deltax}_${deltay}_\n")
                 fout.write("  %s %s -in %s | tee %s\n" % (self.run_params["mpi"], "$PMF_CP2K", "geo-opt.inp", "geo-opt.out"))
                 fout.write("  cd ../\n")
@@ -314,9 +369,7 @@ class cp2k_run(cp2k.opt_run):
 
             os.chdir("../")
         if runopt == "genrun" or runopt == "run":
-            os.chdir(directory)
-            os.system("bash pes-relax.sh")
-            oschdir("../")
+            pes_executor(directory, code="cp2k", nworker=nworker, nrank=nrank, mpi=self.run_params["mpi"]).run()
         # server handle
         server_handle(auto=auto, directory=directory, jobfilebase="pes-relax", server=self.run_params["server"])
 
@@ -334,7 +387,7 @@ class qe_run(qe.opt_run):
         self.pes_params = {}
         self.set_pes() # set default value
 
-    def set_pes(self, move_atom=[-1], xrange=[0, 1.5, 0.1], yrange=[0, 1.5, 0.5], zshift=0.0, fix_z=1, fix_y=2, fix_x=2):
+    def set_pes(self, move_atom=[-1], xrange=[0, 1.5, 0.1], yrange=[0, 1.5, 0.5], zshift=0.0, fix_z=1, fix_y=2, fix_x=2, symmetry=False, symprec=0.1):
         """
         :parma move_atom: the atoms that will move in the calculation, list start from 0.
         :param xrange: x range for moving the specified moving atoms.
@@ -343,6 +396,8 @@ class qe_run(qe.opt_run):
         :param: fix_z: 0 -> do not fix any z of the atoms, 1 -> only fix z of the buttom atoms, 2: fix z of both the buttom and the moving atoms. 
         :param: fix_y: 0 -> do not fix any y of the atoms, 1 -> only fix y of the buttom atoms, 2: fix y of both the buttom and the moving atoms. 
         :param: fix_x: 0 -> do not fix any x of the atoms, 1 -> only fix x of the buttom atoms, 2: fix x of both the buttom and the moving atoms. 
+        :param: symmetry: whether only the grid points not equivalent by the in-plane symmetry of the fixed atoms are calculated
+        :param: symprec: tolerance of positions in the symmetry search, in unit of Angstrom
         """
         self.pes_params["move_atom"] = move_atom
         self.pes_params["xrange"] = xrange
@@ -351,9 +406,11 @@ class qe_run(qe.opt_run):
         self.pes_params["fix_z"] = fix_z
         self.pes_params["fix_y"] = fix_y
         self.pes_params["fix_x"] = fix_x
+        self.pes_params["symmetry"] = symmetry
+        self.pes_params["symprec"] = symprec
         
 
-    def run(self, directory="tmp-qe-pes-opt", runopt="gen", auto=0):
+    def run(self, directory="tmp-qe-pes-opt", runopt="gen", auto=0, nworker=1, nrank=0):
         if runopt == "gen" or runopt == "genrun":
             if os.path.exists(directory):
                 shutil.rmtree(directory)
@@ -380,9 +437,17 @@ class qe_run(qe.opt_run):
             os.chdir(directory)
             # generate the input files and the initial trajectory
             os.system("mkdir -p post-processing")
+            irreducible = None
+            if self.pes_params["symmetry"] == True:
+                mapping = reduce_pes_grid(self.arts.xyz, self.pes_params)
+                write_pes_symmetry("pes-symmetry.data", mapping)
+                irreducible = set(mapping.values())
             # first iterate y and iterate x which is good for post processing to get the imgage
             for deltay in np.arange(yrange[0], yrange[1], yrange[2]):
                 for deltax in np.arange(xrange[0], xrange[1], xrange[2]): 
+                    if irreducible is not None and grid_name(deltax, deltay) not in irreducible:
+                        # equivalent to another grid point by symmetry
+                        continue
                     # to avoid float -0.000 be translated to string -0.000 we use 0.0 when value ==0 whether it is 0.0 or -0.0
                     os.mkdir("_%.3f_%.3f_" % (deltax if np.abs(deltax) >= 0.001 else 0.0, deltay if np.abs(deltay) >= 0.001 else 0.0))
 
@@ -474,6 +539,7 @@ class qe_run(qe.opt_run):
                 fout.write("    deltay=0.000\n")
                 fout.write("  fi\n")                
                 fout.write("  # run the calculation\n")
+                fout.write("  [ -d _${deltax}_${deltay}_ ] || continue # equivalent to another point by symmetry\n")
                 fout.write("  cd _${deltax}_${deltay}_\n")
                 fout.write("  mpirun -np $NP -machinefile $PBS_NODEFILE %s < %s > %s\n" % ("$PMF_PWX", "relax.in", "relax.out"))
                 fout.write("  cd ../\n")
@@ -561,6 +627,7 @@ class qe_run(qe.opt_run):
                 fout.write("    deltay=0.000\n")
                 fout.write("  fi\n")                
                 fout.write("  # run the calculation\n")
+                fout.write("  [ -d _${deltax}_${deltay}_ ] || continue # equivalent to another point by symmetry\n")
                 fout.write("  cd _${deltax}_${deltay}_\n")
                 fout.write("  %s %s < %s > %s\n" % (self.run_params["mpi"], "$PMF_PWX", "relax.in", "relax.out"))
                 fout.write("  cd ../\n")
@@ -633,9 +700,7 @@ class qe_run(qe.opt_run):
 
             os.chdir("../")
         if runopt == "genrun" or runopt == "run":
-            os.chdir(directory)
-            os.system("bash pes-relax.sh")
-            oschdir("../")
+            pes_executor(directory, code="qe", nworker=nworker, nrank=nrank, mpi=self.run_params["mpi"]).run()
         # server handle
         server_handle(auto=auto, directory=directory, jobfilebase="pes-relax", server=self.run_params["server"])
 
@@ -655,7 +720,7 @@ class vasp_run(vasp.opt_run):
 
         self.batch_x_y = None
 
-    def set_pes(self, move_atom=[-1], xrange=[0, 1.5, 0.1], yrange=[0, 1.5, 0.5], zshift=0.0, fix_z=1, fix_y=2, fix_x=2):
+    def set_pes(self, move_atom=[-1], xrange=[0, 1.5, 0.1], yrange=[0, 1.5, 0.5], zshift=0.0, fix_z=1, fix_y=2, fix_x=2, symmetry=False, symprec=0.1):
         """
         :parma move_atom: the atoms that will move in the calculation, list start from 0.
         :param xrange: x range for moving the specified moving atoms.
@@ -664,6 +729,8 @@ class vasp_run(vasp.opt_run):
         :param: fix_z: 0 -> do not fix any z of the atoms, 1 -> only fix z of the buttom atoms, 2: fix z of both the buttom and the moving atoms. 
         :param: fix_y: 0 -> do not fix any y of the atoms, 1 -> only fix y of the buttom atoms, 2: fix y of both the buttom and the moving atoms. 
         :param: fix_x: 0 -> do not fix any x of the atoms, 1 -> only fix x of the buttom atoms, 2: fix x of both the buttom and the moving atoms. 
+        :param: symmetry: whether only the grid points not equivalent by the in-plane symmetry of the fixed atoms are calculated
+        :param: symprec: tolerance of positions in the symmetry search, in unit of Angstrom
         """
         self.pes_params["move_atom"] = move_atom
         self.pes_params["xrange"] = xrange
@@ -672,8 +739,10 @@ class vasp_run(vasp.opt_run):
         self.pes_params["fix_z"] = fix_z
         self.pes_params["fix_y"] = fix_y
         self.pes_params["fix_x"] = fix_x
+        self.pes_params["symmetry"] = symmetry
+        self.pes_params["symprec"] = symprec
 
-    def run(self, directory="tmp-vasp-pes-opt", runopt="gen", auto=0):
+    def run(self, directory="tmp-vasp-pes-opt", runopt="gen", auto=0, nworker=1, nrank=0):
         """
         """
         xrange = self.pes_params["xrange"]
@@ -719,9 +788,17 @@ class vasp_run(vasp.opt_run):
             os.chdir(directory)
             # generate the input files and the initial trajectory
             os.system("mkdir -p post-processing")
+            irreducible = None
+            if self.pes_params["symmetry"] == True:
+                mapping = reduce_pes_grid(self.poscar.xyz, self.pes_params)
+                write_pes_symmetry("pes-symmetry.data", mapping)
+                irreducible = set(mapping.values())
             # first iterate y and iterate x which is good for post processing to get the imgage
             for deltay in np.arange(yrange[0], yrange[1], yrange[2]):
                 for deltax in np.arange(xrange[0], xrange[1], xrange[2]): 
+                    if irreducible is not None and grid_name(deltax, deltay) not in irreducible:
+                        # equivalent to another grid point by symmetry
+                        continue
                     # to avoid float -0.000 be translated to string -0.000 we use 0.0 when value ==0 whether it is 0.0 or -0.0
                     os.mkdir("_%.3f_%.3f_" % (deltax if np.abs(deltax) >= 0.001 else 0.0, deltay if np.abs(deltay) >= 0.001 else 0.0))
 
@@ -804,6 +881,7 @@ class vasp_run(vasp.opt_run):
                 fout.write("    deltay=0.000\n")
                 fout.write("  fi\n")
                 fout.write("  # run the calculation\n")
+                fout.write("  [ -d _${deltax}_${deltay}_ ] || continue # equivalent to another point by symmetry\n")
                 fout.write("  cd _${deltax}_${deltay}_\n")
                 fout.write("  cp ../INCAR .; cp ../POTCAR .; cp ../KPOINTS .;\n")
                 fout.write("  mpirun -np $NP -machinefile $PBS_NODEFILE %s\n" % ("$PMF_VASP_STD"))
@@ -925,6 +1003,7 @@ class vasp_run(vasp.opt_run):
                         fout.write("    deltay=0.000\n")
                         fout.write("  fi\n")                        
                         fout.write("  # run the calculation\n")
+                        fout.write("  [ -d _${deltax}_${deltay}_ ] || continue # equivalent to another point by symmetry\n")
                         fout.write("  cd _${deltax}_${deltay}_\n")
                         fout.write("  cp ../INCAR .; cp ../POTCAR .; cp ../KPOINTS .;\n")
                         fout.write("  mpirun -np $NP -machinefile $PBS_NODEFILE %s\n" % ("$PMF_VASP_STD"))
@@ -935,12 +1014,355 @@ class vasp_run(vasp.opt_run):
 
             os.chdir("../")
         if runopt == "genrun" or runopt == "run":
-            os.chdir(directory)
-            os.system("bash pes-relax.sh")
-            oschdir("../")
+            pes_executor(directory, code="vasp", nworker=nworker, nrank=nrank, mpi=self.run_params["mpi"]).run()
         # server handle
         for i_batch_y in range(n_batch_y):
             for i_batch_x in range(n_batch_x):
                 #print("i_batch_x: %d, ibatch_y: %d\n" % (i_batch_x, i_batch_y))
                 server_handle(auto=auto, directory=directory, jobfilebase="pes-relax-batch-%d-%d" % (i_batch_x, i_batch_y), server=self.run_params["server"])
 
+
+# how to run each code in a grid point and find its final energy
+#   command: run in the directory of the grid point, after the mpi launcher
+#   output: file with the energy
+#   marker: the energy is the first number after marker on its last line
+#   done: the output contains done when the program ends normally
+#   unit: unit of the energy
+pes_codes = {
+    "cp2k": {
+        "command": "$PMF_CP2K -in geo-opt.inp > geo-opt.out",
+        "output": "geo-opt.out",
+        "marker": "ENERGY| Total FORCE_EVAL ( QS ) energy (a.u.):",
+        "done": "PROGRAM ENDED AT",
+        "unit": "a.u.",
+        },
+    "qe": {
+        "command": "$PMF_PWX < relax.in > relax.out",
+        "output": "relax.out",
+        "marker": "!    total energy",
+        "done": "JOB DONE.",
+        "unit": "Ry",
+        },
+    "vasp": {
+        "command": "cp ../INCAR ../POTCAR ../KPOINTS . && $PMF_VASP_STD > vasp.out",
+        "output": "OUTCAR",
+        "marker": "energy  without entropy=",
+        "done": "General timing and accounting",
+        "unit": "eV",
+        },
+    }
+
+_grid_dir = re.compile(r"^_(-?[0-9]+(?:\.[0-9]+)?)_(-?[0-9]+(?:\.[0-9]+)?)_$")
+
+
+class pes_executor:
+    """
+    run the grid points of a PES sweep concurrently and collect the energies
+    """
+    def __init__(self, directory, code, nworker=1, nrank=0, mpi="", launcher="mpirun -np %d"):
+        """
+        :param directory: directory of the sweep, containing the _x_y_ directories
+        :param code: cp2k | qe | vasp
+        :param nworker: number of grid points running at the same time
+        :param nrank: number of mpi ranks of each grid point, 0 means using mpi as it is
+        :param mpi: mpi command used when nrank is 0, like 'mpirun -np 4', can be empty
+        :param launcher: mpi command with the number of ranks as %d, used when nrank > 0
+        """
+        if code not in pes_codes:
+            print("=============================================================================\n")
+            print("                              WARNING \n")
+            print("------------------------------------------------------------------------------\n")
+            print("pes_executor supports %s, but got code: %s\n" % (", ".join(pes_codes), code))
+            sys.exit(1)
+        self.directory = directory
+        self.code = code
+        self.nworker = nworker
+        self.mpi = launcher % nrank if nrank > 0 else mpi
+        self.points = list_grid(directory)
+
+    def run(self):
+        """
+        run the points not finished yet and write post-processing/pes.data
+        :return dict of (x, y) -> energy of the points finished, None for the failed ones
+        """
+        spec = pes_codes[self.code]
+        command = ("%s %s" % (self.mpi, spec["command"])).strip()
+        energies = {}
+        os.makedirs(os.path.join(self.directory, "post-processing"), exist_ok=True)
+        data = os.path.join(self.directory, "post-processing", "pes.data")
+        with open(data, "w") as fout:
+            fout.write("# format: x y energy(%s)\n" % spec["unit"])
+            with ThreadPoolExecutor(max_workers=self.nworker) as pool:
+                futures = {pool.submit(_run_point, os.path.join(self.directory, name), command, spec): (x, y) for x, y, name in self.points}
+                for future in as_completed(futures):
+                    x, y = futures[future]
+                    energies[(x, y)] = future.result()
+                    if energies[(x, y)] is not None:
+                        fout.write("%s %s %s\n" % (x, y, energies[(x, y)]))
+                        fout.flush()
+        failed = [(x, y) for x, y in energies if energies[(x, y)] is None]
+        if len(failed) > 0:
+            print("=============================================================================\n")
+            print("                              WARNING \n")
+            print("------------------------------------------------------------------------------\n")
+            print("no final energy found for %d grid points:\n" % len(failed))
+            print(" ".join("_%s_%s_" % point for point in failed) + "\n")
+        points, energies = _expand_symmetry(self.directory, self.points, energies)
+        _write_pes(data, points, energies, spec["unit"])
+        return energies
+
+
+def list_grid(directory):
+    """
+    :return list of (x, y, name) of the _x_y_ directories in directory, in the
+        order of the grid(y outer, x inner), x and y are the strings in the name
+    """
+    points = []
+    for name in os.listdir(directory):
+        match = _grid_dir.match(name)
+        if match is not None and os.path.isdir(os.path.join(directory, name)):
+            points.append((match.group(1), match.group(2), name))
+    points.sort(key=lambda point: (float(point[1]), float(point[0])))
+    return points
+
+def get_final_energy(output, spec):
+    """
+    :param output: output file of a grid point
+    :param spec: an item of pes_codes
+    :return the final energy as the string in the output, or None if not found
+    """
+    line = _last_line_with(output, spec["marker"])
+    if line is None:
+        return None
+    # the first number after the marker
+    for value in line[line.index(spec["marker"]) + len(spec["marker"]):].split():
+        try:
+            float(value)
+            return value
+        except ValueError:
+            continue
+    return None
+
+def get_pes(directory, code, nproc=1):
+    """
+    collect the energies of the grid points into post-processing/pes.data,
+    without running anything, replacing post-processing/get_pes.sh
+    :param nproc: number of processes reading the outputs
+    :return dict of (x, y) -> energy, None for the points without energy
+    """
+    spec = pes_codes[code]
+    points = list_grid(directory)
+    outputs = [os.path.join(directory, name, spec["output"]) for x, y, name in points]
+    if nproc == 1:
+        values = [get_final_energy(output, spec) for output in outputs]
+    else:
+        with ProcessPoolExecutor(max_workers=nproc) as pool:
+            values = list(pool.map(get_final_energy, outputs, [spec] * len(outputs), chunksize=16))
+    energies = {(x, y): value for (x, y, name), value in zip(points, values)}
+    points, energies = _expand_symmetry(directory, points, energies)
+    os.makedirs(os.path.join(directory, "post-processing"), exist_ok=True)
+    _write_pes(os.path.join(directory, "post-processing", "pes.data"), points, energies, spec["unit"])
+    return energies
+
+def grid_name(deltax, deltay):
+    """
+    :return name of the directory of the grid point, -0.000 is written as 0.000
+    """
+    return "_%.3f_%.3f_" % (deltax if np.abs(deltax) >= 0.001 else 0.0, deltay if np.abs(deltay) >= 0.001 else 0.0)
+
+def get_surface_symmetry(cell, symbols, positions, symprec=0.1):
+    """
+    search the in-plane symmetry operations of a slab, a and b of cell should be
+    in the xy plane, an operation maps fractional coordinates(of a and b) f to
+    f.dot(M.T) + t and keeps z.
+    :param cell: [[a1, a2, a3], [b1, b2, b3], [c1, c2, c3]]
+    :param symbols: (natom,) names of the elements
+    :param positions: (natom, 3) cartesian coordinates
+    :param symprec: tolerance of positions, in unit of Angstrom
+    :return list of (M, t), M is a 2x2 integer array and t of shape (2,)
+    """
+    lattice = np.array(cell, dtype=float)[0:2, 0:2]
+    inverse = np.linalg.inv(lattice)
+    symbols = np.asarray(symbols)
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    frac = positions[:, 0:2].dot(inverse)
+    frac = frac - np.floor(frac)
+    z = positions[:, 2]
+    same = (symbols[:, None] == symbols[None, :]) & (np.abs(z[:, None] - z[None, :]) < symprec)
+    metric = lattice.dot(lattice.T)
+    # the atoms of the rarest element give the candidate translations
+    names, counts = np.unique(symbols, return_counts=True)
+    anchor = np.nonzero(symbols == names[np.argmin(counts)])[0][0]
+    ops = []
+    for elements in itertools.product([-1, 0, 1], repeat=4):
+        rotation = np.array(elements).reshape(2, 2)
+        if abs(round(np.linalg.det(rotation))) != 1:
+            continue
+        if np.max(np.abs(rotation.T.dot(metric).dot(rotation) - metric)) > 2 * symprec * np.sqrt(np.max(np.diag(metric))):
+            continue
+        rotated = frac.dot(rotation.T)
+        for j in np.nonzero(same[anchor])[0]:
+            translation = frac[j] - rotated[anchor]
+            translation = translation - np.floor(translation)
+            if any(np.array_equal(rotation, m) and _periodic_distance(translation - t, lattice) < symprec for m, t in ops):
+                continue
+            if _maps_onto(rotated + translation, frac, same, lattice, symprec):
+                ops.append((rotation, translation))
+    return ops
+
+def reduce_pes_grid(xyz, pes_params):
+    """
+    :param xyz: the structure, an instance of base_xyz with cell
+    :param pes_params: pes_params of cp2k_run, qe_run or vasp_run
+    :return dict of the name of every grid point -> name of the irreducible
+        grid point equivalent to it, in the order of the grid
+    """
+    symbols = xyz.atoms.symbols
+    positions = xyz.atoms.positions
+    natom = positions.shape[0]
+    moving = np.zeros(natom, dtype=bool)
+    moving[[i % natom for i in pes_params["move_atom"]]] = True
+    symprec = pes_params["symprec"]
+    lattice = np.array(xyz.cell, dtype=float)[0:2, 0:2]
+    inverse = np.linalg.inv(lattice)
+    ops = get_surface_symmetry(xyz.cell, symbols[~moving], positions[~moving], symprec=symprec)
+    # the moving atoms as a group should be kept by the rotation of the operation
+    center = positions[moving, 0:2].mean(axis=0)
+    group = positions[moving] - np.append(center, 0.0)
+    same = (symbols[moving][:, None] == symbols[moving][None, :]) & (np.abs(group[:, None, 2] - group[None, :, 2]) < symprec)
+    kept = []
+    for rotation, translation in ops:
+        rotated = group[:, 0:2].dot(inverse).dot(rotation.T).dot(lattice)
+        vector = rotated[:, None, :] - group[None, :, 0:2]
+        if np.all(np.any(same & (np.sqrt(np.einsum("ijk,ijk->ij", vector, vector)) < symprec), axis=1)):
+            kept.append((rotation, translation))
+    grid = [(deltax, deltay) for deltay in np.arange(pes_params["yrange"][0], pes_params["yrange"][1], pes_params["yrange"][2])
+        for deltax in np.arange(pes_params["xrange"][0], pes_params["xrange"][1], pes_params["xrange"][2])]
+    names = [grid_name(deltax, deltay) for deltax, deltay in grid]
+    frac = (center + np.array(grid, dtype=float).reshape(-1, 2)).dot(inverse)
+    # images should fall on the grid points, closer than the steps
+    tolerance = min(symprec, 0.25 * abs(pes_params["xrange"][2]), 0.25 * abs(pes_params["yrange"][2]))
+    parent = list(range(len(grid)))
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    for rotation, translation in kept:
+        image = frac.dot(rotation.T) + translation
+        for begin in range(0, len(grid), 256):
+            vector = image[begin:begin+256, None, :] - frac[None, :, :]
+            vector = (vector - np.round(vector)).dot(lattice)
+            i, j = np.nonzero(np.einsum("ijk,ijk->ij", vector, vector) < tolerance ** 2)
+            for a, b in zip((i + begin).tolist(), j.tolist()):
+                a, b = find(a), find(b)
+                if a != b:
+                    # the first one in the order of the grid is kept
+                    parent[max(a, b)] = min(a, b)
+    mapping = {name: names[find(i)] for i, name in enumerate(names)}
+    print("=============================================================================\n")
+    print("%d symmetry operations of the surface, %d of %d grid points are irreducible\n" % (len(kept), len(set(mapping.values())), len(names)))
+    return mapping
+
+def write_pes_symmetry(fname, mapping):
+    """
+    :param mapping: dict returned by reduce_pes_grid
+    """
+    with open(fname, "w") as fout:
+        fout.write("# format: grid point, the irreducible grid point equivalent to it\n")
+        for name in mapping:
+            fout.write("%s %s\n" % (name, mapping[name]))
+
+def read_pes_symmetry(fname):
+    """
+    :return dict of the name of every grid point -> name of the irreducible grid point
+    """
+    mapping = {}
+    with open(fname, "r") as fin:
+        for line in fin:
+            if line.startswith("#") or len(line.split()) != 2:
+                continue
+            name, irreducible = line.split()
+            mapping[name] = irreducible
+    return mapping
+
+
+def _periodic_distance(vector, lattice):
+    vector = vector - np.round(vector)
+    return np.linalg.norm(vector.dot(lattice))
+
+def _maps_onto(image, frac, same, lattice, symprec):
+    """
+    whether every image is within symprec of an atom it may be mapped to(same)
+    """
+    vector = image[:, None, :] - frac[None, :, :]
+    vector = (vector - np.round(vector)).dot(lattice)
+    return bool(np.all(np.any(same & (np.einsum("ijk,ijk->ij", vector, vector) < symprec ** 2), axis=1)))
+
+def _expand_symmetry(directory, points, energies):
+    """
+    give every grid point the energy of the irreducible grid point equivalent to
+    it, when the sweep is reduced by symmetry(has pes-symmetry.data)
+    :return (points, energies) of the full grid
+    """
+    fname = os.path.join(directory, "pes-symmetry.data")
+    if not os.path.exists(fname):
+        return points, energies
+    mapping = read_pes_symmetry(fname)
+    energy_of = {name: energies.get((x, y)) for x, y, name in points}
+    full_points = []
+    full_energies = {}
+    for name in mapping:
+        match = _grid_dir.match(name)
+        x, y = match.group(1), match.group(2)
+        full_points.append((x, y, name))
+        full_energies[(x, y)] = energy_of.get(mapping[name])
+    return full_points, full_energies
+
+def _run_point(path, command, spec):
+    """
+    run one grid point in path unless it is finished
+    :return the final energy, or None
+    """
+    output = os.path.join(path, spec["output"])
+    if _last_line_with(output, spec["done"]) is None:
+        subprocess.run(command, shell=True, cwd=path)
+    return get_final_energy(output, spec)
+
+def _last_line_with(path, marker, block=1048576):
+    """
+    :return the last line of the file containing marker, or None, the file is
+        read backwards by block bytes
+    """
+    if not os.path.exists(path):
+        return None
+    marker = marker.encode()
+    with open(path, "rb") as fin:
+        end = fin.seek(0, os.SEEK_END)
+        carry = b"" # begining of the line cut by the previous block
+        while end > 0:
+            begin = max(0, end - block)
+            fin.seek(begin)
+            buf = fin.read(end - begin) + carry
+            if begin > 0:
+                first = buf.find(b"\n") + 1
+                carry, buf = buf[:first], buf[first:]
+                if first == 0:
+                    carry, buf = buf, b""
+            i = buf.rfind(marker)
+            if i >= 0:
+                start = buf.rfind(b"\n", 0, i) + 1
+                stop = buf.find(b"\n", i)
+                return buf[start:stop if stop >= 0 else len(buf)].decode(errors="replace")
+            end = begin
+    return None
+
+def _write_pes(data, points, energies, unit):
+    """
+    write pes.data in the order of the grid
+    """
+    with open(data, "w") as fout:
+        fout.write("# format: x y energy(%s)\n" % unit)
+        for x, y, name in points:
+            if energies.get((x, y)) is not None:
+                fout.write("%s %s %s\n" % (x, y, energies[(x, y)]))
@@ -12,6 +12,10 @@ import matplotlib.pyplot as plt
 
 from pymatflow.base.xyz import base_xyz
 from pymatflow.base.atom import Atom
+from pymatflow.base.trajectory import base_trajectory
+from pymatflow.base.incremental import tail_state, read_appended_lines
+from pymatflow.base.cache import post_cache
+from pymatflow.base.xyzio import format_atoms
 
 
 class opt_out:
@@ -32,26 +36,64 @@ class opt_out:
         self.cell = None # optimized cell now only used when run_type == vc-relax
         self.trajectory = None
 
-    def get_info(self, file):
+    def get_info(self, file, incremental=False, cache=False):
         """
         get the general information from relax or vc-relax run output file
         which is now stored in self.lines
+
+        incremental:
+            if True, the parsing state is saved to a sidecar file beside the
+            output, and the next get_info on the same output only parses the
+            newly appended part. useful to monitor a running optimization.
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
+            cache is not used in incremental mode.
         """
         self.clean()
 
         self.file = file
-        with open(self.file, 'r') as fout:
-            self.lines = fout.readlines()
+        cache = cache == True and incremental == False
+        if cache == True:
+            sidecar = post_cache(self.file, name="opt")
+            if sidecar.load():
+                sidecar.restore(self)
+                return
+        if incremental == False:
+            with open(self.file, 'r') as fout:
+                self.lines = fout.readlines()
+            # lines in range(self.line_begin, self.line_end) are parsed
+            self.line_begin = 0
+            self.line_end = len(self.lines)
+            # line number in the output file of self.lines[0]
+            self.line_shift = 0
+        else:
+            state = tail_state(self.file, name="opt")
+            state.load()
+            self.lines, offsets = read_appended_lines(self.file, state.offset)
+            self.from_state(state)
 
         # check whether calculation is finished
-        if len(self.lines[-2].split()) == 2 and self.lines[-2].split()[0] == "JOB" and self.lines[-2].split()[1] == "DONE.":
+        if len(self.lines) > 1 and len(self.lines[-2].split()) == 2 and self.lines[-2].split()[0] == "JOB" and self.lines[-2].split()[1] == "DONE.":
             self.job_done = True
         else:
             self.job_done = False
 
+        if incremental == True:
+            # the lines before self.lines[self.line_begin] are the last lines parsed
+            # last time, kept for looking back like the CELL_PARAMETERS before
+            # ATOMIC_POSITIONS. and the last lines of a running output might be
+            # an incomplete block, they are left for the next invocation.
+            context = state.data.get("context", [])
+            self.lines = context + self.lines
+            self.line_begin = len(context)
+            self.line_shift = state.data.get("nline", 0) - len(context)
+            self.line_end = len(self.lines) if self.job_done == True else max(self.line_begin, len(self.lines) - self._get_margin())
+
         # check the run_type: relax or vc-relax
-        self.run_type = 'relax'
-        for line in self.lines:
+        if self.run_type != 'vc-relax':
+            self.run_type = 'relax'
+        for line in self.lines[self.line_begin:self.line_end]:
             if len(line.split()) == 0:
                 continue
             if line.split()[0] == "CELL_PARAMETERS":
@@ -59,8 +101,9 @@ class opt_out:
                 break
 
         # check whether successfully relaxed
-        self.relaxed = False
-        for line in self.lines:
+        if self.relaxed != True:
+            self.relaxed = False
+        for line in self.lines[self.line_begin:self.line_end]:
             if line == "Begin final coordinates\n":
                 self.relaxed = True
                 break
@@ -69,10 +112,81 @@ class opt_out:
         self.get_opt_params_and_run_info()
         self.get_trajectory()
 
+        if incremental == True:
+            state.offset = offsets[self.line_end - self.line_begin]
+            self.to_state(state)
+            state.save()
+        if cache == True:
+            sidecar.dump(self, ["opt_params", "run_info", "run_type", "relaxed", "job_done", "xyz", "trajectory", "final_cell"])
+            sidecar.save()
+
+    def _get_margin(self):
+        """
+        number of lines at the end of a running output that are not parsed
+        in incremental mode, it must cover the longest lookahead of the parser,
+        namely the header after bravais-lattice index and a block of atoms.
+        """
+        nat = self.opt_params.get("nat", None)
+        if nat is None:
+            for line in self.lines:
+                if line.split()[0:4] == ["number", "of", "atoms/cell", "="]:
+                    nat = int(line.split()[4])
+                    break
+        return 16 + (0 if nat is None else nat)
+
+    def to_state(self, state):
+        """
+        store the parsing progress into tail_state
+        """
+        state.data = {
+            "context": self.lines[max(0, self.line_end - 4):self.line_end],
+            "nline": self.line_shift + self.line_end,
+            "run_type": self.run_type,
+            "relaxed": self.relaxed,
+            "opt_params": self.opt_params,
+            "final_cell": getattr(self, "final_cell", None),
+            }
+        # only the ionic steps parsed this time are appended to the series
+        state.extend_dict("run_info", self.run_info)
+        if hasattr(self, "xyz"):
+            state.data["xyz"] = {
+                "names": [atom.name for atom in self.xyz.atoms],
+                "coords": [[atom.x, atom.y, atom.z] for atom in self.xyz.atoms],
+                "cell": self.xyz.cell,
+                }
+        if self.trajectory is not None and len(self.trajectory) > 0:
+            state.data["species"] = self.trajectory.species
+            state.extend("positions", self.trajectory.positions[state.length("positions"):])
+
+    def from_state(self, state):
+        """
+        restore the parsing progress from tail_state
+        """
+        if len(state.data) == 0:
+            return
+        self.run_type = state.data["run_type"]
+        self.relaxed = state.data["relaxed"]
+        self.opt_params = state.data["opt_params"]
+        self.run_info = state.get_dict("run_info")
+        if state.data["final_cell"] is not None:
+            self.final_cell = state.data["final_cell"]
+        if "xyz" in state.data:
+            self.xyz = base_xyz()
+            self.xyz.natom = len(state.data["xyz"]["names"])
+            for name, coord in zip(state.data["xyz"]["names"], state.data["xyz"]["coords"]):
+                self.xyz.atoms.append(Atom(name, coord[0], coord[1], coord[2]))
+            self.xyz.cell = state.data["xyz"]["cell"]
+        if state.length("positions") > 0:
+            self.trajectory = base_trajectory(species=state.data["species"])
+            self.trajectory.extend(state.series("positions"))
+
     def clean(self):
         self.file = None
         self.opt_params = {}
         self.run_info = {}
+        self.run_type = None
+        self.relaxed = None
+        self.trajectory = None
 
     #
     def get_opt_params_and_run_info(self):
@@ -86,7 +200,8 @@ class opt_out:
         """
         #self.run_info["scf_energies"] = []
 
-        for i in range(len(self.lines)):
+        site_line = None
+        for i in range(self.line_begin, self.line_end):
             # if it is an empty line continue to next line
             if len(self.lines[i].split()) == 0:
                 continue
@@ -122,7 +237,8 @@ class opt_out:
                 self.opt_params["cell_b_2pi_alat"].append([float(self.lines[i+2].split()[3]), float(self.lines[i+2].split()[4]), float(self.lines[i+2].split()[5])])
                 self.opt_params["cell_b_2pi_alat"].append([float(self.lines[i+3].split()[3]), float(self.lines[i+3].split()[4]), float(self.lines[i+3].split()[5])])
             elif self.lines[i].split()[0] == "site" and self.lines[i].split()[-1] == "units)" and self.lines[i].split()[-2] == "(alat":
-                self.run_info["site_line_number"] = i
+                self.run_info["site_line_number"] = i + self.line_shift
+                site_line = i
             elif self.lines[i].split()[0] == "number" and self.lines[i].split()[2] == 'k':
                 if self.lines[i].split()[5] == "(tetrahedron":
                     self.opt_params["degauss"] = "tetrahedron method: degauss not needed"
@@ -136,9 +252,13 @@ class opt_out:
 
         # ----------------------------------------------------------------------
         # get the input xyz structure from information extracted above:
+        if site_line is None:
+            # in incremental mode the input structure was obtained before
+            self._get_info_for_each_ions_step()
+            return
         self.xyz = base_xyz()
         self.xyz.natom = self.opt_params["nat"]
-        begin = self.run_info["site_line_number"] + 1
+        begin = site_line + 1
         # Warning:
         # there are numeric erros when obtaining atom coordinated from qe output
         # in unit of alat and multiplied by alat and bohr. namely the acquired
@@ -163,12 +283,12 @@ class opt_out:
         self._get_info_for_each_ions_step()
 
     def _get_info_for_each_ions_step(self):
-        self.run_info["total_energy_each_ion_step"] = []
-        self.run_info["fermi_energy_each_ion_step"] = []
-        self.run_info["total_force_each_ion_step"] = []
-        self.run_info["total_force_scf_correction_each_ion_step"] = []
-        self.run_info["scf_iterations_each_ion_step"] = []
-        for i in range(len(self.lines)):
+        self.run_info.setdefault("total_energy_each_ion_step", [])
+        self.run_info.setdefault("fermi_energy_each_ion_step", [])
+        self.run_info.setdefault("total_force_each_ion_step", [])
+        self.run_info.setdefault("total_force_scf_correction_each_ion_step", [])
+        self.run_info.setdefault("scf_iterations_each_ion_step", [])
+        for i in range(self.line_begin, self.line_end):
             # if it is an empty line continue to next line
             if len(self.lines[i].split()) == 0:
                 continue
@@ -189,81 +309,56 @@ class opt_out:
             self.trajectory contains all other structures and the last of it
             is the optimized structure.
         """
-        if self.run_type == "relax":
-            self.trajectory = []
-            for i in range(len(self.lines)):
-                if len(self.lines[i].split()) > 0 and self.lines[i].split()[0] == "ATOMIC_POSITIONS":
-                    if self.lines[i].split()[1] == "(angstrom)":
-                        atm = []
-                        j = i + 1
-                        while len(self.lines[j].split()) == 4 or len(self.lines[j].split()) == 7:
-                            atm.append(Atom(self.lines[j].split()[0], float(self.lines[j].split()[1]), float(self.lines[j].split()[2]), float(self.lines[j].split()[3])))
-                            j = j + 1
-                        self.trajectory.append(atm)
-                    elif self.lines[i].split()[1] == "(crystal)":
-                        # convert frac to cartesian again
+        if self.trajectory is None:
+            self.trajectory = base_trajectory()
+        for i in range(self.line_begin, self.line_end):
+            if len(self.lines[i].split()) > 0 and self.lines[i].split()[0] == "ATOMIC_POSITIONS":
+                names = []
+                coords = []
+                j = i + 1
+                while len(self.lines[j].split()) == 4 or len(self.lines[j].split()) == 7:
+                    names.append(self.lines[j].split()[0])
+                    coords.append(self.lines[j].split()[1:4])
+                    j = j + 1
+                coords = np.array(coords, dtype=float)
+                if self.lines[i].split()[1] == "(crystal)":
+                    # convert frac to cartesian again
+                    if self.run_type == "relax":
                         latcell = np.array(self.xyz.cell)
-                        convmat = latcell.T
-
-                        atm = []
-                        j = i + 1
-                        while len(self.lines[j].split()) == 4 or len(self.lines[j].split()) == 7:
-                            x, y, z = list(convmat.dot(np.array([float(self.lines[j].split()[1]), float(self.lines[j].split()[2]), float(self.lines[j].split()[3])])))
-                            atm.append(Atom(self.lines[j].split()[0], x, y, z))
-                            j = j + 1
-                        self.trajectory.append(atm)                    
-            #
-        elif self.run_type == "vc-relax":
-            self.trajectory = []
-            for i in range(len(self.lines)):
-                if len(self.lines[i].split()) > 0 and self.lines[i].split()[0] == "ATOMIC_POSITIONS":
-                    if self.lines[i].split()[1] == "(angstrom)":                    
-                        atm = []
-                        j = i + 1
-                        while len(self.lines[j].split()) == 4 or len(self.lines[j].split()) == 7:
-                            atm.append(Atom(self.lines[j].split()[0], float(self.lines[j].split()[1]), float(self.lines[j].split()[2]), float(self.lines[j].split()[3])))
-                            j = j + 1
-                        self.trajectory.append(atm)
-                    elif self.lines[i].split()[1] == "(crystal)":
+                    elif self.run_type == "vc-relax":
                         cell = []
                         for k in range(3):
                             cell.append([float(self.lines[i-4+k].split()[0]), float(self.lines[i-4+k].split()[1]), float(self.lines[i-4+k].split()[2])])
-                        # convert frac to cartesian again
                         latcell = np.array(cell)
-                        convmat = latcell.T
-
-                        atm = []
-                        j = i + 1
-                        while len(self.lines[j].split()) == 4 or len(self.lines[j].split()) == 7:
-                            x, y, z = list(convmat.dot(np.array([float(self.lines[j].split()[1]), float(self.lines[j].split()[2]), float(self.lines[j].split()[3])])))
-                            atm.append(Atom(self.lines[j].split()[0], x, y, z))
-                            j = j + 1
-                        self.trajectory.append(atm)                         
-            #            
+                    coords = coords.dot(latcell)
+                elif self.lines[i].split()[1] != "(angstrom)":
+                    continue
+                if self.trajectory.species is None:
+                    # species is stored only once for the whole trajectory
+                    self.trajectory.set_species(names)
+                self.trajectory.append(coords)
+        #
         if self.relaxed == True and self.run_type == "vc-relax":
             # get the line number of the 'Begin final coordinates'
             # and 'End final coordinates'
-            begin_final_coord_line = 0
-            end_final_coord_line = 0
-            while self.lines[begin_final_coord_line] != "Begin final coordinates\n":
+            begin_final_coord_line = self.line_begin
+            while begin_final_coord_line < self.line_end and self.lines[begin_final_coord_line] != "Begin final coordinates\n":
                 begin_final_coord_line += 1
-            while self.lines[end_final_coord_line] != "End final coordinates\n":
-                end_final_coord_line += 1
-            # get the optimized cell
-            self.final_cell = []
-            for i in range(begin_final_coord_line+5, begin_final_coord_line+8):
-                vec = []
-                for j in range(3):
-                    vec.append(float(self.lines[i].split()[j]))
-                self.final_cell.append(vec)
+            # get the optimized cell, in incremental mode it might be obtained before
+            if begin_final_coord_line < self.line_end:
+                self.final_cell = []
+                for i in range(begin_final_coord_line+5, begin_final_coord_line+8):
+                    vec = []
+                    for j in range(3):
+                        vec.append(float(self.lines[i].split()[j]))
+                    self.final_cell.append(vec)
         #
     def print_final_structure(self, xyz="optimized.xyz"):
         if self.relaxed == False:
             with open("final-structure(not-relaxed).xyz", 'w') as fout:
                 fout.write("%d\n" % len(self.trajectory[0]))
                 fout.write("Warning(%s): structure failed to be relaxed or vc-relaxed, this is the final structure(unrelaxed)\n" % self.run_type)
-                for atom in self.trajectory[-1]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory[-1]))
             return
         # printout relaxed structure
         with open(xyz, 'w') as fout:
@@ -274,16 +369,10 @@ class opt_out:
             else:
                 cell = self.xyz.cell
                 fout.write("cell: %.9f %.9f %.9f | %.9f %.9f %.9f | %.9f %.9f %.9f\n" % (cell[0][0], cell[0][1], cell[0][2], cell[1][0], cell[1][1], cell[1][2], cell[2][0], cell[2][1], cell[2][2]))
-            for atom in self.trajectory[-1]:
-                fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+            fout.write(format_atoms(self.trajectory[-1]))
 
     def print_trajectory(self, xyz="trajectory.xyz"):
-        with open(xyz, 'w') as fout:
-            for i in range(len(self.trajectory)):
-                fout.write("%d\n" % len(self.trajectory[i]))
-                fout.write("i = %d\n" % i)
-                for atom in self.trajectory[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+        self.trajectory.to_xyz(xyz)
 
 
     def plot_run_info(self):
@@ -9,6 +9,7 @@ import shutil
 
 from pymatflow.remote.server import server_handle
 from pymatflow.qe.pwscf import pwscf
+from pymatflow.base.variants import variant_renderer
 
 
 class static_run(pwscf):
@@ -133,7 +134,7 @@ class static_run(pwscf):
             os.chdir("../")
         server_handle(auto=auto, directory=directory, jobfilebase="static-nscf", server=self.run_params["server"])
 
-    def converge_ecutwfc(self, emin, emax, step, directory="tmp-qe-ecutwfc", runopt="gen", auto=0):
+    def converge_ecutwfc(self, emin, emax, step, directory="tmp-qe-ecutwfc", runopt="gen", auto=0, nproc=1):
         if runopt == "gen" or runopt == "genrun":
             if os.path.exists(directory):
                 shutil.rmtree(directory)
@@ -154,17 +155,13 @@ class static_run(pwscf):
 
             os.chdir(directory)
             n_test = int((emax - emin) / step)
-            for i in range(n_test + 1):
-                ecut_wfc = int(emin + i * step)
-                ecut_rho = ecut_wfc * 4 # using default value for ecut_rho: 4 * ecutwfc
-                inp_name = "ecutwfc-%d.in" % ecut_wfc
-                self.control.params['outdir'] = './tmp-' + str(ecut_wfc)
-                self.system.params['ecutwfc'] = ecut_wfc
-                with open(inp_name, 'w') as fout:
-                    self.control.to_in(fout)
-                    self.system.to_in(fout)
-                    self.electrons.to_in(fout)
-                    self.arts.to_in(fout)
+            ecuts = [int(emin + i * step) for i in range(n_test + 1)]
+            # electrons and arts are written once, self.control and self.system are not changed
+            renderer = variant_renderer(self, [
+                ("ecutwfc-%s.in", [("control", "to_in"), ("system", "to_in"), ("electrons", "to_in"), ("arts", "to_in")]),
+                ])
+            variants = [{"control.outdir": './tmp-' + str(ecut_wfc), "system.ecutwfc": ecut_wfc} for ecut_wfc in ecuts]
+            renderer.write("./", variants, [str(ecut_wfc) for ecut_wfc in ecuts], nproc=nproc)
             # gen yhbatch running script
             with open("converge-ecutwfc.slurm", 'w') as fout:
                 fout.write("#!/bin/bash\n")
@@ -9,7 +9,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.transforms as mtransforms
 
-from pymatflow.cmd.structflow import read_structure
+from pymatflow.structure.volumetric import volumetric_data
+from pymatflow.structure.volumetric import reduce_1d
 from pymatflow.cmd.structflow import write_structure
 
 from pymatflow.vasp.post.pdos import post_pdos
@@ -38,6 +39,9 @@ def main():
     parser.add_argument("--abscissa", type=str, nargs="+", default=["a", "b", "c"], 
         choices=["a", "b", "c"], 
         help="choose the direction to do the dimension reduction")
+
+    parser.add_argument("--nslab", type=int, default=8,
+        help="number of planes along c read at a time, larger is faster but needs more memory, default is 8")
         
     # ==========================================================
     # transfer parameters from the arg subparser to static_run setting
@@ -45,34 +49,13 @@ def main():
 
     args = parser.parse_args()
     
-    chg_filepath = args.input
-    
-    chg = []
-    for i in range(3):
-        with open(chg_filepath[i], "r") as fin:
-            chg.append(fin.readlines())
-    
-    first_blank_line = []
-    for i in range(3):
-        for j in range(len(chg[i])):
-            if len(chg[i][j].split()) == 0:
-                first_blank_line.append(j)
-                break
-    
-    first_augmentation_line = [None, None, None]
-    for i in range(3):
-        for j in range(len(chg[i])):
-            if "augmentation" in chg[i][j]:
-                first_augmentation_line[i] = j
-                break
-                
-    os.system("mkdir -p /tmp/pymatflow/")
+    # total - part1 - part2 is reduced slab by slab, only one slab of each *CHG* is in memory
+    head, reduced = reduce_1d(args.input, coeffs=[1.0, -1.0, -1.0], nslab=args.nslab, c=args.z)
+
     for i in range(3):
-        with open("/tmp/pymatflow/POSCAR", "w") as fout:
-            for j in range(first_blank_line[i]):
-                fout.write(chg[i][j])
-            
-        structure = read_structure("/tmp/pymatflow/POSCAR")
+        chg = volumetric_data()
+        chg.read_header(args.input[i])
+        structure = chg.structure
         if i == 0:
             write_structure(structure=structure, filepath=args.output_structure+".total.cif")
         elif i == 1:
@@ -85,30 +68,19 @@ def main():
     c = np.linalg.norm(structure.cell[2])
     
     # assume three *CHG* have the same ngxf and ngyf ngzf
-    ngxf = int(chg[0][first_blank_line[0]+1].split()[0])
-    ngyf = int(chg[0][first_blank_line[0]+1].split()[1])
-    ngzf = int(chg[0][first_blank_line[0]+1].split()[2])    
-    
-    data_iii = []
-    for i in range(3):
-        if first_augmentation_line[i] == None:
-            tmp_str = "".join(chg[i][first_blank_line[i]+2:])
-            data_iii.append(np.fromstring(tmp_str, sep="\n").reshape(ngzf, ngyf, ngxf))
-        else:
-            tmp_str = "".join(chg[i][first_blank_line[i]+2:first_augmentation_line[i]])
-            data_iii.append(np.fromstring(tmp_str, sep="\n").reshape(ngzf, ngyf, ngxf))
-        #data = data.reshape(ngzf, ngyf, ngxf)
+    ngxf = head.ngrid[0]
+    ngyf = head.ngrid[1]
+    ngzf = head.ngrid[2]
     
     
-    # data_iii dimension reduction
-    data_sub = np.array(data_iii[0]) - np.array(data_iii[1]) - np.array(data_iii[2])
     # the unit of value is actually not physical now!
     cell_volume = np.dot(np.cross(np.array(structure.cell[0]), np.array(structure.cell[1])), np.array(structure.cell[2]))
     cell_volume_per_unit = cell_volume / (ngzf * ngyf * ngxf)
     
     # value in Vasp *CHG* are \rho(r)_of_electrons * Volume_of_cell, so we should divide it by cell_volume here and time it with cell_volume_per_unit
     # to get the number of electrons per divided unit
-    total_electrons = np.sum(data_iii[0]) / cell_volume * cell_volume_per_unit
+    # the total electrons of TOTAL is reduced separately, so still only one slab is in memory
+    total_electrons = reduce_1d([args.input[0]], nslab=args.nslab)[1]["total"] / cell_volume * cell_volume_per_unit
     #
     
     print("======================================================\n")
@@ -120,39 +92,10 @@ def main():
     
     
     # unit of data_red_? is e/Anstrom, namely number of electrons per Angstrom
-    data_red_a = []
-    data_red_b = []
-    data_red_c = []
-    if "c" in args.abscissa:
-        factor = cell_volume_per_unit / cell_volume
-        len_ci = c / ngzf
-        for ci in range(data_sub.shape[0]):
-            tmp = 0
-            for bi in range(data_sub.shape[1]):
-                tmp += np.sum(data_sub[ci, bi, :])
-            nelect_ci = tmp * factor
-            rho_line = nelect_ci / len_ci
-            data_red_c.append(rho_line)
-    if "b" in args.abscissa:
-        factor = cell_volume_per_unit / cell_volume
-        len_bi = b / ngyf    
-        for bi in range(data_sub.shape[1]):
-            tmp = 0
-            for ai in range(data_sub.shape[2]):
-                tmp += np.sum(data_sub[:, bi, ai])
-            nelect_bi = tmp * factor
-            rho_line = nelect_bi / len_bi                
-            data_red_b.append(rho_line)
-    if "a" in args.abscissa:
-        factor = cell_volume_per_unit / cell_volume
-        len_ai = a / ngxf        
-        for ai in range(data_sub.shape[2]):
-            tmp = 0
-            for ci in range(data_sub.shape[0]):
-                tmp += np.sum(data_sub[ci, :, ai])
-            nelect_ai = tmp * factor
-            rho_line = nelect_ai / len_ai                   
-            data_red_a.append(rho_line)    
+    factor = cell_volume_per_unit / cell_volume
+    data_red_a = reduced["a"] * factor / (a / ngxf)
+    data_red_b = reduced["b"] * factor / (b / ngyf)
+    data_red_c = reduced["c"] * factor / (c / ngzf)
 
     # output the data and make the plot
     if "c" in args.abscissa:
@@ -197,9 +140,7 @@ def main():
     # -------------------------------------------------------
     
     
-    zi = int((data_sub.shape[0]-1) * args.z)
-    #img = data_sub[i, ::-1, ::]
-    img = data_sub[zi, ::, ::]
+    img = reduced["slice-c"]
     img = (img-img.min()) / (img.max() - img.min()) * 255
     # need to do a transform when the cell is not Orthorhombic
     # skew the image
@@ -242,7 +183,7 @@ def main():
             X[yi, xi] = structure.cell[0][0] * nx[xi] + structure.cell[1][0] * ny[yi]
             Y[yi, xi] = structure.cell[0][1] * nx[xi] + structure.cell[1][1] * ny[yi]
     
-    Z = data_sub[zi, :, :]
+    Z = reduced["slice-c"]
     Z = (Z-Z.min()) / (Z.max() - Z.min()) * 255
     # fill color, three color are divided into three layer(6)
     # cmap = plt.cm.hot means using thermostat plot(graduated red yellow)
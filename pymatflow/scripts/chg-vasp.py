@@ -9,7 +9,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.transforms as mtransforms
 
-from pymatflow.cmd.structflow import read_structure
+from pymatflow.structure.volumetric import volumetric_data
 from pymatflow.cmd.structflow import write_structure
 
 from pymatflow.vasp.post.pdos import post_pdos
@@ -42,6 +42,10 @@ def main():
         
     parser.add_argument("--cmap", type=str, default="gray",
         choices=["gray", "hot", "afmhot", "Spectral", "plasma", "magma", "hsv", "rainbow", "brg"])
+
+    parser.add_argument("--cache", type=str, default="F",
+        choices=["T", "F"],
+        help="whether to keep the grid in a memory mapped .npy file beside the input to speed up later runs, default is F")
         
     # ==========================================================
     # transfer parameters from the arg subparser to static_run setting
@@ -49,28 +53,10 @@ def main():
 
     args = parser.parse_args()
     
-    chg_filepath = args.input
-    
-    with open(chg_filepath, "r") as fin:
-        chg = fin.readlines()
-        
-    for i in range(len(chg)):
-        if len(chg[i].split()) == 0:
-            first_blank_line = i
-            break
-    
-    first_augmentation_line = None
-    for i in range(len(chg)):
-        if "augmentation" in chg[i]:
-            first_augmentation_line = i
-            break
-                
-    os.system("mkdir -p /tmp/pymatflow/")
-    with open("/tmp/pymatflow/POSCAR", "w") as fout:
-        for i in range(first_blank_line):
-            fout.write(chg[i])
-            
-    structure = read_structure("/tmp/pymatflow/POSCAR")
+    chg = volumetric_data()
+    chg.read_vasp_chg(args.input, cache=args.cache == "T")
+
+    structure = chg.structure
     write_structure(structure=structure, filepath=args.output_structure)
     
     is_orthogonal = False
@@ -80,20 +66,11 @@ def main():
     if cos_ab == cos_ac == cos_bc == 0:
         is_orthogonal = True
     
-    ngxf = int(chg[first_blank_line+1].split()[0])
-    ngyf = int(chg[first_blank_line+1].split()[1])
-    ngzf = int(chg[first_blank_line+1].split()[2])    
+    ngxf = chg.ngrid[0]
+    ngyf = chg.ngrid[1]
+    ngzf = chg.ngrid[2]
     
-    if first_augmentation_line == None:
-        #data = np.loadtxt(chg[first_blank_line+2:])
-        tmp_str = "".join(chg[first_blank_line+2:])
-        data = np.fromstring(tmp_str, sep="\n")
-    else:
-        #data = np.loadtxt(chg[first_blank_line+2:first_augmentation_line])
-        tmp_str = "".join(chg[first_blank_line+2:first_augmentation_line])
-        data = np.fromstring(tmp_str, sep="\n")
-        
-    data = data.reshape(ngzf, ngyf, ngxf)
+    data = chg.data
     # charge data in cube file is in shape (ngridx, ngridy, ngridz)
     # while charge in *CHG* file is in shape (ngzf, ngyf, ngxf)
     # they are different!    
@@ -9,7 +9,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.transforms as mtransforms
 
-from pymatflow.cmd.structflow import read_structure
+from pymatflow.structure.volumetric import volumetric_data
+from pymatflow.structure.volumetric import reduce_1d
+from pymatflow.structure.volumetric import write_linear_combination
 from pymatflow.cmd.structflow import write_structure
 
 from pymatflow.vasp.post.pdos import post_pdos
@@ -17,41 +19,22 @@ from pymatflow.vasp.post.pdos import post_pdos
 
 
 class vasp_chg:
-    def __init__(self, chg_filepath):
+    def __init__(self, chg_filepath, cache=False):
         #self.chg_file_path = chg_filepath
-        self.read_chg(chg_filepath)
+        self.read_chg(chg_filepath, cache=cache)
 
-    def read_chg(self, chg_filepath):
-        with open(chg_filepath, "r") as fin:
-            self.lines = fin.readlines()
-        
-        for j in range(len(self.lines)):
-            if len(self.lines[j].split()) == 0:
-                first_blank_line = j
-                break
-        
-        first_augmentation_line = None
-        for j in range(len(self.lines)):
-            if "augmentation" in self.lines[j]:
-                first_augmentation_line = j
-                break
-                    
-        os.system("mkdir -p /tmp/pymatflow/")
-        with open("/tmp/pymatflow/POSCAR", "w") as fout:
-            for j in range(first_blank_line):
-                fout.write(self.lines[j])
-                
-        self.structure = read_structure("/tmp/pymatflow/POSCAR")
-        
-        # assume three *CHG* have the same ngxf and ngyf ngzf
-        self.ngxf = int(self.lines[first_blank_line+1].split()[0])
-        self.ngyf = int(self.lines[first_blank_line+1].split()[1])
-        self.ngzf = int(self.lines[first_blank_line+1].split()[2])    
+    def read_chg(self, chg_filepath, cache=False):
+        chg = volumetric_data()
+        chg.read_vasp_chg(chg_filepath, cache=cache)
+
+        self.structure = chg.structure
         
+        self.ngxf = chg.ngrid[0]
+        self.ngyf = chg.ngrid[1]
+        self.ngzf = chg.ngrid[2]
 
-        if first_augmentation_line == None:
-            tmp_str = "".join(self.lines[first_blank_line+2:])
-            self.data = np.fromstring(tmp_str, sep="\n").reshape(self.ngzf, self.ngyf, self.ngxf)
+        # (ngzf, ngyf, ngxf), a read only np.memmap when cache is True
+        self.data = chg.data
 
         # the unit of value is actually not physical now!
         self.cell_volume = np.dot(np.cross(np.array(self.structure.cell[0]), np.array(self.structure.cell[1])), np.array(self.structure.cell[2]))
@@ -97,6 +80,13 @@ def main():
         choices=["a", "b", "c"], 
         help="choose the direction to do the dimension reduction")
 
+    subparser.add_argument("--nslab", type=int, default=8,
+        help="number of planes along c read at a time, larger is faster but needs more memory, default is 8")
+
+    subparser.add_argument("--cache", type=str, default="F",
+        choices=["T", "F"],
+        help="whether to keep the grid in a memory mapped .npy file beside the input to speed up later runs, default is F")
+
     #  add 
     subparser = subparsers.add_parser("add", help="add CHG*")
 
@@ -107,7 +97,14 @@ def main():
         help="output stucture contained in *CHG*")
 
     subparser.add_argument("-o", "--output", type=str, default="chg-merged",
-        help="prefix of the output chg file name")
+        help="prefix of the output chg file name, the sum is written to [prefix].CHGCAR")
+
+    subparser.add_argument("--nslab", type=int, default=8,
+        help="number of planes along c read at a time, larger is faster but needs more memory, default is 8")
+
+    subparser.add_argument("--cache", type=str, default="F",
+        choices=["T", "F"],
+        help="whether to keep the grid in a memory mapped .npy file beside the input to speed up later runs, default is F")
 
     # slice
     subparser = subparsers.add_parser("slice", help="slice CHG* to get 2d DATA")
@@ -133,6 +130,11 @@ def main():
     subparser.add_argument("--abscissa", type=str, nargs="+", default=["a", "b", "c"], 
         choices=["a", "b", "c"], 
         help="choose the direction to do the dimension reduction")
+
+    subparser.add_argument("--cache", type=str, default="F",
+        choices=["T", "F"],
+        help="whether to keep the grid in a memory mapped .npy file beside the input to speed up later runs, default is F")
+
     # ==========================================================
     # transfer parameters from the arg subparser to static_run setting
     # ==========================================================
@@ -141,44 +143,18 @@ def main():
     
     if args.driver == "1d":
 
-        chg_filepath = args.input
-        
-        with open(chg_filepath, "r") as fin:
-            chg = fin.readlines()
-        
-        for j in range(len(chg)):
-            if len(chg[j].split()) == 0:
-                first_blank_line = j
-                break
-        
-        first_augmentation_line = None
-        for j in range(len(chg)):
-            if "augmentation" in chg[j]:
-                first_augmentation_line = j
-                break
-                    
-        os.system("mkdir -p /tmp/pymatflow/")
-        with open("/tmp/pymatflow/POSCAR", "w") as fout:
-            for j in range(first_blank_line):
-                fout.write(chg[j])
-                
-        structure = read_structure("/tmp/pymatflow/POSCAR")
+        # reduced along a, b, c slab by slab, the grid is never loaded as a whole
+        chg, reduced = reduce_1d([args.input], nslab=args.nslab, cache=args.cache == "T")
+        structure = chg.structure
         write_structure(structure=structure, filepath=args.output_structure+".cif")
 
         a = np.linalg.norm(structure.cell[0])
         b = np.linalg.norm(structure.cell[1])
         c = np.linalg.norm(structure.cell[2])
         
-        # assume three *CHG* have the same ngxf and ngyf ngzf
-        ngxf = int(chg[first_blank_line+1].split()[0])
-        ngyf = int(chg[first_blank_line+1].split()[1])
-        ngzf = int(chg[first_blank_line+1].split()[2])    
-        
-
-        if first_augmentation_line == None:
-            tmp_str = "".join(chg[first_blank_line+2:])
-            data = np.fromstring(tmp_str, sep="\n").reshape(ngzf, ngyf, ngxf)
-        #data = data.reshape(ngzf, ngyf, ngxf)
+        ngxf = chg.ngrid[0]
+        ngyf = chg.ngrid[1]
+        ngzf = chg.ngrid[2]
 
         
         # data dimension reduction
@@ -188,7 +164,7 @@ def main():
         
         # value in Vasp *CHG* are \rho(r)_of_electrons * Volume_of_cell, so we should divide it by cell_volume here and time it with cell_volume_per_unit
         # to get the number of electrons per divided unit
-        total_electrons = np.sum(data) / cell_volume * cell_volume_per_unit
+        total_electrons = reduced["total"] / cell_volume * cell_volume_per_unit
         #
         
         print("======================================================\n")
@@ -200,39 +176,10 @@ def main():
         
         
         # unit of data_red_? is e/Anstrom, namely number of electrons per Angstrom
-        data_red_a = []
-        data_red_b = []
-        data_red_c = []
-        if "c" in args.abscissa:
-            factor = cell_volume_per_unit / cell_volume
-            len_ci = c / ngzf
-            for ci in range(data.shape[0]):
-                tmp = 0
-                for bi in range(data.shape[1]):
-                    tmp += np.sum(data[ci, bi, :])
-                nelect_ci = tmp * factor
-                rho_line = nelect_ci / len_ci
-                data_red_c.append(rho_line)
-        if "b" in args.abscissa:
-            factor = cell_volume_per_unit / cell_volume
-            len_bi = b / ngyf    
-            for bi in range(data.shape[1]):
-                tmp = 0
-                for ai in range(data.shape[2]):
-                    tmp += np.sum(data[:, bi, ai])
-                nelect_bi = tmp * factor
-                rho_line = nelect_bi / len_bi                
-                data_red_b.append(rho_line)
-        if "a" in args.abscissa:
-            factor = cell_volume_per_unit / cell_volume
-            len_ai = a / ngxf        
-            for ai in range(data.shape[2]):
-                tmp = 0
-                for ci in range(data.shape[0]):
-                    tmp += np.sum(data[ci, :, ai])
-                nelect_ai = tmp * factor
-                rho_line = nelect_ai / len_ai                   
-                data_red_a.append(rho_line)    
+        factor = cell_volume_per_unit / cell_volume
+        data_red_a = reduced["a"] * factor / (a / ngxf)
+        data_red_b = reduced["b"] * factor / (b / ngyf)
+        data_red_c = reduced["c"] * factor / (c / ngzf)
 
         # output the data and make the plot
         if "c" in args.abscissa:
@@ -270,13 +217,11 @@ def main():
             plt.close()
 
     elif args.driver == "add":
-        chgs = []   
-        for item in args.input:
-            chgs.append(vasp_chg(item))
-        pass
+        # the sum is written slab by slab, only one slab of each input is in memory
+        write_linear_combination(args.input, args.output+".CHGCAR", nslab=args.nslab, cache=args.cache == "T")
        
     elif args.driver == "slice":
-        chg = vasp_chg(args.input)
+        chg = vasp_chg(args.input, cache=args.cache == "T")
         zi = int((chg.data.shape[0]-1) * args.z)
         img = chg.data[zi, ::, ::]
         img = (img-img.min()) / (img.max() - img.min())  * 255
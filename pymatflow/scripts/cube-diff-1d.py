@@ -10,7 +10,7 @@ import matplotlib.pyplot as plt
 import matplotlib.transforms as mtransforms
 
 
-from pymatflow.base.element import element as elem
+from pymatflow.base.element import element_symbols
 from pymatflow.structure.crystal import crystal
 
 
@@ -72,9 +72,7 @@ def main():
         atoms_list = []
         for i in range(natom):
             atomic_number = int(cube[k][i+6].split()[0])
-            for e in elem:
-                if elem[e].number == atomic_number:
-                    label = e
+            label = element_symbols[atomic_number]
             atoms_list.append([
                 label,
                 float(cube[k][i+6].split()[2]) * bohr_to_angstrom,
@@ -9,9 +9,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.transforms as mtransforms
 
-from pymatflow.base.element import element as elem
-from pymatflow.structure.crystal import crystal
-from pymatflow.cmd.structflow import read_structure
+from pymatflow.structure.volumetric import volumetric_data
 from pymatflow.cmd.structflow import write_structure
 
 from pymatflow.vasp.post.pdos import post_pdos
@@ -36,55 +34,29 @@ def main():
         
     parser.add_argument("--cmap", type=str, default="gray",
         choices=["gray", "hot", "afmhot", "Spectral", "plasma", "magma", "hsv", "rainbow", "brg"])
+
+    parser.add_argument("--cache", type=str, default="F",
+        choices=["T", "F"],
+        help="whether to keep the grid in a memory mapped .npy file beside the input to speed up later runs, default is F")
+
     # ==========================================================
     # transfer parameters from the arg subparser to static_run setting
     # ==========================================================
 
     args = parser.parse_args()
     
-    cube_filepath = args.input
-    
-    with open(cube_filepath, "r") as fin:
-        cube = fin.readlines()
-        
-    ngridx = int(cube[3].split()[0])
-    ngridy = int(cube[4].split()[0])
-    ngridz = int(cube[5].split()[0])            
-        
-    # read structure info
-    natom = abs(int(cube[2].split()[0])) # it might be negative, if MO infor are included in cube file
-    bohr_to_angstrom = 0.529177249
-    structure = crystal()
-    structure.cell = []
-    for i in range(3):
-        tmp = []
-        for j in range(3):
-            tmp.append(int(cube[i+3].split()[0]) * float(cube[i+3].split()[j+1]) * bohr_to_angstrom)
-        structure.cell.append(tmp)
-    atoms_list = []
-    for i in range(natom):
-        atomic_number = int(cube[i+6].split()[0])
-        for e in elem:
-            if elem[e].number == atomic_number:
-                label = e
-        atoms_list.append([
-            label,
-            float(cube[i+6].split()[2]) * bohr_to_angstrom,
-            float(cube[i+6].split()[3]) * bohr_to_angstrom,
-            float(cube[i+6].split()[4]) * bohr_to_angstrom,
-        ])
-    structure.get_atoms(atoms_list)
-    # end read structure info
-    write_structure(structure=structure, filepath=args.output_structure)
+    cube = volumetric_data()
+    cube.read_cube(args.input, cache=args.cache == "T")
 
+    ngridx = cube.ngrid[0]
+    ngridy = cube.ngrid[1]
+    ngridz = cube.ngrid[2]
+
+    structure = cube.structure
+    write_structure(structure=structure, filepath=args.output_structure)
 
-    # read grid value
-    tmp_str = "".join(cube[natom+6:])
-    data = np.fromstring(tmp_str, sep="\n")
-        
-    #data = data.reshape(ngridz, ngridy, ngridx)
     # grid data in cube is iterated in different compared to *CHG* of vasp
-    data = data.reshape(ngridx, ngridy, ngridz) 
+    data = cube.data
     # charge data in cube file is in shape (ngridx, ngridy, ngridz)
     # while charge in *CHG* file is in shape (ngzf, ngyf, ngxf)
     # they are different!
@@ -71,23 +71,12 @@ def main():
         sys.exit(1)
     
     # data: [x, y, z, ldos]
+    # ldos of each atom is its pdos summed over spin, energy and orbitals
+    ldos = pdos.pdos[[i-1 for i in atoms_index_from_1]].sum(axis=(1, 2, 3))
     data = []
-    for i in atoms_index_from_1:
-        ldos = 0.0
-        #if pdos.magnetic_status == "non-soc-ispin-1":
-        #    pdos.data[i-1]
-        #elif pdos.magnetic_status == "non-soc-ispin-2":
-        #    pdos.data[i-1]
-        #elif pdos.magnetic_status == "soc-ispin-1" or pdos.magnetic_status == "soc-ispin-2":
-        #    pdos.data[i-1]
-        for item in pdos.data[i-1]:
-            if item == "ion":
-                continue
-            for itm in pdos.data[i-1][item]:
-                if itm == "energy":
-                    continue
-                ldos += sum(pdos.data[i-1][item][itm])
-        data.append([structure.atoms[i-1].x, structure.atoms[i-1].y, structure.atoms[i-1].z, ldos])
+    for i in range(len(atoms_index_from_1)):
+        atom = structure.atoms[atoms_index_from_1[i]-1]
+        data.append([atom.x, atom.y, atom.z, ldos[i]])
 
 
     with open(args.output+".data", "w") as fout:
@@ -21,8 +21,22 @@ def main():
             help="number of inter images")
 
     parser.add_argument("-m", "--moving-atom", type=int, nargs="+",
-            required=True,
-            help="specifying the moving atoms, index start from 0")
+            default=None,
+            help="specifying the moving atoms, index start from 0, default all atoms")
+
+    parser.add_argument("--method", type=str, default="linear",
+            choices=["linear", "idpp"],
+            help="linear(default): linear interpolation, idpp: relax the linear path with image dependent pair potential")
+
+    parser.add_argument("--mic", type=str, default="T",
+            choices=["T", "F"],
+            help="T(default): interpolate along the shortest periodic image of the displacement, F: use the displacement as it is")
+
+    parser.add_argument("--idpp-steps", type=int, default=200,
+            help="maximum number of steps of idpp relaxation")
+
+    parser.add_argument("--idpp-fmax", type=float, default=0.1,
+            help="force threshold of idpp relaxation")
 
     parser.add_argument("-d", "--directory", type=str, default="./",
             help="directory to put the generated images")
@@ -37,7 +51,12 @@ def main():
     initial = read_structure(args.images[0])
     final = read_structure(args.images[1])
 
-    inter_images = interpolate(initial=initial, final=final, nimage=args.nimage, moving_atom=args.moving_atom)
+    if args.method == "idpp":
+        inter_images = interpolate(initial=initial, final=final, nimage=args.nimage, moving_atom=args.moving_atom,
+            mic=True if args.mic.upper() == "T" else False, method="idpp", steps=args.idpp_steps, fmax=args.idpp_fmax)
+    else:
+        inter_images = interpolate(initial=initial, final=final, nimage=args.nimage, moving_atom=args.moving_atom,
+            mic=True if args.mic.upper() == "T" else False)
 
     
     os.system("mkdir -p %s" % os.path.join(args.directory, "%.2d" % (0)))
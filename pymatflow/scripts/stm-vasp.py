@@ -9,7 +9,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.transforms as mtransforms
 
-from pymatflow.cmd.structflow import read_structure
+from pymatflow.structure.volumetric import volumetric_data
 from pymatflow.cmd.structflow import write_structure
 
 from pymatflow.vasp.post.pdos import post_pdos
@@ -34,6 +34,10 @@ def main():
         
     parser.add_argument("--cmap", type=str, default="gray",
         choices=["gray", "hot", "afmhot", "Spectral", "plasma", "magma", "hsv", "rainbow", "brg"])
+
+    parser.add_argument("--cache", type=str, default="F",
+        choices=["T", "F"],
+        help="whether to keep the grid in a memory mapped .npy file beside the input to speed up later runs, default is F")
         
     # ==========================================================
     # transfer parameters from the arg subparser to static_run setting
@@ -41,44 +45,17 @@ def main():
 
     args = parser.parse_args()
     
-    parchg_filepath = args.input
-    
-    with open(parchg_filepath, "r") as fin:
-        parchg = fin.readlines()
-        
-    for i in range(len(parchg)):
-        if len(parchg[i].split()) == 0:
-            first_blank_line = i
-            break
-    
-    first_augmentation_line = None
-    for i in range(len(parchg)):
-        if "augmentation" in parchg[i]:
-            first_augmentation_line = i
-            break
-            
-    os.system("mkdir -p /tmp/pymatflow/")
-    with open("/tmp/pymatflow/POSCAR", "w") as fout:
-        for i in range(first_blank_line):
-            fout.write(parchg[i])
-            
-    structure = read_structure("/tmp/pymatflow/POSCAR")
+    parchg = volumetric_data()
+    parchg.read_vasp_chg(args.input, cache=args.cache == "T")
+
+    structure = parchg.structure
     write_structure(structure=structure, filepath=args.output_structure)
     
-    ngxf = int(parchg[first_blank_line+1].split()[0])
-    ngyf = int(parchg[first_blank_line+1].split()[1])
-    ngzf = int(parchg[first_blank_line+1].split()[2])    
+    ngxf = parchg.ngrid[0]
+    ngyf = parchg.ngrid[1]
+    ngzf = parchg.ngrid[2]
     
-    if first_augmentation_line == None:
-        #data = np.loadtxt(chg[first_blank_line+2:])
-        tmp_str = "".join(parchg[first_blank_line+2:])
-        data = np.fromstring(tmp_str, sep="\n")
-    else:
-        #data = np.loadtxt(chg[first_blank_line+2:first_augmentation_line])
-        tmp_str = "".join(parchg[first_blank_line+2:first_augmentation_line])
-        data = np.fromstring(tmp_str, sep="\n")
-        
-    data = data.reshape(ngzf, ngyf, ngxf)
+    data = parchg.data
     
     
     # -------------------------------------------------------
@@ -31,6 +31,10 @@ def main():
       
     parser.add_argument("--levels", type=int, default=3, 
         help="number of levels in color map or alpha channel, etc.")
+
+    parser.add_argument("--pbc", type=str, default="F",
+        choices=["T", "F"],
+        help="whether to use the shortest length among periodic images for bonds across the cell boundary")
         
     # ==========================================================
     # transfer parameters from the arg subparser to static_run setting
@@ -47,41 +51,31 @@ def main():
     bonds = imap.findall("Bond")
     natom = len(atoms)
     nbond = len(bonds)
-    bonds_length = []
-    for bond in bonds:
-        connects = []
-        connects.append(int(bond.attrib["Connects"].split(",")[0]))
-        connects.append(int(bond.attrib["Connects"].split(",")[1]))
-        connect_0_in_atoms = False 
-        connect_1_in_atoms = False
-        for i in range(len(atoms)):
-            if int(atoms[i].attrib["ID"]) == connects[0]:
-                connect_0_in_atoms = True
-                connect_0_atom_i = i
-                break
-        for i in range(len(atoms)):
-            if int(atoms[i].attrib["ID"]) == connects[1]:
-                connect_1_in_atoms = True
-                connect_1_atom_i = i
-                break
-        if connect_0_in_atoms == True and connect_1_in_atoms == True:            
-            x0 = float(atoms[connect_0_atom_i].attrib["XYZ"].split(",")[0])
-            y0 = float(atoms[connect_0_atom_i].attrib["XYZ"].split(",")[1])
-            z0 = float(atoms[connect_0_atom_i].attrib["XYZ"].split(",")[2])
-
-            x1 = float(atoms[connect_1_atom_i].attrib["XYZ"].split(",")[0])
-            y1 = float(atoms[connect_1_atom_i].attrib["XYZ"].split(",")[1])
-            z1 = float(atoms[connect_1_atom_i].attrib["XYZ"].split(",")[2])
-           
-            # transform from fractional coord to cartesian
-            latcell = np.array(structure.cell)
-            convmat = latcell.T
-            x0, y0, z0 = list(convmat.dot(np.array([x0, y0, z0])))        
-            x1, y1, z1 = list(convmat.dot(np.array([x1, y1, z1])))
-            length = np.sqrt((x1-x0)**2 + (y1-y0)**2 + (z1-z0)**2)
-            bonds_length.append(length)
-        else:
-            bonds_length.append(None)
+    # map ID of Atom3d to its index, instead of scanning all atoms for each bond
+    index = {}
+    for i in range(len(atoms)):
+        index[int(atoms[i].attrib["ID"])] = i
+    # transform from fractional coord to cartesian
+    positions = np.array([[float(item) for item in atom.attrib["XYZ"].split(",")] for atom in atoms]).reshape(-1, 3).dot(np.array(structure.cell))
+    connects = [[int(item) for item in bond.attrib["Connects"].split(",")[0:2]] for bond in bonds]
+    found = np.array([connect[0] in index and connect[1] in index for connect in connects], dtype=bool)
+    pairs = np.array([[index[connect[0]], index[connect[1]]] for connect, ok in zip(connects, found) if ok], dtype=int).reshape(-1, 2)
+    lengths = np.linalg.norm(positions[pairs[:, 1]] - positions[pairs[:, 0]], axis=1)
+    if args.pbc == "T" and lengths.shape[0] > 0:
+        # bonds across the cell boundary: use the shortest distance among periodic images,
+        # found by the neighbor list within the longest direct bond length
+        from pymatflow.structure.neighbor import neighbor_list
+        nl = neighbor_list().build(positions, structure.cell, lengths.max())
+        center = np.repeat(np.arange(natom), np.diff(nl.first))
+        keys, inverse = np.unique(center * natom + nl.neighbors, return_inverse=True)
+        shortest = np.full(keys.shape[0], np.inf)
+        np.minimum.at(shortest, inverse, nl.distances)
+        bond_keys = pairs[:, 0] * natom + pairs[:, 1]
+        loc = np.minimum(np.searchsorted(keys, bond_keys), keys.shape[0] - 1)
+        lengths = np.where(keys[loc] == bond_keys, np.minimum(lengths, shortest[loc]), lengths)
+    bonds_length = [None] * nbond
+    for i, length in zip(np.nonzero(found)[0], lengths.tolist()):
+        bonds_length[i] = length
     #   
     bonds_length_norm = []
     tmp = copy.deepcopy(bonds_length)
@@ -95,7 +89,7 @@ def main():
         if bonds_length[i] == None:
             bonds_length_norm.append(None)
         else:
-            bonds_length_norm.append((bonds_length[i] - bond_min) / (bond_max - bond_min))
+            bonds_length_norm.append((bonds_length[i] - bond_min) / (bond_max - bond_min if bond_max > bond_min else 1.0))
             
     print(bonds_length_norm)
     # ------------------------------------------------------------------------
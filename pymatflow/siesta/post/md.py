@@ -5,21 +5,34 @@ import datetime
 import subprocess
 import matplotlib.pyplot as plt
 
+from pymatflow.base.cache import post_cache
+
 
 class md_post:
     """
     """
-    def __init__(self, outputfile):
+    def __init__(self, outputfile, cache=False):
         """
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         """
         self.job_completed = None # judge whether the calculation is finished
         self.md_params = {}
         self.run_info = {}
 
+        if cache == True:
+            sidecar = post_cache(outputfile, name="md")
+            if sidecar.load():
+                sidecar.restore(self)
+                return
         with open(outputfile, 'r') as fin:
             self.lines = fin.readlines()
 
         self.get_info()
+        if cache == True:
+            sidecar.dump(self, ["job_completed", "md_params", "run_info"])
+            sidecar.save()
     
     def get_info(self):
         """
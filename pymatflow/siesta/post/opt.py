@@ -7,6 +7,8 @@ import datetime
 import subprocess
 import matplotlib.pyplot as plt
 
+from pymatflow.base.cache import post_cache
+
 
 
 class opt_out:
@@ -21,11 +23,19 @@ class opt_out:
 
 
 
-    def get_info(self, filepath):
+    def get_info(self, filepath, cache=False):
         """
         filepath: output file of the optimization running
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         """
         self.file = filepath
+        if cache == True:
+            sidecar = post_cache(self.file, name="opt")
+            if sidecar.load():
+                sidecar.restore(self)
+                return
         with open(self.file, 'r') as fin:
             self.lines = fin.readlines()
 
@@ -43,6 +53,9 @@ class opt_out:
                 break
         #
         self.get_opt_params_and_run_info()
+        if cache == True:
+            sidecar.dump(self, ["job_completed", "relaxed", "opt_params", "run_info"])
+            sidecar.save()
 
     def get_opt_params_and_run_info(self):
         """
@@ -0,0 +1,254 @@
+"""
+batch building of surfaces and interfaces
+"""
+import os
+import sys
+import json
+import itertools
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+
+from pymatflow.structure.crystal import crystal
+from pymatflow.base.atoms import atoms_array
+from pymatflow.base.xyzio import write_frame
+from pymatflow.structure.tools import surface_cleaver, _redefine_frac, vacuum_layer, merge_layers
+
+
+"""
+Usage:
+    builder = surface_builder()
+    builder.add_bulk("Si", si) # si is an instance of crystal()
+    builder.add_bulk("Ge", ge)
+    builder.add_slabs(["Si", "Ge"], millers=[[0, 0, 1], [1, 1, 0]], terminations="all", nlayers=[2, 3])
+    builder.add_interfaces(["Si"], ["Ge"], millers1=[[0, 0, 1]], millers2=[[0, 0, 1]], distances=[2.5, 3.0])
+    manifest = builder.run("candidates.xyz", nproc=8)
+    # or one xyz file per candidate in directory candidates
+    manifest = builder.run("candidates", nproc=8, split=True)
+
+Note:
+    every candidate is described by a task, a small dict of the labels of the bulks
+    and the parameters, tasks are built by taking all combinations of the lists given
+    to add_slabs/add_interfaces. the bulks are sent to each worker process once when
+    the pool starts, and every worker keeps its own surface_cleaver of each bulk, so
+    the surface vectors and fractional coordinates of a bulk are computed once per
+    process and nothing mutable is shared between processes.
+
+    the structures are written as soon as they are returned(in the order of the
+    tasks), either as frames of one xyz file or as one xyz file per candidate, both
+    in the format of crystal.write_xyz(). the manifest is a json file of a list with
+    the id, file, frame, parameters, natom and formula of each candidate.
+
+    slabs and interfaces are rotated so that a is along x and the surface is in the
+    xy plane, which vacuum_layer and merge_layers expect.
+    termination t puts the t-th distinct layer(counted along c, layers closer than
+    termination_tolerance are one) at the bottom of the slab, "all" builds all of them.
+"""
+
+class surface_builder:
+    """
+    batch builder of slabs and interfaces
+    """
+    def __init__(self):
+        self.bulks = {} # label -> crystal()
+        self.tasks = []
+
+    def add_bulk(self, label, structure):
+        """
+        :param label: name used to refer to the bulk in tasks and manifest
+        :param structure: an instance of crystal()
+        """
+        bulk = crystal()
+        bulk.cell = [list(map(float, vector)) for vector in structure.cell]
+        bulk.atoms = structure.atoms.copy()
+        self.bulks[label] = bulk
+
+    def add_slabs(self, bulks, millers, terminations=[0], nlayers=[1], thickness=10, termination_tolerance=0.1):
+        """
+        :param bulks: list of labels of the bulks
+        :param millers: list of miller indices [h, k, l]
+        :param terminations: list of termination indices, or "all"
+        :param nlayers: list of the number of repetition of the cleaved cell along c
+        :param thickness: thickness of the vacuum layer
+        """
+        terminations = ["all"] if terminations == "all" else terminations
+        for bulk, miller, termination, nlayer in itertools.product(bulks, millers, terminations, nlayers):
+            self._check_bulk(bulk)
+            self.tasks.append({
+                "kind": "slab", "bulk": bulk, "miller": list(miller), "termination": termination,
+                "nlayer": nlayer, "thickness": thickness, "termination_tolerance": termination_tolerance,
+                })
+
+    def add_interfaces(self, bulks1, bulks2, millers1, millers2, distances=[3.4], terminations1=[0], terminations2=[0],
+            nlayers1=[1], nlayers2=[1], use_cell=None, thickness=10, termination_tolerance=0.1):
+        """
+        build interfaces of slab of bulk1 under slab of bulk2 by merge_layers
+        :param distances: list of distances between the two slabs
+        :param use_cell: see merge_layers
+        the other parameters are like those of add_slabs for the two slabs
+        """
+        for bulk1, bulk2, miller1, miller2, distance, termination1, termination2, nlayer1, nlayer2 in itertools.product(
+                bulks1, bulks2, millers1, millers2, distances, terminations1, terminations2, nlayers1, nlayers2):
+            self._check_bulk(bulk1)
+            self._check_bulk(bulk2)
+            self.tasks.append({
+                "kind": "interface", "bulk1": bulk1, "bulk2": bulk2, "miller1": list(miller1), "miller2": list(miller2),
+                "distance": distance, "termination1": termination1, "termination2": termination2,
+                "nlayer1": nlayer1, "nlayer2": nlayer2, "use_cell": use_cell, "thickness": thickness,
+                "termination_tolerance": termination_tolerance,
+                })
+
+    def run(self, output, manifest=None, nproc=1, split=False, chunksize=8):
+        """
+        :param output: xyz file to write all candidates to, or directory for them if split is True
+        :param manifest: the manifest json file, default to output + ".manifest.json"
+        :param nproc: number of worker processes, 1 means build in the current process
+        :param split: whether to write one xyz file per candidate
+        :return the manifest, list of dict
+        """
+        if manifest is None:
+            manifest = output.rstrip("/") + ".manifest.json"
+        if split == True:
+            os.makedirs(output, exist_ok=True)
+            fout = None
+        else:
+            fout = open(output, "w")
+        records = []
+        try:
+            if nproc == 1:
+                _init_worker(self.bulks)
+                results = map(_build, self.tasks)
+                self._write(results, output, fout, split, records)
+            else:
+                with ProcessPoolExecutor(max_workers=nproc, initializer=_init_worker, initargs=(self.bulks,)) as pool:
+                    results = pool.map(_build, self.tasks, chunksize=chunksize)
+                    self._write(results, output, fout, split, records)
+        finally:
+            if fout is not None:
+                fout.close()
+        with open(manifest, "w") as fout:
+            json.dump(records, fout, indent=1)
+        return records
+
+    def _write(self, results, output, fout, split, records):
+        for task, built in zip(self.tasks, results):
+            for params, cell, symbols, positions in built:
+                record = dict(task)
+                record.update(params)
+                record["id"] = len(records)
+                record["natom"] = int(positions.shape[0])
+                record["formula"] = _formula(symbols)
+                if split == True:
+                    record["file"] = os.path.join(output, "candidate-%06d.xyz" % record["id"])
+                    record["frame"] = 0
+                    with open(record["file"], "w") as fcandidate:
+                        _write_frame(fcandidate, cell, symbols, positions)
+                else:
+                    record["file"] = output
+                    record["frame"] = record["id"]
+                    _write_frame(fout, cell, symbols, positions)
+                records.append(record)
+
+    def _check_bulk(self, label):
+        if label not in self.bulks:
+            print("=============================================================================\n")
+            print("                              WARNING \n")
+            print("------------------------------------------------------------------------------\n")
+            print("bulk %s is not added to the surface_builder\n" % label)
+            sys.exit(1)
+
+
+# state of each worker process, set once by _init_worker
+_bulks = {}
+_cleavers = {}
+
+def _init_worker(bulks):
+    global _bulks, _cleavers
+    _bulks = bulks
+    _cleavers = {}
+
+def _build(task):
+    """
+    :return list of (params, cell, symbols, positions) of the candidates of the task,
+        params are the resolved parameters like the termination index
+    """
+    if task["kind"] == "slab":
+        out = []
+        for termination, slab in _slabs(task["bulk"], task["miller"], task["termination"], task["nlayer"], task["termination_tolerance"]):
+            vacuum_layer(structure=slab, plane=1, thickness=task["thickness"])
+            out.append(({"termination": termination}, np.array(slab.cell), slab.atoms.symbols, slab.atoms.positions.copy()))
+        return out
+    out = []
+    slabs1 = _slabs(task["bulk1"], task["miller1"], task["termination1"], task["nlayer1"], task["termination_tolerance"])
+    slabs2 = _slabs(task["bulk2"], task["miller2"], task["termination2"], task["nlayer2"], task["termination_tolerance"])
+    for (termination1, slab1), (termination2, slab2) in itertools.product(slabs1, slabs2):
+        interface = merge_layers(slab1, slab2, use_cell=task["use_cell"], distance=task["distance"], thickness=task["thickness"])
+        params = {"termination1": termination1, "termination2": termination2, "mismatch": _mismatch(slab1.cell, slab2.cell)}
+        out.append((params, np.array(interface.cell), interface.atoms.symbols, interface.atoms.positions.copy()))
+    return out
+
+def _slabs(label, miller, termination, nlayer, tolerance):
+    """
+    :return list of (termination, crystal()) of the slab without vacuum, aligned to xy plane
+    """
+    if label not in _cleavers:
+        _cleavers[label] = surface_cleaver(_bulks[label])
+    cleaver = _cleavers[label]
+    a, b, c = cleaver.get_vectors(miller, miller=True)
+    unit = _redefine_frac(cleaver.frac, cleaver.symbols, cleaver.cell, [a, b, c])
+    cell, positions = _align(np.array(unit.cell), unit.atoms.positions)
+    frac = positions.dot(np.linalg.inv(cell))
+    frac = frac - np.floor(frac)
+    # distinct layers along c
+    height = frac[:, 2] * cell[2, 2]
+    order = np.sort(height)
+    layers = order[np.concatenate(([True], np.diff(order) > tolerance))]
+    if layers.shape[0] > 1 and layers[0] + cell[2, 2] - order[-1] <= tolerance:
+        # the last layer is the first one of the next period
+        layers = layers[:-1]
+    if termination == "all":
+        terminations = list(range(layers.shape[0]))
+    else:
+        terminations = [termination % layers.shape[0]]
+    out = []
+    for t in terminations:
+        shifted = frac.copy()
+        shifted[:, 2] = (frac[:, 2] - (layers[t] - tolerance / 2) / cell[2, 2]) % 1.0
+        # repeat along c
+        shifted = (shifted[None, :, :] + np.arange(nlayer)[:, None, None] * np.array([0.0, 0.0, 1.0])).reshape(-1, 3)
+        shifted[:, 2] /= nlayer
+        slab = crystal()
+        slab.cell = (cell * np.array([[1.0], [1.0], [nlayer]])).tolist()
+        slab.atoms = atoms_array()
+        slab.atoms.extend_arrays(np.tile(unit.atoms.symbols, nlayer), shifted.dot(np.array(slab.cell)))
+        out.append((t, slab))
+    return out
+
+def _align(cell, positions):
+    """
+    rotate cell and positions so that a is along x and b is in the xy plane
+    """
+    x = cell[0] / np.linalg.norm(cell[0])
+    z = np.cross(cell[0], cell[1])
+    z = z / np.linalg.norm(z)
+    y = np.cross(z, x)
+    rotation = np.array([x, y, z]).T
+    return cell.dot(rotation), positions.dot(rotation)
+
+def _mismatch(cell1, cell2):
+    """
+    :return largest relative difference of the lengths of a and b of the two slabs
+    """
+    length1 = np.linalg.norm(np.array(cell1)[0:2], axis=1)
+    length2 = np.linalg.norm(np.array(cell2)[0:2], axis=1)
+    return float(np.max(np.abs(length1 - length2) / length1))
+
+def _formula(symbols):
+    names, counts = np.unique(symbols, return_counts=True)
+    return "".join("%s%d" % (name, count) for name, count in zip(names.tolist(), counts.tolist()))
+
+def _write_frame(fout, cell, symbols, positions):
+    """
+    write one structure in the format of crystal.write_xyz()
+    """
+    write_frame(fout, symbols, positions, cell=cell, fmt="%f")
@@ -9,9 +9,19 @@ import shutil
 import copy
 import pymatflow.base as base
 from pymatflow.base.atom import Atom
+from pymatflow.base.atoms import atoms_array
+from pymatflow.base.xyzio import write_frame
 
 """
 Usage:
+    a.atoms = [Atom("H", 0, 0, 0)]
+    a.atoms.append(Atom("H", 0, 0, 0.74))
+
+Note:
+    atoms is a pymatflow.base.atoms.atoms_array. a list of Atom assigned to it
+    is copied, so append to a.atoms rather than to the list assigned. atoms
+    got from a.atoms[i] stay bound to the same atom when other atoms are
+    removed or moved, and raise ValueError once that atom itself is removed.
 """
 
 
@@ -27,6 +37,23 @@ class crystal():
         self.atoms = None
         self.kpath = None
 
+    @property
+    def atoms(self):
+        """
+        the atoms are stored in a pymatflow.base.atoms.atoms_array, which
+        can be used like a list of Atom
+        """
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        # an atoms_array is shared like a list was before, a list of Atom is
+        # copied into a new atoms_array, later changes to that list are not seen
+        if atoms is None or isinstance(atoms, atoms_array):
+            self._atoms = atoms
+        else:
+            self._atoms = atoms_array(atoms)
+
     def from_base_xyz(self, basexyz):
         """
         :param basexyz: instance of pymatflow.base.xyz.base_xyz
@@ -46,7 +73,7 @@ class crystal():
         """
         :param cif: filepath for cif file
         """
-        import pymatflow.third.aseio
+        import pymatflow.third.aseio as aseio
         self.cell, self.atoms = aseio.read_cif(cif)
 
     def get_cell(self, cell):
@@ -65,7 +92,8 @@ class crystal():
                     ....
                 ]
         """
-        self.atoms = [Atom(atoms[i][0], atoms[i][1], atoms[i][2], atoms[i][3]) for i in range(len(atoms))]
+        self.atoms = atoms_array()
+        self.atoms.extend_arrays([atom[0] for atom in atoms], [atom[1:4] for atom in atoms])
 
     def get_cell_atoms(self, cell, atoms):
         """
@@ -78,7 +106,8 @@ class crystal():
                 ]
         """
         self.cell = cell
-        self.atoms = [Atom(atoms[i][0], atoms[i][1], atoms[i][2], atoms[i][3]) for i in range(len(atoms))]
+        self.atoms = atoms_array()
+        self.atoms.extend_arrays([atom[0] for atom in atoms], [atom[1:4] for atom in atoms])
 
     def cell(self):
         """
@@ -97,7 +126,7 @@ class crystal():
             ]
 
         """
-        return [[self.atoms[i].name, self.atoms[i].x, self.atoms[i].y, self.atoms[i].z] for i in range(self.natom)]
+        return [[name, x, y, z] for name, (x, y, z) in zip(self.atoms.symbols.tolist(), self.atoms.positions.tolist())]
 
     def get_fractional(self):
         """
@@ -109,16 +138,8 @@ class crystal():
             ]
 
         """
-        out = []
-        latcell = np.array(self.cell)
-        convmat = np.linalg.inv(latcell.T)
-        for i in range(len(self.atoms)):
-            atom = []
-            atom.append(self.atoms[i].name)
-            atom = atom + list(convmat.dot(np.array([self.atoms[i].x, self.atoms[i].y, self.atoms[i].z])))
-            out.append(atom)
-        #
-        return out
+        frac = self.atoms.get_fractional(self.cell)
+        return [[name, x, y, z] for name, (x, y, z) in zip(self.atoms.symbols.tolist(), frac.tolist())]
 
     def volume(self):
         """
@@ -136,26 +157,26 @@ class crystal():
                         ["C", 0.00000, 0.000000, 0.0000],
                         ["O", 0.00000, 0.500000, 0.0000],
                         ...
-                    ]
+                    ],
+                "species": array of name of each atom,
+                "positions": (natom, 3) array of cartesian coordinates,
             }
         Note: will not affect status of self
+            the atoms are replicated by numpy broadcasting over the lattice translations,
+            see pymatflow.structure.tools.replicate_atoms, "atoms" is built from
+            "species" and "positions" and keeps the order of the old implementation:
+            replica along a, then the whole along b, then the whole along c.
         """
+        from pymatflow.structure.tools import replicate_atoms
         #
         cell = copy.deepcopy(self.cell)
         for i in range(3):
             for j in range(3):
                 cell[i][j] = n[i] * self.cell[i][j]
-        atoms = copy.deepcopy(self.atoms)
-        # build supercell: replica in three vector one by one
-        for i in range(3):
-            natom_now = len(atoms)
-            for j in range(n[i] - 1):
-                for atom in atoms[:natom_now]:
-                    x = atom.x + float(j + 1) * self.cell[i][0]
-                    y = atom.y + float(j + 1) * self.cell[i][1]
-                    z = atom.z + float(j + 1) * self.cell[i][2]
-                    atoms.append(Atom(atom.name, x, y, z))
-        return {"cell": cell, "atoms": [[atom.name, atom.x, atom.y, atom.z] for atom in atoms]}
+        positions = replicate_atoms(self.atoms.positions, self.cell, [range(n[0]), range(n[1]), range(n[2])])
+        species = np.tile(self.atoms.symbols, n[0] * n[1] * n[2])
+        atoms = [[name, x, y, z] for name, (x, y, z) in zip(species.tolist(), positions.tolist())]
+        return {"cell": cell, "atoms": atoms, "species": species, "positions": positions}
 
 
 
@@ -164,10 +185,7 @@ class crystal():
         :param filepath: output xyz file path
         """
         with open(filepath, 'w') as fout:
-            fout.write("%d\n" % len(self.atoms))
-            fout.write("cell: %f %f %f | %f %f %f | %f %f %f\n" % (self.cell[0][0], self.cell[0][1], self.cell[0][2], self.cell[1][0], self.cell[1][1], self.cell[1][2], self.cell[2][0], self.cell[2][1], self.cell[2][2]))
-            for atom in self.atoms:
-                fout.write("%s\t%f\t%f\t%f\n" % (atom.name, atom.x, atom.y, atom.z))
+            write_frame(fout, self.atoms.symbols, self.atoms.positions, cell=self.cell, fmt="%f")
 
 
     def to_base_xyz(self):
@@ -191,12 +209,9 @@ class crystal():
 
     def remove_atoms(self, number):
         """ remove several atoms from self.atoms
-        :param number: a list of integer specifying atoms to remove
-            index start with 0
-        """
-        for i in number:
-            self.atoms[i] = None
-        while None in self.atoms:
-            self.atoms.remove(None)
-        
+        :param number: a list of integer(index start with 0) or a bool mask specifying atoms to remove
+            see pymatflow.structure.selection for selecting atoms by species, region, etc.
+        """
+        from pymatflow.structure.selection import get_mask
+        self.atoms.delete(get_mask(self, indices=number))
         self.natom = len(self.atoms)
\ No newline at end of file
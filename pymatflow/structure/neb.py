@@ -5,58 +5,168 @@ implement inter image construction
 import copy
 import numpy as np
 
-def interpolate(initial, final, nimage, moving_atom):
+
+"""
+Usage:
+    images = interpolate(initial, final, nimage=5, moving_atom=None, method="idpp")
+
+Note:
+    all the images are kept in one (nimage+2, natom, 3) array including the
+    initial and final image, and the linear interpolation is one broadcasting.
+    the displacement of each atom from initial to final is taken as the shortest
+    one among its periodic images(mic), so an atom crossing the cell boundary
+    moves the short way instead of through the whole cell.
+
+    method="idpp" relaxes the linear path with the image dependent pair potential
+    (Smidstrup et al., J. Chem. Phys. 140, 214106 (2014)): the target distance of
+    each pair in image k is interpolated between its distances in the initial and
+    final image, and the images are relaxed as a NEB on the objective
+    S_k = sum_{i<j} (d_ij^k(target) - d_ij)^2 / d_ij^4 with FIRE. the pair
+    distances and forces of an image are computed by numpy for all pairs at once,
+    so the memory is O(natom^2) per image.
+"""
+
+def interpolate(initial, final, nimage, moving_atom=None, mic=True, method="linear", **kwargs):
     """
     :param initial -> instance of pymatflow.structure.crystal.crystal()
     :param final -> instance of pymatflow.structure.crystal.crystal()
     :param nimage -> number of intermediate images(not including initial and final image)
-    :param moving_atom -> the index of moving atoms (index starts from 0)
+    :param moving_atom -> the index of moving atoms (index starts from 0), None for all atoms
+    :param mic -> whether to use the minimum image displacement of each atom
+    :param method -> "linear" or "idpp"
+    :param kwargs -> parameters passed to idpp_relax when method is "idpp"
     :return images -> a list of instance of pymatflow.structure.crystal.crystal() 
             as inter images
     Feature:
-        only interpolate(linearly) the specified moving atoms. other atoms may have
+        only interpolate the specified moving atoms. other atoms may have
         different positions between initial and final image, however we use the coordinate
         of the initial image as the cooresponding coordinate for the inter image.
     """
-    # use fractional coordinates to interpolate the images
-    initial.natom = len(initial.atoms)
-    final.natom = len(final.atoms)
-    initial_frac = initial.get_fractional()
-    final_frac = final.get_fractional()
-
-    #images = []
-    images_frac = []
-    for i in range(nimage):
-        #images.append(copy.deepcopy(initial))
-        images_frac.append(copy.deepcopy(initial_frac))
-
-    for i in moving_atom:        
-        dx = final_frac[i][1] - initial_frac[i][1]
-        dy = final_frac[i][2] - initial_frac[i][2]
-        dz = final_frac[i][3] - initial_frac[i][3]
-
-        for j in range(nimage):
-            x = initial_frac[i][1] + j * dx / (nimage+1)
-            y = initial_frac[i][2] + j * dy / (nimage+1)            
-            z = initial_frac[i][3] + j * dz / (nimage+1)
-            #print("fractional x, y, z: %f %f %f\n" % (x, y, z))
-            images_frac[j][i][1] = x
-            images_frac[j][i][2] = y
-            images_frac[j][i][3] = z
-    # transform from images_frac to images
-    # convert frac to cartesian again
-    images = []
-    latcell = np.array(initial.cell)
-    convmat = latcell.T
-    from pymatflow.base.atom import Atom
     from pymatflow.structure.crystal import crystal
-    for i in range(nimage):
+    from pymatflow.base.atoms import atoms_array
+    path = interpolate_positions(initial.atoms.positions, final.atoms.positions, initial.cell, nimage, moving=moving_atom, mic=mic)
+    if method == "idpp":
+        path = idpp_relax(path, initial.cell, moving=moving_atom, mic=mic, **kwargs)
+    images = []
+    for i in range(1, nimage + 1):
         img = crystal()
-        img.atoms = []
-        img.cell = initial.cell
-        for atom in images_frac[i]:
-            cartesian = list(convmat.dot(np.array([atom[1], atom[2], atom[3]])))
-            img.atoms.append(Atom(name=atom[0], x=cartesian[0], y=cartesian[1], z=cartesian[2]))
+        img.cell = copy.deepcopy(initial.cell)
+        img.atoms = atoms_array()
+        img.atoms.extend_arrays(initial.atoms.symbols, path[i])
         images.append(img)
-        #
-    return images
\ No newline at end of file
+    return images
+
+def interpolate_positions(initial, final, cell, nimage, moving=None, mic=True):
+    """
+    :param initial, final: (natom, 3) cartesian coordinates of the initial and final image
+    :param cell: [[a1, a2, a3], [b1, b2, b3], [c1, c2, c3]], None for molecules
+    :param moving: index of the moving atoms, None for all atoms
+    :return (nimage+2, natom, 3) array, the linear path including initial and final
+    """
+    initial = np.asarray(initial, dtype=float)
+    displacement = np.asarray(final, dtype=float) - initial
+    if mic == True and cell is not None:
+        displacement = _mic(displacement, cell)
+    if moving is not None:
+        fixed = np.ones(initial.shape[0], dtype=bool)
+        fixed[np.asarray(moving, dtype=int)] = False
+        displacement[fixed] = 0.0
+    t = np.linspace(0.0, 1.0, nimage + 2)
+    return initial[None, :, :] + t[:, None, None] * displacement[None, :, :]
+
+def idpp_relax(path, cell, moving=None, mic=True, steps=200, fmax=0.1, spring=5.0, dt=0.1, maxstep=0.2):
+    """
+    relax the intermediate images on the image dependent pair potential
+    :param path: (nimage+2, natom, 3) array including initial and final image
+    :param moving: index of the atoms allowed to move, None for all atoms
+    :param steps: maximum number of FIRE steps
+    :param fmax: convergence threshold of the largest NEB force on an atom
+    :param spring: spring constant between images
+    :param dt: initial time step of FIRE
+    :param maxstep: maximum displacement of an atom in one step, in unit of Angstrom
+    :return the relaxed path, (nimage+2, natom, 3) array
+    """
+    path = np.array(path, dtype=float)
+    nimage = path.shape[0] - 2
+    if nimage < 1:
+        return path
+    cell = None if (mic == False or cell is None) else np.array(cell, dtype=float)
+    first = _pair_distances(path[0], cell)[1]
+    last = _pair_distances(path[-1], cell)[1]
+    t = np.linspace(0.0, 1.0, nimage + 2)
+    # target pair distances of each image
+    targets = first[None, :, :] + t[:, None, None] * (last - first)[None, :, :]
+    mask = np.ones(path.shape[1], dtype=bool) if moving is None else np.isin(np.arange(path.shape[1]), moving)
+
+    velocity = np.zeros_like(path[1:-1])
+    alpha = 0.1
+    npositive = 0
+    for step in range(steps):
+        forces = _neb_forces(path, targets, cell, spring) * mask[None, :, None]
+        if np.sqrt((forces ** 2).sum(axis=2)).max() < fmax:
+            break
+        # FIRE
+        power = np.sum(forces * velocity)
+        if power > 0:
+            velocity = (1 - alpha) * velocity + alpha * np.linalg.norm(velocity) * forces / np.linalg.norm(forces)
+            if npositive > 5:
+                dt = min(dt * 1.1, 1.0)
+                alpha *= 0.99
+            npositive += 1
+        else:
+            velocity[:] = 0.0
+            dt *= 0.5
+            alpha = 0.1
+            npositive = 0
+        velocity += dt * forces
+        move = dt * velocity
+        length = np.sqrt((move ** 2).sum(axis=2, keepdims=True))
+        move = np.where(length > maxstep, move * maxstep / np.where(length > 0, length, 1.0), move)
+        path[1:-1] += move
+    return path
+
+
+def _mic(vectors, cell):
+    """
+    :return the vectors reduced to their shortest periodic images
+    """
+    cell = np.array(cell, dtype=float)
+    frac = vectors.dot(np.linalg.inv(cell))
+    return (frac - np.round(frac)).dot(cell)
+
+def _pair_distances(positions, cell):
+    """
+    :return (vectors, distances) of all pairs, vectors[i, j] = positions[j] - positions[i]
+    """
+    vectors = positions[None, :, :] - positions[:, None, :]
+    if cell is not None:
+        vectors = _mic(vectors, cell)
+    return vectors, np.sqrt((vectors ** 2).sum(axis=2))
+
+def _neb_forces(path, targets, cell, spring):
+    """
+    :return (nimage, natom, 3) NEB forces on the intermediate images on the idpp surface
+    """
+    nimage = path.shape[0] - 2
+    natom = path.shape[1]
+    forces = np.zeros((nimage, natom, 3))
+    for k in range(1, nimage + 1):
+        vectors, distances = _pair_distances(path[k], cell)
+        # avoid division by zero on the diagonal
+        d = distances + np.eye(natom)
+        difference = targets[k] - d
+        # dS/dd of each pair, S = sum_{i<j} (target - d)^2 / d^4
+        dsdd = (-4.0 * difference ** 2 / d ** 5 - 2.0 * difference / d ** 4) * (1 - np.eye(natom))
+        # gradient on atom i is -sum_j dsdd * vectors[i, j] / d
+        forces[k-1] = np.einsum("ij,ijk->ik", dsdd / d, vectors)
+    # project out the tangential part and add the spring force along the tangent
+    forward = path[2:] - path[1:-1]
+    backward = path[1:-1] - path[:-2]
+    if cell is not None:
+        forward = _mic(forward, cell)
+        backward = _mic(backward, cell)
+    tangent = forward + backward
+    tangent /= np.linalg.norm(tangent.reshape(nimage, -1), axis=1)[:, None, None]
+    parallel = np.sum(forces * tangent, axis=(1, 2))
+    stretch = spring * (np.linalg.norm(forward.reshape(nimage, -1), axis=1) - np.linalg.norm(backward.reshape(nimage, -1), axis=1))
+    return forces - (parallel - stretch)[:, None, None] * tangent
@@ -0,0 +1,237 @@
+"""
+periodic neighbor search with linked cells
+"""
+import itertools
+import numpy as np
+
+
+"""
+Usage:
+    from pymatflow.structure.neighbor import get_neighbor_list
+    nl = get_neighbor_list(structure, cutoff=3.0)
+    nl.coordination() # number of neighbors of each atom
+    j, shifts, distances = nl.get_neighbors(0)
+    i, j, distances = nl.pairs() # each pair counted once
+
+Note:
+    the atoms are put into bins in fractional space, the number of bins along
+    each lattice vector is chosen so that the width of a bin(the distance between
+    its two faces) is no less than the cutoff, so only the neighboring bins need
+    to be searched. when a lattice vector is shorter than the cutoff, the search
+    goes through the bins of several periodic images, so cells of any shape(triclinic)
+    and size work. the pairs are generated by numpy for one bin offset at a time,
+    no python loop over atoms is involved, and a million atoms takes seconds.
+
+    the result is stored in CSR format: neighbors of atom i are
+    neighbors[first[i]:first[i+1]], with the lattice translation of the image
+    in shifts and the distance in distances. the displacement vector from atom
+    i to the neighbor is positions[j] + shifts.dot(cell) - positions[i].
+"""
+
+class neighbor_list:
+    """
+    neighbor list in CSR format
+    """
+    def __init__(self):
+        self.natom = 0
+        self.cutoff = None
+        self.first = np.zeros(1, dtype=int) # (natom+1,) begining of neighbors of each atom
+        self.neighbors = np.zeros(0, dtype=int) # index of neighbor atoms
+        self.shifts = np.zeros((0, 3), dtype=int) # lattice translation of the neighbor image
+        self.distances = np.zeros(0) # distance to the neighbor
+
+    def build(self, positions, cell, cutoff, pbc=[True, True, True], self_interaction=False):
+        """
+        :param positions: (natom, 3) array like cartesian coordinates
+        :param cell: [[a1, a2, a3], [b1, b2, b3], [c1, c2, c3]], or None for molecules
+        :param cutoff: cutoff radius in unit of Angstrom
+        :param pbc: whether periodic along each lattice vector, ignored when cell is None
+        :param self_interaction: whether an atom is neighbor of itself(with zero shift)
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        self.natom = positions.shape[0]
+        self.cutoff = cutoff
+        i, j, shifts, distances = _search(None, positions, cell, cutoff, pbc)
+        if self_interaction == False:
+            keep = (i != j) | np.any(shifts != 0, axis=1)
+            i, j, shifts, distances = i[keep], j[keep], shifts[keep], distances[keep]
+        order = np.argsort(i, kind="stable")
+        self.neighbors = j[order]
+        self.shifts = shifts[order]
+        self.distances = distances[order]
+        self.first = np.zeros(self.natom + 1, dtype=int)
+        np.cumsum(np.bincount(i, minlength=self.natom), out=self.first[1:])
+        return self
+
+    def get_neighbors(self, i):
+        """
+        :return (neighbors, shifts, distances) of atom i
+        """
+        begin, end = self.first[i], self.first[i+1]
+        return self.neighbors[begin:end], self.shifts[begin:end], self.distances[begin:end]
+
+    def coordination(self, cutoff=None):
+        """
+        :param cutoff: count only neighbors within it, default to the cutoff of the list
+        :return (natom,) number of neighbors of each atom
+        """
+        if cutoff is None:
+            return np.diff(self.first)
+        center = np.repeat(np.arange(self.natom), np.diff(self.first))
+        return np.bincount(center[self.distances <= cutoff], minlength=self.natom)
+
+    def pairs(self):
+        """
+        :return (i, j, distances), each pair appears once with i < j, or with
+            i == j for an atom and its own periodic images
+        """
+        center = np.repeat(np.arange(self.natom), np.diff(self.first))
+        # of the two entries of a pair keep i < j, or the one with positive shift for i == j
+        keep = (center < self.neighbors) | ((center == self.neighbors) & (_first_nonzero(self.shifts) > 0))
+        return center[keep], self.neighbors[keep], self.distances[keep]
+
+
+def get_neighbor_list(structure, cutoff, pbc=[True, True, True], self_interaction=False):
+    """
+    :param structure: an instance of pymatflow.structure.crystal.crystal()
+    :param cutoff: cutoff radius in unit of Angstrom
+    :return an instance of neighbor_list
+    """
+    return neighbor_list().build(structure.atoms.positions, structure.cell, cutoff, pbc=pbc, self_interaction=self_interaction)
+
+def atoms_within(structure, center, radius, pbc=[True, True, True]):
+    """
+    find the atoms(and their periodic images) within radius of a point
+    :param structure: an instance of pymatflow.structure.crystal.crystal()
+    :param center: [x, y, z] cartesian coordinate of the point
+    :param radius: in unit of Angstrom
+    :return (index, shifts, distances): index of the atoms, lattice translation
+        of the image and the distance to center, sorted by distance
+    """
+    _, j, shifts, distances = _search(np.reshape(np.asarray(center, dtype=float), (1, 3)), structure.atoms.positions, structure.cell, radius, pbc)
+    order = np.argsort(distances, kind="stable")
+    return j[order], shifts[order], distances[order]
+
+def find_overlaps(structure, tolerance=0.5, pbc=[True, True, True]):
+    """
+    find pairs of atoms closer than tolerance, useful to check merged or cleaved structures
+    :param structure: an instance of pymatflow.structure.crystal.crystal()
+    :param tolerance: in unit of Angstrom
+    :return (i, j, distances) of the overlapping pairs, each pair appears once
+    """
+    return get_neighbor_list(structure, tolerance, pbc=pbc).pairs()
+
+
+def _first_nonzero(shifts):
+    """
+    :return sign of the first nonzero component of each shift
+    """
+    sign = np.sign(shifts)
+    first = np.argmax(sign != 0, axis=1)
+    return sign[np.arange(sign.shape[0]), first]
+
+def _search(queries, positions, cell, cutoff, pbc, max_bins_per_atom=8):
+    """
+    linked cell search of all (query, atom, image) within cutoff
+    queries:
+        (nquery, 3) points to search around, or None to search around the atoms
+        themselves, in which case only half of the bin offsets are searched
+    :return (i, j, shifts, distances): index of query, index of atom, lattice
+        translation of the atom image and distance
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    symmetric = queries is None
+    queries = positions if symmetric else np.asarray(queries, dtype=float).reshape(-1, 3)
+    natom = positions.shape[0]
+    if cell is None:
+        # molecule, search in cartesian space
+        cell = np.eye(3)
+        pbc = [False, False, False]
+    cell = np.array(cell, dtype=float)
+    pbc = np.array(pbc, dtype=bool)
+    if natom == 0 or queries.shape[0] == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros((0, 3), dtype=int), np.zeros(0)
+
+    inverse = np.linalg.inv(cell)
+    frac = positions.dot(inverse)
+    frac_q = queries.dot(inverse)
+    # wrap periodic directions into [0, 1), and remember the translation removed
+    wrap = np.where(pbc, np.floor(frac), 0.0)
+    wrap_q = np.where(pbc, np.floor(frac_q), 0.0)
+    frac = frac - wrap
+    frac_q = frac_q - wrap_q
+    # range of fractional coordinates covered by the bins along each direction
+    low = np.where(pbc, 0.0, frac.min(axis=0))
+    high = np.where(pbc, 1.0, frac.max(axis=0))
+    # distance between the two faces of the cell perpendicular to each lattice vector
+    volume = abs(np.linalg.det(cell))
+    spacing = np.array([volume / np.linalg.norm(np.cross(cell[(k+1)%3], cell[(k+2)%3])) for k in range(3)])
+    extent = (high - low) * spacing
+    nbins = np.maximum(1, np.floor(extent / cutoff)).astype(int)
+    # limit the total number of bins for sparse systems
+    limit = max_bins_per_atom * natom + 27
+    if np.prod(nbins.astype(float)) > limit:
+        nbins = np.maximum(1, np.floor(nbins / (np.prod(nbins.astype(float)) / limit) ** (1.0 / 3))).astype(int)
+    width = np.where(extent > 0, extent / nbins, 0.0)
+    # number of bins to search on each side
+    reach = np.where(width > 0, np.ceil(cutoff / np.where(width > 0, width, 1.0)), 0).astype(int)
+    reach = np.where(pbc, reach, np.minimum(reach, nbins - 1))
+
+    def bin_of(f):
+        scaled = (f - low) / np.where(high > low, high - low, 1.0) * nbins
+        return np.clip(np.floor(scaled).astype(int), 0, nbins - 1)
+
+    bins = bin_of(frac)
+    bins_q = bin_of(frac_q)
+    flat = np.ravel_multi_index(bins.T, nbins)
+    order = np.argsort(flat, kind="stable")
+    count = np.bincount(flat, minlength=int(np.prod(nbins)))
+    start = np.zeros(count.shape[0] + 1, dtype=int)
+    np.cumsum(count, out=start[1:])
+
+    # wrapped cartesian coordinates
+    cart = frac.dot(cell)
+    cart_q = frac_q.dot(cell)
+    out_i, out_j, out_s, out_d = [], [], [], []
+    query_index = np.arange(queries.shape[0])
+    for offset in itertools.product(*[range(-r, r + 1) for r in reach]):
+        if symmetric == True and offset < (0, 0, 0):
+            # found as the reverse of the pairs of the opposite offset
+            continue
+        target = bins_q + np.array(offset)
+        image = np.floor_divide(target, nbins)
+        valid = np.all(pbc | (image == 0), axis=1)
+        if not np.any(valid):
+            continue
+        image = image[valid]
+        target = target - image * nbins if np.all(valid) else target[valid] - image * nbins
+        t_flat = np.ravel_multi_index(target.T, nbins)
+        n = count[t_flat]
+        total = int(n.sum())
+        if total == 0:
+            continue
+        # expand to all (query, atom in the target bin) pairs, local is the index among valid queries
+        local = np.repeat(np.arange(n.shape[0]), n)
+        base = np.repeat(start[t_flat] - np.concatenate(([0], np.cumsum(n)[:-1])), n)
+        aj = order[base + np.arange(total)]
+        # the query moved by minus the image translation instead of moving every atom
+        vector = cart[aj] - (cart_q[valid] - image.dot(cell))[local]
+        distance = np.einsum("ij,ij->i", vector, vector)
+        close = np.nonzero(distance <= cutoff * cutoff)[0]
+        local, aj = local[close], aj[close]
+        qi = query_index[valid][local]
+        # translation with respect to the unwrapped positions
+        shift = (image[local] - wrap[aj] + wrap_q[qi]).astype(int)
+        distance = np.sqrt(distance[close])
+        out_i.append(qi)
+        out_j.append(aj)
+        out_s.append(shift)
+        out_d.append(distance)
+        if symmetric == True and offset != (0, 0, 0):
+            out_i.append(aj)
+            out_j.append(qi)
+            out_s.append(-shift)
+            out_d.append(distance)
+    if len(out_i) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros((0, 3), dtype=int), np.zeros(0)
+    return np.concatenate(out_i), np.concatenate(out_j), np.concatenate(out_s), np.concatenate(out_d)
@@ -0,0 +1,131 @@
+"""
+mask based selection and removal of atoms
+"""
+import copy
+import numpy as np
+
+from pymatflow.structure.neighbor import atoms_within
+
+
+"""
+Usage:
+    from pymatflow.structure.selection import select_atoms, remove_atoms_where, sphere, box
+    # atoms of Ga within 5 Angstrom of a point
+    cluster = select_atoms(structure, species="Ga", region=sphere([0, 0, 0], 5.0))
+    # remove the atoms in the upper half of the cell
+    slab = remove_atoms_where(structure, region=box(low=[None, None, 0.5], frac=True))
+    # any vectorized predicate on the arrays of atoms_array
+    mask = get_mask(structure, where=lambda atoms: atoms.positions[:, 2] > 10.0)
+
+Note:
+    every criterion gives a bool array over all atoms and they are combined with
+    logical and, the atoms are then taken or dropped by one numpy fancy indexing
+    (atoms_array.select/delete), so selection and removal are linear in the
+    number of atoms. select_atoms and remove_atoms_where return new structures
+    and leave the input untouched.
+"""
+
+class sphere:
+    """
+    region of the atoms within radius of center
+    """
+    def __init__(self, center, radius, pbc=False):
+        """
+        :param center: [x, y, z] in cartesian coordinates
+        :param radius: in unit of Angstrom
+        :param pbc: whether periodic images are considered, an atom is selected
+            if any of its images is within the sphere
+        """
+        self.center = center
+        self.radius = radius
+        self.pbc = pbc
+
+    def mask(self, structure):
+        out = np.zeros(len(structure.atoms), dtype=bool)
+        if self.pbc == True and structure.cell is not None:
+            index, shifts, distances = atoms_within(structure, self.center, self.radius)
+            out[index] = True
+        else:
+            vector = structure.atoms.positions - np.array(self.center, dtype=float)
+            out[:] = np.einsum("ij,ij->i", vector, vector) <= self.radius ** 2
+        return out
+
+class box:
+    """
+    region of the atoms with low <= coordinates < high
+    """
+    def __init__(self, low=[None, None, None], high=[None, None, None], frac=False):
+        """
+        :param low, high: bounds along each direction, None means no bound
+        :param frac: whether the bounds are in fractional coordinates, otherwise cartesian
+        """
+        self.low = low
+        self.high = high
+        self.frac = frac
+
+    def mask(self, structure):
+        if self.frac == True:
+            coords = structure.atoms.get_fractional(structure.cell)
+        else:
+            coords = structure.atoms.positions
+        out = np.ones(coords.shape[0], dtype=bool)
+        for k in range(3):
+            if self.low[k] is not None:
+                out &= coords[:, k] >= self.low[k]
+            if self.high[k] is not None:
+                out &= coords[:, k] < self.high[k]
+        return out
+
+
+def get_mask(structure, indices=None, species=None, region=None, where=None, invert=False):
+    """
+    :param structure: an instance of crystal() or base_xyz()
+    :param indices: bool mask or list of index(counting starts with 0) of atoms
+    :param species: name or list of names of elements
+    :param region: a region like sphere() or box(), or a list of them(atoms in all of them)
+    :param where: a function taking structure.atoms(an atoms_array) and returning a bool array
+    :param invert: select the atoms not matching the criteria
+    :return (natom,) bool array, atoms matching all the given criteria
+    """
+    natom = len(structure.atoms)
+    out = np.ones(natom, dtype=bool)
+    if indices is not None:
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            out &= indices
+        else:
+            chosen = np.zeros(natom, dtype=bool)
+            chosen[indices.astype(int)] = True
+            out &= chosen
+    if species is not None:
+        out &= np.isin(structure.atoms.symbols, [species] if isinstance(species, str) else list(species))
+    if region is not None:
+        for item in (region if isinstance(region, (list, tuple)) else [region]):
+            out &= item.mask(structure)
+    if where is not None:
+        out &= np.asarray(where(structure.atoms), dtype=bool)
+    return ~out if invert == True else out
+
+def select_atoms(structure, **kwargs):
+    """
+    :param kwargs: criteria of get_mask()
+    :return a new structure(of the same class, with a copy of cell) of the selected atoms
+    """
+    mask = get_mask(structure, **kwargs)
+    out = copy.copy(structure)
+    out.cell = copy.deepcopy(structure.cell)
+    out.atoms = structure.atoms.select(mask)
+    if hasattr(out, "natom"):
+        out.natom = len(out.atoms)
+    if hasattr(out, "specie_labels"):
+        # base_xyz
+        out.set_species_number()
+    return out
+
+def remove_atoms_where(structure, **kwargs):
+    """
+    :param kwargs: criteria of get_mask()
+    :return a new structure without the matching atoms
+    """
+    kwargs["invert"] = not kwargs.get("invert", False)
+    return select_atoms(structure, **kwargs)
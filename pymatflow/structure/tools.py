@@ -7,6 +7,21 @@ import copy
 import numpy as np
 
 
+def check_overlaps(structure, tolerance=0.5):
+    """
+    :param structure: an instance of pymatflow.structure.crystal.crystal()
+    :param tolerance: atoms closer than it(in unit of Angstrom) are considered overlapping
+    :return number of overlapping pairs of atoms, a warning is printed if there is any
+    """
+    from pymatflow.structure.neighbor import find_overlaps
+    overlap_i, overlap_j, overlap_d = find_overlaps(structure, tolerance=tolerance)
+    if overlap_i.shape[0] > 0:
+        print("=============================================================================\n")
+        print("                              WARNING \n")
+        print("------------------------------------------------------------------------------\n")
+        print("%d pairs of atoms in the structure are closer than %f Angstrom\n" % (overlap_i.shape[0], tolerance))
+    return overlap_i.shape[0]
+
 def move_along(structure, atoms_to_move, direc, disp):
     """
     :param structure: an instance of pymatflow.structure.crystal.crystal()
@@ -28,14 +43,8 @@ def move_along(structure, atoms_to_move, direc, disp):
     length = np.sqrt(direc_cartesian[0]**2+direc_cartesian[1]**2+direc_cartesian[2]**2)
     direc_cartesian = direc_cartesian / length
 
-    deltax = direc_cartesian[0] * disp
-    deltay = direc_cartesian[1] * disp
-    deltaz = direc_cartesian[2] * disp
-
-    for i in atoms_to_move:
-        structure.atoms[i].x += deltax
-        structure.atoms[i].y += deltay
-        structure.atoms[i].z += deltaz
+    # np.add.at moves an atom listed twice twice, like the loop over atoms_to_move did
+    np.add.at(structure.atoms.positions, np.asarray(atoms_to_move, dtype=int), direc_cartesian * disp)
     # end
 
 def remove_atoms(structure, atoms_to_remove):
@@ -51,10 +60,8 @@ def remove_atoms(structure, atoms_to_remove):
         print("the atom you are trying to remove is beyond the number of atoms in the structure\n")
         sys.exit(1)
 
-    for i in atoms_to_remove:
-        structure.atoms[i] = None
-    while None in structure.atoms:
-        structure.atoms.remove(None)
+    from pymatflow.structure.selection import get_mask
+    structure.atoms.delete(get_mask(structure, indices=atoms_to_remove))
     # end    
 
 def vacuum_layer(structure, plane, thickness):
@@ -71,30 +78,24 @@ def vacuum_layer(structure, plane, thickness):
         # get the cos of the angle between c and outer product of ab
         cosangle = np.dot(np.array(structure.cell[2]), normal_of_ab) / np.linalg.norm(np.array(structure.cell[2])) / np.linalg.norm(normal_of_ab)
         proj_c_on_ab_normal = np.linalg.norm(np.array(structure.cell[2])) * np.abs(cosangle)
-        z_all = []
-        for atom in structure.atoms:
-            z_all.append(atom.z)
-        factor = (max(z_all) - min(z_all) + thickness)  / proj_c_on_ab_normal * 1.0
+        z_all = structure.atoms.positions[:, 2]
+        factor = (z_all.max() - z_all.min() + thickness)  / proj_c_on_ab_normal * 1.0
         structure.cell[2] = list(np.array(structure.cell[2]) * factor)
     elif plane == 2:
         normal_of_ac = np.cross(structure.cell[0], structure.cell[2])
         # get the cos of the angle between b and outer product of ac
         cosangle = np.dot(np.array(structure.cell[1]), normal_of_ac) / np.linalg.norm(np.array(structure.cell[1])) / np.linalg.norm(normal_of_ac)
         proj_b_on_ac_normal = np.linalg.norm(np.array(structure.cell[1])) * np.abs(cosangle)
-        y_all = []
-        for atom in structure.atoms:
-            y_all.append(atom.y)
-        factor = (max(y_all) - min(y_all) + thickness)  / proj_b_on_ac_normal * 1.0
+        y_all = structure.atoms.positions[:, 1]
+        factor = (y_all.max() - y_all.min() + thickness)  / proj_b_on_ac_normal * 1.0
         structure.cell[1] = list(np.array(structure.cell[1]) * factor)        
     elif plane == 3:
         normal_of_bc = np.cross(structure.cell[1], structure.cell[2])
         # get the cos of the angle between a and outer product of bc
         cosangle = np.dot(np.array(structure.cell[0]), normal_of_bc) / np.linalg.norm(np.array(structure.cell[0])) / np.linalg.norm(normal_of_bc)
         proj_a_on_bc_normal = np.linalg.norm(np.array(structure.cell[0])) * np.abs(cosangle)
-        x_all = []
-        for atom in structure.atoms:
-            x_all.append(atom.x)
-        factor = (max(x_all) - min(x_all) + thickness)  / proj_a_on_bc_normal * 1.0
+        x_all = structure.atoms.positions[:, 0]
+        factor = (x_all.max() - x_all.min() + thickness)  / proj_a_on_bc_normal * 1.0
         structure.cell[0] = list(np.array(structure.cell[0]) * factor)
     else:
         pass
@@ -107,38 +108,21 @@ def set_frac_min_to_zero(structure):
         set the fractional coordinate minimum to zero, this is a way of standardize the cif file
     """
     from pymatflow.structure.crystal import crystal
-    from pymatflow.base.atom import Atom
+    from pymatflow.base.atoms import atoms_array
 
 
     # now calc the fractional coordinates
-    atoms_frac = []
-    latcell = np.array(structure.cell)
-    convmat = np.linalg.inv(latcell.T)
-    for i in range(len(structure.atoms)):
-        atom = []
-        atom.append(structure.atoms[i].name)
-        atom = atom + list(convmat.dot(np.array([structure.atoms[i].x, structure.atoms[i].y, structure.atoms[i].z])))
-        atoms_frac.append(atom)
+    frac = structure.atoms.get_fractional(structure.cell)
     
     # set the minimum of fractional coord to to 0
-    min_frac_x = min(atoms_frac[:][1])
-    min_frac_y = min(atoms_frac[:][2])
-    min_frac_z = min(atoms_frac[:][3])
-    for i in range(len(atoms_frac)):
-        atoms_frac[i][1] -= min_frac_x
-        atoms_frac[i][2] -= min_frac_y
-        atoms_frac[i][3] -= min_frac_z
+    frac = frac - frac.min(axis=0)
     
             
-    # now convert coord of atom in atoms_frac_within_new_cell to cartesian
+    # now convert the fractional coordinates to cartesian
     out = crystal()
-    out.atoms = []
-    out.cell = structure.cell
-    latcell = np.array(out.cell)
-    convmat_frac_to_cartesian = latcell.T
-    for atom in atoms_frac:
-        cartesian = list(convmat_frac_to_cartesian.dot(np.array([atom[1], atom[2], atom[3]])))
-        out.atoms.append(Atom(name=atom[0], x=cartesian[0], y=cartesian[1], z=cartesian[2]))
+    out.atoms = atoms_array()
+    out.cell = copy.deepcopy(structure.cell)
+    out.atoms.extend_arrays(structure.atoms.symbols, frac.dot(np.array(out.cell)))
     #
     
     return out
@@ -150,36 +134,20 @@ def set_frac_within_zero_and_one(structure):
         set the fractional coordinate within the range of 0 and 1, this is a way of standardize the cif file
     """
     from pymatflow.structure.crystal import crystal
-    from pymatflow.base.atom import Atom
+    from pymatflow.base.atoms import atoms_array
 
 
     # now calc the fractional coordinates
-    atoms_frac = []
-    latcell = np.array(structure.cell)
-    convmat = np.linalg.inv(latcell.T)
-    for i in range(len(structure.atoms)):
-        atom = []
-        atom.append(structure.atoms[i].name)
-        atom = atom + list(convmat.dot(np.array([structure.atoms[i].x, structure.atoms[i].y, structure.atoms[i].z])))
-        atoms_frac.append(atom)
+    frac = structure.atoms.get_fractional(structure.cell)
     
     # set the fractional coordinates within 0 and 1
-    for i in range(len(atoms_frac)):
-        for j in range(1, 4):
-            while atoms_frac[i][j] >= 1:
-                atoms_frac[i][j] -= 1
-            while atoms_frac[i][j] < 0:
-                atoms_frac[i][j] += 1
+    frac = frac - np.floor(frac)
             
-    # now convert coord of atom in atoms_frac_within_new_cell to cartesian
+    # now convert the fractional coordinates to cartesian
     out = crystal()
-    out.atoms = []
-    out.cell = structure.cell
-    latcell = np.array(out.cell)
-    convmat_frac_to_cartesian = latcell.T
-    for atom in atoms_frac:
-        cartesian = list(convmat_frac_to_cartesian.dot(np.array([atom[1], atom[2], atom[3]])))
-        out.atoms.append(Atom(name=atom[0], x=cartesian[0], y=cartesian[1], z=cartesian[2]))
+    out.atoms = atoms_array()
+    out.cell = copy.deepcopy(structure.cell)
+    out.atoms.extend_arrays(structure.atoms.symbols, frac.dot(np.array(out.cell)))
     #
     return out        
     
@@ -191,21 +159,9 @@ def inverse_geo_center(structure):
     :param structure: an instance of pymatflow.structure.crystal.crystal()
     """
     # calc the geometric center
-    x = 0
-    y = 0
-    z = 0
-    for atom in structure.atoms:
-        x += atom.x
-        y += atom.y
-        z += atom.z
-    x /= len(structure.atoms)
-    y /= len(structure.atoms)
-    z /= len(structure.atoms)
+    center = structure.atoms.positions.mean(axis=0)
     # now get the symmetry image against the geometric center
-    for atom in structure.atoms:
-        atom.x = x * 2 - atom.x
-        atom.y = y * 2 - atom.y
-        atom.z = z * 2 - atom.z
+    structure.atoms.positions = center * 2 - structure.atoms.positions
     # end
 
 def inverse_point(structure, point):
@@ -215,10 +171,7 @@ def inverse_point(structure, point):
     :param point: the inverse center point, like [0.0, 0.0, 0.0]
     """
     # now get the symmetry image against the inverse center
-    for atom in structure.atoms:
-        atom.x = point[0] * 2 - atom.x
-        atom.y = point[1] * 2 - atom.y
-        atom.z = point[2] * 2 - atom.z
+    structure.atoms.positions = np.array(point, dtype=float) * 2 - structure.atoms.positions
     # end
 
 def inverse_cell_center(structure):
@@ -228,19 +181,9 @@ def inverse_cell_center(structure):
     """
     # first transfer to fractional coordinate and inverse against [0.5, 0.5, 0.5]
     structure.natom = len(structure.atoms)
-    frac = structure.get_fractional()
-    for atom in frac:
-        atom[1] = 0.5 * 2 - atom[1]
-        atom[2] = 0.5 * 2 - atom[2]
-        atom[3] = 0.5 * 2 - atom[3]
+    frac = structure.atoms.get_fractional(structure.cell)
     # convert frac to cartesian again
-    latcell = np.array(structure.cell)
-    convmat = latcell.T
-    from pymatflow.base.atom import Atom
-    structure.atoms = []
-    for atom in frac:
-        cartesian = list(convmat.dot(np.array([atom[1], atom[2], atom[3]])))
-        structure.atoms.append(Atom(name=atom[0], x=cartesian[0], y=cartesian[1], z=cartesian[2]))
+    structure.atoms.set_fractional(0.5 * 2 - frac, structure.cell)
     #
 
 def rotate_along_axis(structure, rotate_atoms=[], axis=[]):
@@ -251,6 +194,40 @@ def rotate_along_axis(structure, rotate_atoms=[], axis=[]):
     pass
     
     
+def replicate_atoms(positions, cell, offsets):
+    """
+    :param positions: (natom, 3) array like cartesian coordinates of the atoms
+    :param cell: [[a1, a2, a3], [b1, b2, b3], [c1, c2, c3]]
+    :param offsets: [offsets_a, offsets_b, offsets_c], integer offsets of the images
+        along each lattice vector, like [range(2), range(2), range(1)]
+    :return (nimage*natom, 3) array of cartesian coordinates of all images
+    Note: images are ordered with the offsets along a running fastest, and each image
+        holds all the atoms in their original order, so the species of the result is
+        np.tile(species, nimage). the translations are added by numpy broadcasting of
+        (natom, 3) positions over the translation vectors along a, b and c in turn,
+        instead of creating one Atom per image.
+    """
+    cell = np.array(cell, dtype=float)
+    translations = [np.array(offsets[i], dtype=float).reshape(-1, 1) * cell[i] for i in range(3)]
+    out = np.asarray(positions, dtype=float).reshape(1, 1, 1, -1, 3) + translations[0][None, None, :, None, :]
+    out = out + translations[1][None, :, None, None, :]
+    out = out + translations[2][:, None, None, None, :]
+    return out.reshape(-1, 3)
+
+def enlarge_positions(structure, n):
+    """
+    :param n: [n1, n2, n3]
+    :return (species, positions):
+        species: array of name of each atom
+        positions: (natom*8*n1*n2*n3, 3) array of cartesian coordinates
+    Note: the atoms in the unit cell are replicated n[i] times along both cell[i] and -cell[i],
+        the array backed version of enlarge_atoms
+    """
+    offsets = [list(range(n[i])) + list(range(-n[i], 0)) for i in range(3)]
+    positions = replicate_atoms([[atom.x, atom.y, atom.z] for atom in structure.atoms], structure.cell, offsets)
+    species = np.tile(np.array([atom.name for atom in structure.atoms]), 8 * n[0] * n[1] * n[2])
+    return species, positions
+
 def enlarge_atoms(structure):
     """
     :return out:
@@ -263,7 +240,6 @@ def enlarge_atoms(structure):
         The goal is to make sure when the cell rotate in the 3D space, it will always be filled
         with atoms.
     """
-    from pymatflow.base.atom import Atom
     #
     cell = copy.deepcopy(structure.cell)
     a = np.linalg.norm(cell[0])
@@ -276,23 +252,8 @@ def enlarge_atoms(structure):
     n = [int(n1), int(n2), int(n3)]
     print(n)
     
-    atoms = copy.deepcopy(structure.atoms)
-    # build supercell: replica in three vector one by one
-    for i in range(3):
-        natom_now = len(atoms)
-        for j in range(n[i] - 1):
-            for atom in atoms[:natom_now]:
-                x = atom.x + float(j + 1) * structure.cell[i][0]
-                y = atom.y + float(j + 1) * structure.cell[i][1]
-                z = atom.z + float(j + 1) * structure.cell[i][2]
-                atoms.append(Atom(atom.name, x, y, z))
-        # replicate in the negative direction of structure.cell[i]
-        for atom in atoms[:natom_now*n[i]]:
-            x = atom.x - float(n[i]) * structure.cell[i][0]
-            y = atom.y - float(n[i]) * structure.cell[i][1]
-            z = atom.z - float(n[i]) * structure.cell[i][2]
-            atoms.append(Atom(atom.name, x, y, z))
-    return [[atom.name, atom.x, atom.y, atom.z] for atom in atoms]
+    species, positions = enlarge_positions(structure, n)
+    return [[name, x, y, z] for name, (x, y, z) in zip(species.tolist(), positions.tolist())]
 
 def enlarge_atoms_new_cell(structure, new_cell):
     """
@@ -308,7 +269,6 @@ def enlarge_atoms_new_cell(structure, new_cell):
         The goal is to make sure when the new cell rotate in the 3D space, it will always be filled
         with atoms.    
     """
-    from pymatflow.base.atom import Atom
     #
     cell = copy.deepcopy(structure.cell)
     a = np.linalg.norm(cell[0])
@@ -325,27 +285,42 @@ def enlarge_atoms_new_cell(structure, new_cell):
     n = [int(n1), int(n2), int(n3)]
     
     print("n1 n2 n3: %d %d %d\n" % (n1, n2, n3))
-    atoms = copy.deepcopy(structure.atoms)
-    print("atoms.size(): %d\n" % len(atoms))    
-    # build supercell: replica in three vector one by one
-    for i in range(3):
-        natom_now = len(atoms)
-        for j in range(n[i] - 1):
-            for atom in atoms[:natom_now]:
-                x = atom.x + float(j + 1) * structure.cell[i][0]
-                y = atom.y + float(j + 1) * structure.cell[i][1]
-                z = atom.z + float(j + 1) * structure.cell[i][2]
-                atoms.append(Atom(atom.name, x, y, z))
-        # replicate in the negative direction of structure.cell[i]
-        for atom in atoms[:natom_now*n[i]]:
-            x = atom.x - float(n[i]) * structure.cell[i][0]
-            y = atom.y - float(n[i]) * structure.cell[i][1]
-            z = atom.z - float(n[i]) * structure.cell[i][2]
-            atoms.append(Atom(atom.name, x, y, z))
-    return [[atom.name, atom.x, atom.y, atom.z] for atom in atoms]
-    
-
-def redefine_lattice(structure, a, b, c, precision=1.0e-8):
+    print("atoms.size(): %d\n" % len(structure.atoms))    
+    species, positions = enlarge_positions(structure, n)
+    return [[name, x, y, z] for name, (x, y, z) in zip(species.tolist(), positions.tolist())]
+    
+
+def lattice_translations(transform, precision=1.0e-8):
+    """
+    :param transform: (3, 3) new lattice vectors in terms of old, in rows
+    :return generator of (n, 3) integer arrays of the translations of the old cell whose
+        image can intersect the new cell, one slab of translations along a at a time
+    Note:
+        the new cell spans [0, 1) in the fractional coordinates g regarding it, and an atom
+        with fractional coordinates f in [0, 1) regarding the old cell and translated by T
+        has g = (f + T).dot(inv(transform)). as it is linear, the range of g for the whole
+        old cell translated by T is T.dot(inv(transform)) plus the sum of the negative or
+        positive elements of each column of inv(transform), so translations whose range
+        misses [0, 1) are dropped without looking at the atoms.
+    """
+    transform = np.array(transform, dtype=float)
+    inverse = np.linalg.inv(transform)
+    # corners of the new cell in fractional coordinates of the old cell
+    corners = np.array([[i, j, k] for i in range(2) for j in range(2) for k in range(2)], dtype=float).dot(transform)
+    low = np.floor(corners.min(axis=0) - precision).astype(int) - 1
+    high = np.ceil(corners.max(axis=0) + precision).astype(int)
+    lower = np.minimum(inverse, 0).sum(axis=0)
+    upper = np.maximum(inverse, 0).sum(axis=0)
+    t2, t3 = np.meshgrid(np.arange(low[1], high[1] + 1), np.arange(low[2], high[2] + 1), indexing="ij")
+    slab = np.stack([np.zeros(t2.size, dtype=int), t2.ravel(), t3.ravel()], axis=1)
+    for t1 in range(low[0], high[0] + 1):
+        slab[:, 0] = t1
+        g = slab.dot(inverse)
+        keep = np.all(g + upper > -precision, axis=1) & np.all(g + lower < 1 - precision, axis=1)
+        if np.any(keep):
+            yield slab[keep].copy()
+
+def redefine_lattice(structure, a, b, c, precision=1.0e-8, tolerance=1.0e-3, chunk=1000000):
     """
     :param a, b, c: new lattice vectors in terms of old.
         new_a = a[0] * old_a + a[1] * old_b + a[2] * old_c
@@ -353,13 +328,17 @@ def redefine_lattice(structure, a, b, c, precision=1.0e-8):
         same lattice as old.
     :param precision, a value that is less than 1 and infinitely close to 1
         used to judge whether one atom is in another periodic of the redefined cell
+    :param tolerance: atoms of the same element closer than it(in unit of Angstrom) in the
+        redefined cell are duplicates and only the first one is kept, 0 to disable
+    :param chunk: maximum number of candidate positions generated at a time
     :return an object of crystal()
     Method:
-        first make a large enough supercell, which guarantee that all the atoms in the new lattice are inside
-        the supercell.
-        then redfine the cell, and calc the fractional coord of all atoms with regarding the new cell
-        finally remove those atoms who's fractional coord is not within range [0, 1), and we can convert fractional
-        coords to cartesian.
+        only the translations of the old cell whose image can intersect the new cell
+        are generated(see lattice_translations), the fractional coordinates regarding
+        the new cell of all atoms in all those translations are calculated by numpy
+        broadcasting, and atoms whose fractional coord is not within range
+        [-precision, 1-precision) are removed in one pass. the remaining fractional coords
+        are converted to cartesian with the new cell.
     Note:
         relationship among convertion of coords. the most important point is that all coords actually have one common
         reference system, namely the General XYZ coordinate system. all the cell are defined with XYZ as reference,
@@ -368,137 +347,224 @@ def redefine_lattice(structure, a, b, c, precision=1.0e-8):
         the cartesian with general XYZ as reference. In the last all the coord of atoms and cell have the general 
         XYZ  system as reference. So it works!
     """
+    # fractional coordinates regarding the old cell, within [0, 1)
+    frac = structure.atoms.get_fractional(structure.cell)
+    frac = frac - np.floor(frac)
+    return _redefine_frac(frac, structure.atoms.symbols, structure.cell, [a, b, c], precision=precision, tolerance=tolerance, chunk=chunk)
+
+def _redefine_frac(frac, symbols, cell, transform, precision=1.0e-8, tolerance=1.0e-3, chunk=1000000):
+    """
+    redefine_lattice for atoms given by fractional coordinates within [0, 1) regarding cell
+    """
     from pymatflow.structure.crystal import crystal
-    from pymatflow.base.atom import Atom
-    old_cell = copy.deepcopy(structure.cell)
-    new_cell = copy.deepcopy(structure.cell)
-    new_cell[0] = list(a[0] * np.array(old_cell[0]) + a[1] * np.array(old_cell[1]) + a[2] * np.array(old_cell[2]))
-    new_cell[1] = list(b[0] * np.array(old_cell[0]) + b[1] * np.array(old_cell[1]) + b[2] * np.array(old_cell[2]))
-    new_cell[2] = list(c[0] * np.array(old_cell[0]) + c[1] * np.array(old_cell[1]) + c[2] * np.array(old_cell[2]))
-    
-    
-    # enlarge the system
-    atoms_container = crystal()
-    atoms_container.get_atoms(enlarge_atoms_new_cell(structure=structure, new_cell=new_cell))
-    
-    print("atoms_container.size(): %d\n" % len(atoms_container.atoms))
-    # now calc the fractional coordinates of all atoms in atoms_container with new_cell as reference
-    atoms_frac = []
-    latcell_new = np.array(new_cell)
-    convmat_new = np.linalg.inv(latcell_new.T)
-    for i in range(len(atoms_container.atoms)):
-        atom = []
-        atom.append(atoms_container.atoms[i].name)
-        atom = atom + list(convmat_new.dot(np.array([atoms_container.atoms[i].x, atoms_container.atoms[i].y, atoms_container.atoms[i].z])))
-        atoms_frac.append(atom)
-    
-    atoms_frac_within_new_cell = []
-    for atom in atoms_frac:
-        if (0 <= atom[1] < (1-precision)) and (0 <= atom[2] < (1-precision)) and (0 <= atom[3] < (1-precision)):
-            atoms_frac_within_new_cell.append(atom)
-            
-    # now convert coord of atom in atoms_frac_within_new_cell to cartesian
+    from pymatflow.base.atoms import atoms_array
+    transform = np.array(transform, dtype=float)
+    new_cell = transform.dot(np.array(cell, dtype=float))
+    inverse = np.linalg.inv(transform)
+    natom = frac.shape[0]
+    frac_new = []
+    index = []
+    for translations in lattice_translations(transform, precision=precision):
+        step = max(1, chunk // max(1, natom))
+        for begin in range(0, translations.shape[0], step):
+            g = (frac[None, :, :] + translations[begin:begin+step, None, :]).dot(inverse).reshape(-1, 3)
+            inside = np.nonzero(np.all(g >= -precision, axis=1) & np.all(g < 1 - precision, axis=1))[0]
+            frac_new.append(g[inside])
+            index.append(inside % natom)
+    frac_new = np.concatenate(frac_new) if len(frac_new) > 0 else np.zeros((0, 3))
+    index = np.concatenate(index) if len(index) > 0 else np.zeros(0, dtype=int)
+    # atoms on the faces within -precision are put exactly on the face
+    frac_new = np.maximum(frac_new, 0.0)
+
     out = crystal()
-    out.atoms = []
-    latcell_new = np.array(new_cell)
-    convmat_frac_to_cartesian = latcell_new.T
-    for atom in atoms_frac_within_new_cell:
-        cartesian = list(convmat_frac_to_cartesian.dot(np.array([atom[1], atom[2], atom[3]])))
-        out.atoms.append(Atom(name=atom[0], x=cartesian[0], y=cartesian[1], z=cartesian[2]))
+    out.cell = new_cell.tolist()
+    out.atoms = atoms_array()
+    out.atoms.extend_arrays(symbols[index], frac_new.dot(new_cell))
     #
-    
-    out.cell = new_cell
-    
+    if tolerance > 0 and len(out.atoms) > 1:
+        from pymatflow.structure.neighbor import find_overlaps
+        i, j, distances = find_overlaps(out, tolerance=tolerance)
+        same = (i != j) & (out.atoms.species[i] == out.atoms.species[j])
+        out.atoms.delete(np.unique(np.maximum(i[same], j[same])))
     return out
     
     
-def cleave_surface(structure, direction, thickness=10, precision=1.0e-8):
+def cleave_surface(structure, direction, thickness=10, precision=1.0e-8, miller=False, perpendicular=True):
     """
     :param structure: an instance of crystal()
     :param direction: direction of the surface plane, like [0, 0, 1], the reference of it is three lattice 
         vector a, b, c
     :param precision, a value that is less than 1 and infinitely close to 1
         used to judge whether one atom is in another periodic of the redefined cell used in cleave surface
+    :param miller: if True, direction is the miller index(h, k, l) of the surface plane instead
+    :param perpendicular: if True, new c is the shortest lattice vector perpendicular to the surface
+        when there is one, otherwise the lattice vector out of the surface making the smallest cell
         
     :return an object of crystal()
     
     Note: make use of redefine_lattice() to cleave surface.
-        we try to find new_a and new_b which form the surface plane (the direction is normal to the plane)
+        new_a and new_b which form the surface plane (the direction is normal to the plane) and
+        new_c are found by surface_cleaver.get_vectors()
     """
-    from pymatflow.structure.crystal import crystal
-    #from pymatflow.base.atom import Atom
-    
-    old_cell = copy.deepcopy(structure.cell)
-    direction_xyz_as_ref = list(direction[0] * np.array(old_cell[0]) + direction[1] * np.array(old_cell[1]) + direction[2] * np.array(old_cell[2]))
-    a_from_old = None #[1, 0, 0]
-    b_from_old = None #[0, 1, 0]
-    c_from_old = None #[0, 0, 1]
-    
-    iter_ijk = []
-    iter_ijk.append(0)
-    for i in range(1, 16):
-        iter_ijk.append(i)
-        iter_ijk.append(-i)
-    for i in iter_ijk:
-        if a_from_old != None and b_from_old != None:
-            break
-        for j in iter_ijk:
-            if a_from_old != None and b_from_old != None:
-                break        
-            for k in iter_ijk:
-                if a_from_old != None and b_from_old != None:
-                    break
-                if i == j == k == 0:
-                    continue
-                new_vec = list(i * np.array(old_cell[0]) + j * np.array(old_cell[1]) + k * np.array(old_cell[2]))
-                if np.dot(np.array(new_vec), np.array(direction_xyz_as_ref)) == 0:
-                    if a_from_old == None:
-                        a_from_old = [i, j, k]
-                        new_a = list(a_from_old[0] * np.array(old_cell[0]) + a_from_old[1] * np.array(old_cell[1]) + a_from_old[2] * np.array(old_cell[2]))
-                        continue
-                    elif b_from_old == None:
-                        cosangle = np.dot(np.array(new_vec), np.array(new_a)) / np.linalg.norm(np.array(new_vec)) / np.linalg.norm(np.array(new_a))
-                        sinangle = np.sin(np.arccos(cosangle))
-                        if np.abs(sinangle - 0) < 1.0e-3:
-                            continue
-                        elif 1.0e-5 < cosangle < 1:
-                            # ignore angle between [0, 90) by default
-                            # like we  ignore angle = 60 degree for a and b here, we seek for 120 instead
-                            continue
-                        else:
-                            b_from_old = [i, j, k]
-                            continue
-                
-    #
-    new_c_ijk_sin = []
-    for i in iter_ijk:
-        for j in iter_ijk:
-            for k in iter_ijk:
-                new_c = list(i * np.array(old_cell[0]) + j * np.array(old_cell[1]) + k * np.array(old_cell[2]))
-                cosangle = np.dot(np.array(new_c), np.array(direction_xyz_as_ref)) / np.linalg.norm(np.array(new_c)) / np.linalg.norm(np.array(direction_xyz_as_ref))
-                sinangle = np.sin(np.arccos(cosangle))
-                tmp = [i, j, k, sinangle]
-                new_c_ijk_sin.append(tmp)
-    sin = []
-    for item in new_c_ijk_sin:
-        # sometime item[3] maybe nan, we have to remove it 
-        if not np.isnan(item[3]):
-            sin.append(item[3])
-    min_sin = min(sin)
-    for item in new_c_ijk_sin:
-        if item[3] == min_sin:
-            c_from_old = item[:3]
-            break
+    cleaver = surface_cleaver(structure)
+    a_from_old, b_from_old, c_from_old = cleaver.get_vectors(direction, miller=miller, perpendicular=perpendicular)
     print("a", a_from_old)
     print("b", b_from_old)
     print("c", c_from_old)
-    # redefine lattice
-    out = redefine_lattice(structure=structure, a=a_from_old, b=b_from_old, c=c_from_old, precision=precision)
-    
-    vacuum_layer(structure=out, plane=1, thickness=thickness)
-    
-    return out
-    
+    return cleaver.cleave(direction, thickness=thickness, precision=precision, miller=miller, perpendicular=perpendicular)
+
+def cleave_surfaces(structure, directions, thickness=10, precision=1.0e-8, miller=False, perpendicular=True):
+    """
+    cleave several surfaces of one structure
+    :param directions: list of directions(or miller indices if miller is True) of the surface planes
+    :return list of crystal(), see cleave_surface for the other parameters
+    """
+    cleaver = surface_cleaver(structure)
+    return [cleaver.cleave(direction, thickness=thickness, precision=precision, miller=miller, perpendicular=perpendicular) for direction in directions]
+
+class surface_cleaver:
+    """
+    find the lattice vectors of surfaces and cleave them from one bulk structure
+    Note:
+        the vectors are found with integer arithmetic instead of searching all
+        [i, j, k] in [-15, 15]:
+        the plane normal to direction d has miller index h proportional to G.d, where
+        G is the metric tensor. the integer vectors v with h.v = 0 are spanned by two
+        vectors built from the extended gcd of h, which also gives a third vector with
+        h.v = 1. the two in plane vectors are then reduced by Lagrange-Gauss reduction
+        to the shortest basis(with angle no less than 90 degree like the old search),
+        and the out of plane vector is either the shortest integer vector along the
+        normal inv(G).h or the third vector shifted by in plane vectors to be as
+        upright as possible.
+        the fractional coordinates of the bulk and the results for each plane(d and 2d
+        give the same plane) are kept, so cleaving many surfaces of one structure
+        reuses them.
+    """
+    def __init__(self, structure):
+        self.structure = structure
+        self.cell = np.array(structure.cell, dtype=float)
+        self.metric = self.cell.dot(self.cell.T)
+        frac = structure.atoms.get_fractional(structure.cell)
+        self.frac = frac - np.floor(frac)
+        self.symbols = structure.atoms.symbols
+        self.vectors = {}
+
+    def get_miller(self, direction, miller=False):
+        """
+        :return the miller index of the plane, integers without common divisor
+        """
+        if miller == True:
+            hkl = np.array(direction, dtype=float)
+        else:
+            hkl = self.metric.dot(np.array(direction, dtype=float))
+        hkl = _integer_vector(hkl)
+        if hkl is None:
+            print("=============================================================================\n")
+            print("                              WARNING \n")
+            print("------------------------------------------------------------------------------\n")
+            print("the plane normal to direction %s is not a lattice plane\n" % str(list(direction)))
+            sys.exit(1)
+        return hkl
+
+    def get_vectors(self, direction, miller=False, perpendicular=True):
+        """
+        :return (a, b, c) new lattice vectors in terms of old, a and b in the surface
+        """
+        hkl = self.get_miller(direction, miller=miller)
+        key = (tuple(hkl.tolist()), perpendicular)
+        if key not in self.vectors:
+            self.vectors[key] = self._find_vectors(hkl, perpendicular)
+        return [item.tolist() for item in self.vectors[key]]
+
+    def cleave(self, direction, thickness=10, precision=1.0e-8, miller=False, perpendicular=True):
+        """
+        :return an object of crystal(), the surface with a vacuum layer of thickness
+        """
+        a, b, c = self.get_vectors(direction, miller=miller, perpendicular=perpendicular)
+        out = _redefine_frac(self.frac, self.symbols, self.cell, [a, b, c], precision=precision)
+        vacuum_layer(structure=out, plane=1, thickness=thickness)
+        check_overlaps(out)
+        return out
+
+    def _find_vectors(self, hkl, perpendicular):
+        G = self.metric
+        h, k, l = [int(item) for item in hkl]
+        zero = [h == 0, k == 0, l == 0]
+        if sum(zero) == 2:
+            # plane of two lattice vectors
+            index = zero.index(False)
+            a = np.eye(3, dtype=int)[(index + 1) % 3]
+            b = np.eye(3, dtype=int)[(index + 2) % 3]
+            c = np.eye(3, dtype=int)[index] * (1 if hkl[index] > 0 else -1)
+        else:
+            p, q = _ext_gcd(k, l)
+            x, y = _ext_gcd(p * k + q * l, h)
+            a = np.array([p * k + q * l, -p * h, -q * h], dtype=int)
+            b = np.array([0, l, -k], dtype=int) // _gcd(l, k)
+            c = np.array([y, x * p, x * q], dtype=int)
+        # shortest basis of the surface lattice
+        while True:
+            if b.dot(G).dot(b) < a.dot(G).dot(a):
+                a, b = b, a
+            m = int(np.round(a.dot(G).dot(b) / a.dot(G).dot(a)))
+            if m == 0:
+                break
+            b = b - m * a
+        if a.dot(G).dot(b) > 1.0e-8 * np.sqrt(a.dot(G).dot(a) * b.dot(G).dot(b)):
+            # prefer an obtuse angle like 120 degree over 60 degree
+            b = -b
+        normal = np.linalg.solve(G, hkl.astype(float))
+        upright = _integer_vector(normal) if perpendicular == True else None
+        if upright is not None:
+            c = upright
+        else:
+            # remove the in plane part of c as much as possible
+            gram = np.array([[a.dot(G).dot(a), a.dot(G).dot(b)], [a.dot(G).dot(b), b.dot(G).dot(b)]])
+            m = np.round(np.linalg.solve(gram, [a.dot(G).dot(c), b.dot(G).dot(c)])).astype(int)
+            c = c - m[0] * a - m[1] * b
+        if c.dot(hkl) < 0:
+            c = -c
+        if np.linalg.det(np.array([a, b, c], dtype=float)) < 0:
+            a, b = b, a
+        return a, b, c
+
+def _gcd(a, b):
+    a, b = abs(int(a)), abs(int(b))
+    while b != 0:
+        a, b = b, a % b
+    return a
+
+def _ext_gcd(a, b):
+    """
+    :return (x, y) with a * x + b * y = gcd(a, b)
+    """
+    if b == 0:
+        return (1 if a >= 0 else -1), 0
+    if a % b == 0:
+        return 0, (1 if b > 0 else -1)
+    x, y = _ext_gcd(b, a % b)
+    return y, x - (a // b) * y
+
+def _integer_vector(vector, max_index=100, tolerance=1.0e-6):
+    """
+    :return the shortest integer vector parallel to vector, None if no such vector
+        with components within max_index
+    """
+    vector = np.array(vector, dtype=float)
+    scale = np.abs(vector).max()
+    if scale == 0:
+        return None
+    vector = vector / scale
+    for m in range(1, max_index + 1):
+        candidate = np.round(vector * m)
+        if np.all(np.abs(vector * m - candidate) < tolerance * m):
+            candidate = candidate.astype(int)
+            divisor = 0
+            for item in candidate:
+                divisor = _gcd(divisor, item)
+            return candidate // divisor
+    return None
+
 def merge_layers(structure1, structure2, use_cell=None, distance=3.4, thickness=10):
     """
     :param structure1: an instance of crystal()
@@ -514,7 +580,7 @@ def merge_layers(structure1, structure2, use_cell=None, distance=3.4, thickness=
         only merge layers with ab plane as the surface plane
     """
     from pymatflow.structure.crystal import crystal
-    from pymatflow.base.atom import Atom                                            
+    from pymatflow.base.atoms import atoms_array
     
     structure1 = set_frac_within_zero_and_one(structure1)
     structure2 = set_frac_within_zero_and_one(structure2)
@@ -523,10 +589,8 @@ def merge_layers(structure1, structure2, use_cell=None, distance=3.4, thickness=
     old_cell_2 = copy.deepcopy(structure2.cell)
     
     # first transfer to fractional coordinate
-    structure1.natom = len(structure1.atoms)
-    frac_1 = structure1.get_fractional()
-    structure2.natom = len(structure2.atoms)
-    frac_2 = structure2.get_fractional()
+    frac_1 = structure1.atoms.get_fractional(structure1.cell)
+    frac_2 = structure2.atoms.get_fractional(structure2.cell)
 
     average_cell = []
     for i in range(3):
@@ -534,60 +598,28 @@ def merge_layers(structure1, structure2, use_cell=None, distance=3.4, thickness=
     
     out = crystal()
     
+    # the cells used to convert frac back to cartesian are copies, so that setting
+    # the c of one of them does not change the other or average_cell
     if use_cell == 1:
-        latcell_frac_to_cart_1 = old_cell_1
-        latcell_frac_to_cart_2 = old_cell_1[0:2]
-        latcell_frac_to_cart_2.append(old_cell_2[2])
+        latcell_frac_to_cart_1 = copy.deepcopy(old_cell_1)
+        latcell_frac_to_cart_2 = copy.deepcopy(old_cell_1[0:2]) + [old_cell_2[2]]
     elif use_cell == 2:
-        latcell_frac_to_cart_2 = old_cell_2
-        latcell_frac_to_cart_1 = old_cell_2[0:2]
-        latcell_frac_to_cart_1.append(old_cell_1[2])
+        latcell_frac_to_cart_2 = copy.deepcopy(old_cell_2)
+        latcell_frac_to_cart_1 = copy.deepcopy(old_cell_2[0:2]) + [old_cell_1[2]]
     else:
-        #average_ab = []
-        #for i in range(2):
-        #    vec = []
-        #    for j in range(3):
-        #        vec.append((old_cell_1[i][j] + old_cell_2[i][j]) / 2 )
-        #    average_ab.append(vec)
-        
-        latcell_frac_to_cart_1 = average_cell
-        latcell_frac_to_cart_1[2] = old_cell_1[2]
-        latcell_frac_to_cart_2= average_cell
-        latcell_frac_to_cart_2[2] = old_cell_2[2]
-        
-        
+        latcell_frac_to_cart_1 = copy.deepcopy(average_cell[0:2]) + [old_cell_1[2]]
+        latcell_frac_to_cart_2 = copy.deepcopy(average_cell[0:2]) + [old_cell_2[2]]
 
     # convert frac to cartesian again
-    convmat_1 = np.array(latcell_frac_to_cart_1).T
-    convmat_2 = np.array(latcell_frac_to_cart_2).T
-    
-    cart_1 = []
-    for atom in frac_1:
-        cartesian = list(convmat_1.dot(np.array([atom[1], atom[2], atom[3]])))
-        cart_1.append([atom[0], cartesian[0], cartesian[1], cartesian[2]])
-    
-    cart_2 = []
-    for atom in frac_2:
-        cartesian = list(convmat_2.dot(np.array([atom[1], atom[2], atom[3]])))
-        cart_2.append([atom[0], cartesian[0], cartesian[1], cartesian[2]])
+    cart_1 = frac_1.dot(np.array(latcell_frac_to_cart_1))
+    cart_2 = frac_2.dot(np.array(latcell_frac_to_cart_2))
         
     # make distance gap between cart_1 and cart_2 is the value of distance
-    z_1 = []
-    for atom in cart_1:
-        z_1.append(atom[3])
-    z_2 = []
-    for atom in cart_2:
-        z_2.append(atom[3])
-    max_z_1 = max(z_1)
-    min_z_2 = min(z_2)
-    
-    for i in range(len(cart_2)):
-        cart_2[i][3] += distance - (min_z_2 - max_z_1)
-    
-    cart_all = cart_1 + cart_2
-    out.atoms = []
-    for atom in cart_all:
-        out.atoms.append(Atom(name=atom[0], x=atom[1], y=atom[2], z=atom[3]))
+    cart_2[:, 2] += distance - (cart_2[:, 2].min() - cart_1[:, 2].max())
+    
+    out.atoms = atoms_array()
+    out.atoms.extend_arrays(structure1.atoms.symbols, cart_1)
+    out.atoms.extend_arrays(structure2.atoms.symbols, cart_2)
     
     if use_cell == 1:
         out.cell = old_cell_1
@@ -603,6 +635,7 @@ def merge_layers(structure1, structure2, use_cell=None, distance=3.4, thickness=
         out.cell[2] = list(np.array(out.cell[2]) * factor)
 
     vacuum_layer(structure=out, plane=1, thickness=thickness)
+    check_overlaps(out)
     
     return out
     
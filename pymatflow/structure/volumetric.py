@@ -0,0 +1,447 @@
+"""
+module for volumetric data on a real space grid, like vasp *CHG*, PARCHG and cube
+"""
+
+import os
+import sys
+import itertools
+import numpy as np
+
+from pymatflow.base.atom import Atom
+from pymatflow.base.atoms import atoms_array
+from pymatflow.base.element import numbers_to_symbols
+from pymatflow.base.cache import post_cache
+from pymatflow.structure.crystal import crystal
+
+"""
+Usage:
+    chg = volumetric_data()
+    chg.read("CHGCAR", cache=True)
+    chg.structure # pymatflow.structure.crystal.crystal
+    chg.grid # (na, nb, nc) view of the grid value
+    img = chg.get_slice_c(0.5) # (nb, na) plane at half height of c
+
+    # charge density difference without loading any of the grids as a whole
+    head, reduced = reduce_1d(["CHGCAR", "CHGCAR-1", "CHGCAR-2"], coeffs=[1, -1, -1], c=0.5)
+    reduced["c"] # sum of the grid value over each ab plane along c
+    write_linear_combination(["CHGCAR", "CHGCAR-1", "CHGCAR-2"], "CHGCAR-diff", coeffs=[1, -1, -1])
+
+Note:
+    the grid file is never loaded as a whole. the header(structure and number
+    of grid points) is read line by line, then the numeric block is parsed in
+    chunks of lines directly into a preallocated float array, so besides the
+    array itself only one chunk of text is held in memory. for vasp *CHG* files
+    exactly ngxf*ngyf*ngzf values are read, and the augmentation occupancies or
+    the magnetization block after it are never touched.
+
+    when cache=True the array is created as a .npy file beside the grid file,
+    like .CHGCAR.grid.npy, and filled chunk by chunk through np.memmap, so even
+    the first read does not need the memory of the whole grid. later reads
+    of the unchanged file open the .npy with mmap_mode="r", so taking a slice
+    only reads the pages of that slice from disk. the .npy is validated the
+    same way as pymatflow.base.cache.post_cache.
+
+    self.data keeps the layout of the file:
+        vasp *CHG*: (ngzf, ngyf, ngxf), x runs fastest in the file
+        cube: (ngridx, ngridy, ngridz), z runs fastest in the file
+    while self.grid is always a (na, nb, nc) view of it.
+
+    volumetric_data.iter_slabs reads the grid as slabs of a few planes along the
+    first axis of self.data(c for vasp *CHG* and a for cube), which is how the
+    values are stored in the file. linear_combination, reduce_1d and
+    write_linear_combination are built on it, so combining N grids only needs
+    memory for N slabs, and the combined grid is written slab by slab.
+"""
+
+bohr_to_angstrom = 0.529177249
+
+class volumetric_data:
+    """
+    grid value on the real space grid of a crystal
+    """
+    def __init__(self):
+        self.structure = None
+        self.ngrid = None # number of grid points along a, b, c
+        self.data = None
+        self.format = None # "vasp" or "cube", decides the layout of self.data
+        self.header = [] # lines before the grid value in the file, used to write the grid
+
+    def read(self, filepath, cache=False, chunk=4096):
+        """
+        filepath:
+            grid file, a file with suffix .cube is read as cube, others as vasp *CHG*
+        cache:
+            whether to use the memory mapped .npy cache beside the grid file
+        chunk:
+            number of lines parsed at a time
+        """
+        if filepath.split(".")[-1] == "cube":
+            self.read_cube(filepath, cache=cache, chunk=chunk)
+        else:
+            self.read_vasp_chg(filepath, cache=cache, chunk=chunk)
+
+    def read_vasp_chg(self, filepath, cache=False, chunk=4096):
+        """
+        read vasp CHG, CHGCAR, PARCHG, LOCPOT, ELFCAR, etc.
+        only the first data block(total charge for ISPIN=2) is read.
+        """
+        self.format = "vasp"
+        self._read_data(filepath, cache, chunk)
+
+    def read_cube(self, filepath, cache=False, chunk=4096):
+        """
+        read gaussian cube file
+        """
+        self.format = "cube"
+        self._read_data(filepath, cache, chunk)
+
+    def read_header(self, filepath):
+        """
+        read only the structure and number of grid points of the grid file
+        """
+        self.format = "cube" if filepath.split(".")[-1] == "cube" else "vasp"
+        with open(filepath, 'rb') as fin:
+            self._read_header(fin)
+
+    def iter_slabs(self, filepath, nslab=8, cache=False, chunk=4096):
+        """
+        read the grid file slab by slab
+        nslab:
+            number of planes along the first axis of self.data in each slab
+        cache:
+            if True the slabs are views of the memory mapped .npy cache,
+            otherwise the grid file is parsed as the slabs are requested.
+        yield:
+            (start, slab) where slab is data[start:start+nslab] in the layout of self.data
+        """
+        if cache == True:
+            self.read(filepath, cache=True, chunk=chunk)
+            for start in range(0, self.data.shape[0], nslab):
+                yield start, self.data[start:start+nslab]
+            return
+        self.format = "cube" if filepath.split(".")[-1] == "cube" else "vasp"
+        with open(filepath, 'rb') as fin:
+            values = self._read_header(fin, chunk=chunk)
+            shape = self.shape
+            rest = np.empty(0)
+            for start in range(0, shape[0], nslab):
+                slab = np.empty((min(nslab, shape[0] - start),) + shape[1:])
+                rest = self._fill(values, slab.reshape(-1), rest)
+                yield start, slab
+
+    @property
+    def shape(self):
+        """
+        shape of self.data
+        """
+        if self.format == "vasp":
+            return (self.ngrid[2], self.ngrid[1], self.ngrid[0])
+        return tuple(self.ngrid)
+
+    @property
+    def grid(self):
+        """
+        (na, nb, nc) view of self.data
+        """
+        if self.format == "vasp":
+            return self.data.transpose(2, 1, 0)
+        return self.data
+
+    @property
+    def cell_volume(self):
+        return abs(np.linalg.det(np.array(self.structure.cell)))
+
+    def index_c(self, c):
+        """
+        c:
+            a value between 0 and 1, height in c direction
+        :return index of the grid point along c
+        """
+        return int((self.ngrid[2] - 1) * c)
+
+    def get_slice_c(self, c):
+        """
+        c:
+            a value between 0 and 1, height in c direction
+        :return (nb, na) array of the plane of grid value, as plotted by imshow(origin="lower")
+        """
+        ci = self.index_c(c)
+        if self.format == "vasp":
+            return np.array(self.data[ci, :, :])
+        return np.array(self.data[:, :, ci].T)
+
+    def _read_data(self, filepath, cache, chunk):
+        if cache == True and self._load_cache(filepath):
+            return
+        with open(filepath, 'rb') as fin:
+            values = self._read_header(fin, chunk=chunk)
+            self.data = self._allocate(filepath, self.shape, cache)
+            self._fill(values, self.data.reshape(-1), np.empty(0))
+        if cache == True:
+            self._save_cache(filepath)
+
+    def _read_header(self, fin, chunk=4096):
+        """
+        read the lines before the grid value from fin
+        :return generator over the grid value of the file
+        """
+        if self.format == "vasp":
+            return self._read_vasp_chg_header(fin, chunk)
+        return self._read_cube_header(fin, chunk)
+
+    def _read_vasp_chg_header(self, fin, chunk):
+        self.header = []
+        for line in fin:
+            self.header.append(line.decode())
+            if len(line.split()) == 0:
+                break
+        self.structure = self._structure_from_poscar(self.header[:-1])
+        self.header.append(fin.readline().decode())
+        self.ngrid = [int(item) for item in self.header[-1].split()[0:3]]
+        # all the lines of the block except the last one have the same number of values
+        first = fin.readline()
+        ncol = len(first.split())
+        return self._iter_values(itertools.chain([first], fin), int(np.prod(self.ngrid)), ncol=ncol, chunk=chunk)
+
+    def _read_cube_header(self, fin, chunk):
+        # two comment lines
+        self.header = [fin.readline().decode(), fin.readline().decode()]
+        # natom might be negative, if MO infor are included in cube file
+        self.header.append(fin.readline().decode())
+        natom = int(self.header[-1].split()[0])
+        self.ngrid = []
+        cell = []
+        for i in range(3):
+            self.header.append(fin.readline().decode())
+            words = self.header[-1].split()
+            self.ngrid.append(int(words[0]))
+            cell.append([int(words[0]) * float(words[j]) * bohr_to_angstrom for j in range(1, 4)])
+        lines = [fin.readline().decode() for i in range(abs(natom))]
+        self.header.extend(lines)
+        table = np.array([line.split()[0:5] for line in lines], dtype=float).reshape(-1, 5)
+        atoms = atoms_array()
+        atoms.extend_arrays(numbers_to_symbols(table[:, 0]), table[:, 2:5] * bohr_to_angstrom)
+        if natom < 0:
+            # the line of number of MO and their index
+            self.header.append(fin.readline().decode())
+        self.structure = crystal()
+        self.structure.cell = cell
+        self.structure.atoms = atoms
+        return self._iter_values(fin, int(np.prod(self.ngrid)), chunk=chunk)
+
+    def _structure_from_poscar(self, lines):
+        """
+        build crystal from the POSCAR part of the head of *CHG*
+        """
+        scale = float(lines[1].split()[0])
+        cell = np.array([[float(item) for item in lines[i].split()[0:3]] for i in range(2, 5)])
+        if scale < 0:
+            # negative scale is the volume of the cell
+            scale = (-scale / abs(np.linalg.det(cell))) ** (1.0 / 3)
+        cell = cell * scale
+        i = 5
+        if lines[i].split()[0].isdigit():
+            # vasp4 format, element names are given in the comment line
+            names = lines[0].split()
+        else:
+            names = lines[i].split()
+            i += 1
+        counts = [int(item) for item in lines[i].split()]
+        i += 1
+        if lines[i].strip()[0] in "sS":
+            # selective dynamics
+            i += 1
+        direct = lines[i].strip()[0] not in "cCkK"
+        i += 1
+        natom = sum(counts)
+        positions = np.array([[float(item) for item in lines[j].split()[0:3]] for j in range(i, i + natom)]).reshape(-1, 3)
+        if direct == True:
+            positions = positions.dot(cell)
+        else:
+            positions = positions * scale
+        species = []
+        for name, count in zip(names, counts):
+            species.extend([name.split("_")[0].split("/")[0]] * count)
+        structure = crystal()
+        structure.cell = cell.tolist()
+        structure.atoms = atoms_array()
+        structure.atoms.extend_arrays(species, positions)
+        return structure
+
+    def _iter_values(self, lines, size, ncol=None, chunk=4096):
+        """
+        generator over the first size whitespace separated numbers in the
+        iterable of lines, as 1d arrays parsed from chunk lines at a time
+        ncol:
+            number of values per line, if known the lines after the block are not read
+        """
+        read = 0
+        while read < size:
+            nline = chunk
+            if ncol is not None:
+                nline = min(chunk, -(-(size - read) // ncol))
+            block = b"".join(itertools.islice(lines, nline))
+            if len(block) == 0:
+                print("===============================================\n")
+                print("warning: volumetric_data._iter_values\n")
+                print("grid file ended with %d values read, %d expected\n" % (read, size))
+                return
+            values = np.fromstring(block.decode(), sep=" ")[:size - read]
+            read += values.shape[0]
+            yield values
+
+    def _fill(self, values, out, rest):
+        """
+        fill the flat array out from the generator values
+        rest:
+            values left by the previous call
+        :return values left after out is filled
+        """
+        filled = 0
+        size = out.shape[0]
+        while filled < size:
+            if rest.shape[0] == 0:
+                rest = next(values, None)
+                if rest is None:
+                    return np.empty(0)
+            n = min(rest.shape[0], size - filled)
+            out[filled:filled+n] = rest[:n]
+            rest = rest[n:]
+            filled += n
+        return rest
+
+    def _npy(self, filepath):
+        sidecar = post_cache(filepath, name="grid")
+        return sidecar, sidecar.sidecar[:-len(".cache.json")] + ".npy"
+
+    def _allocate(self, filepath, shape, cache):
+        """
+        preallocated array for the grid value, a .npy memmap when cache is True
+        """
+        if cache == False:
+            return np.empty(shape)
+        sidecar, npy = self._npy(filepath)
+        return np.lib.format.open_memmap(npy + ".tmp", mode="w+", dtype=float, shape=shape)
+
+    def _load_cache(self, filepath):
+        sidecar, npy = self._npy(filepath)
+        if not sidecar.load() or not os.path.exists(npy):
+            return False
+        self.ngrid = sidecar.data["ngrid"]
+        self.header = sidecar.data.get("header", [])
+        self.structure = crystal()
+        self.structure.cell = sidecar.data["cell"]
+        self.structure.atoms = [Atom(atom[0], atom[1], atom[2], atom[3]) for atom in sidecar.data["atoms"]]
+        self.data = np.load(npy, mmap_mode="r")
+        return True
+
+    def _save_cache(self, filepath):
+        sidecar, npy = self._npy(filepath)
+        self.data.flush()
+        del self.data
+        os.replace(npy + ".tmp", npy)
+        sidecar.data = {
+            "ngrid": self.ngrid,
+            "header": self.header,
+            "cell": [list(vec) for vec in self.structure.cell],
+            "atoms": [[atom.name, atom.x, atom.y, atom.z] for atom in self.structure.atoms],
+            }
+        sidecar.arrays = {}
+        sidecar.save()
+        self.data = np.load(npy, mmap_mode="r")
+
+
+def linear_combination(filepaths, coeffs=None, nslab=8, cache=False):
+    """
+    :param filepaths: grid files on the same grid, all vasp *CHG* or all cube
+    :param coeffs: coefficient of each grid, default to 1 for every grid
+    :param nslab: number of planes in each slab
+    :param cache: whether to use the memory mapped .npy cache of the grid files
+    :return (head, slabs):
+        head: volumetric_data of the first grid file with only the header read
+        slabs: generator over (start, slab) of sum(coeffs[i] * grid_i)
+    """
+    if coeffs is None:
+        coeffs = [1.0] * len(filepaths)
+    grids = []
+    for filepath in filepaths:
+        grids.append(volumetric_data())
+        grids[-1].read_header(filepath)
+        if grids[-1].ngrid != grids[0].ngrid:
+            print("===============================================\n")
+            print("warning: pymatflow.structure.volumetric.linear_combination\n")
+            print("grid of %s is %s, while grid of %s is %s\n" % (filepath, grids[-1].ngrid, filepaths[0], grids[0].ngrid))
+            sys.exit(1)
+
+    def slabs():
+        readers = [grid.iter_slabs(filepath, nslab=nslab, cache=cache) for grid, filepath in zip(grids, filepaths)]
+        for items in zip(*readers):
+            start = items[0][0]
+            slab = coeffs[0] * items[0][1]
+            for coeff, (start_i, slab_i) in zip(coeffs[1:], items[1:]):
+                slab += coeff * slab_i
+            yield start, slab
+
+    return grids[0], slabs()
+
+def reduce_1d(filepaths, coeffs=None, nslab=8, cache=False, c=None):
+    """
+    reduce the linear combination of grids to one dimension along a, b and c
+    :param c: if given, the ab plane at height c(between 0 and 1) is also returned
+    :return (head, reduced):
+        head: volumetric_data of the first grid file with only the header read
+        reduced: {
+            "a", "b", "c": sum of the grid value over the plane at each grid point along a, b, c
+            "total": sum of all the grid value
+            "slice-c": (nb, na) plane at height c, only when c is given
+            }
+    """
+    head, slabs = linear_combination(filepaths, coeffs=coeffs, nslab=nslab, cache=cache)
+    na, nb, nc = head.ngrid
+    reduced = {"a": np.zeros(na), "b": np.zeros(nb), "c": np.zeros(nc)}
+    if c is not None:
+        ci = head.index_c(c)
+        reduced["slice-c"] = np.zeros((nb, na))
+    for start, slab in slabs:
+        end = start + slab.shape[0]
+        if head.format == "vasp":
+            # slab of (c, b, a)
+            reduced["c"][start:end] = slab.sum(axis=(1, 2))
+            reduced["b"] += slab.sum(axis=(0, 2))
+            reduced["a"] += slab.sum(axis=(0, 1))
+            if c is not None and start <= ci < end:
+                reduced["slice-c"] = np.array(slab[ci - start])
+        else:
+            # slab of (a, b, c)
+            reduced["a"][start:end] = slab.sum(axis=(1, 2))
+            reduced["b"] += slab.sum(axis=(0, 2))
+            reduced["c"] += slab.sum(axis=(0, 1))
+            if c is not None:
+                reduced["slice-c"][:, start:end] = slab[:, :, ci].T
+    reduced["total"] = reduced["a"].sum()
+    return head, reduced
+
+def write_linear_combination(filepaths, output, coeffs=None, nslab=8, cache=False):
+    """
+    write the linear combination of grids to output slab by slab, in the
+    format of the grid files and with the header of the first one
+    """
+    head, slabs = linear_combination(filepaths, coeffs=coeffs, nslab=nslab, cache=cache)
+    with open(output, 'w') as fout:
+        fout.write("".join(head.header))
+        if head.format == "vasp":
+            # 5 values per line across the planes, like CHGCAR
+            rest = np.empty(0)
+            for start, slab in slabs:
+                values = np.concatenate([rest, slab.reshape(-1)])
+                nrow = values.shape[0] // 5
+                np.savetxt(fout, values[:nrow*5].reshape(nrow, 5), fmt=" %.11E", delimiter="")
+                rest = values[nrow*5:]
+            if rest.shape[0] > 0:
+                fout.write("".join([" %.11E" % value for value in rest]) + "\n")
+        else:
+            # 6 values per line, a new line is started for each row along c
+            nc = head.ngrid[2]
+            fmt_row = ("%13.5E" * 6 + "\n") * (nc // 6) + ("%13.5E" * (nc % 6) + "\n" if nc % 6 > 0 else "")
+            for start, slab in slabs:
+                fout.write(fmt_row * (slab.shape[0] * slab.shape[1]) % tuple(slab.ravel()))
@@ -2,8 +2,114 @@
 converting between other structure file and xyz format(with second line specifying
 the cell parameter), with the help of ase.io
 """
+import os
 import ase.io
+import numpy as np
 import pymatflow.base as base
+from pymatflow.base.element import numbers_to_symbols, symbols_to_numbers
+
+
+"""
+Usage:
+    import pymatflow.third.aseio as aseio
+    cell, atoms = aseio.read("POSCAR") # format judged from the file name
+    aseio.write("structure.cif", cell, atoms)
+    # images of a trajectory one by one, only the current image is in memory
+    for cell, atoms in aseio.iread("XDATCAR", index="::10"):
+        pass
+
+Note:
+    the structure is passed between ase.Atoms and pymatflow as arrays: the atomic
+    numbers are converted to symbols(and back) by one table lookup and the positions
+    are passed to atoms_array/ase.Atoms as a whole, no per atom object is created.
+    all the read_*/write_* functions below share read()/write(), the format name of
+    ase.io is given explicitly or judged by _guess_format from the file name.
+"""
+
+# suffix or file name -> format name of ase.io
+formats = {
+    "cif": "cif",
+    "xtd": "xtd",
+    "xsd": "xsd",
+    "xsf": "xsf",
+    "axsf": "xsf",
+    "cube": "cube",
+    "cfg": "cfg",
+    "lammps": "lammps-data",
+    "lmp": "lammps-data",
+    "traj": "traj",
+    "extxyz": "extxyz",
+    "POSCAR": "vasp",
+    "CONTCAR": "vasp",
+    "XDATCAR": "vasp-xdatcar",
+    "OUTCAR": "vasp-out",
+    "vasprun.xml": "vasp-xml",
+    }
+
+
+def from_ase(a):
+    """
+    :param a: an instance of ase.Atoms
+    :return cell and atoms(an atoms_array) need to build the pymatflow.structure.crystal object
+    """
+    atoms = base.atoms_array()
+    atoms.extend_arrays(numbers_to_symbols(a.numbers), a.positions)
+    return a.cell.tolist(), atoms
+
+def to_ase(cell, atoms, pbc=True):
+    """
+    :param cell: cell of the structure
+    :param atoms: atoms of the structure, an atoms_array or a list of Atom
+    :return an instance of ase.Atoms
+    """
+    from ase import Atoms
+    if isinstance(atoms, base.atoms_array) == False:
+        atoms = base.atoms_array(atoms)
+    return Atoms(numbers=symbols_to_numbers(atoms.symbols), cell=cell, positions=atoms.positions, pbc=pbc)
+
+def read(filepath, format=None, index=-1):
+    """
+    :param filepath: path of the structure file
+    :param format: format name of ase.io, judged from filepath if None
+    :param index: the image to read from a file with several images
+    :return cell and atoms need to build the pymatflow.structure.crystal object
+    """
+    return from_ase(ase.io.read(filepath, index=index, format=_guess_format(filepath, format)))
+
+def iread(filepath, format=None, index=":"):
+    """
+    read the images of a trajectory lazily
+    :param index: slice string like ":" or "::10" or an int
+    :return a generator of (cell, atoms) of each image
+    """
+    for a in ase.io.iread(filepath, index=index, format=_guess_format(filepath, format)):
+        yield from_ase(a)
+
+def write(filepath, cell, atoms, format=None):
+    """
+    :param filepath: the output file path
+    :param cell: cell of the structure
+    :param atoms: atoms of the structure
+    :param format: format name of ase.io, judged from filepath if None
+    """
+    ase.io.write(filepath, to_ase(cell, atoms), format=_guess_format(filepath, format))
+
+def write_images(filepath, images, format=None):
+    """
+    :param images: iterable of (cell, atoms) of each image, converted one by one
+    """
+    ase.io.write(filepath, [to_ase(cell, atoms) for cell, atoms in images], format=_guess_format(filepath, format))
+
+def _guess_format(filepath, format):
+    if format is not None:
+        return format
+    name = os.path.basename(filepath)
+    if name in formats:
+        return formats[name]
+    if name.split(".")[-1] in formats:
+        return formats[name.split(".")[-1]]
+    # let ase.io judge it
+    return None
 
 
 def read_cif(filepath):
@@ -11,21 +117,7 @@ def read_cif(filepath):
     :param filepath filepath of the cif file
     :return cell and atoms need to build the pymatflow.structure.crystal object
     """
-    a = ase.io.read(filepath, format='cif')
-    cell = a.cell.tolist()
-    atoms = []
-    for i in range(len(a.arrays['numbers'])):
-        for item in base.element:
-            if base.element[item].number == a.arrays['numbers'][i]:
-                symbol = item
-                break
-        atoms.append(base.Atom(
-            symbol,
-            a.arrays['positions'][i, 0],
-            a.arrays['positions'][i, 1],
-            a.arrays['positions'][i, 2]
-            ))
-    return cell, atoms
+    return read(filepath, format='cif')
 
 def write_cif(cell, atoms, filepath):
     """
@@ -33,14 +125,7 @@ def write_cif(cell, atoms, filepath):
     :param atoms: atoms of the structure
     :param filepath: the output cif file path
     """
-    from ase import Atoms
-    numbers = []
-    positions = []
-    for atom in atoms:
-        numbers.append(base.element[atom.name].number)
-        positions.append([atom.x, atom.y, atom.z])
-    a = Atoms(numbers=numbers, cell=cell, positions=positions, pbc=True)
-    ase.io.write(filepath, a, format='cif')
+    write(filepath, cell, atoms, format='cif')
 
 
 def read_xtd(filepath):
@@ -48,21 +133,7 @@ def read_xtd(filepath):
     :param filepath filepath of the xtd file
     :return cell and atoms need to build the pymatflow.structure.crystal object
     """
-    a = ase.io.read(filepath, format='xtd')
-    cell = a.cell.tolist()
-    atoms = []
-    for i in range(len(a.arrays['numbers'])):
-        for item in base.element:
-            if base.element[item].number == a.arrays['numbers'][i]:
-                symbol = item
-                break
-        atoms.append(base.Atom(
-            symbol,
-            a.arrays['positions'][i, 0],
-            a.arrays['positions'][i, 1],
-            a.arrays['positions'][i, 2]
-            ))
-    return cell, atoms
+    return read(filepath, format='xtd')
 
 def write_xtd(cell, atoms, filepath):
     """
@@ -70,14 +141,7 @@ def write_xtd(cell, atoms, filepath):
     :param atoms: atoms of the structure
     :param filepath: the output xtd file path
     """
-    from ase import Atoms
-    numbers = []
-    positions = []
-    for atom in atoms:
-        numbers.append(base.element[atom.name].number)
-        positions.append([atom.x, atom.y, atom.z])
-    a = Atoms(numbers=numbers, cell=cell, positions=positions, pbc=True)
-    ase.io.write(filepath, a, format='xtd')
+    write(filepath, cell, atoms, format='xtd')
 
 
 def read_xsd(filepath):
@@ -85,21 +149,7 @@ def read_xsd(filepath):
     :param filepath filepath of the xtd file
     :return cell and atoms need to build the pymatflow.structure.crystal object
     """
-    a = ase.io.read(filepath, format='xsd')
-    cell = a.cell.tolist()
-    atoms = []
-    for i in range(len(a.arrays['numbers'])):
-        for item in base.element:
-            if base.element[item].number == a.arrays['numbers'][i]:
-                symbol = item
-                break
-        atoms.append(base.Atom(
-            symbol,
-            a.arrays['positions'][i, 0],
-            a.arrays['positions'][i, 1],
-            a.arrays['positions'][i, 2]
-            ))
-    return cell, atoms
+    return read(filepath, format='xsd')
 
 def write_xsd(cell, atoms, filepath):
     """
@@ -107,35 +157,14 @@ def write_xsd(cell, atoms, filepath):
     :param atoms: atoms of the structure
     :param filepath: the output xtd file path
     """
-    from ase import Atoms
-    numbers = []
-    positions = []
-    for atom in atoms:
-        numbers.append(base.element[atom.name].number)
-        positions.append([atom.x, atom.y, atom.z])
-    a = Atoms(numbers=numbers, cell=cell, positions=positions, pbc=True)
-    ase.io.write(filepath, a, format='xsd')
+    write(filepath, cell, atoms, format='xsd')
 
 def read_xsf(filepath):
     """
     :param filepath filepath of the xtd file
     :return cell and atoms need to build the pymatflow.structure.crystal object
     """
-    a = ase.io.read(filepath, format='xsf')
-    cell = a.cell.tolist()
-    atoms = []
-    for i in range(len(a.arrays['numbers'])):
-        for item in base.element:
-            if base.element[item].number == a.arrays['numbers'][i]:
-                symbol = item
-                break
-        atoms.append(base.Atom(
-            symbol,
-            a.arrays['positions'][i, 0],
-            a.arrays['positions'][i, 1],
-            a.arrays['positions'][i, 2]
-            ))
-    return cell, atoms
+    return read(filepath, format='xsf')
 
 def write_xsf(cell, atoms, filepath):
     """
@@ -143,35 +172,14 @@ def write_xsf(cell, atoms, filepath):
     :param atoms: atoms of the structure
     :param filepath: the output xtd file path
     """
-    from ase import Atoms
-    numbers = []
-    positions = []
-    for atom in atoms:
-        numbers.append(base.element[atom.name].number)
-        positions.append([atom.x, atom.y, atom.z])
-    a = Atoms(numbers=numbers, cell=cell, positions=positions, pbc=True)
-    ase.io.write(filepath, a, format='xsf')
+    write(filepath, cell, atoms, format='xsf')
 
 def read_poscar(filepath):
     """
     :param filepath filepath of the POSCAR of CONTCAR file
     :return cell and atoms need to build the pymatflow.structure.crystal object
     """
-    a = ase.io.read(filepath, format='vasp')
-    cell = a.cell.tolist()
-    atoms = []
-    for i in range(len(a.arrays['numbers'])):
-        for item in base.element:
-            if base.element[item].number == a.arrays['numbers'][i]:
-                symbol = item
-                break
-        atoms.append(base.Atom(
-            symbol,
-            a.arrays['positions'][i, 0],
-            a.arrays['positions'][i, 1],
-            a.arrays['positions'][i, 2]
-            ))
-    return cell, atoms
+    return read(filepath, format='vasp')
 
 def write_poscar(cell, atoms, filepath):
     """
@@ -179,35 +187,14 @@ def write_poscar(cell, atoms, filepath):
     :param atoms: atoms of the structure
     :param filepath: the output POSCAR CONTCAR file path
     """
-    from ase import Atoms
-    numbers = []
-    positions = []
-    for atom in atoms:
-        numbers.append(base.element[atom.name].number)
-        positions.append([atom.x, atom.y, atom.z])
-    a = Atoms(numbers=numbers, cell=cell, positions=positions, pbc=True)
-    ase.io.write(filepath, a, format='vasp')
+    write(filepath, cell, atoms, format='vasp')
 
 def read_cube(filepath):
     """
     :param filepath filepath of the cube file
     :return cell and atoms need to build the pymatflow.structure.crystal object
     """
-    a = ase.io.read(filepath, format='cube')
-    cell = a.cell.tolist()
-    atoms = []
-    for i in range(len(a.arrays['numbers'])):
-        for item in base.element:
-            if base.element[item].number == a.arrays['numbers'][i]:
-                symbol = item
-                break
-        atoms.append(base.Atom(
-            symbol,
-            a.arrays['positions'][i, 0],
-            a.arrays['positions'][i, 1],
-            a.arrays['positions'][i, 2]
-            ))
-    return cell, atoms
+    return read(filepath, format='cube')
 
 def write_cube(cell, atoms, filepath):
     """
@@ -215,35 +202,14 @@ def write_cube(cell, atoms, filepath):
     :param atoms: atoms of the structure
     :param filepath: the output cube file path
     """
-    from ase import Atoms
-    numbers = []
-    positions = []
-    for atom in atoms:
-        numbers.append(base.element[atom.name].number)
-        positions.append([atom.x, atom.y, atom.z])
-    a = Atoms(numbers=numbers, cell=cell, positions=positions, pbc=True)
-    ase.io.write(filepath, a, format='cube')
+    write(filepath, cell, atoms, format='cube')
 
 def read_lammps_data(filepath):
     """
     :param filepath filepath of the lammps data file
     :return cell and atoms need to build the pymatflow.structure.crystal object
     """
-    a = ase.io.read(filepath, format='lammps-data')
-    cell = a.cell.tolist()
-    atoms = []
-    for i in range(len(a.arrays['numbers'])):
-        for item in base.element:
-            if base.element[item].number == a.arrays['numbers'][i]:
-                symbol = item
-                break
-        atoms.append(base.Atom(
-            symbol,
-            a.arrays['positions'][i, 0],
-            a.arrays['positions'][i, 1],
-            a.arrays['positions'][i, 2]
-            ))
-    return cell, atoms
+    return read(filepath, format='lammps-data')
 
 def write_lammps_data(cell, atoms, filepath):
     """
@@ -251,14 +217,7 @@ def write_lammps_data(cell, atoms, filepath):
     :param atoms: atoms of the structure
     :param filepath: the output lammps data file path
     """
-    from ase import Atoms
-    numbers = []
-    positions = []
-    for atom in atoms:
-        numbers.append(base.element[atom.name].number)
-        positions.append([atom.x, atom.y, atom.z])
-    a = Atoms(numbers=numbers, cell=cell, positions=positions, pbc=True)
-    ase.io.write(filepath, a, format='lammps-data')
+    write(filepath, cell, atoms, format='lammps-data')
 
 
 def read_cfg(filepath):
@@ -266,21 +225,7 @@ def read_cfg(filepath):
     :param filepath filepath of the cfg file: native AtomEye format
     :return cell and atoms need to build the pymatflow.structure.crystal object
     """
-    a = ase.io.read(filepath, format='cfg')
-    cell = a.cell.tolist()
-    atoms = []
-    for i in range(len(a.arrays['numbers'])):
-        for item in base.element:
-            if base.element[item].number == a.arrays['numbers'][i]:
-                symbol = item
-                break
-        atoms.append(base.Atom(
-            symbol,
-            a.arrays['positions'][i, 0],
-            a.arrays['positions'][i, 1],
-            a.arrays['positions'][i, 2]
-            ))
-    return cell, atoms
+    return read(filepath, format='cfg')
 
 def write_cfg(cell, atoms, filepath):
     """
@@ -288,13 +233,4 @@ def write_cfg(cell, atoms, filepath):
     :param atoms: atoms of the structure
     :param filepath: the output cfg file path
     """
-    from ase import Atoms
-    numbers = []
-    positions = []
-    for atom in atoms:
-        numbers.append(base.element[atom.name].number)
-        positions.append([atom.x, atom.y, atom.z])
-    a = Atoms(numbers=numbers, cell=cell, positions=positions, pbc=True)
-    ase.io.write(filepath, a, format='cfg')
-
-    
\ No newline at end of file
+    write(filepath, cell, atoms, format='cfg')
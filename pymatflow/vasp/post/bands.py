@@ -13,25 +13,36 @@ import os
 import numpy as np
 import matplotlib.pyplot as plt
 
-from xml.etree.ElementTree import parse
+from pymatflow.vasp.post.vasprun import vasprun_reader
 
 class post_bands:
     def __init__(self):
         pass
 
-    def get_efermi(self, vasprun="vasprun.xml"):
+    def get_efermi(self, vasprun="vasprun.xml", cache=False):
         """
         we set efermi in an individual function because we can choose to get efermi from nscf run
         or scf run in this way.
         if you want to get efermi from the scf run specify the vasprun.xml for the scf
         if you want to get efermi from the nscf run specify the vasprun.xml for the nscf
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         """
-        vasprun_xml = parse(vasprun)
-        self.efermi = float(vasprun_xml.getroot().find("calculation").find("dos").find("i").text)    
+        # the reader stops as soon as efermi is read
+        reader = vasprun_reader()
+        reader.parse(vasprun, cache=cache)
+        self.efermi = reader.efermi
 
-    def get_kpath_and_vasprun(self, kpath, vasprun="vasprun.xml"):
-        # vasprun.xml
-        self.vasprun = parse(vasprun)
+    def get_kpath_and_vasprun(self, kpath, vasprun="vasprun.xml", cache=False):
+        """
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
+        """
+        # vasprun.xml, read in a single pass
+        self.vasprun = vasprun_reader()
+        self.vasprun.parse(vasprun, eigenvalues=True, cache=cache)
 
         # kpath
         self.kpath = kpath
@@ -72,39 +83,8 @@ class post_bands:
         """
         self.xcoord_k = []
         # get the lattice parameter and the reciprocal basis
-        a1 = np.sqrt(
-                float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[0].text.split()[0])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[0].text.split()[1])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[0].text.split()[2])**2
-                )
-        a2 = np.sqrt(
-                float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[1].text.split()[0])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[1].text.split()[1])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[1].text.split()[2])**2
-                )
-        a3 = np.sqrt(
-                float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[2].text.split()[0])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[2].text.split()[1])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[0].getchildren()[2].text.split()[2])**2
-                )
-
-        b1 = np.sqrt(
-                float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[0].text.split()[0])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[0].text.split()[1])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[0].text.split()[2])**2
-                )
-
-        b2 = np.sqrt(
-                float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[1].text.split()[0])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[1].text.split()[1])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[1].text.split()[2])**2
-                )
-
-        b3 = np.sqrt(
-                float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[2].text.split()[0])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[2].text.split()[1])**2
-                + float(self.vasprun.findall("structure")[0].getchildren()[0].getchildren()[2].getchildren()[2].text.split()[2])**2
-                )
+        a1, a2, a3 = np.linalg.norm(self.vasprun.basis, axis=1)
+        b1, b2, b3 = np.linalg.norm(self.vasprun.rec_basis, axis=1)
 
         # actually you will find that in vasp b1=1/a1, b2=1/a2, b3=1/a3
         # now we use the reciprocal lattice constant and the kpoints in crystal coordinate to build the xcoord_k
@@ -160,32 +140,8 @@ class post_bands:
 
         """
         # first check the magnetic_status
-        for i in range(len(self.vasprun.getroot().find("parameters"))):
-            if self.vasprun.getroot().find("parameters").getchildren()[i].attrib["name"] == "electronic":
-                for item in self.vasprun.getroot().find("parameters")[i]:
-                    if item.attrib["name"] == "electronic spin":
-                        for spin_item in item:
-                            if spin_item.attrib["name"] == "ISPIN":
-                                ispin = int(spin_item.text.split()[0])
-                            elif spin_item.attrib["name"] == "LNONCOLLINEAR":
-                                lnoncollinear = spin_item.text.split()[0]
-                            elif spin_item.attrib["name"] == "LSORBIT":
-                                lsorbit = spin_item.text.split()[0]
-        if lsorbit == "T":
-            self.magnetic_status = "soc-ispin-%d" % ispin # soc-ispin-1 or soc-ispin-2
-            # actually soc-ispin-2 never exists !!!
-            # I found when soc and ISPIN=2 are set in the INCAR at the same time,
-            # you can find in <incar> section of vasprun.xml ISPIN=2, but it will be turned to 1
-            # in <parameters> -> <separator name="electronic"> - > <separator name="electronic spin"> 
-            # So VASP will automatically set ISPIN to 1 even when you set ISPIN to 2 
-            # if you are considering soc
-            # I mean you can set soc and ISPIN=2 at the same time in INCAR, but 
-            # VASP will turn ISPIN to 1, and this post script will read it to be ISPIN = 1
-            # so never will therere be soc-ispin-2 even when you set it in INCAR.
-            # in vasprun.xml, we read the acutally used ISPIN from <parameters>... rather than
-            # the input from <incar>.
-        else:
-            self.magnetic_status = "non-soc-ispin-%d" % ispin # non-soc-ispin-1 or non-soc-ispin-2
+        self.magnetic_status = self.vasprun.magnetic_status
+        # soc-ispin-1 or soc-ispin-2, non-soc-ispin-1 or non-soc-ispin-2
 
 
         # get the eigenval
@@ -253,22 +209,15 @@ class post_bands:
 
         self.eigenval = {}
         for i in range(spin_n):
-            eigenval = []
-            for kpoint in self.vasprun.getroot().find("calculation").find("eigenvalues").find("array").findall("set")[0].findall("set")[i]: # notice the .findall("set")[i] indicate which spin data to read
-                eigenval.append({})
-                eigenval[-1]["energy"] = []
-                eigenval[-1]["occupation"] = []
-                for j in range(len(kpoint)):
-                    eigenval[-1]["energy"].append(float(kpoint[j].text.split()[0]))
-                    eigenval[-1]["occupation"].append(float(kpoint[j].text.split()[1]))
+            # (nkpoint, nband, 2) array of energy and occupation for spin i
+            data = self.vasprun.eigenvalues[i]
             # if HSE is used, in pymatflow the kpoints in the KPOINTS file include the Monkhorst-pack from SCF and 
             # kpoints from kpath. so self.eigeval contains data for both the two part of kpoints.
             # here we remove the Monkhorst-pack part kpoint from self.eigenval.
-            nk_scf = len(eigenval) -  len(self.xcoord_k)
-            for k in range(nk_scf):
-                eigenval[k] = None
-            for k in range(nk_scf):
-                eigenval.remove(None)
+            nk_scf = len(data) -  len(self.xcoord_k)
+            eigenval = []
+            for kpoint in data[nk_scf:]:
+                eigenval.append({"energy": kpoint[:, 0].tolist(), "occupation": kpoint[:, 1].tolist()})
             self.eigenval["spin_%d" % (i+1)] = eigenval
 
     def _plot_band_matplotlib(self, bandrange=[0, 1.0], xrange=None, yrange=None):
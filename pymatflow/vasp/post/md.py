@@ -7,7 +7,8 @@ import datetime
 import subprocess
 import matplotlib.pyplot as plt
 
-from pymatflow.vasp.base.xyz import Atom
+from pymatflow.base.incremental import tail_state
+from pymatflow.vasp.post.outcar import outcar_reader
 
 
 class md_post:
@@ -16,15 +17,24 @@ class md_post:
         md_post can extract information for the molecular dynamics running,
         it will printout the trajectory file(xyz format).
     """
-    def __init__(self, output="OUTCAR"):
+    def __init__(self, output="OUTCAR", incremental=False, cache=False):
         """
         output:
            the output file of md run.
+        incremental:
+            if True, the parsing state is saved to a sidecar file beside the
+            output, and the next md_post on the same output only parses the
+            newly appended part. useful to monitor a running md.
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
 
         relaxed:
             whether the structure successfully relaxed.
         """
         self.file = output
+        self.incremental = incremental
+        self.cache = cache
         self.electronic_params = {}
         self.ionic_params = {}
         self.run_info = {}
@@ -33,36 +43,37 @@ class md_post:
         #self.cell = None # optimized cell
         self.trajectory = None
 
-        with open(self.file, 'r') as fout:
-            self.lines = fout.readlines()
         self.get_info()
 
     def get_info(self):
         """
-        get the general information of opt run from opt run output file
-        which is now stored in self.lines
+        get the general information of md run from the output file, the file
+        is read by the streaming outcar_reader
         """
-        # check whether calculation is finished
-        if len(self.lines[-1].split()) == 4 and self.lines[-1].split()[0] == "Voluntary" and self.lines[-1].split()[1] == "context":
-            self.job_done = True
-        else:
-            self.job_done = False
         #
         # we may also use XDATCAR to get the trajectory so we do not execute self.get_trajectory() here
         #self.get_trajectory()
         self.get_opt_params_and_run_info()
 
+    def parse_outcar(self, trajectory=False):
+        """
+        parse the output with outcar_reader, resuming from the sidecar
+        state file when self.incremental is True
+        """
+        reader = outcar_reader()
+        if self.incremental == False:
+            reader.parse(self.file, trajectory=trajectory, cache=self.cache)
+            return reader
+        state = tail_state(self.file, name="md-trajectory" if trajectory else "md")
+        state.load()
+        reader.parse(self.file, trajectory=trajectory, state=state)
+        state.save()
+        return reader
 
     def get_trajectory(self):
-        self.trajectory = []
-        for i in range(len(self.lines)):
-            if len(self.lines[i].split()) > 0 and self.lines[i].split()[0] == "POSITION" and self.lines[i].split()[1] == "TOTAL-FORCE":
-                atm = []
-                j = i + 2
-                while len(self.lines[j].split()) == 6:
-                    atm.append(Atom("x", float(self.lines[j].split()[0]), float(self.lines[j].split()[1]), float(self.lines[j].split()[2])))
-                    j = j + 1
-                self.trajectory.append(atm)
+        reader = self.parse_outcar(trajectory=True)
+        # positions and forces of every step are stored in the array backed base_trajectory
+        self.trajectory = reader.trajectory
         #
 
     def get_opt_params_and_run_info(self):
@@ -72,56 +83,13 @@ class md_post:
         run_info["fermi-energies"]: fermi energies of every scf step
         run_info["total-forces-rms"]: total RMS forces of every scf step
         """
-        self.run_info["iterations"] = []
-        self.run_info["total-energies"] = []
-        self.run_info["fermi-energies"] = []
-        self.run_info["total-forces-rms"] = []
-        self.run_info["temperatures"] = []
-
-        for line in self.lines:
-            # if it is an empty line continue to next line
-            if len(line.split()) == 0:
-                continue
-            if line.split()[0] == "executed" and line.split()[1] == "on" and line.split()[3] == "date":
-                self.run_info["start-time"] = line.split("\n")[0]
-            #if line.split()[0] == "This" and line.split()[1] == "run" and line.split()[3] == "terminated":
-            #    self.run_info["stop-time"] = line.split("\n")[0]
-            if len(line.split()) == 4 and line.split()[1] == "Iteration":
-                self.run_info["iterations"].append(line)
-            if line.split()[0] == "energy" and line.split()[1] == "without" and line.split()[2] == "entropy=":
-                self.run_info["total-energies"].append(float(line.split()[3]))
-            if line.split()[0] ==  "E-fermi" and line.split()[1] == ":":
-                self.run_info["fermi-energies"].append(float(line.split()[2]))
-            if line.split()[0] == "FORCES:" and line.split()[1] == "max":
-                self.run_info["total-forces-rms"].append(float(line.split()[5]))
-            if "(temperature" in line:
-                self.run_info["temperatures"].append(float(line.split("(temperature")[1].split("K)")[0]))
-            if line.split()[0] == "ENCUT" and line.split()[1] == "=":
-                self.electronic_params["ENCUT"] = float(line.split()[2])
-            if line.split()[0] == "EDIFF" and line.split()[1] == "=":
-                self.electronic_params["EDIFF"] = float(line.split()[2])
-            if line.split()[0] == "LREAL" and line.split()[1] == "=":
-                self.electronic_params["LREAL"] = line.split()[2]
-            if line.split()[0] == "EDIFFG" and line.split()[1] == "=":
-                self.ionic_params["EDIFFG"] = float(line.split()[2])
-            if line.split()[0] == "NSW" and line.split()[1] == "=":
-                self.ionic_params["NSW"] = int(line.split()[2])
-            if line.split()[0] == "IBRION" and line.split()[1] == "=":
-                self.ionic_params["IBRION"] = int(line.split()[2])
-            if line.split()[0] == "NFREE" and line.split()[1] == "=":
-                self.ionic_params["NFREE"] = int(line.split()[2])
-            if line.split()[0] == "ISIF" and line.split()[1] == "=":
-                self.ionic_params["ISIF"] = int(line.split()[2])
-            if line.split()[0] == "POTIM" and line.split()[1] == "=":
-                self.ionic_params["POTIM"] = float(line.split()[2])
-            if line.split()[0] == "TEIN" and line.split()[1] == "=":
-                self.ionic_params["TEIN"] = float(line.split()[2])
-            if line.split()[0] == "TEBEG" and line.split()[1] == "=":
-                self.ionic_params["TEBEG"] = float(line.split()[2].split(";")[0])
-            if line.split()[0] == "SMASS" and line.split()[1] == "=":
-                self.ionic_params["SMASS"] = float(line.split()[2])
-            if line.split()[0] == "PSTRESS=":
-                self.ionic_params["PSTRESS"] = float(line.split()[1])
+        reader = self.parse_outcar(trajectory=False)
+        self.job_done = reader.job_done
+        self.electronic_params = reader.electronic_params
+        self.ionic_params = reader.ionic_params
+        for item in ["start-time", "iterations", "total-energies", "fermi-energies", "total-forces-rms", "temperatures"]:
+            if item in reader.run_info:
+                self.run_info[item] = reader.run_info[item]
 
         #self.run_info["scf-cycles"] = len(self.run_info["iterations"])
         #if self.run_type == "relax":
@@ -131,12 +99,7 @@ class md_post:
 
 
     def print_trajectory(self, directory="./", xyz="trajectory.xyz"):
-        with open(os.path.join(directory, xyz), 'w') as fout:
-            for i in range(len(self.trajectory)):
-                fout.write("%d\n" % len(self.trajectory[i]))
-                fout.write("i = %d\n" % i)
-                for atom in self.trajectory[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+        self.trajectory.to_xyz(os.path.join(directory, xyz))
 
     def view_trajectory(self, trajfile="trajectory.xyz"):
         #os.system("xcrysden --xyz %s" % trajfile)
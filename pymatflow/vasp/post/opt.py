@@ -4,7 +4,8 @@ import datetime
 import subprocess
 import matplotlib.pyplot as plt
 
-from pymatflow.vasp.base.xyz import Atom
+from pymatflow.vasp.post.outcar import outcar_reader
+from pymatflow.base.xyzio import format_atoms
 
 class opt_out:
     """
@@ -26,34 +27,30 @@ class opt_out:
 
 
 
-    def get_info(self, outcar, poscar):
+    def get_info(self, outcar, poscar, cache=False):
         """
         get the general information of opt run from opt run output file
-        which is now stored in self.lines
+        the file is parsed in a single pass by the streaming outcar_reader
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         """
         self.outcar = outcar
         self.poscar = poscar
-        with open(self.outcar, 'r') as fout:
-            self.lines = fout.readlines()
         with open(self.poscar, 'r') as fin:
             self.lines_poscar = fin.readlines()
-        # check whether calculation is finished
-        if len(self.lines[-1].split()) == 4 and self.lines[-1].split()[0] == "Voluntary" and self.lines[-1].split()[1] == "context":
-            self.job_done = True
-        else:
-            self.job_done = False
-        # check whether successfully relaxed
-        self.relaxed = False
-        for line in self.lines:
-            if line == " reached required accuracy - stopping structural energy minimisation\n":
-                self.relaxed = True
-                break
-
-        self.get_trajectory()
-        self.get_opt_params_and_run_info()
-
-
-    def get_trajectory(self):
+        # the OUTCAR is parsed in a single streaming pass
+        reader = outcar_reader()
+        reader.parse(self.outcar, trajectory=True, cache=cache)
+        # check whether calculation is finished and whether successfully relaxed
+        self.job_done = reader.job_done
+        self.relaxed = reader.relaxed
+
+        self.get_trajectory(reader)
+        self.get_opt_params_and_run_info(reader)
+
+
+    def get_trajectory(self, reader):
         """
         in OUTCAR we can get the atom positions but the element name is not available
         so we have to found it in POSCAR through self.lines_poscar
@@ -61,25 +58,8 @@ class opt_out:
         Note: the cell of each trajectory is also obtained
         """
 
-        self.trajectory = []
-        self.cells = []
-        for i in range(len(self.lines)):
-            if len(self.lines[i].split()) > 0 and self.lines[i].split()[0] == "POSITION" and self.lines[i].split()[1] == "TOTAL-FORCE":
-                atm = []
-                j = i + 2
-                while len(self.lines[j].split()) == 6:
-                    atm.append(Atom("x", float(self.lines[j].split()[0]), float(self.lines[j].split()[1]), float(self.lines[j].split()[2])))
-                    j = j + 1
-                self.trajectory.append(atm)
-        for i in range(len(self.lines)):
-            if len(self.lines[i].split()) > 0 and self.lines[i].split()[0] == "direct" and self.lines[i].split()[1] == "lattice" and len(self.lines[i-4].split()) > 0 and self.lines[i-4].split()[0] == "VOLUME":
-                # note in the begining vasp will output the direct lattice vector of the input structure so that must be excluded, so we check the previous 4 line by i-4 above
-                cell = []
-                for j in range(3):
-                    cell.append([float(self.lines[i+1].split()[0]), float(self.lines[i+1].split()[1]), float(self.lines[i+1].split()[2])])
-                    cell.append([float(self.lines[i+2].split()[0]), float(self.lines[i+2].split()[1]), float(self.lines[i+2].split()[2])])
-                    cell.append([float(self.lines[i+3].split()[0]), float(self.lines[i+3].split()[1]), float(self.lines[i+3].split()[2])])
-                self.cells.append(cell)
+        self.trajectory = reader.trajectory
+        self.cells = reader.cells
         # len(self.cells) must equals to len(self.trajectory)
         if not len(self.cells) == len(self.trajectory):
             print(len(self.cells))
@@ -98,70 +78,22 @@ class opt_out:
         for i in range(len(elements)):
             for j in range(int(natom_each_element[i])):
                 label_list.append(elements[i])
-        for i in range(len(self.trajectory)):
-            for j in range(len(label_list)):
-                self.trajectory[i][j].name = label_list[j]
+        self.trajectory.set_species(label_list)
         #
 
 
-    def get_opt_params_and_run_info(self):
+    def get_opt_params_and_run_info(self, reader):
         """
         run_info["iterations"]: scf iterations per scf step
         run_info["total_energies"]: total energies of every scf step
         run_info["fermi_energies"]: fermi energies of every scf step
         run_info["total_forces_rms"]: total RMS forces of every scf step
         """
-        self.run_info["iterations"] = []
-        self.run_info["total_energies"] = []
-        self.run_info["fermi_energies"] = []
-        self.run_info["total_forces_rms"] = []
-
-        for line in self.lines:
-            # if it is an empty line continue to next line
-            if len(line.split()) == 0:
-                continue
-            if line.split()[0] == "executed" and line.split()[1] == "on" and line.split()[3] == "date":
-                self.run_info["start_time"] = line.split("\n")[0]
-            #if line.split()[0] == "This" and line.split()[1] == "run" and line.split()[3] == "terminated":
-            #    self.run_info["stop_time"] = line.split("\n")[0]
-            if line.split()[0] == "Total" and line.split()[1] == "CPU" and line.split()[2] == "time":
-                self.run_info["total_cpu_time"] = float(line.split()[5]) # in unit of second
-            if line.split()[0] == "Elapsed" and line.split()[1] == "time":
-                self.run_info["elapsed_time"] = float(line.split()[3])
-            if len(line.split()) == 4 and line.split()[1] == "Iteration":
-                self.run_info["iterations"].append(line)
-            if line.split()[0] == "energy" and line.split()[1] == "without" and line.split()[2] == "entropy=":
-                self.run_info["total_energies"].append(float(line.split()[3]))
-            if line.split()[0] ==  "E-fermi" and line.split()[1] == ":":
-                self.run_info["fermi_energies"].append(float(line.split()[2]))
-            if line.split()[0] == "FORCES:" and line.split()[1] == "max":
-                self.run_info["total_forces_rms"].append(float(line.split()[5]))
-            if line.split()[0] == "ENCUT" and line.split()[1] == "=":
-                self.run_params["ENCUT"] = float(line.split()[2])
-            if line.split()[0] == "EDIFF" and line.split()[1] == "=":
-                self.run_params["EDIFF"] = float(line.split()[2])
-            if line.split()[0] == "LREAL" and line.split()[1] == "=":
-                self.run_params["LREAL"] = line.split()[2]
-            if line.split()[0] == "EDIFFG" and line.split()[1] == "=":
-                self.run_params["EDIFFG"] = float(line.split()[2])
-            if line.split()[0] == "NSW" and line.split()[1] == "=":
-                self.run_params["NSW"] = int(line.split()[2])
-            if line.split()[0] == "IBRION" and line.split()[1] == "=":
-                self.run_params["IBRION"] = int(line.split()[2])
-            if line.split()[0] == "NFREE" and line.split()[1] == "=":
-                self.run_params["NFREE"] = int(line.split()[2])
-            if line.split()[0] == "ISIF" and line.split()[1] == "=":
-                self.run_params["ISIF"] = int(line.split()[2])
-            if line.split()[0] == "POTIM" and line.split()[1] == "=":
-                self.run_params["POTIM"] = float(line.split()[2])
-            if line.split()[0] == "TEIN" and line.split()[1] == "=":
-                self.run_params["TEIN"] = float(line.split()[2])
-            if line.split()[0] == "TEBEG" and line.split()[1] == "=":
-                self.run_params["TEBEG"] = float(line.split()[2].split(";")[0])
-            if line.split()[0] == "SMASS" and line.split()[1] == "=":
-                self.run_params["SMASS"] = float(line.split()[2])
-            if line.split()[0] == "PSTRESS=":
-                self.run_params["PSTRESS"] = float(line.split()[1])
+        for item in ["start-time", "total-cpu-time", "elapsed-time", "iterations", "total-energies", "fermi-energies", "total-forces-rms"]:
+            if item in reader.run_info:
+                self.run_info[item.replace("-", "_")] = reader.run_info[item]
+        self.run_params.update(reader.electronic_params)
+        self.run_params.update(reader.ionic_params)
 
         #self.run_info["scf-cycles"] = len(self.run_info["iterations"])
         #if self.run_type == "relax":
@@ -174,8 +106,7 @@ class opt_out:
             with open("final-structure(not-relaxed).xyz", 'w') as fout:
                 fout.write("%d\n" % len(self.trajectory[0]))
                 fout.write("Warning: structure failed to be relaxed or vc-relaxed, this is the final structure(unrelaxed)\n")
-                for atom in self.trajectory[-1]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory[-1]))
             return
         # printout relaxed structure
         with open(xyz, 'w') as fout:
@@ -185,22 +116,18 @@ class opt_out:
                 self.cells[-1][1][0], self.cells[-1][1][1], self.cells[-1][1][2],
                 self.cells[-1][2][0], self.cells[-1][2][1], self.cells[-1][2][2]
                 ))
-            for atom in self.trajectory[-1]:
-                fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+            fout.write(format_atoms(self.trajectory[-1]))
 
     def print_trajectory(self, xyz="trajectory.xyz"):
-        with open(xyz, 'w') as fout:
-            for i in range(len(self.trajectory)):
-                fout.write("%d\n" % len(self.trajectory[i]))
-                #fout.write("i = %d\n" % i)
-                fout.write("cell(i=%d): %f %f %f | %f %f %f | %f %f %f\n" % (
-                    i,
-                    self.cells[i][0][0], self.cells[i][0][1], self.cells[i][0][2],
-                    self.cells[i][1][0], self.cells[i][1][1], self.cells[i][1][2],
-                    self.cells[i][2][0], self.cells[i][2][1], self.cells[i][2][2]
-                    ))
-                for atom in self.trajectory[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+        comments = []
+        for i in range(len(self.trajectory)):
+            comments.append("cell(i=%d): %f %f %f | %f %f %f | %f %f %f" % (
+                i,
+                self.cells[i][0][0], self.cells[i][0][1], self.cells[i][0][2],
+                self.cells[i][1][0], self.cells[i][1][1], self.cells[i][1][2],
+                self.cells[i][2][0], self.cells[i][2][1], self.cells[i][2][2]
+                ))
+        self.trajectory.to_xyz(xyz, comments=comments)
 
     def export(self, directory="tmp-vasp-optimization"):
         os.chdir(directory)
@@ -281,11 +208,15 @@ class opt_post:
     """
     Note:
     """
-    def __init__(self, output="OUTCAR"):
+    def __init__(self, output="OUTCAR", cache=False):
         """
         output:
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         """
         self.file = output
+        self.cache = cache
         self.electronic_params = {}
         self.ionic_params = {}
         self.run_info = {}
@@ -295,118 +226,39 @@ class opt_post:
         self.cell = None # optimized cell
         self.trajectory = None
 
-        with open(self.file, 'r') as fout:
-            self.lines = fout.readlines()
         self.get_info()
 
     def get_info(self):
         """
-        get the general information of opt run from opt run output file
-        which is now stored in self.lines
+        get the general information of opt run from opt run output file,
+        the file is parsed in a single pass by the streaming outcar_reader
         """
-        # check whether calculation is finished
-        if len(self.lines[-1].split()) == 4 and self.lines[-1].split()[0] == "Voluntary" and self.lines[-1].split()[1] == "context":
-            self.job_done = True
-        else:
-            self.job_done = False
-        # check whether successfully relaxed
-        self.relaxed = False
-        for line in self.lines:
-            if line == " reached required accuracy - stopping structural energy minimisation\n":
-                self.relaxed = True
-                break
-
-        self.get_trajectory()
-        self.get_opt_params_and_run_info()
-
-
-    def get_trajectory(self):
-        self.trajectory = []
-        for i in range(len(self.lines)):
-            if len(self.lines[i].split()) > 0 and self.lines[i].split()[0] == "POSITION" and self.lines[i].split()[1] == "TOTAL-FORCE":
-                atm = []
-                j = i + 2
-                while len(self.lines[j].split()) == 6:
-                    atm.append(Atom("x", float(self.lines[j].split()[0]), float(self.lines[j].split()[1]), float(self.lines[j].split()[2])))
-                    j = j + 1
-                self.trajectory.append(atm)
-        #
-        """
-        if self.relaxed == True and self.run_type == "vc-relax":
-            # get the line number of the 'Begin final coordinates'
-            # and 'End final coordinates'
-            begin_final_coord_line = 0
-            end_final_coord_line = 0
-            while self.lines[begin_final_coord_line] != "Begin final coordinates\n":
-                begin_final_coord_line += 1
-            while self.lines[end_final_coord_line] != "End final coordinates\n":
-                end_final_coord_line += 1
-            # get the optimized cell
-            self.cell = []
-            for i in range(begin_final_coord_line+5, begin_final_coord_line+8):
-                for j in range(3):
-                    self.cell.append(float(self.lines[i].split()[j]))
+        reader = outcar_reader()
+        reader.parse(self.file, trajectory=True, cache=self.cache)
+        # check whether calculation is finished and whether successfully relaxed
+        self.job_done = reader.job_done
+        self.relaxed = reader.relaxed
+
+        self.get_trajectory(reader)
+        self.get_opt_params_and_run_info(reader)
+
+
+    def get_trajectory(self, reader):
+        self.trajectory = reader.trajectory
         #
-        """
 
-    def get_opt_params_and_run_info(self):
+    def get_opt_params_and_run_info(self, reader):
         """
         run_info["iterations"]: scf iterations per scf step
         run_info["total-energies"]: total energies of every scf step
         run_info["fermi-energies"]: fermi energies of every scf step
         run_info["total-forces-rms"]: total RMS forces of every scf step
         """
-        self.run_info["iterations"] = []
-        self.run_info["total-energies"] = []
-        self.run_info["fermi-energies"] = []
-        self.run_info["total-forces-rms"] = []
-
-        for line in self.lines:
-            # if it is an empty line continue to next line
-            if len(line.split()) == 0:
-                continue
-            if line.split()[0] == "executed" and line.split()[1] == "on" and line.split()[3] == "date":
-                self.run_info["start-time"] = line.split("\n")[0]
-            #if line.split()[0] == "This" and line.split()[1] == "run" and line.split()[3] == "terminated":
-            #    self.run_info["stop-time"] = line.split("\n")[0]
-            if line.split()[0] == "Total" and line.split()[1] == "CPU" and line.split()[2] == "time":
-                self.run_info["total-cpu-time"] = float(line.split()[5]) # in unit of second
-            if line.split()[0] == "Elapsed" and line.split()[1] == "time":
-                self.run_info["elapsed-time"] = float(line.split()[3])
-            if len(line.split()) == 4 and line.split()[1] == "Iteration":
-                self.run_info["iterations"].append(line)
-            if line.split()[0] == "energy" and line.split()[1] == "without" and line.split()[2] == "entropy=":
-                self.run_info["total-energies"].append(float(line.split()[3]))
-            if line.split()[0] ==  "E-fermi" and line.split()[1] == ":":
-                self.run_info["fermi-energies"].append(float(line.split()[2]))
-            if line.split()[0] == "FORCES:" and line.split()[1] == "max":
-                self.run_info["total-forces-rms"].append(float(line.split()[5]))
-            if line.split()[0] == "ENCUT" and line.split()[1] == "=":
-                self.electronic_params["ENCUT"] = float(line.split()[2])
-            if line.split()[0] == "EDIFF" and line.split()[1] == "=":
-                self.electronic_params["EDIFF"] = float(line.split()[2])
-            if line.split()[0] == "LREAL" and line.split()[1] == "=":
-                self.electronic_params["LREAL"] = line.split()[2]
-            if line.split()[0] == "EDIFFG" and line.split()[1] == "=":
-                self.ionic_params["EDIFFG"] = float(line.split()[2])
-            if line.split()[0] == "NSW" and line.split()[1] == "=":
-                self.ionic_params["NSW"] = int(line.split()[2])
-            if line.split()[0] == "IBRION" and line.split()[1] == "=":
-                self.ionic_params["IBRION"] = int(line.split()[2])
-            if line.split()[0] == "NFREE" and line.split()[1] == "=":
-                self.ionic_params["NFREE"] = int(line.split()[2])
-            if line.split()[0] == "ISIF" and line.split()[1] == "=":
-                self.ionic_params["ISIF"] = int(line.split()[2])
-            if line.split()[0] == "POTIM" and line.split()[1] == "=":
-                self.ionic_params["POTIM"] = float(line.split()[2])
-            if line.split()[0] == "TEIN" and line.split()[1] == "=":
-                self.ionic_params["TEIN"] = float(line.split()[2])
-            if line.split()[0] == "TEBEG" and line.split()[1] == "=":
-                self.ionic_params["TEBEG"] = float(line.split()[2].split(";")[0])
-            if line.split()[0] == "SMASS" and line.split()[1] == "=":
-                self.ionic_params["SMASS"] = float(line.split()[2])
-            if line.split()[0] == "PSTRESS=":
-                self.ionic_params["PSTRESS"] = float(line.split()[1])
+        for item in ["start-time", "total-cpu-time", "elapsed-time", "iterations", "total-energies", "fermi-energies", "total-forces-rms"]:
+            if item in reader.run_info:
+                self.run_info[item] = reader.run_info[item]
+        self.electronic_params = reader.electronic_params
+        self.ionic_params = reader.ionic_params
 
         #self.run_info["scf-cycles"] = len(self.run_info["iterations"])
         #if self.run_type == "relax":
@@ -419,23 +271,16 @@ class opt_post:
             with open("final-structure(not-relaxed).xyz", 'w') as fout:
                 fout.write("%d\n" % len(self.trajectory[0]))
                 fout.write("Warning: structure failed to be relaxed or vc-relaxed, this is the final structure(unrelaxed)\n")
-                for atom in self.trajectory[-1]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+                fout.write(format_atoms(self.trajectory[-1]))
             return
         # printout relaxed structure
         with open(xyz, 'w') as fout:
             fout.write("%d\n" % len(self.trajectory[-1]))
             fout.write("cell:\n")
-            for atom in self.trajectory[-1]:
-                fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+            fout.write(format_atoms(self.trajectory[-1]))
 
     def print_trajectory(self, xyz="trajectory.xyz"):
-        with open(xyz, 'w') as fout:
-            for i in range(len(self.trajectory)):
-                fout.write("%d\n" % len(self.trajectory[i]))
-                fout.write("i = %d\n" % i)
-                for atom in self.trajectory[i]:
-                    fout.write("%s\t%.9f\t%.9f\t%.9f\n" % (atom.name, atom.x, atom.y, atom.z))
+        self.trajectory.to_xyz(xyz)
 
     def view_trajectory(self, trajfile="trajectory.xyz"):
         #os.system("xcrysden --xyz %s" % trajfile)
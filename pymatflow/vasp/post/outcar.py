@@ -0,0 +1,285 @@
+"""
+streaming OUTCAR parser shared by the vasp post processing classes
+"""
+import numpy as np
+
+from pymatflow.base.trajectory import base_trajectory
+from pymatflow.base.incremental import iter_appended_lines
+from pymatflow.base.cache import post_cache
+
+
+"""
+Usage:
+    reader = outcar_reader()
+    reader.parse("OUTCAR", trajectory=True)
+    reader.run_info["total-energies"]
+    reader.trajectory.positions[-1]
+
+    # incremental parsing of a running OUTCAR
+    state = tail_state("OUTCAR", name="outcar")
+    state.load()
+    reader.parse("OUTCAR", state=state)
+    state.save()
+
+Note:
+    the OUTCAR is never loaded as a whole. it is read line by line through a
+    generator and every line is split only once, the first word of the line is
+    then used to look up the handler in a dispatch table. handlers of multi line
+    blocks (like POSITION TOTAL-FORCE) consume the following lines from the same
+    generator.
+
+    memory ceiling: besides the single line currently processed, the reader only
+    keeps the extracted quantities, namely a few floats per electronic/ionic step
+    and, only when trajectory=True, natom*6 floats (positions and forces stored
+    in a base_trajectory) plus 9 floats (cell) per ionic step. so the memory used
+    is independent of the size of the OUTCAR itself.
+
+    when a tail_state is passed, the reader starts from the byte offset saved in
+    it. a block that is not completely written yet(at the end of a running OUTCAR)
+    is left for the next invocation, so the saved offset always points to the
+    begining of a line that has not been parsed.
+"""
+
+class outcar_reader:
+    """
+    single pass streaming reader of OUTCAR
+    """
+    def __init__(self):
+        self.electronic_params = {}
+        self.ionic_params = {}
+        self.run_info = {}
+        self.job_done = None # whether calculation has finished
+        self.relaxed = None # whether structure is relaxed successfully
+
+        self.trajectory = base_trajectory() # positions and forces of each ionic step
+        self.cells = [] # list of 3x3 cell of each ionic step
+        self.read_trajectory = False
+
+        # parameters appeared in OUTCAR like 'ENCUT  =  400.0 eV'
+        self.electronic_keys = {"ENCUT": float, "EDIFF": float, "LREAL": str}
+        self.ionic_keys = {
+            "EDIFFG": float, "NSW": int, "IBRION": int, "NFREE": int, "ISIF": int,
+            "POTIM": float, "TEIN": float, "TEBEG": lambda x: float(x.split(";")[0]), "SMASS": float,
+            }
+
+        self.handlers = {
+            "executed": self._executed,
+            "Total": self._total,
+            "Elapsed": self._elapsed,
+            "energy": self._energy,
+            "E-fermi": self._efermi,
+            "FORCES:": self._forces,
+            "kinetic": self._kinetic,
+            "reached": self._reached,
+            "PSTRESS=": self._pstress,
+            "VOLUME": self._volume,
+            "direct": self._direct,
+            "POSITION": self._position,
+            }
+        for key in self.electronic_keys:
+            self.handlers[key] = self._electronic_param
+        for key in self.ionic_keys:
+            self.handlers[key] = self._ionic_param
+
+    # attributes stored in the cache
+    cached = ["electronic_params", "ionic_params", "run_info", "job_done", "relaxed", "trajectory", "cells"]
+
+    def parse(self, outcar, trajectory=False, state=None, cache=False):
+        """
+        outcar:
+            the OUTCAR file to read
+        trajectory:
+            whether to collect positions, forces and cells of every ionic step
+        state:
+            a pymatflow.base.incremental.tail_state. if provided, parsing resumes
+            from the byte offset and accumulators stored in it, and they are
+            updated after parsing, so that only newly appended bytes are read.
+        cache:
+            if True, the result is loaded from the sidecar cache of the OUTCAR
+            when it is still valid, otherwise the OUTCAR is parsed and the
+            result is saved to the cache. ignored when state is provided.
+        """
+        self.read_trajectory = trajectory
+        if cache == True and state is None:
+            sidecar = post_cache(outcar, name="outcar-trajectory" if trajectory else "outcar")
+            if sidecar.load():
+                sidecar.restore(self)
+                return
+        self.run_info["iterations"] = []
+        self.run_info["total-energies"] = []
+        self.run_info["scf-energies"] = []
+        self.run_info["fermi-energies"] = []
+        self.run_info["total-forces-rms"] = []
+        self.run_info["temperatures"] = []
+        self.trajectory = base_trajectory()
+        self.cells = []
+        self.relaxed = False
+
+        self.nline = 0
+        self.last_words = []
+        self.volume_line = None
+        self.offset = 0
+        if state is not None and len(state.data) > 0:
+            self.from_state(state)
+        self.incomplete = False # whether the last block is not completely written
+        stream = self.read_lines(outcar)
+        for line, words in stream:
+            # if it is an empty line continue to next line
+            if len(words) > 0:
+                handler = self.handlers.get(words[0])
+                if handler is not None:
+                    handler(line, words, stream)
+                elif len(words) == 4 and words[1] == "Iteration":
+                    self.run_info["iterations"].append(line)
+                if self.incomplete == True:
+                    break
+            # byte offset and line number up to which the file is completely parsed
+            self.offset = self.position
+            self.offset_nline = self.nline
+        # check whether calculation is finished through the last line
+        if len(self.last_words) == 4 and self.last_words[0] == "Voluntary" and self.last_words[1] == "context":
+            self.job_done = True
+        else:
+            self.job_done = False
+        if state is not None:
+            self.to_state(state)
+        elif cache == True:
+            sidecar.dump(self, self.cached)
+            sidecar.save()
+
+    def read_lines(self, outcar):
+        """
+        generator over the lines of OUTCAR, starting from byte self.offset
+        yield:
+            (line, words) where words is the result of line.split()
+        """
+        self.position = self.offset
+        self.offset_nline = self.nline
+        for line, self.position in iter_appended_lines(outcar, self.offset):
+            self.nline += 1
+            self.last_words = line.split()
+            yield line, self.last_words
+
+    def to_state(self, state):
+        """
+        store the parsing progress into tail_state
+        """
+        state.offset = self.offset
+        state.data = {
+            "nline": self.offset_nline,
+            "volume_line": self.volume_line,
+            "last_words": self.last_words,
+            "relaxed": self.relaxed,
+            "electronic_params": self.electronic_params,
+            "ionic_params": self.ionic_params,
+            }
+        # only the steps parsed this time are appended to the series
+        state.extend_dict("run_info", self.run_info)
+        state.extend("cells", self.cells[state.length("cells"):])
+        if self.read_trajectory == True and len(self.trajectory) > 0:
+            state.extend("positions", self.trajectory.positions[state.length("positions"):])
+            if self.trajectory.forces is not None:
+                state.extend("forces", self.trajectory.forces[state.length("forces"):])
+
+    def from_state(self, state):
+        """
+        restore the parsing progress from tail_state
+        """
+        self.offset = state.offset
+        self.nline = state.data["nline"]
+        self.volume_line = state.data["volume_line"]
+        self.last_words = state.data["last_words"]
+        self.relaxed = state.data["relaxed"]
+        self.run_info = state.get_dict("run_info")
+        self.electronic_params = state.data["electronic_params"]
+        self.ionic_params = state.data["ionic_params"]
+        self.cells = state.series("cells")
+        if state.length("positions") > 0:
+            forces = state.series("forces") if state.length("forces") > 0 else None
+            self.trajectory.extend(state.series("positions"), forces)
+
+    def _executed(self, line, words, stream):
+        if len(words) > 3 and words[1] == "on" and words[3] == "date":
+            self.run_info["start-time"] = line.split("\n")[0]
+
+    def _total(self, line, words, stream):
+        if len(words) > 5 and words[1] == "CPU" and words[2] == "time":
+            self.run_info["total-cpu-time"] = float(words[5]) # in unit of second
+
+    def _elapsed(self, line, words, stream):
+        if len(words) > 3 and words[1] == "time":
+            self.run_info["elapsed-time"] = float(words[3])
+
+    def _energy(self, line, words, stream):
+        if len(words) < 4 or words[1] != "without":
+            return
+        if words[2] == "entropy=":
+            self.run_info["total-energies"].append(float(words[3]))
+        elif words[2] == "entropy" and len(words) > 4:
+            self.run_info["scf-energies"].append(float(words[4]))
+
+    def _efermi(self, line, words, stream):
+        if len(words) > 2 and words[1] == ":":
+            self.run_info["fermi-energies"].append(float(words[2]))
+
+    def _forces(self, line, words, stream):
+        if len(words) > 5 and words[1] == "max":
+            self.run_info["total-forces-rms"].append(float(words[5]))
+
+    def _kinetic(self, line, words, stream):
+        if "(temperature" in line:
+            self.run_info["temperatures"].append(float(line.split("(temperature")[1].split("K)")[0]))
+
+    def _reached(self, line, words, stream):
+        if line == " reached required accuracy - stopping structural energy minimisation\n":
+            self.relaxed = True
+
+    def _electronic_param(self, line, words, stream):
+        if len(words) > 2 and words[1] == "=":
+            self.electronic_params[words[0]] = self.electronic_keys[words[0]](words[2])
+
+    def _ionic_param(self, line, words, stream):
+        if len(words) > 2 and words[1] == "=":
+            self.ionic_params[words[0]] = self.ionic_keys[words[0]](words[2])
+
+    def _pstress(self, line, words, stream):
+        self.ionic_params["PSTRESS"] = float(words[1])
+
+    def _volume(self, line, words, stream):
+        self.volume_line = self.nline
+
+    def _direct(self, line, words, stream):
+        """
+        in the begining vasp will output the direct lattice vector of the input
+        structure, so only the direct lattice vectors 4 lines after VOLUME is used
+        """
+        if not self.read_trajectory or len(words) < 2 or words[1] != "lattice":
+            return
+        if self.volume_line is None or self.nline - self.volume_line != 4:
+            return
+        cell = []
+        for line, words in stream:
+            cell.append([float(words[0]), float(words[1]), float(words[2])])
+            if len(cell) == 3:
+                self.cells.append(cell)
+                break
+        else:
+            # reached the end of a running OUTCAR, the block is not complete
+            self.incomplete = True
+
+    def _position(self, line, words, stream):
+        if not self.read_trajectory or len(words) < 2 or words[1] != "TOTAL-FORCE":
+            return
+        # skip the ------ line under the head
+        next(stream, None)
+        block = []
+        for line, words in stream:
+            if len(words) != 6:
+                break
+            block.append(words)
+        else:
+            # reached the end of a running OUTCAR, the block is not complete
+            self.incomplete = True
+            return
+        block = np.array(block, dtype=float).reshape(-1, 6)
+        self.trajectory.append(block[:, 0:3], block[:, 3:6])
@@ -1,6 +1,8 @@
 import datetime
 import matplotlib.pyplot as plt
 
+from pymatflow.vasp.post.outcar import outcar_reader
+
 
 
 class scf_out:
@@ -15,70 +17,34 @@ class scf_out:
         self.job_done = None
 
 
-    def get_info(self, outcar):
+    def get_info(self, outcar, cache=False):
         """
-        get the general information of scf run from scf run output file
-        which is now stored in self.lines
+        get the general information of scf run from scf run output file,
+        the file is parsed in a single pass by the streaming outcar_reader
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
         """
         self.outcar = outcar
-        with open(self.outcar, 'r') as fin:
-            self.lines = fin.readlines()
+        # the OUTCAR is parsed in a single streaming pass
+        reader = outcar_reader()
+        reader.parse(self.outcar, cache=cache)
         # check whether calculation is finished
-        if len(self.lines[-1].split()) == 4 and self.lines[-1].split()[0] == "Voluntary" and self.lines[-1].split()[1] == "context":
-            self.job_done = True
-        else:
-            self.job_done = False
-        self.get_run_params_and_run_info()
+        self.job_done = reader.job_done
+        self.get_run_params_and_run_info(reader)
     #
-    def get_run_params_and_run_info(self):
-        """
-        """
-        self.run_info["scf_energies"] = []
-
-        for line in self.lines:
-            # if it is an empty line continue to next line
-            if len(line.split()) == 0:
-                continue
-            if line.split()[0] == "executed" and line.split()[1] == "on" and line.split()[3] == "date":
-                self.run_info["start_time"] = line.split("\n")[0]
-            #if line.split()[0] == "This" and line.split()[1] == "run" and line.split()[3] == "terminated":
-            #    self.run_info["stop-time"] = line.split("\n")[0]
-            if line.split()[0] == "Total" and line.split()[1] == "CPU" and line.split()[2] == "time":
-                self.run_info["total_cpu_time"] = float(line.split()[5]) # in unit of second
-            if line.split()[0] == "Elapsed" and line.split()[1] == "time":
-                self.run_info["elapsed_time"] = float(line.split()[3])
-            if line.split()[0] == "energy" and line.split()[1] == "without" and line.split()[2] == "entropy":
-                self.run_info["scf_energies"].append(float(line.split()[4]))
-            if line.split()[0] ==  "E_fermi" and line.split()[1] == ":":
-                self.run_info["fermi_energy"] = float(line.split()[2])
-            if line.split()[0] == "FORCES:" and line.split()[1] == "max":
-                self.run_info["forces_rms"] = float(line.split()[5])
-            if line.split()[0] == "ENCUT" and line.split()[1] == "=":
-                self.run_params["ENCUT"] = float(line.split()[2])
-            if line.split()[0] == "EDIFF" and line.split()[1] == "=":
-                self.run_params["EDIFF"] = float(line.split()[2])
-            if line.split()[0] == "LREAL" and line.split()[1] == "=":
-                self.run_params["LREAL"] = line.split()[2]
-            if line.split()[0] == "EDIFFG" and line.split()[1] == "=":
-                self.run_params["EDIFFG"] = float(line.split()[2])
-            if line.split()[0] == "NSW" and line.split()[1] == "=":
-                self.run_params["NSW"] = int(line.split()[2])
-            if line.split()[0] == "IBRION" and line.split()[1] == "=":
-                self.run_params["IBRION"] = int(line.split()[2])
-            if line.split()[0] == "NFREE" and line.split()[1] == "=":
-                self.run_params["NFREE"] = int(line.split()[2])
-            if line.split()[0] == "ISIF" and line.split()[1] == "=":
-                self.run_params["ISIF"] = int(line.split()[2])
-            if line.split()[0] == "POTIM" and line.split()[1] == "=":
-                self.run_params["POTIM"] = float(line.split()[2])
-            if line.split()[0] == "TEIN" and line.split()[1] == "=":
-                self.run_params["TEIN"] = float(line.split()[2])
-            if line.split()[0] == "TEBEG" and line.split()[1] == "=":
-                self.run_params["TEBEG"] = float(line.split()[2].split(";")[0])
-            if line.split()[0] == "SMASS" and line.split()[1] == "=":
-                self.run_params["SMASS"] = float(line.split()[2])
-            if line.split()[0] == "PSTRESS=":
-                self.run_params["PSTRESS"] = float(line.split()[1])
+    def get_run_params_and_run_info(self, reader):
+        """
+        """
+        for item in ["start-time", "total-cpu-time", "elapsed-time", "scf-energies"]:
+            if item in reader.run_info:
+                self.run_info[item.replace("-", "_")] = reader.run_info[item]
+        if len(reader.run_info["fermi-energies"]) > 0:
+            self.run_info["fermi_energy"] = reader.run_info["fermi-energies"][-1]
+        if len(reader.run_info["total-forces-rms"]) > 0:
+            self.run_info["forces_rms"] = reader.run_info["total-forces-rms"][-1]
+        self.run_params.update(reader.electronic_params)
+        self.run_params.update(reader.ionic_params)
 
 
 
@@ -95,74 +61,41 @@ class scf_post:
         self.scf_params = {}
         self.run_info = {}
         self.job_done = None
+        self.cache = False
 
-    def get_outcar(self, outcar):
+    def get_outcar(self, outcar, cache=False):
+        """
+        cache:
+            if True, the parsed result is saved to a sidecar cache beside the
+            output and loaded from it next time if the output is unchanged.
+        """
         self.outcar = outcar
-        with open(self.outcar, 'r') as fin:
-            self.lines = fin.readlines()
+        self.cache = cache
         self.get_info()
 
     def get_info(self):
         """
-        get the general information of scf run from scf run output file
-        which is now stored in self.lines
+        get the general information of scf run from scf run output file,
+        the file is parsed in a single pass by the streaming outcar_reader
         """
+        reader = outcar_reader()
+        reader.parse(self.outcar, cache=self.cache)
         # check whether calculation is finished
-        if len(self.lines[-1].split()) == 4 and self.lines[-1].split()[0] == "Voluntary" and self.lines[-1].split()[1] == "context":
-            self.job_done = True
-        else:
-            self.job_done = False
-        self.get_scf_params_and_run_info()
+        self.job_done = reader.job_done
+        self.get_scf_params_and_run_info(reader)
     #
-    def get_scf_params_and_run_info(self):
-        """
-        """
-        self.run_info["scf-energies"] = []
-
-        for line in self.lines:
-            # if it is an empty line continue to next line
-            if len(line.split()) == 0:
-                continue
-            if line.split()[0] == "executed" and line.split()[1] == "on" and line.split()[3] == "date":
-                self.run_info["start-time"] = line.split("\n")[0]
-            #if line.split()[0] == "This" and line.split()[1] == "run" and line.split()[3] == "terminated":
-            #    self.run_info["stop-time"] = line.split("\n")[0]
-            if line.split()[0] == "Total" and line.split()[1] == "CPU" and line.split()[2] == "time":
-                self.run_info["total-cpu-time"] = float(line.split()[5]) # in unit of second
-            if line.split()[0] == "Elapsed" and line.split()[1] == "time":
-                self.run_info["elapsed-time"] = float(line.split()[3])
-            if line.split()[0] == "energy" and line.split()[1] == "without" and line.split()[2] == "entropy":
-                self.run_info["scf-energies"].append(float(line.split()[4]))
-            if line.split()[0] ==  "E-fermi" and line.split()[1] == ":":
-                self.run_info["fermi-energy"] = float(line.split()[2])
-            if line.split()[0] == "FORCES:" and line.split()[1] == "max":
-                self.run_info["forces-rms"] = float(line.split()[5])
-            if line.split()[0] == "ENCUT" and line.split()[1] == "=":
-                self.electronic_params["ENCUT"] = float(line.split()[2])
-            if line.split()[0] == "EDIFF" and line.split()[1] == "=":
-                self.electronic_params["EDIFF"] = float(line.split()[2])
-            if line.split()[0] == "LREAL" and line.split()[1] == "=":
-                self.electronic_params["LREAL"] = line.split()[2]
-            if line.split()[0] == "EDIFFG" and line.split()[1] == "=":
-                self.ionic_params["EDIFFG"] = float(line.split()[2])
-            if line.split()[0] == "NSW" and line.split()[1] == "=":
-                self.ionic_params["NSW"] = int(line.split()[2])
-            if line.split()[0] == "IBRION" and line.split()[1] == "=":
-                self.ionic_params["IBRION"] = int(line.split()[2])
-            if line.split()[0] == "NFREE" and line.split()[1] == "=":
-                self.ionic_params["NFREE"] = int(line.split()[2])
-            if line.split()[0] == "ISIF" and line.split()[1] == "=":
-                self.ionic_params["ISIF"] = int(line.split()[2])
-            if line.split()[0] == "POTIM" and line.split()[1] == "=":
-                self.ionic_params["POTIM"] = float(line.split()[2])
-            if line.split()[0] == "TEIN" and line.split()[1] == "=":
-                self.ionic_params["TEIN"] = float(line.split()[2])
-            if line.split()[0] == "TEBEG" and line.split()[1] == "=":
-                self.ionic_params["TEBEG"] = float(line.split()[2].split(";")[0])
-            if line.split()[0] == "SMASS" and line.split()[1] == "=":
-                self.ionic_params["SMASS"] = float(line.split()[2])
-            if line.split()[0] == "PSTRESS=":
-                self.ionic_params["PSTRESS"] = float(line.split()[1])
+    def get_scf_params_and_run_info(self, reader):
+        """
+        """
+        for item in ["start-time", "total-cpu-time", "elapsed-time", "scf-energies"]:
+            if item in reader.run_info:
+                self.run_info[item] = reader.run_info[item]
+        if len(reader.run_info["fermi-energies"]) > 0:
+            self.run_info["fermi-energy"] = reader.run_info["fermi-energies"][-1]
+        if len(reader.run_info["total-forces-rms"]) > 0:
+            self.run_info["forces-rms"] = reader.run_info["total-forces-rms"][-1]
+        self.electronic_params = reader.electronic_params
+        self.ionic_params = reader.ionic_params
 
     def plot_run_info(self):
         """
@@ -0,0 +1,162 @@
+"""
+single pass vasprun.xml reader shared by post_bands and post_pdos
+"""
+import numpy as np
+
+from xml.etree.ElementTree import iterparse
+
+from pymatflow.base.cache import post_cache
+
+
+"""
+Usage:
+    reader = vasprun_reader()
+    reader.parse("vasprun.xml", eigenvalues=True, pdos=True)
+    reader.efermi
+    reader.eigenvalues # (nspin, nkpoint, nband, 2) array, energy and occupation
+    reader.pdos # (nion, nspin, nedos, nfield) array, fields in reader.pdos_fields
+
+Note:
+    vasprun.xml is read through xml.etree.ElementTree.iterparse, and every
+    element is cleared as soon as its end tag is processed, so the whole tree
+    is never built in memory. the <r> lines of a k point or an ion are joined
+    and converted to float by one numpy call instead of one split per line.
+
+    like the old code which used .find("calculation"), only the first
+    <calculation> is read, and parsing stops right after the requested
+    quantities are obtained, e.g. reading only efermi will not go through the
+    partial dos of a LORBIT=11 run.
+"""
+
+class vasprun_reader:
+    """
+    iterparse based reader of vasprun.xml
+    """
+    def __init__(self):
+        self.efermi = None
+        self.ispin = None
+        self.lnoncollinear = None
+        self.lsorbit = None
+        self.magnetic_status = None
+        self.ion_list = [] # element label of each ion
+        self.basis = None # (3, 3) real space basis of the initial structure
+        self.rec_basis = None # (3, 3) reciprocal space basis of the initial structure
+        self.eigenvalues = None
+        self.pdos = None
+        self.pdos_fields = []
+
+    # attributes stored in the cache
+    cached = [
+        "efermi", "ispin", "lnoncollinear", "lsorbit", "magnetic_status", "ion_list",
+        "basis", "rec_basis", "eigenvalues", "pdos", "pdos_fields",
+        ]
+
+    def parse(self, vasprun="vasprun.xml", eigenvalues=False, pdos=False, cache=False):
+        """
+        vasprun:
+            the vasprun.xml file to read
+        eigenvalues:
+            whether to read the eigenvalues of each k point
+        pdos:
+            whether to read the partial density of states of each ion
+        cache:
+            if True, the result is loaded from the sidecar cache of the vasprun.xml
+            when it is still valid, otherwise the result is saved to the cache.
+        efermi, spin parameters, ion labels and lattice are always read.
+        """
+        if cache == True:
+            sidecar = post_cache(vasprun, name="vasprun" + ("-eigenvalues" if eigenvalues else "") + ("-pdos" if pdos else ""))
+            if sidecar.load():
+                sidecar.restore(self)
+                return
+        self.ion_list = []
+        self.pdos_fields = []
+        basis = {"basis": [], "rec_basis": []}
+        eigen = [] # list of (nkpoint, nband, 2) array for each spin
+        partial = [] # list of (nspin, nedos, nfield) array for each ion
+        rows = []
+        nset = 0 # number of k point sets or spin sets in the current block
+        nstructure = 0
+        ncalculation = 0
+        path = []
+        elems = []
+        with open(vasprun, 'rb') as fin:
+            for event, elem in iterparse(fin, events=("start", "end")):
+                if event == "start":
+                    path.append(elem.tag)
+                    elems.append(elem)
+                    if len(path) == 2 and elem.tag == "structure":
+                        nstructure += 1
+                    elif len(path) == 2 and elem.tag == "calculation":
+                        ncalculation += 1
+                        if ncalculation > 1:
+                            break
+                    continue
+                depth = len(path)
+                tag = elem.tag
+                if depth < 3:
+                    pass
+                elif path[1] == "parameters":
+                    if tag == "i" and elem.get("name") in ("ISPIN", "LNONCOLLINEAR", "LSORBIT"):
+                        setattr(self, elem.get("name").lower(), elem.text.split()[0])
+                elif path[1] == "atominfo":
+                    # the first <c> of each <rc> in the atoms array is the element label
+                    if tag == "c" and depth == 6 and elems[2].get("name") == "atoms" and elems[4][0] is elem:
+                        self.ion_list.append(elem.text.split()[0])
+                elif path[1] == "structure":
+                    if nstructure == 1 and tag == "v" and depth == 5 and path[2] == "crystal" and elems[3].get("name") in basis:
+                        basis[elems[3].get("name")].append(elem.text.split())
+                elif path[1] == "calculation":
+                    if path[2] == "dos":
+                        if depth == 4 and tag == "i" and elem.get("name") == "efermi":
+                            self.efermi = float(elem.text)
+                            if eigenvalues == False and pdos == False:
+                                break
+                        elif pdos == True and depth > 4 and path[3] == "partial":
+                            if tag == "field" and depth == 6:
+                                self.pdos_fields.append(elem.text.split()[0])
+                            elif tag == "r" and depth == 9:
+                                rows.append(elem.text)
+                            elif tag == "set" and depth == 8:
+                                nset += 1
+                            elif tag == "set" and depth == 7:
+                                # an ion completed
+                                partial.append(np.fromstring(" ".join(rows), sep=" ").reshape(nset, -1, len(self.pdos_fields)))
+                                rows = []
+                                nset = 0
+                        elif tag == "dos" and depth == 3:
+                            # eigenvalues are before dos in <calculation>, so all is read
+                            break
+                    elif path[2] == "eigenvalues" and eigenvalues == True:
+                        if tag == "r" and depth == 8:
+                            rows.append(elem.text)
+                        elif tag == "set" and depth == 7:
+                            nset += 1
+                        elif tag == "set" and depth == 6:
+                            # a spin completed
+                            eigen.append(np.fromstring(" ".join(rows), sep=" ").reshape(nset, -1, 2))
+                            rows = []
+                            nset = 0
+                path.pop()
+                elems.pop()
+                # release the processed element, its text has been used above
+                elem.clear()
+
+        self.ispin = int(self.ispin)
+        if self.lsorbit == "T":
+            # VASP will turn ISPIN to 1 when soc is considered, so soc-ispin-2
+            # never exists actually, see the note in post_bands.get_eigenval
+            self.magnetic_status = "soc-ispin-%d" % self.ispin
+        else:
+            self.magnetic_status = "non-soc-ispin-%d" % self.ispin
+        if len(basis["basis"]) == 3:
+            self.basis = np.array(basis["basis"], dtype=float)
+        if len(basis["rec_basis"]) == 3:
+            self.rec_basis = np.array(basis["rec_basis"], dtype=float)
+        if len(eigen) > 0:
+            self.eigenvalues = np.array(eigen)
+        if len(partial) > 0:
+            self.pdos = np.array(partial)
+        if cache == True:
+            sidecar.dump(self, self.cached)
+            sidecar.save()
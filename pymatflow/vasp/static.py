@@ -7,6 +7,7 @@ import shutil
 
 from pymatflow.remote.server import server_handle
 from pymatflow.vasp.vasp import vasp
+from pymatflow.base.variants import variant_renderer
 
 """
 usage:
@@ -141,7 +142,7 @@ class static_run(vasp):
             os.chdir("../")
         server_handle(auto=auto, directory=directory, jobfilebase="static-bands", server=self.run_params["server"])
 
-    def converge_encut(self, emin, emax, step, directory="tmp-vasp-encut", runopt="gen", auto=0, restart=0):
+    def converge_encut(self, emin, emax, step, directory="tmp-vasp-encut", runopt="gen", auto=0, restart=0, nproc=1):
         if runopt == "gen" or runopt == "genrun":
             if os.path.exists(directory):
                 shutil.rmtree(directory)
@@ -151,16 +152,15 @@ class static_run(vasp):
 
             os.chdir(directory)
             n_test = int((emax - emin) / step)
-            for i in range(n_test + 1):
-                encut = int(emin + i * step)
-                os.mkdir("encut-%d" % encut)
-                self.incar.params['ENCUT'] = encut
-                with open(os.path.join("encut-%d" % encut, "INCAR"), 'w') as fout:
-                    self.incar.to_incar(fout)
-                with open(os.path.join("encut-%d" % encut, "POSCAR"), 'w') as fout:
-                    self.poscar.to_poscar(fout)
-                with open(os.path.join("encut-%d" % encut, "KPOINTS"), 'w') as fout:
-                    self.kpoints.to_kpoints(fout)
+            encuts = [int(emin + i * step) for i in range(n_test + 1)]
+            # POSCAR and KPOINTS are written once, self.incar is not changed
+            renderer = variant_renderer(self, [
+                ("%s/INCAR", [("incar", "to_incar")]),
+                ("%s/POSCAR", [("poscar", "to_poscar")]),
+                ("%s/KPOINTS", [("kpoints", "to_kpoints")]),
+                ])
+            renderer.write("./", [{"incar.ENCUT": encut} for encut in encuts], ["encut-%d" % encut for encut in encuts], nproc=nproc)
+            for encut in encuts:
                 shutil.copyfile("POTCAR", os.path.join("encut-%d" % encut, "POTCAR"))
 
 
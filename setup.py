@@ -194,6 +194,7 @@ setup(
         "pymatflow/flow/scripts/flow-pes-relax-qe.py",
         "pymatflow/flow/scripts/flow-pes-relax-cp2k.py",
         "pymatflow/flow/scripts/pes-to-img.py",
+        "pymatflow/flow/scripts/pes-run.py",
         "pymatflow/vasp/scripts/vasp-bands.py",
         "pymatflow/vasp/scripts/vasp-phono3py.py",
         "pymatflow/vasp/scripts/vasp-md.py",
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+"""
+benchmark of constructing and writing CP2K inputs with lazily built sections
+against building every section eagerly like the old implementation
+"""
+import io
+import sys
+import time
+import argparse
+
+from pymatflow.cp2k.static import static_run
+from pymatflow.cp2k.opt import opt_run
+from pymatflow.cp2k.md import md_run
+from pymatflow.cp2k.base.section import lazy_section
+
+
+"""
+Usage:
+    python benchmark-cp2k-input.py --xyz structure.xyz --ninput 100
+
+Note:
+    the old implementation built every subsection in __init__, it is reproduced
+    here by touching all the lazy_section attributes recursively right after the
+    construction, which builds exactly the same objects. the inputs written in
+    the two ways are checked to be the same. before the benchmark the keys
+    switching subsections on or off(like "FORCE_EVAL-DFT-LS_SCF") are checked to
+    give the same input as not setting them when FALSE, and never to be written
+    as keywords.
+"""
+
+def materialize(section):
+    """
+    build all the subsections of section recursively
+    :return number of sections built
+    """
+    count = 1
+    for owner in type(section).__mro__:
+        for attr, value in list(owner.__dict__.items()):
+            if isinstance(value, lazy_section):
+                count += materialize(getattr(section, attr))
+    return count
+
+def build(cls, xyz, eager):
+    task = cls()
+    task.get_xyz(xyz)
+    nsection = materialize(task) if eager == True else None
+    fout = io.StringIO()
+    task.glob.to_input(fout)
+    task.force_eval.to_input(fout)
+    if cls != static_run:
+        task.motion.to_input(fout)
+    return fout.getvalue(), nsection
+
+def check_switches(xyz):
+    """
+    the keys naming a subsection without section keyword(set by the scripts like
+    cp2k-phonopy.py) switch it on or off and are never written as keywords
+    :return list of the failed checks
+    """
+    failed = []
+    def render(params):
+        task = opt_run()
+        task.get_xyz(xyz)
+        task.set_params(params)
+        fout = io.StringIO()
+        task.glob.to_input(fout)
+        task.force_eval.to_input(fout)
+        task.motion.to_input(fout)
+        return fout.getvalue()
+    baseline = render({})
+    for key, header in [("FORCE_EVAL-DFT-LS_SCF", "&LS_SCF"), ("FORCE_EVAL-DFT-XC-VDW_POTENTIAL", "&VDW_POTENTIAL")]:
+        name = key.split("-")[-1]
+        off = render({key: "FALSE"})
+        on = render({key: "TRUE"})
+        if off != baseline:
+            failed.append("%s: FALSE changes the input" % key)
+        if header not in on.upper():
+            failed.append("%s: TRUE does not write %s" % (key, header))
+        for text in [off, on]:
+            if any(line.split()[0:1] == [name] for line in text.splitlines()):
+                failed.append("%s: written as a keyword" % key)
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("--xyz", type=str, required=True,
+            help="the xyz structure file")
+
+    parser.add_argument("--ninput", type=int, default=100,
+            help="number of inputs to construct and write for each type")
+
+    args = parser.parse_args()
+
+    for failure in check_switches(args.xyz):
+        print("warning: %s\n" % failure)
+
+    print("=========================================================\n")
+    print("        benchmark of CP2K input construct + write\n")
+    print("---------------------------------------------------------\n")
+    print("%12s %12s %14s %14s %10s\n" % ("run", "sections", "eager(ms)", "lazy(ms)", "speedup"))
+    for cls in [static_run, opt_run, md_run]:
+        eager, nsection = build(cls, args.xyz, True)
+        lazy, _ = build(cls, args.xyz, False)
+        if eager != lazy:
+            print("warning: inputs of eager and lazy construction differ\n")
+        start = time.time()
+        for i in range(args.ninput):
+            build(cls, args.xyz, True)
+        t_eager = (time.time() - start) / args.ninput
+        start = time.time()
+        for i in range(args.ninput):
+            build(cls, args.xyz, False)
+        t_lazy = (time.time() - start) / args.ninput
+        print("%12s %12d %14.3f %14.3f %10.1f\n" % (cls.__name__, nsection, t_eager * 1000, t_lazy * 1000, t_eager / t_lazy))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+"""
+benchmark of crystal.build_supercell and structure.tools.enlarge_atoms
+against the old implementation replicating Atom in nested python loops
+"""
+import sys
+import copy
+import time
+import argparse
+
+import numpy as np
+
+from pymatflow.base.atom import Atom
+from pymatflow.structure.crystal import crystal
+from pymatflow.structure.tools import enlarge_positions
+
+
+"""
+Usage:
+    python benchmark-supercell.py --natom 1000 10000 100000 1000000
+
+Note:
+    the supercell of each size is built from a 8 atom cubic cell by
+    n x n x n replication, so the actual number of atoms is 8*n^3 closest to
+    the requested one. the old implementation is skipped above --old-max atoms
+    as it takes minutes for 10^6 atoms.
+"""
+
+def build_supercell_old(structure, n):
+    """
+    the old crystal.build_supercell
+    """
+    cell = copy.deepcopy(structure.cell)
+    for i in range(3):
+        for j in range(3):
+            cell[i][j] = n[i] * structure.cell[i][j]
+    atoms = copy.deepcopy(structure.atoms)
+    for i in range(3):
+        natom_now = len(atoms)
+        for j in range(n[i] - 1):
+            for atom in atoms[:natom_now]:
+                x = atom.x + float(j + 1) * structure.cell[i][0]
+                y = atom.y + float(j + 1) * structure.cell[i][1]
+                z = atom.z + float(j + 1) * structure.cell[i][2]
+                atoms.append(Atom(atom.name, x, y, z))
+    return {"cell": cell, "atoms": [[atom.name, atom.x, atom.y, atom.z] for atom in atoms]}
+
+def enlarge_atoms_old(structure, n):
+    """
+    the old replication in structure.tools.enlarge_atoms
+    """
+    atoms = copy.deepcopy(structure.atoms)
+    for i in range(3):
+        natom_now = len(atoms)
+        for j in range(n[i] - 1):
+            for atom in atoms[:natom_now]:
+                x = atom.x + float(j + 1) * structure.cell[i][0]
+                y = atom.y + float(j + 1) * structure.cell[i][1]
+                z = atom.z + float(j + 1) * structure.cell[i][2]
+                atoms.append(Atom(atom.name, x, y, z))
+        for atom in atoms[:natom_now*n[i]]:
+            x = atom.x - float(n[i]) * structure.cell[i][0]
+            y = atom.y - float(n[i]) * structure.cell[i][1]
+            z = atom.z - float(n[i]) * structure.cell[i][2]
+            atoms.append(Atom(atom.name, x, y, z))
+    return [[atom.name, atom.x, atom.y, atom.z] for atom in atoms]
+
+def timing(func, *args):
+    start = time.time()
+    out = func(*args)
+    return time.time() - start, out
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("--natom", type=int, nargs="+", default=[1000, 10000, 100000, 1000000],
+            help="number of atoms of the supercell")
+
+    parser.add_argument("--old-max", type=int, default=200000,
+            help="the old implementation is not run for supercells larger than this")
+
+    args = parser.parse_args()
+
+    # rocksalt like cubic cell with 8 atoms
+    unit = crystal()
+    unit.cell = [[5.64, 0.0, 0.0], [0.0, 5.64, 0.0], [0.0, 0.0, 5.64]]
+    unit.get_atoms([
+        ["Na", 0.0, 0.0, 0.0], ["Na", 0.0, 2.82, 2.82], ["Na", 2.82, 0.0, 2.82], ["Na", 2.82, 2.82, 0.0],
+        ["Cl", 2.82, 0.0, 0.0], ["Cl", 0.0, 2.82, 0.0], ["Cl", 0.0, 0.0, 2.82], ["Cl", 2.82, 2.82, 2.82],
+        ])
+
+    print("=========================================================\n")
+    print("              benchmark of supercell building\n")
+    print("---------------------------------------------------------\n")
+    print("%10s %12s %12s %12s %12s\n" % ("natom", "old(s)", "new(s)", "new-array(s)", "speedup"))
+    for natom in args.natom:
+        n = max(1, int(round((natom / 8.0) ** (1.0 / 3))))
+        t_new, new = timing(unit.build_supercell, [n, n, n])
+        t_array, arrays = timing(replicate_only, unit, n)
+        if len(new["atoms"]) <= args.old_max:
+            t_old, old = timing(build_supercell_old, unit, [n, n, n])
+            same = np.allclose(np.array([atom[1:] for atom in old["atoms"]]), new["positions"]) and [atom[0] for atom in old["atoms"]] == new["species"].tolist()
+            if same == False:
+                print("warning: results of old and new build_supercell differ\n")
+            print("%10d %12.4f %12.4f %12.4f %12.1f\n" % (len(new["atoms"]), t_old, t_new, t_array, t_old / t_new))
+        else:
+            print("%10d %12s %12.4f %12.4f %12s\n" % (len(new["atoms"]), "-", t_new, t_array, "-"))
+
+    print("---------------------------------------------------------\n")
+    print("              benchmark of enlarge_atoms\n")
+    print("---------------------------------------------------------\n")
+    print("%10s %12s %12s %12s\n" % ("natom", "old(s)", "new(s)", "speedup"))
+    for natom in args.natom:
+        # enlarge_atoms builds 8*n1*n2*n3 images
+        n = max(1, int(round((natom / 64.0) ** (1.0 / 3))))
+        t_new, (species, positions) = timing(enlarge_positions, unit, [n, n, n])
+        if positions.shape[0] <= args.old_max:
+            t_old, old = timing(enlarge_atoms_old, unit, [n, n, n])
+            if not np.allclose(np.array([atom[1:] for atom in old]), positions):
+                print("warning: results of old and new enlarge_atoms differ\n")
+            print("%10d %12.4f %12.4f %12.1f\n" % (positions.shape[0], t_old, t_new, t_old / t_new))
+        else:
+            print("%10d %12s %12.4f %12s\n" % (positions.shape[0], "-", t_new, "-"))
+
+def replicate_only(structure, n):
+    """
+    the array part of build_supercell, without building the list of atoms
+    """
+    from pymatflow.structure.tools import replicate_atoms
+    return replicate_atoms([[atom.x, atom.y, atom.z] for atom in structure.atoms], structure.cell, [range(n), range(n), range(n)])
+
+if __name__ == "__main__":
+    main()